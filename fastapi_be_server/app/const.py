@@ -30,6 +30,16 @@ class Settings(BaseSettings):
     DB_IP: str = os.getenv("DB_IP", "")
     DB_PORT: str = os.getenv("DB_PORT", "3306")
     LIKENOVEL_DB_URL: str = f"mysql+aiomysql://{DB_USER_ID}:{DB_USER_PW}@{DB_IP}:{DB_PORT}/likenovel?charset=utf8mb4"
+    # 읽기 전용 replica (DB_READ_IP 미설정 시 primary 사용)
+    DB_READ_IP: str = os.getenv("DB_READ_IP", "")
+    DB_READ_PORT: str = os.getenv("DB_READ_PORT", DB_PORT)
+    LIKENOVEL_READ_DB_URL: str = (
+        f"mysql+aiomysql://{DB_USER_ID}:{DB_USER_PW}@{DB_READ_IP}:{DB_READ_PORT}/likenovel?charset=utf8mb4"
+        if DB_READ_IP
+        else ""
+    )
+    DB_READ_POOL_SIZE: int = int(os.getenv("DB_READ_POOL_SIZE", "10"))
+    DB_READ_MAX_OVERFLOW: int = int(os.getenv("DB_READ_MAX_OVERFLOW", "20"))
     VARCHAR_COMM_SIZE: int = 300
     VARCHAR_ID_SIZE: int = 30
     VARCHAR_CODE_SIZE: int = 20
@@ -62,6 +72,10 @@ class Settings(BaseSettings):
                                         -----END PUBLIC KEY-----
                                         """
     KC_PK_ALGORITHMS: list = ["RS256"]
+    # refresh token 최대 수명(로그인 유지 client 기준) - 로그아웃 시 세션 폐기 이벤트 보관 상한 (token_revocation)
+    KC_REFRESH_TOKEN_MAX_LIFETIME_SECONDS: int = int(
+        os.getenv("KC_REFRESH_TOKEN_MAX_LIFETIME_SECONDS", str(60 * 60 * 24 * 30))
+    )
 
     # naver 로그인 연동
     NAVER_OAUTH2_BASE_URL: str = "https://nid.naver.com/oauth2.0"
@@ -153,12 +167,211 @@ class Settings(BaseSettings):
         "MEILISEARCH_API_KEY", ""
     )
 
+    # 외부 API 공유 HTTP 커넥션 풀 (app/utils/http_client.py)
+    HTTP_POOL_MAX_CONNECTIONS: int = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS: int = int(
+        os.getenv("HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )
+    HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS: float = float(
+        os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS", "30")
+    )
+    HTTP_POOL_HTTP2_ENABLED: bool = os.getenv("HTTP_POOL_HTTP2_ENABLED", "Y") == "Y"
+
+    # 사이트 통계/페이지뷰 이벤트 적재 버퍼 (app/services/common/statistics_ingest.py)
+    STATISTICS_INGEST_ENABLED: bool = (
+        os.getenv("STATISTICS_INGEST_ENABLED", "Y") == "Y"
+    )
+    STATISTICS_INGEST_FLUSH_SIZE: int = int(
+        os.getenv("STATISTICS_INGEST_FLUSH_SIZE", "500")
+    )
+    STATISTICS_INGEST_FLUSH_INTERVAL_SECONDS: float = float(
+        os.getenv("STATISTICS_INGEST_FLUSH_INTERVAL_SECONDS", "2")
+    )
+    STATISTICS_INGEST_MAX_PENDING: int = int(
+        os.getenv("STATISTICS_INGEST_MAX_PENDING", "50000")
+    )
+    STATISTICS_INGEST_SPILL_PATH: str = os.getenv(
+        "STATISTICS_INGEST_SPILL_PATH", "./logs/statistics_ingest_spill.jsonl"
+    )
+    # DB 가 정상인데 혼자서도 적재에 실패한 row 는 이 횟수만큼 시도한 뒤 spill 경로 + ".dead" 로 보낸다
+    STATISTICS_INGEST_MAX_ATTEMPTS: int = int(
+        os.getenv("STATISTICS_INGEST_MAX_ATTEMPTS", "3")
+    )
+
+    # 에피소드 뷰어 조회수 write-behind 집계 (app/services/product/view_counter.py)
+    VIEW_COUNTER_ENABLED: bool = os.getenv("VIEW_COUNTER_ENABLED", "Y") == "Y"
+    VIEW_COUNTER_FLUSH_INTERVAL_SECONDS: float = float(
+        os.getenv("VIEW_COUNTER_FLUSH_INTERVAL_SECONDS", "5")
+    )
+    VIEW_COUNTER_MAX_KEYS: int = int(os.getenv("VIEW_COUNTER_MAX_KEYS", "20000"))
+
+    # 작품 카드 read model (app/services/product/product_card_service.py)
+    PRODUCT_CARD_READ_MODEL_ENABLED: bool = (
+        os.getenv("PRODUCT_CARD_READ_MODEL_ENABLED", "Y") == "Y"
+    )
+    PRODUCT_CARD_REFRESH_INTERVAL_SECONDS: float = float(
+        os.getenv("PRODUCT_CARD_REFRESH_INTERVAL_SECONDS", "5")
+    )
+    # refresh 주기마다 순회(sweep) 재계산하는 작품 수
+    PRODUCT_CARD_SWEEP_BATCH_SIZE: int = int(
+        os.getenv("PRODUCT_CARD_SWEEP_BATCH_SIZE", "100")
+    )
+
+    # 작품 목록 전역(사용자 무관) 결과 캐시 (app/services/product/product_list_cache.py)
+    PRODUCT_LIST_CACHE_ENABLED: bool = (
+        os.getenv("PRODUCT_LIST_CACHE_ENABLED", "Y") == "Y"
+    )
+    PRODUCT_LIST_CACHE_TTL_SECONDS: float = float(
+        os.getenv("PRODUCT_LIST_CACHE_TTL_SECONDS", "30")
+    )
+    PRODUCT_LIST_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("PRODUCT_LIST_CACHE_MAX_ENTRIES", "1000")
+    )
+    # 랭킹 세대(tb_batch_generation) 확인 주기, 세대가 바뀌면 목록 캐시 무효화 (app/services/product/rank_generation.py)
+    RANK_GENERATION_CHECK_SECONDS: float = float(
+        os.getenv("RANK_GENERATION_CHECK_SECONDS", "10")
+    )
+    # 추천용 작품 AI 메타데이터 색인 증분 갱신/전체 재적재 주기, 증분 조회 겹침 (app/services/ai/product_ai_metadata_index.py)
+    AI_METADATA_INDEX_REFRESH_SECONDS: float = float(
+        os.getenv("AI_METADATA_INDEX_REFRESH_SECONDS", "30")
+    )
+    AI_METADATA_INDEX_FULL_RELOAD_SECONDS: float = float(
+        os.getenv("AI_METADATA_INDEX_FULL_RELOAD_SECONDS", "3600")
+    )
+    AI_METADATA_INDEX_OVERLAP_SECONDS: float = float(
+        os.getenv("AI_METADATA_INDEX_OVERLAP_SECONDS", "5")
+    )
+    # 유저별 취향 추천 결과 캐시 (app/services/ai/taste_recommendation_cache.py)
+    # 입력 변경은 profile_version 으로 즉시 반영하고, TTL 은 작품 카드 정보 변경 반영 상한
+    TASTE_RECOMMENDATION_CACHE_ENABLED: bool = (
+        os.getenv("TASTE_RECOMMENDATION_CACHE_ENABLED", "Y") == "Y"
+    )
+    TASTE_RECOMMENDATION_CACHE_TTL_SECONDS: float = float(
+        os.getenv("TASTE_RECOMMENDATION_CACHE_TTL_SECONDS", "600")
+    )
+    TASTE_RECOMMENDATION_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("TASTE_RECOMMENDATION_CACHE_MAX_ENTRIES", "20000")
+    )
+    # 구좌가 비어 있는 결과(온보딩 필요, 후보 부족)는 짧게만 재사용
+    TASTE_RECOMMENDATION_CACHE_EMPTY_TTL_SECONDS: float = float(
+        os.getenv("TASTE_RECOMMENDATION_CACHE_EMPTY_TTL_SECONDS", "30")
+    )
+
+    # 유사 작품 이웃 테이블 (app/services/ai/product_similar_neighbor.py)
+    # DNA 내용 유사도 상위 N개를 미리 계산해 두고, 부족하면 기존 후보 채점으로 대체
+    PRODUCT_SIMILAR_NEIGHBOR_ENABLED: bool = (
+        os.getenv("PRODUCT_SIMILAR_NEIGHBOR_ENABLED", "Y") == "Y"
+    )
+    PRODUCT_SIMILAR_NEIGHBOR_TOP_N: int = int(
+        os.getenv("PRODUCT_SIMILAR_NEIGHBOR_TOP_N", "50")
+    )
+
+    # 웹소챗 회차 본문 청크 n-gram 색인 (app/services/websochat/websochat_chunk_index.py)
+    # 색인이 없는 작품은 기존 LIKE 조회로 대체
+    WEBSOCHAT_CHUNK_INDEX_ENABLED: bool = (
+        os.getenv("WEBSOCHAT_CHUNK_INDEX_ENABLED", "Y") == "Y"
+    )
+    WEBSOCHAT_CHUNK_INDEX_CACHE_PRODUCTS: int = int(
+        os.getenv("WEBSOCHAT_CHUNK_INDEX_CACHE_PRODUCTS", "200")
+    )
+
+    # 웹소챗 질문 분류 빠른 경로 (app/services/websochat/websochat_intent_router.py)
+    # 규칙 분류 -> 작품별 정규화 질문 캐시 -> LLM 분류 순
+    WEBSOCHAT_INTENT_FAST_PATH_ENABLED: bool = (
+        os.getenv("WEBSOCHAT_INTENT_FAST_PATH_ENABLED", "Y") == "Y"
+    )
+    WEBSOCHAT_INTENT_CACHE_ENABLED: bool = (
+        os.getenv("WEBSOCHAT_INTENT_CACHE_ENABLED", "Y") == "Y"
+    )
+    WEBSOCHAT_INTENT_CACHE_TTL_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_INTENT_CACHE_TTL_SECONDS", "3600")
+    )
+    WEBSOCHAT_INTENT_CACHE_MAX_PER_PRODUCT: int = int(
+        os.getenv("WEBSOCHAT_INTENT_CACHE_MAX_PER_PRODUCT", "512")
+    )
+    WEBSOCHAT_INTENT_CACHE_MAX_PRODUCTS: int = int(
+        os.getenv("WEBSOCHAT_INTENT_CACHE_MAX_PRODUCTS", "500")
+    )
+
+    # 웹소챗 턴 준비 단계 동시 실행 (app/services/websochat/websochat_turn_prep.py)
+    # N 이면 선언 순서대로 요청 세션에서 하나씩 실행
+    WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED: bool = (
+        os.getenv("WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED", "Y") == "Y"
+    )
+    # 워커 전체에서 턴 준비 단계가 따로 여는 primary 세션 수 상한 (넘으면 요청 세션에서 차례로 실행)
+    WEBSOCHAT_TURN_PREP_MAX_EXTRA_SESSIONS: int = int(
+        os.getenv("WEBSOCHAT_TURN_PREP_MAX_EXTRA_SESSIONS", "8")
+    )
+
+    # 웹소챗 턴 잠금 lease (app/services/websochat/websochat_turn_lock.py)
+    # 워커가 죽으면 TTL 뒤에 만료, 답변 생성 중에는 RENEW 주기마다 연장
+    WEBSOCHAT_TURN_LEASE_TTL_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_TURN_LEASE_TTL_SECONDS", "30")
+    )
+    WEBSOCHAT_TURN_LEASE_RENEW_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_TURN_LEASE_RENEW_SECONDS", "10")
+    )
+
+    # 웹소챗 LLM provider 호출 governor (app/services/websochat/websochat_provider_governor.py)
+    # 동시 호출 상한, 호출 전 실패 재시도, 분류 호출 hedge(최근 지연 분위수 기준), 연속 실패 시 회로 차단
+    WEBSOCHAT_LLM_MAX_IN_FLIGHT: int = int(os.getenv("WEBSOCHAT_LLM_MAX_IN_FLIGHT", "64"))
+    WEBSOCHAT_LLM_QUEUE_TIMEOUT_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_LLM_QUEUE_TIMEOUT_SECONDS", "10")
+    )
+    WEBSOCHAT_LLM_MAX_ATTEMPTS: int = int(os.getenv("WEBSOCHAT_LLM_MAX_ATTEMPTS", "3"))
+    WEBSOCHAT_LLM_RETRY_BACKOFF_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_LLM_RETRY_BACKOFF_SECONDS", "0.5")
+    )
+    WEBSOCHAT_LLM_RETRY_BACKOFF_MAX_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_LLM_RETRY_BACKOFF_MAX_SECONDS", "4")
+    )
+    WEBSOCHAT_LLM_HEDGE_ENABLED: bool = os.getenv("WEBSOCHAT_LLM_HEDGE_ENABLED", "Y") == "Y"
+    WEBSOCHAT_LLM_HEDGE_PERCENTILE: float = float(
+        os.getenv("WEBSOCHAT_LLM_HEDGE_PERCENTILE", "95")
+    )
+    WEBSOCHAT_LLM_HEDGE_MIN_SAMPLES: int = int(
+        os.getenv("WEBSOCHAT_LLM_HEDGE_MIN_SAMPLES", "20")
+    )
+    WEBSOCHAT_LLM_HEDGE_MIN_DELAY_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_LLM_HEDGE_MIN_DELAY_SECONDS", "0.5")
+    )
+    WEBSOCHAT_LLM_CIRCUIT_FAILURE_THRESHOLD: int = int(
+        os.getenv("WEBSOCHAT_LLM_CIRCUIT_FAILURE_THRESHOLD", "5")
+    )
+    WEBSOCHAT_LLM_CIRCUIT_OPEN_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_LLM_CIRCUIT_OPEN_SECONDS", "30")
+    )
+
+    # 웹소챗 SSE 응답 (app/services/websochat/websochat_sse.py)
+    # 이벤트 큐 크기(가득 차면 생산자가 기다림), delta 합치기 대기(ms), 프레임당 최대 글자 수, keep-alive 주기
+    WEBSOCHAT_SSE_QUEUE_SIZE: int = int(os.getenv("WEBSOCHAT_SSE_QUEUE_SIZE", "64"))
+    WEBSOCHAT_SSE_COALESCE_MS: float = float(os.getenv("WEBSOCHAT_SSE_COALESCE_MS", "20"))
+    WEBSOCHAT_SSE_MAX_FRAME_CHARS: int = int(os.getenv("WEBSOCHAT_SSE_MAX_FRAME_CHARS", "512"))
+    WEBSOCHAT_SSE_KEEP_ALIVE_SECONDS: float = float(
+        os.getenv("WEBSOCHAT_SSE_KEEP_ALIVE_SECONDS", "10")
+    )
+
+    # 웹소챗 세션 대화 문맥 캐시 (app/services/websochat/websochat_session_context.py)
+    # 워커별 세션 메모리/최근 메시지 캐시, tb_story_agent_session.context_version 이 같을 때만 쓴다
+    WEBSOCHAT_SESSION_CONTEXT_CACHE_ENABLED: bool = (
+        os.getenv("WEBSOCHAT_SESSION_CONTEXT_CACHE_ENABLED", "Y") == "Y"
+    )
+    WEBSOCHAT_SESSION_CONTEXT_MAX_SESSIONS: int = int(
+        os.getenv("WEBSOCHAT_SESSION_CONTEXT_MAX_SESSIONS", "2000")
+    )
+
     # 페이징 기본 설정값
     PAGINATION_DEFAULT_PAGE_NO: int = 1  # 조회 시작 위치
     PAGINATION_DEFAULT_LIMIT: int = 10  # 한 페이지당 개수
     PAGINATION_PRODUCT_DEFAULT_LIMIT: int = 25  # 작품 목록 조회 시 한 페이지당 개수
     PAGINATION_ORDER_DIRECTION_ASC: str = "asc"
     PAGINATION_ORDER_DIRECTION_DESC: str = "desc"
+    # 커서(keyset) 페이징 서명 키 (app/utils/cursor_pagination.py)
+    # 비어 있으면 KC_CLIENT_SECRET 에서 용도별 하위 키를 유도, 둘 다 없으면 기동 실패
+    PAGINATION_CURSOR_SECRET: str = os.getenv("PAGINATION_CURSOR_SECRET", "")
+    PAGINATION_CURSOR_MAX_LIMIT: int = int(
+        os.getenv("PAGINATION_CURSOR_MAX_LIMIT", "100")
+    )
 
     # custom status code
     class CustomStatusCode(Enum):
@@ -383,6 +596,7 @@ class ErrorMessages:
         "종료 날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식이어야 합니다."
     )
     INVALID_DATE_RANGE = "시작 날짜가 종료 날짜보다 늦을 수 없습니다."
+    INVALID_PAGE_CURSOR = "유효하지 않은 페이지 커서입니다. 첫 페이지부터 다시 조회해주세요."
     PRIMARY_SECONDARY_GENRE_SAME = (
         "1차 장르와 2차 장르가 동일합니다. 다른 장르를 선택해주세요."
     )
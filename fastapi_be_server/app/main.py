@@ -1,22 +1,36 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response, status
+from fastapi import FastAPI, Request, status
 # from fastapi.middleware.cors import CORSMiddleware  # Nginx에서 CORS 처리
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.datastructures import MutableHeaders
 
 from app.const import settings, ErrorMessages
 from app.tags import tags_metadata
 from app.exceptions import CustomResponseException
+from app.services.ai.taste_recommendation_cache import taste_recommendation_cache
+from app.services.common.statistics_ingest import statistics_ingest_buffer
+from app.services.product.product_card_service import product_card_refresher
+from app.services.product.view_counter import episode_view_counter
+from app.services.websochat.websochat_intent_router import websochat_intent_cache
+from app.services.websochat.websochat_provider_governor import websochat_gemini_governor
+from app.services.websochat.websochat_session_context import websochat_session_contexts
+from app.services.websochat.websochat_sse import websochat_sse_stats
+from app.services.websochat.websochat_turn_lock import websochat_turn_locks
+from app.services.websochat.websochat_turn_prep import websochat_turn_db_slots
 from app.utils.auto_migrate import run_auto_migrations
+from app.utils.cursor_pagination import check_cursor_secret
+from app.utils.http_client import (
+    check_http2_support,
+    close_http_clients,
+    get_http_pool_metrics,
+)
+from app.utils.identity import UserIdentityScopeMiddleware
+from app.utils.trace import TraceIdMiddleware
 
-import uuid
 import logging
 import importlib
 import pkgutil
-import json
 from pathlib import Path
 from fastapi import APIRouter
 import app.routers as routers_pkg
@@ -27,12 +41,46 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
+    check_cursor_secret()
+    check_http2_support()
     try:
         await run_auto_migrations()
     except Exception as e:
         logger.error(f"[auto_migrate] 초기화 실패 (앱은 계속 실행): {e}")
+    await statistics_ingest_buffer.start()
+    await episode_view_counter.start()
+    await product_card_refresher.start()
     yield
     # shutdown
+    await product_card_refresher.stop()
+    logger.info(f"[product_card] metrics at shutdown: {product_card_refresher.metrics()}")
+    await episode_view_counter.stop()
+    logger.info(f"[view_counter] metrics at shutdown: {episode_view_counter.metrics()}")
+    await statistics_ingest_buffer.stop()
+    logger.info(
+        f"[statistics_ingest] metrics at shutdown: {statistics_ingest_buffer.metrics()}"
+    )
+    logger.info(
+        f"[taste_recommendation_cache] metrics at shutdown: {taste_recommendation_cache.metrics()}"
+    )
+    logger.info(
+        f"[websochat_intent] metrics at shutdown: {websochat_intent_cache.metrics()}"
+    )
+    logger.info(
+        f"[websochat_turn_lock] metrics at shutdown: {websochat_turn_locks.metrics()}"
+    )
+    logger.info(
+        f"[websochat_gemini_governor] metrics at shutdown: {websochat_gemini_governor.metrics()}"
+    )
+    logger.info(f"[websochat_sse] metrics at shutdown: {websochat_sse_stats.metrics()}")
+    logger.info(
+        f"[websochat_turn_prep] db slot metrics at shutdown: {websochat_turn_db_slots.metrics()}"
+    )
+    logger.info(
+        f"[websochat_session_context] metrics at shutdown: {websochat_session_contexts.metrics()}"
+    )
+    logger.info(f"[http_client] pool metrics at shutdown: {get_http_pool_metrics()}")
+    await close_http_clients()
 
 
 be_app = FastAPI(openapi_tags=tags_metadata, lifespan=lifespan)  # swagger
@@ -138,72 +186,16 @@ async def custom_validation_exception_handler(
 
 
 ## 미들웨어를 사용해 traceId 발급
-class TraceIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """
-        trace_id, span_id 생성
-        :param request:
-        :param call_next:
-        :return:
-        """
-
-        # 요청 파라미터 읽기
-        params = dict()
-        if request.query_params:
-            params = dict(request.query_params)
-
-        # 요청 바디 읽기
-        body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.json()
-            except Exception:
-                pass
-
-        # 요청 상태에 파라미터 저장
-        request.state.params = params
-        request.state.body = body
-        request.state.analysis_params = params if params is not None else body
-
-        if request.headers.get("trace_id") is None:
-            trace_id = str(uuid.uuid4().hex)  # traceId 생성
-        else:
-            trace_id = request.headers.get("trace_id")
-
-        span_id = uuid.uuid4().int >> 64
-
-        # 요청 상태에 trace_id 저장
-        request.state.trace_id = trace_id
-        # 요청 상태에 span_id 저장
-        request.state.span_id = str(f"{span_id:016x}")
-
-        request.state.odata = request.headers.get("odata")
-
-        # 요청을 처리한 후 응답을 받음
-        response = await call_next(request)
-
-        # 응답 헤더에 traceId를 추가
-        response.headers["trace_id"] = trace_id
-
-        # return response
-
-        res_body = b""
-        async for chunk in response.body_iterator:
-            res_body += chunk
-
-        headers = MutableHeaders(response.headers)
-
-        return Response(
-            content=res_body,
-            status_code=response.status_code,
-            headers=headers,
-            media_type=response.media_type,
-        )
-
+# - pure ASGI 미들웨어로 응답 본문을 버퍼링하지 않습니다(SSE/CSV 스트리밍 유지).
+# - 구현: app/utils/trace.py
 
 # TraceId 미들웨어 추가
 be_app.add_middleware(TraceIdMiddleware)
 
+# 요청 단위 사용자 식별 정보(kc_user_id -> user_id) memo
+# - 구현: app/utils/identity.py
+be_app.add_middleware(UserIdentityScopeMiddleware)
+
 # 데이터 분석용 파일 로그
 # import logging
 # logger = logging.getLogger(settings.LOGGER_NAME)
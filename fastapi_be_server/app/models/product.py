@@ -1,5 +1,5 @@
 from decimal import Decimal
-from sqlalchemy import BigInteger, Date, Double, Index, Integer, JSON, Numeric, String, Text, TIMESTAMP, UniqueConstraint, text
+from sqlalchemy import BigInteger, Computed, Date, Double, Index, Integer, JSON, Numeric, String, Text, TIMESTAMP, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from datetime import date, datetime
@@ -1656,6 +1656,15 @@ class ProductEpisodeDropoffDaily(Base):
 
 class UserTasteFactorScore(Base):
     __tablename__ = "tb_user_taste_factor_score"  # 유저 취향 축 점수
+    __table_args__ = (
+        # 코호트 유사 유저 조회용 축 키 역색인(커버링)
+        Index(
+            "idx_user_taste_factor_key_norm",
+            "factor_key_norm",
+            "score",
+            "user_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -1667,6 +1676,11 @@ class UserTasteFactorScore(Base):
     factor_key: Mapped[str] = mapped_column(
         String(120), nullable=False, comment="축 키"
     )
+    factor_key_norm: Mapped[str] = mapped_column(
+        String(120),
+        Computed("LOWER(TRIM(factor_key))", persisted=True),
+        comment="정규화 축 키(LOWER(TRIM(factor_key)))",
+    )
     score: Mapped[float] = mapped_column(
         Double, nullable=False, server_default="0", comment="점수"
     )
@@ -1,4 +1,5 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.const import settings
@@ -19,6 +20,61 @@ likenovel_db_session = sessionmaker(
 )
 
 
+def _set_read_only_session(dbapi_connection, connection_record):
+    """
+    replica 커넥션을 읽기 전용으로 고정하여 실수로 들어온 쓰기 쿼리는 DB 에서 거부되도록 합니다.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SET SESSION TRANSACTION READ ONLY")
+    finally:
+        cursor.close()
+
+
+def _set_sqlite_query_only(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA query_only = ON")
+    finally:
+        cursor.close()
+
+
+def create_read_db_engine(url: str) -> AsyncEngine:
+    """
+    읽기 전용(replica) 엔진 생성
+    """
+    if url.startswith("sqlite"):
+        # 로컬 테스트용 SQLite stand-in
+        engine = create_async_engine(url, future=True)
+        event.listen(engine.sync_engine, "connect", _set_sqlite_query_only)
+        return engine
+
+    engine = create_async_engine(
+        url,
+        future=True,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=settings.DB_READ_POOL_SIZE,
+        max_overflow=settings.DB_READ_MAX_OVERFLOW,
+    )
+    event.listen(engine.sync_engine, "connect", _set_read_only_session)
+    return engine
+
+
+# replica 가 설정되지 않은 경우 primary 엔진을 그대로 사용
+likenovel_read_db_engine = (
+    create_read_db_engine(settings.LIKENOVEL_READ_DB_URL)
+    if settings.LIKENOVEL_READ_DB_URL
+    else likenovel_db_engine
+)
+likenovel_read_db_session = sessionmaker(
+    bind=likenovel_read_db_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    autoflush=False,
+)
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -30,5 +86,16 @@ async def get_likenovel_db():
         await likenovel_session.commit()
 
 
+async def get_likenovel_read_db():
+    """
+    조회 전용 세션(*_query 라우터, 통계/리포트 조회용)
+    - replica 가 설정되어 있으면 replica, 아니면 primary 커넥션을 사용합니다.
+    - 읽기 세션은 commit 하지 않습니다(세션 종료 시 트랜잭션은 rollback 으로 정리).
+    - replica 는 복제 지연이 있으므로 방금 쓴 데이터를 바로 읽어야 하는 API 에는 사용하지 않습니다.
+    """
+    async with likenovel_read_db_session() as likenovel_session:
+        yield likenovel_session
+
+
 # Legacy FastAPI dependencies still import `get_db`.
 get_db = get_likenovel_db
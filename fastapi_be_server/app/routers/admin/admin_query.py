@@ -305,6 +305,10 @@ async def user_list(
     search_word: str = Query("", description="검색어"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 첫 페이지, 이후 응답의 next_cursor 전달)"
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 개수 조회 여부"),
     db: AsyncSession = Depends(get_likenovel_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
@@ -317,7 +321,14 @@ async def user_list(
         raise e
 
     return await admin_user_service.user_list(
-        status, search_target, search_word, page, count_per_page, db
+        status,
+        search_target,
+        search_word,
+        page,
+        count_per_page,
+        db,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
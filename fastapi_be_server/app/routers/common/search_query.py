@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rdb import get_likenovel_db
+from app.rdb import get_likenovel_read_db
 from app.config.log_config import (
     analysis_logger,
     service_data_logger,
@@ -117,7 +117,7 @@ error_logger = service_error_logger(LOGGER_TYPE.LOGGER_INSTANCE_NAME_FOR_SERVICE
 )
 async def products_of_searched(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     keyword: str = Query(None, description="검색 키워드"),
     adult_yn: str = Query(None, description="통합검색(일반검색-작품, 퀘스트, 이벤트)"),
     orderby: str = Query(None, description="정렬 기준"),
@@ -161,7 +161,7 @@ async def products_of_searched(
 )
 async def results_of_autocomplete(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     keyword: str = Query(None, description="검색 키워드"),
     adult_yn: str = Query(None, description="통합검색(일반검색-작품, 퀘스트, 이벤트)"),
 ):
@@ -303,7 +303,7 @@ async def get_trending_keywords(user: Dict[str, Any] = Depends(chk_cur_user)):
 )
 async def get_weekly_most_viewed_products(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     adult_yn: str = Query("N", description="성인 작품 포함 여부 (Y/N)"),
     page: int = Query(1, description="조회 페이지"),
     limit: int = Query(10, description="한 페이지당 조회 개수"),
@@ -389,7 +389,7 @@ async def get_weekly_most_viewed_products(
 )
 async def search_products_for_review(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     keyword: str = Query(..., description="검색 키워드 (작품명, 작가명)"),
     adult_yn: str = Query("N", description="성인 작품 포함 여부 (Y/N)"),
     limit: Optional[int] = Query(None, description="조회 개수"),
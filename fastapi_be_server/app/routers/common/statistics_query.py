@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from typing import Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.rdb import get_likenovel_db
+from app.rdb import get_likenovel_read_db
 from app.utils.common import check_user
 from app.utils.auth import analysis_logger, chk_cur_user
 import app.services.common.statistics_service as statistics_service
@@ -79,7 +79,7 @@ async def site_statistics(
     end_date: str | None = Query(None, description="종료 날짜"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     site 통계
@@ -152,7 +152,7 @@ async def site_statistics(
 async def site_statistics_for_excel_download(
     start_date: str | None = Query(None, description="시작 날짜"),
     end_date: str | None = Query(None, description="종료 날짜"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     site 통계
@@ -178,7 +178,7 @@ async def product_detail_funnel_statistics(
     entry_source: str | None = Query(None, description="상세 진입 source(nullable, __null__ 지원)"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(20, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -209,7 +209,7 @@ async def site_page_route_statistics(
     route_group: str | None = Query(None, description="route 대분류"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(20, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -243,7 +243,7 @@ async def site_page_referrer_statistics(
     sort_order: str | None = Query("desc", description="정렬 방향"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(20, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -336,7 +336,7 @@ async def payment_statistics(
     end_date: str = Query(None, description="종료 날짜"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     결제 통계
@@ -410,7 +410,7 @@ async def payment_statistics(
 async def payment_statistics_for_excel_download(
     start_date: str = Query(None, description="시작 날짜"),
     end_date: str = Query(None, description="종료 날짜"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     결제 통계
@@ -493,7 +493,7 @@ async def payment_statistics_by_user(
     search_word: str = Query("", description="검색어"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     회원별 결제 통계
@@ -571,7 +571,7 @@ async def payment_statistics_by_user_for_excel_download(
     end_date: str = Query(None, description="종료 날짜"),
     search_target: str = Query("", description="검색 타겟(email | nickname)"),
     search_word: str = Query("", description="검색어"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     회원별 결제 통계
@@ -598,7 +598,7 @@ async def websochat_usage_statistics(
     fallback_used: str = Query("", description="fallback 사용 여부(Y | N)"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """웹소챗 사용량/비용 통계."""
@@ -627,7 +627,7 @@ async def websochat_usage_statistics(
 async def ai_api_usage_statistics(
     start_date: str | None = Query(None, description="시작 날짜"),
     end_date: str | None = Query(None, description="종료 날짜"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """AI API 사용량/비용 통계."""
@@ -651,7 +651,7 @@ async def ai_reader_engagement_statistics(
     product_id: int | None = Query(None, description="작품 ID"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(20, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """AI reader 운영/작품 반응 관제판."""
@@ -678,7 +678,7 @@ async def ai_reader_actions_timeline(
     status_filter: str | None = Query("applied", description="applied|pending|skipped|failed|all"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(50, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """전체 AI 독자 활동 타임라인(action queue)."""
@@ -705,7 +705,7 @@ async def ai_reader_agent_actions(
     end_date: str | None = Query(None, description="종료 날짜"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(50, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """AI 독자 개별 활동 내역(action queue)."""
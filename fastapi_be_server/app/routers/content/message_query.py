@@ -53,6 +53,10 @@ async def get_chat_rooms(
     search_nickname: Optional[str] = Query(None, description="닉네임 검색"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     count_per_page: int = Query(20, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 첫 페이지, 이후 응답의 next_cursor 전달)"
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 개수 조회 여부"),
     user: Dict[str, Any] = Depends(chk_cur_user),
     db: AsyncSession = Depends(get_likenovel_db),
 ):
@@ -70,6 +74,8 @@ async def get_chat_rooms(
         page=page,
         count_per_page=count_per_page,
         db=db,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -111,6 +117,10 @@ async def get_chat_messages(
     room_id: int = Path(..., description="대화방 ID"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     count_per_page: int = Query(30, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 최신 메시지부터, 이후 응답의 next_cursor 로 이전 메시지 조회)"
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 메시지 수 조회 여부"),
     user: Dict[str, Any] = Depends(chk_cur_user),
     db: AsyncSession = Depends(get_likenovel_db),
 ):
@@ -125,6 +135,8 @@ async def get_chat_messages(
         page=page,
         count_per_page=count_per_page,
         db=db,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
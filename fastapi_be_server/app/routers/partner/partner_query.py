@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, Optional
 
-from app.rdb import get_likenovel_db
+from app.rdb import get_likenovel_read_db
 from app.utils.auth import analysis_logger, chk_cur_user
 import app.services.partner.partner_basic_service as partner_basic_service
 import app.services.partner.partner_product_service as partner_product_service
@@ -84,7 +84,7 @@ router = APIRouter(prefix="/partners")
 )
 async def partner_detail_by_user_id(
     user_id: int = Path(..., description="파트너의 회원 번호"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -161,7 +161,7 @@ async def partner_detail_by_user_id(
 )
 async def partner_profiles_of_partner(
     user_id: int = Path(..., description="파트너의 회원 번호"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -269,7 +269,11 @@ async def product_list(
     from_episode_sales_page: Optional[bool] = Query(
         None, description="회차별 매출 페이지에서 호출 여부"
     ),
-    db: AsyncSession = Depends(get_likenovel_db),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 첫 페이지, 이후 응답의 next_cursor 전달)"
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 개수 조회 여부"),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -293,6 +297,8 @@ async def product_list(
         start_date,
         end_date,
         from_episode_sales_page,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -358,7 +364,7 @@ async def product_list(
     dependencies=[Depends(analysis_logger)],
 )
 async def product_genre_list(
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -464,7 +470,7 @@ async def product_list_for_download(
     from_episode_sales_page: Optional[bool] = Query(
         None, description="회차별 매출 페이지에서 호출 여부"
     ),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -538,7 +544,7 @@ async def product_list_for_download(
     dependencies=[Depends(analysis_logger)],
 )
 async def get_cp_company_name_list(
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -624,7 +630,7 @@ async def get_cp_company_name_list(
 )
 async def product_detail_by_id(
     id: int = Path(..., description="작품 번호"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -718,7 +724,7 @@ async def product_statistics_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -748,7 +754,7 @@ async def product_statistics_list(
 )
 async def product_recent_24h_statistics(
     product_id: int = Path(..., description="작품 ID"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     user_data = await check_user(kc_user_id=user.get("sub"), db=db)
@@ -838,7 +844,7 @@ async def product_statistics_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -878,7 +884,7 @@ async def product_detail_funnel_statistics_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(20, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -915,7 +921,7 @@ async def product_episode_dropoff_statistics_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(100, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -949,7 +955,7 @@ async def product_inflow_dropoff_statistics(
     product_id: int | None = Query(None, description="작품 ID"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1045,7 +1051,7 @@ async def product_episode_statistics_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1144,7 +1150,7 @@ async def product_episode_statistics_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1246,7 +1252,7 @@ async def cart_analysis_list(
     type: str = Query("bookmark", description="타입(bookmark | tag | similar-user)"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1338,7 +1344,7 @@ async def cart_analysis_list(
 async def cart_analysis_list_for_download(
     search_target: str = Query("", description="검색 타겟(product-title)"),
     search_word: str = Query("", description="검색어"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1420,7 +1426,7 @@ async def hourly_inflow_product_list(
     search_word: str = Query("", description="검색어"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1500,7 +1506,7 @@ async def hourly_inflow_product_list(
 async def hourly_inflow_product_list_for_download(
     search_target: str = Query("", description="검색 타겟(product-title)"),
     search_word: str = Query("", description="검색어"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1602,7 +1608,7 @@ async def hourly_inflow_detail_by_product_id(
     ),
     search_target: str = Query("", description="검색 타겟(product-title)"),
     search_word: str = Query("", description="검색어"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1719,7 +1725,7 @@ async def monthly_sales_by_product_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1841,7 +1847,7 @@ async def monthly_sales_by_product_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -1956,7 +1962,7 @@ async def monthly_sales_by_product_list_for_download(
 )
 async def monthly_sales_by_product_detail_by_product_id(
     id: int = Path(..., description="작품 번호"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2058,7 +2064,7 @@ async def sales_by_episode_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2165,7 +2171,7 @@ async def sales_by_episode_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2273,7 +2279,7 @@ async def sales_by_episode_list_by_product_id(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2378,7 +2384,7 @@ async def sales_by_episode_list_by_product_id_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2468,7 +2474,7 @@ async def daily_ticket_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2563,7 +2569,7 @@ async def daily_ticket_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2660,7 +2666,7 @@ async def monthly_settlement_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2755,7 +2761,7 @@ async def monthly_settlement_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2851,7 +2857,7 @@ async def product_contract_offer_deduction_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -2945,7 +2951,7 @@ async def product_contract_offer_deduction_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3037,7 +3043,7 @@ async def sponsorship_recodes_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3127,7 +3133,7 @@ async def sponsorship_recodes_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3220,7 +3226,7 @@ async def income_recodes_list(
     item_type: str = Query("", description="수익 내역(후원-sponsorship | 광고-ad)"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3312,7 +3318,7 @@ async def income_recodes_list_for_download(
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
     item_type: str = Query("", description="수익 내역(후원-sponsorship | 광고-ad)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3401,7 +3407,7 @@ async def income_settlement_list(
     search_end_date: str = Query("", description="기간 검색 종료일"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3487,7 +3493,7 @@ async def income_settlement_list_for_download(
     search_word: str = Query("", description="검색어"),
     search_start_date: str = Query("", description="기간 검색 시작일"),
     search_end_date: str = Query("", description="기간 검색 종료일"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3570,7 +3576,7 @@ async def income_settlement_list_for_download(
 )
 async def income_settlement_summary(
     search_month: str = Query("", description="조회할 년월 (yyyy-mm)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3669,7 +3675,7 @@ async def product_discovery_statistics_list(
     scope: str = Query("", description="뷰 범위(contracted)"),
     page: int = Query(1, description="페이지"),
     count_per_page: int = Query(8, description="한 페이지 내 갯수"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3766,7 +3772,7 @@ async def product_discovery_statistics_list_for_download(
     search_target: str = Query("", description="검색 타겟(story | keyword-genre)"),
     search_word: str = Query("", description="검색어"),
     scope: str = Query("", description="뷰 범위(contracted)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
@@ -3857,7 +3863,7 @@ async def product_discovery_statistics_list_for_download(
 async def product_discovery_statistics_detail_by_id(
     id: int = Path(..., description="발굴작품 번호"),
     scope: str = Query("", description="뷰 범위(contracted)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
     user: Dict[str, Any] = Depends(chk_cur_user),
 ):
     """
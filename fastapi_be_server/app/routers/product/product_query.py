@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query, Path, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Any, List, Optional
 
-from app.rdb import get_likenovel_db
+from app.rdb import get_likenovel_db, get_likenovel_read_db
 from app.utils.auth import analysis_logger, chk_cur_user
 from app.exceptions import CustomResponseException
 import app.services.product.product_service as product_service
@@ -123,7 +123,7 @@ async def products_of_managed(
 async def products_of_main_single_slots(
     adult_yn: str = Query("N", description="성인등급 작품 포함 여부 (Y/N)"),
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     return await main_single_slot_service.get_public_main_single_slots(
         kc_user_id=user.get("sub"),
@@ -140,7 +140,7 @@ async def products_of_main_single_slots(
 )
 async def get_products_home_ticker(
     adult_yn: str = Query("N", description="성인등급 작품 포함 여부 (Y/N)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     return await home_ticker_service.get_home_ticker(adult_yn=adult_yn, db=db)
 
@@ -157,7 +157,7 @@ async def get_products_rank_history(
         None, alias="date", description="조회 날짜(YYYY-MM-DD)"
     ),
     limit: int = Query(50, ge=1, le=50, description="순위 개수(최대 50)"),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     return await product_service.get_product_rank_history(
         area_code=area_code,
@@ -393,6 +393,11 @@ async def episodes_by_product_id(
     limit: Optional[int] = Query(None, description="한페이지 조회 개수"),
     order_by: Optional[str] = Query(None, description="정렬 항목(episodeNo)"),
     order_dir: Optional[str] = Query(None, description="정렬 방향(asc, desc)"),
+    cursor: Optional[str] = Query(
+        None,
+        description="커서 페이징(빈 값은 첫 페이지, 이후 pagination.nextCursor 전달). 정렬 항목은 episodeNo/createdDate/openChangedDate",
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 회차 수 조회 여부"),
     db: AsyncSession = Depends(get_likenovel_db),
 ):
     """
@@ -407,6 +412,8 @@ async def episodes_by_product_id(
         order_by=order_by,
         order_dir=order_dir,
         db=db,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -1489,6 +1496,10 @@ async def get_products_product_id_comments(
     page: str = Query(None, description="페이지 넘버"),
     limit: str = Query(None, description="페이지당 최대 출력 수"),
     order: str = Query(None, description="정렬 순서(recommend, recent))"),
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 첫 페이지, 이후 응답의 nextCursor 전달)"
+    ),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 댓글 수 조회 여부"),
     user: Dict[str, Any] = Depends(chk_cur_user),
     db: AsyncSession = Depends(get_likenovel_db),
 ):
@@ -1501,6 +1512,7 @@ async def get_products_product_id_comments(
     2. ?page={number}&limit={number}: 페이징 처리(더보기). number는 1이상의 값, limit은 30 전달 필요
     3. ?order=recommend: 공감많은순 정렬
     4. ?order=recent: 최신순 정렬
+    5. ?cursor=&limit={number}: 커서 페이징(더보기). 응답의 nextCursor 를 다음 요청 cursor 로 전달, null 이면 마지막
     """
 
     return await product_comment_service.get_products_product_id_comments(
@@ -1511,6 +1523,8 @@ async def get_products_product_id_comments(
         order=order,
         kc_user_id=user.get("sub"),
         db=db,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -1756,7 +1770,7 @@ async def get_products_product_id_conversion(
 )
 async def get_products_genres(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     **인터페이스 구현 최종 완료**\n
@@ -1846,7 +1860,7 @@ async def get_products_genres(
 )
 async def get_products_keywords(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     **인터페이스 구현 최종 완료**\n
@@ -2326,7 +2340,7 @@ async def get_user_interest_drop_products_soon(
     },
     dependencies=[Depends(analysis_logger)],
 )
-async def get_product_rank(db: AsyncSession = Depends(get_likenovel_db)):
+async def get_product_rank(db: AsyncSession = Depends(get_likenovel_read_db)):
     """
     작품 목록 전체 조회(메인, 유료, 무료)
     """
@@ -2404,7 +2418,7 @@ async def get_product_rank(db: AsyncSession = Depends(get_likenovel_db)):
 async def products_in_publisher_promotion(
     adult_yn: str = Query("N", description="성인등급 작품 포함 여부 (Y/N)"),
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     출판사 프로모션 작품 리스트 조회
@@ -2423,7 +2437,7 @@ async def products_in_publisher_promotion(
 async def products_in_main_rule_slots(
     adult_yn: str = Query("N", description="성인등급 작품 포함 여부 (Y/N)"),
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     return await product_service.products_in_main_rule_slots(
         kc_user_id=user.get("sub"), db=db, adult_yn=adult_yn
@@ -2500,7 +2514,7 @@ async def products_in_main_rule_slots(
 async def products_in_latest_update(
     adult_yn: str = Query("N", description="성인등급 작품 포함 여부 (Y/N)"),
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     최신 업데이트 작품 리스트 조회
@@ -2581,7 +2595,7 @@ async def products_in_latest_update(
 )
 async def products_in_applied_promotion_wait_for_free(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     기다리면 무료 프로모션 작품 리스트 조회
@@ -2660,7 +2674,7 @@ async def products_in_applied_promotion_wait_for_free(
 )
 async def products_in_applied_promotion_6_9_pass(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     """
     69패스 프로모션 작품 리스트 조회
@@ -2678,7 +2692,7 @@ async def products_in_applied_promotion_6_9_pass(
 )
 async def products_in_admin_gift_promotion(
     user: Dict[str, Any] = Depends(chk_cur_user),
-    db: AsyncSession = Depends(get_likenovel_db),
+    db: AsyncSession = Depends(get_likenovel_read_db),
 ):
     return await product_service.products_in_admin_gift_promotion(
         kc_user_id=user.get("sub"), db=db
@@ -666,6 +666,11 @@ async def get_user_comments_block(
 
 @router.get("/alarms", tags=["유저 - 알림"], dependencies=[Depends(analysis_logger)])
 async def get_user_alarms(
+    cursor: Optional[str] = Query(
+        None, description="커서 페이징(빈 값은 첫 페이지, 이후 응답의 nextCursor 전달). 미전달 시 전체 조회"
+    ),
+    limit: Optional[int] = Query(None, ge=1, description="커서 페이징 시 페이지당 개수"),
+    include_total: bool = Query(False, description="커서 페이징 시 전체 알림 수 조회 여부"),
     user: Dict[str, Any] = Depends(chk_cur_user),
     db: AsyncSession = Depends(get_likenovel_db),
 ):
@@ -675,7 +680,11 @@ async def get_user_alarms(
     """
 
     return await user_notification_service.get_user_alarms(
-        kc_user_id=user.get("sub"), db=db
+        kc_user_id=user.get("sub"),
+        db=db,
+        cursor=cursor,
+        limit=limit,
+        include_total=include_total,
     )
 
 
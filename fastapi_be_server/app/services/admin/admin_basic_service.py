@@ -9,6 +9,7 @@ from app.const import ErrorMessages, settings
 from app.exceptions import CustomResponseException
 import app.schemas.admin as admin_schema
 from app.services.common import comm_service
+from app.utils.identity import invalidate_user_identity
 from app.utils.query import build_update_query, get_file_path_sub_query
 from app.utils.response import check_exists_or_404
 
@@ -124,6 +125,7 @@ async def put_user(
     query = text(f"UPDATE tb_user SET {set_clause} WHERE user_id = :user_id")
 
     await db.execute(query, params)
+    invalidate_user_identity(user_id=user_id)
 
     return {"result": req_body}
 
@@ -12,11 +12,19 @@ from app.utils.query import (
     get_nickname_sub_query,
     get_pagination_params,
 )
-from app.utils.response import build_paginated_response, check_exists_or_404
+from app.utils.response import (
+    build_cursor_paginated_response,
+    build_paginated_response,
+    check_exists_or_404,
+)
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
 from app.utils.common import handle_exceptions
 from app.const import CommonConstants
 from app.services.common import comm_service
+from app.utils import token_revocation
+from app.utils.identity import invalidate_user_identity
 from app.services.common.cp_link_service import get_accepted_cp_info_by_user_id
+from app.services.product.product_card_service import mark_product_cards_dirty
 from app.const import ErrorMessages
 
 logger = logging.getLogger("admin_app")
@@ -25,6 +33,11 @@ logger = logging.getLogger("admin_app")
 Admin user management service functions.
 """
 
+# 회원 목록 커서 페이징 정렬(가입일 최신순, 동시각은 user_id 로 구분)
+ADMIN_USER_KEYSET_SPEC = KeysetSpec(
+    "admin_users", (KeysetOrder("u.created_date"), KeysetOrder("u.user_id"))
+)
+
 
 async def user_list(
     status: str,
@@ -33,9 +46,13 @@ async def user_list(
     page: int,
     count_per_page: int,
     db: AsyncSession,
+    cursor: str | None = None,
+    include_total: bool = False,
 ):
     """
-    Documentation cleaned due to encoding issue.
+    회원 목록 조회
+    - cursor 가 None 이면 page 페이징, 문자열(빈 값은 첫 페이지)이면 가입일 최신순 커서 페이징
+    - 커서 페이징은 include_total 일 때만 전체 회원 수를 조회합니다.
     """
 
     if search_word != "":
@@ -64,7 +81,27 @@ async def user_list(
     else:
         where = text("""""")
 
-    limit_clause, limit_params = get_pagination_params(page, count_per_page)
+    keyset = None
+    if cursor is not None:
+        keyset = parse_keyset_page(
+            ADMIN_USER_KEYSET_SPEC,
+            cursor,
+            count_per_page,
+            scope={
+                "status": status,
+                "search_target": search_target,
+                "search_word": search_word,
+            },
+        )
+        limit_clause, limit_params = keyset.limit_sql, keyset.params
+        keyset_select = f", {keyset.select_sql}"
+        keyset_where = keyset.where_sql
+        order_sql = keyset.order_by_sql
+    else:
+        limit_clause, limit_params = get_pagination_params(page, count_per_page)
+        keyset_select = ""
+        keyset_where = ""
+        order_sql = "created_date DESC"
 
     # TODO: cleaned garbled comment (encoding issue).
     if status == "all":
@@ -83,8 +120,10 @@ async def user_list(
         count_query = text(f"""
             SELECT COUNT(*) AS total_count FROM tb_user WHERE use_yn = 'N' {where}
         """)
-    count_result = await db.execute(count_query, {})
-    total_count = dict(count_result.mappings().first())["total_count"]
+    total_count = None
+    if keyset is None or include_total:
+        count_result = await db.execute(count_query, {})
+        total_count = dict(count_result.mappings().first())["total_count"]
 
     # TODO: cleaned garbled comment (encoding issue).
     if status == "all":
@@ -100,8 +139,10 @@ async def user_list(
                 NULL AS signoff_date,
                 agree_terms_yn,
                 (SELECT noti_yn FROM tb_user_notification WHERE user_id = u.user_id ORDER BY created_date DESC LIMIT 1) AS noti_yn
+                {keyset_select}
             FROM tb_user u WHERE use_yn = 'Y' {where}
-            ORDER BY created_date DESC
+            {keyset_where}
+            ORDER BY {order_sql}
             {limit_clause}
         """)
     elif status == CommonConstants.ROLE_NORMAL:
@@ -117,8 +158,10 @@ async def user_list(
                 NULL AS signoff_date,
                 agree_terms_yn,
                 (SELECT noti_yn FROM tb_user_notification WHERE user_id = u.user_id ORDER BY created_date DESC LIMIT 1) AS noti_yn
+                {keyset_select}
             FROM tb_user u WHERE use_yn = 'Y' AND role_type = 'normal' {where}
-            ORDER BY created_date DESC
+            {keyset_where}
+            ORDER BY {order_sql}
             {limit_clause}
         """)
     elif status == CommonConstants.ROLE_ADMIN:
@@ -134,8 +177,10 @@ async def user_list(
                 NULL AS signoff_date,
                 agree_terms_yn,
                 (SELECT noti_yn FROM tb_user_notification WHERE user_id = u.user_id ORDER BY created_date DESC LIMIT 1) AS noti_yn
+                {keyset_select}
             FROM tb_user u WHERE use_yn = 'Y' AND role_type = 'admin' {where}
-            ORDER BY created_date DESC
+            {keyset_where}
+            ORDER BY {order_sql}
             {limit_clause}
         """)
     elif status == "signout":
@@ -151,13 +196,21 @@ async def user_list(
                 updated_date AS signoff_date,
                 agree_terms_yn,
                 (SELECT noti_yn FROM tb_user_notification WHERE user_id = u.user_id ORDER BY created_date DESC LIMIT 1) AS noti_yn
+                {keyset_select}
             FROM tb_user u WHERE use_yn = 'N' {where}
-            ORDER BY created_date DESC
+            {keyset_where}
+            ORDER BY {order_sql}
             {limit_clause}
         """)
     result = await db.execute(query, limit_params)
     rows = result.mappings().all()
 
+    if keyset is not None:
+        rows, next_cursor = keyset.split(rows)
+        return build_cursor_paginated_response(
+            rows, next_cursor, keyset.limit, total_count
+        )
+
     results = [dict(row) for row in rows]
 
     # TODO: cleaned garbled comment (encoding issue).
@@ -307,6 +360,7 @@ async def accept_apply_role(id: int, db: AsyncSession):
                   WHERE id = :id
                  """)
     await db.execute(query, {"id": id})
+    invalidate_user_identity(user_id=row["user_id"])
 
     # TODO: cleaned garbled comment (encoding issue).
     # TODO: cleaned garbled comment (encoding issue).
@@ -399,6 +453,7 @@ async def deny_apply_role(id: int, db: AsyncSession):
                   WHERE id = :id
                  """)
     await db.execute(query, {"id": id})
+    invalidate_user_identity(user_id=row["user_id"])
 
     return {"result": True}
 
@@ -928,6 +983,7 @@ async def accept_apply_rank_up(apply_id: int, db: AsyncSession):
                  UPDATE tb_product_paid_apply SET status_code = 'accepted', approval_date = now() WHERE id = :apply_id
                  """)
     await db.execute(query, {"apply_id": apply_id})
+    mark_product_cards_dirty(row["product_id"])
 
     return {"result": True}
 
@@ -955,6 +1011,7 @@ async def deny_apply_rank_up(apply_id: int, db: AsyncSession):
                  UPDATE tb_product_paid_apply SET status_code = 'denied', approval_date = now() WHERE id = :apply_id
                  """)
     await db.execute(query, {"apply_id": apply_id})
+    mark_product_cards_dirty(row["product_id"])
 
     return {"result": True}
 
@@ -1256,6 +1313,8 @@ async def put_auth_signoff(user_id: int, db: AsyncSession):
                     pass
                 else:
                     raise e
+            token_revocation.revoke_user(kc_user_id)
+            invalidate_user_identity(kc_user_id=kc_user_id)
 
         query = text("""
                             delete from tb_user_social a
@@ -1332,5 +1391,7 @@ async def put_auth_signoff(user_id: int, db: AsyncSession):
                 pass
             else:
                 raise e
+        token_revocation.revoke_user(kc_user_id)
+        invalidate_user_identity(kc_user_id=kc_user_id)
 
     return
@@ -12,7 +12,6 @@ from decimal import Decimal
 from html import unescape
 from typing import Any
 
-import httpx
 from fastapi import status
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -21,7 +20,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config.log_config import service_error_logger
 from app.const import LOGGER_TYPE, settings
 from app.exceptions import CustomResponseException
+from app.utils.http_client import HTTP_PROVIDER_ANTHROPIC, get_http_client
 from app.utils.query import get_file_path_sub_query
+import app.services.ai.product_similar_neighbor as product_similar_neighbor
 import app.services.ai.recommendation_service as recommendation_service
 
 error_logger = service_error_logger(LOGGER_TYPE.LOGGER_FILE_NAME_FOR_SERVICE_ERROR)
@@ -545,16 +546,17 @@ async def _call_claude_messages(
     if tool_choice:
         payload["tool_choice"] = tool_choice
 
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-        response = await client.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": settings.ANTHROPIC_API_KEY,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json=payload,
-        )
+    client = get_http_client(HTTP_PROVIDER_ANTHROPIC)
+    response = await client.post(
+        "https://api.anthropic.com/v1/messages",
+        headers={
+            "x-api-key": settings.ANTHROPIC_API_KEY,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+        json=payload,
+        timeout=timeout_seconds,
+    )
 
     if response.status_code != 200:
         error_logger.error("Claude messages API error: %s %s", response.status_code, response.text)
@@ -1024,74 +1026,8 @@ def _should_reask_final_with_detail_lookup(
     return bool(last_query_rows)
 
 
-def _text_tokens(value: str, *, max_count: int = 30) -> set[str]:
-    text_value = str(value or "")
-    if not text_value:
-        return set()
-    tokens = re.findall(r"[가-힣A-Za-z0-9]{2,}", text_value.lower())
-    if not tokens:
-        return set()
-    return set(tokens[:max_count])
-
-
-def _match_ratio(base_values: set[str], candidate_values: set[str]) -> float:
-    if not base_values:
-        return 0.0
-    if not candidate_values:
-        return 0.0
-    return len(base_values & candidate_values) / len(base_values)
-
-
 def _compute_similarity_score(base: dict, candidate: dict) -> tuple[float, list[str]]:
-    matched_signals: list[str] = []
-    score = 0.0
-
-    axis_rules = [
-        ("세계관", "worldview_tags", 0.12),
-        ("주인공 타입", "protagonist_type_tags", 0.12),
-        ("주인공 직업", "protagonist_job_tags", 0.10),
-        ("능력/소재", "protagonist_material_tags", 0.10),
-        ("관계/로맨스", "axis_romance_tags", 0.09),
-        ("작풍", "axis_style_tags", 0.09),
-    ]
-    for label, key, weight in axis_rules:
-        base_set = set(base.get(key) or [])
-        candidate_set = set(candidate.get(key) or [])
-        ratio = _match_ratio(base_set, candidate_set)
-        if ratio > 0:
-            score += weight * ratio
-            matched_signals.append(label)
-
-    base_goal = str(base.get("protagonist_goal_primary") or "").strip()
-    candidate_goal = str(candidate.get("protagonist_goal_primary") or "").strip()
-    if base_goal and candidate_goal and base_goal == candidate_goal:
-        score += 0.08
-        matched_signals.append("목표")
-
-    base_mood = str(base.get("mood") or "").strip()
-    candidate_mood = str(candidate.get("mood") or "").strip()
-    if base_mood and candidate_mood and base_mood == candidate_mood:
-        score += 0.07
-        matched_signals.append("분위기")
-
-    base_pacing = str(base.get("pacing") or "").strip()
-    candidate_pacing = str(candidate.get("pacing") or "").strip()
-    if base_pacing and candidate_pacing and base_pacing == candidate_pacing:
-        score += 0.07
-        matched_signals.append("전개속도")
-
-    base_text_tokens = _text_tokens(
-        f"{base.get('premise') or ''} {base.get('hook') or ''}",
-        max_count=40,
-    )
-    candidate_text_tokens = _text_tokens(
-        f"{candidate.get('premise') or ''} {candidate.get('hook') or ''}",
-        max_count=40,
-    )
-    text_overlap = _match_ratio(base_text_tokens, candidate_text_tokens)
-    if text_overlap > 0:
-        score += 0.10 * text_overlap
-        matched_signals.append("설정/훅")
+    score, matched_signals = product_similar_neighbor.compute_content_similarity(base, candidate)
 
     reading_rate = _safe_float(candidate.get("reading_rate"), 0.0)
     count_hit = _safe_int(candidate.get("count_hit"), 0)
@@ -1127,6 +1063,62 @@ def _score_similar_candidate(
     return round(total_score, 4), round(similarity_score, 4), matched_signals, taste_match
 
 
+def _rank_similar_candidates(
+    base: dict,
+    candidate_rows: list[Any],
+    profile: dict | None = None,
+) -> list[dict]:
+    scored: list[dict] = []
+    for row in candidate_rows:
+        candidate = dict(row)
+        candidate["worldview_tags"] = _load_json_list(candidate.get("worldview_tags"))
+        candidate["protagonist_type_tags"] = _load_json_list(candidate.get("protagonist_type_tags"))
+        candidate["protagonist_job_tags"] = _load_json_list(candidate.get("protagonist_job_tags"))
+        candidate["protagonist_material_tags"] = _load_json_list(candidate.get("protagonist_material_tags"))
+        candidate["axis_romance_tags"] = _load_json_list(candidate.get("axis_romance_tags"))
+        candidate["axis_style_tags"] = _load_json_list(candidate.get("axis_style_tags"))
+        candidate["taste_tags"] = _load_json_list(candidate.get("taste_tags"))
+        total_score, similarity_score, matched_signals, taste_match = _score_similar_candidate(
+            base,
+            candidate,
+            profile,
+        )
+        if total_score <= 0:
+            continue
+        scored.append(
+            {
+                "product_id": candidate.get("product_id"),
+                "title": candidate.get("title"),
+                "author_name": candidate.get("author_name"),
+                "status_code": candidate.get("status_code"),
+                "price_type": candidate.get("price_type"),
+                "monopoly_yn": candidate.get("monopoly_yn"),
+                "contract_yn": candidate.get("contract_yn", "N"),
+                "last_episode_date": candidate.get("last_episode_date"),
+                "new_release_yn": candidate.get("new_release_yn", "N"),
+                "episode_count": _safe_int(candidate.get("episode_count"), 0),
+                "cover_url": _to_cover_url(candidate.get("cover_path")),
+                "writing_count_per_week": _safe_float(candidate.get("writing_count_per_week"), 0.0),
+                "taste_tags": candidate.get("taste_tags") or [],
+                "waiting_for_free_yn": candidate.get("waiting_for_free_yn", "N"),
+                "six_nine_path_yn": candidate.get("six_nine_path_yn", "N"),
+                "similarity_score": similarity_score,
+                "total_score": total_score,
+                "matched_signals": matched_signals[:3],
+                "taste_match": taste_match,
+            }
+        )
+
+    scored.sort(
+        key=lambda item: (
+            item.get("total_score", 0.0),
+            item.get("similarity_score", 0.0),
+        ),
+        reverse=True,
+    )
+    return scored
+
+
 async def get_similar_products(
     db: AsyncSession,
     *,
@@ -1202,8 +1194,7 @@ async def get_similar_products(
             candidate_params[key] = product_id
         exclude_clause = f" AND p.product_id NOT IN ({', '.join(placeholders)})"
 
-    candidate_query = text(
-        f"""
+    candidate_select_sql = f"""
         SELECT
             p.product_id,
             p.title,
@@ -1236,6 +1227,8 @@ async def get_similar_products(
             IF(wff.product_id IS NOT NULL, 'Y', 'N') AS waiting_for_free_yn,
             IF(p69.product_id IS NOT NULL, 'Y', 'N') AS six_nine_path_yn
         FROM tb_product p
+    """
+    candidate_join_where_sql = f"""
         INNER JOIN tb_product_ai_metadata m ON m.product_id = p.product_id
         LEFT JOIN tb_product_trend_index pti ON pti.product_id = p.product_id
         {recommendation_service.LATEST_ENGAGEMENT_JOIN_SQL}
@@ -1249,61 +1242,45 @@ async def get_similar_products(
           AND TRIM(p.author_name) <> ''
           {"AND p.ratings_code = 'all'" if normalized_adult == "N" else ""}
           {exclude_clause}
-        ORDER BY COALESCE(pti.reading_rate, 0) DESC, p.count_hit DESC
-        LIMIT 120
-        """
-    )
-    candidate_result = await db.execute(candidate_query, candidate_params)
-    candidate_rows = await _result_mappings_all(candidate_result)
+    """
 
     scored: list[dict] = []
-    for row in candidate_rows:
-        candidate = dict(row)
-        candidate["worldview_tags"] = _load_json_list(candidate.get("worldview_tags"))
-        candidate["protagonist_type_tags"] = _load_json_list(candidate.get("protagonist_type_tags"))
-        candidate["protagonist_job_tags"] = _load_json_list(candidate.get("protagonist_job_tags"))
-        candidate["protagonist_material_tags"] = _load_json_list(candidate.get("protagonist_material_tags"))
-        candidate["axis_romance_tags"] = _load_json_list(candidate.get("axis_romance_tags"))
-        candidate["axis_style_tags"] = _load_json_list(candidate.get("axis_style_tags"))
-        candidate["taste_tags"] = _load_json_list(candidate.get("taste_tags"))
-        total_score, similarity_score, matched_signals, taste_match = _score_similar_candidate(
-            base,
-            candidate,
-            profile,
+    if settings.PRODUCT_SIMILAR_NEIGHBOR_ENABLED:
+        # 미리 계산한 내용 유사도 상위 이웃(product_similar_neighbor)만 다시 채점
+        neighbor_query = text(
+            f"""
+            {candidate_select_sql}
+            INNER JOIN tb_product_similar_neighbor n
+                ON n.neighbor_product_id = p.product_id
+               AND n.product_id = :base_product_id
+            {candidate_join_where_sql}
+            ORDER BY n.rank_no
+            """
         )
-        if total_score <= 0:
-            continue
-        scored.append(
-            {
-                "product_id": candidate.get("product_id"),
-                "title": candidate.get("title"),
-                "author_name": candidate.get("author_name"),
-                "status_code": candidate.get("status_code"),
-                "price_type": candidate.get("price_type"),
-                "monopoly_yn": candidate.get("monopoly_yn"),
-                "contract_yn": candidate.get("contract_yn", "N"),
-                "last_episode_date": candidate.get("last_episode_date"),
-                "new_release_yn": candidate.get("new_release_yn", "N"),
-                "episode_count": _safe_int(candidate.get("episode_count"), 0),
-                "cover_url": _to_cover_url(candidate.get("cover_path")),
-                "writing_count_per_week": _safe_float(candidate.get("writing_count_per_week"), 0.0),
-                "taste_tags": candidate.get("taste_tags") or [],
-                "waiting_for_free_yn": candidate.get("waiting_for_free_yn", "N"),
-                "six_nine_path_yn": candidate.get("six_nine_path_yn", "N"),
-                "similarity_score": similarity_score,
-                "total_score": total_score,
-                "matched_signals": matched_signals[:3],
-                "taste_match": taste_match,
-            }
+        try:
+            neighbor_result = await db.execute(neighbor_query, candidate_params)
+            scored = _rank_similar_candidates(base, await _result_mappings_all(neighbor_result), profile)
+        except SQLAlchemyError as e:
+            logger.warning(f"similar neighbor lookup failed: base_product_id={base_product_id}, error={e}")
+            scored = []
+
+    if len(scored) < normalized_limit:
+        # 이웃 계산 전(신규 작품 등)이거나 필터 후 부족하면 인기 상위 후보를 채점해 남은 자리를 채운다
+        candidate_query = text(
+            f"""
+            {candidate_select_sql}
+            {candidate_join_where_sql}
+            ORDER BY COALESCE(pti.reading_rate, 0) DESC, p.count_hit DESC
+            LIMIT 120
+            """
         )
-
-    scored.sort(
-        key=lambda item: (
-            item.get("total_score", 0.0),
-            item.get("similarity_score", 0.0),
-        ),
-        reverse=True,
-    )
+        candidate_result = await db.execute(candidate_query, candidate_params)
+        neighbor_ids = {item.get("product_id") for item in scored}
+        scored = scored + [
+            item
+            for item in _rank_similar_candidates(base, await _result_mappings_all(candidate_result), profile)
+            if item.get("product_id") not in neighbor_ids
+        ]
     return base, scored[:normalized_limit]
 
 
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+"""
+추천용 작품 AI 메타데이터(DNA) 프로세스 색인
+- 취향 추천/최근 읽은 작품 기반 섹션/자유 입력 추천은 매 요청 전체 작품의 AI 메타데이터를 조회하고
+  행마다 JSON 컬럼 10여 개를 json.loads 하던 것을, 프로세스(워커) 단위 색인 하나를 공유하도록 바꿉니다.
+- 처음 한 번 전체를 적재(파싱 1회)하고, 이후 refresh_interval 마다 마지막 확인 시각 이후
+  updated_date 가 바뀐 작품(메타데이터/작품/행동 지표)만 다시 조회해 반영합니다.
+  추천 대상에서 빠진 작품(비공개/분석 실패/추천 제외)은 색인에서 제거합니다.
+- 삭제된 행이나 시계 오차로 놓친 변경은 full_reload_interval 마다 전체 재적재로 맞춥니다.
+- 반영으로 내용이 바뀔 때마다 version 이 1 증가하고, 요청에는 version 별로 만들어 둔 목록을 돌려줍니다.
+  목록의 dict 는 색인과 공유하므로 호출부는 읽기 전용으로만 사용합니다.
+- 같은 시점에 몰린 요청은 한 요청만 조회하고(asyncio.Lock), 갱신 조회가 실패하면 기존 색인을 그대로 씁니다.
+"""
+
+# 색인 행에서 추천 대상 여부를 담는 컬럼(로더가 함께 조회)
+ELIGIBLE_COLUMN = "index_eligible_yn"
+# 추천 경로에서 쓰지 않아 색인에 보관하지 않는 컬럼(LLM 원본 응답)
+_DROPPED_COLUMNS = ("raw_analysis",)
+
+
+class ProductAiMetadataIndex:
+    """
+    작품 AI 메타데이터 색인
+
+    Args:
+        loader: async (db, since) -> (rows, checked_at). since 가 None 이면 전체 조회,
+            아니면 since 이후 변경된 작품만 조회. rows 에는 ELIGIBLE_COLUMN 이 포함되고,
+            checked_at 은 조회 직전의 DB 시각(다음 증분 조회 기준)
+        parse_row: 조회 행 -> 메타데이터 dict (JSON 컬럼 파싱)
+    """
+
+    def __init__(
+        self,
+        loader,
+        parse_row,
+        refresh_interval: float = settings.AI_METADATA_INDEX_REFRESH_SECONDS,
+        full_reload_interval: float = settings.AI_METADATA_INDEX_FULL_RELOAD_SECONDS,
+        overlap_seconds: float = settings.AI_METADATA_INDEX_OVERLAP_SECONDS,
+    ):
+        self.loader = loader
+        self.parse_row = parse_row
+        self.refresh_interval = refresh_interval
+        self.full_reload_interval = full_reload_interval
+        self.overlap_seconds = overlap_seconds
+        self.version = 0
+        self._entries: dict[int, dict] = {}
+        # version 별 목록 (version, 전체, 전체 이용가)
+        self._snapshot: tuple[int, list[dict], list[dict]] | None = None
+        self._since = None
+        self._loaded = False
+        self._checked_at = 0.0
+        self._full_loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.full_loads = 0
+        self.incremental_loads = 0
+        self.failed_loads = 0
+
+    def metrics(self) -> dict:
+        return {
+            "version": self.version,
+            "products": len(self._entries),
+            "full_loads": self.full_loads,
+            "incremental_loads": self.incremental_loads,
+            "failed_loads": self.failed_loads,
+        }
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def contains(self, product_id) -> bool:
+        """현재 색인 기준 추천 대상 작품인지(조회 없이)"""
+        try:
+            return int(product_id) in self._entries
+        except (TypeError, ValueError):
+            return False
+
+    def invalidate(self) -> None:
+        """다음 조회 시 전체 재적재"""
+        self._since = None
+        self._checked_at = 0.0
+
+    def _parse(self, row) -> tuple[int, bool, dict]:
+        data = dict(row)
+        eligible = data.pop(ELIGIBLE_COLUMN, "Y") == "Y"
+        for key in _DROPPED_COLUMNS:
+            data.pop(key, None)
+        parsed = self.parse_row(data)
+        return int(parsed["product_id"]), eligible, parsed
+
+    def _apply_full(self, rows) -> None:
+        entries = {}
+        for row in rows:
+            product_id, eligible, parsed = self._parse(row)
+            if eligible:
+                entries[product_id] = parsed
+        self._entries = entries
+        self.version += 1
+
+    def _apply_incremental(self, rows) -> int:
+        changed = 0
+        for row in rows:
+            product_id, eligible, parsed = self._parse(row)
+            if not eligible:
+                if self._entries.pop(product_id, None) is not None:
+                    changed += 1
+                continue
+            if self._entries.get(product_id) != parsed:
+                self._entries[product_id] = parsed
+                changed += 1
+        if changed:
+            self.version += 1
+        return changed
+
+    def _next_since(self, checked_at):
+        # 조회 직전에 커밋 중이던 변경을 놓치지 않도록 겹쳐서 다시 조회
+        if checked_at is None:
+            return None
+        return checked_at - timedelta(seconds=self.overlap_seconds)
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> int:
+        """
+        주기가 지났으면 전체/증분 조회를 반영하고 현재 version 반환
+
+        Raises:
+            처음 적재가 실패하면 조회 예외를 그대로 전달(색인이 없으므로)
+        """
+        if not force and self._loaded and time.monotonic() - self._checked_at < self.refresh_interval:
+            return self.version
+
+        async with self._lock:
+            now = time.monotonic()
+            # 대기하는 동안 다른 요청이 갱신했으면 그대로 사용
+            if not force and self._loaded and now - self._checked_at < self.refresh_interval:
+                return self.version
+
+            full = (
+                not self._loaded
+                or self._since is None
+                or now - self._full_loaded_at >= self.full_reload_interval
+            )
+            try:
+                rows, checked_at = await self.loader(db, None if full else self._since)
+            except Exception as e:
+                if not self._loaded:
+                    raise
+                self.failed_loads += 1
+                self._checked_at = now
+                logger.warning(f"product ai metadata index refresh failed: {e}")
+                return self.version
+
+            if full:
+                self._apply_full(rows)
+                self.full_loads += 1
+                self._full_loaded_at = now
+                self._loaded = True
+            else:
+                self._apply_incremental(rows)
+                self.incremental_loads += 1
+            self._since = self._next_since(checked_at)
+            self._checked_at = now
+            return self.version
+
+    def snapshot(self, adult_yn: str = "N") -> list[dict]:
+        """
+        현재 version 의 추천 대상 목록(adult_yn == "N" 이면 전체 이용가만)
+        """
+        if self._snapshot is None or self._snapshot[0] != self.version:
+            all_rows = list(self._entries.values())
+            all_age_rows = [row for row in all_rows if row.get("ratings_code") == "all"]
+            self._snapshot = (self.version, all_rows, all_age_rows)
+        _, all_rows, all_age_rows = self._snapshot
+        # 목록 자체는 호출부가 정렬/필터해도 색인에 영향 없도록 복사
+        return list(all_age_rows if adult_yn == "N" else all_rows)
+
+    async def get_all(self, db: AsyncSession, adult_yn: str = "N") -> list[dict]:
+        await self.refresh(db)
+        return self.snapshot(adult_yn)
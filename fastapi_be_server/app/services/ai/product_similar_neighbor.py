@@ -0,0 +1,445 @@
+import heapq
+import json
+import re
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+"""
+유사 작품 이웃 테이블(tb_product_similar_neighbor)
+- get_similar_products(ai_chat_service) 의 유사도 중 작품 DNA 로만 정해지는 내용 점수
+  (축 태그/목표/분위기/전개속도/설정·훅 토큰)를 compute_content_similarity 로 분리하고,
+  작품마다 내용 점수 상위 N개(PRODUCT_SIMILAR_NEIGHBOR_TOP_N)를 미리 계산해 저장합니다.
+- 인기/독자반응/취향 점수는 자주 바뀌므로 저장하지 않고, 서빙 시 이웃 후보에만 기존 채점을 다시 적용합니다.
+- 계산은 (축, 라벨)/토큰 역색인의 작품 행 배열을 np.bincount 로 세어 기준 작품과 전체 작품의 공유 개수를 한 번에 구하고,
+  compute_content_similarity 와 같은 순서/식으로 점수를 냅니다(부동소수 결과 동일).
+  분위기/전개속도처럼 값 종류가 적은 항목은 역색인 대신 값 코드 비교로 셉니다.
+- 갱신
+  - 전체: rebuild_all_similar_neighbors (dist/batch/build_product_similar_neighbors.py --all, 테이블이 비었을 때)
+  - 증분: refresh_similar_neighbors(product_ids), extract_product_dna 가 DNA 를 저장한 작품 기준
+    · 바뀐 작품 자신의 목록은 다시 계산
+    · 바뀐 작품을 이웃으로 가진 작품은 목록 전체를 다시 계산(점수가 내려가 밀려날 수 있음)
+    · 그 외 특징을 공유하는 작품은 바뀐 작품의 점수가 현재 목록 꼬리보다 높을 때만 끼워 넣음
+"""
+
+SIMILARITY_AXIS_RULES = (
+    ("세계관", "worldview_tags", 0.12),
+    ("주인공 타입", "protagonist_type_tags", 0.12),
+    ("주인공 직업", "protagonist_job_tags", 0.10),
+    ("능력/소재", "protagonist_material_tags", 0.10),
+    ("관계/로맨스", "axis_romance_tags", 0.09),
+    ("작풍", "axis_style_tags", 0.09),
+)
+SIMILARITY_EQUAL_RULES = (
+    ("목표", "protagonist_goal_primary", 0.08),
+    ("분위기", "mood", 0.07),
+    ("전개속도", "pacing", 0.07),
+)
+SIMILARITY_TEXT_LABEL = "설정/훅"
+SIMILARITY_TEXT_WEIGHT = 0.10
+SIMILARITY_TEXT_MAX_TOKENS = 40
+
+# 특징 구성요소 순서: 축 6개, 일치 3개, 설정/훅 토큰 1개
+_TEXT_COMPONENT = len(SIMILARITY_AXIS_RULES) + len(SIMILARITY_EQUAL_RULES)
+_COMPONENT_COUNT = _TEXT_COMPONENT + 1
+
+_INSERT_CHUNK_SIZE = 1000
+
+_PRODUCT_QUERY = """
+    SELECT
+        m.product_id,
+        m.protagonist_goal_primary,
+        m.mood,
+        m.pacing,
+        m.premise,
+        m.hook,
+        m.worldview_tags,
+        m.protagonist_type_tags,
+        m.protagonist_job_tags,
+        m.protagonist_material_tags,
+        m.axis_romance_tags,
+        m.axis_style_tags
+    FROM tb_product_ai_metadata m
+    WHERE m.analysis_status = 'success'
+      AND COALESCE(m.exclude_from_recommend_yn, 'N') = 'N'
+"""
+
+_NEIGHBOR_QUERY = text(
+    """
+    SELECT product_id, neighbor_product_id, content_score, matched_signals
+    FROM tb_product_similar_neighbor
+    ORDER BY product_id, rank_no
+    """
+)
+
+_DELETE_QUERY = text(
+    """
+    DELETE FROM tb_product_similar_neighbor
+    WHERE product_id IN :product_ids
+    """
+).bindparams(bindparam("product_ids", expanding=True))
+
+_DELETE_STALE_QUERY = text(
+    """
+    DELETE FROM tb_product_similar_neighbor
+    WHERE computed_date < :computed_date
+    """
+)
+
+_INSERT_QUERY = text(
+    """
+    INSERT INTO tb_product_similar_neighbor (
+        product_id, neighbor_product_id, rank_no, content_score, matched_signals, computed_date
+    ) VALUES (
+        :product_id, :neighbor_product_id, :rank_no, :content_score, :matched_signals, :computed_date
+    )
+    """
+)
+
+# (neighbor_product_id, content_score, matched_signals)
+Neighbor = tuple[int, float, list[str]]
+
+
+def text_tokens(value: str, *, max_count: int = 30) -> set[str]:
+    text_value = str(value or "")
+    if not text_value:
+        return set()
+    tokens = re.findall(r"[가-힣A-Za-z0-9]{2,}", text_value.lower())
+    if not tokens:
+        return set()
+    return set(tokens[:max_count])
+
+
+def _content_features(product: dict) -> tuple[list[set[str]], list[str], set[str]]:
+    axis_sets = [set(product.get(key) or []) for _, key, _ in SIMILARITY_AXIS_RULES]
+    equal_values = [str(product.get(key) or "").strip() for _, key, _ in SIMILARITY_EQUAL_RULES]
+    tokens = text_tokens(
+        f"{product.get('premise') or ''} {product.get('hook') or ''}",
+        max_count=SIMILARITY_TEXT_MAX_TOKENS,
+    )
+    return axis_sets, equal_values, tokens
+
+
+def _score_from_counts(base_features, counts: list[int]) -> tuple[float, list[str]]:
+    """
+    공유 개수(구성요소별)로 내용 점수 계산, compute_content_similarity 와 같은 덧셈 순서
+    """
+    axis_sets, _, tokens = base_features
+    matched_signals: list[str] = []
+    score = 0.0
+    for idx, (label, _, weight) in enumerate(SIMILARITY_AXIS_RULES):
+        if counts[idx] > 0:
+            score += weight * (counts[idx] / len(axis_sets[idx]))
+            matched_signals.append(label)
+    offset = len(SIMILARITY_AXIS_RULES)
+    for idx, (label, _, weight) in enumerate(SIMILARITY_EQUAL_RULES):
+        if counts[offset + idx] > 0:
+            score += weight
+            matched_signals.append(label)
+    if counts[_TEXT_COMPONENT] > 0:
+        score += SIMILARITY_TEXT_WEIGHT * (counts[_TEXT_COMPONENT] / len(tokens))
+        matched_signals.append(SIMILARITY_TEXT_LABEL)
+    return score, matched_signals
+
+
+def _shared_counts(base_features, candidate_features) -> list[int]:
+    base_axis, base_equal, base_tokens = base_features
+    candidate_axis, candidate_equal, candidate_tokens = candidate_features
+    counts = [len(base_set & candidate_set) for base_set, candidate_set in zip(base_axis, candidate_axis)]
+    counts.extend(
+        1 if base_value and base_value == candidate_value else 0
+        for base_value, candidate_value in zip(base_equal, candidate_equal)
+    )
+    counts.append(len(base_tokens & candidate_tokens))
+    return counts
+
+
+def compute_content_similarity(base: dict, candidate: dict) -> tuple[float, list[str]]:
+    """
+    작품 DNA 내용 유사도(인기/독자반응 제외)와 일치한 신호 라벨
+    """
+    base_features = _content_features(base)
+    return _score_from_counts(base_features, _shared_counts(base_features, _content_features(candidate)))
+
+
+def _vector_scores(counts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    _score_from_counts 의 배열 버전(작품별 같은 덧셈 순서라 부동소수 결과 동일)
+
+    Args:
+        counts: (구성요소, 작품) 공유 개수
+        lengths: 기준 작품의 구성요소별 개수, (구성요소,) 또는 (구성요소, 작품)
+    """
+    score = np.zeros(counts.shape[1], dtype=np.float64)
+    for idx, (_, _, weight) in enumerate(SIMILARITY_AXIS_RULES):
+        score = np.where(counts[idx] > 0, score + weight * (counts[idx] / np.maximum(lengths[idx], 1)), score)
+    offset = len(SIMILARITY_AXIS_RULES)
+    for idx, (_, _, weight) in enumerate(SIMILARITY_EQUAL_RULES):
+        score = np.where(counts[offset + idx] > 0, score + weight, score)
+    text_counts = counts[_TEXT_COMPONENT]
+    return np.where(
+        text_counts > 0,
+        score + SIMILARITY_TEXT_WEIGHT * (text_counts / np.maximum(lengths[_TEXT_COMPONENT], 1)),
+        score,
+    )
+
+
+class SimilarNeighborIndex:
+    """
+    작품 DNA 특징 역색인(라벨/토큰 -> 작품 행 배열), 작품쌍 공유 개수를 배열로 계산
+    """
+
+    def __init__(self, products: dict[int, dict]):
+        self.product_ids = list(products)
+        self.row_of = {product_id: row for row, product_id in enumerate(self.product_ids)}
+        self.ids = np.array(self.product_ids, dtype=np.int64)
+        self.features = {product_id: _content_features(product) for product_id, product in products.items()}
+        size = len(self.product_ids)
+
+        # 축 6개 + 설정/훅 토큰: 값 -> 작품 행 배열
+        postings: dict[int, dict[str, list[int]]] = {
+            component: {} for component in [*range(len(SIMILARITY_AXIS_RULES)), _TEXT_COMPONENT]
+        }
+        # 일치 비교(목표/분위기/전개속도): 값 코드, 빈 값은 -1
+        self.equal_codes = np.full((len(SIMILARITY_EQUAL_RULES), size), -1, dtype=np.int64)
+        self.equal_code_of: list[dict[str, int]] = [{} for _ in SIMILARITY_EQUAL_RULES]
+        self.lengths = np.zeros((_COMPONENT_COUNT, size), dtype=np.int64)
+        for row, product_id in enumerate(self.product_ids):
+            axis_sets, equal_values, tokens = self.features[product_id]
+            for component, values in enumerate(axis_sets):
+                self.lengths[component, row] = len(values)
+                for value in values:
+                    postings[component].setdefault(value, []).append(row)
+            for idx, value in enumerate(equal_values):
+                if value:
+                    codes = self.equal_code_of[idx]
+                    self.equal_codes[idx, row] = codes.setdefault(value, len(codes))
+                    self.lengths[len(axis_sets) + idx, row] = 1
+            self.lengths[_TEXT_COMPONENT, row] = len(tokens)
+            for token in tokens:
+                postings[_TEXT_COMPONENT].setdefault(token, []).append(row)
+        self.postings = {
+            component: {value: np.array(rows, dtype=np.int64) for value, rows in by_value.items()}
+            for component, by_value in postings.items()
+        }
+
+    def __contains__(self, product_id: int) -> bool:
+        return product_id in self.row_of
+
+    def shared_counts(self, product_id: int) -> np.ndarray:
+        """(구성요소, 작품) 공유 개수, 자기 자신 열은 0"""
+        size = len(self.product_ids)
+        counts = np.zeros((_COMPONENT_COUNT, size), dtype=np.int64)
+        axis_sets, equal_values, tokens = self.features[product_id]
+        for component, values in [*enumerate(axis_sets), (_TEXT_COMPONENT, tokens)]:
+            if values:
+                rows = np.concatenate([self.postings[component][value] for value in values])
+                counts[component] = np.bincount(rows, minlength=size)
+        offset = len(axis_sets)
+        for idx, value in enumerate(equal_values):
+            if value:
+                counts[offset + idx] = self.equal_codes[idx] == self.equal_code_of[idx][value]
+        counts[:, self.row_of[product_id]] = 0
+        return counts
+
+    def top_neighbors(self, product_id: int, top_n: int) -> list[Neighbor]:
+        row = self.row_of[product_id]
+        counts = self.shared_counts(product_id)
+        scores = _vector_scores(counts, self.lengths[:, row])
+        rows = np.flatnonzero(scores > 0)
+        if top_n <= 0 or not len(rows):
+            return []
+        if len(rows) > top_n:
+            # 경계 점수 이상만 남긴 뒤(동점 포함) 정렬
+            kth = np.partition(scores[rows], len(rows) - top_n)[len(rows) - top_n]
+            rows = rows[scores[rows] >= kth]
+        rows = rows[np.lexsort((self.ids[rows], -scores[rows]))][:top_n]
+        base_features = self.features[product_id]
+        neighbors = []
+        for candidate_row in rows:
+            score, matched_signals = _score_from_counts(base_features, counts[:, candidate_row].tolist())
+            neighbors.append((int(self.ids[candidate_row]), score, matched_signals))
+        return neighbors
+
+    def scores_as_candidate(self, product_id: int) -> list[tuple[int, float, list[str]]]:
+        """다른 작품 각각을 기준으로 했을 때 이 작품의 점수(0 초과만)"""
+        counts = self.shared_counts(product_id)
+        scores = _vector_scores(counts, self.lengths)
+        result = []
+        for row in np.flatnonzero(scores > 0):
+            base_id = self.product_ids[row]
+            score, matched_signals = _score_from_counts(self.features[base_id], counts[:, row].tolist())
+            result.append((base_id, score, matched_signals))
+        return result
+
+
+def _top(neighbors, top_n: int) -> list[Neighbor]:
+    # 점수 내림차순, 같으면 작품 ID 오름차순
+    return heapq.nsmallest(top_n, neighbors, key=lambda item: (-item[1], item[0]))
+
+
+def build_similar_neighbors(
+    products: dict[int, dict],
+    *,
+    top_n: int = settings.PRODUCT_SIMILAR_NEIGHBOR_TOP_N,
+) -> dict[int, list[Neighbor]]:
+    """전체 작품의 이웃 목록"""
+    index = SimilarNeighborIndex(products)
+    return {product_id: index.top_neighbors(product_id, top_n) for product_id in products}
+
+
+def refresh_similar_neighbor_lists(
+    products: dict[int, dict],
+    current: dict[int, list[Neighbor]],
+    changed_product_ids,
+    *,
+    top_n: int = settings.PRODUCT_SIMILAR_NEIGHBOR_TOP_N,
+) -> dict[int, list[Neighbor]]:
+    """
+    DNA 가 바뀐 작품 기준 증분 갱신, 다시 써야 하는 작품의 목록만 반환(빈 목록은 삭제)
+
+    Args:
+        products: 현재 추천 대상 작품 DNA (product_id -> 메타)
+        current: 저장된 이웃 목록
+        changed_product_ids: DNA 가 바뀐(또는 추천 대상에서 빠진) 작품
+    """
+    index = SimilarNeighborIndex(products)
+    changed = {int(product_id) for product_id in changed_product_ids}
+    updated: dict[int, list[Neighbor]] = {}
+
+    recompute = {product_id for product_id in changed if product_id in index}
+    for product_id, neighbors in current.items():
+        if product_id in changed:
+            continue
+        if any(neighbor_id in changed for neighbor_id, _, _ in neighbors):
+            recompute.add(product_id)
+    for product_id in changed - recompute:
+        # 추천 대상에서 빠진 작품
+        updated[product_id] = []
+    for product_id in recompute:
+        if product_id in index:
+            updated[product_id] = index.top_neighbors(product_id, top_n)
+        else:
+            updated[product_id] = []
+
+    for changed_id in sorted(changed):
+        if changed_id not in index:
+            continue
+        for product_id, score, matched_signals in index.scores_as_candidate(changed_id):
+            if product_id in recompute:
+                continue
+            neighbors = updated.get(product_id, current.get(product_id, []))
+            if len(neighbors) >= top_n and (-score, changed_id) > (-neighbors[-1][1], neighbors[-1][0]):
+                continue
+            updated[product_id] = _top([*neighbors, (changed_id, score, matched_signals)], top_n)
+    return updated
+
+
+def _load_label_list(value: Any) -> list[str]:
+    # ai_chat_service._load_json_list 와 같은 규칙(JSON 배열이 아니면 문자열 하나)
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value if str(v or "").strip()]
+    if isinstance(value, str):
+        text_value = value.strip()
+        if not text_value:
+            return []
+        try:
+            parsed = json.loads(text_value)
+            if isinstance(parsed, list):
+                return [str(v) for v in parsed if str(v or "").strip()]
+        except (json.JSONDecodeError, TypeError):
+            pass
+        return [text_value]
+    return []
+
+
+async def load_similar_neighbor_products(db: AsyncSession) -> dict[int, dict]:
+    """이웃 계산 대상(분석 성공, 추천 제외 아님) 작품 DNA"""
+    result = await db.execute(text(_PRODUCT_QUERY))
+    products: dict[int, dict] = {}
+    for row in result.mappings().all():
+        product = dict(row)
+        for _, key, _ in SIMILARITY_AXIS_RULES:
+            product[key] = _load_label_list(product.get(key))
+        products[int(product["product_id"])] = product
+    return products
+
+
+async def load_similar_neighbors(db: AsyncSession) -> dict[int, list[Neighbor]]:
+    result = await db.execute(_NEIGHBOR_QUERY)
+    neighbors: dict[int, list[Neighbor]] = {}
+    for row in result.mappings().all():
+        neighbors.setdefault(int(row["product_id"]), []).append(
+            (
+                int(row["neighbor_product_id"]),
+                float(row["content_score"]),
+                _load_label_list(row.get("matched_signals")),
+            )
+        )
+    return neighbors
+
+
+async def save_similar_neighbors(
+    db: AsyncSession,
+    neighbor_lists: dict[int, list[Neighbor]],
+    *,
+    computed_date: datetime,
+) -> int:
+    """작품별 이웃 목록 교체(삭제 후 입력), 입력 행 수 반환. 커밋은 호출부"""
+    product_ids = sorted(neighbor_lists)
+    for start in range(0, len(product_ids), _INSERT_CHUNK_SIZE):
+        await db.execute(_DELETE_QUERY, {"product_ids": product_ids[start:start + _INSERT_CHUNK_SIZE]})
+
+    rows = [
+        {
+            "product_id": product_id,
+            "neighbor_product_id": neighbor_id,
+            "rank_no": rank_no,
+            "content_score": score,
+            "matched_signals": json.dumps(matched_signals, ensure_ascii=False),
+            "computed_date": computed_date,
+        }
+        for product_id in product_ids
+        for rank_no, (neighbor_id, score, matched_signals) in enumerate(neighbor_lists[product_id], 1)
+    ]
+    for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+        await db.execute(_INSERT_QUERY, rows[start:start + _INSERT_CHUNK_SIZE])
+    return len(rows)
+
+
+async def rebuild_all_similar_neighbors(
+    db: AsyncSession,
+    *,
+    top_n: int = settings.PRODUCT_SIMILAR_NEIGHBOR_TOP_N,
+) -> dict:
+    """전체 재계산, 이번 계산에 없는 작품 행은 삭제"""
+    computed_date = datetime.now().replace(microsecond=0)
+    products = await load_similar_neighbor_products(db)
+    neighbor_lists = build_similar_neighbors(products, top_n=top_n)
+    inserted = await save_similar_neighbors(db, neighbor_lists, computed_date=computed_date)
+    await db.execute(_DELETE_STALE_QUERY, {"computed_date": computed_date})
+    await db.commit()
+    return {"products": len(products), "updated_products": len(neighbor_lists), "rows": inserted}
+
+
+async def refresh_similar_neighbors(
+    db: AsyncSession,
+    product_ids,
+    *,
+    top_n: int = settings.PRODUCT_SIMILAR_NEIGHBOR_TOP_N,
+) -> dict:
+    """DNA 가 바뀐 작품 기준 증분 갱신"""
+    computed_date = datetime.now().replace(microsecond=0)
+    products = await load_similar_neighbor_products(db)
+    current = await load_similar_neighbors(db)
+    neighbor_lists = refresh_similar_neighbor_lists(products, current, product_ids, top_n=top_n)
+    inserted = await save_similar_neighbors(db, neighbor_lists, computed_date=computed_date)
+    await db.commit()
+    return {"products": len(products), "updated_products": len(neighbor_lists), "rows": inserted}
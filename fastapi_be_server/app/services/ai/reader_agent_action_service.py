@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.const import settings
 from app.services.ai.reader_agent_decision_service import EVALUATION_CODES
+from app.services.product.product_card_service import mark_product_cards_dirty
 
 
 YN_VALUES = {"Y", "N"}
@@ -1137,6 +1138,7 @@ async def _apply_read_action(
                 "updated_id": settings.DB_DML_DEFAULT_ID,
             },
         )
+    mark_product_cards_dirty(action.product_id)
 
     await db.execute(
         text("""
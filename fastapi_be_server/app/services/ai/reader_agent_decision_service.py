@@ -9,6 +9,7 @@ import httpx
 
 from app.const import settings
 from app.exceptions import CustomResponseException
+from app.utils.http_client import HTTP_PROVIDER_OPENROUTER, get_http_client
 
 
 READER_DECISION_PROMPT_VERSION = "ai-reader-decision-v1"
@@ -475,18 +476,17 @@ async def _call_openrouter_chat_completion(
 
 
 async def _post_openrouter_chat_completion(payload: dict[str, Any], max_tokens: int) -> str:
-    async with httpx.AsyncClient(
-        timeout=settings.AI_READER_OPENROUTER_TIMEOUT_SECONDS
-    ) as client:
-        resp = await client.post(
-            f"{settings.OPENROUTER_BASE_URL}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "X-Title": "LikeNovel AI Reader Agent",
-            },
-            json=payload,
-        )
+    client = get_http_client(HTTP_PROVIDER_OPENROUTER)
+    resp = await client.post(
+        f"{settings.OPENROUTER_BASE_URL}/chat/completions",
+        headers={
+            "Authorization": f"Bearer {settings.OPENROUTER_API_KEY}",
+            "Content-Type": "application/json",
+            "X-Title": "LikeNovel AI Reader Agent",
+        },
+        json=payload,
+        timeout=settings.AI_READER_OPENROUTER_TIMEOUT_SECONDS,
+    )
     if resp.status_code != 200:
         logger.error("OpenRouter API error: %s", _sanitize_openrouter_error(resp))
         raise CustomResponseException(
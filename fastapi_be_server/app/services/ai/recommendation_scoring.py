@@ -0,0 +1,265 @@
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import chain
+
+import numpy as np
+
+"""
+추천 후보 점수 계산(NumPy)
+- 축/차원 매칭(_match_products_by_axes, _match_products_by_dimension)은 작품마다 라벨 목록을 순회해
+  점수를 더하던 것을, 카탈로그 라벨을 희소 행렬(행=작품, 열=라벨, nnz 순서 = 기존 순회 순서)로 한 번 인코딩하고
+  사용자 가중치 벡터를 곱해 전체 후보를 몇 번의 배열 연산으로 계산합니다.
+- 행별 합은 np.bincount 로 nnz 순서대로 더하므로(0.0 부터 순차 덧셈) 기존 Python 루프와 부동소수 결과가 같습니다.
+  top-k 는 기존 sorted(reverse=True)[:limit] 와 같게 키 내림차순, 동점은 카탈로그 순서입니다.
+- 작품별 특징 추출(extract)은 recommendation_service 가 기존 헬퍼로 제공하고,
+  product_id 별로 같은 dict 객체면 재사용합니다(색인 version 이 바뀌어도 바뀐 작품만 다시 추출).
+- 작품 dict 는 색인과 공유하는 읽기 전용 객체라는 전제(product_ai_metadata_index.py)입니다.
+"""
+
+# 최근 사용한 목록 객체 수(전체/전체 이용가 x 최근 요청들)
+_CATALOG_CACHE_SIZE = 8
+
+
+@dataclass
+class ProductScoringFeatures:
+    """
+    작품 하나의 점수 계산용 특징
+
+    Args:
+        tokens: family -> 라벨 목록(순서/중복 유지, 가중치 합산 순서)
+        weighted_tokens: family -> (라벨, 작품 쪽 점수) 목록(축 매칭용)
+        popularity: 조회수 기반 인기 점수
+        engagement: 행동 지표 점수
+    """
+
+    tokens: dict[str, tuple] = field(default_factory=dict)
+    weighted_tokens: dict[str, tuple[tuple, ...]] = field(default_factory=dict)
+    popularity: float = 0.0
+    engagement: float = 0.0
+
+
+@dataclass
+class _Family:
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray | None
+
+
+class ScoringCatalog:
+    """한 카탈로그(작품 목록) 인코딩 결과, family 별 희소 배열은 처음 쓸 때 생성"""
+
+    def __init__(self, engine: "ScoringEngine", products: list[dict], features: list[ProductScoringFeatures]):
+        self.engine = engine
+        self.products = products
+        self.features = features
+        self.size = len(products)
+        self.popularity = np.fromiter((f.popularity for f in features), dtype=np.float64, count=self.size)
+        self.engagement = np.fromiter((f.engagement for f in features), dtype=np.float64, count=self.size)
+        self.product_ids = [dna.get("product_id") for dna in products]
+        self.none_id_mask = np.fromiter(
+            (pid is None for pid in self.product_ids), dtype=bool, count=self.size
+        )
+        self._rows_by_id: dict | None = None
+        self._families: dict[str, _Family] = {}
+
+    def _family(self, name: str, weighted: bool) -> _Family:
+        family = self._families.get(name)
+        if family is not None:
+            return family
+
+        vocab = self.engine.vocab(name)
+        if weighted:
+            entries = [f.weighted_tokens.get(name, ()) for f in self.features]
+        else:
+            entries = [f.tokens.get(name, ()) for f in self.features]
+        lengths = np.fromiter((len(entry) for entry in entries), dtype=np.int64, count=self.size)
+        total = int(lengths.sum())
+        rows = np.repeat(np.arange(self.size, dtype=np.int64), lengths)
+        values = None
+        if weighted:
+            cols = np.fromiter(
+                (vocab.id(token) for entry in entries for token, _ in entry),
+                dtype=np.int64,
+                count=total,
+            )
+            values = np.fromiter(
+                (float(value) for entry in entries for _, value in entry),
+                dtype=np.float64,
+                count=total,
+            )
+        else:
+            cols = np.fromiter(
+                (vocab.id(token) for token in chain.from_iterable(entries)),
+                dtype=np.int64,
+                count=total,
+            )
+        family = _Family(rows=rows, cols=cols, values=values)
+        self._families[name] = family
+        return family
+
+    def exclusion_mask(self, excluded_ids) -> np.ndarray:
+        """product_id 가 excluded_ids 에 있는 작품(in 연산과 같은 hash/eq 비교)"""
+        if self._rows_by_id is None:
+            rows_by_id: dict = {}
+            for idx, pid in enumerate(self.product_ids):
+                if pid is not None:
+                    rows_by_id.setdefault(pid, []).append(idx)
+            self._rows_by_id = rows_by_id
+        mask = np.zeros(self.size, dtype=bool)
+        for pid in excluded_ids or ():
+            if pid is None:
+                mask |= self.none_id_mask
+                continue
+            rows = self._rows_by_id.get(pid)
+            if rows:
+                mask[rows] = True
+        return mask
+
+    def weighted_min_match(self, name: str, user_scores: dict) -> tuple[np.ndarray, np.ndarray]:
+        """
+        sum(min(사용자 점수, 작품 점수)) / sum(작품 점수) 를 0~1 로 자른 값과 라벨 보유 여부
+        """
+        family = self._family(name, weighted=True)
+        user_vector = self.engine.vocab(name).vector(lambda label: user_scores.get(label, 0.0))
+        numerator = np.bincount(
+            family.rows,
+            weights=np.minimum(user_vector[family.cols], family.values),
+            minlength=self.size,
+        )
+        denominator = np.bincount(family.rows, weights=family.values, minlength=self.size)
+        has_label = np.bincount(family.rows, minlength=self.size) > 0
+        match = np.zeros(self.size, dtype=np.float64)
+        positive = has_label & (denominator > 0)
+        np.divide(numerator, denominator, out=match, where=positive)
+        return np.clip(match, 0.0, 1.0), has_label
+
+    def token_sum(self, names: list[str], weight) -> np.ndarray:
+        """
+        family 들의 라벨 가중치를 작품별로 순서대로 더한 값(names 순서 -> 라벨 순서)
+        """
+        rows = []
+        weights = []
+        for name in names:
+            family = self._family(name, weighted=False)
+            vector = self.engine.vocab(name).vector(lambda label, _name=name: weight(_name, label))
+            rows.append(family.rows)
+            weights.append(vector[family.cols])
+        if not rows:
+            return np.zeros(self.size, dtype=np.float64)
+        return np.bincount(
+            np.concatenate(rows), weights=np.concatenate(weights), minlength=self.size
+        )
+
+
+class _Vocab:
+    """family 별 라벨 -> 열 번호(프로세스 동안 추가만)"""
+
+    def __init__(self):
+        self._ids: dict = {}
+        self._labels: list = []
+
+    def id(self, label) -> int:
+        idx = self._ids.get(label)
+        if idx is None:
+            idx = len(self._labels)
+            self._ids[label] = idx
+            self._labels.append(label)
+        return idx
+
+    def vector(self, weight) -> np.ndarray:
+        return np.fromiter(
+            (float(weight(label)) for label in self._labels),
+            dtype=np.float64,
+            count=len(self._labels),
+        )
+
+
+class ScoringEngine:
+    """
+    카탈로그 인코딩 캐시
+
+    Args:
+        extract: 작품 dict -> ProductScoringFeatures
+    """
+
+    def __init__(self, extract):
+        self.extract = extract
+        self._vocabs: dict[str, _Vocab] = {}
+        # product_id -> (작품 dict, 특징)
+        self._features: dict = {}
+        # id(목록) -> (목록, 카탈로그), 같은 카탈로그를 여러 목록 객체가 가리킬 수 있음
+        self._catalogs: OrderedDict[int, tuple[list[dict], ScoringCatalog]] = OrderedDict()
+
+    def vocab(self, name: str) -> _Vocab:
+        vocab = self._vocabs.get(name)
+        if vocab is None:
+            vocab = self._vocabs[name] = _Vocab()
+        return vocab
+
+    def _product_features(self, dna: dict) -> ProductScoringFeatures:
+        pid = dna.get("product_id")
+        cached = self._features.get(pid) if pid is not None else None
+        if cached is not None and cached[0] is dna:
+            return cached[1]
+        features = self.extract(dna)
+        if pid is not None:
+            self._features[pid] = (dna, features)
+        return features
+
+    def catalog(self, products: list[dict]) -> ScoringCatalog:
+        """
+        같은 dict 객체들로 된 목록이면 기존 인코딩 재사용(요청마다 목록 객체가 달라도 됨)
+        """
+        entry = self._catalogs.get(id(products))
+        if entry is not None and entry[0] is products:
+            self._catalogs.move_to_end(id(products))
+            return entry[1]
+
+        catalog = None
+        for _, cached in self._catalogs.values():
+            if cached.size == len(products) and all(
+                map(operator.is_, cached.products, products)
+            ):
+                catalog = cached
+                break
+        if catalog is None:
+            catalog = ScoringCatalog(
+                self, products, [self._product_features(dna) for dna in products]
+            )
+
+        # 같은 요청의 다음 매칭은 목록 객체로 바로 찾도록 등록
+        self._catalogs[id(products)] = (products, catalog)
+        while len(self._catalogs) > _CATALOG_CACHE_SIZE:
+            self._catalogs.popitem(last=False)
+        self._prune_features()
+        return catalog
+
+    def _prune_features(self) -> None:
+        # 카탈로그에서 빠진 작품 특징 정리
+        catalogs = {id(catalog): catalog for _, catalog in self._catalogs.values()}
+        if len(self._features) <= 2 * max(c.size for c in catalogs.values()):
+            return
+        live = {pid for c in catalogs.values() for pid in c.product_ids}
+        self._features = {pid: v for pid, v in self._features.items() if pid in live}
+
+
+def top_k_indices(mask: np.ndarray, keys: list[np.ndarray], limit: int) -> list[int]:
+    """
+    mask 인 작품을 keys(앞이 우선) 내림차순, 동점은 카탈로그 순서로 정렬한 앞 limit 개 인덱스
+    (sorted(..., reverse=True)[:limit] 와 같은 결과)
+    """
+    candidates = np.flatnonzero(mask)
+    if candidates.size == 0:
+        return []
+    if 0 <= limit < candidates.size:
+        if limit == 0:
+            return []
+        primary = keys[0][candidates]
+        kth = np.partition(primary, candidates.size - limit)[candidates.size - limit]
+        # limit 번째 값과 동점인 후보까지 남겨 정확히 정렬
+        candidates = candidates[primary >= kth]
+    order = np.lexsort(
+        [candidates] + [-key[candidates] for key in reversed(keys)]
+    )
+    return candidates[order][:limit].tolist()
@@ -15,12 +15,28 @@ from pathlib import Path
 import time
 from zoneinfo import ZoneInfo
 
-import httpx
+import numpy as np
 
 from app.const import settings, LOGGER_TYPE, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.config.log_config import service_error_logger
+from app.utils.http_client import HTTP_PROVIDER_ANTHROPIC, get_http_client
+from app.utils.identity import resolve_user_id
 from app.schemas.ai_recommendation import MAX_EVENT_PAYLOAD_LENGTH
+from app.services.ai.product_ai_metadata_index import (
+    ELIGIBLE_COLUMN,
+    ProductAiMetadataIndex,
+)
+from app.services.ai.recommendation_scoring import (
+    ProductScoringFeatures,
+    ScoringEngine,
+    top_k_indices,
+)
+from app.services.ai.taste_recommendation_cache import (
+    bump_taste_profile_version,
+    get_taste_profile_version,
+    taste_recommendation_cache,
+)
 
 error_logger = service_error_logger(LOGGER_TYPE.LOGGER_FILE_NAME_FOR_SERVICE_ERROR)
 logger = logging.getLogger(__name__)
@@ -118,6 +134,8 @@ AI_TASTE_ENTRY_SOURCE = "ai_taste_section"
 AI_SLOT_FEEDBACK_WINDOW_DAYS = 30
 AI_SLOT_FEEDBACK_MIN_EPISODES = 3
 ENGAGEMENT_SAMPLE_TARGET = 20
+# 축/차원 매칭을 NumPy 로 계산하는 최소 작품 수(작으면 Python 루프가 더 빠름)
+VECTORIZED_MATCH_MIN_PRODUCTS = 500
 MAX_SIGNAL_FACTOR_LABELS_PER_AXIS = 3
 DERIVED_REVISIT_24H_FACTOR_MULTIPLIER = 0.7
 SIGNAL_FACTOR_METADATA_CACHE_TTL_SECONDS = 60.0
@@ -318,41 +336,42 @@ async def _call_claude(
     max_tokens: int = 1024,
     fail_on_max_tokens: bool = False,
 ) -> str:
-    """Anthropic Messages API 호출. httpx로 직접 호출 (추가 패키지 불필요)."""
+    """Anthropic Messages API 호출. 공유 httpx 클라이언트로 직접 호출 (추가 패키지 불필요)."""
     if not settings.ANTHROPIC_API_KEY:
         raise CustomResponseException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             message="AI 추천 서비스가 설정되지 않았습니다.",
         )
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": settings.ANTHROPIC_API_KEY,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": settings.ANTHROPIC_MODEL,
-                "max_tokens": max_tokens,
-                "system": system_prompt,
-                "messages": [{"role": "user", "content": user_prompt}],
-            },
+    client = get_http_client(HTTP_PROVIDER_ANTHROPIC)
+    resp = await client.post(
+        "https://api.anthropic.com/v1/messages",
+        headers={
+            "x-api-key": settings.ANTHROPIC_API_KEY,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        },
+        json={
+            "model": settings.ANTHROPIC_MODEL,
+            "max_tokens": max_tokens,
+            "system": system_prompt,
+            "messages": [{"role": "user", "content": user_prompt}],
+        },
+        timeout=30.0,
+    )
+    if resp.status_code != 200:
+        error_logger.error(f"Claude API error: {resp.status_code} {resp.text}")
+        raise CustomResponseException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            message="AI 서비스 호출에 실패했습니다.",
         )
-        if resp.status_code != 200:
-            error_logger.error(f"Claude API error: {resp.status_code} {resp.text}")
-            raise CustomResponseException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                message="AI 서비스 호출에 실패했습니다.",
-            )
-        data = resp.json()
-        if fail_on_max_tokens and data.get("stop_reason") == "max_tokens":
-            raise CustomResponseException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                message=f"AI 응답이 토큰 한도(max_tokens={max_tokens})에 도달해 중단되었습니다.",
-            )
-        return data["content"][0]["text"]
+    data = resp.json()
+    if fail_on_max_tokens and data.get("stop_reason") == "max_tokens":
+        raise CustomResponseException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            message=f"AI 응답이 토큰 한도(max_tokens={max_tokens})에 도달해 중단되었습니다.",
+        )
+    return data["content"][0]["text"]
 
 
 def _parse_json_from_llm(raw: str) -> dict:
@@ -497,21 +516,53 @@ async def get_product_ai_metadata(product_id: int, db: AsyncSession) -> dict | N
 
 
 async def get_all_product_ai_metadata(db: AsyncSession, adult_yn: str = "N") -> list[dict]:
-    adult_filter = "AND p.ratings_code = 'all'" if adult_yn == "N" else ""
+    """
+    추천 대상 전체 작품 DNA (프로세스 색인, product_ai_metadata_index.py)
+
+    반환 dict 는 색인과 공유하므로 수정하지 않습니다.
+    """
+    return await product_ai_metadata_index.get_all(db, adult_yn=adult_yn)
+
+
+_PRODUCT_AI_METADATA_ELIGIBLE_SQL = """
+    p.open_yn = 'Y'
+    AND m.analysis_status = 'success'
+    AND COALESCE(m.exclude_from_recommend_yn, 'N') = 'N'
+"""
+
+
+async def _load_product_ai_metadata_index_rows(db: AsyncSession, since) -> tuple[list, datetime]:
+    """
+    색인 적재용 조회. since 가 None 이면 추천 대상 전체, 아니면 since 이후 메타데이터/작품/행동 지표가
+    바뀐 작품을 대상 여부(index_eligible_yn)와 함께 조회(성인 작품 포함, 이용가 필터는 색인에서 적용)
+    """
+    checked_at = (await db.execute(text("SELECT NOW()"))).scalar()
+    if since is None:
+        where_sql = _PRODUCT_AI_METADATA_ELIGIBLE_SQL
+        params = {}
+    else:
+        where_sql = """
+            m.updated_date > :since
+            OR p.updated_date > :since
+            OR m.product_id IN (
+                SELECT product_id
+                FROM tb_product_engagement_metrics
+                WHERE updated_date > :since
+            )
+        """
+        params = {"since": since}
     query = text(f"""
         SELECT m.*, p.title, p.status_code, p.count_hit, p.ratings_code,
-               {LATEST_ENGAGEMENT_SELECT_SQL}
+               {LATEST_ENGAGEMENT_SELECT_SQL},
+               CASE WHEN {_PRODUCT_AI_METADATA_ELIGIBLE_SQL} THEN 'Y' ELSE 'N' END AS {ELIGIBLE_COLUMN}
         FROM tb_product_ai_metadata m
         JOIN tb_product p ON p.product_id = m.product_id
         {LATEST_ENGAGEMENT_JOIN_SQL}
-        WHERE p.open_yn = 'Y'
-          AND m.analysis_status = 'success'
-          AND COALESCE(m.exclude_from_recommend_yn, 'N') = 'N'
-        {adult_filter}
+        WHERE ({where_sql})
+        ORDER BY m.product_id
     """)
-    result = await db.execute(query)
-    rows = result.mappings().all()
-    return [_metadata_row_to_dict(r) for r in rows]
+    result = await db.execute(query, params)
+    return result.mappings().all(), checked_at
 
 
 def _metadata_row_to_dict(row) -> dict:
@@ -536,6 +587,12 @@ def _metadata_row_to_dict(row) -> dict:
     return d
 
 
+product_ai_metadata_index = ProductAiMetadataIndex(
+    loader=_load_product_ai_metadata_index_rows,
+    parse_row=_metadata_row_to_dict,
+)
+
+
 def score_engagement_for_recommendation(item: dict) -> float:
     total_readers = max(
         int(_safe_float(item.get("total_readers"), 0.0)),
@@ -603,10 +660,7 @@ def _profile_row_to_dict(row) -> dict:
 
 
 async def _get_user_id_by_kc(kc_user_id: str, db: AsyncSession) -> int | None:
-    query = text("SELECT user_id FROM tb_user WHERE kc_user_id = :kc AND use_yn = 'Y' LIMIT 1")
-    result = await db.execute(query, {"kc": kc_user_id})
-    row = result.mappings().one_or_none()
-    return row["user_id"] if row else None
+    return await resolve_user_id(kc_user_id, db)
 
 
 async def _is_ai_onboarding_dismissed(user_id: int, db: AsyncSession) -> bool:
@@ -1402,6 +1456,9 @@ async def post_signal_event(kc_user_id: str, req_body: dict, db: AsyncSession) -
             e,
         )
 
+    # 최근 열람/연독 신호가 바뀌었으므로 취향 추천 캐시 무효화
+    await bump_taste_profile_version(user_id, db)
+
     await db.commit()
     return {"message": "AI 신호 이벤트가 저장되었습니다."}
 
@@ -1695,6 +1752,7 @@ async def process_onboarding(
         ),
         {"user_id": user_id},
     )
+    await bump_taste_profile_version(user_id, db)
 
     return {
         "message": "취향 프로파일이 생성되었습니다.",
@@ -1722,6 +1780,7 @@ async def dismiss_onboarding(kc_user_id: str, db: AsyncSession) -> dict:
         ),
         {"user_id": user_id},
     )
+    await bump_taste_profile_version(user_id, db)
     return {"message": "온보딩 모달 숨김 상태가 저장되었습니다."}
 
 
@@ -1798,6 +1857,43 @@ async def get_taste_recommendations(kc_user_id: str, adult_yn: str, db: AsyncSes
     if not user_id:
         return {"sections": [], "needs_onboarding": False}
 
+    # 입력(profile_version)이 그대로면 계산된 구좌를 재사용(taste_recommendation_cache.py)
+    profile_version = await get_taste_profile_version(user_id, db)
+    result = None
+    if profile_version is not None and taste_recommendation_cache.enabled:
+        # 회차 열람은 버전을 올리지 않으므로 캐시 저장 뒤 읽은 작품은 여기서 제외
+        recent_read_ids = await _get_recent_read_product_ids(user_id, db, limit=30)
+        result = taste_recommendation_cache.get(
+            user_id,
+            adult_yn,
+            profile_version,
+            is_servable=lambda product_id: (
+                _safe_int(product_id) not in recent_read_ids
+                and _is_servable_recommendation_product(product_id)
+            ),
+        )
+    if result is None:
+        result = await _build_taste_recommendations(user_id, adult_yn, db)
+        if profile_version is not None:
+            taste_recommendation_cache.put(user_id, adult_yn, profile_version, result)
+
+    if result["sections"]:
+        try:
+            async with db.begin_nested():
+                await _save_ai_slot_serving_logs(user_id, result["sections"], db)
+        except Exception as e:
+            error_logger.error(
+                f"AI slot serving log insert failed: user_id={user_id}, section_count={len(result['sections'])}, error={e}"
+            )
+    return result
+
+
+def _is_servable_recommendation_product(product_id) -> bool:
+    # 색인이 아직 없으면(이 워커 첫 요청 전) 확인하지 않음
+    return not product_ai_metadata_index.loaded or product_ai_metadata_index.contains(product_id)
+
+
+async def _build_taste_recommendations(user_id: int, adult_yn: str, db: AsyncSession) -> dict:
     dismissed_onboarding = await _is_ai_onboarding_dismissed(user_id, db)
     profile = await get_user_taste_profile(user_id, db)
     recent_read_ids = await _get_recent_read_product_ids(user_id, db)
@@ -1815,13 +1911,6 @@ async def get_taste_recommendations(kc_user_id: str, adult_yn: str, db: AsyncSes
                     db=db,
                 )
             if weak_section:
-                try:
-                    async with db.begin_nested():
-                        await _save_ai_slot_serving_logs(user_id, [weak_section], db)
-                except Exception as e:
-                    error_logger.error(
-                        f"AI weak slot serving log insert failed: user_id={user_id}, error={e}"
-                    )
                 return {
                     "sections": [weak_section],
                     "needs_onboarding": not dismissed_onboarding,
@@ -2008,14 +2097,6 @@ async def get_taste_recommendations(kc_user_id: str, adult_yn: str, db: AsyncSes
         ]
         await append_matching_sections(fill_candidates, MIN_TASTE_RECOMMENDATION_SECTIONS)
 
-    if result_sections:
-        try:
-            async with db.begin_nested():
-                await _save_ai_slot_serving_logs(user_id, result_sections, db)
-        except Exception as e:
-            error_logger.error(
-                f"AI slot serving log insert failed: user_id={user_id}, section_count={len(result_sections)}, error={e}"
-            )
     return {"sections": result_sections, "needs_onboarding": needs_onboarding}
 
 
@@ -2864,6 +2945,66 @@ def _calculate_axis_match(
     return _clamp(numerator / denominator, 0.0, 1.0), True
 
 
+_DIMENSION_FACTOR_KEYS = ("protagonist", "material", "worldview", "romance")
+_DIMENSION_PROFILE_PREFERENCE_KEYS = {
+    "protagonist": "preferred_protagonist",
+    "mood": "preferred_mood",
+    "theme": "preferred_themes",
+}
+
+
+def _extract_scoring_features(dna: dict) -> ProductScoringFeatures:
+    """
+    축/차원 매칭에 쓰는 작품 쪽 값을 기존 루프와 같은 순서로 추출 (recommendation_scoring.py)
+    """
+    weighted_tokens = {
+        f"axis:{axis}": tuple(_collect_product_axis_labels(dna, axis).items())
+        for axis in AXIS_KEYS
+    }
+
+    protagonist_tokens = []
+    protagonist = _normalize_factor_key(dna.get("protagonist_type"))
+    if protagonist:
+        protagonist_tokens.append(protagonist)
+    goal_primary = _normalize_factor_key(dna.get("protagonist_goal_primary"))
+    goal_confidence = _safe_float(dna.get("goal_confidence") or 0)
+    if goal_primary and not (goal_primary == "생존" and goal_confidence < 0.6):
+        protagonist_tokens.append(goal_primary)
+    romance_weight = _normalize_factor_key(dna.get("romance_chemistry_weight"))
+
+    tokens = {
+        "taste_tags": tuple(set(dna.get("taste_tags") or [])),
+        "factor:protagonist": tuple(protagonist_tokens),
+        "factor:material": tuple(
+            _normalize_factor_key(tag) for tag in _as_list(dna.get("protagonist_material_tags"))
+        ),
+        "factor:worldview": tuple(
+            _normalize_factor_key(tag) for tag in _as_list(dna.get("worldview_tags"))
+        ),
+        "factor:romance": (romance_weight,) if romance_weight else (),
+        "pref:protagonist": (dna.get("protagonist_type"),),
+        "pref:mood": (dna.get("mood"),),
+        "pref:theme": tuple(_as_list(dna.get("themes"))),
+    }
+    return ProductScoringFeatures(
+        tokens=tokens,
+        weighted_tokens=weighted_tokens,
+        popularity=math.log10((dna.get("count_hit") or 0) + 1),
+        engagement=score_engagement_for_recommendation(dna),
+    )
+
+
+recommendation_scoring_engine = ScoringEngine(extract=_extract_scoring_features)
+
+
+def _unique_axes(axes: list[str]) -> list[str]:
+    unique_axes = []
+    for axis in axes:
+        if axis not in unique_axes:
+            unique_axes.append(axis)
+    return unique_axes
+
+
 def _match_products_by_axes(
     all_dna: list[dict],
     axes: list[str],
@@ -2872,13 +3013,64 @@ def _match_products_by_axes(
     factor_scores: dict[str, dict[str, float]],
     limit: int = 6,
 ) -> list[dict]:
+    """축 라벨 매칭. 작품 수가 많으면 NumPy 경로(결과는 _match_products_by_axes_loop 와 동일)."""
     if not axes:
         return []
+    if len(all_dna) < VECTORIZED_MATCH_MIN_PRODUCTS:
+        return _match_products_by_axes_loop(
+            all_dna, axes, profile, excluded_ids, factor_scores, limit
+        )
 
-    unique_axes = []
-    for axis in axes:
-        if axis not in unique_axes:
-            unique_axes.append(axis)
+    catalog = recommendation_scoring_engine.catalog(all_dna)
+    slot_scores = np.zeros(catalog.size, dtype=np.float64)
+    has_any_axis_label = np.zeros(catalog.size, dtype=bool)
+    for axis in _unique_axes(axes):
+        user_scores = _build_user_axis_label_scores(axis, factor_scores, profile)
+        axis_match, has_axis_label = catalog.weighted_min_match(f"axis:{axis}", user_scores)
+        has_any_axis_label |= has_axis_label
+        slot_scores = slot_scores + AXIS_WEIGHT.get(axis, 0.0) * axis_match
+
+    eligible = (
+        has_any_axis_label
+        & ~catalog.none_id_mask
+        & ~catalog.exclusion_mask(excluded_ids)
+    )
+    positive = eligible & (slot_scores > 0)
+    if positive.any():
+        indices = top_k_indices(
+            positive, [slot_scores, catalog.engagement, catalog.popularity], limit
+        )
+    else:
+        indices = top_k_indices(
+            eligible & ~(slot_scores > 0), [catalog.engagement, catalog.popularity], limit
+        )
+
+    matched = []
+    for idx in indices:
+        dna = catalog.products[idx]
+        features = catalog.features[idx]
+        matched.append({
+            "product_id": catalog.product_ids[idx],
+            "score": float(slot_scores[idx]),
+            "engagement_score": features.engagement,
+            "popularity": features.popularity,
+            "reason": dna.get("protagonist_desc") or dna.get("premise") or "",
+        })
+    return matched
+
+
+def _match_products_by_axes_loop(
+    all_dna: list[dict],
+    axes: list[str],
+    profile: dict,
+    excluded_ids: set[int],
+    factor_scores: dict[str, dict[str, float]],
+    limit: int = 6,
+) -> list[dict]:
+    if not axes:
+        return []
+
+    unique_axes = _unique_axes(axes)
 
     user_axis_scores = {
         axis: _build_user_axis_label_scores(axis, factor_scores, profile)
@@ -2970,6 +3162,59 @@ def _match_products_by_dimension(
     taste_tags: set,
     factor_scores: dict[str, dict[str, float]],
     limit: int = 6,
+) -> list[dict]:
+    """차원별 작품 매칭. 작품 수가 많으면 NumPy 경로(결과는 _match_products_by_dimension_loop 와 동일)."""
+    if len(all_dna) < VECTORIZED_MATCH_MIN_PRODUCTS:
+        return _match_products_by_dimension_loop(
+            all_dna, dimension, profile, read_ids, taste_tags, factor_scores, limit
+        )
+
+    catalog = recommendation_scoring_engine.catalog(all_dna)
+    dimension_key = _normalize_factor_key(dimension)
+    normalized_factor_scores = factor_scores.get(dimension_key, {})
+    preference_key = _DIMENSION_PROFILE_PREFERENCE_KEYS.get(dimension)
+    pref = (profile.get(preference_key) or {}) if preference_key else {}
+
+    families = []
+    if dimension_key in _DIMENSION_FACTOR_KEYS:
+        families.append(f"factor:{dimension_key}")
+    if preference_key:
+        families.append(f"pref:{dimension}")
+
+    def bonus_weight(family: str, label) -> float:
+        if family.startswith("factor:"):
+            return normalized_factor_scores.get(label, 0.0)
+        if dimension != "theme" and label not in pref:
+            return 0.0
+        return _safe_float(pref.get(label), 0.0)
+
+    overlap = catalog.token_sum(
+        ["taste_tags"], lambda _family, label: 1.0 if label in taste_tags else 0.0
+    )
+    bonus = catalog.token_sum(families, bonus_weight)
+    scores = (overlap * 0.7) + bonus + (catalog.popularity * 0.3) + (catalog.engagement * 0.8)
+
+    eligible = ~catalog.exclusion_mask(read_ids) & ~(scores <= 0)
+    matched = []
+    for idx in top_k_indices(eligible, [scores, catalog.engagement], limit):
+        dna = catalog.products[idx]
+        matched.append({
+            "product_id": catalog.product_ids[idx],
+            "score": float(scores[idx]),
+            "engagement_score": catalog.features[idx].engagement,
+            "reason": dna.get("protagonist_desc") or dna.get("premise") or "",
+        })
+    return matched
+
+
+def _match_products_by_dimension_loop(
+    all_dna: list[dict],
+    dimension: str,
+    profile: dict,
+    read_ids: set,
+    taste_tags: set,
+    factor_scores: dict[str, dict[str, float]],
+    limit: int = 6,
 ) -> list[dict]:
     """차원별 작품 매칭. taste_tags 유사도 기반 정렬."""
     scored = []
@@ -3664,28 +3909,26 @@ def _build_cohort_seed_labels(
     return dict(ranked_labels[:limit])
 
 
-async def _get_condition_first_cohort_scores(
+async def _get_cohort_similar_user_weights(
     *,
-    user_id: int | None,
-    factor_scores: dict[str, dict[str, float]],
-    profile: dict | None,
-    candidates: list[dict],
+    user_id: int,
+    seed_labels: dict[str, float],
     db: AsyncSession,
 ) -> dict[int, float]:
-    if not user_id or not candidates:
-        return {}
-
-    seed_labels = _build_cohort_seed_labels(factor_scores, profile)
-    if not seed_labels:
-        return {}
+    """
+    seed 라벨을 가진 다른 유저별 가중치 합
 
+    factor_key_norm(LOWER(TRIM(factor_key)) STORED 생성 컬럼)과
+    idx_user_taste_factor_key_norm (factor_key_norm, score, user_id) 커버링 인덱스로
+    축 키별 posting 만 range scan 합니다(dist/init/99d-add-user-taste-factor-key-norm.sql).
+    """
     similar_users_query = text(
         """
-        SELECT user_id, LOWER(TRIM(factor_key)) AS factor_key, score
+        SELECT user_id, factor_key_norm AS factor_key, score
         FROM tb_user_taste_factor_score
-        WHERE user_id <> :user_id
+        WHERE factor_key_norm IN :factor_keys
           AND score > 0
-          AND LOWER(TRIM(factor_key)) IN :factor_keys
+          AND user_id <> :user_id
         """
     ).bindparams(bindparam("factor_keys", expanding=True))
 
@@ -3710,6 +3953,29 @@ async def _get_condition_first_cohort_scores(
         if signal_weight <= 0:
             continue
         user_weights[similar_user_id] = user_weights.get(similar_user_id, 0.0) + (base_weight * signal_weight)
+    return user_weights
+
+
+async def _get_condition_first_cohort_scores(
+    *,
+    user_id: int | None,
+    factor_scores: dict[str, dict[str, float]],
+    profile: dict | None,
+    candidates: list[dict],
+    db: AsyncSession,
+) -> dict[int, float]:
+    if not user_id or not candidates:
+        return {}
+
+    seed_labels = _build_cohort_seed_labels(factor_scores, profile)
+    if not seed_labels:
+        return {}
+
+    user_weights = await _get_cohort_similar_user_weights(
+        user_id=user_id,
+        seed_labels=seed_labels,
+        db=db,
+    )
 
     ranked_users = sorted(user_weights.items(), key=lambda item: item[1], reverse=True)[:COHORT_SIMILAR_USER_LIMIT]
     if not ranked_users:
@@ -0,0 +1,197 @@
+import logging
+import time
+from collections import OrderedDict
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+"""
+유저별 취향 추천(get_taste_recommendations) 결과 캐시
+- 추천 결과는 유저의 취향 프로필/축 점수/최근 열람/구매와 작품 카탈로그로 정해지므로,
+  유저 쪽 입력이 바뀌는 시점(AI 신호 이벤트, 온보딩 선택/숨김, 구매, 시간 배치의 축 점수 반영)에
+  tb_user_taste_profile_version.profile_version 을 1 증가시키고(bump_taste_profile_version),
+  (user_id, adult_yn) 캐시는 저장 당시 profile_version 과 같을 때만 재사용합니다.
+  버전은 DB 에 있으므로 워커가 여러 개여도 변경 직후 요청은 다시 계산됩니다(요청마다 PK 조회 1회).
+- 캐시는 프로세스(워커) 단위 TTL LRU 이며, TTL 은 작품 카드(제목/표지/회차 수) 변경 반영 상한입니다.
+  구좌가 빈 결과는 empty_ttl 동안만 재사용합니다.
+- 회차 열람(tb_user_product_usage)은 너무 잦아 버전을 올리지 않습니다. 대신 hit 시 호출부가
+  최근 열람 작품을 is_servable 로 걸러 방금 읽은 작품이 추천에 남지 않게 합니다.
+- hit 시 구좌의 작품이 여전히 추천 대상인지(is_servable) 확인해 빠진 작품은 제거하고,
+  작품이 남은 구좌만 그대로 돌려줍니다. 남은 구좌가 없으면 miss 로 보고 다시 계산합니다.
+- 버전 조회가 실패하면(테이블 생성 전 등) 캐시 없이 계산합니다.
+"""
+
+_VERSION_QUERY = text(
+    """
+    SELECT profile_version
+    FROM tb_user_taste_profile_version
+    WHERE user_id = :user_id
+    """
+)
+
+_BUMP_VERSION_QUERY = text(
+    """
+    INSERT INTO tb_user_taste_profile_version (user_id, profile_version)
+    VALUES (:user_id, 1)
+    ON DUPLICATE KEY UPDATE profile_version = profile_version + 1
+    """
+)
+
+
+def _copy_result(result: dict) -> dict:
+    # 호출부(직렬화/노출 로그)가 수정해도 캐시에 영향 없도록 구좌/작품 목록 복사
+    copied = dict(result)
+    copied["sections"] = [
+        {**section, "products": [dict(product) for product in section.get("products") or []]}
+        for section in result.get("sections") or []
+    ]
+    return copied
+
+
+class TasteRecommendationCache:
+    """
+    (user_id, adult_yn) -> (profile_version, 추천 결과) TTL LRU 캐시
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.TASTE_RECOMMENDATION_CACHE_TTL_SECONDS,
+        max_entries: int = settings.TASTE_RECOMMENDATION_CACHE_MAX_ENTRIES,
+        enabled: bool = settings.TASTE_RECOMMENDATION_CACHE_ENABLED,
+        empty_ttl: float = settings.TASTE_RECOMMENDATION_CACHE_EMPTY_TTL_SECONDS,
+    ):
+        self.ttl = ttl
+        self.empty_ttl = min(empty_ttl, ttl)
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # (user_id, adult_yn) -> (profile_version, 결과, expires_at)
+        self._entries: OrderedDict[tuple[int, str], tuple[int, dict, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.version_misses = 0
+        self.dropped_products = 0
+        self.dropped_sections = 0
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "version_misses": self.version_misses,
+            "dropped_products": self.dropped_products,
+            "dropped_sections": self.dropped_sections,
+        }
+
+    def get(self, user_id: int, adult_yn: str, profile_version: int, is_servable=None) -> dict | None:
+        """
+        같은 profile_version 으로 저장된 결과(복사본), 없거나 만료/무효면 None
+
+        Args:
+            is_servable: product_id -> 추천 대상 여부, None 이면 확인하지 않음
+        """
+        if not self.enabled:
+            return None
+        key = (user_id, adult_yn)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        cached_version, result, expires_at = entry
+        if cached_version != profile_version or expires_at <= time.time():
+            if cached_version != profile_version:
+                self.version_misses += 1
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        if is_servable is not None and result.get("sections"):
+            result = self._servable_result(key, entry, is_servable)
+            if result is None:
+                self.misses += 1
+                return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return _copy_result(result)
+
+    def _servable_result(self, key, entry, is_servable) -> dict | None:
+        cached_version, result, expires_at = entry
+        sections = []
+        changed = False
+        for section in result["sections"]:
+            products = [
+                product for product in section.get("products") or []
+                if is_servable(product.get("productId"))
+            ]
+            if len(products) != len(section.get("products") or []):
+                changed = True
+                self.dropped_products += len(section.get("products") or []) - len(products)
+            if products:
+                sections.append({**section, "products": products})
+            else:
+                self.dropped_sections += 1
+        if not changed:
+            return result
+        if not sections:
+            self._entries.pop(key, None)
+            return None
+        # 다음 hit 에서 다시 거르지 않도록 정리된 결과로 교체
+        result = {**result, "sections": sections}
+        self._entries[key] = (cached_version, result, expires_at)
+        return result
+
+    def put(self, user_id: int, adult_yn: str, profile_version: int, result: dict) -> None:
+        if not self.enabled:
+            return
+        key = (user_id, adult_yn)
+        ttl = self.ttl if result.get("sections") else self.empty_ttl
+        self._entries[key] = (profile_version, _copy_result(result), time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """이 워커의 해당 유저 결과 제거(다른 워커는 profile_version 으로 무효화)"""
+        for adult_yn in ("Y", "N"):
+            self._entries.pop((user_id, adult_yn), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.version_misses = 0
+        self.dropped_products = 0
+        self.dropped_sections = 0
+
+
+async def get_taste_profile_version(user_id: int, db: AsyncSession) -> int | None:
+    """
+    유저의 취향 추천 입력 버전(행이 없으면 0), 조회 실패 시 None(캐시 사용 안 함)
+    """
+    try:
+        result = await db.execute(_VERSION_QUERY, {"user_id": user_id})
+        version = result.scalar_one_or_none()
+    except Exception as e:
+        logger.warning(f"taste profile version lookup failed: user_id={user_id}, error={e}")
+        return None
+    return int(version or 0)
+
+
+async def bump_taste_profile_version(user_id: int, db: AsyncSession) -> None:
+    """
+    취향 추천 입력 변경 표시(호출부 트랜잭션에 포함), 실패해도 호출부 처리는 계속(TTL 로 반영)
+    """
+    taste_recommendation_cache.invalidate_user(user_id)
+    try:
+        await db.execute(_BUMP_VERSION_QUERY, {"user_id": user_id})
+    except Exception as e:
+        logger.warning(f"taste profile version bump failed: user_id={user_id}, error={e}")
+
+
+taste_recommendation_cache = TasteRecommendationCache()
@@ -14,6 +14,12 @@ import logging
 from app.const import settings, CommonConstants, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.utils.auth import get_kc_signing_key
+from app.utils import token_revocation
+from app.utils.identity import (
+    invalidate_user_identity,
+    resolve_user_id,
+    resolve_user_identity,
+)
 from app.utils.time import get_cur_time
 from app.utils.email import send_password_reset_email
 import app.services.common.comm_service as comm_service
@@ -767,6 +773,7 @@ async def get_auth_signup_naver_callback(
                             },
                         )
                         await db.commit()
+                        invalidate_user_identity(kc_user_id=kc_user_id)
 
                         logger.info(
                             f"Created Keycloak user {new_kc_user_id} for existing DB user"
@@ -1897,6 +1904,7 @@ async def get_auth_signin_naver_callback(
                             },
                         )
                         await db.commit()
+                        invalidate_user_identity(kc_user_id=kc_user_id)
 
                         logger.info(
                             f"Created Keycloak user {new_kc_user_id} for existing DB user"
@@ -2125,6 +2133,7 @@ async def get_auth_signin_google_callback(
                             },
                         )
                         await db.commit()
+                        invalidate_user_identity(kc_user_id=kc_user_id)
 
                         logger.info(
                             f"Created Keycloak user {new_kc_user_id} for existing DB user"
@@ -2361,6 +2370,7 @@ async def get_auth_signin_kakao_callback(
                             },
                         )
                         await db.commit()
+                        invalidate_user_identity(kc_user_id=kc_user_id)
 
                         logger.info(
                             f"Created Keycloak user {new_kc_user_id} for existing DB user"
@@ -2819,11 +2829,9 @@ async def put_auth_identity_password_reset(
                             )
 
                             # DB에 이미 해당 kc_user_id를 가진 행이 있는지 확인 (중복 방지)
-                            dup_check = await db.execute(
-                                text("SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id"),
-                                {"kc_user_id": existing_kc_user_id},
+                            dup_row = await resolve_user_identity(
+                                existing_kc_user_id, db, active_only=False
                             )
-                            dup_row = dup_check.first()
 
                             if not dup_row:
                                 # 충돌 없음 — kc_user_id 동기화 진행
@@ -2844,6 +2852,7 @@ async def put_auth_identity_password_reset(
                                     },
                                 )
                                 await db.commit()
+                                invalidate_user_identity(kc_user_id=kc_user_id)
                                 logger.info(
                                     f"DB sync successful. Rows affected: {result.rowcount}"
                                 )
@@ -2916,6 +2925,7 @@ async def put_auth_identity_password_reset(
                         },
                     )
                     await db.commit()
+                    invalidate_user_identity(kc_user_id=kc_user_id)
                     logger.info(
                         f"DB update successful. Rows affected: {result.rowcount}"
                     )
@@ -3152,6 +3162,8 @@ async def post_auth_signout(
         await comm_service.kc_logout_endpoint(
             method="POST", type=type, user_ref_token=req_body.refresh_token
         )
+        # Keycloak 이 토큰을 받아들인 뒤에만 같은 세션(sid)의 access token 을 이 워커에서 즉시 무효화
+        token_revocation.revoke_by_refresh_token(req_body.refresh_token)
     except CustomResponseException as e:
         # Keycloak 로그아웃 실패해도 클라이언트에는 성공으로 응답
         # (이미 세션이 만료되었을 수 있음)
@@ -3259,6 +3271,8 @@ async def put_auth_signoff(kc_user_id: str, kc_client: str, db: AsyncSession):
                             admin_acc_token=admin_acc_token,
                             id=kc_user_id,
                         )
+                        token_revocation.revoke_user(kc_user_id)
+                        invalidate_user_identity(kc_user_id=kc_user_id)
 
                     query = text("""
                                      delete from tb_user_social a
@@ -3321,6 +3335,8 @@ async def put_auth_signoff(kc_user_id: str, kc_client: str, db: AsyncSession):
                     await comm_service.kc_users_id_endpoint(
                         method="DELETE", admin_acc_token=admin_acc_token, id=kc_user_id
                     )
+                    token_revocation.revoke_user(kc_user_id)
+                    invalidate_user_identity(kc_user_id=kc_user_id)
         except OperationalError:
             raise CustomResponseException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE
@@ -3533,24 +3549,14 @@ async def post_auth_token_partner_relay_issue(
 
     try:
         async with db.begin():
-            query = text("""
-                             select user_id
-                               from tb_user
-                              where kc_user_id = :kc_user_id
-                                and use_yn = 'Y'
-                             """)
-
-            result = await db.execute(query, {"kc_user_id": kc_user_id})
-            user_row = result.mappings().first()
+            user_id = await resolve_user_id(kc_user_id, db)
 
-            if not user_row:
+            if user_id is None:
                 raise CustomResponseException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     message=ErrorMessages.INVALID_TOKEN,
                 )
 
-            user_id = user_row.get("user_id")
-
             query = text("""
                              select sns_id
                                from tb_user_social
@@ -1,5 +1,5 @@
 from fastapi import status
-from httpx import AsyncClient, HTTPStatusError
+from httpx import HTTPStatusError
 from typing import Optional
 
 import os
@@ -24,6 +24,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.const import settings
 from app.exceptions import CustomResponseException
 from app.const import ErrorMessages
+from app.utils.http_client import (
+    HTTP_PROVIDER_EXTERNAL,
+    HTTP_PROVIDER_KEYCLOAK,
+    HTTP_PROVIDER_R2,
+    get_http_client,
+)
+from app.utils.identity import resolve_user_identity
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,9 @@ EPUB_NORMALIZABLE_ASSET_PREFIXES = (
 재사용하는 공통 서비스 함수 모음
 """
 
+# get_user_from_kc 에서 identity resolver 로 응답 가능한 tb_user 컬럼
+_IDENTITY_USER_INFO_COLUMNS = ("role_type",)
+
 
 async def get_user_from_kc(
     kc_user_id: str, db: AsyncSession, addUserInfo: list[str] = []
@@ -55,6 +65,18 @@ async def get_user_from_kc(
     Returns:
         user_id if found, -1 if not found
     """
+    if all(column in _IDENTITY_USER_INFO_COLUMNS for column in addUserInfo):
+        # 식별 정보만 필요한 경우 resolver(요청 memo/캐시) 사용
+        identity = await resolve_user_identity(kc_user_id, db)
+        if identity is None:
+            return (-1, None) if len(addUserInfo) > 0 else -1
+        if len(addUserInfo) > 0:
+            user_info = {"user_id": identity.user_id}
+            for column in addUserInfo:
+                user_info[column] = getattr(identity, column)
+            return identity.user_id, user_info
+        return identity.user_id
+
     query = text(f"""
         select user_id {(", " + ", ".join(addUserInfo)) if len(addUserInfo) > 0 else ""}
         from tb_user
@@ -96,11 +118,11 @@ async def kc_logout_endpoint(method: str, type: str, user_ref_token: str):
             }
 
     try:
-        async with AsyncClient() as ac:
-            if method == "POST":
-                res = await ac.post(url=url, headers=headers, data=data)
-                res.raise_for_status()
-                return
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "POST":
+            res = await ac.post(url=url, headers=headers, data=data)
+            res.raise_for_status()
+            return
     except HTTPStatusError as e:
         if type in ["reissue_normal", "reissue_keep"]:
             raise CustomResponseException(
@@ -185,11 +207,11 @@ async def kc_token_endpoint(method: str, type: str, data_dict: Optional[dict] =
             }
 
     try:
-        async with AsyncClient() as ac:
-            if method == "POST":
-                res = await ac.post(url=url, headers=headers, data=data)
-                res.raise_for_status()
-                return res.json()
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "POST":
+            res = await ac.post(url=url, headers=headers, data=data)
+            res.raise_for_status()
+            return res.json()
     except HTTPStatusError as e:
         error_message = await e.response.aread()
         decoded_error_message = error_message.decode(errors="ignore")
@@ -253,26 +275,26 @@ async def kc_users_endpoint(
     )
 
     try:
-        async with AsyncClient() as ac:
-            if method == "GET":
-                if params_dict:
-                    res = await ac.get(url=url, headers=headers, params=params_dict)
-                else:
-                    res = await ac.get(url=url, headers=headers)
-
-                res.raise_for_status()
-                logger.info(
-                    f"Keycloak API success: {method} {url}, status: {res.status_code}"
-                )
-                return res.json()
-            elif method == "POST":
-                res = await ac.post(url=url, headers=headers, json=data)
-                res.raise_for_status()
-                new_user_id = res.headers.get("location").rstrip("/").split("/")[-1]
-                logger.info(
-                    f"Keycloak API success: {method} {url}, status: {res.status_code}, new_user_id: {new_user_id}"
-                )
-                return new_user_id  # id
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "GET":
+            if params_dict:
+                res = await ac.get(url=url, headers=headers, params=params_dict)
+            else:
+                res = await ac.get(url=url, headers=headers)
+
+            res.raise_for_status()
+            logger.info(
+                f"Keycloak API success: {method} {url}, status: {res.status_code}"
+            )
+            return res.json()
+        elif method == "POST":
+            res = await ac.post(url=url, headers=headers, json=data)
+            res.raise_for_status()
+            new_user_id = res.headers.get("location").rstrip("/").split("/")[-1]
+            logger.info(
+                f"Keycloak API success: {method} {url}, status: {res.status_code}, new_user_id: {new_user_id}"
+            )
+            return new_user_id  # id
     except HTTPStatusError as e:
         logger.error(
             f"Keycloak API error: {method} {url}, "
@@ -304,28 +326,28 @@ async def kc_users_id_endpoint(
     logger.info(f"Keycloak API request: {method} {url}, user_id: {id}")
 
     try:
-        async with AsyncClient() as ac:
-            if method == "GET":
-                res = await ac.get(url=url, headers=headers)
-                res.raise_for_status()
-                logger.info(
-                    f"Keycloak API success: {method} {url}, status: {res.status_code}"
-                )
-                return res.json()
-            elif method == "PUT":
-                res = await ac.put(url=url, headers=headers, json=data)
-                res.raise_for_status()
-                logger.info(
-                    f"Keycloak API success: {method} {url}, status: {res.status_code}"
-                )
-                return
-            elif method == "DELETE":
-                res = await ac.delete(url=url, headers=headers)
-                res.raise_for_status()
-                logger.info(
-                    f"Keycloak API success: {method} {url}, status: {res.status_code}"
-                )
-                return
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "GET":
+            res = await ac.get(url=url, headers=headers)
+            res.raise_for_status()
+            logger.info(
+                f"Keycloak API success: {method} {url}, status: {res.status_code}"
+            )
+            return res.json()
+        elif method == "PUT":
+            res = await ac.put(url=url, headers=headers, json=data)
+            res.raise_for_status()
+            logger.info(
+                f"Keycloak API success: {method} {url}, status: {res.status_code}"
+            )
+            return
+        elif method == "DELETE":
+            res = await ac.delete(url=url, headers=headers)
+            res.raise_for_status()
+            logger.info(
+                f"Keycloak API success: {method} {url}, status: {res.status_code}"
+            )
+            return
     except HTTPStatusError as e:
         logger.error(
             f"Keycloak API error: {method} {url}, "
@@ -344,12 +366,12 @@ async def kc_users_id_imperson_endpoint(method: str, admin_acc_token: str, id: s
     headers = {"Authorization": f"Bearer {admin_acc_token}"}
 
     try:
-        async with AsyncClient() as ac:
-            if method == "POST":
-                res = await ac.post(url=url, headers=headers)
-                res.raise_for_status()
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "POST":
+            res = await ac.post(url=url, headers=headers)
+            res.raise_for_status()
 
-                return res.json().get("redirect")
+            return res.json().get("redirect")
     except HTTPStatusError as e:
         raise CustomResponseException(
             status_code=e.response.status_code,
@@ -376,14 +398,14 @@ async def kc_users_id_imperson_auth_endpoint(method: str, type: str, redirect_ur
             "scope": "openid",
         }
 
-    async with AsyncClient() as ac:
-        if method == "GET":
-            res = await ac.get(url=url, params=params, follow_redirects=False)
+    ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+    if method == "GET":
+        res = await ac.get(url=url, params=params, follow_redirects=False)
 
-            redirect_url = res.headers.get("location")
-            parsed_url = urlparse(redirect_url)
-            query_params = parse_qs(parsed_url.query)
-            return query_params.get("code", [None])[0]  # code
+        redirect_url = res.headers.get("location")
+        parsed_url = urlparse(redirect_url)
+        query_params = parse_qs(parsed_url.query)
+        return query_params.get("code", [None])[0]  # code
 
     return None
 
@@ -394,11 +416,11 @@ async def kc_userinfo_endpoint(method: str, user_acc_token: str):
     headers = {"Authorization": f"Bearer {user_acc_token}"}
 
     try:
-        async with AsyncClient() as ac:
-            if method == "GET":
-                res = await ac.get(url=url, headers=headers)
-                res.raise_for_status()
-                return res.json().get("sub")  # id
+        ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+        if method == "GET":
+            res = await ac.get(url=url, headers=headers)
+            res.raise_for_status()
+            return res.json().get("sub")  # id
     except HTTPStatusError as e:
         if e.response.status_code == 401:
             raise CustomResponseException(
@@ -449,11 +471,11 @@ async def sns_token_endpoint(
         data["code"] = code
 
     try:
-        async with AsyncClient() as ac:
-            if method == "POST":
-                res = await ac.post(url=url, headers=headers, data=data)
-                res.raise_for_status()
-                return res.json()
+        ac = get_http_client(HTTP_PROVIDER_EXTERNAL)
+        if method == "POST":
+            res = await ac.post(url=url, headers=headers, data=data)
+            res.raise_for_status()
+            return res.json()
     except HTTPStatusError as e:
         masked_data = {
             k: ("***" if k in ("client_secret", "code", "client_id") else v)
@@ -480,11 +502,11 @@ async def sns_me_endpoint(method: str, type: str, sns_acc_token: str):
     headers = {"Authorization": f"Bearer {sns_acc_token}"}
 
     try:
-        async with AsyncClient() as ac:
-            if method == "GET":
-                res = await ac.get(url=url, headers=headers)
-                res.raise_for_status()
-                return res.json()
+        ac = get_http_client(HTTP_PROVIDER_EXTERNAL)
+        if method == "GET":
+            res = await ac.get(url=url, headers=headers)
+            res.raise_for_status()
+            return res.json()
     except HTTPStatusError as e:
         logger.error(
             f"SNS Me Endpoint Error - Type: {type}, Status: {e.response.status_code}, "
@@ -500,10 +522,10 @@ async def decode_apple_token(id_token: str):
     url = settings.APPLE_KEYS_URL
 
     try:
-        async with AsyncClient() as ac:
-            res = await ac.get(url=url)
-            res.raise_for_status()
-            res_json = res.json()
+        ac = get_http_client(HTTP_PROVIDER_EXTERNAL)
+        res = await ac.get(url=url)
+        res.raise_for_status()
+        res_json = res.json()
     except HTTPStatusError as e:
         raise CustomResponseException(
             status_code=e.response.status_code,
@@ -751,9 +773,11 @@ async def upload_epub_to_r2(url: str, file_name: str):
         with open(file_path, "rb") as f:
             file_content = f.read()
 
-        async with AsyncClient() as ac:
-            res = await ac.put(url=url, content=file_content, headers=headers)
-            res.raise_for_status()
+        ac = get_http_client(HTTP_PROVIDER_R2)
+        res = await ac.put(
+            url=url, content=file_content, headers=headers, timeout=5.0
+        )
+        res.raise_for_status()
     except HTTPStatusError as e:
         raise CustomResponseException(
             status_code=e.response.status_code,
@@ -0,0 +1,426 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import text
+
+from app.const import settings
+
+logger = logging.getLogger("statistics_app")  # 커스텀 로거 생성
+
+"""
+사이트 통계 로그 / 페이지뷰·체류 raw 이벤트 적재 버퍼
+- 조회 API 마다 발생하던 단건 INSERT + commit 을 프로세스(워커) 단위 버퍼에 모아
+  건수(flush_size) 또는 주기(flush_interval) 기준으로 multi-row INSERT 로 적재합니다.
+- 앱 lifespan 에서 start()/stop() 하며, stop() 시 남은 이벤트를 모두 flush 합니다.
+- DB 장애로 flush 가 실패하면 spill 파일(JSONL)에 기록하고, 다음 flush 성공 시 재적재합니다.
+- DB 는 살아 있는데 flush 가 실패하면(제약 위반, 잘못된 값 등) 배치를 반씩 나눠 다시 적재해 문제 row 만 골라냅니다.
+  혼자서도 실패한 row 는 시도 횟수를 붙여 spill 하고, max_attempts 번 실패하면 dead-letter 파일로 보내
+  더 이상 재적재하지 않습니다. (한 row 때문에 같은 배치의 정상 row 가 계속 실패하지 않게 합니다)
+- 버퍼가 실행 중이 아닐 때(배치/스크립트/테스트)는 호출부가 기존처럼 직접 INSERT 합니다.
+"""
+
+
+@dataclass(frozen=True)
+class IngestTable:
+    table: str
+    columns: tuple[str, ...]
+    # spill 파일 직렬화 시 datetime 으로 복원할 컬럼
+    datetime_columns: tuple[str, ...] = ()
+    # 중복 이벤트(event_id) 무시용 절
+    on_duplicate: str = ""
+
+
+INGEST_TABLES = {
+    "site_statistics_log": IngestTable(
+        table="tb_site_statistics_log",
+        columns=("date", "type", "user_id"),
+        datetime_columns=("date",),
+    ),
+    "site_page_view_event": IngestTable(
+        table="tb_site_page_view_event",
+        columns=(
+            "event_id",
+            "occurred_at",
+            "user_id",
+            "visitor_id",
+            "session_id",
+            "route_group",
+            "route_name",
+            "path_template",
+            "path",
+            "query_hash",
+            "referrer_path",
+            "utm_source",
+            "utm_medium",
+            "utm_campaign",
+            "utm_content",
+            "external_referrer_host",
+            "external_referrer_group",
+            "product_id",
+            "entry_source",
+            "entry_source_group",
+            "source",
+            "taxonomy_version",
+        ),
+        datetime_columns=("occurred_at",),
+        on_duplicate="ON DUPLICATE KEY UPDATE event_id = event_id",
+    ),
+    "site_page_dwell_event": IngestTable(
+        table="tb_site_page_dwell_event",
+        columns=(
+            "event_id",
+            "occurred_at",
+            "user_id",
+            "visitor_id",
+            "session_id",
+            "route_group",
+            "route_name",
+            "path_template",
+            "active_ms",
+            "source",
+            "taxonomy_version",
+        ),
+        datetime_columns=("occurred_at",),
+        on_duplicate="ON DUPLICATE KEY UPDATE event_id = event_id",
+    ),
+}
+
+
+# 큐/spill 의 row 에 붙이는 적재 실패 횟수 (INSERT 컬럼에는 들어가지 않는다)
+_ATTEMPTS_KEY = "_ingest_attempts"
+
+
+def build_multi_row_insert(spec: IngestTable, rows: list[dict]):
+    """
+    multi-row INSERT 쿼리와 바인딩 파라미터 생성
+    """
+    values = []
+    params = dict()
+    for idx, row in enumerate(rows):
+        placeholders = []
+        for column in spec.columns:
+            key = f"{column}_{idx}"
+            placeholders.append(f":{key}")
+            params[key] = row.get(column)
+        values.append(f"({', '.join(placeholders)}, NOW())")
+
+    query = text(f"""
+        INSERT INTO {spec.table} ({', '.join(spec.columns)}, created_date)
+        VALUES {', '.join(values)}
+        {spec.on_duplicate}
+    """)
+    return query, params
+
+
+def _default_session_factory():
+    from app.rdb import likenovel_db_session
+
+    return likenovel_db_session()
+
+
+class StatisticsIngestBuffer:
+    """
+    테이블(kind)별 이벤트 큐 + 주기 flush 루프
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        flush_size: int = settings.STATISTICS_INGEST_FLUSH_SIZE,
+        flush_interval: float = settings.STATISTICS_INGEST_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = settings.STATISTICS_INGEST_MAX_PENDING,
+        spill_path: str = settings.STATISTICS_INGEST_SPILL_PATH,
+        enabled: bool = settings.STATISTICS_INGEST_ENABLED,
+        max_attempts: int = settings.STATISTICS_INGEST_MAX_ATTEMPTS,
+        dead_letter_path: str | None = None,
+    ):
+        self.session_factory = session_factory or _default_session_factory
+        self.flush_size = max(int(flush_size), 1)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.spill_path = spill_path
+        self.enabled = enabled
+        self.max_attempts = max(int(max_attempts), 1)
+        # 기본값은 spill 파일 옆 (spill 을 끄면 dead-letter 도 로그만 남기고 버린다)
+        self.dead_letter_path = (
+            dead_letter_path
+            if dead_letter_path is not None
+            else (f"{spill_path}.dead" if spill_path else "")
+        )
+        self._queues: dict[str, list[dict]] = {kind: [] for kind in INGEST_TABLES}
+        self._pending = 0
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self.flushed_rows = 0
+        self.flush_count = 0
+        self.spilled_rows = 0
+        self.replayed_rows = 0
+        self.isolated_rows = 0
+        self.dead_letter_rows = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def metrics(self) -> dict:
+        return {
+            "pending": self._pending,
+            "flushed_rows": self.flushed_rows,
+            "flush_count": self.flush_count,
+            "spilled_rows": self.spilled_rows,
+            "replayed_rows": self.replayed_rows,
+            "isolated_rows": self.isolated_rows,
+            "dead_letter_rows": self.dead_letter_rows,
+        }
+
+    async def start(self) -> None:
+        if not self.enabled or self.is_running:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        # 이전 프로세스에서 남긴 spill 파일은 첫 flush 때 재적재
+        self._task = asyncio.create_task(self._run(), name="statistics_ingest_flush")
+
+    async def stop(self) -> None:
+        """
+        flush 루프 종료 후 남은 이벤트 drain
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def add(self, kind: str, rows: list[dict]) -> None:
+        """
+        이벤트 적재 요청(논블로킹). flush_size 에 도달하면 flush 루프를 깨웁니다.
+        """
+        if not rows:
+            return
+        if self._pending + len(rows) > self.max_pending:
+            # flush 가 장애로 밀려 있는 경우 메모리 대신 디스크로 보냄
+            self._spill(kind, rows)
+            return
+        self._queues[kind].extend(rows)
+        self._pending += len(rows)
+        if self._pending >= self.flush_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[statistics_ingest] flush loop error: {e}")
+
+    def _take_all(self) -> dict[str, list[dict]]:
+        batches = {kind: rows for kind, rows in self._queues.items() if rows}
+        self._queues = {kind: [] for kind in INGEST_TABLES}
+        self._pending = 0
+        return batches
+
+    async def flush(self) -> int:
+        """
+        대기 중인 이벤트를 multi-row INSERT 로 적재합니다.
+
+        Returns:
+            적재된 row 수
+        """
+        async with self._flush_lock:
+            batches = self._take_all()
+            if not batches and not self._has_spill():
+                return 0
+
+            try:
+                written = await self._insert(batches)
+            except asyncio.CancelledError:
+                # 종료 중 취소된 flush 는 큐로 되돌려 stop() 의 drain 에서 적재
+                for kind, rows in batches.items():
+                    self._queues[kind][:0] = rows
+                    self._pending += len(rows)
+                raise
+            except Exception as e:
+                row_count = sum(len(r) for r in batches.values())
+                if not await self._is_db_available():
+                    logger.error(f"[statistics_ingest] flush failed, spill {row_count} rows: {e}")
+                    for kind, rows in batches.items():
+                        self._spill(kind, rows)
+                    return 0
+                # DB 는 정상: 배치 안의 문제 row 만 골라낸다
+                logger.error(f"[statistics_ingest] flush failed, isolate {row_count} rows: {e}")
+                written = 0
+                for kind, rows in batches.items():
+                    written += await self._isolate(kind, rows)
+
+            self.flushed_rows += written
+            self.flush_count += 1
+            # DB 가 정상이므로 이전 spill 분을 다음 flush 대상으로 되돌림
+            # (종료 drain 중에는 재적재하지 않고 다음 기동 시 처리)
+            if self.is_running:
+                self._replay_spill()
+            return written
+
+    async def _insert(self, batches: dict[str, list[dict]]) -> int:
+        """batches 를 한 트랜잭션으로 적재"""
+        written = 0
+        async with self.session_factory() as session:
+            for kind, rows in batches.items():
+                spec = INGEST_TABLES[kind]
+                for start in range(0, len(rows), self.flush_size):
+                    chunk = rows[start : start + self.flush_size]
+                    query, params = build_multi_row_insert(spec, chunk)
+                    await session.execute(query, params)
+                    written += len(chunk)
+            await session.commit()
+        return written
+
+    async def _is_db_available(self) -> bool:
+        try:
+            async with self.session_factory() as session:
+                await session.execute(text("SELECT 1"))
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+
+    async def _isolate(self, kind: str, rows: list[dict]) -> int:
+        """
+        rows 를 반씩 나눠 각각 적재한다. 혼자서도 실패한 row 는 시도 횟수를 올려 spill 하고,
+        max_attempts 에 이르면 dead-letter 로 보낸다.
+
+        Returns:
+            적재된 row 수
+        """
+        written = 0
+        stack = [rows]
+        try:
+            while stack:
+                chunk = stack.pop()
+                try:
+                    written += await self._insert({kind: chunk})
+                except asyncio.CancelledError:
+                    stack.append(chunk)
+                    raise
+                except Exception as e:
+                    if len(chunk) > 1:
+                        middle = len(chunk) // 2
+                        stack.append(chunk[middle:])
+                        stack.append(chunk[:middle])
+                        continue
+                    self._record_row_failure(kind, chunk[0], e)
+        except asyncio.CancelledError:
+            # 아직 적재하지 않은 row 는 시도 횟수를 올리지 않고 spill
+            for chunk in stack:
+                self._spill(kind, chunk)
+            raise
+        self.isolated_rows += len(rows)
+        return written
+
+    def _record_row_failure(self, kind: str, row: dict, error: Exception) -> None:
+        attempts = int(row.get(_ATTEMPTS_KEY) or 0) + 1
+        failed = {**row, _ATTEMPTS_KEY: attempts}
+        if attempts < self.max_attempts:
+            self._spill(kind, [failed])
+            return
+        logger.error(f"[statistics_ingest] dead-letter 1 row ({kind}) after {attempts} attempts: {error}")
+        self._write_lines(
+            self.dead_letter_path,
+            kind,
+            [failed],
+            error=str(error)[:500],
+        )
+        self.dead_letter_rows += 1
+
+    def _has_spill(self) -> bool:
+        return bool(self.spill_path) and os.path.exists(self.spill_path)
+
+    def _spill(self, kind: str, rows: list[dict]) -> None:
+        if self._write_lines(self.spill_path, kind, rows):
+            self.spilled_rows += len(rows)
+
+    def _write_lines(self, path: str, kind: str, rows: list[dict], error: str | None = None) -> bool:
+        """rows 를 JSONL 로 덧붙인다 (spill / dead-letter 공용)"""
+        if not path:
+            logger.error(f"[statistics_ingest] drop {len(rows)} rows ({kind})")
+            return False
+        spec = INGEST_TABLES[kind]
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    serialized = dict(row)
+                    attempts = serialized.pop(_ATTEMPTS_KEY, 0)
+                    for column in spec.datetime_columns:
+                        if isinstance(serialized.get(column), datetime):
+                            serialized[column] = serialized[column].isoformat()
+                    item = {"kind": kind, "row": serialized}
+                    if attempts:
+                        item["attempts"] = attempts
+                    if error is not None:
+                        item["error"] = error
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            return True
+        except OSError as e:
+            logger.error(f"[statistics_ingest] write {path} failed, drop {len(rows)} rows: {e}")
+            return False
+
+    def _replay_spill(self) -> None:
+        if not self._has_spill():
+            return
+        # 여러 워커가 같은 파일을 공유하므로 rename 에 성공한 워커만 재적재
+        replay_path = f"{self.spill_path}.{os.getpid()}.{int(time.time() * 1000)}"
+        try:
+            os.rename(self.spill_path, replay_path)
+        except OSError:
+            return
+
+        replayed = 0
+        try:
+            with open(replay_path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        item = json.loads(line)
+                        spec = INGEST_TABLES[item["kind"]]
+                        row = item["row"]
+                        for column in spec.datetime_columns:
+                            if row.get(column):
+                                row[column] = datetime.fromisoformat(row[column])
+                        if item.get("attempts"):
+                            row[_ATTEMPTS_KEY] = int(item["attempts"])
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.error(f"[statistics_ingest] skip broken spill line: {e}")
+                        continue
+                    self._queues[item["kind"]].append(row)
+                    self._pending += 1
+                    replayed += 1
+        finally:
+            os.remove(replay_path)
+
+        self.replayed_rows += replayed
+        if replayed and self._wakeup is not None:
+            self._wakeup.set()
+
+
+statistics_ingest_buffer = StatisticsIngestBuffer()
@@ -8,6 +8,8 @@ from zoneinfo import ZoneInfo
 
 from app.const import CommonConstants, settings
 from app.exceptions import CustomResponseException
+from app.services.common.statistics_ingest import statistics_ingest_buffer
+from app.utils.identity import resolve_user_id
 from app.utils.query import get_nickname_sub_query
 from app.utils.response import build_paginated_response
 
@@ -358,17 +360,7 @@ async def insert_site_page_view_event(
     entry_source: str | None = None,
     entry_source_group: str | None = None,
 ):
-    user_id = None
-    if kc_user_id:
-        user_query = text("""
-            SELECT user_id
-            FROM tb_user
-            WHERE kc_user_id = :kc_user_id
-        """)
-        result = await db.execute(user_query, {"kc_user_id": kc_user_id})
-        row = result.mappings().one_or_none()
-        if row is not None:
-            user_id = row.get("user_id")
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
 
     normalized_route_group = _normalize_site_page_view_route_group(route_group)
     sanitized_path = _sanitize_page_view_path(path)
@@ -432,37 +424,39 @@ async def insert_site_page_view_event(
     normalized_external_referrer_host = _normalize_external_referrer_host(
         external_referrer_host
     )
-    await db.execute(
-        query,
-        {
-            "event_id": event_id,
-            "occurred_at": _normalize_page_view_occurred_at(occurred_at),
-            "user_id": user_id,
-            "visitor_id": _limit_text(visitor_id, 80),
-            "session_id": _limit_text(session_id, 80),
-            "route_group": normalized_route_group,
-            "route_name": _limit_text(route_name or "unknown", 120),
-            "path_template": _limit_text(_sanitize_page_view_path(path_template), 255),
-            "path": sanitized_path,
-            "query_hash": _normalize_site_page_view_query_hash(query_hash),
-            "referrer_path": sanitized_referrer_path,
-            "utm_source": _normalize_marketing_source(utm_source, 80),
-            "utm_medium": _normalize_marketing_token(utm_medium, 80),
-            "utm_campaign": _normalize_marketing_token(utm_campaign, 120),
-            "utm_content": _normalize_marketing_token(utm_content, 120),
-            "external_referrer_host": normalized_external_referrer_host,
-            "external_referrer_group": _normalize_external_referrer_group(
-                external_referrer_group, normalized_external_referrer_host
-            ),
-            "product_id": product_id if product_id and product_id > 0 else None,
-            "entry_source": _normalize_marketing_token(entry_source, 120),
-            "entry_source_group": _normalize_product_entry_source_group(
-                entry_source_group
-            ),
-            "source": _normalize_site_page_view_source(source),
-            "taxonomy_version": taxonomy_version or 1,
-        },
-    )
+    params = {
+        "event_id": event_id,
+        "occurred_at": _normalize_page_view_occurred_at(occurred_at),
+        "user_id": user_id,
+        "visitor_id": _limit_text(visitor_id, 80),
+        "session_id": _limit_text(session_id, 80),
+        "route_group": normalized_route_group,
+        "route_name": _limit_text(route_name or "unknown", 120),
+        "path_template": _limit_text(_sanitize_page_view_path(path_template), 255),
+        "path": sanitized_path,
+        "query_hash": _normalize_site_page_view_query_hash(query_hash),
+        "referrer_path": sanitized_referrer_path,
+        "utm_source": _normalize_marketing_source(utm_source, 80),
+        "utm_medium": _normalize_marketing_token(utm_medium, 80),
+        "utm_campaign": _normalize_marketing_token(utm_campaign, 120),
+        "utm_content": _normalize_marketing_token(utm_content, 120),
+        "external_referrer_host": normalized_external_referrer_host,
+        "external_referrer_group": _normalize_external_referrer_group(
+            external_referrer_group, normalized_external_referrer_host
+        ),
+        "product_id": product_id if product_id and product_id > 0 else None,
+        "entry_source": _normalize_marketing_token(entry_source, 120),
+        "entry_source_group": _normalize_product_entry_source_group(
+            entry_source_group
+        ),
+        "source": _normalize_site_page_view_source(source),
+        "taxonomy_version": taxonomy_version or 1,
+    }
+    if statistics_ingest_buffer.is_running:
+        # 버퍼 적재(주기적으로 multi-row INSERT), 요청 트랜잭션에서는 commit 하지 않음
+        statistics_ingest_buffer.add("site_page_view_event", [params])
+        return
+    await db.execute(query, params)
     await db.commit()
 
 
@@ -480,17 +474,7 @@ async def insert_site_page_dwell_event(
     source: str,
     taxonomy_version: int,
 ):
-    user_id = None
-    if kc_user_id:
-        user_query = text("""
-            SELECT user_id
-            FROM tb_user
-            WHERE kc_user_id = :kc_user_id
-        """)
-        result = await db.execute(user_query, {"kc_user_id": kc_user_id})
-        row = result.mappings().one_or_none()
-        if row is not None:
-            user_id = row.get("user_id")
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
 
     normalized_route_group = _normalize_site_page_view_route_group(route_group)
 
@@ -525,22 +509,23 @@ async def insert_site_page_dwell_event(
         )
         ON DUPLICATE KEY UPDATE event_id = event_id
     """)
-    await db.execute(
-        query,
-        {
-            "event_id": event_id,
-            "occurred_at": _normalize_page_view_occurred_at(occurred_at),
-            "user_id": user_id,
-            "visitor_id": _limit_text(visitor_id, 80),
-            "session_id": _limit_text(session_id, 80),
-            "route_group": normalized_route_group,
-            "route_name": _limit_text(route_name or "unknown", 120),
-            "path_template": _limit_text(_sanitize_page_view_path(path_template), 255),
-            "active_ms": _normalize_site_page_dwell_active_ms(active_ms),
-            "source": _normalize_site_page_view_source(source),
-            "taxonomy_version": taxonomy_version or 1,
-        },
-    )
+    params = {
+        "event_id": event_id,
+        "occurred_at": _normalize_page_view_occurred_at(occurred_at),
+        "user_id": user_id,
+        "visitor_id": _limit_text(visitor_id, 80),
+        "session_id": _limit_text(session_id, 80),
+        "route_group": normalized_route_group,
+        "route_name": _limit_text(route_name or "unknown", 120),
+        "path_template": _limit_text(_sanitize_page_view_path(path_template), 255),
+        "active_ms": _normalize_site_page_dwell_active_ms(active_ms),
+        "source": _normalize_site_page_view_source(source),
+        "taxonomy_version": taxonomy_version or 1,
+    }
+    if statistics_ingest_buffer.is_running:
+        statistics_ingest_buffer.add("site_page_dwell_event", [params])
+        return
+    await db.execute(query, params)
     await db.commit()
 
 
@@ -1133,17 +1118,18 @@ async def insert_site_statistics_log(
     if user_id is None:
         return
     if isinstance(user_id, str):
-        kc_user_id = user_id
-        query = text("""
-                         SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id
-                         """)
-        result = await db.execute(query, {"kc_user_id": kc_user_id})
-        row = result.mappings().one_or_none()
-        if row is None:
+        user_id = await resolve_user_id(user_id, db, active_only=False)
+        if user_id is None:
             return
-        user_id = row.get("user_id")
     if date is None:
         date = datetime.now()
+    if statistics_ingest_buffer.is_running:
+        statistics_ingest_buffer.add(
+            "site_statistics_log", [{"date": date, "type": type, "user_id": user_id}]
+        )
+        # 호출부가 앞선 쓰기를 이 commit 에 맡기는 경우가 있어 commit 은 유지
+        await db.commit()
+        return
     query = text("""
         INSERT INTO tb_site_statistics_log (date, type, user_id, created_date)
         VALUES (:date, :type, :user_id, NOW())
@@ -1161,21 +1147,22 @@ async def insert_site_statistics_logs(
     """
     여러 사이트 통계 로그를 한 번의 executemany + commit으로 저장합니다.
     read API에서 visit/page_view를 연속 기록할 때 commit 왕복을 줄이기 위한 helper입니다.
+    적재 버퍼가 실행 중이면 버퍼에만 넣고 commit 하지 않습니다(조회 API 전용).
     """
     if user_id is None or not types:
         return
     if isinstance(user_id, str):
-        kc_user_id = user_id
-        query = text("""
-                         SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id
-                         """)
-        result = await db.execute(query, {"kc_user_id": kc_user_id})
-        row = result.mappings().one_or_none()
-        if row is None:
+        user_id = await resolve_user_id(user_id, db, active_only=False)
+        if user_id is None:
             return
-        user_id = row.get("user_id")
     if date is None:
         date = datetime.now()
+    if statistics_ingest_buffer.is_running:
+        statistics_ingest_buffer.add(
+            "site_statistics_log",
+            [{"date": date, "type": type, "user_id": user_id} for type in types],
+        )
+        return
     query = text("""
         INSERT INTO tb_site_statistics_log (date, type, user_id, created_date)
         VALUES (:date, :type, :user_id, NOW())
@@ -11,11 +11,23 @@ from typing import Optional
 from app.exceptions import CustomResponseException
 from app.const import ErrorMessages
 from app.utils.query import get_pagination_params, get_file_path_sub_query
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
+from app.utils.response import build_cursor_paginated_response
 from app.services.common import comm_service
 import app.schemas.message as message_schema
 
 logger = logging.getLogger("app")
 
+# 커서 페이징 정렬(대화방: 마지막 메시지 시각, 메시지: 메시지 id)
+CHAT_ROOM_KEYSET_SPEC = KeysetSpec(
+    "chat_rooms",
+    (
+        KeysetOrder("COALESCE(last_msg.created_date, crm.created_date)"),
+        KeysetOrder("crm.room_id"),
+    ),
+)
+CHAT_MESSAGE_KEYSET_SPEC = KeysetSpec("chat_messages", (KeysetOrder("cm.id"),))
+
 
 def query_UTC2KST(utc_column: str, return_column: str) -> str:
     return f"DATE_ADD({utc_column}, INTERVAL 9 HOUR) AS {return_column}"
@@ -116,6 +128,8 @@ async def get_chat_room_list(
     page: int,
     count_per_page: int,
     db: AsyncSession,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
     """
     대화방 리스트 조회
@@ -127,6 +141,8 @@ async def get_chat_room_list(
         page: 페이지 번호
         count_per_page: 페이지당 개수
         db: 데이터베이스 세션
+        cursor: 커서 페이징 커서 (None 이면 page 페이징, 빈 값은 첫 페이지)
+        include_total: 커서 페이징 시 전체 개수 조회 여부
 
     Returns:
         대화방 리스트
@@ -140,6 +156,19 @@ async def get_chat_room_list(
             message=ErrorMessages.NOT_FOUND_USER,
         )
 
+    keyset = None
+    if cursor is not None:
+        keyset = parse_keyset_page(
+            CHAT_ROOM_KEYSET_SPEC,
+            cursor,
+            count_per_page,
+            scope={
+                "user_id": current_user_id,
+                "filter_type": filter_type,
+                "search_nickname": search_nickname,
+            },
+        )
+
     where_conditions = ["crm.user_id = :current_user_id", "crm.is_active = 'Y'"]
     query_params = {"current_user_id": current_user_id}
 
@@ -161,20 +190,32 @@ async def get_chat_room_list(
     where_clause = " AND ".join(where_conditions)
 
     # 전체 개수
-    count_query = text(f"""
-        SELECT COUNT(DISTINCT crm.room_id) AS total_count
-        FROM tb_chat_room_members crm
-        INNER JOIN tb_chat_room_members other_user_member ON crm.room_id = other_user_member.room_id
-        INNER JOIN tb_user_profile other_user_profile ON other_user_member.user_id = other_user_profile.user_id AND other_user_profile.default_yn = 'Y'
-        WHERE other_user_member.user_id != :current_user_id
-          AND {where_clause}
-    """)
-    result = await db.execute(count_query, query_params)
-    total_count = result.scalar() or 0
+    total_count = None
+    if keyset is None or include_total:
+        count_query = text(f"""
+            SELECT COUNT(DISTINCT crm.room_id) AS total_count
+            FROM tb_chat_room_members crm
+            INNER JOIN tb_chat_room_members other_user_member ON crm.room_id = other_user_member.room_id
+            INNER JOIN tb_user_profile other_user_profile ON other_user_member.user_id = other_user_profile.user_id AND other_user_profile.default_yn = 'Y'
+            WHERE other_user_member.user_id != :current_user_id
+              AND {where_clause}
+        """)
+        result = await db.execute(count_query, query_params)
+        total_count = result.scalar() or 0
 
     # 페이지네이션
-    limit_clause, limit_params = get_pagination_params(page, count_per_page)
-    query_params.update(limit_params)
+    if keyset is not None:
+        limit_clause = keyset.limit_sql
+        query_params.update(keyset.params)
+        keyset_select = f", {keyset.select_sql}"
+        keyset_where = keyset.where_sql
+        order_by = keyset.order_by_sql
+    else:
+        limit_clause, limit_params = get_pagination_params(page, count_per_page)
+        query_params.update(limit_params)
+        keyset_select = ""
+        keyset_where = ""
+        order_by = "COALESCE(last_msg.created_date, crm.created_date) DESC"
 
     # 대화방 리스트 조회
     list_query = text(f"""
@@ -219,6 +260,7 @@ async def get_chat_room_list(
                AND (crm.last_read_message_id IS NULL OR cm2.id > crm.last_read_message_id)
                AND cm2.is_deleted = 'N') AS unread_message_count,
             crm.is_active
+            {keyset_select}
         FROM tb_chat_room_members crm
         INNER JOIN tb_chat_room_members other_user_member ON crm.room_id = other_user_member.room_id
         INNER JOIN tb_user_profile other_user_profile ON other_user_member.user_id = other_user_profile.user_id AND other_user_profile.default_yn = 'Y'
@@ -233,11 +275,17 @@ async def get_chat_room_list(
         ) last_msg ON crm.room_id = last_msg.room_id
         WHERE other_user_member.user_id != :current_user_id
           AND {where_clause}
-        ORDER BY COALESCE(last_msg.created_date, crm.created_date) DESC
+          {keyset_where}
+        ORDER BY {order_by}
         {limit_clause}
     """)
 
     result = await db.execute(list_query, query_params)
+    if keyset is not None:
+        rooms, next_cursor = keyset.split(result.mappings().all())
+        return build_cursor_paginated_response(
+            rooms, next_cursor, keyset.limit, total_count
+        )
     rooms = [dict(row) for row in result.mappings().all()]
 
     return {
@@ -254,6 +302,8 @@ async def get_chat_messages(
     page: int,
     count_per_page: int,
     db: AsyncSession,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
     """
     특정 대화방의 메시지 조회
@@ -264,9 +314,11 @@ async def get_chat_messages(
         page: 페이지 번호
         count_per_page: 페이지당 개수
         db: 데이터베이스 세션
+        cursor: 커서 페이징 커서 (None 이면 page 페이징, 빈 값은 최신 메시지부터)
+        include_total: 커서 페이징 시 전체 메시지 수 조회 여부
 
     Returns:
-        메시지 리스트
+        메시지 리스트 (커서 페이징의 next_cursor 는 더 이전 메시지 방향)
     """
 
     # 현재 사용자 ID 조회
@@ -291,18 +343,36 @@ async def get_chat_messages(
             message=ErrorMessages.FORBIDDEN_ACCESS_CHAT_ROOM,
         )
 
+    keyset = None
+    if cursor is not None:
+        keyset = parse_keyset_page(
+            CHAT_MESSAGE_KEYSET_SPEC, cursor, count_per_page, scope={"room_id": room_id}
+        )
+
     # 전체 메시지 수
-    count_query = text("""
-        SELECT COUNT(*) AS total_count
-        FROM tb_chat_messages
-        WHERE room_id = :room_id AND is_deleted = 'N'
-    """)
-    result = await db.execute(count_query, {"room_id": room_id})
-    total_count = result.scalar() or 0
+    total_count = None
+    if keyset is None or include_total:
+        count_query = text("""
+            SELECT COUNT(*) AS total_count
+            FROM tb_chat_messages
+            WHERE room_id = :room_id AND is_deleted = 'N'
+        """)
+        result = await db.execute(count_query, {"room_id": room_id})
+        total_count = result.scalar() or 0
 
     # 페이지네이션
-    limit_clause, limit_params = get_pagination_params(page, count_per_page)
-    query_params = {"room_id": room_id, **limit_params}
+    if keyset is not None:
+        limit_clause = keyset.limit_sql
+        query_params = {"room_id": room_id, **keyset.params}
+        keyset_select = f", {keyset.select_sql}"
+        keyset_where = keyset.where_sql
+        order_by = keyset.order_by_sql
+    else:
+        limit_clause, limit_params = get_pagination_params(page, count_per_page)
+        query_params = {"room_id": room_id, **limit_params}
+        keyset_select = ""
+        keyset_where = ""
+        order_by = "cm.created_date DESC"
 
     # 메시지 조회 (최신순)
     messages_query = text(f"""
@@ -316,17 +386,23 @@ async def get_chat_messages(
                 ELSE (CASE WHEN crm.last_read_message_id >= cm.id THEN 'Y' ELSE 'N' END)
             END AS is_read,
             {query_UTC2KST("cm.created_date", "created_date")}
+            {keyset_select}
         FROM tb_chat_messages cm
         LEFT JOIN tb_chat_room_members crm ON cm.room_id = crm.room_id
             AND crm.user_id != cm.sender_user_id
         WHERE cm.room_id = :room_id AND cm.is_deleted = 'N'
-        ORDER BY cm.created_date DESC
+          {keyset_where}
+        ORDER BY {order_by}
         {limit_clause}
     """)
     query_params["current_user_id"] = current_user_id
 
     result = await db.execute(messages_query, query_params)
-    messages = [dict(row) for row in result.mappings().all()]
+    next_cursor = None
+    if keyset is not None:
+        messages, next_cursor = keyset.split(result.mappings().all())
+    else:
+        messages = [dict(row) for row in result.mappings().all()]
 
     # 읽음 상태 업데이트 (마지막 메시지까지 읽음 처리)
     if messages:
@@ -346,6 +422,12 @@ async def get_chat_messages(
             },
         )
 
+    if keyset is not None:
+        # 오래된 순서로 반환
+        return build_cursor_paginated_response(
+            list(reversed(messages)), next_cursor, keyset.limit, total_count
+        )
+
     return {
         "total_count": total_count,
         "page": page,
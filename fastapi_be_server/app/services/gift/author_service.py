@@ -25,6 +25,7 @@ from app.services.product.product_service import (
     convert_product_data,
     get_select_fields_and_joins_for_product,
 )
+from app.services.product.product_card_service import mark_product_cards_dirty
 import app.schemas.user_giftbook as user_giftbook_schema
 import app.services.user.user_giftbook_service as user_giftbook_service
 
@@ -1267,6 +1268,7 @@ async def accept_contract_offers(offer_id: int, kc_user_id: str, db: AsyncSessio
     """)
     await db.execute(query, {"offer_id": offer_id})
 
+    mark_product_cards_dirty(offer.get("product_id"))
     res_body = dict()
     res_body["result"] = True
 
@@ -1323,6 +1325,7 @@ async def reject_contract_offers(offer_id: int, kc_user_id: str, db: AsyncSessio
     """)
     await db.execute(query, {"offer_id": offer_id})
 
+    mark_product_cards_dirty(offer.get("product_id"))
     res_body = dict()
     res_body["result"] = True
 
@@ -1483,4 +1486,6 @@ async def post_products_product_id_contract_offer(
         error_logger.error(f"post_products_product_id_contract_offer => {e}")
         raise CustomResponseException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    mark_product_cards_dirty(product_id_to_int)
+
     return res_body
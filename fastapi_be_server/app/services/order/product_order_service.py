@@ -2,6 +2,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.const import settings
+from app.services.product.product_card_service import mark_product_cards_dirty
 
 
 async def create_product_order_with_items(
@@ -115,4 +116,6 @@ async def create_product_order_with_items(
         },
     )
 
+    mark_product_cards_dirty(*(item.get("product_id") for item in items))
+
     return order_id
@@ -1,3 +1,4 @@
+from app.services.ai.taste_recommendation_cache import bump_taste_profile_version
 from app.services.common import comm_service
 from app.services.order.product_order_service import create_product_order_with_items
 from fastapi import status
@@ -147,6 +148,9 @@ async def purchase_episode_with_cash(
             },
         )
 
+        # 구매 작품이 취향 추천 입력(열람/소장)에 반영되도록 추천 캐시 무효화
+        await bump_taste_profile_version(user_id, db)
+
         # 소장 기록 등록
         query = text("""
             INSERT INTO tb_user_productbook
@@ -421,6 +425,9 @@ async def purchase_all_episodes_with_cash(
             },
         )
 
+        # 구매 작품이 취향 추천 입력(열람/소장)에 반영되도록 추천 캐시 무효화
+        await bump_taste_profile_version(user_id, db)
+
         # 단행본 대여 기록 등록
         if purchase_type == "rental":
             query = text("""
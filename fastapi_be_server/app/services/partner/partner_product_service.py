@@ -12,7 +12,12 @@ from app.utils.query import (
     get_file_path_sub_query,
     get_pagination_params,
 )
-from app.utils.response import build_paginated_response, check_exists_or_404
+from app.utils.response import (
+    build_cursor_paginated_response,
+    build_paginated_response,
+    check_exists_or_404,
+)
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
 from app.const import CommonConstants
 from app.const import ErrorMessages
 from app.services.common.genre_policy import can_use_as_primary_genre
@@ -23,6 +28,11 @@ logger = logging.getLogger("partner_app")  # 커스텀 로거 생성
 partner 작품 관리 서비스 함수 모음
 """
 
+# 작품 리스트 커서 페이징 정렬(등록일 최신순, 동시각은 product_id 로 구분)
+PARTNER_PRODUCT_KEYSET_SPEC = KeysetSpec(
+    "partner_products", (KeysetOrder("a.created_date"), KeysetOrder("a.product_id"))
+)
+
 
 def _normalize_optional_text(value: Optional[str]) -> Optional[str]:
     if value is None:
@@ -89,6 +99,8 @@ async def product_list(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     from_episode_sales_page: Optional[bool] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
     """
     작품 관리 / 작품 리스트
@@ -105,6 +117,8 @@ async def product_list(
         start_date: 회차별 매출 시작 날짜 (YYYY-MM-DD)
         end_date: 회차별 매출 종료 날짜 (YYYY-MM-DD)
         from_episode_sales_page: 회차별 매출 페이지에서 호출 여부 (True일 때 매출 데이터가 있는 작품만 조회)
+        cursor: 커서 페이징 커서 (None 이면 page 페이징, 빈 값은 첫 페이지)
+        include_total: 커서 페이징 시 전체 개수 조회 여부
 
     Returns:
         작품 리스트 및 페이징 정보 딕셔너리
@@ -230,7 +244,36 @@ async def product_list(
         inner join tmp_episode_sales_product_summary eps on eps.product_id = a.product_id
         """
 
-    limit_clause, limit_params = get_pagination_params(page, count_per_page)
+    keyset = None
+    if cursor is not None:
+        keyset = parse_keyset_page(
+            PARTNER_PRODUCT_KEYSET_SPEC,
+            cursor,
+            count_per_page,
+            scope={
+                "user_id": user_data["user_id"],
+                "role": user_data["role"],
+                "contract_type": contract_type,
+                "status_code": status_code,
+                "has_episode_apply_yn": has_episode_apply_yn,
+                "search_target": search_target,
+                "search_word": search_word,
+                "start_date": start_date,
+                "end_date": end_date,
+                "from_episode_sales_page": bool(from_episode_sales_page),
+            },
+        )
+        limit_clause, limit_params = keyset.limit_sql, keyset.params
+        keyset_select = f", {keyset.select_sql}"
+        keyset_where = keyset.where_sql
+        order_sql = keyset.order_by_sql
+        outer_order_sql = keyset.order_by_sql
+    else:
+        limit_clause, limit_params = get_pagination_params(page, count_per_page)
+        keyset_select = ""
+        keyset_where = ""
+        order_sql = "a.created_date DESC"
+        outer_order_sql = "fp.created_date DESC"
 
     # 전체 개수 구하기
     count_query = text(f"""
@@ -259,8 +302,10 @@ async def product_list(
         WHERE 1=1 {where}
         ;
     """)
-    count_result = await db.execute(count_query, {})
-    total_count = count_result.mappings().first()["total_count"]
+    total_count = None
+    if keyset is None or include_total:
+        count_result = await db.execute(count_query, {})
+        total_count = count_result.mappings().first()["total_count"]
 
     # 실제 데이터 조회
     query = text(f"""
@@ -297,7 +342,8 @@ async def product_list(
             {sales_summary_join}
             left join tmp_cp_summary d on a.cp_user_id = d.user_id
             WHERE 1=1 {where}
-            ORDER BY a.created_date DESC
+            {keyset_where}
+            ORDER BY {order_sql}
             {limit_clause}
         )
         select a.product_id
@@ -333,18 +379,26 @@ async def product_list(
             , a.series_regular_price
             , a.monopoly_yn
             , {get_file_path_sub_query("a.thumbnail_file_id", "cover_image_path", "cover")}
+            {keyset_select}
         from filtered_products fp
         inner join tb_product a on a.product_id = fp.product_id
         left join tmp_product_episode_summary b on a.product_id = b.product_id
         left join tmp_cp_summary d on a.cp_user_id = d.user_id
-        ORDER BY fp.created_date DESC
+        ORDER BY {outer_order_sql}
     """)
     result = await db.execute(query, limit_params)
-    rows = [dict(row) for row in result.mappings().all()]
+    if keyset is not None:
+        rows, next_cursor = keyset.split(result.mappings().all())
+    else:
+        rows = [dict(row) for row in result.mappings().all()]
 
     for row in rows:
         row.pop("contract_yn", None)
 
+    if keyset is not None:
+        return build_cursor_paginated_response(
+            rows, next_cursor, keyset.limit, total_count
+        )
     return build_paginated_response(rows, total_count, page, count_per_page)
 
 
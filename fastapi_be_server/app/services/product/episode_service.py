@@ -14,11 +14,13 @@ from zipfile import BadZipFile, ZipFile
 from xml.etree import ElementTree as ET
 
 from bs4 import BeautifulSoup
-from httpx import AsyncClient, HTTPStatusError, RequestError, Timeout
+from httpx import HTTPStatusError, RequestError, Timeout
 
 from app.const import settings, CommonConstants, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.rdb import likenovel_db_session
+from app.utils.http_client import HTTP_PROVIDER_R2, get_http_client
+from app.utils.identity import resolve_user_id, resolve_user_identity
 from app.utils.time import convert_to_kor_time
 from app.utils.query import get_file_path_sub_query
 from app.utils.rich_text_sanitizer import (
@@ -30,6 +32,11 @@ import app.schemas.episode as episode_schema
 import app.services.common.statistics_service as statistics_service
 import app.services.product.product_service as product_service
 import app.services.event.event_reward_service as event_reward_service
+from app.services.product.product_card_service import (
+    mark_episode_product_cards_dirty,
+    mark_product_cards_dirty,
+)
+from app.services.product.view_counter import episode_view_counter
 
 logger = logging.getLogger(__name__)
 
@@ -59,33 +66,14 @@ async def _transaction_scope(db: AsyncSession):
 async def _resolve_episode_sale_actor(
     kc_user_id: str, db: AsyncSession
 ) -> tuple[int, dict[str, bool]]:
-    query = text("""
-        select
-            u.user_id,
-            u.role_type,
-            exists(
-                select 1
-                  from tb_user_profile_apply upa
-                 where upa.user_id = u.user_id
-                   and upa.apply_type = 'cp'
-                   and upa.approval_code = 'accepted'
-                   and upa.approval_date IS NOT NULL
-                 limit 1
-            ) as is_cp
-          from tb_user u
-         where u.kc_user_id = :kc_user_id
-           and u.use_yn = 'Y'
-         limit 1
-    """)
-    result = await db.execute(query, {"kc_user_id": kc_user_id})
-    row = result.mappings().one_or_none()
+    identity = await resolve_user_identity(kc_user_id, db)
 
-    if row is None:
+    if identity is None:
         return -1, {"is_admin": False, "is_cp": False}
 
-    return int(row["user_id"]), {
-        "is_admin": row.get("role_type") == "admin",
-        "is_cp": bool(row.get("is_cp")),
+    return identity.user_id, {
+        "is_admin": identity.is_admin,
+        "is_cp": identity.is_cp,
     }
 
 
@@ -463,9 +451,9 @@ async def _download_epub_binary_from_r2(
     )
 
     try:
-        async with AsyncClient(timeout=60.0) as ac:
-            response = await ac.get(url=presigned_url)
-            response.raise_for_status()
+        ac = get_http_client(HTTP_PROVIDER_R2)
+        response = await ac.get(url=presigned_url, timeout=60.0)
+        response.raise_for_status()
         return response.content
     except (HTTPStatusError, RequestError) as e:
         logger.warning(
@@ -548,44 +536,44 @@ async def _get_epub_cache_from_epub_files(
     semaphore = asyncio.Semaphore(24)
     timeout = Timeout(connect=10.0, read=20.0, write=20.0, pool=20.0)
 
-    async with AsyncClient(timeout=timeout) as ac:
+    ac = get_http_client(HTTP_PROVIDER_R2)
 
-        async def _extract(file_group_id: int, file_name: str) -> tuple[int, dict]:
-            presigned_url = comm_service.make_r2_presigned_url(
-                type="download",
-                bucket_name=settings.R2_SC_EPUB_BUCKET,
-                file_id=file_name,
+    async def _extract(file_group_id: int, file_name: str) -> tuple[int, dict]:
+        presigned_url = comm_service.make_r2_presigned_url(
+            type="download",
+            bucket_name=settings.R2_SC_EPUB_BUCKET,
+            file_id=file_name,
+        )
+        try:
+            async with semaphore:
+                response = await ac.get(url=presigned_url, timeout=timeout)
+                response.raise_for_status()
+            epub_bytes = response.content
+            epub_payload = await asyncio.to_thread(
+                _extract_epub_payload_from_epub, epub_bytes
             )
-            try:
-                async with semaphore:
-                    response = await ac.get(url=presigned_url)
-                    response.raise_for_status()
-                epub_bytes = response.content
-                epub_payload = await asyncio.to_thread(
-                    _extract_epub_payload_from_epub, epub_bytes
-                )
-                return file_group_id, epub_payload
-            except (HTTPStatusError, RequestError, BadZipFile, ValueError) as e:
-                logger.warning(
-                    "Failed to extract epub in batch. file_group_id=%s, reason=%s",
-                    file_group_id,
-                    str(e),
-                )
-                return file_group_id, {"text_count": 0, "html_content": ""}
-            except Exception as e:
-                logger.warning(
-                    "Unexpected error while extracting epub in batch. file_group_id=%s, reason=%s",
-                    file_group_id,
-                    str(e),
-                )
-                return file_group_id, {"text_count": 0, "html_content": ""}
+            return file_group_id, epub_payload
+        except (HTTPStatusError, RequestError, BadZipFile, ValueError) as e:
+            logger.warning(
+                "Failed to extract epub in batch. file_group_id=%s, reason=%s",
+                file_group_id,
+                str(e),
+            )
+            return file_group_id, {"text_count": 0, "html_content": ""}
+        except Exception as e:
+            logger.warning(
+                "Unexpected error while extracting epub in batch. file_group_id=%s, reason=%s",
+                file_group_id,
+                str(e),
+            )
+            return file_group_id, {"text_count": 0, "html_content": ""}
 
-        results = await asyncio.gather(
-            *[
-                _extract(file_group_id=file_group_id, file_name=file_name)
-                for file_group_id, file_name in file_name_by_group_id.items()
-            ]
-        )
+    results = await asyncio.gather(
+        *[
+            _extract(file_group_id=file_group_id, file_name=file_name)
+            for file_group_id, file_name in file_name_by_group_id.items()
+        ]
+    )
 
     return {file_group_id: data for file_group_id, data in results}
 
@@ -677,21 +665,12 @@ async def get_episodes_episode_id(episode_id: str, kc_user_id: str, db: AsyncSes
                 episode_id=episode_id_to_int, kc_user_id=kc_user_id, db=db
             )
 
-            query = text("""
-                                select user_id
-                                from tb_user
-                                where kc_user_id = :kc_user_id
-                                and use_yn = 'Y'
-                                """)
-
-            result = await db.execute(query, {"kc_user_id": kc_user_id})
-            db_rst = result.mappings().all()
-            if not db_rst:
+            user_id = await resolve_user_id(kc_user_id, db)
+            if user_id is None:
                 raise CustomResponseException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     message=ErrorMessages.LOGIN_REQUIRED,
                 )
-            user_id = db_rst[0].get("user_id")
 
             query = text("""
                                 with tmp_get_episodes_episode_id_1 as (                                     
@@ -987,6 +966,7 @@ async def get_episodes_episode_id(episode_id: str, kc_user_id: str, db: AsyncSes
                                 "updated_id": settings.DB_DML_DEFAULT_ID,
                             },
                         )
+                    mark_product_cards_dirty(product_id)
 
                     query = text("""
                                         select 1
@@ -1000,24 +980,32 @@ async def get_episodes_episode_id(episode_id: str, kc_user_id: str, db: AsyncSes
 
                     cp_yn = CommonConstants.YES if db_rst else CommonConstants.NO
 
-                    query = text("""
-                                        update tb_product_episode
-                                        set count_hit = count_hit + 1
-                                        where episode_id = :episode_id
-                                        """)
+                    if episode_view_counter.is_running:
+                        # 조회수/일별 조회 로그는 write-behind 집계 후 주기적으로 bulk 반영
+                        episode_view_counter.record(
+                            product_id=product_id,
+                            episode_id=episode_id_to_int,
+                            cp_yn=cp_yn,
+                        )
+                    else:
+                        query = text("""
+                                            update tb_product_episode
+                                            set count_hit = count_hit + 1
+                                            where episode_id = :episode_id
+                                            """)
 
-                    await db.execute(query, {"episode_id": episode_id_to_int})
+                        await db.execute(query, {"episode_id": episode_id_to_int})
 
-                    query = text("""
-                                        update tb_product
-                                        set count_hit = count_hit + 1
-                                            , count_cp_hit = (case when :cp_yn = 'Y' then count_cp_hit + 1 else count_cp_hit end)
-                                        where product_id = :product_id
-                                        """)
+                        query = text("""
+                                            update tb_product
+                                            set count_hit = count_hit + 1
+                                                , count_cp_hit = (case when :cp_yn = 'Y' then count_cp_hit + 1 else count_cp_hit end)
+                                            where product_id = :product_id
+                                            """)
 
-                    await db.execute(query, {"product_id": product_id, "cp_yn": cp_yn})
+                        await db.execute(query, {"product_id": product_id, "cp_yn": cp_yn})
 
-                    await product_service.save_product_hit_log(product_id=product_id, db=db)
+                        await product_service.save_product_hit_log(product_id=product_id, db=db)
 
                     try:
                         await event_reward_service.check_and_grant_event_reward(
@@ -1233,13 +1221,20 @@ async def get_episodes_episode_id(episode_id: str, kc_user_id: str, db: AsyncSes
                 }
 
                 # TODO: cleaned garbled comment (encoding issue).
-                query = text("""
-                                    update tb_product_episode
-                                    set count_hit = count_hit + 1
-                                    where episode_id = :episode_id
-                                    """)
+                if episode_view_counter.is_running:
+                    episode_view_counter.record(
+                        product_id=db_rst[0].get("product_id"),
+                        episode_id=episode_id_to_int,
+                        count_product=False,
+                    )
+                else:
+                    query = text("""
+                                        update tb_product_episode
+                                        set count_hit = count_hit + 1
+                                        where episode_id = :episode_id
+                                        """)
 
-                await db.execute(query, {"episode_id": episode_id_to_int})
+                    await db.execute(query, {"episode_id": episode_id_to_int})
             else:
                 logger.warning("db_rst is None")
 
@@ -2193,6 +2188,7 @@ async def post_episodes_products_product_id(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(product_id_to_int)
     res_body = {"data": res_data}
 
     return res_body
@@ -2473,6 +2469,7 @@ async def post_episodes_products_product_id_epub(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(product_id_to_int)
     res_body = {"data": res_data}
 
     return res_body
@@ -2779,6 +2776,7 @@ async def post_episodes_products_product_id_epub_batch(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(product_id_to_int)
     res_body = {"data": res_data}
 
     return res_body
@@ -3418,6 +3416,7 @@ async def post_episodes_delete(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(*(req_body.episode_ids or []))
     res_body = {"data": res_data}
     return res_body
 
@@ -3622,6 +3621,7 @@ async def post_episodes_sale_start(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(*(req_body.episode_ids or []))
     res_body = {"data": res_data}
     return res_body
 
@@ -3798,6 +3798,7 @@ async def post_episodes_sale_reserve(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(*(req_body.episode_ids or []))
     res_body = {"data": res_data}
     return res_body
 
@@ -3977,6 +3978,9 @@ async def post_episodes_publish_reserve_bulk(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(
+        *(item.episode_id for item in (req_body.schedules or []))
+    )
     res_body = {"data": res_data}
     return res_body
 
@@ -4494,6 +4498,8 @@ async def put_episodes_episode_id(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(episode_id_to_int)
+
     return
 
 
@@ -4692,6 +4698,7 @@ async def put_episodes_episode_id_open(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_episode_product_cards_dirty(episode_id_to_int)
     res_body = {"data": res_data}
 
     return res_body
@@ -4870,6 +4877,7 @@ async def put_episodes_episode_id_reaction(
 
                         # TODO: cleaned garbled comment (encoding issue).
                         recommend_yn = "Y"
+                    mark_product_cards_dirty(product_id)
 
                     # TODO: cleaned garbled comment (encoding issue).
                     query = text("""
@@ -5057,15 +5065,16 @@ async def check_like_product_episode(
     """
     Check whether the current user already liked the episode.
     """
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
+    if user_id is None:
+        return False
     query = text("""
         select count(*) as cnt from tb_product_episode_like
         where product_id = (select product_id from tb_product_episode where episode_id = :episode_id)
           and episode_id = :episode_id
-          and user_id = (select user_id from tb_user where kc_user_id = :kc_user_id)
+          and user_id = :user_id
     """)
-    result = await db.execute(
-        query, {"episode_id": episode_id, "kc_user_id": kc_user_id}
-    )
+    result = await db.execute(query, {"episode_id": episode_id, "user_id": user_id})
     db_rst = result.mappings().all()
     cnt = db_rst[0].get("cnt")
     return cnt > 0
@@ -6,12 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.const import LOGGER_TYPE, settings, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.utils.common import handle_exceptions
+from app.utils.identity import resolve_user_id
 
 from app.config.log_config import service_error_logger
 
 # Import from product_service for helper functions
 from app.services.product.product_service import (
-    get_user_id,
     get_select_fields_and_joins_for_product,
     convert_product_data,
 )
@@ -205,17 +205,16 @@ async def products_bookmark_by_user_id(
         )
 
     async with db.begin():
+        user_id = await resolve_user_id(kc_user_id, db)
         query = text("""
                         select b.product_id
                              , b.created_date as bookmark_created_date
-                        from tb_user a
-                            inner join tb_user_bookmark b on a.user_id = b.user_id and b.use_yn = 'Y'
-                        where 1=1
-                            and a.kc_user_id = :kc_user_id
-                            and a.use_yn = 'Y'
+                        from tb_user_bookmark b
+                        where b.user_id = :user_id
+                            and b.use_yn = 'Y'
                          """)
 
-        result = await db.execute(query, {"kc_user_id": kc_user_id})
+        result = await db.execute(query, {"user_id": user_id or 0})
         db_rst = result.mappings().all()
 
         if len(db_rst) > 0:
@@ -232,8 +231,6 @@ async def products_bookmark_by_user_id(
             filter_option.append(f"p.product_id IN ({fetch_product_ids})")
             filter_option.append("p.open_yn = 'Y'")
 
-            user_id = await get_user_id(kc_user_id, db)
-
             query_parts = get_select_fields_and_joins_for_product(
                 user_id=user_id, join_rank=False
             )
@@ -0,0 +1,428 @@
+import asyncio
+import logging
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+"""
+작품 카드 read model (tb_product_card_summary)
+- 목록 API 의 get_select_fields_and_joins_for_product 가 요청마다 전체 테이블을 집계하던
+  회차 수/키워드/관심 수/누적 매출/계약 제안/유료 전환 신청/최신·첫 회차/관심 유지·이탈 값을
+  작품 단위로 미리 계산해 두고, 목록 조회는 tb_product_card_summary 1건 join 으로 대체합니다.
+- 회차/키워드/계약 제안/매출/유료 전환/관심 변경 시 mark_product_cards_dirty() 로 표시하면
+  ProductCardRefresher 가 flush 주기마다 해당 작품만 다시 계산합니다.
+  요청 commit 전에 재계산되는 경우를 대비해 dirty 작품은 다음 주기에 한 번 더 재계산합니다.
+- 배치/관리자 SQL 등 hook 이 없는 변경은 작품 id 순으로 조금씩 순회하는 sweep 으로 반영합니다.
+- check_product_card_consistency() 는 read model 과 라이브 join 결과를 비교합니다
+  (scripts/check_product_card_consistency.py).
+- 사용자별 값(티켓/북마크/최근 읽은 회차 등)과 시간에 따라 바뀌는 값(프로모션, 주간 알림 수)은
+  read model 에 넣지 않고 기존처럼 조회 시 join 합니다.
+"""
+
+# 한 번에 재계산하는 작품 수
+_REFRESH_CHUNK_SIZE = 200
+
+PRODUCT_CARD_COLUMNS = (
+    "keywords",
+    "episode_count",
+    "open_episode_count",
+    "open_episode_text_count",
+    "latest_episode_id",
+    "latest_episode_no",
+    "first_episode_id",
+    "total_interest",
+    "total_sales",
+    "offer_count",
+    "offer_id",
+    "offer_date",
+    "offer_price",
+    "offer_profit",
+    "author_profit",
+    "offer_decision_state",
+    "paid_state",
+    "paid_apply_count",
+    "paid_status_code_raw",
+    "interest_sustain_count",
+    "interest_loss_count",
+)
+
+
+def _product_card_source_sql(filter_product_ids: bool) -> str:
+    """
+    라이브 테이블 기준 작품 카드 집계 SELECT
+    - filter_product_ids 면 모든 파생 테이블을 :product_ids 로 좁혀 작품 단위 재계산이 인덱스를 타도록 합니다.
+    """
+    product_filter = "AND product_id IN :product_ids" if filter_product_ids else ""
+    return f"""
+        SELECT p.product_id
+             , (SELECT GROUP_CONCAT(DISTINCT sk.keyword_name SEPARATOR '|')
+                  FROM tb_mapped_product_keyword mpk
+                  LEFT JOIN tb_standard_keyword sk ON sk.keyword_id = mpk.keyword_id
+                 WHERE mpk.product_id = p.product_id) AS keywords
+             , COALESCE(ep_count.episode_count, 0) AS episode_count
+             , COALESCE(ep_count.open_episode_count, 0) AS open_episode_count
+             , COALESCE(ep_count.open_episode_text_count, 0) AS open_episode_text_count
+             , latest_episode.episode_id AS latest_episode_id
+             , latest_episode.episode_no AS latest_episode_no
+             , first_episode.episode_id AS first_episode_id
+             , COALESCE(interest_count.total_interest, 0) AS total_interest
+             , COALESCE(total_sales.total, 0) AS total_sales
+             , COALESCE(offer_stats.offer_count, 0) AS offer_count
+             , pco_latest.offer_id
+             , pco_latest.offer_date
+             , pco_latest.offer_price
+             , pco_latest.offer_profit
+             , pco_latest.author_profit
+             , pco_latest.decision_state AS offer_decision_state
+             , ppa_latest.paid_state
+             , COALESCE(ppa_latest.apply_count, 0) AS paid_apply_count
+             , ppa_latest.status_code_raw AS paid_status_code_raw
+             , pdcs.current_count_interest_sustain AS interest_sustain_count
+             , pdcs.current_count_interest_loss AS interest_loss_count
+          FROM tb_product p
+          LEFT JOIN (
+              SELECT product_id, COUNT(*) as episode_count, SUM(CASE WHEN open_yn = 'Y' THEN 1 ELSE 0 END) as open_episode_count, SUM(CASE WHEN open_yn = 'Y' THEN episode_text_count ELSE 0 END) as open_episode_text_count
+                FROM tb_product_episode
+               WHERE use_yn = 'Y' {product_filter}
+               GROUP BY product_id
+          ) ep_count ON ep_count.product_id = p.product_id
+          LEFT JOIN (
+              SELECT DISTINCT
+                  product_id,
+                  FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_id,
+                  FIRST_VALUE(episode_no) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_no
+                FROM tb_product_episode
+               WHERE open_yn = 'Y' AND use_yn = 'Y' {product_filter}
+          ) latest_episode ON latest_episode.product_id = p.product_id
+          LEFT JOIN (
+              SELECT DISTINCT
+                  product_id,
+                  FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date ASC, episode_id ASC) as episode_id
+                FROM tb_product_episode
+               WHERE open_yn = 'Y' AND use_yn = 'Y' {product_filter}
+          ) first_episode ON first_episode.product_id = p.product_id
+          LEFT JOIN (
+              SELECT product_id, COUNT(DISTINCT user_id) as total_interest
+                FROM tb_user_product_usage
+               WHERE use_yn = 'Y' {product_filter}
+               GROUP BY product_id
+          ) interest_count ON interest_count.product_id = p.product_id
+          LEFT JOIN (
+              SELECT poii.product_id, SUM(po.total_price) as total
+                FROM tb_product_order po
+                JOIN tb_product_order_item poi ON po.order_id = poi.order_id
+                JOIN tb_product_order_item_info poii ON poi.item_id = poii.item_info_id
+               WHERE po.cancel_yn = 'N' {product_filter.replace("product_id", "poii.product_id")}
+               GROUP BY poii.product_id
+          ) total_sales ON total_sales.product_id = p.product_id
+          LEFT JOIN (
+              SELECT product_id, COUNT(*) as offer_count
+                FROM tb_product_contract_offer
+               WHERE use_yn = 'Y' {product_filter}
+               GROUP BY product_id
+          ) offer_stats ON offer_stats.product_id = p.product_id
+          LEFT JOIN (
+              SELECT DISTINCT
+                  product_id,
+                  FIRST_VALUE(offer_id) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_id,
+                  FIRST_VALUE(offer_date) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_date,
+                  FIRST_VALUE(offer_price) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_price,
+                  FIRST_VALUE(offer_profit) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_profit,
+                  FIRST_VALUE(author_profit) OVER (PARTITION BY product_id ORDER BY created_date DESC) as author_profit,
+                  FIRST_VALUE(CASE WHEN author_accept_yn = 'Y' THEN 'accepted' WHEN author_accept_yn = 'N' THEN 'review' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC) as decision_state
+                FROM tb_product_contract_offer
+               WHERE use_yn = 'Y' {product_filter}
+          ) pco_latest ON pco_latest.product_id = p.product_id
+          LEFT JOIN (
+              SELECT DISTINCT
+                  product_id,
+                  CASE
+                      WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                          FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                      WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                          FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                      ELSE 'review'
+                  END as paid_state,
+                  COUNT(*) OVER (PARTITION BY product_id) as apply_count,
+                  CASE
+                      WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                          FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                      WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                          FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                      ELSE NULL
+                  END as status_code_raw
+                FROM tb_product_paid_apply
+               WHERE use_yn = 'Y' {product_filter}
+          ) ppa_latest ON ppa_latest.product_id = p.product_id
+          LEFT JOIN (
+              SELECT product_id, current_count_interest_sustain, current_count_interest_loss
+                FROM (
+                    SELECT product_id
+                         , current_count_interest_sustain
+                         , current_count_interest_loss
+                         , ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY created_date DESC, id DESC) AS rn
+                      FROM tb_batch_daily_product_count_summary
+                     WHERE 1 = 1 {product_filter}
+                ) latest_pdcs
+               WHERE rn = 1
+          ) pdcs ON pdcs.product_id = p.product_id
+         WHERE 1 = 1 {product_filter.replace("product_id", "p.product_id")}
+    """
+
+
+_PRODUCT_CARD_SOURCE_QUERY = text(
+    _product_card_source_sql(filter_product_ids=True)
+).bindparams(bindparam("product_ids", expanding=True))
+
+_PRODUCT_CARD_REFRESH_QUERY = text(f"""
+    INSERT INTO tb_product_card_summary (product_id, {", ".join(PRODUCT_CARD_COLUMNS)})
+    SELECT product_id, {", ".join(PRODUCT_CARD_COLUMNS)}
+      FROM ({_product_card_source_sql(filter_product_ids=True)}) src
+    ON DUPLICATE KEY UPDATE
+        {", ".join(f"{column} = VALUES({column})" for column in PRODUCT_CARD_COLUMNS)}
+      , refreshed_date = NOW()
+""").bindparams(bindparam("product_ids", expanding=True))
+
+_PRODUCT_CARD_SNAPSHOT_QUERY = text(f"""
+    SELECT product_id, {", ".join(PRODUCT_CARD_COLUMNS)}
+      FROM tb_product_card_summary
+     WHERE product_id IN :product_ids
+""").bindparams(bindparam("product_ids", expanding=True))
+
+_EPISODE_PRODUCT_IDS_QUERY = text("""
+    SELECT DISTINCT product_id
+      FROM tb_product_episode
+     WHERE episode_id IN :episode_ids
+""").bindparams(bindparam("episode_ids", expanding=True))
+
+_SWEEP_PRODUCT_IDS_QUERY = text("""
+    SELECT product_id
+      FROM tb_product
+     WHERE product_id > :cursor
+     ORDER BY product_id
+     LIMIT :limit
+""")
+
+
+# 목록 조회용 select 식(get_select_fields_and_joins_for_product 의 라이브 집계 대체)
+PRODUCT_CARD_JOIN = """
+            LEFT JOIN tb_product_card_summary pcs ON pcs.product_id = p.product_id
+"""
+
+
+def _chunks(items: list, size: int = _REFRESH_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def refresh_product_cards(product_ids, db: AsyncSession) -> int:
+    """
+    작품 카드 재계산(upsert)
+
+    Returns:
+        재계산 요청한 작품 수
+    """
+    ids = sorted({int(product_id) for product_id in product_ids if product_id})
+    for chunk in _chunks(ids):
+        await db.execute(_PRODUCT_CARD_REFRESH_QUERY, {"product_ids": chunk})
+    return len(ids)
+
+
+async def check_product_card_consistency(product_ids, db: AsyncSession) -> list[dict]:
+    """
+    read model 과 라이브 join 결과 비교
+
+    Returns:
+        불일치 목록 [{"product_id", "column", "expected", "actual"}]
+        read model row 가 없으면 column 은 None
+    """
+    mismatches = []
+    ids = sorted({int(product_id) for product_id in product_ids if product_id})
+    for chunk in _chunks(ids):
+        live_result = await db.execute(_PRODUCT_CARD_SOURCE_QUERY, {"product_ids": chunk})
+        live_rows = {row["product_id"]: row for row in live_result.mappings().all()}
+        card_result = await db.execute(_PRODUCT_CARD_SNAPSHOT_QUERY, {"product_ids": chunk})
+        card_rows = {row["product_id"]: row for row in card_result.mappings().all()}
+
+        for product_id, live in live_rows.items():
+            card = card_rows.get(product_id)
+            if card is None:
+                mismatches.append(
+                    {"product_id": product_id, "column": None, "expected": None, "actual": None}
+                )
+                continue
+            for column in PRODUCT_CARD_COLUMNS:
+                expected = live.get(column)
+                actual = card.get(column)
+                if expected != actual:
+                    mismatches.append(
+                        {
+                            "product_id": product_id,
+                            "column": column,
+                            "expected": expected,
+                            "actual": actual,
+                        }
+                    )
+    return mismatches
+
+
+def _default_session_factory():
+    from app.rdb import likenovel_db_session
+
+    return likenovel_db_session()
+
+
+class ProductCardRefresher:
+    """
+    dirty 작품 재계산 + 전체 작품 순회(sweep) 루프
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        flush_interval: float = settings.PRODUCT_CARD_REFRESH_INTERVAL_SECONDS,
+        sweep_batch_size: int = settings.PRODUCT_CARD_SWEEP_BATCH_SIZE,
+        enabled: bool = settings.PRODUCT_CARD_READ_MODEL_ENABLED,
+    ):
+        self.session_factory = session_factory or _default_session_factory
+        self.flush_interval = flush_interval
+        self.sweep_batch_size = sweep_batch_size
+        self.enabled = enabled
+        self._dirty_product_ids: set[int] = set()
+        self._dirty_episode_ids: set[int] = set()
+        # 직전 주기에 재계산한 작품(요청 commit 지연 대비 1회 재확인)
+        self._recheck_product_ids: set[int] = set()
+        self._sweep_cursor = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.refreshed_products = 0
+        self.failed_flush_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def metrics(self) -> dict:
+        return {
+            "dirty_products": len(self._dirty_product_ids),
+            "dirty_episodes": len(self._dirty_episode_ids),
+            "refreshed_products": self.refreshed_products,
+            "failed_flush_count": self.failed_flush_count,
+            "sweep_cursor": self._sweep_cursor,
+        }
+
+    def mark_products(self, product_ids) -> None:
+        # 갱신 루프가 없으면(배치/스크립트/테스트) sweep 또는 수동 재계산에 맡김
+        if not self.is_running:
+            return
+        self._dirty_product_ids.update(int(pid) for pid in product_ids if pid)
+
+    def mark_episodes(self, episode_ids) -> None:
+        if not self.is_running:
+            return
+        self._dirty_episode_ids.update(int(eid) for eid in episode_ids if eid)
+
+    def _restore(self, product_ids: set[int], episode_ids: set[int]) -> None:
+        self._dirty_product_ids |= product_ids
+        self._dirty_episode_ids |= episode_ids
+
+    async def start(self) -> None:
+        if not self.enabled or self.is_running:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="product_card_refresh")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush(sweep=False)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[product_card] refresh loop error: {e}")
+
+    async def flush(self, sweep: bool = True) -> int:
+        """
+        dirty 작품(+ 직전 주기 재확인 분, sweep 구간) 재계산
+
+        Returns:
+            재계산한 작품 수
+        """
+        async with self._flush_lock:
+            product_ids = self._dirty_product_ids
+            episode_ids = self._dirty_episode_ids
+            recheck_ids = self._recheck_product_ids
+            self._dirty_product_ids, self._dirty_episode_ids = set(), set()
+            self._recheck_product_ids = set()
+            if not product_ids and not episode_ids and not recheck_ids and not sweep:
+                return 0
+
+            dirty_ids = set(product_ids)
+            try:
+                async with self.session_factory() as session:
+                    for chunk in _chunks(sorted(episode_ids)):
+                        result = await session.execute(
+                            _EPISODE_PRODUCT_IDS_QUERY, {"episode_ids": chunk}
+                        )
+                        dirty_ids.update(row["product_id"] for row in result.mappings().all())
+
+                    sweep_ids = []
+                    if sweep and self.sweep_batch_size > 0:
+                        result = await session.execute(
+                            _SWEEP_PRODUCT_IDS_QUERY,
+                            {"cursor": self._sweep_cursor, "limit": self.sweep_batch_size},
+                        )
+                        sweep_ids = [row["product_id"] for row in result.mappings().all()]
+
+                    refreshed = await refresh_product_cards(
+                        dirty_ids | recheck_ids | set(sweep_ids), session
+                    )
+                    await session.commit()
+            except asyncio.CancelledError:
+                self._restore(product_ids | recheck_ids, episode_ids)
+                raise
+            except Exception as e:
+                self.failed_flush_count += 1
+                logger.error(f"[product_card] refresh failed, retry next interval: {e}")
+                self._restore(product_ids | recheck_ids, episode_ids)
+                return 0
+
+            # 마지막 구간을 지나면 처음부터 다시 순회
+            if sweep and self.sweep_batch_size > 0:
+                self._sweep_cursor = (
+                    sweep_ids[-1] if len(sweep_ids) >= self.sweep_batch_size else 0
+                )
+            # 새로 표시된 작품만 다음 주기에 한 번 더 재계산
+            self._recheck_product_ids |= dirty_ids
+            self.refreshed_products += refreshed
+            return refreshed
+
+
+product_card_refresher = ProductCardRefresher()
+
+
+def mark_product_cards_dirty(*product_ids) -> None:
+    """
+    작품 카드 재계산 요청(회차/키워드/계약 제안/매출/유료 전환/관심 변경 시)
+    """
+    product_card_refresher.mark_products(product_ids)
+
+
+def mark_episode_product_cards_dirty(*episode_ids) -> None:
+    """
+    회차 id 만 알고 있는 변경(판매 시작/예약/삭제 등)의 작품 카드 재계산 요청
+    """
+    product_card_refresher.mark_episodes(episode_ids)
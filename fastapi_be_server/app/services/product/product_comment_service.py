@@ -15,6 +15,7 @@ from app.utils.query import (
     get_user_block_filter,
 )
 from app.utils.common import handle_exceptions
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
 
 from app.config.log_config import service_error_logger
 
@@ -24,6 +25,23 @@ error_logger = service_error_logger(LOGGER_TYPE.LOGGER_FILE_NAME_FOR_SERVICE_ERR
 product comment 도메인 개별 서비스 함수 모음
 """
 
+# 댓글 목록 커서 페이징 정렬(마지막 comment_id 로 동순위 구분)
+# 추천순은 추천 수가 조회 중 바뀔 수 있어 해당 댓글이 앞/뒤 페이지로 이동할 수 있습니다.
+COMMENT_KEYSET_SPECS = {
+    "recent": KeysetSpec(
+        "product_comments_recent",
+        (KeysetOrder("a.created_date"), KeysetOrder("a.comment_id")),
+    ),
+    "recommend": KeysetSpec(
+        "product_comments_recommend",
+        (
+            KeysetOrder("a.count_recommend"),
+            KeysetOrder("a.created_date"),
+            KeysetOrder("a.comment_id"),
+        ),
+    ),
+}
+
 
 async def get_products_product_id_comments(
     product_id: str,
@@ -33,7 +51,14 @@ async def get_products_product_id_comments(
     kc_user_id: str,
     db: AsyncSession,
     episode_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
+    """
+    댓글 목록 조회
+    - cursor 가 None 이면 기존 page/limit(OFFSET) 페이징, 문자열(빈 값은 첫 페이지)이면 커서 페이징
+    - 커서 페이징은 include_total 일 때만 전체 댓글 수를 조회하고 응답에 nextCursor 를 포함합니다.
+    """
     res_data = {}
     product_id_to_int = int(product_id)
     episode_id_to_int = int(episode_id) if episode_id else None
@@ -43,6 +68,22 @@ async def get_products_product_id_comments(
     if order not in ["recommend", "recent"]:
         order = "recent"
 
+    count_total = None
+    next_cursor = None
+    keyset = None
+    if cursor is not None:
+        keyset = parse_keyset_page(
+            COMMENT_KEYSET_SPECS[order],
+            cursor,
+            limit_to_int,
+            scope={"product_id": product_id_to_int, "episode_id": episode_id_to_int},
+            include_total=include_total,
+        )
+    keyset_select = f", {keyset.select_sql}" if keyset else ""
+    keyset_where = keyset.where_sql if keyset else ""
+    keyset_params = keyset.params if keyset else {}
+    page_sql = keyset.limit_sql if keyset else "limit :limit offset :offset"
+
     if kc_user_id:
         res_data = list()
 
@@ -50,47 +91,48 @@ async def get_products_product_id_comments(
             async with db.begin():
                 user_id = await comm_service.get_user_from_kc(kc_user_id, db)
 
-                if episode_id_to_int:
-                    query = text(f"""
-                                     select count(1) as count_total
-                                       from tb_product_comment a
-                                      inner join tb_product_episode c on a.episode_id = c.episode_id
-                                        and c.use_yn = 'Y'
-                                      where a.product_id = :product_id
-                                        and a.episode_id = :episode_id
-                                        and a.use_yn = 'Y'
-                                        and a.open_yn = 'Y'
-                                        {get_user_block_filter()}
-                                     """)
+                if keyset is None or include_total:
+                    if episode_id_to_int:
+                        query = text(f"""
+                                         select count(1) as count_total
+                                           from tb_product_comment a
+                                          inner join tb_product_episode c on a.episode_id = c.episode_id
+                                            and c.use_yn = 'Y'
+                                          where a.product_id = :product_id
+                                            and a.episode_id = :episode_id
+                                            and a.use_yn = 'Y'
+                                            and a.open_yn = 'Y'
+                                            {get_user_block_filter()}
+                                         """)
 
-                    result = await db.execute(
-                        query,
-                        {
-                            "user_id": user_id,
-                            "product_id": product_id_to_int,
-                            "episode_id": episode_id_to_int,
-                        },
-                    )
-                else:
-                    query = text(f"""
-                                     select count(1) as count_total
-                                       from tb_product_comment a
-                                      inner join tb_product_episode c on a.episode_id = c.episode_id
-                                        and c.use_yn = 'Y'
-                                      where a.product_id = :product_id
-                                        and a.use_yn = 'Y'
-                                        and a.open_yn = 'Y'
-                                        {get_user_block_filter()}
-                                     """)
+                        result = await db.execute(
+                            query,
+                            {
+                                "user_id": user_id,
+                                "product_id": product_id_to_int,
+                                "episode_id": episode_id_to_int,
+                            },
+                        )
+                    else:
+                        query = text(f"""
+                                         select count(1) as count_total
+                                           from tb_product_comment a
+                                          inner join tb_product_episode c on a.episode_id = c.episode_id
+                                            and c.use_yn = 'Y'
+                                          where a.product_id = :product_id
+                                            and a.use_yn = 'Y'
+                                            and a.open_yn = 'Y'
+                                            {get_user_block_filter()}
+                                         """)
 
-                    result = await db.execute(
-                        query, {"user_id": user_id, "product_id": product_id_to_int}
-                    )
+                        result = await db.execute(
+                            query, {"user_id": user_id, "product_id": product_id_to_int}
+                        )
 
-                db_rst = result.mappings().all()
+                    db_rst = result.mappings().all()
 
-                if db_rst:
-                    count_total = db_rst[0].get("count_total")
+                    if db_rst:
+                        count_total = db_rst[0].get("count_total")
 
                 if episode_id_to_int:
                     # 회차단위 조회
@@ -133,7 +175,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , e.author_nickname
-                                              , e.author_profile_image_path
+                                              , e.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -146,8 +188,9 @@ async def get_products_product_id_comments(
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
                                             {get_user_block_filter()}
+                                         {keyset_where}
                                          order by a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
                     elif order == "recommend":
                         query = text(f"""
@@ -187,7 +230,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , e.author_nickname
-                                              , e.author_profile_image_path
+                                              , e.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -200,8 +243,9 @@ async def get_products_product_id_comments(
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
                                             {get_user_block_filter()}
+                                         {keyset_where}
                                          order by a.count_recommend desc, a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
 
                     result = await db.execute(
@@ -212,9 +256,12 @@ async def get_products_product_id_comments(
                             "episode_id": episode_id_to_int,
                             "offset": limit_to_int * (page_to_int - 1),
                             "limit": limit_to_int,
+                            **keyset_params,
                         },
                     )
                     db_rst = result.mappings().all()
+                    if keyset is not None:
+                        db_rst, next_cursor = keyset.split(db_rst)
 
                     if db_rst:
                         res_data = [
@@ -261,7 +308,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , e.author_nickname
-                                              , e.author_profile_image_path
+                                              , e.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -273,8 +320,9 @@ async def get_products_product_id_comments(
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
                                             {get_user_block_filter()}
+                                         {keyset_where}
                                          order by a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
                     elif order == "recommend":
                         query = text(f"""
@@ -313,7 +361,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , e.author_nickname
-                                              , e.author_profile_image_path
+                                              , e.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -325,8 +373,9 @@ async def get_products_product_id_comments(
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
                                             {get_user_block_filter()}
+                                         {keyset_where}
                                          order by a.count_recommend desc, a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
 
                     result = await db.execute(
@@ -336,9 +385,12 @@ async def get_products_product_id_comments(
                             "product_id": product_id_to_int,
                             "offset": limit_to_int * (page_to_int - 1),
                             "limit": limit_to_int,
+                            **keyset_params,
                         },
                     )
                     db_rst = result.mappings().all()
+                    if keyset is not None:
+                        db_rst, next_cursor = keyset.split(db_rst)
 
                     if db_rst:
                         res_data = [
@@ -365,42 +417,43 @@ async def get_products_product_id_comments(
 
         try:
             async with db.begin():
-                if episode_id_to_int:
-                    query = text("""
-                                     select count(1) as count_total
-                                       from tb_product_comment a
-                                      inner join tb_product_episode c on a.episode_id = c.episode_id
-                                        and c.use_yn = 'Y'
-                                      where a.product_id = :product_id
-                                        and a.episode_id = :episode_id
-                                        and a.use_yn = 'Y'
-                                        and a.open_yn = 'Y'
-                                     """)
+                if keyset is None or include_total:
+                    if episode_id_to_int:
+                        query = text("""
+                                         select count(1) as count_total
+                                           from tb_product_comment a
+                                          inner join tb_product_episode c on a.episode_id = c.episode_id
+                                            and c.use_yn = 'Y'
+                                          where a.product_id = :product_id
+                                            and a.episode_id = :episode_id
+                                            and a.use_yn = 'Y'
+                                            and a.open_yn = 'Y'
+                                         """)
 
-                    result = await db.execute(
-                        query,
-                        {
-                            "product_id": product_id_to_int,
-                            "episode_id": episode_id_to_int,
-                        },
-                    )
-                else:
-                    query = text("""
-                                     select count(1) as count_total
-                                       from tb_product_comment a
-                                      inner join tb_product_episode c on a.episode_id = c.episode_id
-                                        and c.use_yn = 'Y'
-                                      where a.product_id = :product_id
-                                        and a.use_yn = 'Y'
-                                        and a.open_yn = 'Y'
-                                     """)
+                        result = await db.execute(
+                            query,
+                            {
+                                "product_id": product_id_to_int,
+                                "episode_id": episode_id_to_int,
+                            },
+                        )
+                    else:
+                        query = text("""
+                                         select count(1) as count_total
+                                           from tb_product_comment a
+                                          inner join tb_product_episode c on a.episode_id = c.episode_id
+                                            and c.use_yn = 'Y'
+                                          where a.product_id = :product_id
+                                            and a.use_yn = 'Y'
+                                            and a.open_yn = 'Y'
+                                         """)
 
-                    result = await db.execute(query, {"product_id": product_id_to_int})
+                        result = await db.execute(query, {"product_id": product_id_to_int})
 
-                db_rst = result.mappings().all()
+                    db_rst = result.mappings().all()
 
-                if db_rst:
-                    count_total = db_rst[0].get("count_total")
+                    if db_rst:
+                        count_total = db_rst[0].get("count_total")
 
                 if episode_id_to_int:
                     # 회차단위 조회
@@ -432,7 +485,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , d.author_nickname
-                                              , d.author_profile_image_path
+                                              , d.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -443,8 +496,9 @@ async def get_products_product_id_comments(
                                             and a.episode_id = :episode_id
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
+                                         {keyset_where}
                                          order by a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
                     elif order == "recommend":
                         query = text(f"""
@@ -474,7 +528,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , d.author_nickname
-                                              , d.author_profile_image_path
+                                              , d.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -485,8 +539,9 @@ async def get_products_product_id_comments(
                                             and a.episode_id = :episode_id
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
+                                         {keyset_where}
                                          order by a.count_recommend desc, a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
 
                     result = await db.execute(
@@ -496,9 +551,12 @@ async def get_products_product_id_comments(
                             "episode_id": episode_id_to_int,
                             "offset": limit_to_int * (page_to_int - 1),
                             "limit": limit_to_int,
+                            **keyset_params,
                         },
                     )
                     db_rst = result.mappings().all()
+                    if keyset is not None:
+                        db_rst, next_cursor = keyset.split(db_rst)
 
                     if db_rst:
                         res_data = [
@@ -535,7 +593,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , d.author_nickname
-                                              , d.author_profile_image_path
+                                              , d.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -545,8 +603,9 @@ async def get_products_product_id_comments(
                                           where a.product_id = :product_id
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
+                                         {keyset_where}
                                          order by a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
                     elif order == "recommend":
                         query = text(f"""
@@ -576,7 +635,7 @@ async def get_products_product_id_comments(
                                               , b.role_type as user_role
                                               , concat('댓글 회차 : ', c.episode_no, '화. ', c.episode_title) as comment_episode
                                               , d.author_nickname
-                                              , d.author_profile_image_path
+                                              , d.author_profile_image_path{keyset_select}
                                            from tb_product_comment a
                                           inner join tb_user_profile b on a.user_id = b.user_id
                                             and a.profile_id = b.profile_id
@@ -586,8 +645,9 @@ async def get_products_product_id_comments(
                                           where a.product_id = :product_id
                                             and a.use_yn = 'Y'
                                             and a.open_yn = 'Y'
+                                         {keyset_where}
                                          order by a.count_recommend desc, a.created_date desc, a.comment_id desc
-                                         limit :limit offset :offset
+                                         {page_sql}
                                          """)
 
                     result = await db.execute(
@@ -596,9 +656,12 @@ async def get_products_product_id_comments(
                             "product_id": product_id_to_int,
                             "offset": limit_to_int * (page_to_int - 1),
                             "limit": limit_to_int,
+                            **keyset_params,
                         },
                     )
                     db_rst = result.mappings().all()
+                    if keyset is not None:
+                        db_rst, next_cursor = keyset.split(db_rst)
 
                     if db_rst:
                         res_data = [
@@ -622,6 +685,8 @@ async def get_products_product_id_comments(
             )
 
     res_body = {"data": {"commentTotalCount": count_total, "comments": res_data}}
+    if keyset is not None:
+        res_body["data"]["nextCursor"] = next_cursor
 
     return res_body
 
@@ -651,18 +716,14 @@ async def post_products_comments_episodes_episode_id(
             )
 
         query = text("""
-                         select a.user_id
-                              , b.profile_id
-                           from tb_user a
-                          inner join tb_user_profile b on a.user_id = b.user_id
+                         select b.profile_id
+                           from tb_user_profile b
+                          where b.user_id = :user_id
                             and b.default_yn = 'Y'
-                          where a.kc_user_id = :kc_user_id
-                            and a.use_yn = 'Y'
                          """)
 
-        result = await db.execute(query, {"kc_user_id": kc_user_id})
+        result = await db.execute(query, {"user_id": user_id})
         db_rst = result.mappings().all()
-        user_id = db_rst[0].get("user_id")
         profile_id = db_rst[0].get("profile_id")
 
         # tb_product_comment ins
@@ -841,17 +902,14 @@ async def put_products_comments_comment_id(
                               , a.updated_id = a.user_id
                           where a.comment_id = :comment_id
                             and a.use_yn = 'Y'
-                            and exists (select 1 from tb_user z
-                                         where a.user_id = z.user_id
-                                           and z.kc_user_id = :kc_user_id
-                                           and z.use_yn = 'Y')
+                            and a.user_id = :user_id
                          """)
 
         await db.execute(
             query,
             {
                 "comment_id": comment_id_to_int,
-                "kc_user_id": kc_user_id,
+                "user_id": user_id,
                 "content": req_body.content,
             },
         )
@@ -885,14 +943,11 @@ async def delete_products_comments_comment_id(
                             set a.use_yn = 'N'
                               , a.updated_id = a.user_id
                           where a.comment_id = :comment_id
-                            and exists (select 1 from tb_user z
-                                         where a.user_id = z.user_id
-                                           and z.kc_user_id = :kc_user_id
-                                           and z.use_yn = 'Y')
+                            and a.user_id = :user_id
                          """)
 
         await db.execute(
-            query, {"comment_id": comment_id_to_int, "kc_user_id": kc_user_id}
+            query, {"comment_id": comment_id_to_int, "user_id": user_id}
         )
 
         # count 재계산
@@ -1112,17 +1167,14 @@ async def put_products_comments_comment_id_pin(
                               , a.updated_id = a.user_id
                           where a.comment_id = :comment_id
                             and a.use_yn = 'Y'
-                            and exists (select 1 from tb_user z
-                                         where z.kc_user_id = :kc_user_id
-                                           and z.use_yn = 'Y'
-                                           and exists (select 1 from tb_product x
-                                                        where a.product_id = x.product_id
-                                                          and z.user_id = x.author_id))
+                            and exists (select 1 from tb_product x
+                                         where a.product_id = x.product_id
+                                           and x.author_id = :user_id)
                          """)
 
         result = await db.execute(
             query,
-            {"comment_id": comment_id_to_int, "kc_user_id": kc_user_id},
+            {"comment_id": comment_id_to_int, "user_id": user_id},
         )
 
         # upd된 경우만
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+from app.services.product.rank_generation import rank_generation_tracker
+
+logger = logging.getLogger(__name__)
+
+"""
+작품 목록 전역 결과 캐시 + 사용자별 overlay
+- 목록 쿼리에 섞여 있던 사용자별 값(무료 이용권 수/관심 상태/읽은 회차 수/북마크/최근 읽은 회차)을 분리해
+  전역(사용자 무관) 부분은 user_id 없이 조회하고, 같은 조건의 목록은 사용자 간에 캐시를 공유합니다.
+- 사용자별 값은 화면에 노출되는 product_id 들에 대해 keyed 쿼리 1회(fetch_user_product_overlay)로 조회해
+  Python 에서 병합(apply_user_overlay)합니다. 사용자별 값은 캐시하지 않습니다.
+- 캐시는 프로세스(워커) 단위 TTL LRU 이며 키는 최종 SQL 문자열입니다(필터/정렬/페이지가 모두 포함).
+  작품 변경은 TTL 내에 반영되고, 같은 키의 동시 miss 는 한 번만 조회합니다.
+  랭킹 테이블이 교체되면(랭킹 세대 변경) TTL 과 무관하게 한 번 비웁니다(rank_generation.py).
+"""
+
+# 목록 행에 병합되는 사용자별 값과 비로그인 기본값
+USER_OVERLAY_DEFAULTS = {
+    "freeEpisodeTicketCount": 0,
+    "interestEndDate": None,
+    "interestStatus": "no_interest",
+    "readedEpisodeCount": 0,
+    "bookmarkYn": "N",
+    "recentReadEpisodeId": None,
+    "recentReadEpisodeNo": None,
+}
+
+# get_select_fields_and_joins_for_product 의 사용자별 join 을 product_id 목록으로 좁힌 쿼리
+_USER_OVERLAY_QUERY = text("""
+    SELECT p.product_id
+         , COALESCE(ut.ticket_count, 0) as freeEpisodeTicketCount
+         , DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) as interestEndDate
+         , CASE
+               WHEN readed_count.updated_date IS NULL THEN 'no_interest'
+               WHEN DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) > NOW() THEN
+                   CASE
+                       WHEN DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) <= DATE_ADD(NOW(), INTERVAL 72 HOUR) THEN 'interest_ending_soon'
+                       ELSE 'interest_active'
+                   END
+               ELSE 'no_interest'
+           END as interestStatus
+         , COALESCE(readed_count.count, 0) as readedEpisodeCount
+         , COALESCE(ub.use_yn, 'N') as bookmarkYn
+         , recent_read_episode.episode_id as recentReadEpisodeId
+         , recent_read_episode.episode_no as recentReadEpisodeNo
+      FROM tb_product p
+      LEFT JOIN (
+          SELECT product_id, COUNT(*) as ticket_count
+            FROM tb_user_ticketbook
+           WHERE user_id = :user_id AND ticket_type = 'free' AND use_yn = 'Y'
+             AND (use_expired_date IS NULL OR use_expired_date > NOW())
+             AND product_id IN :product_ids
+           GROUP BY product_id
+      ) ut ON ut.product_id = p.product_id
+      LEFT JOIN (
+          SELECT product_id, COUNT(DISTINCT episode_id) as count, MAX(updated_date) as updated_date
+            FROM tb_user_product_usage
+           WHERE user_id = :user_id AND use_yn = 'Y'
+             AND product_id IN :product_ids
+           GROUP BY product_id
+      ) readed_count ON readed_count.product_id = p.product_id
+      LEFT JOIN tb_user_bookmark ub ON ub.product_id = p.product_id AND ub.user_id = :user_id
+      LEFT JOIN (
+          SELECT DISTINCT
+              upb.product_id,
+              FIRST_VALUE(pe.episode_id) OVER (PARTITION BY upb.product_id ORDER BY upb.updated_date DESC, upb.episode_id DESC) as episode_id,
+              FIRST_VALUE(pe.episode_no) OVER (PARTITION BY upb.product_id ORDER BY upb.updated_date DESC, upb.episode_id DESC) as episode_no
+            FROM tb_user_productbook upb
+           INNER JOIN tb_product_episode pe ON upb.episode_id = pe.episode_id
+           WHERE upb.user_id = :user_id AND upb.use_yn = 'Y'
+             AND upb.product_id IN :product_ids
+      ) recent_read_episode ON recent_read_episode.product_id = p.product_id
+     WHERE p.product_id IN :product_ids
+""").bindparams(bindparam("product_ids", expanding=True))
+
+
+async def fetch_user_product_overlay(
+    user_id: int | None, product_ids, db: AsyncSession
+) -> dict[int, dict]:
+    """
+    노출 작품들의 사용자별 값 조회
+
+    Returns:
+        {product_id: {overlay 컬럼: 값}}, 비로그인이거나 작품이 없으면 빈 dict
+    """
+    ids = sorted({int(product_id) for product_id in product_ids if product_id})
+    if not user_id or user_id < 0 or not ids:
+        return dict()
+
+    result = await db.execute(
+        _USER_OVERLAY_QUERY, {"user_id": user_id, "product_ids": ids}
+    )
+    overlay = dict()
+    for row in result.mappings().all():
+        values = dict(row)
+        overlay[int(values.pop("product_id"))] = values
+    return overlay
+
+
+def apply_user_overlay(rows: list[dict], overlay: dict[int, dict]) -> list[dict]:
+    """
+    전역 목록 행에 사용자별 값 병합(overlay 에 없는 작품은 비로그인 기본값)
+    """
+    merged = []
+    for row in rows:
+        data = dict(row)
+        data.update(USER_OVERLAY_DEFAULTS)
+        data.update(overlay.get(data["productId"], {}))
+        merged.append(data)
+    return merged
+
+
+class ProductListCache:
+    """
+    전역 목록 결과(행 dict 목록) TTL LRU 캐시
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.PRODUCT_LIST_CACHE_TTL_SECONDS,
+        max_entries: int = settings.PRODUCT_LIST_CACHE_MAX_ENTRIES,
+        enabled: bool = settings.PRODUCT_LIST_CACHE_ENABLED,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # key -> (rows, expires_at)
+        self._entries: OrderedDict[str, tuple[list[dict], float]] = OrderedDict()
+        # 같은 키 동시 miss 시 조회 중인 future 공유
+        self._inflight: dict[str, asyncio.Future] = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def get(self, key: str) -> list[dict] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        rows, expires_at = entry
+        if expires_at <= time.time():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return rows
+
+    def put(self, key: str, rows: list[dict]) -> None:
+        self._entries[key] = (rows, time.time() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self) -> None:
+        """저장된 목록만 비움(랭킹 세대 변경 등, 지표는 유지)"""
+        self._entries.clear()
+
+    async def get_or_load(self, key: str, loader) -> list[dict]:
+        """
+        캐시 조회 후 miss 면 loader() 로 조회해 저장
+
+        Returns:
+            행 dict 목록(호출부에서 수정해도 캐시에 영향 없도록 복사본)
+        """
+        if not self.enabled:
+            return [dict(row) for row in await loader()]
+
+        rows = self.get(key)
+        if rows is not None:
+            self.hits += 1
+            return [dict(row) for row in rows]
+
+        self.misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                rows = await asyncio.shield(inflight)
+                return [dict(row) for row in rows]
+            except Exception:
+                # 먼저 조회한 요청이 실패하면 직접 조회
+                pass
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            rows = [dict(row) for row in await loader()]
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e if isinstance(e, Exception) else RuntimeError("cancelled"))
+                # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                self._inflight.pop(key, None)
+
+        self.put(key, rows)
+        future.set_result(rows)
+        return [dict(row) for row in rows]
+
+
+product_list_cache = ProductListCache()
+rank_generation_tracker.subscribe(product_list_cache.invalidate)
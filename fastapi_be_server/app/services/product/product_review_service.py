@@ -14,6 +14,7 @@ import app.schemas.product_review as product_review_schema
 import app.services.common.statistics_service as statistics_service
 import app.services.event.event_reward_service as event_reward_service
 from app.exceptions import CustomResponseException
+from app.utils.identity import resolve_user_id
 from app.utils.query import (
     build_insert_query,
     build_update_query,
@@ -33,18 +34,7 @@ async def product_review_list(
     kc_user_id: str | None, genres: list[str] | None, db: AsyncSession
 ):
     # 1. kc_user_id로 user_id 조회 (로그인 안되어 있으면 None)
-    user_id = None
-    if kc_user_id:
-        user_query = text("""
-            SELECT user_id
-            FROM tb_user
-            WHERE kc_user_id = :kc_user_id AND use_yn = 'Y'
-        """)
-        user_result = await db.execute(user_query, {"kc_user_id": kc_user_id})
-        user_row = user_result.mappings().one_or_none()
-
-        if user_row:
-            user_id = user_row["user_id"]
+    user_id = await resolve_user_id(kc_user_id, db)
 
     # 2. 작품 정보를 가져오기 위한 select fields와 joins 가져오기
     product_fields = get_select_fields_and_joins_for_product(user_id=user_id)
@@ -165,18 +155,7 @@ async def product_review_detail_by_id(
     작품 리뷰(product_review) 상세 조회
     """
     # 1. kc_user_id로 user_id 조회 (로그인 안되어 있으면 None)
-    user_id = None
-    if kc_user_id:
-        user_query = text("""
-            SELECT user_id
-            FROM tb_user
-            WHERE kc_user_id = :kc_user_id AND use_yn = 'Y'
-        """)
-        user_result = await db.execute(user_query, {"kc_user_id": kc_user_id})
-        user_row = user_result.mappings().one_or_none()
-
-        if user_row:
-            user_id = user_row["user_id"]
+    user_id = await resolve_user_id(kc_user_id, db)
 
     # 2. 작품 정보를 가져오기 위한 select fields와 joins 가져오기
     product_fields = get_select_fields_and_joins_for_product(user_id=user_id)
@@ -420,13 +399,14 @@ async def check_like_product_review(review_id: int, kc_user_id: str, db: AsyncSe
     """
     리뷰 좋아요 여부 체크
     """
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
     query = text("""
         SELECT 1
         FROM tb_product_review_like
         WHERE review_id = :review_id
-          AND user_id = (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id)
+          AND user_id = :user_id
     """)
-    result = await db.execute(query, {"review_id": review_id, "kc_user_id": kc_user_id})
+    result = await db.execute(query, {"review_id": review_id, "user_id": user_id})
     row = result.mappings().one_or_none()
     return row is not None
 
@@ -443,13 +423,10 @@ async def add_like_product_review(review_id: int, kc_user_id: str, db: AsyncSess
 
     query = text("""
         INSERT INTO tb_product_review_like (review_id, user_id, created_id)
-        VALUES (
-            :review_id,
-            (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id),
-            -1
-        )
+        VALUES (:review_id, :user_id, -1)
     """)
-    await db.execute(query, {"review_id": review_id, "kc_user_id": kc_user_id})
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
+    await db.execute(query, {"review_id": review_id, "user_id": user_id})
     return {"result": True}
 
 
@@ -466,9 +443,10 @@ async def remove_like_product_review(review_id: int, kc_user_id: str, db: AsyncS
     query = text("""
         DELETE FROM tb_product_review_like
         WHERE review_id = :review_id
-          AND user_id = (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id)
+          AND user_id = :user_id
     """)
-    await db.execute(query, {"review_id": review_id, "kc_user_id": kc_user_id})
+    user_id = await resolve_user_id(kc_user_id, db, active_only=False)
+    await db.execute(query, {"review_id": review_id, "user_id": user_id})
     return {"result": True}
 
 
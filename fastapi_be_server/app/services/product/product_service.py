@@ -11,8 +11,10 @@ from datetime import datetime, timedelta
 from app.const import LOGGER_TYPE, settings, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.utils.time import convert_to_kor_time
+from app.utils.identity import resolve_user_id, resolve_user_identity
 from app.utils.query import get_file_path_sub_query
 from app.utils.response import build_list_response
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
 import app.services.common.comm_service as comm_service
 import app.schemas.product as product_schema
 from app.services.common.cp_link_service import (
@@ -29,6 +31,16 @@ import app.services.common.statistics_service as statistics_service
 import app.schemas.user_giftbook as user_giftbook_schema
 import app.services.user.user_giftbook_service as user_giftbook_service
 import app.services.event.event_reward_service as event_reward_service
+from app.services.product.product_card_service import (
+    PRODUCT_CARD_JOIN,
+    mark_product_cards_dirty,
+)
+from app.services.product.product_list_cache import (
+    apply_user_overlay,
+    fetch_user_product_overlay,
+    product_list_cache,
+)
+from app.services.product.rank_generation import rank_generation_tracker
 
 error_logger = service_error_logger(LOGGER_TYPE.LOGGER_FILE_NAME_FOR_SERVICE_ERROR)
 logger = logging.getLogger(__name__)
@@ -55,6 +67,13 @@ MAIN_RULE_SLOT_DEFINITIONS = [
 
 WEBSOCHAT_CONTEXT_DISABLED_STATUS = "disabled"
 
+# 회차 목록 커서 페이징 정렬 항목(order_by) -> 컬럼, 동순위는 episode_id 로 구분
+EPISODE_KEYSET_ORDER_COLUMNS = {
+    "episodeNo": "e.episode_no",
+    "createdDate": "e.created_date",
+    "openChangedDate": "e.open_changed_date",
+}
+
 
 def _normalize_websochat_enabled_yn(value: str | None) -> str:
     normalized = (value or "Y").upper()
@@ -152,32 +171,15 @@ async def _resolve_current_user_role(kc_user_id: str, db: AsyncSession) -> str:
     kc_user_id 湲곗? ?꾩옱 ?ъ슜????븷??議고쉶?쒕떎.
     admin > partner(cp) > author ?쒖쑝濡?留ㅽ븨?쒕떎.
     """
-    query = text("""
-        select
-            u.role_type,
-            (
-                select apply_type
-                  from tb_user_profile_apply
-                 where user_id = u.user_id
-                   and approval_code = 'accepted'
-                 order by created_date desc
-                 limit 1
-            ) as apply_type
-          from tb_user u
-         where u.kc_user_id = :kc_user_id
-           and u.use_yn = 'Y'
-         limit 1
-    """)
-    result = await db.execute(query, {"kc_user_id": kc_user_id})
-    row = result.mappings().one_or_none()
+    identity = await resolve_user_identity(kc_user_id, db)
 
-    if row is None:
+    if identity is None:
         return "author"
 
-    if row.get("role_type") == "admin":
+    if identity.is_admin:
         return "admin"
 
-    if row.get("apply_type") == "cp":
+    if identity.accepted_apply_type == "cp":
         return "CP"
 
     return "author"
@@ -269,12 +271,158 @@ def _resolve_product_cp_link_update_values(
     return next_contract_yn, requested_cp_user_id if next_contract_yn == "Y" else None
 
 
+# get_select_fields_and_joins_for_product 작품 단위 집계 - 라이브 join
+_PRODUCT_CARD_LIVE_FIELDS = {
+    "keywords": "(SELECT GROUP_CONCAT(DISTINCT sk2.keyword_name SEPARATOR '|') FROM tb_mapped_product_keyword mpk2 LEFT JOIN tb_standard_keyword sk2 ON sk2.keyword_id = mpk2.keyword_id WHERE mpk2.product_id = p.product_id)",
+    "episode_count": "ep_count.episode_count",
+    "open_episode_count": "ep_count.open_episode_count",
+    "open_episode_text_count": "ep_count.open_episode_text_count",
+    "total_interest": "interest_count.total_interest",
+    "interest_sustain_count": "pdcs.current_count_interest_sustain",
+    "interest_loss_count": "pdcs.current_count_interest_loss",
+    "total_sales": "total_sales.total",
+    "offer_count": "offer_stats.offer_count",
+    "offer_id": "pco_latest.offer_id",
+    "offer_date": "pco_latest.offer_date",
+    "offer_price": "pco_latest.offer_price",
+    "settlement_ratio": "pco_latest.settlement_ratio",
+    "offer_decision_state": "pco_latest.decision_state",
+    "paid_state": "ppa_latest.paid_state",
+    "paid_apply_count": "ppa_latest.apply_count",
+    "paid_status_code_raw": "ppa_latest.status_code_raw",
+    "latest_episode_no": "latest_episode.episode_no",
+    "latest_episode_id": "latest_episode.episode_id",
+    "first_episode_id": "first_episode.episode_id",
+}
+_PRODUCT_CARD_LIVE_JOINS = """
+            LEFT JOIN (
+                SELECT product_id, COUNT(*) as episode_count, SUM(episode_text_count) as episode_text_count, SUM(CASE WHEN open_yn = 'Y' THEN 1 ELSE 0 END) as open_episode_count, SUM(CASE WHEN open_yn = 'Y' THEN episode_text_count ELSE 0 END) as open_episode_text_count
+                FROM tb_product_episode
+                WHERE use_yn = 'Y'
+                GROUP BY product_id
+            ) ep_count ON ep_count.product_id = p.product_id
+            LEFT JOIN (
+                SELECT product_id, current_count_interest_sustain, current_count_interest_loss
+                FROM (
+                    SELECT
+                        product_id,
+                        current_count_interest_sustain,
+                        current_count_interest_loss,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY product_id
+                            ORDER BY created_date DESC, id DESC
+                        ) AS rn
+                    FROM tb_batch_daily_product_count_summary
+                ) latest_pdcs
+                WHERE rn = 1
+            ) pdcs ON pdcs.product_id = p.product_id
+            LEFT JOIN (
+                SELECT product_id, COUNT(DISTINCT user_id) as total_interest
+                FROM tb_user_product_usage
+                WHERE use_yn = 'Y'
+                GROUP BY product_id
+            ) interest_count ON interest_count.product_id = p.product_id
+            LEFT JOIN (
+                SELECT poii.product_id, SUM(po.total_price) as total
+                FROM tb_product_order po
+                JOIN tb_product_order_item poi ON po.order_id = poi.order_id
+                JOIN tb_product_order_item_info poii ON poi.item_id = poii.item_info_id
+                WHERE po.cancel_yn = 'N'
+                GROUP BY poii.product_id
+            ) total_sales ON total_sales.product_id = p.product_id
+            LEFT JOIN (
+                SELECT product_id, COUNT(*) as offer_count
+                FROM tb_product_contract_offer
+                WHERE use_yn = 'Y'
+                GROUP BY product_id
+            ) offer_stats ON offer_stats.product_id = p.product_id
+            LEFT JOIN (
+                SELECT DISTINCT
+                    product_id,
+                    FIRST_VALUE(offer_id) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_id,
+                    FIRST_VALUE(offer_date) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_date,
+                    FIRST_VALUE(offer_price) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_price,
+                    FIRST_VALUE(CONCAT('?뺤궛鍮?CP ', offer_profit, ' : ?묎? ', author_profit)) OVER (PARTITION BY product_id ORDER BY created_date DESC) as settlement_ratio,
+                    FIRST_VALUE(CASE WHEN author_accept_yn = 'Y' THEN 'accepted' WHEN author_accept_yn = 'N' THEN 'review' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC) as decision_state
+                FROM tb_product_contract_offer
+                WHERE use_yn = 'Y'
+            ) pco_latest ON pco_latest.product_id = p.product_id
+            LEFT JOIN (
+                SELECT DISTINCT
+                    product_id,
+                    CASE
+                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                            FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                            FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                        ELSE 'review'
+                    END as paid_state,
+                    COUNT(*) OVER (PARTITION BY product_id) as apply_count,
+                    CASE
+                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                            FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                            FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                        ELSE NULL
+                    END as status_code_raw
+                FROM tb_product_paid_apply
+                WHERE use_yn = 'Y'
+            ) ppa_latest ON ppa_latest.product_id = p.product_id
+            LEFT JOIN (
+                SELECT DISTINCT
+                    product_id,
+                    FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_id,
+                    FIRST_VALUE(episode_no) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_no
+                FROM tb_product_episode
+                WHERE open_yn = 'Y' AND use_yn = 'Y'
+            ) latest_episode ON latest_episode.product_id = p.product_id
+            LEFT JOIN (
+                SELECT DISTINCT
+                    product_id,
+                    FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date ASC, episode_id ASC) as episode_id
+                FROM tb_product_episode
+                WHERE open_yn = 'Y' AND use_yn = 'Y'
+            ) first_episode ON first_episode.product_id = p.product_id
+        """
+
+# 작품 카드 read model(product_card_service) 컬럼
+_PRODUCT_CARD_READ_MODEL_FIELDS = {
+    "keywords": "pcs.keywords",
+    "episode_count": "pcs.episode_count",
+    "open_episode_count": "pcs.open_episode_count",
+    "open_episode_text_count": "pcs.open_episode_text_count",
+    "total_interest": "pcs.total_interest",
+    "interest_sustain_count": "pcs.interest_sustain_count",
+    "interest_loss_count": "pcs.interest_loss_count",
+    "total_sales": "pcs.total_sales",
+    "offer_count": "pcs.offer_count",
+    "offer_id": "pcs.offer_id",
+    "offer_date": "pcs.offer_date",
+    "offer_price": "pcs.offer_price",
+    "settlement_ratio": "CONCAT('?뺤궛鍮?CP ', pcs.offer_profit, ' : ?묎? ', pcs.author_profit)",
+    "offer_decision_state": "pcs.offer_decision_state",
+    "paid_state": "pcs.paid_state",
+    "paid_apply_count": "pcs.paid_apply_count",
+    "paid_status_code_raw": "pcs.paid_status_code_raw",
+    "latest_episode_no": "pcs.latest_episode_no",
+    "latest_episode_id": "pcs.latest_episode_id",
+    "first_episode_id": "pcs.first_episode_id",
+}
+
+
 def get_select_fields_and_joins_for_product(
     user_id: int | None = None,
     join_rank: bool = False,
     rank_area_code: str | None = None,
 ):
     join_rank_enabled = join_rank or rank_area_code is not None
+    # 작품 단위 집계는 read model(tb_product_card_summary) 또는 라이브 join 에서 조회
+    if settings.PRODUCT_CARD_READ_MODEL_ENABLED:
+        card, card_joins = _PRODUCT_CARD_READ_MODEL_FIELDS, PRODUCT_CARD_JOIN
+        episode_alias = "pcs"
+    else:
+        card, card_joins = _PRODUCT_CARD_LIVE_FIELDS, _PRODUCT_CARD_LIVE_JOINS
+        episode_alias = "ep_count"
     return {
         "select_fields": ",".join(
             [
@@ -293,7 +441,7 @@ def get_select_fields_and_joins_for_product(
                 "p.created_date as createdDate",
                 "p.updated_date as updatedDate",
                 "p.author_id as authorId",
-                "(SELECT GROUP_CONCAT(DISTINCT sk2.keyword_name SEPARATOR '|') FROM tb_mapped_product_keyword mpk2 LEFT JOIN tb_standard_keyword sk2 ON sk2.keyword_id = mpk2.keyword_id WHERE mpk2.product_id = p.product_id) as keywords",
+                f"{card['keywords']} as keywords",
                 "pg.keyword_name as primary_genre",
                 "sg.keyword_name as sub_genre",
                 "pr.current_rank" if join_rank_enabled else "NULL as current_rank",
@@ -307,9 +455,9 @@ def get_select_fields_and_joins_for_product(
                 "p.count_cp_hit",
                 "p.count_recommend",
                 "p.count_bookmark",
-                "COALESCE(ep_count.episode_count, 0) as hasEpisodeCount",
-                "CASE WHEN p.price_type = 'free' AND p.open_yn = 'Y' AND COALESCE(p.blind_yn, 'N') = 'N' AND COALESCE(p.product_type, 'free') = 'free' AND COALESCE(ep_count.open_episode_count, 0) >= 5 AND COALESCE(ep_count.open_episode_text_count, 0) >= 20000 THEN 'Y' ELSE 'N' END as canApplyForNormal",
-                "COALESCE(ep_count.open_episode_count, 0) as totalOpenEpisodeCount",
+                f"COALESCE({card['episode_count']}, 0) as hasEpisodeCount",
+                f"CASE WHEN p.price_type = 'free' AND p.open_yn = 'Y' AND COALESCE(p.blind_yn, 'N') = 'N' AND COALESCE(p.product_type, 'free') = 'free' AND COALESCE({episode_alias}.open_episode_count, 0) >= 5 AND COALESCE({episode_alias}.open_episode_text_count, 0) >= 20000 THEN 'Y' ELSE 'N' END as canApplyForNormal",
+                f"COALESCE({card['open_episode_count']}, 0) as totalOpenEpisodeCount",
                 "wff.status as waitingForFreeStatus",
                 "p69.status as sixNinePathStatus",
                 # "fff.num_of_ticket_per_person as freeEpisodes",
@@ -319,14 +467,14 @@ def get_select_fields_and_joins_for_product(
                 else "0 as freeEpisodeTicketCount",
                 "aeb.file_path as authorEventLevelBadgeImagePath",
                 "aib.file_path as authorInterestLevelBadgeImagePath",
-                f"(SELECT DATE_ADD(MAX(upu2.updated_date), INTERVAL 3 DAY) FROM tb_user_product_usage upu2 WHERE upu2.product_id = p.product_id AND upu2.user_id = {user_id} AND upu2.use_yn = 'Y') as interestEndDate"
+                "DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) as interestEndDate"
                 if user_id
                 else "NULL as interestEndDate",
-                f"""CASE
-                    WHEN (SELECT DATE_ADD(MAX(upu2.updated_date), INTERVAL 3 DAY) FROM tb_user_product_usage upu2 WHERE upu2.product_id = p.product_id AND upu2.user_id = {user_id} AND upu2.use_yn = 'Y') IS NULL THEN 'no_interest'
-                    WHEN (SELECT DATE_ADD(MAX(upu2.updated_date), INTERVAL 3 DAY) FROM tb_user_product_usage upu2 WHERE upu2.product_id = p.product_id AND upu2.user_id = {user_id} AND upu2.use_yn = 'Y') > NOW() THEN
+                """CASE
+                    WHEN readed_count.updated_date IS NULL THEN 'no_interest'
+                    WHEN DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) > NOW() THEN
                         CASE
-                            WHEN (SELECT DATE_ADD(MAX(upu2.updated_date), INTERVAL 3 DAY) FROM tb_user_product_usage upu2 WHERE upu2.product_id = p.product_id AND upu2.user_id = {user_id} AND upu2.use_yn = 'Y') <= DATE_ADD(NOW(), INTERVAL 72 HOUR) THEN 'interest_ending_soon'
+                            WHEN DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY) <= DATE_ADD(NOW(), INTERVAL 72 HOUR) THEN 'interest_ending_soon'
                             ELSE 'interest_active'
                         END
                     ELSE 'no_interest'
@@ -336,11 +484,11 @@ def get_select_fields_and_joins_for_product(
                 "pti.reading_rate as readThroughRate",
                 "pcv.reading_rate_indicator as readThroughIndicator",
                 "pcv.count_cp_hit_indicator as cpHitIndicator",
-                "COALESCE(interest_count.total_interest, 0) as totalInterestCount",
+                f"COALESCE({card['total_interest']}, 0) as totalInterestCount",
                 "pcv.count_interest_indicator as totalInterestIndicator",
-                "pdcs.current_count_interest_sustain as interestSustainCount",
+                f"{card['interest_sustain_count']} as interestSustainCount",
                 "pcv.count_interest_sustain_indicator as interestSustainIndicator",
-                "pdcs.current_count_interest_loss as interestLossCount",
+                f"{card['interest_loss_count']} as interestLossCount",
                 "pcv.count_interest_loss_indicator as interestLossIndicator",
                 "pcv.count_hit_indicator as hitIndicator",
                 "pcv.count_recommend_indicator as recommendIndicator",
@@ -350,8 +498,8 @@ def get_select_fields_and_joins_for_product(
                 "COALESCE(readed_count.count, 0) as readedEpisodeCount"
                 if user_id
                 else "0 as readedEpisodeCount",
-                "pco_latest.offer_price as advancePayment",
-                "COALESCE(total_sales.total, 0) as totalSales",
+                f"{card['offer_price']} as advancePayment",
+                f"COALESCE({card['total_sales']}, 0) as totalSales",
                 "p.publish_days",
                 "p.last_episode_date",
                 "COALESCE(ub.use_yn, 'N') as bookmarkYn"
@@ -361,18 +509,18 @@ def get_select_fields_and_joins_for_product(
                 "p.contract_yn",
                 "p.status_code",
                 "p.publish_regular_yn",
-                "COALESCE(offer_stats.offer_count, 0) as offerCount",
-                "pco_latest.offer_id as offerId",
-                "pco_latest.offer_date as offerDate",
-                "pco_latest.offer_price as offerAdvancePayment",
-                "pco_latest.settlement_ratio as settlementRatioSnippet",
-                "pco_latest.decision_state as offerDecisionState",
-                "COALESCE(ppa_latest.paid_state, 'not_applied') as convertToPaidState",
-                "CASE WHEN ppa_latest.apply_count = 2 OR (ppa_latest.apply_count = 1 AND ppa_latest.status_code_raw != 'denied') THEN 'N' ELSE 'Y' END as canApplyForPaid",
+                f"COALESCE({card['offer_count']}, 0) as offerCount",
+                f"{card['offer_id']} as offerId",
+                f"{card['offer_date']} as offerDate",
+                f"{card['offer_price']} as offerAdvancePayment",
+                f"{card['settlement_ratio']} as settlementRatioSnippet",
+                f"{card['offer_decision_state']} as offerDecisionState",
+                f"COALESCE({card['paid_state']}, 'not_applied') as convertToPaidState",
+                f"CASE WHEN {card['paid_apply_count']} = 2 OR ({card['paid_apply_count']} = 1 AND {card['paid_status_code_raw']} != 'denied') THEN 'N' ELSE 'Y' END as canApplyForPaid",
                 "(5 - COALESCE(notification_log.weekly_notification_count, 0)) as remainingNotificationCount",
-                "latest_episode.episode_no as latestEpisodeNo",
-                "latest_episode.episode_id as latestEpisodeId",
-                "first_episode.episode_id as firstEpisodeId",
+                f"{card['latest_episode_no']} as latestEpisodeNo",
+                f"{card['latest_episode_id']} as latestEpisodeId",
+                f"{card['first_episode_id']} as firstEpisodeId",
                 "recent_read_episode.episode_id as recentReadEpisodeId"
                 if user_id
                 else "NULL as recentReadEpisodeId",
@@ -413,12 +561,6 @@ def get_select_fields_and_joins_for_product(
                 JOIN tb_common_file_item cfi ON cf.file_group_id = cfi.file_group_id
                 WHERE cf.use_yn = 'Y' AND cfi.use_yn = 'Y' AND cf.group_type = 'cover'
             ) cf ON cf.file_group_id = p.thumbnail_file_id
-            LEFT JOIN (
-                SELECT product_id, COUNT(*) as episode_count, SUM(episode_text_count) as episode_text_count, SUM(CASE WHEN open_yn = 'Y' THEN 1 ELSE 0 END) as open_episode_count, SUM(CASE WHEN open_yn = 'Y' THEN episode_text_count ELSE 0 END) as open_episode_text_count
-                FROM tb_product_episode
-                WHERE use_yn = 'Y'
-                GROUP BY product_id
-            ) ep_count ON ep_count.product_id = p.product_id
             """
         + "LEFT JOIN tb_applied_promotion wff ON wff.product_id = p.product_id AND wff.type = 'waiting-for-free' AND wff.status = 'ing' AND DATE(wff.start_date) <= CURDATE() AND (wff.end_date IS NULL OR DATE(wff.end_date) >= CURDATE())"
         + "LEFT JOIN tb_applied_promotion p69 ON p69.product_id = p.product_id AND p69.type = '6-9-path' AND p69.status = 'ing' AND DATE(p69.start_date) <= CURDATE() AND (p69.end_date IS NULL OR DATE(p69.end_date) >= CURDATE())"
@@ -466,73 +608,9 @@ def get_select_fields_and_joins_for_product(
             ) aib ON aib.user_id = p.author_id
             LEFT JOIN tb_product_trend_index pti ON pti.product_id = p.product_id
             LEFT JOIN tb_product_count_variance pcv ON pcv.product_id = p.product_id
-            LEFT JOIN (
-                SELECT product_id, current_count_interest_sustain, current_count_interest_loss
-                FROM (
-                    SELECT
-                        product_id,
-                        current_count_interest_sustain,
-                        current_count_interest_loss,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY product_id
-                            ORDER BY created_date DESC, id DESC
-                        ) AS rn
-                    FROM tb_batch_daily_product_count_summary
-                ) latest_pdcs
-                WHERE rn = 1
-            ) pdcs ON pdcs.product_id = p.product_id
-            LEFT JOIN (
-                SELECT product_id, COUNT(DISTINCT user_id) as total_interest
-                FROM tb_user_product_usage
-                WHERE use_yn = 'Y'
-                GROUP BY product_id
-            ) interest_count ON interest_count.product_id = p.product_id
-            LEFT JOIN (
-                SELECT poii.product_id, SUM(po.total_price) as total
-                FROM tb_product_order po
-                JOIN tb_product_order_item poi ON po.order_id = poi.order_id
-                JOIN tb_product_order_item_info poii ON poi.item_id = poii.item_info_id
-                WHERE po.cancel_yn = 'N'
-                GROUP BY poii.product_id
-            ) total_sales ON total_sales.product_id = p.product_id
-            LEFT JOIN (
-                SELECT product_id, COUNT(*) as offer_count
-                FROM tb_product_contract_offer
-                WHERE use_yn = 'Y'
-                GROUP BY product_id
-            ) offer_stats ON offer_stats.product_id = p.product_id
-            LEFT JOIN (
-                SELECT DISTINCT
-                    product_id,
-                    FIRST_VALUE(offer_id) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_id,
-                    FIRST_VALUE(offer_date) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_date,
-                    FIRST_VALUE(offer_price) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_price,
-                    FIRST_VALUE(CONCAT('?뺤궛鍮?CP ', offer_profit, ' : ?묎? ', author_profit)) OVER (PARTITION BY product_id ORDER BY created_date DESC) as settlement_ratio,
-                    FIRST_VALUE(CASE WHEN author_accept_yn = 'Y' THEN 'accepted' WHEN author_accept_yn = 'N' THEN 'review' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC) as decision_state
-                FROM tb_product_contract_offer
-                WHERE use_yn = 'Y'
-            ) pco_latest ON pco_latest.product_id = p.product_id
-            LEFT JOIN (
-                SELECT DISTINCT
-                    product_id,
-                    CASE
-                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
-                            FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date ASC)
-                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
-                            FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC)
-                        ELSE 'review'
-                    END as paid_state,
-                    COUNT(*) OVER (PARTITION BY product_id) as apply_count,
-                    CASE
-                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
-                            FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date ASC)
-                        WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
-                            FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date DESC)
-                        ELSE NULL
-                    END as status_code_raw
-                FROM tb_product_paid_apply
-                WHERE use_yn = 'Y'
-            ) ppa_latest ON ppa_latest.product_id = p.product_id
+            """
+        + card_joins
+        + """
             LEFT JOIN (
                 SELECT product_id, COUNT(*) as weekly_notification_count
                 FROM tb_user_notification_log
@@ -540,21 +618,6 @@ def get_select_fields_and_joins_for_product(
                   AND created_date < DATE_ADD(DATE_SUB(CURDATE(), INTERVAL WEEKDAY(CURDATE()) DAY), INTERVAL 7 DAY)
                 GROUP BY product_id
             ) notification_log ON notification_log.product_id = p.product_id
-            LEFT JOIN (
-                SELECT DISTINCT
-                    product_id,
-                    FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_id,
-                    FIRST_VALUE(episode_no) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_no
-                FROM tb_product_episode
-                WHERE open_yn = 'Y' AND use_yn = 'Y'
-            ) latest_episode ON latest_episode.product_id = p.product_id
-            LEFT JOIN (
-                SELECT DISTINCT
-                    product_id,
-                    FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date ASC, episode_id ASC) as episode_id
-                FROM tb_product_episode
-                WHERE open_yn = 'Y' AND use_yn = 'Y'
-            ) first_episode ON first_episode.product_id = p.product_id
         """
         + (
             f"""
@@ -1025,10 +1088,7 @@ def convert_home_card_product_data(row: RowMapping):
 
 
 async def get_user_id(kc_user_id: str, db: AsyncSession):
-    query = text("select user_id from tb_user where kc_user_id = :kc_user_id")
-    result = await db.execute(query, {"kc_user_id": kc_user_id})
-    row = result.mappings().first()
-    return int(row.get("user_id")) if row else None
+    return await resolve_user_id(kc_user_id, db, active_only=False)
 
 
 async def save_product_hit_log(product_id: int, db: AsyncSession):
@@ -1050,6 +1110,20 @@ async def save_product_hit_log(product_id: int, db: AsyncSession):
         # 濡쒓렇 ????ㅽ뙣??硫붿씤 濡쒖쭅???곹뼢??二쇱? ?딅룄濡??덉쇅瑜?臾댁떆
 
 
+async def _fetch_global_product_rows(query, db: AsyncSession) -> list[dict]:
+    """
+    사용자 무관 목록 조회(같은 SQL 은 product_list_cache 공유)
+    """
+
+    async def _load():
+        result = await db.execute(query, {})
+        return result.mappings().all()
+
+    # 랭킹 테이블이 교체됐으면 캐시된 목록을 먼저 비움
+    await rank_generation_tracker.refresh(db)
+    return await product_list_cache.get_or_load(str(query), _load)
+
+
 async def products_of_managed(
     division: str,
     area: str,
@@ -1088,8 +1162,9 @@ async def products_of_managed(
         order_by = "pr.current_rank ASC"
         rank_area_code = rule["rank_area_code"]
 
+    # 전역(사용자 무관) 목록은 캐시를 공유하고 사용자별 값은 노출 작품만 따로 조회
     query_parts = get_select_fields_and_joins_for_home_card_product(
-        user_id=user_id, rank_area_code=rank_area_code
+        user_id=None, rank_area_code=rank_area_code
     )
     query = text(f"""
         SELECT {query_parts["select_fields"]}, "{resolved_area}" as area
@@ -1099,11 +1174,16 @@ async def products_of_managed(
         ORDER BY {order_by}
         {f"LIMIT {limit}"}
     """)
-    result = await db.execute(query, {})
-    rows = result.mappings().all()
+    rows = await _fetch_global_product_rows(query, db)
+    overlay = await fetch_user_product_overlay(
+        user_id, [row["productId"] for row in rows], db
+    )
 
     res_body = dict()
-    res_data = [convert_home_card_product_data(row) for row in rows]
+    res_data = [
+        convert_home_card_product_data(row)
+        for row in apply_user_overlay(rows, overlay)
+    ]
 
     # 鍮꾧났媛??묓뭹 ?꾪꽣留????쒖쐞 ?ы븷??(freeTop, paidTop??寃쎌슦)
     if join_rank or rank_area_code is not None:
@@ -1224,8 +1304,9 @@ async def products_all(
                 filter_option.append("p.ratings_code = 'all'")
         # 19???댁긽?닿퀬 adult_yn='Y'??寃쎌슦: ?꾪꽣 異붽? ?덊븿 (?깆씤 ?묓뭹 ?ы븿)
 
+    # 전역(사용자 무관) 목록은 캐시를 공유하고 사용자별 값은 노출 작품만 따로 조회
     query_parts = get_select_fields_and_joins_for_product(
-        user_id=user_id, join_rank=False
+        user_id=None, join_rank=False
     )
     filter_option.append("p.open_yn = 'Y'")
     query = text(f"""
@@ -1236,11 +1317,15 @@ async def products_all(
         ORDER BY p.last_episode_date DESC, p.product_id DESC
         LIMIT {limit} OFFSET {(page - 1) * limit}
     """)
-    result = await db.execute(query, {})
-    rows = result.mappings().all()
+    rows = await _fetch_global_product_rows(query, db)
+    overlay = await fetch_user_product_overlay(
+        user_id, [row["productId"] for row in rows], db
+    )
 
     res_body = dict()
-    res_body["data"] = [convert_product_data(row) for row in rows]
+    res_body["data"] = [
+        convert_product_data(row) for row in apply_user_overlay(rows, overlay)
+    ]
 
     await statistics_service.insert_site_statistics_logs(
         db=db, types=["visit", "page_view"], user_id=user_id
@@ -1257,6 +1342,8 @@ async def episodes_by_product_id(
     order_by: str,
     order_dir: str,
     db: AsyncSession,
+    cursor: str | None = None,
+    include_total: bool = False,
 ):
     """
     ?묓뭹 - ?먰뵾?뚮뱶 紐⑸줉
@@ -1266,6 +1353,31 @@ async def episodes_by_product_id(
     order_by = order_by if order_by else "episodeNo"
     order_dir = order_dir if order_dir else settings.PAGINATION_ORDER_DIRECTION_ASC
 
+    # cursor 가 None 이 아니면 커서 페이징(빈 값은 첫 페이지)
+    keyset = None
+    if cursor is not None:
+        if order_by not in EPISODE_KEYSET_ORDER_COLUMNS:
+            order_by = "episodeNo"
+        desc = order_dir.lower() == settings.PAGINATION_ORDER_DIRECTION_DESC
+        keyset = parse_keyset_page(
+            KeysetSpec(
+                f"product_episodes_{order_by}",
+                (
+                    KeysetOrder(EPISODE_KEYSET_ORDER_COLUMNS[order_by], desc),
+                    KeysetOrder("e.episode_id", desc),
+                ),
+            ),
+            cursor,
+            limit,
+            scope={"product_id": int(product_id), "desc": desc},
+        )
+        limit = keyset.limit
+    keyset_select = f", {keyset.select_sql}" if keyset else ""
+    keyset_where = keyset.where_sql if keyset else ""
+    order_sql = keyset.order_by_sql if keyset else f"{order_by} {order_dir}"
+    limit_sql = keyset.limit_sql if keyset else f"limit {limit} offset {(page - 1) * limit}"
+    next_cursor = None
+
     user_id = await get_user_id(kc_user_id, db)
 
     try:
@@ -1313,6 +1425,7 @@ async def episodes_by_product_id(
                     ) and user_id = :user_id and own_type = 'rental' and use_yn = 'Y'
                     order by id desc limit 1
                 ) as rentalRemaining
+                {keyset_select}
             from tb_product_episode e where product_id = :product_id and e.use_yn = 'Y'
                 and (
                     e.open_yn = 'Y'
@@ -1327,12 +1440,23 @@ async def episodes_by_product_id(
                           AND (pb.rental_expired_date IS NULL OR pb.rental_expired_date > NOW())
                     )
                 )
-            order by {order_by} {order_dir}
-            limit {limit} offset {(page - 1) * limit}
+                {keyset_where}
+            order by {order_sql}
+            {limit_sql}
         """)
-        result = await db.execute(query, {"user_id": user_id, "product_id": product_id})
+        result = await db.execute(
+            query,
+            {
+                "user_id": user_id,
+                "product_id": product_id,
+                **(keyset.params if keyset else {}),
+            },
+        )
         rows = result.mappings().all()
-        episodes = [dict(row) for row in rows]
+        if keyset is not None:
+            episodes, next_cursor = keyset.split(rows)
+        else:
+            episodes = [dict(row) for row in rows]
 
         # rentalRemaining JSON ?뚯떛
         for episode in episodes:
@@ -1376,8 +1500,10 @@ async def episodes_by_product_id(
                     )
                 )
         """)
-        count_result = await db.execute(count_query, {"product_id": product_id, "user_id": user_id})
-        episodeTotalCount = count_result.scalar()
+        episodeTotalCount = None
+        if keyset is None or include_total:
+            count_result = await db.execute(count_query, {"product_id": product_id, "user_id": user_id})
+            episodeTotalCount = count_result.scalar()
 
         # ?ъ슜???쎌? 理쒖쥌 ?뚯감
         max_episode_no = 0
@@ -1464,6 +1590,8 @@ async def episodes_by_product_id(
                 "limit": limit,
             },
         }
+        if keyset is not None:
+            res_body["data"]["pagination"]["nextCursor"] = next_cursor
 
         return res_body
 
@@ -3211,11 +3339,14 @@ async def post_products(
                     # 일반연재 자격 확인: 기존 승급 작품이 있는지 체크
                     qual_query = text("""
                         SELECT 1 FROM tb_product
-                        WHERE user_id = (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id AND use_yn = 'Y')
+                        WHERE user_id = :user_id
                           AND product_type = 'normal'
                         LIMIT 1
                     """)
-                    qual_result = await db.execute(qual_query, {"kc_user_id": kc_user_id})
+                    qual_result = await db.execute(
+                        qual_query,
+                        {"user_id": user_id},
+                    )
                     product_type = "normal" if qual_result.scalar() else None
                 else:
                     product_type = None
@@ -3229,16 +3360,13 @@ async def post_products(
 
                 query = text("""
                                  insert into tb_product (title, price_type, product_type, status_code, ratings_code, synopsis_text, user_id, author_id, author_name, illustrator_name, publish_regular_yn, publish_days, thumbnail_file_id, primary_genre_id, sub_genre_id, open_yn, blind_yn, monopoly_yn, contract_yn, ai_content_service_enabled_yn, ai_external_promotion_yn, cp_user_id, series_regular_price, single_regular_price, single_rental_price, created_id, updated_id)
-                                 select :title, :price_type, :product_type, :status_code, :ratings_code, :synopsis_text, user_id, :author_id, :author_name, :illustrator_name, :publish_regular_yn, :publish_days, :thumbnail_file_id, :primary_genre_id, :sub_genre_id, :open_yn, :blind_yn, :monopoly_yn, :contract_yn, :ai_content_service_enabled_yn, :ai_external_promotion_yn, :cp_user_id, :series_regular_price, :single_regular_price, :single_rental_price, :created_id, :updated_id
-                                   from tb_user
-                                  where kc_user_id = :kc_user_id
-                                    and use_yn = 'Y'
+                                 values (:title, :price_type, :product_type, :status_code, :ratings_code, :synopsis_text, :user_id, :author_id, :author_name, :illustrator_name, :publish_regular_yn, :publish_days, :thumbnail_file_id, :primary_genre_id, :sub_genre_id, :open_yn, :blind_yn, :monopoly_yn, :contract_yn, :ai_content_service_enabled_yn, :ai_external_promotion_yn, :cp_user_id, :series_regular_price, :single_regular_price, :single_rental_price, :created_id, :updated_id)
                                  """)
 
                 await db.execute(
                     query,
                     {
-                        "kc_user_id": kc_user_id,
+                        "user_id": user_id,
                         "price_type": created_price_type,
                         "product_type": product_type,
                         "thumbnail_file_id": req_body.cover_image_file_id
@@ -3396,6 +3524,7 @@ async def post_products(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(res_data.get("product_id"))
     res_body = {"data": res_data}
 
     return res_body
@@ -3792,16 +3921,13 @@ async def put_products_product_id(
                                           , a.paid_episode_no = :paid_episode_no
                                           , a.updated_id = a.user_id
                                       where a.product_id = :product_id
-                                        and exists (select 1 from tb_user z
-                                                     where z.kc_user_id = :kc_user_id
-                                                       and z.use_yn = 'Y'
-                                                       and z.user_id = a.user_id)
+                                        and a.user_id = :user_id
                                      """)
 
                     result = await db.execute(
                         query,
                         {
-                            "kc_user_id": kc_user_id,
+                            "user_id": user_id,
                             "product_id": product_id_to_int,
                             "status_code": req_body.ongoing_state,
                             "title": req_body.title,
@@ -3869,16 +3995,13 @@ async def put_products_product_id(
                                           , a.paid_episode_no = :paid_episode_no
                                           , a.updated_id = a.user_id
                                       where a.product_id = :product_id
-                                        and exists (select 1 from tb_user z
-                                                     where z.kc_user_id = :kc_user_id
-                                                       and z.use_yn = 'Y'
-                                                       and z.user_id = a.user_id)
+                                        and a.user_id = :user_id
                                      """)
 
                     result = await db.execute(
                         query,
                         {
-                            "kc_user_id": kc_user_id,
+                            "user_id": user_id,
                             "product_id": product_id_to_int,
                             "thumbnail_file_id": req_body.cover_image_file_id,
                             "status_code": req_body.ongoing_state,
@@ -4031,6 +4154,8 @@ async def put_products_product_id(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(product_id_to_int)
+
     return
 
 
@@ -4225,6 +4350,7 @@ async def put_products_product_id_conversion(
             message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
         )
 
+    mark_product_cards_dirty(product_id_to_int)
     res_body = {"data": res_data}
 
     return res_body
@@ -4275,15 +4401,13 @@ async def get_user_interest_drop_products(kc_user_id: str, db: AsyncSession):
                     {query_parts["joins"]}
                     where p.product_id IN (
                         select b.product_id
-                        from tb_user a
-                        inner join tb_user_product_usage b on b.user_id = a.user_id
-                        where a.kc_user_id = :kc_user_id
-                            and a.use_yn = 'Y'
+                        from tb_user_product_usage b
+                        where b.user_id = :user_id
                             and b.use_yn = 'Y'
                         order by b.updated_date desc
                     ) AND p.open_yn = 'Y'
                 """)
-                result = await db.execute(query, {"kc_user_id": kc_user_id})
+                result = await db.execute(query, {"user_id": user_id or 0})
                 rows = result.mappings().all()
                 res_data = [convert_product_data(row) for row in rows]
 
@@ -4411,18 +4535,17 @@ async def get_user_interest_drop_products_soon(
     if kc_user_id:
         try:
             async with db.begin():
+                user_id = await resolve_user_id(kc_user_id, db)
                 query = text("""
                                  select b.product_id
-                                 from tb_user a
-                                    inner join tb_user_product_usage b on b.user_id = a.user_id
-                                 where a.kc_user_id = :kc_user_id
-                                    and a.use_yn = 'Y'
+                                 from tb_user_product_usage b
+                                 where b.user_id = :user_id
                                     and b.use_yn = 'Y'
                                     and b.updated_date > now() - interval 3 day
                                  order by b.updated_date desc
                                  """)
 
-                result = await db.execute(query, {"kc_user_id": kc_user_id})
+                result = await db.execute(query, {"user_id": user_id or 0})
                 db_rst = result.mappings().all()
 
                 if len(db_rst) > 0:
@@ -4438,8 +4561,6 @@ async def get_user_interest_drop_products_soon(
                     if adult_yn == "N":
                         filter_option.append("p.ratings_code = 'all'")
 
-                    user_id = await get_user_id(kc_user_id, db)
-
                     query_parts = get_select_fields_and_joins_for_product(
                         user_id=user_id, join_rank=False
                     )
@@ -4936,6 +5057,7 @@ async def revive_product_interest(product_id: str, kc_user_id: str, db: AsyncSes
             "id": usage_row["id"],
         },
     )
+    mark_product_cards_dirty(product_id_to_int)
 
     # ?덈줈??愿??醫낅즺??怨꾩궛 (?꾩옱 ?쒓컙 + 3??
     from datetime import timedelta
@@ -5159,11 +5281,14 @@ async def get_direct_recommend_products(
 
 async def get_can_create_normal(kc_user_id: str, db: AsyncSession):
     """일반연재 자격 확인: 기존 승급된 작품이 1개 이상 있으면 True"""
+    user_id = await resolve_user_id(kc_user_id, db)
+    if user_id is None:
+        return {"can_create_normal": False}
     query = text("""
         SELECT 1 FROM tb_product
-        WHERE user_id = (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id AND use_yn = 'Y')
+        WHERE user_id = :user_id
           AND product_type = 'normal'
         LIMIT 1
     """)
-    result = await db.execute(query, {"kc_user_id": kc_user_id})
+    result = await db.execute(query, {"user_id": user_id})
     return {"can_create_normal": result.scalar() is not None}
@@ -0,0 +1,101 @@
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+"""
+랭킹 세대(generation) 추적
+- service_reset_hourly_batch.sql 은 랭킹을 shadow 테이블에 재계산해 RENAME TABLE 로 교체한 뒤
+  tb_batch_generation 의 product_rank 세대를 1 증가시킵니다.
+- RankGenerationTracker 는 check_interval 마다 세대를 한 번 읽고, 이전에 본 세대와 다르면
+  등록된 무효화 콜백(랭킹을 포함한 목록 캐시 clear 등)을 세대당 한 번만 호출합니다.
+- 프로세스 시작 후 처음 읽은 세대는 기준값으로만 기록합니다(무효화 없음).
+- 세대 조회가 실패하면 기존 값을 유지하고 캐시는 TTL 로만 만료됩니다.
+"""
+
+RANK_GENERATION_KEY = "product_rank"
+
+_GENERATION_QUERY = text("""
+    SELECT generation
+      FROM tb_batch_generation
+     WHERE generation_key = :generation_key
+""")
+
+
+class RankGenerationTracker:
+    def __init__(
+        self,
+        generation_key: str = RANK_GENERATION_KEY,
+        check_interval: float = settings.RANK_GENERATION_CHECK_SECONDS,
+    ):
+        self.generation_key = generation_key
+        self.check_interval = check_interval
+        self.generation: int | None = None
+        self.invalidation_count = 0
+        self.failed_check_count = 0
+        self._checked_at = 0.0
+        self._listeners = []
+
+    def subscribe(self, callback) -> None:
+        """세대가 바뀔 때 호출할 콜백(인자 없음) 등록"""
+        self._listeners.append(callback)
+
+    def metrics(self) -> dict:
+        return {
+            "generation": self.generation,
+            "invalidations": self.invalidation_count,
+            "failed_checks": self.failed_check_count,
+        }
+
+    def observe(self, generation: int | None) -> bool:
+        """
+        조회한 세대 반영
+
+        Returns:
+            무효화 콜백을 호출했으면 True
+        """
+        if generation is None or generation == self.generation:
+            return False
+        previous, self.generation = self.generation, generation
+        if previous is None:
+            return False
+
+        self.invalidation_count += 1
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"rank generation listener failed: {e}")
+        logger.info(f"rank generation changed: {previous} -> {generation}")
+        return True
+
+    async def refresh(self, db: AsyncSession, force: bool = False) -> int | None:
+        """
+        check_interval 이 지났으면 세대를 조회해 반영하고 현재 세대 반환
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return self.generation
+        # 같은 주기에 동시 요청이 몰려도 한 요청만 조회
+        self._checked_at = now
+
+        try:
+            result = await db.execute(
+                _GENERATION_QUERY, {"generation_key": self.generation_key}
+            )
+            generation = result.scalar()
+        except Exception as e:
+            self.failed_check_count += 1
+            logger.warning(f"rank generation check failed: {e}")
+            return self.generation
+
+        self.observe(int(generation) if generation is not None else None)
+        return self.generation
+
+
+rank_generation_tracker = RankGenerationTracker()
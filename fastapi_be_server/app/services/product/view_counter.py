@@ -0,0 +1,263 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import text
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+"""
+에피소드 뷰어 조회수 write-behind 집계
+- 뷰어 조회마다 실행되던 tb_product_episode / tb_product count_hit 증가와
+  tb_product_hit_log upsert 를 메모리에서 (product_id, episode_id, 시간) 단위로 모아
+  flush 주기마다 테이블별 bulk update/upsert 1회로 반영합니다.
+- 증가분(delta)만 더하므로 gunicorn 워커가 여러 개여도 합계는 정확합니다.
+- 행 잠금 순서를 고정(id 오름차순)하여 워커 간 flush 가 교착되지 않도록 합니다.
+- flush 실패 시 증가분을 메모리에 되돌려 다음 주기에 재시도합니다.
+  프로세스 비정상 종료 시 유실은 워커당 최대 flush 주기(또는 max_keys 도달 전) 분량으로 제한되며,
+  정상 종료 시에는 lifespan 에서 stop() 으로 모두 반영합니다.
+- 집계기가 실행 중이 아닐 때(배치/스크립트/테스트)는 호출부가 기존처럼 직접 update 합니다.
+"""
+
+# bulk 쿼리 1회당 최대 row 수
+_FLUSH_CHUNK_SIZE = 500
+
+
+@dataclass
+class ViewCount:
+    episode_hits: int = 0
+    product_hits: int = 0
+    cp_hits: int = 0
+
+
+def _hour_bucket(now: datetime | None = None) -> datetime:
+    # tb_product_hit_log.hit_date(CURDATE()) 와 같은 KST 기준 날짜로 귀속
+    if now is None:
+        now = datetime.now(ZoneInfo(settings.KOREA_TIMEZONE)).replace(tzinfo=None)
+    return now.replace(minute=0, second=0, microsecond=0)
+
+
+def _derived_table(columns: tuple[str, ...], rows: list[tuple]):
+    """
+    `select :a_0 as a, :b_0 as b union all select :a_1, :b_1 ...` 파생 테이블 생성
+    """
+    selects = []
+    params = dict()
+    for idx, row in enumerate(rows):
+        items = []
+        for column, value in zip(columns, row):
+            key = f"{column}_{idx}"
+            params[key] = value
+            items.append(f":{key} as {column}" if idx == 0 else f":{key}")
+        selects.append(f"select {', '.join(items)}")
+    return " union all ".join(selects), params
+
+
+def build_episode_hit_query(rows: list[tuple[int, int]]):
+    derived, params = _derived_table(("episode_id", "hit"), rows)
+    query = text(f"""
+        update tb_product_episode e
+          join ({derived}) d on d.episode_id = e.episode_id
+           set e.count_hit = e.count_hit + d.hit
+    """)
+    return query, params
+
+
+def build_product_hit_query(rows: list[tuple[int, int, int]]):
+    derived, params = _derived_table(("product_id", "hit", "cp_hit"), rows)
+    query = text(f"""
+        update tb_product p
+          join ({derived}) d on d.product_id = p.product_id
+           set p.count_hit = p.count_hit + d.hit
+             , p.count_cp_hit = p.count_cp_hit + d.cp_hit
+    """)
+    return query, params
+
+
+def build_product_hit_log_query(rows: list[tuple[int, object, int]]):
+    values = []
+    params = dict()
+    for idx, (product_id, hit_date, hit_count) in enumerate(rows):
+        values.append(f"(:product_id_{idx}, :hit_date_{idx}, :hit_count_{idx})")
+        params[f"product_id_{idx}"] = product_id
+        params[f"hit_date_{idx}"] = hit_date
+        params[f"hit_count_{idx}"] = hit_count
+    query = text(f"""
+        insert into tb_product_hit_log (product_id, hit_date, hit_count)
+        values {', '.join(values)}
+        on duplicate key update hit_count = hit_count + values(hit_count)
+    """)
+    return query, params
+
+
+def _chunks(rows: list, size: int = _FLUSH_CHUNK_SIZE):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _default_session_factory():
+    from app.rdb import likenovel_db_session
+
+    return likenovel_db_session()
+
+
+class EpisodeViewCounter:
+    """
+    (product_id, episode_id, 시간) 단위 조회수 증가분 집계기
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        flush_interval: float = settings.VIEW_COUNTER_FLUSH_INTERVAL_SECONDS,
+        max_keys: int = settings.VIEW_COUNTER_MAX_KEYS,
+        enabled: bool = settings.VIEW_COUNTER_ENABLED,
+    ):
+        self.session_factory = session_factory or _default_session_factory
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self.enabled = enabled
+        self._counts: dict[tuple[int, int, datetime], ViewCount] = defaultdict(ViewCount)
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self.flushed_views = 0
+        self.flush_count = 0
+        self.failed_flush_count = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending_keys(self) -> int:
+        return len(self._counts)
+
+    def metrics(self) -> dict:
+        return {
+            "pending_keys": len(self._counts),
+            "flushed_views": self.flushed_views,
+            "flush_count": self.flush_count,
+            "failed_flush_count": self.failed_flush_count,
+        }
+
+    async def start(self) -> None:
+        if not self.enabled or self.is_running:
+            return
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="episode_view_counter_flush")
+
+    async def stop(self) -> None:
+        """
+        flush 루프 종료 후 남은 증가분 반영
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    def record(
+        self,
+        product_id: int,
+        episode_id: int,
+        cp_yn: str = "N",
+        count_product: bool = True,
+        now: datetime | None = None,
+    ) -> None:
+        """
+        조회 1건 집계(논블로킹)
+
+        Args:
+            count_product: False 면 에피소드 조회수만 증가(비로그인 조회)
+        """
+        count = self._counts[(int(product_id), int(episode_id), _hour_bucket(now))]
+        count.episode_hits += 1
+        if count_product:
+            count.product_hits += 1
+            if cp_yn == "Y":
+                count.cp_hits += 1
+        if len(self._counts) >= self.max_keys and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[view_counter] flush loop error: {e}")
+
+    def _merge_back(self, counts: dict) -> None:
+        for key, count in counts.items():
+            current = self._counts[key]
+            current.episode_hits += count.episode_hits
+            current.product_hits += count.product_hits
+            current.cp_hits += count.cp_hits
+
+    async def flush(self) -> int:
+        """
+        집계된 증가분을 DB 에 반영합니다.
+
+        Returns:
+            반영된 에피소드 조회 수
+        """
+        async with self._flush_lock:
+            counts, self._counts = self._counts, defaultdict(ViewCount)
+            if not counts:
+                return 0
+
+            episode_hits: dict[int, int] = defaultdict(int)
+            product_hits: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+            hit_logs: dict[tuple, int] = defaultdict(int)
+            for (product_id, episode_id, hour), count in counts.items():
+                if count.episode_hits:
+                    episode_hits[episode_id] += count.episode_hits
+                if count.product_hits:
+                    product_hits[product_id][0] += count.product_hits
+                    product_hits[product_id][1] += count.cp_hits
+                    hit_logs[(product_id, hour.date())] += count.product_hits
+
+            try:
+                async with self.session_factory() as session:
+                    # 워커 간 교착 방지를 위해 항상 id 오름차순으로 잠금
+                    for rows in _chunks(sorted(episode_hits.items())):
+                        await session.execute(*build_episode_hit_query(rows))
+                    for rows in _chunks(
+                        sorted((pid, hits[0], hits[1]) for pid, hits in product_hits.items())
+                    ):
+                        await session.execute(*build_product_hit_query(rows))
+                    for rows in _chunks(
+                        sorted((pid, day, hits) for (pid, day), hits in hit_logs.items())
+                    ):
+                        await session.execute(*build_product_hit_log_query(rows))
+                    await session.commit()
+            except asyncio.CancelledError:
+                self._merge_back(counts)
+                raise
+            except Exception as e:
+                self.failed_flush_count += 1
+                logger.error(f"[view_counter] flush failed, retry next interval: {e}")
+                self._merge_back(counts)
+                return 0
+
+            flushed = sum(episode_hits.values())
+            self.flushed_views += flushed
+            self.flush_count += 1
+            return flushed
+
+
+episode_view_counter = EpisodeViewCounter()
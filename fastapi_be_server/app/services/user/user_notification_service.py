@@ -6,6 +6,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.const import settings, ErrorMessages, LOGGER_TYPE
 from app.exceptions import CustomResponseException
 from app.utils.common import handle_exceptions
+from app.utils.cursor_pagination import KeysetOrder, KeysetSpec, parse_keyset_page
+from app.utils.identity import resolve_user_id
 import app.schemas.user as user_schema
 
 from app.config.log_config import service_error_logger
@@ -17,14 +19,51 @@ error_logger = service_error_logger(LOGGER_TYPE.LOGGER_INSTANCE_NAME_FOR_SERVICE
 user notification 도메인 개별 서비스 함수 모음
 """
 
+# 알림 목록 커서 페이징 정렬(최신순, 동시각은 id 로 구분)
+USER_ALARM_KEYSET_SPEC = KeysetSpec(
+    "user_alarms", (KeysetOrder("c.created_date"), KeysetOrder("c.id"))
+)
 
-async def get_user_alarms(kc_user_id: str, db: AsyncSession):
+
+async def get_user_alarms(
+    kc_user_id: str,
+    db: AsyncSession,
+    cursor: str | None = None,
+    limit: int | None = None,
+    include_total: bool = False,
+):
+    """
+    알림 목록 조회
+    - cursor 가 None 이면 전체 목록, 문자열(빈 값은 첫 페이지)이면 limit 개씩 커서 페이징
+    """
     res_data = list()
+    total_count = None
+    next_cursor = None
+
+    keyset = None
+    if cursor is not None and kc_user_id:
+        keyset = parse_keyset_page(
+            USER_ALARM_KEYSET_SPEC, cursor, limit, scope={"kc_user_id": kc_user_id}
+        )
+    keyset_select = f", {keyset.select_sql}" if keyset else ""
+    keyset_where = keyset.where_sql if keyset else ""
+    order_sql = keyset.order_by_sql if keyset else "c.created_date desc"
+    limit_sql = keyset.limit_sql if keyset else ""
 
     if kc_user_id:
         try:
             async with db.begin():
-                query = text("""
+                user_id = await resolve_user_id(kc_user_id, db) or 0
+                if keyset is not None and include_total:
+                    query = text("""
+                                     select count(1) as total_count
+                                     from tb_user_notification_item c
+                                     where c.user_id = :user_id
+                                     """)
+                    result = await db.execute(query, {"user_id": user_id})
+                    total_count = result.scalar() or 0
+
+                query = text(f"""
                                  select
                                     c.id
                                     , c.title
@@ -32,15 +71,21 @@ async def get_user_alarms(kc_user_id: str, db: AsyncSession):
                                     , c.content
                                     , c.read_yn as readYn
                                     , date_format(c.created_date, '%Y-%m-%d %H:%i:%s') as createdAt
-                                 from tb_user a
-                                    inner join tb_user_notification_item c on a.user_id = c.user_id
-                                 where a.kc_user_id = :kc_user_id
-                                    and a.use_yn = 'Y'
-                                 order by c.created_date desc
+                                    {keyset_select}
+                                 from tb_user_notification_item c
+                                 where c.user_id = :user_id
+                                    {keyset_where}
+                                 order by {order_sql}
+                                 {limit_sql}
                                  """)
 
-                result = await db.execute(query, {"kc_user_id": kc_user_id})
+                result = await db.execute(
+                    query,
+                    {"user_id": user_id, **(keyset.params if keyset else {})},
+                )
                 db_rst = result.mappings().all()
+                if keyset is not None:
+                    db_rst, next_cursor = keyset.split(db_rst)
 
                 if db_rst:
                     for row in db_rst:
@@ -86,6 +131,9 @@ async def get_user_alarms(kc_user_id: str, db: AsyncSession):
         )
 
     res_body = {"data": res_data}
+    if keyset is not None:
+        res_body["nextCursor"] = next_cursor
+        res_body["totalCount"] = total_count
 
     return res_body
 
@@ -109,21 +157,17 @@ async def put_user_alarms_alarm_id(kc_user_id: str, db: AsyncSession):
                 # db_rst = result.mappings().all()
                 # user_id = db_rst[0].get("user_id")
 
-                query = text("""
-                                 update tb_user_notification_item a
-                                    set a.read_yn = 'Y'
-                                      , a.updated_id = ifnull((select user_id from tb_user where kc_user_id = :kc_user_id and use_yn = 'Y'), 0)
-                                      , a.updated_date = now()
-                                  where exists (
-                                        select user_id
-                                        from tb_user b
-                                        where b.kc_user_id = :kc_user_id
-                                        and b.use_yn = 'Y'
-                                        and b.user_id = a.user_id
-                                    )
-                                 """)
-
-                await db.execute(query, {"kc_user_id": kc_user_id})
+                user_id = await resolve_user_id(kc_user_id, db)
+                if user_id is not None:
+                    query = text("""
+                                     update tb_user_notification_item a
+                                        set a.read_yn = 'Y'
+                                          , a.updated_id = :user_id
+                                          , a.updated_date = now()
+                                      where a.user_id = :user_id
+                                     """)
+
+                    await db.execute(query, {"user_id": user_id})
         # except OperationalError as e:
         #     raise CustomResponseException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
         # except SQLAlchemyError as e:
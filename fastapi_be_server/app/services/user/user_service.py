@@ -18,6 +18,7 @@ from Crypto.Cipher import AES
 from app.const import CommonConstants, settings, ErrorMessages
 from app.exceptions import CustomResponseException
 from app.utils.time import get_full_age
+from app.utils.identity import invalidate_user_identity, resolve_user_id
 import app.services.common.comm_service as comm_service
 import app.schemas.user as user_schema
 
@@ -119,17 +120,7 @@ async def get_user(kc_user_id: str, db: AsyncSession):
                 # balance = db_rst[0].get("balance")
                 # sns_links = json.loads(db_rst[0].get("sns_links"))
 
-                query = text("""
-                                 select 1
-                                   from tb_user
-                                  where kc_user_id = :kc_user_id
-                                    and use_yn = 'Y'
-                                 """)
-
-                result = await db.execute(query, {"kc_user_id": kc_user_id})
-                db_rst = result.mappings().all()
-
-                if db_rst:
+                if await resolve_user_id(kc_user_id, db) is not None:
                     identity_yn = "Y"
                 else:
                     identity_yn = "N"
@@ -1058,6 +1049,7 @@ async def post_user_apply_role(
                             "updated_id": settings.DB_DML_DEFAULT_ID,
                         },
                     )
+                    invalidate_user_identity(kc_user_id=kc_user_id)
 
             res_data = {"applyRoleYn": "Y", "applyCPEditorYN": "N"}
     else:
@@ -1771,14 +1763,16 @@ async def post_userid_identity_token(user_id: str, kc_user_id: str, db: AsyncSes
 
                     # DB에 세션 데이터 저장
                     async with db.begin():
+                        user_id = await resolve_user_id(kc_user_id, db)
+
                         # 기존 세션 데이터 무효화
                         query = text("""
                             UPDATE tb_user_identity_session
                             SET use_yn = 'N', updated_date = NOW()
-                            WHERE user_id = (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id AND use_yn = 'Y')
+                            WHERE user_id = :user_id
                             AND use_yn = 'Y'
                         """)
-                        await db.execute(query, {"kc_user_id": kc_user_id})
+                        await db.execute(query, {"user_id": user_id})
 
                         # 새 세션 데이터 저장
                         query = text("""
@@ -1786,7 +1780,7 @@ async def post_userid_identity_token(user_id: str, kc_user_id: str, db: AsyncSes
                             (user_id, token_version_id, req_no, encryption_key, encryption_iv, hmac_key,
                              expired_date, created_id, updated_id)
                             VALUES (
-                                (SELECT user_id FROM tb_user WHERE kc_user_id = :kc_user_id AND use_yn = 'Y'),
+                                :user_id,
                                 :token_version_id, :req_no, :encryption_key, :encryption_iv, :hmac_key,
                                 DATE_ADD(NOW(), INTERVAL 30 MINUTE), :created_id, :updated_id
                             )
@@ -1794,7 +1788,7 @@ async def post_userid_identity_token(user_id: str, kc_user_id: str, db: AsyncSes
                         await db.execute(
                             query,
                             {
-                                "kc_user_id": kc_user_id,
+                                "user_id": user_id,
                                 "token_version_id": token_version_id,
                                 "req_no": "req" + request_no,
                                 "encryption_key": encryption_key,
@@ -1942,6 +1936,7 @@ async def get_user_authed_data(
         """)
 
         await db.execute(query, update_params)
+        invalidate_user_identity(kc_user_id=kc_user_id)
 
     return {
         "success": True,
@@ -0,0 +1,383 @@
+"""
+웹소챗 회차 본문 청크 검색 색인 (tb_story_agent_chunk_index / tb_story_agent_chunk_ngram)
+
+- 청크 본문의 한글/영숫자 연속 구간을 글자 2-gram 으로 색인하고 BM25 로 순위를 매긴다.
+- 색인은 스토리 컨텍스트 적재 배치(scripts/build_story_agent_context.py)가 작품 잠금 안에서 갱신한다.
+  새로 활성화된 청크만 세그먼트로 덧붙이고, 비활성 청크의 posting 은 조회 때 live 청크 목록(chunk_meta)으로 거른다.
+  죽은 posting 비율이나 세그먼트 수가 한도를 넘으면 작품 전체를 다시 만든다.
+- 검색은 작품 chunk_meta 와 질의 n-gram posting 만 읽어 메모리에서 채점하고,
+  상위 청크 본문만 가져와 키워드 포함 여부(기존 LIKE 조건)를 확인한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import struct
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+CHUNK_INDEX_NGRAM_SIZE = 2
+CHUNK_INDEX_BM25_K1 = 1.2
+CHUNK_INDEX_BM25_B = 0.75
+# 세그먼트 하나에 담는 최대 청크 수(전체 재색인 시 메모리 상한), 세그먼트/죽은 posting 한도
+CHUNK_INDEX_SEGMENT_CHUNKS = 5000
+CHUNK_INDEX_MAX_SEGMENTS = 32
+CHUNK_INDEX_MAX_DEAD_RATIO = 0.3
+_TERM_RUN_RE = re.compile(r"[가-힣a-z0-9]+")
+_META_HEADER = struct.Struct("<q")
+_META_FIELDS = (
+    ("chunk_ids", "<i8"),
+    ("episode_ids", "<i8"),
+    ("episode_nos", "<i4"),
+    ("chunk_nos", "<i4"),
+    ("lengths", "<i4"),
+)
+_POSTING_ID_DTYPE = np.dtype("<i8")
+_POSTING_TF_DTYPE = np.dtype("<u2")
+
+
+def text_ngrams(text_value: str) -> Counter[str]:
+    """청크 본문 n-gram 빈도 (소문자, 한글/영숫자 연속 구간 안에서만)"""
+    grams: Counter[str] = Counter()
+    size = CHUNK_INDEX_NGRAM_SIZE
+    for run in _TERM_RUN_RE.findall(str(text_value or "").lower()):
+        if len(run) < size:
+            continue
+        grams.update(run[idx:idx + size] for idx in range(len(run) - size + 1))
+    return grams
+
+
+def keyword_ngrams(keyword: str) -> set[str]:
+    return set(text_ngrams(keyword))
+
+
+@dataclass(frozen=True)
+class ChunkMeta:
+    """작품의 live 청크(활성 doc) 목록, chunk_id 오름차순"""
+
+    chunk_ids: np.ndarray
+    episode_ids: np.ndarray
+    episode_nos: np.ndarray
+    chunk_nos: np.ndarray
+    lengths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def positions(self, chunk_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """chunk_id -> 메타 위치, live 가 아닌 id 는 mask False"""
+        if not len(self.chunk_ids):
+            return np.zeros(len(chunk_ids), dtype=np.int64), np.zeros(len(chunk_ids), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.chunk_ids, chunk_ids), len(self.chunk_ids) - 1)
+        return positions, self.chunk_ids[positions] == chunk_ids
+
+
+def build_chunk_meta(rows: Iterable[dict[str, Any]], lengths: dict[int, int]) -> ChunkMeta:
+    ordered = sorted(rows, key=lambda row: int(row["chunk_id"]))
+    return ChunkMeta(
+        chunk_ids=np.array([int(row["chunk_id"]) for row in ordered], dtype="<i8"),
+        episode_ids=np.array([int(row["episode_id"]) for row in ordered], dtype="<i8"),
+        episode_nos=np.array([int(row["episode_no"]) for row in ordered], dtype="<i4"),
+        chunk_nos=np.array([int(row["chunk_no"]) for row in ordered], dtype="<i4"),
+        lengths=np.array([int(lengths.get(int(row["chunk_id"]), 0)) for row in ordered], dtype="<i4"),
+    )
+
+
+def pack_chunk_meta(meta: ChunkMeta) -> bytes:
+    parts = [_META_HEADER.pack(len(meta))]
+    for field, dtype in _META_FIELDS:
+        parts.append(np.ascontiguousarray(getattr(meta, field), dtype=dtype).tobytes())
+    return b"".join(parts)
+
+
+def unpack_chunk_meta(blob: bytes) -> ChunkMeta:
+    (count,) = _META_HEADER.unpack_from(blob, 0)
+    offset = _META_HEADER.size
+    arrays: dict[str, np.ndarray] = {}
+    for field, dtype in _META_FIELDS:
+        arrays[field] = np.frombuffer(blob, dtype=dtype, count=count, offset=offset)
+        offset += count * np.dtype(dtype).itemsize
+    return ChunkMeta(**arrays)
+
+
+def pack_postings(chunk_ids: np.ndarray, tfs: np.ndarray) -> bytes:
+    return (
+        np.ascontiguousarray(chunk_ids, dtype=_POSTING_ID_DTYPE).tobytes()
+        + np.ascontiguousarray(np.minimum(tfs, 65535), dtype=_POSTING_TF_DTYPE).tobytes()
+    )
+
+
+def unpack_postings(blob: bytes) -> tuple[np.ndarray, np.ndarray]:
+    count = len(blob) // (_POSTING_ID_DTYPE.itemsize + _POSTING_TF_DTYPE.itemsize)
+    chunk_ids = np.frombuffer(blob, dtype=_POSTING_ID_DTYPE, count=count)
+    tfs = np.frombuffer(blob, dtype=_POSTING_TF_DTYPE, count=count, offset=count * _POSTING_ID_DTYPE.itemsize)
+    return chunk_ids, tfs
+
+
+def build_segment_postings(chunks: Iterable[tuple[int, str]]) -> tuple[dict[str, bytes], dict[int, int]]:
+    """
+    청크 묶음 -> (n-gram 별 packed posting, chunk_id 별 n-gram 수)
+    posting 은 chunk_id 오름차순, 같은 n-gram 은 한 행으로 묶는다.
+    """
+    vocab: dict[str, int] = {}
+    gram_parts: list[np.ndarray] = []
+    id_parts: list[np.ndarray] = []
+    tf_parts: list[np.ndarray] = []
+    lengths: dict[int, int] = {}
+    for chunk_id, text_value in sorted(chunks, key=lambda item: int(item[0])):
+        grams = text_ngrams(text_value)
+        lengths[int(chunk_id)] = sum(grams.values())
+        if not grams:
+            continue
+        gram_parts.append(np.fromiter((vocab.setdefault(gram, len(vocab)) for gram in grams), dtype=np.int32, count=len(grams)))
+        tf_parts.append(np.fromiter(grams.values(), dtype=np.int64, count=len(grams)))
+        id_parts.append(np.full(len(grams), int(chunk_id), dtype=np.int64))
+    if not gram_parts:
+        return {}, lengths
+
+    gram_ids = np.concatenate(gram_parts)
+    chunk_ids = np.concatenate(id_parts)
+    tfs = np.concatenate(tf_parts)
+    order = np.argsort(gram_ids, kind="stable")  # 청크 순서(chunk_id 오름차순) 유지
+    gram_ids, chunk_ids, tfs = gram_ids[order], chunk_ids[order], tfs[order]
+    boundaries = np.flatnonzero(np.diff(gram_ids)) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(gram_ids)]))
+    grams_by_id = list(vocab)
+    postings = {
+        grams_by_id[int(gram_ids[start])]: pack_postings(chunk_ids[start:end], tfs[start:end])
+        for start, end in zip(starts, ends)
+    }
+    return postings, lengths
+
+
+def merge_postings(meta: ChunkMeta, blobs: Iterable[bytes]) -> tuple[np.ndarray, np.ndarray]:
+    """세그먼트별 posting 을 합쳐 live 청크의 (메타 위치, tf) 로 변환"""
+    position_parts: list[np.ndarray] = []
+    tf_parts: list[np.ndarray] = []
+    for blob in blobs:
+        chunk_ids, tfs = unpack_postings(blob)
+        positions, live = meta.positions(chunk_ids)
+        position_parts.append(positions[live])
+        tf_parts.append(tfs[live].astype(np.float64))
+    if not position_parts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64)
+    return np.concatenate(position_parts), np.concatenate(tf_parts)
+
+
+def rank_chunks(
+    meta: ChunkMeta,
+    postings: dict[str, tuple[np.ndarray, np.ndarray]],
+    keyword_grams: list[set[str]],
+    corpus_mask: np.ndarray,
+) -> list[tuple[int, float]]:
+    """
+    BM25 순위 (메타 위치, 점수). 질의어는 키워드들의 n-gram 합집합, 통계(N/avgdl/df)는 corpus_mask 청크 기준.
+    키워드 하나의 n-gram 을 모두 가진 청크만 후보로 두고, 동점은 최신 회차/앞 청크 순(기존 정렬과 같음).
+    """
+    total = int(corpus_mask.sum())
+    if not total:
+        return []
+    avgdl = float(meta.lengths[corpus_mask].mean()) or 1.0
+    norm = CHUNK_INDEX_BM25_K1 * (1 - CHUNK_INDEX_BM25_B + CHUNK_INDEX_BM25_B * meta.lengths / avgdl)
+    scores = np.zeros(len(meta), dtype=np.float64)
+    present: dict[str, np.ndarray] = {}
+    for gram in sorted(set().union(*keyword_grams)) if keyword_grams else []:
+        positions, tfs = postings.get(gram, (np.zeros(0, dtype=np.int64), np.zeros(0)))
+        in_corpus = corpus_mask[positions]
+        positions, tfs = positions[in_corpus], tfs[in_corpus]
+        df = len(positions)
+        mask = np.zeros(len(meta), dtype=bool)
+        mask[positions] = True
+        present[gram] = mask
+        if not df:
+            continue
+        idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+        scores[positions] += idf * tfs * (CHUNK_INDEX_BM25_K1 + 1) / (tfs + norm[positions])
+
+    candidate = np.zeros(len(meta), dtype=bool)
+    for grams in keyword_grams:
+        if not grams:
+            continue
+        has_all = corpus_mask.copy()
+        for gram in grams:
+            has_all &= present[gram]
+        candidate |= has_all
+    positions = np.flatnonzero(candidate)
+    order = np.lexsort((meta.chunk_nos[positions], -meta.episode_nos[positions], -scores[positions]))
+    return [(int(positions[idx]), float(scores[positions[idx]])) for idx in order]
+
+
+@dataclass(frozen=True)
+class ChunkIndexPlan:
+    mode: str  # "noop" | "append" | "rebuild"
+    add_chunk_ids: list[int]
+
+
+def plan_chunk_index_update(
+    meta: ChunkMeta | None,
+    live_chunk_ids: Iterable[int],
+    *,
+    segment_count: int,
+    indexed_chunk_count: int,
+) -> ChunkIndexPlan:
+    live = sorted({int(chunk_id) for chunk_id in live_chunk_ids})
+    if meta is None:
+        return ChunkIndexPlan("rebuild", live)
+    indexed = {int(chunk_id) for chunk_id in meta.chunk_ids.tolist()}
+    added = [chunk_id for chunk_id in live if chunk_id not in indexed]
+    if not added and len(indexed) == len(live):
+        return ChunkIndexPlan("noop", [])
+    projected_indexed = indexed_chunk_count + len(added)
+    dead_ratio = (projected_indexed - len(live)) / projected_indexed if projected_indexed else 0.0
+    if segment_count + (1 if added else 0) > CHUNK_INDEX_MAX_SEGMENTS or dead_ratio > CHUNK_INDEX_MAX_DEAD_RATIO:
+        return ChunkIndexPlan("rebuild", live)
+    return ChunkIndexPlan("append", added)
+
+
+class ChunkMetaCache:
+    """작품별 chunk_meta 캐시 (index_version 이 같을 때만 재사용, 작품 수 LRU)"""
+
+    def __init__(self, max_products: int):
+        self.max_products = max(1, max_products)
+        self._items: OrderedDict[int, tuple[int, ChunkMeta]] = OrderedDict()
+
+    def get(self, product_id: int, version: int) -> ChunkMeta | None:
+        item = self._items.get(product_id)
+        if item is None or item[0] != version:
+            return None
+        self._items.move_to_end(product_id)
+        return item[1]
+
+    def put(self, product_id: int, version: int, meta: ChunkMeta) -> None:
+        self._items[product_id] = (version, meta)
+        self._items.move_to_end(product_id)
+        while len(self._items) > self.max_products:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+chunk_meta_cache = ChunkMetaCache(settings.WEBSOCHAT_CHUNK_INDEX_CACHE_PRODUCTS)
+
+_INDEX_VERSION_QUERY = text(
+    "SELECT index_version FROM tb_story_agent_chunk_index WHERE product_id = :product_id"
+)
+_INDEX_META_QUERY = text(
+    "SELECT index_version, chunk_meta FROM tb_story_agent_chunk_index WHERE product_id = :product_id"
+)
+_POSTING_QUERY = text(
+    """
+    SELECT ngram, postings
+    FROM tb_story_agent_chunk_ngram
+    WHERE product_id = :product_id
+      AND ngram IN :ngrams
+    ORDER BY ngram, segment_no
+    """
+).bindparams(bindparam("ngrams", expanding=True))
+_VISIBLE_EPISODE_QUERY = text(
+    """
+    SELECT episode_id
+    FROM tb_product_episode
+    WHERE product_id = :product_id
+      AND use_yn = 'Y'
+      AND open_yn = 'Y'
+    """
+)
+_CHUNK_TEXT_QUERY = text(
+    """
+    SELECT c.chunk_id, c.text
+    FROM tb_story_agent_context_chunk c
+    JOIN tb_story_agent_context_doc d
+      ON d.context_doc_id = c.context_doc_id
+     AND d.is_active = 'Y'
+    WHERE c.chunk_id IN :chunk_ids
+    """
+).bindparams(bindparam("chunk_ids", expanding=True))
+
+
+async def load_chunk_meta(product_id: int, db: AsyncSession) -> ChunkMeta | None:
+    version = (await db.execute(_INDEX_VERSION_QUERY, {"product_id": product_id})).scalar_one_or_none()
+    if version is None:
+        return None
+    cached = chunk_meta_cache.get(product_id, int(version))
+    if cached is not None:
+        return cached
+    row = (await db.execute(_INDEX_META_QUERY, {"product_id": product_id})).mappings().one_or_none()
+    if row is None:
+        return None
+    meta = unpack_chunk_meta(bytes(row["chunk_meta"]))
+    chunk_meta_cache.put(product_id, int(row["index_version"]), meta)
+    return meta
+
+
+async def search_chunk_index(
+    product_id: int,
+    keywords: list[str],
+    latest_episode_no: int,
+    db: AsyncSession,
+    *,
+    limit: int = 6,
+) -> list[dict[str, Any]] | None:
+    """
+    색인 기반 청크 검색. 색인이 없거나 색인할 수 없는 키워드면 None (호출부가 LIKE 조회로 대체)
+    반환 행: episodeNo, matchScore(BM25), rawText
+    """
+    keyword_grams = [keyword_ngrams(keyword) for keyword in keywords]
+    if not keyword_grams or not all(keyword_grams):
+        return None
+    meta = await load_chunk_meta(product_id, db)
+    if meta is None:
+        return None
+
+    grams = sorted(set().union(*keyword_grams))
+    blobs: dict[str, list[bytes]] = {}
+    result = await db.execute(_POSTING_QUERY, {"product_id": product_id, "ngrams": grams})
+    for row in result.mappings().all():
+        blobs.setdefault(str(row["ngram"]), []).append(bytes(row["postings"]))
+    postings = {gram: merge_postings(meta, blobs.get(gram, [])) for gram in grams}
+
+    visible_episode_ids = np.array(
+        [int(value) for value in (await db.execute(_VISIBLE_EPISODE_QUERY, {"product_id": product_id})).scalars().all()],
+        dtype=np.int64,
+    )
+    corpus_mask = np.isin(meta.episode_ids, visible_episode_ids) & (meta.episode_nos <= latest_episode_no)
+    ranked = rank_chunks(meta, postings, keyword_grams, corpus_mask)
+
+    lowered_keywords = [keyword.lower() for keyword in keywords]
+    rows: list[dict[str, Any]] = []
+    page_size = max(limit * 3, 12)
+    for start in range(0, len(ranked), page_size):
+        page = ranked[start:start + page_size]
+        chunk_ids = [int(meta.chunk_ids[position]) for position, _ in page]
+        texts = {
+            int(row["chunk_id"]): str(row["text"] or "")
+            for row in (await db.execute(_CHUNK_TEXT_QUERY, {"chunk_ids": chunk_ids})).mappings().all()
+        }
+        for (position, score), chunk_id in zip(page, chunk_ids):
+            raw_text = texts.get(chunk_id)
+            # n-gram 이 모두 있어도 연속 문자열이 아닐 수 있으므로 기존 LIKE 조건으로 확인
+            if raw_text is None or not any(keyword in raw_text.lower() for keyword in lowered_keywords):
+                continue
+            rows.append(
+                {
+                    "episodeNo": int(meta.episode_nos[position]),
+                    "rawText": raw_text,
+                    "matchScore": round(score, 6),
+                }
+            )
+            if len(rows) >= limit:
+                return rows
+    return rows
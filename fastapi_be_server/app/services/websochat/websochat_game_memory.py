@@ -486,8 +486,8 @@ def _merge_websochat_qa_corrections(
     return next_memory
 
 
-def _serialize_websochat_session_memory(session_memory: dict[str, Any]) -> str | None:
-    normalized = _normalize_websochat_session_memory(session_memory)
+def _is_websochat_session_memory_empty(normalized: dict[str, Any]) -> bool:
+    """정규화된 메모리에 저장할 상태가 없으면 True (이때 session_memory_json 은 NULL 로 둔다)"""
     has_rp_state = bool(normalized.get("active_character") and normalized.get("rp_mode"))
     has_pending_rp_state = bool(normalized.get("pending_rp_character_selection"))
     has_game_state = bool(normalized.get("game_context", {}).get("mode"))
@@ -497,6 +497,11 @@ def _serialize_websochat_session_memory(session_memory: dict[str, Any]) -> str |
     has_pending_qa_action = bool(normalized.get("pending_qa_action_key"))
     has_qa_memory = bool(normalized.get("qa_recent_notes"))
     has_qa_corrections = bool(normalized.get("qa_corrections"))
-    if not has_rp_state and not has_pending_rp_state and not has_game_state and not has_scope_state and not has_scope_prompted and not has_non_read_scope_state and not has_pending_qa_action and not has_qa_memory and not has_qa_corrections:
+    return not has_rp_state and not has_pending_rp_state and not has_game_state and not has_scope_state and not has_scope_prompted and not has_non_read_scope_state and not has_pending_qa_action and not has_qa_memory and not has_qa_corrections
+
+
+def _serialize_websochat_session_memory(session_memory: dict[str, Any]) -> str | None:
+    normalized = _normalize_websochat_session_memory(session_memory)
+    if _is_websochat_session_memory_empty(normalized):
         return None
     return json.dumps(normalized, ensure_ascii=False)
@@ -0,0 +1,219 @@
+"""
+웹소챗 질문 분류 빠른 경로 (_resolve_websochat_intent / _resolve_websochat_rp_recall_need / _resolve_websochat_qa_corrections)
+
+- 규칙: 자주 오는 질문 유형을 키워드/패턴으로 바로 분류하고, 애매하면 None 을 돌려 다음 단계로 넘긴다.
+  규칙은 LLM 분류 프롬프트의 정의/예시를 그대로 옮긴 것이라 확신할 수 있는 경우만 다룬다.
+- 캐시: 작품별로 정규화한 질문 -> LLM 분류 결과를 TTL LRU 로 보관한다(워커 단위).
+  직전 대화를 가리키는 질문(그거, 아까, 그럼 ...)은 문맥에 따라 답이 바뀌므로 규칙/캐시 모두 쓰지 않는다.
+- 규칙과 캐시가 모두 비면 기존 LLM 분류를 호출한다.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections import Counter, OrderedDict
+from typing import Any
+
+from app.const import settings
+
+WEBSOCHAT_INTENT_MIN_RULE_CHARS = 4
+WEBSOCHAT_INTENT_CONTEXT_DEPENDENT_RE = re.compile(
+    r"그거|그건|그게|그걸|그럼|그러면|그래서|아까|방금|위에서|앞에서 말|걔|쟤|그 사람|그 장면|그 다음|다음은|"
+    r"더 자세히|자세히 말|계속해|이어서|다시 말|또\?|또 뭐"
+)
+WEBSOCHAT_SELF_INSERT_RE = re.compile(
+    r"(?<![가-힣])(내가|나를|나도|제가|저를|저도).{0,12}(들어가|빙의|환생|회귀|주인공이|있었|있다면|태어나|합류|끼면|끼어|가면)|"
+    r"(?<![가-힣])(나라면|저라면|내 포지션|내 자리|내 역할)"
+)
+WEBSOCHAT_SIMULATION_RE = re.compile(
+    r"만약|만일|(?<![a-z])if(?![a-z])|였다면|이었다면|었다면|았다면|했다면|않았다면|안 했으면|했으면 어땠|"
+    r"면 어떻게 됐|면 어떻게 될|대신 (움직|나섰|싸웠|했)|라면 어떻게|세계가 어떻게 반응"
+)
+WEBSOCHAT_COMPARATIVE_RE = re.compile(
+    r"붙으면|싸우면|맞붙|대결하면|겨루면|(?<![a-z])vs(?![a-z])|월드컵|랭킹|"
+    r"순위.{0,4}(매겨|정해|나열)|티어.{0,4}(매겨|나눠|정리)|누가 이겨|누가 이길|누가 더 세|상성"
+)
+WEBSOCHAT_PLAYFUL_RE = re.compile(
+    r"역할극|롤플|연기해|대사(로|처럼)? ?(해|말해|쳐)|말투로|처럼 말해|빙의해서|성대모사|"
+    r"(한테|에게) (한마디|말 걸|고백)|놀아줘|드립|칭찬해 ?줘|위로해 ?줘"
+)
+WEBSOCHAT_FACTUAL_QUESTION_RE = re.compile(
+    r"뭐야|뭐였|뭔가요|뭐지|뭐예요|뭐에요|누구야|누구였|누구지|누군지|누구예요|무엇|어디야|어디서|언제|"
+    r"왜 |왜\?|왜$|어떻게 (됐|되었|된|했|되|돼)|어떤 (사람|인물|능력|관계|설정|사건)|"
+    r"설명해|정리해|요약해|알려줘|알려 줘|말해줘|궁금해|있어\?|했어\?|나와\?|나왔어|맞아\?|맞지\?|"
+    r"(이|가) 뭐|(은|는) 뭐|몇 (명|화|개)|어때\?|어때$|어땠어|있었어|무슨 일"
+)
+WEBSOCHAT_EXACT_MODE_RE = re.compile(r"\d{1,4}\s*화")
+WEBSOCHAT_LATEST_MODE_RE = re.compile(
+    r"최신|최근|요즘|지금 (상황|어떻게|뭐|어디)|현재 (상황|상태)|마지막 (화|회차)|최근 (화|회차)"
+)
+WEBSOCHAT_EARLY_MODE_RE = re.compile(r"초반|도입부|도입 부분|시작 부분|첫\s?화|1화부터")
+# '처음/첫 등장' 은 도입부(early)인지 가장 처음 발생한 사건(general)인지 문맥으로만 갈리므로 LLM 에 맡긴다
+WEBSOCHAT_AMBIGUOUS_MODE_RE = re.compile(r"처음|첫 (등장|발현|각성|만남)|첫등장")
+
+WEBSOCHAT_RP_EXACT_RECALL_RE = re.compile(
+    r"뭐라고 (했|말했|그랬)|뭐라 (했|그랬)|정확히|그대로 (말|읊|옮)|했던 말|한 말 (기억|뭐)|"
+    r"그때 (한|했던) (말|행동)|대사(가|를|는)? ?(뭐|기억)|어떤 행동|무슨 말을 했"
+)
+WEBSOCHAT_RP_PAST_REFERENCE_RE = re.compile(
+    r"그때|아까|예전|옛날|전에|처음 만났|기억(나|해|하|은|이|해\?)|했었|했던|했잖|했지\?|그 장면|회차|\d{1,4}\s*화"
+)
+WEBSOCHAT_QA_CORRECTION_MARKER_RE = re.compile(
+    r"아니(야|지|라|고|거든|,|\.|\s|$)|아닌데|틀렸|틀린|잘못|정정|바로잡|맞는 (건|거|게)|그게 아니|사실은|오타|헷갈렸"
+)
+_CACHE_KEY_STRIP_RE = re.compile(r"[\s?!.,~…ㅋㅎㅠㅜ]+")
+
+
+def _normalize_websochat_prompt(user_prompt: str) -> str:
+    return " ".join(str(user_prompt or "").split()).lower()
+
+
+def is_websochat_prompt_context_dependent(user_prompt: str) -> bool:
+    normalized = _normalize_websochat_prompt(user_prompt)
+    return len(normalized) < WEBSOCHAT_INTENT_MIN_RULE_CHARS or bool(
+        WEBSOCHAT_INTENT_CONTEXT_DEPENDENT_RE.search(normalized)
+    )
+
+
+def build_websochat_intent_cache_key(user_prompt: str) -> str | None:
+    """공백/문장부호/ㅋㅋ 를 뺀 질문, 직전 대화에 기대는 질문은 None (캐시하지 않음)"""
+    if is_websochat_prompt_context_dependent(user_prompt):
+        return None
+    key = _CACHE_KEY_STRIP_RE.sub("", _normalize_websochat_prompt(user_prompt))
+    return key or None
+
+
+def _resolve_websochat_rule_mode(normalized: str) -> str | None:
+    modes = []
+    if WEBSOCHAT_EXACT_MODE_RE.search(normalized):
+        modes.append("exact")
+    if WEBSOCHAT_LATEST_MODE_RE.search(normalized):
+        modes.append("latest")
+    if WEBSOCHAT_EARLY_MODE_RE.search(normalized):
+        modes.append("early")
+    if len(modes) > 1 or (not modes and WEBSOCHAT_AMBIGUOUS_MODE_RE.search(normalized)):
+        return None
+    return modes[0] if modes else "general"
+
+
+def classify_websochat_intent_by_rules(user_prompt: str) -> tuple[str, bool, str] | None:
+    """(intent, needs_creative, mode), 확신할 수 없으면 None"""
+    normalized = _normalize_websochat_prompt(user_prompt)
+    if is_websochat_prompt_context_dependent(normalized):
+        return None
+    mode = _resolve_websochat_rule_mode(normalized)
+    if mode is None:
+        return None
+
+    # 자기투영은 가정형(…라면)을 함께 쓰는 경우가 대부분이라 먼저 본다
+    if WEBSOCHAT_SELF_INSERT_RE.search(normalized):
+        return "self_insert", True, mode
+    creative = [
+        intent
+        for intent, pattern in (
+            ("simulation", WEBSOCHAT_SIMULATION_RE),
+            ("comparative", WEBSOCHAT_COMPARATIVE_RE),
+            ("playful", WEBSOCHAT_PLAYFUL_RE),
+        )
+        if pattern.search(normalized)
+    ]
+    if len(creative) == 1:
+        return creative[0], True, mode
+    if creative:
+        return None
+    if WEBSOCHAT_FACTUAL_QUESTION_RE.search(normalized):
+        return "factual", False, mode
+    return None
+
+
+def classify_websochat_rp_recall_by_rules(user_prompt: str) -> bool | None:
+    """
+    원문 회상이 필요 없는 RP 발화면 False, 아니면 None.
+    회상이 필요한 경우는 LLM 이 만든 검색어를 써야 하므로 규칙으로 True 를 정하지 않는다.
+    """
+    normalized = _normalize_websochat_prompt(user_prompt)
+    if not normalized:
+        return None
+    if WEBSOCHAT_RP_EXACT_RECALL_RE.search(normalized) or WEBSOCHAT_RP_PAST_REFERENCE_RE.search(normalized):
+        return None
+    return False
+
+
+def has_websochat_qa_correction_marker(user_prompt: str) -> bool:
+    """교정 추출 프롬프트 기준('아니', '틀렸어', '정정하면', '맞는 건' 등)의 표지가 있는지"""
+    return bool(WEBSOCHAT_QA_CORRECTION_MARKER_RE.search(_normalize_websochat_prompt(user_prompt)))
+
+
+class WebsochatIntentCache:
+    """
+    product_id -> {(분류 종류, 범위 키, 정규화 질문) -> (결과, expires_at)} TTL LRU 캐시
+    작품 수와 작품별 항목 수를 각각 제한한다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = settings.WEBSOCHAT_INTENT_CACHE_TTL_SECONDS,
+        max_entries_per_product: int = settings.WEBSOCHAT_INTENT_CACHE_MAX_PER_PRODUCT,
+        max_products: int = settings.WEBSOCHAT_INTENT_CACHE_MAX_PRODUCTS,
+        enabled: bool = settings.WEBSOCHAT_INTENT_CACHE_ENABLED,
+    ):
+        self.ttl = ttl
+        self.max_entries_per_product = max_entries_per_product
+        self.max_products = max_products
+        self.enabled = enabled
+        self._products: OrderedDict[int, OrderedDict[tuple[str, str, str], tuple[Any, float]]] = OrderedDict()
+        # (분류 종류, rule|cache|llm) -> 건수
+        self.sources: Counter[tuple[str, str]] = Counter()
+
+    def record(self, kind: str, source: str) -> None:
+        self.sources[(kind, source)] += 1
+
+    def metrics(self) -> dict:
+        kinds = sorted({kind for kind, _ in self.sources})
+        result: dict[str, Any] = {"products": len(self._products)}
+        for kind in kinds:
+            counts = {source: count for (item_kind, source), count in self.sources.items() if item_kind == kind}
+            total = sum(counts.values())
+            result[kind] = {
+                **counts,
+                "llm_avoided_rate": round(1 - counts.get("llm", 0) / total, 4) if total else 0.0,
+            }
+        return result
+
+    def get(self, product_id: int, kind: str, scope_key: str, prompt_key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        entries = self._products.get(product_id)
+        if entries is None:
+            return None
+        key = (kind, scope_key, prompt_key)
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            entries.pop(key, None)
+            return None
+        entries.move_to_end(key)
+        self._products.move_to_end(product_id)
+        return entry[0]
+
+    def put(self, product_id: int, kind: str, scope_key: str, prompt_key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        entries = self._products.setdefault(product_id, OrderedDict())
+        key = (kind, scope_key, prompt_key)
+        entries[key] = (value, time.time() + self.ttl)
+        entries.move_to_end(key)
+        self._products.move_to_end(product_id)
+        while len(entries) > self.max_entries_per_product:
+            entries.popitem(last=False)
+        while len(self._products) > self.max_products:
+            self._products.popitem(last=False)
+
+    def clear(self) -> None:
+        self._products.clear()
+        self.sources.clear()
+
+
+websochat_intent_cache = WebsochatIntentCache()
@@ -9,6 +9,12 @@ from fastapi import status
 
 from app.const import settings
 from app.exceptions import CustomResponseException
+from app.utils.http_client import HTTP_PROVIDER_GEMINI, get_http_client
+from app.services.websochat.websochat_provider_governor import (
+    WEBSOCHAT_PROVIDER_REJECT_BUSY,
+    WebsochatProviderRejectedError,
+    websochat_gemini_governor,
+)
 from app.services.websochat.websochat_stream import emit_websochat_stream_delta, is_websochat_stream_enabled
 
 logger = logging.getLogger(__name__)
@@ -23,6 +29,25 @@ WEBSOCHAT_AI_PROVIDER_UNAVAILABLE_MESSAGE = "AI 답변을 불러오지 못했어
 WEBSOCHAT_AI_PROVIDER_LIMITED_MESSAGE = "지금은 AI 생성 요청이 많아 답변을 완성하지 못했어요. 잠시 후 다시 시도해 주세요."
 WEBSOCHAT_AI_PROVIDER_AUTH_MESSAGE = "AI 생성 설정을 확인하는 중이에요. 잠시 후 다시 시도해 주세요."
 WEBSOCHAT_AI_PROVIDER_TIMEOUT_MESSAGE = "생성 시간이 길어져 답변을 마치지 못했어요. 조금 뒤 다시 시도해 주세요."
+# 다시 보내도 되는 provider 응답 코드 / 요청이 provider 에 닿기 전(또는 응답 전 끊긴) 오류
+# 읽기 timeout 은 이미 timeout_seconds 를 다 기다린 뒤라 재시도하지 않는다(분류 호출은 hedge 로 대응)
+WEBSOCHAT_RETRYABLE_PROVIDER_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+WEBSOCHAT_RETRYABLE_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+class _WebsochatProviderStatusError(Exception):
+    """provider 가 200 이 아닌 응답을 준 경우 (governor 재시도 판단 후 CustomResponseException 으로 바꾼다)"""
+
+    def __init__(self, status_code: int, error_text: Any, *, operation: str):
+        super().__init__(f"Gemini {operation} status={status_code}")
+        self.status_code = status_code
+        self.error_text = error_text
+        self.operation = operation
 
 
 def to_websochat_gemini_contents(messages: list[dict[str, str]]) -> list[dict[str, Any]]:
@@ -103,6 +128,25 @@ def _raise_websochat_provider_error(
     )
 
 
+def _is_websochat_provider_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, _WebsochatProviderStatusError):
+        return exc.status_code in WEBSOCHAT_RETRYABLE_PROVIDER_STATUS_CODES
+    return isinstance(exc, WEBSOCHAT_RETRYABLE_TRANSPORT_ERRORS)
+
+
+def _raise_websochat_provider_rejected(exc: WebsochatProviderRejectedError) -> None:
+    logger.warning("Gemini call rejected by governor: %s", exc.reason)
+    if exc.reason == WEBSOCHAT_PROVIDER_REJECT_BUSY:
+        code, message = "AI_PROVIDER_LIMITED", WEBSOCHAT_AI_PROVIDER_LIMITED_MESSAGE
+    else:
+        code, message = "AI_PROVIDER_UNAVAILABLE", WEBSOCHAT_AI_PROVIDER_UNAVAILABLE_MESSAGE
+    raise CustomResponseException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        code=code,
+        message=message,
+    )
+
+
 def _raise_websochat_provider_timeout(*, operation: str) -> None:
     logger.exception("Gemini %s API timeout", operation)
     raise CustomResponseException(
@@ -119,7 +163,9 @@ async def _call_websochat_gemini_stream(
     max_tokens: int,
     temperature: float,
     timeout_seconds: float = WEBSOCHAT_GEMINI_TIMEOUT_SECONDS,
+    progress: dict[str, bool] | None = None,
 ) -> str:
+    """progress["emitted"] 는 첫 delta 를 내보내기 직전에 True 가 된다 (그 뒤 실패는 재시도하지 않는다)"""
     payload: dict[str, Any] = {
         "systemInstruction": {
             "parts": [{"text": system_prompt}],
@@ -131,39 +177,42 @@ async def _call_websochat_gemini_stream(
         },
     }
     accumulated = ""
-    async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-        async with client.stream(
-            "POST",
-            f"https://generativelanguage.googleapis.com/v1beta/models/{settings.WEBSOCHAT_GEMINI_MODEL}:streamGenerateContent?alt=sse",
-            headers={
-                "content-type": "application/json",
-                "x-goog-api-key": settings.GEMINI_API_KEY,
-            },
-            json=payload,
-        ) as response:
-            if response.status_code != 200:
-                error_text = await response.aread()
-                _raise_websochat_provider_error(
-                    response.status_code,
-                    error_text,
-                    operation="streamGenerateContent",
-                )
-            async for raw_line in response.aiter_lines():
-                line = str(raw_line or "").strip()
-                if not line or not line.startswith("data:"):
-                    continue
-                payload_text = line[5:].strip()
-                if not payload_text:
-                    continue
-                try:
-                    event_json = json.loads(payload_text)
-                except json.JSONDecodeError:
-                    continue
-                current_text = extract_websochat_gemini_text(event_json)
-                delta = _compute_websochat_stream_delta(accumulated, current_text)
-                if delta:
-                    await emit_websochat_stream_delta(delta)
-                    accumulated += delta
+    client = get_http_client(HTTP_PROVIDER_GEMINI)
+    async with client.stream(
+        "POST",
+        f"https://generativelanguage.googleapis.com/v1beta/models/{settings.WEBSOCHAT_GEMINI_MODEL}:streamGenerateContent?alt=sse",
+        headers={
+            "content-type": "application/json",
+            "x-goog-api-key": settings.GEMINI_API_KEY,
+        },
+        json=payload,
+        timeout=timeout_seconds,
+    ) as response:
+        if response.status_code != 200:
+            error_text = await response.aread()
+            raise _WebsochatProviderStatusError(
+                response.status_code,
+                error_text,
+                operation="streamGenerateContent",
+            )
+        async for raw_line in response.aiter_lines():
+            line = str(raw_line or "").strip()
+            if not line or not line.startswith("data:"):
+                continue
+            payload_text = line[5:].strip()
+            if not payload_text:
+                continue
+            try:
+                event_json = json.loads(payload_text)
+            except json.JSONDecodeError:
+                continue
+            current_text = extract_websochat_gemini_text(event_json)
+            delta = _compute_websochat_stream_delta(accumulated, current_text)
+            if delta:
+                if progress is not None:
+                    progress["emitted"] = True
+                await emit_websochat_stream_delta(delta)
+                accumulated += delta
     return accumulated.strip()
 
 
@@ -174,7 +223,12 @@ async def call_websochat_gemini(
     max_tokens: int = WEBSOCHAT_REPLY_MAX_TOKENS,
     temperature: float = WEBSOCHAT_QA_TEMPERATURE,
     timeout_seconds: float = WEBSOCHAT_GEMINI_TIMEOUT_SECONDS,
+    hedge: bool = False,
 ) -> str:
+    """
+    websochat_gemini_governor 를 거쳐 호출한다.
+    hedge=True 는 짧은 분류/JSON 호출용으로, 스트리밍하지 않고 느린 요청에 hedge 를 보낼 수 있다.
+    """
     if not settings.GEMINI_API_KEY:
         raise CustomResponseException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -182,15 +236,24 @@ async def call_websochat_gemini(
             message=WEBSOCHAT_AI_PROVIDER_AUTH_MESSAGE,
         )
 
-    if is_websochat_stream_enabled():
+    if is_websochat_stream_enabled() and not hedge:
+        progress = {"emitted": False}
         try:
-            return await _call_websochat_gemini_stream(
-                system_prompt=system_prompt,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                timeout_seconds=timeout_seconds,
+            return await websochat_gemini_governor.call(
+                lambda: _call_websochat_gemini_stream(
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout_seconds=timeout_seconds,
+                    progress=progress,
+                ),
+                retryable=lambda exc: not progress["emitted"] and _is_websochat_provider_retryable(exc),
             )
+        except WebsochatProviderRejectedError as exc:
+            _raise_websochat_provider_rejected(exc)
+        except _WebsochatProviderStatusError as exc:
+            _raise_websochat_provider_error(exc.status_code, exc.error_text, operation=exc.operation)
         except CustomResponseException:
             raise
         except Exception:
@@ -207,16 +270,35 @@ async def call_websochat_gemini(
         },
     }
 
-    try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/{settings.WEBSOCHAT_GEMINI_MODEL}:generateContent",
-                headers={
-                    "content-type": "application/json",
-                    "x-goog-api-key": settings.GEMINI_API_KEY,
-                },
-                json=payload,
+    async def _generate_content() -> httpx.Response:
+        client = get_http_client(HTTP_PROVIDER_GEMINI)
+        response = await client.post(
+            f"https://generativelanguage.googleapis.com/v1beta/models/{settings.WEBSOCHAT_GEMINI_MODEL}:generateContent",
+            headers={
+                "content-type": "application/json",
+                "x-goog-api-key": settings.GEMINI_API_KEY,
+            },
+            json=payload,
+            timeout=timeout_seconds,
+        )
+        if response.status_code != 200:
+            raise _WebsochatProviderStatusError(
+                response.status_code,
+                response.text,
+                operation="generateContent",
             )
+        return response
+
+    try:
+        response = await websochat_gemini_governor.call(
+            _generate_content,
+            retryable=_is_websochat_provider_retryable,
+            hedge=hedge,
+        )
+    except WebsochatProviderRejectedError as exc:
+        _raise_websochat_provider_rejected(exc)
+    except _WebsochatProviderStatusError as exc:
+        _raise_websochat_provider_error(exc.status_code, exc.error_text, operation=exc.operation)
     except httpx.TimeoutException:
         _raise_websochat_provider_timeout(operation="generateContent")
     except httpx.HTTPError:
@@ -227,13 +309,6 @@ async def call_websochat_gemini(
             message=WEBSOCHAT_AI_PROVIDER_UNAVAILABLE_MESSAGE,
         )
 
-    if response.status_code != 200:
-        _raise_websochat_provider_error(
-            response.status_code,
-            response.text,
-            operation="generateContent",
-        )
-
     reply = extract_websochat_gemini_text(response.json())
     if not reply:
         raise CustomResponseException(
@@ -0,0 +1,266 @@
+"""
+웹소챗 LLM provider 호출 governor (websochat_llm.call_websochat_gemini)
+
+- 동시 호출 상한: provider 별 세마포어로 in-flight 호출 수를 제한하고, queue_timeout 안에 자리가 나지 않으면
+  호출하지 않고 거절한다(provider 429 폭주를 워커 안에서 먼저 막는다).
+- 재시도: retryable 로 판정한 실패(연결 실패, 429/5xx 등)만 지수 backoff + jitter 로 다시 보낸다.
+  스트리밍은 첫 delta 를 내보내기 전 실패만 retryable 로 넘겨야 한다(이미 보낸 글자를 되돌릴 수 없다).
+- hedge: 비스트리밍 분류 호출은 최근 지연의 hedge_percentile 분위수가 지나도 응답이 없으면 같은 요청을
+  한 번 더 보내고 먼저 온 응답을 쓴다. 표본이 hedge_min_samples 보다 적거나 자리가 없으면 보내지 않는다.
+- 회로 차단: retryable 실패가 failure_threshold 번 연속되면 open_seconds 동안 호출하지 않고 바로 거절한다.
+  그 뒤 첫 호출 하나만 시험(half-open)으로 보내고, 성공하면 닫고 실패하면 다시 연다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, TypeVar
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WEBSOCHAT_CIRCUIT_CLOSED = "closed"
+WEBSOCHAT_CIRCUIT_OPEN = "open"
+WEBSOCHAT_CIRCUIT_HALF_OPEN = "half_open"
+
+# 회로가 열려 있음 / 동시 호출 상한에서 자리를 얻지 못함
+WEBSOCHAT_PROVIDER_REJECT_CIRCUIT_OPEN = "circuit_open"
+WEBSOCHAT_PROVIDER_REJECT_BUSY = "busy"
+
+
+class WebsochatProviderRejectedError(Exception):
+    """governor 가 provider 를 호출하지 않고 거절한 경우"""
+
+    def __init__(self, provider: str, reason: str):
+        super().__init__(f"{provider} call rejected: {reason}")
+        self.provider = provider
+        self.reason = reason
+
+
+def _never_retryable(exc: BaseException) -> bool:
+    return False
+
+
+class WebsochatProviderGovernor:
+    """provider 하나의 동시 호출 상한 + 재시도 + hedge + 회로 차단"""
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        max_in_flight: int = settings.WEBSOCHAT_LLM_MAX_IN_FLIGHT,
+        queue_timeout: float = settings.WEBSOCHAT_LLM_QUEUE_TIMEOUT_SECONDS,
+        max_attempts: int = settings.WEBSOCHAT_LLM_MAX_ATTEMPTS,
+        backoff_base: float = settings.WEBSOCHAT_LLM_RETRY_BACKOFF_SECONDS,
+        backoff_max: float = settings.WEBSOCHAT_LLM_RETRY_BACKOFF_MAX_SECONDS,
+        hedge_enabled: bool = settings.WEBSOCHAT_LLM_HEDGE_ENABLED,
+        hedge_percentile: float = settings.WEBSOCHAT_LLM_HEDGE_PERCENTILE,
+        hedge_min_samples: int = settings.WEBSOCHAT_LLM_HEDGE_MIN_SAMPLES,
+        hedge_min_delay: float = settings.WEBSOCHAT_LLM_HEDGE_MIN_DELAY_SECONDS,
+        latency_window: int = 200,
+        failure_threshold: int = settings.WEBSOCHAT_LLM_CIRCUIT_FAILURE_THRESHOLD,
+        open_seconds: float = settings.WEBSOCHAT_LLM_CIRCUIT_OPEN_SECONDS,
+    ):
+        self.provider = provider
+        self.max_in_flight = max_in_flight
+        self.queue_timeout = queue_timeout
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.hedge_enabled = hedge_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_min_delay = hedge_min_delay
+        self.failure_threshold = max(1, failure_threshold)
+        self.open_seconds = open_seconds
+        self._slots = asyncio.Semaphore(max_in_flight)
+        # hedge 대상(분류) 호출의 성공 지연, 초
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self.state = WEBSOCHAT_CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.in_flight = 0
+        self.max_in_flight_seen = 0
+        self.counters: Counter[str] = Counter()
+
+    def metrics(self) -> dict:
+        hedge_delay = self.hedge_delay()
+        return {
+            **self.counters,
+            "state": self.state,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight_seen,
+            "latency_samples": len(self._latencies),
+            "latency_p50_ms": self._percentile_ms(50),
+            "latency_p95_ms": self._percentile_ms(95),
+            "hedge_delay_ms": round(hedge_delay * 1000, 1) if hedge_delay is not None else None,
+        }
+
+    def _percentile(self, percentile: float) -> float | None:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def _percentile_ms(self, percentile: float) -> float | None:
+        value = self._percentile(percentile)
+        return round(value * 1000, 1) if value is not None else None
+
+    def hedge_delay(self) -> float | None:
+        """hedge 를 보낼 대기 시간(초), 보내지 않으면 None"""
+        if not self.hedge_enabled or len(self._latencies) < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay, self._percentile(self.hedge_percentile) or 0.0)
+
+    def _backoff(self, attempt_no: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt_no - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _enter_circuit(self) -> bool:
+        """호출해도 되면 True (half-open 시험 호출이면 표시한다), 아니면 거절"""
+        if self.state == WEBSOCHAT_CIRCUIT_OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.counters["rejected_open"] += 1
+                raise WebsochatProviderRejectedError(self.provider, WEBSOCHAT_PROVIDER_REJECT_CIRCUIT_OPEN)
+            self.state = WEBSOCHAT_CIRCUIT_HALF_OPEN
+        if self.state == WEBSOCHAT_CIRCUIT_HALF_OPEN:
+            if self._probe_in_flight:
+                self.counters["rejected_open"] += 1
+                raise WebsochatProviderRejectedError(self.provider, WEBSOCHAT_PROVIDER_REJECT_CIRCUIT_OPEN)
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def _record_healthy(self) -> None:
+        # provider 가 응답했으면(성공 또는 재시도 대상이 아닌 오류) 연속 실패를 끊는다
+        self._consecutive_failures = 0
+        if self.state != WEBSOCHAT_CIRCUIT_CLOSED:
+            logger.info("%s circuit closed", self.provider)
+        self.state = WEBSOCHAT_CIRCUIT_CLOSED
+
+    def _record_failure(self) -> None:
+        self.counters["failures"] += 1
+        self._consecutive_failures += 1
+        if self.state == WEBSOCHAT_CIRCUIT_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self.state != WEBSOCHAT_CIRCUIT_OPEN:
+                self.counters["circuit_opened"] += 1
+                logger.warning(
+                    "%s circuit opened after %s consecutive failures",
+                    self.provider,
+                    self._consecutive_failures,
+                )
+            self.state = WEBSOCHAT_CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+
+    @asynccontextmanager
+    async def _slot(self):
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.counters["rejected_busy"] += 1
+            raise WebsochatProviderRejectedError(self.provider, WEBSOCHAT_PROVIDER_REJECT_BUSY) from None
+        self.in_flight += 1
+        self.max_in_flight_seen = max(self.max_in_flight_seen, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def _run_attempt(self, attempt: Callable[[], Awaitable[T]], *, record_latency: bool) -> T:
+        async with self._slot():
+            self.counters["attempts"] += 1
+            started = time.perf_counter()
+            result = await attempt()
+        if record_latency:
+            self._latencies.append(time.perf_counter() - started)
+        return result
+
+    async def _run_hedged(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._run_attempt(attempt, record_latency=True)
+        primary = asyncio.ensure_future(self._run_attempt(attempt, record_latency=True))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or self._slots.locked():
+                return await primary
+            self.counters["hedged"] += 1
+            hedge = asyncio.ensure_future(self._run_attempt(attempt, record_latency=True))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.counters["hedge_won"] += 1
+                        return task.result()
+            # 둘 다 실패하면 먼저 보낸 요청의 오류를 올린다
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def call(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        *,
+        retryable: Callable[[BaseException], bool] = _never_retryable,
+        hedge: bool = False,
+    ) -> T:
+        """
+        attempt 를 호출해 결과를 돌려준다. attempt 는 같은 요청을 다시 보낼 수 있어야 한다(재시도/hedge).
+        retryable(exc) 가 True 인 실패만 재시도하고 회로 차단 실패로 센다.
+        """
+        self.counters["calls"] += 1
+        for attempt_no in range(1, self.max_attempts + 1):
+            probe = self._enter_circuit()
+            try:
+                if hedge:
+                    result = await self._run_hedged(attempt)
+                else:
+                    result = await self._run_attempt(attempt, record_latency=False)
+            except WebsochatProviderRejectedError:
+                raise
+            except Exception as exc:
+                if not retryable(exc):
+                    self._record_healthy()
+                    raise
+                self._record_failure()
+                if attempt_no >= self.max_attempts or self.state == WEBSOCHAT_CIRCUIT_OPEN:
+                    self.counters["gave_up"] += 1
+                    raise
+                self.counters["retries"] += 1
+                logger.warning(
+                    "%s call failed (attempt %s/%s), retrying: %r",
+                    self.provider,
+                    attempt_no,
+                    self.max_attempts,
+                    exc,
+                )
+                await asyncio.sleep(self._backoff(attempt_no))
+                continue
+            finally:
+                if probe:
+                    self._probe_in_flight = False
+            self._record_healthy()
+            return result
+        raise AssertionError("unreachable")
+
+
+websochat_gemini_governor = WebsochatProviderGovernor("gemini")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from difflib import SequenceMatcher
 import json
 import logging
@@ -11,11 +10,10 @@ from typing import Any
 
 from fastapi import status
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.const import ErrorMessages, settings
 from app.exceptions import CustomResponseException
-from app.rdb import likenovel_db_engine
 from app.schemas.websochat import (
     PostWebsochatMessageReqBody,
     PostWebsochatSessionReqBody,
@@ -23,6 +21,7 @@ from app.schemas.websochat import (
     PatchWebsochatSessionReadScopeReqBody,
     PatchWebsochatSessionReqBody,
 )
+from app.services.websochat.websochat_chunk_index import search_chunk_index
 from app.services.websochat.websochat_compare import (
     _build_websochat_pair_key,
     _build_websochat_worldcup_round,
@@ -81,6 +80,13 @@ from app.services.websochat.websochat_game_memory import (
     _serialize_websochat_session_memory,
     _update_websochat_session_memory_after_reply,
 )
+from app.services.websochat.websochat_intent_router import (
+    build_websochat_intent_cache_key,
+    classify_websochat_intent_by_rules,
+    classify_websochat_rp_recall_by_rules,
+    has_websochat_qa_correction_marker,
+    websochat_intent_cache,
+)
 from app.services.websochat.websochat_planner import (
     _build_websochat_qa_plan,
     _build_websochat_rp_plan,
@@ -110,7 +116,21 @@ from app.services.websochat.websochat_scope_resolver import (
     _resolve_websochat_prompt_read_scope_decision,
     _resolve_websochat_scope_read_episode_to,
 )
+from app.services.websochat.websochat_session_context import (
+    update_websochat_session_context,
+    websochat_session_contexts,
+)
 from app.services.websochat.websochat_stream import emit_websochat_stream_text_if_needed
+from app.services.websochat.websochat_turn_lock import (
+    WebsochatTurnLease,
+    WebsochatTurnLeaseLostError,
+    websochat_turn_locks,
+)
+from app.services.websochat.websochat_turn_prep import (
+    WebsochatTurnPrepTrace,
+    WebsochatTurnStep,
+    run_websochat_turn_steps,
+)
 from app.services.websochat.websochat_llm import (
     call_websochat_gemini,
     to_websochat_gemini_contents,
@@ -118,12 +138,21 @@ from app.services.websochat.websochat_llm import (
 from app.services.websochat.websochat_utils import _extract_websochat_json_object
 from app.services.common.comm_service import get_user_from_kc
 from app.utils.common import handle_exceptions
+from app.utils.identity import resolve_user_identity
 from app.utils.query import get_file_path_sub_query
-from app.utils.time import get_full_age
 
 WEBSOCHAT_DEFAULT_TITLE = "새 대화"
-WEBSOCHAT_SESSION_LOCK_TIMEOUT_SECONDS = 0
 WEBSOCHAT_SESSION_TTL_DAYS = 30
+# 턴을 저장할 때 세션 메모리와 함께 고치는 컬럼 (update_websochat_session_context 의 set_clause)
+WEBSOCHAT_SESSION_TURN_SET_CLAUSE = f"""
+    title = CASE
+        WHEN title = :default_title THEN :next_title
+        ELSE title
+    END,
+    expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
+    updated_id = :updated_id,
+    updated_date = NOW()
+"""
 WEBSOCHAT_DAILY_FREE_MESSAGE_LIMIT = 3
 WEBSOCHAT_NONCANONICAL_NEXT_EPISODE_MARKER = "[[websochat:noncanonical:next_episode_write]]\n"
 WEBSOCHAT_MESSAGE_CASH_COST = 20
@@ -147,6 +176,7 @@ async def _call_websochat_gemini_json(
         ),
         max_tokens=max_tokens,
         temperature=0.1,
+        hedge=True,
     )
     parsed = _extract_websochat_json_object(raw_reply)
     return parsed if isinstance(parsed, dict) else {}
@@ -200,6 +230,7 @@ WEBSOCHAT_INTENT_MAX_TOKENS = 120
 WEBSOCHAT_QA_CORRECTION_MAX_TOKENS = 180
 WEBSOCHAT_RP_RECALL_DECISION_MAX_TOKENS = 120
 WEBSOCHAT_RP_RECALL_CONTEXT_CHAR_LIMIT = 1800
+WEBSOCHAT_RP_RECALL_EPISODE_LIMIT = 5
 WEBSOCHAT_ALLOWED_INTENTS = {
     "factual",
     "comparative",
@@ -917,26 +948,11 @@ async def _resolve_effective_adult_yn(
     if requested_adult_yn != "Y" or not kc_user_id:
         return "N"
 
-    query = text(
-        """
-        SELECT
-            DATE_FORMAT(u.birthdate, '%Y-%m-%d') AS birthdate
-        FROM tb_user u
-        WHERE u.kc_user_id = :kc_user_id
-          AND u.use_yn = 'Y'
-        LIMIT 1
-        """
-    )
-    result = await db.execute(query, {"kc_user_id": kc_user_id})
-    user_row = result.mappings().one_or_none()
-    if not user_row:
-        return "N"
-
-    birthdate = user_row.get("birthdate")
-    if not birthdate:
+    identity = await resolve_user_identity(kc_user_id, db)
+    if identity is None:
         return "N"
 
-    return "Y" if get_full_age(date=birthdate) >= 19 else "N"
+    return identity.adult_yn
 
 
 async def _get_websochat_product(product_id: int, adult_yn: str, db: AsyncSession) -> dict[str, Any] | None:
@@ -2263,6 +2279,23 @@ async def _search_websochat_episode_contents(
     db: AsyncSession,
 ) -> list[dict[str, Any]]:
     keywords = _extract_websochat_keywords(query_text)
+    if settings.WEBSOCHAT_CHUNK_INDEX_ENABLED and keywords:
+        # 청크 n-gram 색인이 있는 작품은 BM25 순위, 없으면 아래 LIKE 조회
+        indexed_rows = await search_chunk_index(product_id, keywords, latest_episode_no, db)
+        if indexed_rows is not None:
+            return [
+                {
+                    "episodeNo": item["episodeNo"],
+                    "matchScore": item["matchScore"],
+                    "chunkText": _build_websochat_search_chunk_snippet(
+                        text_value=item["rawText"],
+                        keywords=keywords,
+                        query_text=query_text,
+                    ),
+                }
+                for item in indexed_rows
+            ]
+
     params: dict[str, Any] = {"product_id": product_id}
     where_parts: list[str] = []
     score_parts: list[str] = []
@@ -2369,7 +2402,21 @@ async def _get_websochat_episode_contents(
     return list(grouped.values())
 
 
-async def _get_websochat_recent_messages(session_id: int, db: AsyncSession) -> list[dict[str, str]]:
+def _build_websochat_history_row(role: Any, content: Any) -> dict[str, str] | None:
+    """tb_story_agent_message 한 행 -> 대화 기록 항목 (빈 메시지와 대화 기록에서 빠지는 메시지는 None)"""
+    raw_content = str(content or "")
+    if not raw_content.strip() or _is_websochat_noncanonical_message(raw_content):
+        return None
+    return {
+        "role": str(role or "user"),
+        "content": _strip_websochat_noncanonical_message_marker(raw_content)[:2000],
+    }
+
+
+async def _get_websochat_recent_message_rows(
+    session_id: int,
+    db: AsyncSession,
+) -> list[dict[str, str] | None]:
     result = await db.execute(
         text(
             """
@@ -2387,15 +2434,11 @@ async def _get_websochat_recent_messages(session_id: int, db: AsyncSession) -> l
     )
     rows = [dict(row) for row in result.mappings().all()]
     rows.reverse()
-    return [
-        {
-            "role": str(row.get("role") or "user"),
-            "content": _strip_websochat_noncanonical_message_marker(str(row.get("content") or ""))[:2000],
-        }
-        for row in rows
-        if str(row.get("content") or "").strip()
-        and not _is_websochat_noncanonical_message(str(row.get("content") or ""))
-    ]
+    return [_build_websochat_history_row(row.get("role"), row.get("content")) for row in rows]
+
+
+async def _get_websochat_recent_messages(session_id: int, db: AsyncSession) -> list[dict[str, str]]:
+    return [row for row in await _get_websochat_recent_message_rows(session_id=session_id, db=db) if row]
 
 
 def _build_websochat_system_prompt(product_row: dict[str, Any]) -> str:
@@ -4565,6 +4608,11 @@ async def _resolve_websochat_qa_corrections(
     qa_recent_notes: list[str],
     qa_corrections: list[dict[str, str]],
 ) -> list[dict[str, str]]:
+    if settings.WEBSOCHAT_INTENT_FAST_PATH_ENABLED and not has_websochat_qa_correction_marker(user_prompt):
+        # 바로잡는 표지가 없으면 교정 추출기도 has_corrections=false 로 답하도록 되어 있음
+        websochat_intent_cache.record("qa_corrections", "rule")
+        return []
+    websochat_intent_cache.record("qa_corrections", "llm")
     recent_context_message = build_websochat_recent_context_message(
         recent_messages,
         qa_recent_notes=qa_recent_notes,
@@ -4613,7 +4661,39 @@ async def _resolve_websochat_intent(
     *,
     user_prompt: str,
     recent_messages: list[dict[str, str]],
+    product_id: int = 0,
 ) -> tuple[str, bool, str]:
+    """규칙 분류 -> 작품별 질문 캐시 -> LLM 분류 순 (websochat_intent_router)"""
+    if settings.WEBSOCHAT_INTENT_FAST_PATH_ENABLED:
+        ruled = classify_websochat_intent_by_rules(user_prompt)
+        if ruled is not None:
+            websochat_intent_cache.record("intent", "rule")
+            return ruled
+    cache_key = build_websochat_intent_cache_key(user_prompt)
+    if cache_key is not None:
+        cached = websochat_intent_cache.get(product_id, "intent", "", cache_key)
+        if cached is not None:
+            websochat_intent_cache.record("intent", "cache")
+            return cached
+    websochat_intent_cache.record("intent", "llm")
+    result = await _classify_websochat_intent_with_llm(
+        user_prompt=user_prompt,
+        recent_messages=recent_messages,
+    )
+    if result is None:
+        # 분류 실패 시 기본값은 이번 턴에만 쓰고 캐싱하지 않음
+        return "factual", False, "general"
+    if cache_key is not None:
+        websochat_intent_cache.put(product_id, "intent", "", cache_key, result)
+    return result
+
+
+async def _classify_websochat_intent_with_llm(
+    *,
+    user_prompt: str,
+    recent_messages: list[dict[str, str]],
+) -> tuple[str, bool, str] | None:
+    """LLM 응답에서 intent 를 읽지 못하면 None (호출부에서 기본값 사용)"""
     recent_context_message = build_websochat_recent_context_message(recent_messages)
     system_prompt_parts = [
         "너는 스토리 에이전트 라우팅 전용 분류기다.",
@@ -4658,7 +4738,7 @@ async def _resolve_websochat_intent(
     )
     intent = str(parsed.get("intent") or "").strip().lower()
     if intent not in WEBSOCHAT_ALLOWED_INTENTS:
-        intent = "factual"
+        return None
     mode = str(parsed.get("mode") or "").strip().lower()
     if mode not in WEBSOCHAT_ALLOWED_SUMMARY_MODES:
         mode = "general"
@@ -4675,7 +4755,43 @@ async def _resolve_websochat_rp_recall_need(
     user_prompt: str,
     recent_messages: list[dict[str, str]],
     rp_context: dict[str, Any],
+    product_id: int = 0,
 ) -> tuple[bool, str]:
+    """규칙(회상 불필요 발화) -> 작품/캐릭터/anchor 별 질문 캐시 -> LLM 판단 순"""
+    if settings.WEBSOCHAT_INTENT_FAST_PATH_ENABLED and classify_websochat_rp_recall_by_rules(user_prompt) is False:
+        websochat_intent_cache.record("rp_recall", "rule")
+        return False, _build_websochat_prompt_preview(user_prompt)
+    scope_key = (
+        f"{rp_context.get('active_character') or rp_context.get('display_name') or ''}:"
+        f"{int(rp_context.get('anchor_episode_no') or 0)}"
+    )
+    cache_key = build_websochat_intent_cache_key(user_prompt)
+    if cache_key is not None:
+        cached = websochat_intent_cache.get(product_id, "rp_recall", scope_key, cache_key)
+        if cached is not None:
+            websochat_intent_cache.record("rp_recall", "cache")
+            return cached
+    websochat_intent_cache.record("rp_recall", "llm")
+    result = await _classify_websochat_rp_recall_need_with_llm(
+        user_prompt=user_prompt,
+        recent_messages=recent_messages,
+        rp_context=rp_context,
+    )
+    if result is None:
+        # 판단 실패 시 회상 없이 진행하고 캐싱하지 않음
+        return False, _build_websochat_prompt_preview(user_prompt)
+    if cache_key is not None:
+        websochat_intent_cache.put(product_id, "rp_recall", scope_key, cache_key, result)
+    return result
+
+
+async def _classify_websochat_rp_recall_need_with_llm(
+    *,
+    user_prompt: str,
+    recent_messages: list[dict[str, str]],
+    rp_context: dict[str, Any],
+) -> tuple[bool, str] | None:
+    """LLM 응답에서 needs_exact_recall 을 읽지 못하면 None (호출부에서 기본값 사용)"""
     recent_context_message = build_websochat_recent_context_message(recent_messages)
     anchor_episode_no = int(rp_context.get("anchor_episode_no") or 0)
     anchor_summary_text = str(rp_context.get("anchor_summary_text") or "").strip()
@@ -4705,8 +4821,10 @@ async def _resolve_websochat_rp_recall_need(
     raw_needs_exact_recall = parsed.get("needs_exact_recall")
     if isinstance(raw_needs_exact_recall, bool):
         needs_exact_recall = raw_needs_exact_recall
+    elif str(raw_needs_exact_recall or "").strip().lower() in ("true", "false"):
+        needs_exact_recall = str(raw_needs_exact_recall).strip().lower() == "true"
     else:
-        needs_exact_recall = str(raw_needs_exact_recall or "").strip().lower() == "true"
+        return None
     search_query = re.sub(r"\s+", " ", str(parsed.get("search_query") or "").strip())[:120]
     if not search_query:
         search_query = _build_websochat_prompt_preview(user_prompt)
@@ -4720,11 +4838,13 @@ async def _build_websochat_rp_exact_recall_context(
     recent_messages: list[dict[str, str]],
     rp_context: dict[str, Any],
     db: AsyncSession,
+    turn_trace: WebsochatTurnPrepTrace | None = None,
 ) -> dict[str, Any]:
     needs_exact_recall, search_query = await _resolve_websochat_rp_recall_need(
         user_prompt=user_prompt,
         recent_messages=recent_messages,
         rp_context=rp_context,
+        product_id=int(product_row.get("productId") or 0),
     )
     if not needs_exact_recall:
         return {}
@@ -4748,53 +4868,106 @@ async def _build_websochat_rp_exact_recall_context(
         candidate_episode_nos.append(episode_no)
 
     keywords = _extract_websochat_keywords(search_query or user_prompt)
-    summary_rows = await _get_websochat_summary_candidates(
-        product_id=int(product_row.get("productId") or 0),
-        keywords=keywords,
-        query_text=search_query or user_prompt,
-        latest_episode_no=latest_public_episode_no,
-        mode="general",
-        episode_no=None,
-        db=db,
-    )
-    for row in summary_rows[:3]:
-        for episode_no in [
-            int(row.get("episodeTo") or 0),
-            int(row.get("episodeFrom") or 0),
-        ]:
-            if (
-                episode_no <= 0
-                or episode_no > latest_public_episode_no
-                or episode_no in candidate_episode_order
-            ):
-                continue
-            candidate_episode_order[episode_no] = len(candidate_episode_order)
-            candidate_episode_nos.append(episode_no)
-
-    prioritized_rows: list[dict[str, Any]] = []
-    if candidate_episode_nos:
-        for episode_no in candidate_episode_nos[:5]:
+    # 앵커/이동 기록 회차 원문은 요약 후보와 무관하게 정해지므로 요약 후보 조회와 동시에 읽는다
+    trajectory_episode_nos = candidate_episode_nos[:WEBSOCHAT_RP_RECALL_EPISODE_LIMIT]
+
+    async def _fetch_episode_rows(
+        episode_nos: list[int],
+        step_db: AsyncSession,
+    ) -> list[tuple[int, list[dict[str, Any]]]]:
+        fetched: list[tuple[int, list[dict[str, Any]]]] = []
+        for episode_no in episode_nos:
             episode_rows = await _get_websochat_episode_contents(
                 product_id=int(product_row.get("productId") or 0),
                 episode_from=episode_no,
                 episode_to=episode_no,
                 latest_episode_no=latest_public_episode_no,
-                db=db,
+                db=step_db,
             )
-            for row in episode_rows:
-                chunk_text = str(row.get("chunkText") or "").strip()
-                if not chunk_text:
-                    continue
-                score = sum(1 for keyword in keywords if keyword and keyword in chunk_text)
-                if keywords and score <= 0:
+            fetched.append((episode_no, episode_rows))
+        return fetched
+
+    async def _load_summary_candidates(results: dict[str, Any], step_db: AsyncSession) -> list[dict[str, Any]]:
+        return await _get_websochat_summary_candidates(
+            product_id=int(product_row.get("productId") or 0),
+            keywords=keywords,
+            query_text=search_query or user_prompt,
+            latest_episode_no=latest_public_episode_no,
+            mode="general",
+            episode_no=None,
+            db=step_db,
+        )
+
+    async def _load_trajectory_episodes(
+        results: dict[str, Any],
+        step_db: AsyncSession,
+    ) -> list[tuple[int, list[dict[str, Any]]]]:
+        return await _fetch_episode_rows(trajectory_episode_nos, step_db)
+
+    async def _load_summary_episodes(
+        results: dict[str, Any],
+        step_db: AsyncSession,
+    ) -> list[tuple[int, list[dict[str, Any]]]]:
+        for row in results["rp_exact_recall/summary_candidates"][:3]:
+            for episode_no in [
+                int(row.get("episodeTo") or 0),
+                int(row.get("episodeFrom") or 0),
+            ]:
+                if (
+                    episode_no <= 0
+                    or episode_no > latest_public_episode_no
+                    or episode_no in candidate_episode_order
+                ):
                     continue
-                prioritized_rows.append(
-                    {
-                        "episodeNo": episode_no,
-                        "chunkText": chunk_text,
-                        "matchScore": score,
-                    }
-                )
+                candidate_episode_order[episode_no] = len(candidate_episode_order)
+                candidate_episode_nos.append(episode_no)
+        return await _fetch_episode_rows(
+            candidate_episode_nos[len(trajectory_episode_nos):WEBSOCHAT_RP_RECALL_EPISODE_LIMIT],
+            step_db,
+        )
+
+    recall_results = await run_websochat_turn_steps(
+        [
+            WebsochatTurnStep(
+                name="rp_exact_recall/summary_candidates",
+                run=_load_summary_candidates,
+                uses_db=True,
+            ),
+            WebsochatTurnStep(
+                name="rp_exact_recall/trajectory_episodes",
+                run=_load_trajectory_episodes,
+                uses_db=True,
+            ),
+            WebsochatTurnStep(
+                name="rp_exact_recall/summary_episodes",
+                run=_load_summary_episodes,
+                deps=("rp_exact_recall/summary_candidates",),
+                uses_db=True,
+            ),
+        ],
+        db=db,
+        trace=turn_trace or WebsochatTurnPrepTrace(label="rp_exact_recall"),
+    )
+
+    prioritized_rows: list[dict[str, Any]] = []
+    for episode_no, episode_rows in [
+        *recall_results["rp_exact_recall/trajectory_episodes"],
+        *recall_results["rp_exact_recall/summary_episodes"],
+    ]:
+        for row in episode_rows:
+            chunk_text = str(row.get("chunkText") or "").strip()
+            if not chunk_text:
+                continue
+            score = sum(1 for keyword in keywords if keyword and keyword in chunk_text)
+            if keywords and score <= 0:
+                continue
+            prioritized_rows.append(
+                {
+                    "episodeNo": episode_no,
+                    "chunkText": chunk_text,
+                    "matchScore": score,
+                }
+            )
 
     if prioritized_rows:
         chunk_rows = sorted(
@@ -4854,6 +5027,141 @@ async def _build_websochat_rp_exact_recall_context(
     }
 
 
+def _build_websochat_turn_prep_steps(
+    *,
+    session_id: int,
+    normalized_memory: dict[str, Any],
+    product_row: dict[str, Any],
+    user_prompt: str,
+    load_rp_context: bool,
+    turn_trace: WebsochatTurnPrepTrace,
+    context_version: int | None = None,
+) -> list[WebsochatTurnStep]:
+    """
+    답변 생성 전 조회 단계
+    - recent_messages / rp_context / scope_context 는 서로 무관한 DB 조회
+    - rp_exact_recall(RP 원문 회상)은 rp_context 와 최근 대화가 있어야 한다
+    - intent / qa_corrections(LLM)는 최근 대화가 있어야 하고, RP 로 답할 턴이면 건너뛴다
+    - context_version 을 알면 최근 대화는 세션 문맥 캐시에서 먼저 찾는다
+    """
+    product_id = int(product_row.get("productId") or 0)
+    routing_deps = ("rp_context",) if load_rp_context else ()
+
+    def _is_rp_turn(results: dict[str, Any]) -> bool:
+        # rp_context 가 있으면 항상 RP 로 답한다 (게임 모드는 여기까지 오지 않는다)
+        return bool(results.get("rp_context"))
+
+    async def _load_recent_messages(results: dict[str, Any], step_db: AsyncSession) -> list[dict[str, str]]:
+        if context_version is None:
+            return await _get_websochat_recent_messages(session_id=session_id, db=step_db)
+        return await websochat_session_contexts.recent_messages(
+            session_id,
+            context_version,
+            lambda: _get_websochat_recent_message_rows(session_id=session_id, db=step_db),
+            limit=WEBSOCHAT_MAX_HISTORY_MESSAGES,
+        )
+
+    async def _load_rp_context(results: dict[str, Any], step_db: AsyncSession) -> dict[str, Any] | None:
+        return await _load_websochat_rp_context(
+            product_row=product_row,
+            session_memory=normalized_memory,
+            db=step_db,
+        )
+
+    async def _load_rp_exact_recall(results: dict[str, Any], step_db: AsyncSession) -> dict[str, Any] | None:
+        if not _is_rp_turn(results):
+            return None
+        return await _build_websochat_rp_exact_recall_context(
+            product_row=product_row,
+            user_prompt=user_prompt,
+            recent_messages=results["recent_messages"],
+            rp_context=results["rp_context"],
+            db=step_db,
+            turn_trace=turn_trace,
+        )
+
+    async def _resolve_intent(results: dict[str, Any], step_db: AsyncSession) -> tuple[str, bool, str] | None:
+        if _is_rp_turn(results):
+            return None
+        return await _resolve_websochat_intent(
+            user_prompt=user_prompt,
+            recent_messages=results["recent_messages"],
+            product_id=product_id,
+        )
+
+    async def _resolve_corrections(results: dict[str, Any], step_db: AsyncSession) -> list[dict[str, str]]:
+        if _is_rp_turn(results):
+            return []
+        return await _resolve_websochat_qa_corrections(
+            user_prompt=user_prompt,
+            recent_messages=results["recent_messages"],
+            qa_recent_notes=list(normalized_memory.get("qa_recent_notes") or []),
+            qa_corrections=list(normalized_memory.get("qa_corrections") or []),
+        )
+
+    async def _load_scope_context(results: dict[str, Any], step_db: AsyncSession) -> WebsochatEvidenceBundle | None:
+        if _is_rp_turn(results):
+            return None
+        # 교정 병합은 qa_corrections 만 바꾸고 범위(read_episode_to)는 그대로라 교정 추출을 기다리지 않는다
+        return await assemble_websochat_scope_context(
+            product_row=product_row,
+            session_memory=normalized_memory,
+            user_prompt=user_prompt,
+            db=step_db,
+        )
+
+    def _fallback_intent(exc: Exception) -> tuple[str, bool, str]:
+        logger.warning(
+            "websochat intent_resolution_failed fallback=factual prompt_preview=%r",
+            _build_websochat_prompt_preview(user_prompt),
+            exc_info=(type(exc), exc, exc.__traceback__),
+        )
+        return ("factual", False, "general")
+
+    def _fallback_corrections(exc: Exception) -> list[dict[str, str]]:
+        logger.warning(
+            "websochat qa_corrections_resolution_failed fallback=empty prompt_preview=%r",
+            _build_websochat_prompt_preview(user_prompt),
+            exc_info=(type(exc), exc, exc.__traceback__),
+        )
+        return []
+
+    steps = [
+        WebsochatTurnStep(name="recent_messages", run=_load_recent_messages, uses_db=True),
+    ]
+    if load_rp_context:
+        steps += [
+            WebsochatTurnStep(name="rp_context", run=_load_rp_context, uses_db=True),
+            WebsochatTurnStep(
+                name="rp_exact_recall",
+                run=_load_rp_exact_recall,
+                deps=("rp_context", "recent_messages"),
+                uses_db=True,
+            ),
+        ]
+    steps += [
+        WebsochatTurnStep(
+            name="intent",
+            run=_resolve_intent,
+            deps=(*routing_deps, "recent_messages"),
+            fallback=_fallback_intent,
+        ),
+        WebsochatTurnStep(
+            name="qa_corrections",
+            run=_resolve_corrections,
+            deps=(*routing_deps, "recent_messages"),
+            fallback=_fallback_corrections,
+        ),
+        WebsochatTurnStep(
+            name="scope_context",
+            run=_load_scope_context,
+            deps=routing_deps,
+            uses_db=True,
+        ),
+    ]
+    return steps
+
+
 async def _generate_websochat_reply(
     *,
     session_id: int,
@@ -4863,6 +5171,8 @@ async def _generate_websochat_reply(
     user_id: int | None,
     db: AsyncSession,
     forced_route: str | None = None,
+    turn_trace: WebsochatTurnPrepTrace | None = None,
+    context_version: int | None = None,
 ) -> tuple[str, str, str, bool, str, dict[str, Any] | None]:
     normalized_memory = _normalize_websochat_session_memory(session_memory)
     gemini_enabled = bool(settings.GEMINI_API_KEY)
@@ -4931,27 +5241,28 @@ async def _generate_websochat_reply(
             None,
         )
 
-    rp_context = None
-    active_route = normalized_forced_route or "qa"
-    if normalized_forced_route != "qa":
-        rp_context = await _load_websochat_rp_context(
-            product_row=product_row,
-            session_memory=normalized_memory,
-            db=db,
-        )
-        active_route = normalized_forced_route or _resolve_websochat_response_route(
+    turn_trace = turn_trace or WebsochatTurnPrepTrace(label=f"session:{session_id}")
+    prep_results = await run_websochat_turn_steps(
+        _build_websochat_turn_prep_steps(
+            session_id=session_id,
             normalized_memory=normalized_memory,
-            rp_context=rp_context,
-        )
-    recent_messages = await _get_websochat_recent_messages(session_id=session_id, db=db)
-    if active_route == "rp" and rp_context:
-        exact_recall_context = await _build_websochat_rp_exact_recall_context(
             product_row=product_row,
             user_prompt=user_prompt,
-            recent_messages=recent_messages,
-            rp_context=rp_context,
-            db=db,
-        )
+            load_rp_context=normalized_forced_route != "qa",
+            turn_trace=turn_trace,
+            context_version=context_version,
+        ),
+        db=db,
+        trace=turn_trace,
+    )
+    rp_context = prep_results.get("rp_context")
+    active_route = normalized_forced_route or _resolve_websochat_response_route(
+        normalized_memory=normalized_memory,
+        rp_context=rp_context,
+    )
+    recent_messages = prep_results["recent_messages"]
+    if active_route == "rp" and rp_context:
+        exact_recall_context = prep_results["rp_exact_recall"]
         if exact_recall_context:
             rp_context = {
                 **rp_context,
@@ -4962,6 +5273,7 @@ async def _generate_websochat_reply(
             gemini_enabled=gemini_enabled,
         )
         if rp_plan["preferred_model"] == "gemini":
+            turn_trace.log(route_mode=rp_plan["route_mode"])
             reply = await generate_websochat_rp_reply_with_gemini(
                 product_row=product_row,
                 user_prompt=user_prompt,
@@ -4975,42 +5287,8 @@ async def _generate_websochat_reply(
             message="AI 생성 설정을 확인하는 중이에요. 잠시 후 다시 시도해 주세요.",
         )
 
-    intent_result, detected_qa_corrections = await asyncio.gather(
-        _resolve_websochat_intent(
-            user_prompt=user_prompt,
-            recent_messages=recent_messages,
-        ),
-        _resolve_websochat_qa_corrections(
-            user_prompt=user_prompt,
-            recent_messages=recent_messages,
-            qa_recent_notes=list(normalized_memory.get("qa_recent_notes") or []),
-            qa_corrections=list(normalized_memory.get("qa_corrections") or []),
-        ),
-        return_exceptions=True,
-    )
-    if isinstance(intent_result, Exception):
-        logger.warning(
-            "websochat intent_resolution_failed fallback=factual prompt_preview=%r",
-            _build_websochat_prompt_preview(user_prompt),
-            exc_info=(
-                type(intent_result),
-                intent_result,
-                intent_result.__traceback__,
-            ),
-        )
-        intent_result = ("factual", False, "general")
-    if isinstance(detected_qa_corrections, Exception):
-        logger.warning(
-            "websochat qa_corrections_resolution_failed fallback=empty prompt_preview=%r",
-            _build_websochat_prompt_preview(user_prompt),
-            exc_info=(
-                type(detected_qa_corrections),
-                detected_qa_corrections,
-                detected_qa_corrections.__traceback__,
-            ),
-        )
-        detected_qa_corrections = []
-    intent, needs_creative, routed_mode = intent_result
+    intent, needs_creative, routed_mode = prep_results["intent"]
+    detected_qa_corrections = prep_results["qa_corrections"]
     qa_subtype = resolve_websochat_qa_subtype(user_prompt)
     route_session_memory: dict[str, Any] | None = None
     if scope_fallback_notice:
@@ -5022,12 +5300,7 @@ async def _generate_websochat_reply(
         )
         route_session_memory = normalized_memory
     latest_episode_no = int(product_row.get("latestEpisodeNo") or 0)
-    evidence_bundle: WebsochatEvidenceBundle = await assemble_websochat_scope_context(
-        product_row=product_row,
-        session_memory=normalized_memory,
-        user_prompt=user_prompt,
-        db=db,
-    )
+    evidence_bundle: WebsochatEvidenceBundle = prep_results["scope_context"]
     scoped_product_row = evidence_bundle["product_row"]
     resolved_mode, _, _, _ = _resolve_websochat_summary_mode(
         query_text=user_prompt,
@@ -5059,6 +5332,7 @@ async def _generate_websochat_reply(
         "is_ambiguous_reference_query": _is_websochat_ambiguous_reference_query,
         "dispatch_tool": _dispatch_websochat_tool,
     }
+    turn_trace.log(route_mode=qa_plan["route_mode"])
     result: WebsochatQaExecutionResult = await execute_websochat_qa(
         product_row=scoped_product_row,
         user_prompt=user_prompt,
@@ -5164,46 +5438,27 @@ async def _get_websochat_chunk_previews(
     return [dict(row) for row in fallback_result.mappings().all()]
 
 
-async def _acquire_named_lock(lock_name: str) -> AsyncConnection | None:
-    conn = await likenovel_db_engine.connect()
-    if await _acquire_named_lock_on_connection(lock_name, conn):
-        return conn
-    await conn.close()
-    return None
-
-
-async def _acquire_named_lock_on_connection(lock_name: str, conn: AsyncConnection) -> bool:
-    result = await conn.execute(
-        text("SELECT GET_LOCK(:lock_name, :timeout) AS locked"),
-        {"lock_name": lock_name, "timeout": WEBSOCHAT_SESSION_LOCK_TIMEOUT_SECONDS},
-    )
-    row = result.mappings().one()
-    return bool(row.get("locked"))
+async def _acquire_websochat_session_lock(session_id: int) -> WebsochatTurnLease | None:
+    return await websochat_turn_locks.acquire(f"websochat-session:{session_id}")
 
 
-async def _release_named_lock(lock_name: str, conn: AsyncConnection | None) -> None:
-    if conn is None:
+async def _release_websochat_session_lock(session_id: int, lease: WebsochatTurnLease | None) -> None:
+    if lease is None:
         return
-    try:
-        await _release_named_lock_on_connection(lock_name, conn)
-    except Exception as exc:
-        logger.warning("failed to release named lock [%s]: %s", lock_name, exc)
-    finally:
-        await conn.close()
+    await websochat_turn_locks.release(lease, f"websochat-session:{session_id}")
 
 
-async def _release_named_lock_on_connection(lock_name: str, conn: AsyncConnection | None) -> None:
-    if conn is None:
+async def _ensure_websochat_turn_lease_held(lease: WebsochatTurnLease | None, db: AsyncSession) -> None:
+    """턴 저장 직전 확인: 그 사이 다른 워커가 세션/사용자 잠금을 가져갔으면 저장하지 않고 409"""
+    if lease is None:
         return
-    await conn.execute(text("SELECT RELEASE_LOCK(:lock_name)"), {"lock_name": lock_name})
-
-
-async def _acquire_websochat_session_lock(session_id: int) -> AsyncConnection | None:
-    return await _acquire_named_lock(f"websochat-session:{session_id}")
-
-
-async def _release_websochat_session_lock(session_id: int, conn: AsyncConnection | None) -> None:
-    await _release_named_lock(f"websochat-session:{session_id}", conn)
+    try:
+        await websochat_turn_locks.ensure_held(lease, db)
+    except WebsochatTurnLeaseLostError:
+        raise CustomResponseException(
+            status_code=status.HTTP_409_CONFLICT,
+            message="같은 세션에서 다른 메시지를 처리 중입니다. 잠시 후 다시 시도해주세요.",
+        )
 
 
 def _get_websochat_actor_lock_name(user_id: int | None, guest_key: str | None) -> str:
@@ -5216,39 +5471,38 @@ async def _acquire_websochat_actor_lock(
     user_id: int | None,
     guest_key: str | None,
     db: AsyncSession,
-) -> AsyncConnection | None:
+) -> WebsochatTurnLease | None:
     del db
-    return await _acquire_named_lock(_get_websochat_actor_lock_name(user_id, guest_key))
+    return await websochat_turn_locks.acquire(_get_websochat_actor_lock_name(user_id, guest_key))
 
 
-async def _acquire_websochat_actor_lock_on_connection(
+async def _acquire_websochat_actor_lock_on_lease(
     user_id: int | None,
     guest_key: str | None,
-    conn: AsyncConnection,
+    lease: WebsochatTurnLease,
 ) -> bool:
-    return await _acquire_named_lock_on_connection(
+    return await websochat_turn_locks.acquire_on(
+        lease,
         _get_websochat_actor_lock_name(user_id, guest_key),
-        conn,
     )
 
 
 async def _release_websochat_actor_lock(
     user_id: int | None,
     guest_key: str | None,
-    conn: AsyncConnection | None,
+    lease: WebsochatTurnLease | None,
 ) -> None:
-    await _release_named_lock(_get_websochat_actor_lock_name(user_id, guest_key), conn)
+    if lease is None:
+        return
+    await websochat_turn_locks.release(lease, _get_websochat_actor_lock_name(user_id, guest_key))
 
 
-async def _release_websochat_actor_lock_on_connection(
+async def _release_websochat_actor_lock_on_lease(
     user_id: int | None,
     guest_key: str | None,
-    conn: AsyncConnection | None,
+    lease: WebsochatTurnLease | None,
 ) -> None:
-    await _release_named_lock_on_connection(
-        _get_websochat_actor_lock_name(user_id, guest_key),
-        conn,
-    )
+    await _release_websochat_actor_lock(user_id, guest_key, lease)
 
 
 async def _get_websochat_daily_user_message_count(
@@ -5621,7 +5875,7 @@ async def _get_session_row(
 
     query = text(
         f"""
-        SELECT session_id, product_id, title, session_memory_json, created_date, updated_date
+        SELECT session_id, product_id, title, session_memory_json, context_version, created_date, updated_date
         FROM tb_story_agent_session
         WHERE session_id = :session_id
           AND deleted_yn = 'N'
@@ -5640,6 +5894,43 @@ async def _get_session_row(
     return dict(row)
 
 
+async def _refresh_websochat_session_context_version(
+    session_id: int,
+    context_version: int | None,
+    db: AsyncSession,
+) -> int | None:
+    """
+    턴 잠금을 잡은 뒤의 세션 context_version
+    세션 행은 잠금 전에 읽으므로 그 사이 다른 워커가 턴을 저장했을 수 있다. 버전이 달라졌으면
+    최근 대화/메모리 캐시가 잠금 시점 버전으로 DB 에서 다시 채워지도록 새 버전을 돌려준다.
+    """
+    if context_version is None:
+        return None
+    result = await db.execute(
+        text(
+            """
+            SELECT context_version, session_memory_json
+            FROM tb_story_agent_session
+            WHERE session_id = :session_id
+            """
+        ),
+        {"session_id": session_id},
+    )
+    row = result.mappings().one_or_none()
+    if not row or row["context_version"] == context_version:
+        return context_version
+    locked_version = row["context_version"]
+    logger.info(
+        "websochat session_context moved_before_lease session_id=%s read_version=%s locked_version=%s",
+        session_id,
+        context_version,
+        locked_version,
+    )
+    # 저장 계획(delta)의 기준 문서도 잠금 시점 문서로 맞춘다
+    websochat_session_contexts.resolve_memory(session_id, locked_version, row["session_memory_json"])
+    return locked_version
+
+
 @handle_exceptions
 async def search_products(
     keyword: str,
@@ -6182,7 +6473,12 @@ async def patch_session_mode(
 ):
     user_id, resolved_guest_key = await _resolve_actor(kc_user_id, req_body.guest_key, db)
     session_row = await _get_session_row(session_id, user_id, resolved_guest_key, db)
-    session_memory = _normalize_websochat_session_memory(session_row.get("session_memory_json"))
+    context_version = session_row.get("context_version")
+    session_memory = websochat_session_contexts.resolve_memory(
+        session_id,
+        context_version,
+        session_row.get("session_memory_json"),
+    )
     current_rp_stage = _resolve_websochat_rp_stage(session_memory)
     current_mode_key = "rp" if current_rp_stage in {"awaiting_character", "chatting"} else "qa"
     logger.info(
@@ -6222,24 +6518,20 @@ async def patch_session_mode(
         if req_body.mode_key == "qa":
             next_session_memory["pending_mode_entry_guide"] = "qa_ready"
 
-    await db.execute(
-        text(
-            f"""
-            UPDATE tb_story_agent_session
-            SET session_memory_json = :session_memory_json,
-                expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
-                updated_id = :updated_id,
-                updated_date = NOW()
-            WHERE session_id = :session_id
-            """
-        ),
-        {
-            "session_memory_json": _serialize_websochat_session_memory(next_session_memory),
-            "updated_id": user_id if user_id is not None else settings.DB_DML_DEFAULT_ID,
-            "session_id": session_id,
-        },
+    memory_write = await update_websochat_session_context(
+        session_id=session_id,
+        context_version=context_version,
+        session_memory=next_session_memory,
+        set_clause=f"""
+            expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
+            updated_id = :updated_id,
+            updated_date = NOW()
+        """,
+        params={"updated_id": user_id if user_id is not None else settings.DB_DML_DEFAULT_ID},
+        db=db,
     )
     await db.commit()
+    websochat_session_contexts.apply_write(memory_write)
     logger.info(
         "websochat_debug patch_session_mode:done session_id=%s next_mode=%s next_rp_stage=%s pending_rp=%s pending_mode_guide=%s",
         session_id,
@@ -6267,7 +6559,11 @@ async def patch_session_read_scope(
 ):
     user_id, resolved_guest_key = await _resolve_actor(kc_user_id, req_body.guest_key, db)
     session_row = await _get_session_row(session_id, user_id, resolved_guest_key, db)
-    session_memory = _normalize_websochat_session_memory(session_row.get("session_memory_json"))
+    session_memory = websochat_session_contexts.resolve_memory(
+        session_id,
+        session_row.get("context_version"),
+        session_row.get("session_memory_json"),
+    )
     current_read_episode_to = max(int(session_memory.get("read_episode_to") or 0), 0)
     latest_visible_episode_no = await _get_websochat_latest_visible_episode_no(
         int(session_row["product_id"]),
@@ -6288,23 +6584,20 @@ async def patch_session_read_scope(
         session_memory["read_episode_to"] = resolved_read_episode_to
         session_memory["read_scope_state"] = "known"
         session_memory["read_scope_source"] = "viewer"
-        await db.execute(
-            text(
-                f"""
-                UPDATE tb_story_agent_session
-                SET session_memory_json = :session_memory_json,
-                    expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
-                    updated_id = :updated_id,
-                    updated_date = NOW()
-                WHERE session_id = :session_id
-                """
-            ),
-            {
-                "session_memory_json": _serialize_websochat_session_memory(session_memory),
-                "updated_id": user_id if user_id is not None else settings.DB_DML_DEFAULT_ID,
-                "session_id": session_id,
-            },
+        await update_websochat_session_context(
+            session_id=session_id,
+            context_version=session_row.get("context_version"),
+            session_memory=session_memory,
+            set_clause=f"""
+                expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
+                updated_id = :updated_id,
+                updated_date = NOW()
+            """,
+            params={"updated_id": user_id if user_id is not None else settings.DB_DML_DEFAULT_ID},
+            db=db,
         )
+        # commit 은 요청 세션이 끝날 때 하므로 캐시는 반영하지 않고 비운다
+        websochat_session_contexts.invalidate(session_id)
 
     read_episode_title = await _get_websochat_visible_episode_title(
         int(session_row["product_id"]),
@@ -6347,9 +6640,86 @@ async def delete_session(
             "session_id": session_id,
         },
     )
+    websochat_session_contexts.invalidate(session_id)
     return {"data": {"sessionId": session_id, "deletedYn": "Y"}}
 
 
+def _build_websochat_session_prep_steps(
+    *,
+    session_id: int,
+    req_body: PostWebsochatMessageReqBody,
+    kc_user_id: str | None,
+) -> list[WebsochatTurnStep]:
+    """
+    post_message 앞단 조회 단계
+    - actor -> session_row -> character_resolution / product_row -> prompt_read_episode_to
+    - adult_yn 은 actor 와 같은 사용자 식별 정보를 쓰므로 actor 뒤에 두어 요청 memo 를 탄다
+    """
+
+    async def _load_actor(results: dict[str, Any], step_db: AsyncSession) -> tuple[int | None, str | None]:
+        return await _resolve_actor(kc_user_id, req_body.guest_key, step_db)
+
+    async def _load_session_row(results: dict[str, Any], step_db: AsyncSession) -> dict[str, Any]:
+        user_id, resolved_guest_key = results["actor"]
+        return await _get_session_row(session_id, user_id, resolved_guest_key, step_db)
+
+    async def _load_adult_yn(results: dict[str, Any], step_db: AsyncSession) -> str:
+        return await _resolve_effective_adult_yn(
+            kc_user_id=kc_user_id,
+            adult_yn="Y",
+            db=step_db,
+        )
+
+    async def _load_character_resolution(results: dict[str, Any], step_db: AsyncSession) -> dict[str, Any]:
+        return await _resolve_websochat_active_character_resolution(
+            product_id=int(results["session_row"]["product_id"]),
+            active_character=req_body.active_character,
+            db=step_db,
+        )
+
+    async def _load_product_row(results: dict[str, Any], step_db: AsyncSession) -> dict[str, Any] | None:
+        return await _get_websochat_product(
+            product_id=int(results["session_row"]["product_id"]),
+            adult_yn=results["adult_yn"],
+            db=step_db,
+        )
+
+    async def _load_prompt_read_episode_to(results: dict[str, Any], step_db: AsyncSession) -> int | None:
+        product_row = results["product_row"]
+        if not product_row:
+            return None
+        return await _resolve_websochat_prompt_read_episode_to(
+            product_id=int(results["session_row"]["product_id"]),
+            latest_episode_no=max(int(product_row.get("latestEpisodeNo") or 0), 0),
+            user_prompt=req_body.content,
+            db=step_db,
+        )
+
+    return [
+        WebsochatTurnStep(name="actor", run=_load_actor, uses_db=True),
+        WebsochatTurnStep(name="session_row", run=_load_session_row, deps=("actor",), uses_db=True),
+        WebsochatTurnStep(name="adult_yn", run=_load_adult_yn, deps=("actor",), uses_db=True),
+        WebsochatTurnStep(
+            name="character_resolution",
+            run=_load_character_resolution,
+            deps=("session_row",),
+            uses_db=True,
+        ),
+        WebsochatTurnStep(
+            name="product_row",
+            run=_load_product_row,
+            deps=("session_row", "adult_yn"),
+            uses_db=True,
+        ),
+        WebsochatTurnStep(
+            name="prompt_read_episode_to",
+            run=_load_prompt_read_episode_to,
+            deps=("product_row",),
+            uses_db=True,
+        ),
+    ]
+
+
 @handle_exceptions
 async def post_message(
     session_id: int,
@@ -6368,9 +6738,24 @@ async def post_message(
         req_body.client_message_id,
         _build_websochat_prompt_preview(req_body.content),
     )
-    user_id, resolved_guest_key = await _resolve_actor(kc_user_id, req_body.guest_key, db)
-    session_row = await _get_session_row(session_id, user_id, resolved_guest_key, db)
-    current_session_memory = _normalize_websochat_session_memory(session_row.get("session_memory_json"))
+    turn_trace = WebsochatTurnPrepTrace(label=f"session:{session_id}")
+    session_prep = await run_websochat_turn_steps(
+        _build_websochat_session_prep_steps(
+            session_id=session_id,
+            req_body=req_body,
+            kc_user_id=kc_user_id,
+        ),
+        db=db,
+        trace=turn_trace,
+    )
+    user_id, resolved_guest_key = session_prep["actor"]
+    session_row = session_prep["session_row"]
+    context_version = session_row.get("context_version")
+    current_session_memory = websochat_session_contexts.resolve_memory(
+        session_id,
+        context_version,
+        session_row.get("session_memory_json"),
+    )
     starter_mode_key = str(req_body.starter_mode_key or "").strip().lower() or None
     qa_action_key = str(req_body.qa_action_key or "").strip().lower() or None
     if starter_mode_key == "qa":
@@ -6382,11 +6767,7 @@ async def post_message(
     explicit_game_mode = req_body.game_mode
     if starter_mode_key == "ideal_worldcup" and not explicit_game_mode:
         explicit_game_mode = "ideal_worldcup"
-    resolution = await _resolve_websochat_active_character_resolution(
-        product_id=int(session_row["product_id"]),
-        active_character=req_body.active_character,
-        db=db,
-    )
+    resolution = session_prep["character_resolution"]
     resolved_active_character = str(resolution.get("scopeKey") or "").strip() or None
     resolved_active_character_label = (
         str(resolution.get("displayName") or "").strip()
@@ -6450,16 +6831,8 @@ async def post_message(
             user_prompt=req_body.content,
             game_read_episode_to=req_body.game_read_episode_to,
         )
-    effective_adult_yn = await _resolve_effective_adult_yn(
-        kc_user_id=kc_user_id,
-        adult_yn="Y",
-        db=db,
-    )
-    product_row = await _get_websochat_product(
-        product_id=int(session_row["product_id"]),
-        adult_yn=effective_adult_yn,
-        db=db,
-    )
+    effective_adult_yn = session_prep["adult_yn"]
+    product_row = session_prep["product_row"]
     if not product_row:
         product_state = await _get_websochat_product_session_state(
             product_id=int(session_row["product_id"]),
@@ -6481,12 +6854,7 @@ async def post_message(
             status_code=status.HTTP_400_BAD_REQUEST,
             message=_build_websochat_next_episode_write_pending_message(synced_latest_episode_no),
         )
-    inferred_prompt_read_episode_to = await _resolve_websochat_prompt_read_episode_to(
-        product_id=int(session_row["product_id"]),
-        latest_episode_no=latest_episode_no,
-        user_prompt=req_body.content,
-        db=db,
-    )
+    inferred_prompt_read_episode_to = session_prep["prompt_read_episode_to"]
     read_scope_decision: WebsochatPromptReadScopeDecision = _resolve_websochat_prompt_read_scope_decision(
         user_prompt=req_body.content,
         inferred_read_episode_to=inferred_prompt_read_episode_to,
@@ -6533,15 +6901,20 @@ async def post_message(
 
     created_id = user_id if user_id is not None else settings.DB_DML_DEFAULT_ID
 
-    session_lock_conn: AsyncConnection | None = None
+    session_lock: WebsochatTurnLease | None = None
     actor_lock_acquired = False
     try:
-        session_lock_conn = await _acquire_websochat_session_lock(session_id=session_id)
-        if session_lock_conn is None:
+        session_lock = await _acquire_websochat_session_lock(session_id=session_id)
+        if session_lock is None:
             raise CustomResponseException(
                 status_code=status.HTTP_409_CONFLICT,
                 message="같은 세션에서 다른 메시지를 처리 중입니다. 잠시 후 다시 시도해주세요.",
             )
+        context_version = await _refresh_websochat_session_context_version(
+            session_id=session_id,
+            context_version=context_version,
+            db=db,
+        )
 
         concierge_payload = None
         if _resolve_websochat_read_scope_state(next_session_memory) == "none":
@@ -6572,10 +6945,10 @@ async def post_message(
                 }
             }
 
-        actor_lock_acquired = await _acquire_websochat_actor_lock_on_connection(
+        actor_lock_acquired = await _acquire_websochat_actor_lock_on_lease(
             user_id=user_id,
             guest_key=resolved_guest_key,
-            conn=session_lock_conn,
+            lease=session_lock,
         )
         if not actor_lock_acquired:
             raise CustomResponseException(
@@ -6584,6 +6957,7 @@ async def post_message(
             )
 
         if character_resolution_clarify_reply:
+            await _ensure_websochat_turn_lease_held(session_lock, db)
             user_content = str(req_body.content or req_body.active_character or "").strip()
             insert_query = text(
                 """
@@ -6630,34 +7004,30 @@ async def post_message(
                 created_id=created_id,
                 db=db,
             )
-            await db.execute(
-                text(
-                    f"""
-                    UPDATE tb_story_agent_session
-                    SET title = CASE
-                            WHEN title = :default_title THEN :next_title
-                            ELSE title
-                        END,
-                        session_memory_json = :session_memory_json,
-                        expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
-                        updated_id = :updated_id,
-                        updated_date = NOW()
-                    WHERE session_id = :session_id
-                    """
-                ),
-                {
+            memory_write = await update_websochat_session_context(
+                session_id=session_id,
+                context_version=context_version,
+                session_memory=next_session_memory,
+                set_clause=WEBSOCHAT_SESSION_TURN_SET_CLAUSE,
+                params={
                     "default_title": WEBSOCHAT_DEFAULT_TITLE,
                     "next_title": _resolve_websochat_next_session_title(
                         default_prompt=user_content,
                         starter_mode_key=starter_mode_key,
                         session_memory=next_session_memory,
                     ),
-                    "session_memory_json": _serialize_websochat_session_memory(next_session_memory),
                     "updated_id": created_id,
-                    "session_id": session_id,
                 },
+                db=db,
             )
             await db.commit()
+            websochat_session_contexts.apply_write(
+                memory_write,
+                history_rows=[
+                    _build_websochat_history_row("user", user_content),
+                    _build_websochat_history_row("assistant", character_resolution_clarify_reply),
+                ],
+            )
             logger.info(
                 "websochat rp_resolution_clarify_completed session_id=%s raw=%s resolution_source=%s",
                 session_id,
@@ -6736,6 +7106,8 @@ async def post_message(
                     user_id=user_id,
                     db=db,
                     forced_route="qa",
+                    turn_trace=turn_trace,
+                    context_version=context_version,
                 )
             elif active_mode in WEBSOCHAT_ALLOWED_GAME_MODES:
                 assistant_reply = (
@@ -6838,7 +7210,10 @@ async def post_message(
                 user_id=user_id,
                 db=db,
                 forced_route=forced_route,
+                turn_trace=turn_trace,
+                context_version=context_version,
             )
+        turn_trace.log(route_mode=route_mode)
         await emit_websochat_stream_text_if_needed(assistant_reply)
         route_referenced_episode_nos: list[int] = []
         if route_session_memory is not None:
@@ -6861,6 +7236,7 @@ async def post_message(
                 assistant_reply=assistant_reply,
             )
 
+        await _ensure_websochat_turn_lease_held(session_lock, db)
         insert_query = text(
             """
             INSERT INTO tb_story_agent_message (
@@ -6871,13 +7247,21 @@ async def post_message(
             )
             """
         )
+        user_message_content = _mark_websochat_noncanonical_message(
+            req_body.content,
+            qa_action_key=effective_qa_action_key,
+        )
+        assistant_message_content = _mark_websochat_noncanonical_message(
+            assistant_reply,
+            qa_action_key=effective_qa_action_key,
+        )
         user_result = await db.execute(
             insert_query,
             {
                 "session_id": session_id,
                 "role": "user",
                 "client_message_id": req_body.client_message_id,
-                "content": _mark_websochat_noncanonical_message(req_body.content, qa_action_key=effective_qa_action_key),
+                "content": user_message_content,
                 "created_id": created_id,
             },
         )
@@ -6887,7 +7271,7 @@ async def post_message(
                 "session_id": session_id,
                 "role": "assistant",
                 "client_message_id": req_body.client_message_id,
-                "content": _mark_websochat_noncanonical_message(assistant_reply, qa_action_key=effective_qa_action_key),
+                "content": assistant_message_content,
                 "created_id": settings.DB_DML_DEFAULT_ID,
             },
         )
@@ -6923,36 +7307,31 @@ async def post_message(
             db=db,
         )
 
-        update_title_query = text(
-            f"""
-            UPDATE tb_story_agent_session
-            SET title = CASE
-                    WHEN title = :default_title THEN :next_title
-                    ELSE title
-                END,
-                session_memory_json = :session_memory_json,
-                expires_at = DATE_ADD(NOW(), INTERVAL {WEBSOCHAT_SESSION_TTL_DAYS} DAY),
-                updated_id = :updated_id,
-                updated_date = NOW()
-            WHERE session_id = :session_id
-            """
-        )
-        await db.execute(
-            update_title_query,
-            {
+        memory_write = await update_websochat_session_context(
+            session_id=session_id,
+            context_version=context_version,
+            session_memory=next_session_memory,
+            set_clause=WEBSOCHAT_SESSION_TURN_SET_CLAUSE,
+            params={
                 "default_title": WEBSOCHAT_DEFAULT_TITLE,
                 "next_title": _resolve_websochat_next_session_title(
                     default_prompt=req_body.content,
                     starter_mode_key=starter_mode_key,
                     session_memory=next_session_memory,
                 ),
-                "session_memory_json": _serialize_websochat_session_memory(next_session_memory),
                 "updated_id": created_id,
-                "session_id": session_id,
             },
+            db=db,
         )
 
         await db.commit()
+        websochat_session_contexts.apply_write(
+            memory_write,
+            history_rows=[
+                _build_websochat_history_row("user", user_message_content),
+                _build_websochat_history_row("assistant", assistant_message_content),
+            ],
+        )
         logger.info(
             "websochat reply_completed model_used=%s intent=%s route_mode=%s fallback_used=%s product_id=%s session_id=%s charged_cash=%s prompt_preview=%r",
             model_used,
@@ -7028,10 +7407,10 @@ async def post_message(
         raise
     finally:
         if actor_lock_acquired:
-            await _release_websochat_actor_lock_on_connection(
+            await _release_websochat_actor_lock_on_lease(
                 user_id=user_id,
                 guest_key=resolved_guest_key,
-                conn=session_lock_conn,
+                lease=session_lock,
             )
-        if session_lock_conn is not None:
-            await _release_websochat_session_lock(session_id=session_id, conn=session_lock_conn)
+        if session_lock is not None:
+            await _release_websochat_session_lock(session_id=session_id, lease=session_lock)
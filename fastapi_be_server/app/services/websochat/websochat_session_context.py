@@ -0,0 +1,317 @@
+"""
+웹소챗 세션 대화 문맥 캐시 (post_message / patch_session_mode / patch_session_read_scope)
+
+- 워커 안에 세션별로 정규화된 세션 메모리와 최근 메시지 ring(대화 기록 조회 개수만큼)을 둔다.
+  매 턴 session_memory_json 을 다시 파싱/정규화하고 최근 메시지를 다시 조회하던 비용을 줄인다.
+- 유효성은 tb_story_agent_session.context_version 으로 판단한다. 세션 메모리나 메시지를 쓰는 UPDATE 는
+  항상 context_version 을 1 올리고, 캐시 항목은 세션 행에서 읽은 버전과 같을 때만 쓴다.
+  다른 워커가 턴을 처리하면 버전이 달라지므로 이 워커의 항목은 다음 조회에서 DB 로 다시 채운다.
+- 저장은 바뀐 메모리 키만 JSON_SET 으로 쓴다. 기준 문서(캐시된 버전의 session_memory_json)가
+  정규화 결과와 같은 경우에만 delta 로 쓰고, 그 밖에는 기존처럼 전체 JSON 을 다시 쓴다.
+  delta UPDATE 는 context_version 이 그대로일 때만 반영되고, 그 사이 다른 요청이 세션을 고쳤으면
+  전체 JSON 으로 덮어쓴 뒤(기존 동작) 캐시 항목을 버린다.
+- 캐시는 commit 이 끝난 뒤에만 고친다(apply_write). rollback 된 턴은 캐시에 남지 않는다.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+from app.services.websochat.websochat_game_memory import (
+    _is_websochat_session_memory_empty,
+    _normalize_websochat_session_memory,
+)
+
+logger = logging.getLogger(__name__)
+
+# 최근 메시지 ring 한 칸: {"role", "content"} 또는 대화 기록에서 빠지는 메시지(None)
+WebsochatHistoryRow = dict[str, str] | None
+WebsochatHistoryLoader = Callable[[], Awaitable[list[WebsochatHistoryRow]]]
+
+
+@dataclass
+class _WebsochatSessionContext:
+    version: int
+    # 정규화된 메모리 (캐시 밖으로는 복사본만 내보낸다)
+    memory: dict[str, Any] | None = None
+    # DB 문서를 json.loads 한 결과가 memory 와 같으면 True (delta 저장 가능)
+    canonical: bool = False
+    history: deque[WebsochatHistoryRow] | None = None
+
+
+@dataclass
+class WebsochatSessionMemoryWrite:
+    """세션 메모리 저장 계획 (build_memory_write)"""
+
+    session_id: int
+    from_version: int | None
+    # UPDATE SET 에 넣을 session_memory_json 대입식 (바뀐 키가 없으면 빈 문자열)
+    assignment: str
+    params: dict[str, Any] = field(default_factory=dict)
+    # 저장 뒤 DB 를 다시 읽어 정규화한 것과 같은 메모리
+    memory: dict[str, Any] = field(default_factory=dict)
+    canonical: bool = False
+    # delta 로 쓴 키, 전체 JSON 을 쓰면 None
+    changed_keys: list[str] | None = None
+    # 버전 조건 UPDATE 가 반영되면 from_version + 1, 경합/버전 없음이면 None
+    to_version: int | None = None
+
+
+def _persisted_websochat_session_memory(session_memory: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+    """(저장 뒤 다시 읽으면 나올 정규화 메모리, session_memory_json 값)"""
+    normalized = _normalize_websochat_session_memory(session_memory)
+    if _is_websochat_session_memory_empty(normalized):
+        return _normalize_websochat_session_memory(None), None
+    return normalized, json.dumps(normalized, ensure_ascii=False)
+
+
+def _is_canonical_websochat_session_memory(raw_value: Any, normalized: dict[str, Any]) -> bool:
+    if not isinstance(raw_value, str) or not raw_value.strip():
+        return False
+    try:
+        return json.loads(raw_value) == normalized
+    except Exception:
+        return False
+
+
+class WebsochatSessionContextCache:
+    """session_id -> 세션 문맥(버전, 메모리, 최근 메시지 ring) LRU 캐시"""
+
+    def __init__(
+        self,
+        max_sessions: int = settings.WEBSOCHAT_SESSION_CONTEXT_MAX_SESSIONS,
+        enabled: bool = settings.WEBSOCHAT_SESSION_CONTEXT_CACHE_ENABLED,
+    ):
+        self.max_sessions = max_sessions
+        self.enabled = enabled
+        self._sessions: OrderedDict[int, _WebsochatSessionContext] = OrderedDict()
+        self.counters: Counter[str] = Counter()
+
+    def metrics(self) -> dict:
+        memory_total = self.counters["memory_hits"] + self.counters["memory_misses"]
+        history_total = self.counters["history_hits"] + self.counters["history_misses"]
+        return {
+            **self.counters,
+            "sessions": len(self._sessions),
+            "memory_hit_rate": round(self.counters["memory_hits"] / memory_total, 4) if memory_total else 0.0,
+            "history_hit_rate": round(self.counters["history_hits"] / history_total, 4) if history_total else 0.0,
+        }
+
+    def _get(self, session_id: int, version: int) -> _WebsochatSessionContext | None:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        if entry.version != version:
+            self.counters["stale"] += 1
+            if entry.version < version:
+                # 다른 워커가 쓴 버전: 이 워커의 항목은 더 이상 쓸 수 없다
+                self._sessions.pop(session_id, None)
+            return None
+        self._sessions.move_to_end(session_id)
+        return entry
+
+    def _put(self, session_id: int, entry: _WebsochatSessionContext) -> None:
+        self._sessions[session_id] = entry
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            self.counters["evicted"] += 1
+
+    def resolve_memory(self, session_id: int, version: int | None, raw_memory_json: Any) -> dict[str, Any]:
+        """세션 행(context_version, session_memory_json)에 맞는 정규화 메모리 복사본"""
+        if not self.enabled or version is None:
+            return _normalize_websochat_session_memory(raw_memory_json)
+        entry = self._get(session_id, version)
+        if entry is not None and entry.memory is not None:
+            self.counters["memory_hits"] += 1
+            return copy.deepcopy(entry.memory)
+        self.counters["memory_misses"] += 1
+        normalized = _normalize_websochat_session_memory(raw_memory_json)
+        if entry is None:
+            if session_id in self._sessions:
+                # 이 워커가 이미 더 새 버전을 들고 있다 (늦게 읽은 세션 행)
+                return normalized
+            entry = _WebsochatSessionContext(version=version)
+            self._put(session_id, entry)
+        entry.memory = copy.deepcopy(normalized)
+        entry.canonical = _is_canonical_websochat_session_memory(raw_memory_json, normalized)
+        return normalized
+
+    async def recent_messages(
+        self,
+        session_id: int,
+        version: int | None,
+        loader: WebsochatHistoryLoader,
+        *,
+        limit: int,
+    ) -> list[dict[str, str]]:
+        """
+        version 시점의 최근 대화 (대화 기록에서 빠지는 메시지는 제외), 없으면 loader 로 채운다
+        loader 는 최근 limit 개 메시지를 오래된 순으로 돌려줘야 한다(ring 크기도 limit).
+        """
+        entry = self._get(session_id, version) if self.enabled and version is not None else None
+        if entry is not None and entry.history is not None:
+            self.counters["history_hits"] += 1
+            return [dict(row) for row in entry.history if row]
+        self.counters["history_misses"] += 1
+        rows = await loader()
+        if self.enabled and version is not None:
+            # 조회하는 동안 다른 턴이 버전을 올렸으면 채우지 않는다
+            entry = self._get(session_id, version)
+            if entry is None and session_id not in self._sessions:
+                entry = _WebsochatSessionContext(version=version)
+                self._put(session_id, entry)
+            if entry is not None:
+                entry.history = deque(rows, maxlen=limit)
+        return [dict(row) for row in rows if row]
+
+    def build_memory_write(
+        self,
+        session_id: int,
+        version: int | None,
+        session_memory: dict[str, Any],
+    ) -> WebsochatSessionMemoryWrite:
+        """
+        version 의 문서에서 session_memory 로 가는 session_memory_json 대입식
+        캐시된 기준 문서가 정규화 결과와 같고 저장할 상태가 남아 있으면 바뀐 키만 JSON_SET 으로 쓴다.
+        """
+        persisted, serialized = _persisted_websochat_session_memory(session_memory)
+        write = WebsochatSessionMemoryWrite(
+            session_id=session_id,
+            from_version=version,
+            assignment="session_memory_json = :session_memory_json",
+            params={"session_memory_json": serialized},
+            memory=persisted,
+            canonical=serialized is not None,
+        )
+        entry = self._sessions.get(session_id) if self.enabled and version is not None else None
+        if (
+            entry is None
+            or entry.version != version
+            or entry.memory is None
+            or not entry.canonical
+            or serialized is None
+        ):
+            return write
+        changed_keys = [key for key, value in persisted.items() if entry.memory.get(key) != value]
+        write.changed_keys = changed_keys
+        if not changed_keys:
+            write.assignment = ""
+            write.params = {}
+            return write
+        paths = []
+        write.params = {}
+        for index, key in enumerate(changed_keys):
+            param_name = f"session_memory_value_{index}"
+            paths.append(f"'$.{key}', JSON_EXTRACT(:{param_name}, '$')")
+            write.params[param_name] = json.dumps(persisted[key], ensure_ascii=False)
+        write.assignment = f"session_memory_json = JSON_SET(session_memory_json, {', '.join(paths)})"
+        return write
+
+    def apply_write(
+        self,
+        write: WebsochatSessionMemoryWrite,
+        history_rows: list[WebsochatHistoryRow] | None = None,
+    ) -> None:
+        """commit 된 저장을 캐시에 반영한다. 같은 버전에서 이어 쓴 경우에만 최근 메시지 ring 에 덧붙인다."""
+        if not self.enabled:
+            return
+        if write.to_version is None:
+            self.invalidate(write.session_id)
+            return
+        entry = self._sessions.get(write.session_id)
+        history = None
+        if entry is not None and entry.version == write.from_version and entry.history is not None:
+            history = entry.history
+            history.extend(history_rows or [])
+        elif entry is not None and entry.version > write.to_version:
+            return
+        self._put(
+            write.session_id,
+            _WebsochatSessionContext(
+                version=write.to_version,
+                memory=copy.deepcopy(write.memory),
+                canonical=write.canonical,
+                history=history,
+            ),
+        )
+
+    def invalidate(self, session_id: int) -> None:
+        if self._sessions.pop(session_id, None) is not None:
+            self.counters["invalidated"] += 1
+
+    def clear(self) -> None:
+        self._sessions.clear()
+        self.counters.clear()
+
+
+websochat_session_contexts = WebsochatSessionContextCache()
+
+
+async def update_websochat_session_context(
+    *,
+    session_id: int,
+    context_version: int | None,
+    session_memory: dict[str, Any],
+    set_clause: str,
+    params: dict[str, Any],
+    db: AsyncSession,
+    cache: WebsochatSessionContextCache = websochat_session_contexts,
+) -> WebsochatSessionMemoryWrite:
+    """
+    tb_story_agent_session 에 set_clause 와 세션 메모리를 쓰고 context_version 을 올린다.
+    반환한 저장 계획은 commit 뒤 cache.apply_write 로 캐시에 반영한다.
+    """
+    write = cache.build_memory_write(session_id, context_version, session_memory)
+    if context_version is not None:
+        assignments = ", ".join(part for part in (set_clause, write.assignment) if part)
+        result = await db.execute(
+            text(
+                f"""
+                UPDATE tb_story_agent_session
+                SET {assignments},
+                    context_version = context_version + 1
+                WHERE session_id = :session_id
+                  AND context_version = :context_version
+                """
+            ),
+            {**params, **write.params, "session_id": session_id, "context_version": context_version},
+        )
+        if result.rowcount == 1:
+            cache.counters["delta_writes" if write.changed_keys is not None else "full_writes"] += 1
+            cache.counters["delta_keys"] += len(write.changed_keys or [])
+            write.to_version = context_version + 1
+            return write
+        cache.counters["conflicts"] += 1
+        logger.info(
+            "websochat session_context version conflict session_id=%s context_version=%s",
+            session_id,
+            context_version,
+        )
+
+    # 버전을 모르거나 그 사이 다른 요청이 세션을 고쳤으면 기존처럼 전체 JSON 을 덮어쓴다
+    _, serialized = _persisted_websochat_session_memory(session_memory)
+    await db.execute(
+        text(
+            f"""
+            UPDATE tb_story_agent_session
+            SET {set_clause},
+                session_memory_json = :session_memory_json,
+                context_version = context_version + 1
+            WHERE session_id = :session_id
+            """
+        ),
+        {**params, "session_memory_json": serialized, "session_id": session_id},
+    )
+    cache.counters["full_writes"] += 1
+    write.to_version = None
+    return write
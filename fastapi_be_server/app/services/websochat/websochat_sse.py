@@ -0,0 +1,210 @@
+"""
+웹소챗 SSE 응답 (websochat / story_agent 의 /messages/stream)
+
+- 생산자(post_message 를 돌리는 worker)와 응답 writer 사이를 크기 제한이 있는 큐로 잇는다.
+  큐가 차면 생산자의 put 이 writer 가 비울 때까지 기다리므로, 느린 클라이언트는 LLM 스트림 읽기를 늦춘다.
+- writer 는 delta 를 받으면 coalesce_seconds 동안 뒤따르는 delta 를 모아 프레임 하나로 보낸다
+  (max_frame_chars 까지). 클라이언트가 느려 큐에 쌓인 delta 도 한 프레임으로 합쳐진다.
+  한 번에 들어온 긴 글(스트리밍 없이 만든 답변 등)만 max_frame_chars 단위로 나눈다.
+- 프레임은 이벤트마다 bytes 하나로 한 번만 인코딩해 ASGI send 한 번으로 보낸다
+  (기존 StreamingResponse 는 이벤트당 str 두 조각을 각각 인코딩해 두 번 보냈다).
+- 연결 끊김은 ASGI receive 채널의 http.disconnect 로 바로 감지하고, 생산자 task 를 취소해
+  진행 중인 LLM 호출까지 끊는다(is_disconnected 폴링을 하지 않는다).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+WEBSOCHAT_SSE_DELTA_EVENT = "assistant_delta"
+WEBSOCHAT_SSE_KEEP_ALIVE_FRAME = b": keep-alive\n\n"
+WEBSOCHAT_SSE_DONE_FRAME = b"event: done\ndata: {}\n\n"
+_DELTA_FRAME_PREFIX = b'event: assistant_delta\ndata: {"delta": '
+_DELTA_FRAME_SUFFIX = b"}\n\n"
+_CLOSED = object()
+
+
+def encode_websochat_sse_event(event: str, payload: Any) -> bytes:
+    return b"".join(
+        (
+            b"event: ",
+            event.encode(),
+            b"\ndata: ",
+            json.dumps(payload, ensure_ascii=False).encode(),
+            b"\n\n",
+        )
+    )
+
+
+def encode_websochat_sse_delta(text: str) -> bytes:
+    return b"".join((_DELTA_FRAME_PREFIX, json.dumps(text, ensure_ascii=False).encode(), _DELTA_FRAME_SUFFIX))
+
+
+class WebsochatSseStats:
+    """워커 단위 SSE 스트림 집계"""
+
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+
+    def metrics(self) -> dict:
+        frames = self.counters["delta_frames"]
+        return {
+            **self.counters,
+            "deltas_per_frame": round(self.counters["deltas"] / frames, 2) if frames else 0.0,
+        }
+
+
+websochat_sse_stats = WebsochatSseStats()
+
+
+class WebsochatSseChannel:
+    """생산자 -> writer 이벤트 큐 (maxsize 로 backpressure)"""
+
+    def __init__(self, maxsize: int, stats: WebsochatSseStats = websochat_sse_stats):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._stats = stats
+
+    async def _put(self, item: Any) -> None:
+        if self.queue.full():
+            self._stats.counters["backpressure_waits"] += 1
+        await self.queue.put(item)
+
+    async def send_event(self, event: str, payload: Any) -> None:
+        await self._put((event, payload))
+
+    async def send_delta(self, text: str) -> None:
+        if text:
+            self._stats.counters["deltas"] += 1
+            await self._put((WEBSOCHAT_SSE_DELTA_EVENT, text))
+
+    async def close(self) -> None:
+        await self.queue.put(_CLOSED)
+
+
+WebsochatSseProducer = Callable[[WebsochatSseChannel], Awaitable[None]]
+
+
+class WebsochatSseResponse(Response):
+    """producer(channel) 를 돌리며 channel 의 이벤트를 SSE 로 보내는 응답"""
+
+    media_type = "text/event-stream; charset=utf-8"
+
+    def __init__(
+        self,
+        producer: WebsochatSseProducer,
+        *,
+        headers: dict[str, str] | None = None,
+        queue_size: int = settings.WEBSOCHAT_SSE_QUEUE_SIZE,
+        coalesce_seconds: float = settings.WEBSOCHAT_SSE_COALESCE_MS / 1000,
+        max_frame_chars: int = settings.WEBSOCHAT_SSE_MAX_FRAME_CHARS,
+        keep_alive_seconds: float = settings.WEBSOCHAT_SSE_KEEP_ALIVE_SECONDS,
+        stats: WebsochatSseStats = websochat_sse_stats,
+    ):
+        self.producer = producer
+        self.queue_size = queue_size
+        self.coalesce_seconds = coalesce_seconds
+        self.max_frame_chars = max_frame_chars
+        self.keep_alive_seconds = keep_alive_seconds
+        self.stats = stats
+        self.status_code = 200
+        self.background = None
+        self.init_headers({"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})})
+
+    async def _run_producer(self, channel: WebsochatSseChannel) -> None:
+        try:
+            await self.producer(channel)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("websochat sse producer failed")
+        await channel.close()
+
+    async def _wait_disconnect(self, receive: Receive) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+
+    async def _send_frame(self, send: Send, frame: bytes) -> None:
+        self.stats.counters["frames"] += 1
+        self.stats.counters["bytes"] += len(frame)
+        await send({"type": "http.response.body", "body": frame, "more_body": True})
+
+    async def _collect_deltas(self, queue: asyncio.Queue, first: str) -> tuple[str, Any]:
+        """first 뒤로 coalesce_seconds 안에 온 delta 를 합치고, 합치지 못한 다음 항목(없으면 None)을 돌려준다"""
+        parts = [first]
+        size = len(first)
+        deadline = asyncio.get_running_loop().time() + self.coalesce_seconds
+        while size < self.max_frame_chars:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is _CLOSED or item[0] != WEBSOCHAT_SSE_DELTA_EVENT:
+                return "".join(parts), item
+            parts.append(item[1])
+            size += len(item[1])
+        return "".join(parts), None
+
+    async def _write(self, channel: WebsochatSseChannel, send: Send) -> None:
+        queue = channel.queue
+        pending = None
+        while True:
+            item, pending = pending, None
+            if item is None:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=self.keep_alive_seconds)
+                except asyncio.TimeoutError:
+                    self.stats.counters["keep_alives"] += 1
+                    await send({"type": "http.response.body", "body": WEBSOCHAT_SSE_KEEP_ALIVE_FRAME, "more_body": True})
+                    continue
+            if item is _CLOSED:
+                return
+            event, payload = item
+            if event == WEBSOCHAT_SSE_DELTA_EVENT:
+                text, pending = await self._collect_deltas(queue, payload)
+                for start in range(0, len(text), self.max_frame_chars):
+                    self.stats.counters["delta_frames"] += 1
+                    await self._send_frame(send, encode_websochat_sse_delta(text[start : start + self.max_frame_chars]))
+            else:
+                await self._send_frame(send, encode_websochat_sse_event(event, payload))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.stats.counters["streams"] += 1
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        channel = WebsochatSseChannel(self.queue_size, self.stats)
+        producer_task = asyncio.ensure_future(self._run_producer(channel))
+        writer_task = asyncio.ensure_future(self._write(channel, send))
+        disconnect_task = asyncio.ensure_future(self._wait_disconnect(receive))
+        tasks = (producer_task, writer_task, disconnect_task)
+        try:
+            await asyncio.wait((writer_task, disconnect_task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if writer_task.cancelled() or writer_task.exception() is not None:
+            # 끊긴 연결에는 더 보내지 않는다 (생산자와 진행 중인 LLM 호출은 위에서 취소했다)
+            self.stats.counters["disconnected"] += 1
+            return
+        await self._send_frame(send, WEBSOCHAT_SSE_DONE_FRAME)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -38,7 +38,8 @@ def is_websochat_stream_enabled() -> bool:
     return _websochat_stream_emitter_var.get() is not None
 
 
-async def emit_websochat_stream_delta(text: str, *, chunk_size: int = 48) -> None:
+async def emit_websochat_stream_delta(text: str) -> None:
+    # 프레임 나누기/합치기는 SSE 응답(websochat_sse)이 하므로 받은 그대로 넘긴다
     emitter = _websochat_stream_emitter_var.get()
     if emitter is None:
         return
@@ -48,13 +49,7 @@ async def emit_websochat_stream_delta(text: str, *, chunk_size: int = 48) -> Non
     state = _websochat_stream_state_var.get()
     if state is not None:
         state["emitted"] = True
-    if chunk_size <= 0 or len(value) <= chunk_size:
-        await emitter(value)
-        return
-    for start in range(0, len(value), chunk_size):
-        part = value[start : start + chunk_size]
-        if part:
-            await emitter(part)
+    await emitter(value)
 
 
 async def emit_websochat_stream_text_if_needed(text: str) -> None:
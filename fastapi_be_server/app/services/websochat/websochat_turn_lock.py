@@ -0,0 +1,242 @@
+"""
+웹소챗 턴 잠금 (post_message 의 세션/사용자 단위 중복 처리 방지)
+
+- 같은 워커 안의 경합은 잠금 이름별 asyncio.Lock 레지스트리에서 DB 조회 없이 바로 거절한다.
+- 워커 간 배타는 tb_story_agent_turn_lease 의 lease 행(lock_name PK + holder_token + expires_at)으로 한다.
+  잡기/연장/해제는 각각 짧은 트랜잭션이고 커넥션은 곧바로 풀에 돌려준다.
+  (기존 GET_LOCK 방식은 LLM 스트리밍 내내 전용 커넥션 하나를 붙잡고 있었다)
+- 답변 생성 중에는 renew_interval 마다 expires_at 을 연장한다. 워커가 죽어 연장이 멈추면
+  ttl 뒤에 만료되고, 다음 턴이 만료된 행을 가져간다.
+- 만료 판단은 워커 시각(UTC)으로 하므로 ttl 은 워커 간 시각 오차보다 충분히 길게 둔다.
+- 턴을 저장하기 전에는 ensure_held 로 저장 트랜잭션 안에서 lease 행이 아직 이 턴의 것인지 확인한다
+  (MySQL 은 FOR UPDATE 로 행을 잠가 commit 까지 다른 워커가 가져가지 못하게 한다).
+  연장이 늦어 다른 워커가 가져갔으면 저장하지 않고 WebsochatTurnLeaseLostError 를 올린다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.exc import IntegrityError
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+_INSERT_LEASE_SQL = text(
+    """
+    INSERT INTO tb_story_agent_turn_lease (lock_name, holder_token, expires_at)
+    VALUES (:lock_name, :holder_token, :expires_at)
+    """
+).bindparams(bindparam("expires_at", type_=DateTime()))
+_TAKE_OVER_EXPIRED_LEASE_SQL = text(
+    """
+    UPDATE tb_story_agent_turn_lease
+       SET holder_token = :holder_token,
+           expires_at = :expires_at
+     WHERE lock_name = :lock_name
+       AND expires_at <= :now
+    """
+).bindparams(bindparam("expires_at", type_=DateTime()), bindparam("now", type_=DateTime()))
+_RENEW_LEASE_SQL = text(
+    """
+    UPDATE tb_story_agent_turn_lease
+       SET expires_at = :expires_at
+     WHERE holder_token = :holder_token
+    """
+).bindparams(bindparam("expires_at", type_=DateTime()))
+_HELD_LEASE_SQL = """
+    SELECT lock_name
+      FROM tb_story_agent_turn_lease
+     WHERE holder_token = :holder_token
+"""
+_DELETE_LEASE_SQL = text(
+    """
+    DELETE FROM tb_story_agent_turn_lease
+     WHERE lock_name = :lock_name
+       AND holder_token = :holder_token
+    """
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class WebsochatTurnLeaseLostError(Exception):
+    """턴이 끝나기 전에 다른 워커가 lease 를 가져간 경우"""
+
+    def __init__(self, names: list[str]):
+        super().__init__(f"websochat turn lease lost: {names}")
+        self.names = names
+
+
+@dataclass
+class WebsochatTurnLease:
+    """한 턴이 잡은 잠금들 (같은 holder_token 으로 함께 연장된다)"""
+
+    token: str
+    names: list[str] = field(default_factory=list)
+    heartbeat: asyncio.Task | None = None
+    lost: bool = False
+
+
+class WebsochatTurnLockManager:
+    """
+    잠금 이름 -> asyncio.Lock 레지스트리 + DB lease
+    acquire 로 첫 잠금을 잡고, acquire_on 으로 같은 lease 에 잠금을 더한다.
+    """
+
+    def __init__(
+        self,
+        engine=None,
+        ttl: float = settings.WEBSOCHAT_TURN_LEASE_TTL_SECONDS,
+        renew_interval: float = settings.WEBSOCHAT_TURN_LEASE_RENEW_SECONDS,
+    ):
+        self._engine = engine
+        self.ttl = ttl
+        self.renew_interval = renew_interval
+        self._local_locks: dict[str, asyncio.Lock] = {}
+        self.counters: Counter[str] = Counter()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from app.rdb import likenovel_db_engine
+
+            self._engine = likenovel_db_engine
+        return self._engine
+
+    def metrics(self) -> dict:
+        return {
+            **self.counters,
+            "held": sum(1 for lock in self._local_locks.values() if lock.locked()),
+        }
+
+    async def acquire(self, name: str) -> WebsochatTurnLease | None:
+        lease = WebsochatTurnLease(token=uuid.uuid4().hex)
+        if not await self.acquire_on(lease, name):
+            return None
+        lease.heartbeat = asyncio.create_task(self._heartbeat(lease))
+        return lease
+
+    async def acquire_on(self, lease: WebsochatTurnLease, name: str) -> bool:
+        local_lock = self._local_locks.get(name)
+        if local_lock is not None and local_lock.locked():
+            self.counters["busy_local"] += 1
+            return False
+        local_lock = self._local_locks.setdefault(name, asyncio.Lock())
+        # 위에서 비어 있음을 확인했고 사이에 await 가 없으므로 기다리지 않고 잡힌다
+        await local_lock.acquire()
+        try:
+            acquired = await self._acquire_db_lease(name, lease.token)
+        except BaseException:
+            self._release_local(name)
+            raise
+        if not acquired:
+            self._release_local(name)
+            self.counters["busy_db"] += 1
+            return False
+        self.counters["acquired"] += 1
+        lease.names.append(name)
+        return True
+
+    async def release(self, lease: WebsochatTurnLease, name: str) -> None:
+        if name not in lease.names:
+            return
+        lease.names.remove(name)
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(_DELETE_LEASE_SQL, {"lock_name": name, "holder_token": lease.token})
+                await conn.commit()
+        except Exception as exc:
+            # 해제에 실패해도 연장이 멈추므로 ttl 뒤에 만료된다
+            self.counters["release_failed"] += 1
+            logger.warning("failed to release websochat turn lease [%s]: %s", name, exc)
+        finally:
+            self._release_local(name)
+            if not lease.names and lease.heartbeat is not None:
+                lease.heartbeat.cancel()
+                lease.heartbeat = None
+
+    async def ensure_held(self, lease: WebsochatTurnLease, db) -> None:
+        """
+        db(턴을 저장할 트랜잭션) 에서 lease 의 잠금이 모두 아직 이 턴의 것인지 확인한다.
+        MySQL 은 lease 행을 FOR UPDATE 로 잠그므로 commit 전까지 다른 워커가 가져갈 수 없다.
+        """
+        if not lease.lost:
+            query = _HELD_LEASE_SQL
+            if db.get_bind().dialect.name == "mysql":
+                query += " FOR UPDATE"
+            result = await db.execute(text(query), {"holder_token": lease.token})
+            held = {row[0] for row in result.all()}
+            if not set(lease.names) <= held:
+                lease.lost = True
+                self.counters["lost"] += 1
+        if lease.lost:
+            self.counters["lost_before_commit"] += 1
+            logger.warning("websochat turn lease lost before commit %s", lease.names)
+            raise WebsochatTurnLeaseLostError(list(lease.names))
+
+    def _release_local(self, name: str) -> None:
+        local_lock = self._local_locks.get(name)
+        if local_lock is None:
+            return
+        if local_lock.locked():
+            local_lock.release()
+        self._local_locks.pop(name, None)
+
+    async def _acquire_db_lease(self, name: str, token: str) -> bool:
+        now = _utcnow()
+        params = {
+            "lock_name": name,
+            "holder_token": token,
+            "expires_at": now + timedelta(seconds=self.ttl),
+            "now": now,
+        }
+        async with self.engine.connect() as conn:
+            try:
+                await conn.execute(_INSERT_LEASE_SQL, params)
+                await conn.commit()
+                return True
+            except IntegrityError:
+                await conn.rollback()
+            # 이미 행이 있으면 만료된 경우에만 가져온다 (INSERT 실패 트랜잭션과 분리해 잠금 승격을 피한다)
+            result = await conn.execute(_TAKE_OVER_EXPIRED_LEASE_SQL, params)
+            await conn.commit()
+        if result.rowcount == 1:
+            self.counters["taken_over"] += 1
+            logger.info("websochat turn lease taken over after expiry [%s]", name)
+            return True
+        return False
+
+    async def _heartbeat(self, lease: WebsochatTurnLease) -> None:
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            if not lease.names:
+                return
+            try:
+                async with self.engine.connect() as conn:
+                    result = await conn.execute(
+                        _RENEW_LEASE_SQL,
+                        {"holder_token": lease.token, "expires_at": _utcnow() + timedelta(seconds=self.ttl)},
+                    )
+                    await conn.commit()
+            except Exception as exc:
+                self.counters["renew_failed"] += 1
+                logger.warning("failed to renew websochat turn lease %s: %s", lease.names, exc)
+                continue
+            self.counters["renewed"] += 1
+            if result.rowcount < len(lease.names) and not lease.lost:
+                lease.lost = True
+                self.counters["lost"] += 1
+                logger.warning("websochat turn lease lost before release %s", lease.names)
+
+
+websochat_turn_locks = WebsochatTurnLockManager()
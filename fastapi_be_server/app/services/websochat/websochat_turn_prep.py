@@ -0,0 +1,257 @@
+"""
+웹소챗 턴 준비 단계 (post_message / _generate_websochat_reply)
+
+- 답변 생성 전에 필요한 조회(세션/작품/캐릭터, 최근 대화, 질문 분류, 범위 컨텍스트, RP 원문 회상)를
+  선행 단계를 선언한 WebsochatTurnStep 으로 나누고, 선행 단계가 끝난 단계부터 동시에 실행한다.
+- AsyncSession 은 한 번에 쿼리 하나만 보낼 수 있으므로 DB 단계 중 첫 단계만 요청 세션을 쓰고
+  나머지는 session_factory 로 각자 세션을 연다(조회 전용, 턴마다 커넥션을 더 쓴다).
+- 따로 여는 세션 수는 워커 전체에서 WEBSOCHAT_TURN_PREP_MAX_EXTRA_SESSIONS 로 제한한다.
+  자리가 없으면 풀을 기다리지 않고 요청 세션에서 다른 DB 단계와 차례로 실행한다.
+- 단계별 시작/소요 시간을 WebsochatTurnPrepTrace 에 남기고, 턴마다 한 줄 로그로 남긴다.
+- WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED=N 이면 동시 실행 없이 선언 순서대로 요청 세션에서 하나씩 실행한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.const import settings
+
+logger = logging.getLogger(__name__)
+
+# 하위 단계 이름 구분자 (예: rp_exact_recall/summary_candidates), 임계 경로 계산에서는 제외한다
+WEBSOCHAT_TURN_SUBSTEP_SEPARATOR = "/"
+
+WebsochatTurnStepRunner = Callable[[dict[str, Any], AsyncSession], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class WebsochatTurnStep:
+    """
+    턴 준비 단계 하나
+
+    run(results, db): results 에는 선행 단계 결과가 단계 이름으로 들어 있다.
+    fallback(exc): 실패 시 대신 쓸 값을 돌려준다. None 이면 예외를 그대로 올린다.
+    """
+
+    name: str
+    run: WebsochatTurnStepRunner
+    deps: tuple[str, ...] = ()
+    uses_db: bool = False
+    fallback: Callable[[Exception], Any] | None = None
+
+
+@dataclass
+class WebsochatTurnPrepTrace:
+    """턴 하나의 단계별 소요 시간 기록"""
+
+    label: str
+    started_at: float = field(default_factory=time.perf_counter)
+    steps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    logged: bool = False
+
+    def record(
+        self,
+        name: str,
+        *,
+        deps: tuple[str, ...],
+        started: float,
+        finished: float,
+        failed: bool,
+    ) -> None:
+        self.steps[name] = {
+            "deps": deps,
+            "start_ms": round((started - self.started_at) * 1000, 1),
+            "elapsed_ms": round((finished - started) * 1000, 1),
+            "failed": failed,
+        }
+
+    def _top_level_steps(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: step
+            for name, step in self.steps.items()
+            if WEBSOCHAT_TURN_SUBSTEP_SEPARATOR not in name
+        }
+
+    def sequential_ms(self) -> float:
+        """모든 단계를 하나씩 실행했을 때의 합"""
+        return round(sum(step["elapsed_ms"] for step in self._top_level_steps().values()), 1)
+
+    def critical_path_ms(self) -> float:
+        """선행 관계를 따라 가장 긴 경로의 소요 시간 합 (단계는 선행 단계보다 늦게 기록된다)"""
+        finished_at: dict[str, float] = {}
+        for name, step in self._top_level_steps().items():
+            finished_at[name] = step["elapsed_ms"] + max(
+                (finished_at[dep] for dep in step["deps"] if dep in finished_at),
+                default=0.0,
+            )
+        return round(max(finished_at.values(), default=0.0), 1)
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started_at) * 1000, 1)
+
+    def log(self, *, route_mode: str | None = None) -> None:
+        """답변 생성 직전에 한 번만 남긴다"""
+        if self.logged:
+            return
+        self.logged = True
+        logger.info(
+            "websochat turn_prep label=%s route_mode=%s elapsed_ms=%s critical_path_ms=%s sequential_ms=%s steps=%s",
+            self.label,
+            route_mode,
+            self.elapsed_ms(),
+            self.critical_path_ms(),
+            self.sequential_ms(),
+            ",".join(
+                f"{name}:{step['elapsed_ms']}{'!' if step['failed'] else ''}"
+                for name, step in self.steps.items()
+            ),
+        )
+
+
+class WebsochatTurnDbSlots:
+    """
+    턴 준비 단계가 따로 여는 DB 세션 수 상한 (워커 단위)
+    - 기다리지 않는 자리 수 카운터, 자리가 없으면 호출부가 요청 세션을 쓴다.
+    """
+
+    def __init__(self, limit: int = settings.WEBSOCHAT_TURN_PREP_MAX_EXTRA_SESSIONS):
+        self.limit = max(int(limit), 0)
+        self.in_use = 0
+        self.peak = 0
+        self.acquired = 0
+        self.shared_fallbacks = 0
+
+    def try_acquire(self) -> bool:
+        if self.in_use >= self.limit:
+            self.shared_fallbacks += 1
+            return False
+        self.in_use += 1
+        self.acquired += 1
+        self.peak = max(self.peak, self.in_use)
+        return True
+
+    def release(self) -> None:
+        self.in_use = max(self.in_use - 1, 0)
+
+    def metrics(self) -> dict:
+        return {
+            "limit": self.limit,
+            "in_use": self.in_use,
+            "peak": self.peak,
+            "acquired": self.acquired,
+            "shared_fallbacks": self.shared_fallbacks,
+        }
+
+
+websochat_turn_db_slots = WebsochatTurnDbSlots()
+
+
+def _default_session_factory():
+    # 직전 턴 메시지가 바로 보여야 하므로 replica 가 아닌 primary 세션을 쓴다
+    from app.rdb import likenovel_db_session
+
+    return likenovel_db_session()
+
+
+def _validate_websochat_turn_steps(
+    steps: list[WebsochatTurnStep],
+    known_names: set[str],
+) -> None:
+    names = set(known_names)
+    for step in steps:
+        if step.name in names:
+            raise ValueError(f"중복된 턴 준비 단계입니다: {step.name}")
+        missing = [dep for dep in step.deps if dep not in names]
+        if missing:
+            raise ValueError(f"선행 단계가 먼저 선언되어야 합니다: {step.name} <- {missing}")
+        names.add(step.name)
+
+
+async def _run_websochat_turn_step(
+    step: WebsochatTurnStep,
+    results: dict[str, Any],
+    db: AsyncSession,
+    trace: WebsochatTurnPrepTrace,
+) -> Any:
+    started = time.perf_counter()
+    failed = False
+    try:
+        value = await step.run(results, db)
+    except Exception as exc:
+        failed = True
+        if step.fallback is None:
+            raise
+        value = step.fallback(exc)
+    finally:
+        trace.record(
+            step.name,
+            deps=step.deps,
+            started=started,
+            finished=time.perf_counter(),
+            failed=failed,
+        )
+    results[step.name] = value
+    return value
+
+
+async def run_websochat_turn_steps(
+    steps: list[WebsochatTurnStep],
+    *,
+    db: AsyncSession,
+    trace: WebsochatTurnPrepTrace,
+    results: dict[str, Any] | None = None,
+    parallel: bool | None = None,
+    session_factory=None,
+) -> dict[str, Any]:
+    """
+    선행 단계가 끝난 단계부터 동시에 실행하고 단계 이름 -> 결과를 돌려준다.
+    steps 는 선행 단계가 먼저 오도록 선언해야 한다. results 로 이미 구한 값을 넘기면 선행 단계로 쓸 수 있다.
+    fallback 이 없는 단계가 실패하면 남은 단계를 취소하고 예외를 올린다.
+    """
+    results = dict(results or {})
+    _validate_websochat_turn_steps(steps, set(results))
+    if parallel is None:
+        parallel = settings.WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED
+    if not parallel:
+        for step in steps:
+            await _run_websochat_turn_step(step, results, db, trace)
+        return results
+
+    factory = session_factory or _default_session_factory
+    shared_db_step = next((step.name for step in steps if step.uses_db), None)
+    # 요청 세션을 쓰는 DB 단계끼리 쿼리가 겹치지 않도록 차례로 실행
+    shared_db_lock = asyncio.Lock()
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def _run(step: WebsochatTurnStep) -> Any:
+        dep_tasks = [tasks[dep] for dep in step.deps if dep in tasks]
+        if dep_tasks:
+            await asyncio.gather(*dep_tasks)
+        if not step.uses_db:
+            return await _run_websochat_turn_step(step, results, db, trace)
+        if step.name != shared_db_step and websochat_turn_db_slots.try_acquire():
+            try:
+                async with factory() as step_db:
+                    return await _run_websochat_turn_step(step, results, step_db, trace)
+            finally:
+                websochat_turn_db_slots.release()
+        async with shared_db_lock:
+            return await _run_websochat_turn_step(step, results, db, trace)
+
+    for step in steps:
+        tasks[step.name] = asyncio.ensure_future(_run(step))
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    return results
@@ -1,6 +1,6 @@
 from fastapi import Request, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from httpx import AsyncClient, HTTPStatusError
+from httpx import HTTPStatusError
 from typing import Annotated
 
 import asyncio
@@ -15,7 +15,13 @@ import time
 
 from app.const import settings, ErrorMessages
 from app.exceptions import CustomResponseException
+from app.utils.http_client import HTTP_PROVIDER_KEYCLOAK, get_http_client
 from app.utils.time import datatime_formatted_by_timezone
+from app.utils.token_revocation import (
+    spawn_background,
+    token_cache_key,
+    token_revocation_cache,
+)
 
 """
 인증/인가 관련 유틸 함수 모음
@@ -51,12 +57,12 @@ async def _get_kc_jwks():
 
         url = f"{settings.KC_OIDC_BASE_URL}/certs"
         try:
-            async with AsyncClient() as ac:
-                res = await ac.get(url=url, timeout=5.0)
-                res.raise_for_status()
-                _KC_JWKS_CACHE = res.json()
-                _KC_JWKS_CACHE_AT = time.time()
-                return _KC_JWKS_CACHE
+            ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+            res = await ac.get(url=url, timeout=5.0)
+            res.raise_for_status()
+            _KC_JWKS_CACHE = res.json()
+            _KC_JWKS_CACHE_AT = time.time()
+            return _KC_JWKS_CACHE
         except Exception as e:
             logging.getLogger(__name__).warning(
                 f"[auth] Failed to fetch Keycloak JWKS from {url}: {e}"
@@ -92,44 +98,45 @@ async def get_kc_signing_key(token: str):
     return None
 
 
-async def chk_revoked_token(token: str, decoded_token: dict):
-    url = f"{settings.KC_OIDC_BASE_URL}/token/introspect"
-
-    data = {"token": token}
-
+def _get_introspect_client_auth(decoded_token: dict) -> tuple[str, str]:
     client = decoded_token.get("azp")
 
     if client == settings.KC_CLIENT_ID:
-        auth = (settings.KC_CLIENT_ID, settings.KC_CLIENT_SECRET)
+        return (settings.KC_CLIENT_ID, settings.KC_CLIENT_SECRET)
     elif client == settings.KC_CLIENT_KEEP_SIGNIN_ID:
-        auth = (
+        return (
             settings.KC_CLIENT_KEEP_SIGNIN_ID,
             settings.KC_CLIENT_KEEP_SIGNIN_SECRET,
         )
-    else:
-        raise CustomResponseException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
-        )
+
+    raise CustomResponseException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
+    )
+
+
+async def _introspect_token(token: str, auth: tuple[str, str]) -> dict:
+    """
+    Keycloak /token/introspect 호출 (최대 3회 재시도)
+    - 응답 JSON을 그대로 반환합니다(active 판정은 호출부에서 처리).
+    - HTTP 오류 응답/재시도 소진 시 401 예외
+    """
+    url = f"{settings.KC_OIDC_BASE_URL}/token/introspect"
+
+    data = {"token": token}
 
     last_exc = None
     for attempt in range(3):
         try:
-            async with AsyncClient(timeout=5.0) as ac:
-                res = await ac.post(url=url, data=data, auth=auth)
-                res.raise_for_status()
+            ac = get_http_client(HTTP_PROVIDER_KEYCLOAK)
+            res = await ac.post(url=url, data=data, auth=auth, timeout=5.0)
+            res.raise_for_status()
 
-                res_json = res.json()
+            res_json = res.json()
 
-                logging.getLogger("log_test").info({"res_json": res_json})
+            logging.getLogger("log_test").info({"res_json": res_json})
 
-                if not res_json.get("active", False):
-                    raise CustomResponseException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
-                    )
-
-                return res_json
+            return res_json
         except HTTPStatusError:
             raise CustomResponseException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -149,6 +156,76 @@ async def chk_revoked_token(token: str, decoded_token: dict):
     )
 
 
+async def _introspect_and_cache(
+    token: str, decoded_token: dict, auth: tuple[str, str], cache_key: str
+) -> dict:
+    res_json = await _introspect_token(token, auth)
+    active = bool(res_json.get("active", False))
+    token_revocation_cache.store_verdict(
+        cache_key,
+        active=active,
+        result=res_json if active else None,
+        token_exp=decoded_token.get("exp"),
+    )
+    if not active:
+        raise CustomResponseException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
+        )
+    return res_json
+
+
+async def _refresh_introspection_in_background(
+    token: str, decoded_token: dict, auth: tuple[str, str], cache_key: str
+):
+    try:
+        await _introspect_and_cache(token, decoded_token, auth, cache_key)
+    except CustomResponseException:
+        pass
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            f"[auth] Background introspection refresh failed: {e}"
+        )
+    finally:
+        token_revocation_cache.end_refresh(cache_key)
+
+
+async def chk_revoked_token(token: str, decoded_token: dict):
+    """
+    토큰 폐기 여부 확인
+    - 로그아웃/탈퇴로 등록된 폐기 이벤트(sid/sub)는 즉시 401
+    - introspection 판정 캐시(jti/토큰 해시 키)를 우선 사용하고, 없을 때만 Keycloak을 호출합니다.
+    - fresh TTL 이후 stale TTL 이내의 active 판정은 캐시로 응답하며 백그라운드에서 재확인합니다.
+    """
+    auth = _get_introspect_client_auth(decoded_token)
+
+    if token_revocation_cache.is_revoked(decoded_token):
+        raise CustomResponseException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
+        )
+
+    cache_key = token_cache_key(token, decoded_token)
+    verdict, entry = token_revocation_cache.lookup(cache_key)
+    if verdict == "negative":
+        raise CustomResponseException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message=ErrorMessages.EXPIRED_ACCESS_TOKEN,
+        )
+    if verdict == "fresh":
+        return entry[3]
+    if verdict == "stale":
+        if token_revocation_cache.begin_refresh(cache_key):
+            spawn_background(
+                _refresh_introspection_in_background(
+                    token, decoded_token, auth, cache_key
+                )
+            )
+        return entry[3]
+
+    return await _introspect_and_cache(token, decoded_token, auth, cache_key)
+
+
 async def chk_jwt_token(token: str):
     try:
         if not token or len(token.split(".")) != 3:
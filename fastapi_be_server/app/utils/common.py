@@ -1,12 +1,12 @@
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from functools import wraps
 import logging
 
 from app.exceptions import CustomResponseException
 from app.const import ErrorMessages
+from app.utils.identity import resolve_user_identity
 
 """
 기타 공통 유틸 함수 모음
@@ -92,29 +92,24 @@ async def check_user(kc_user_id: str | None, db: AsyncSession, role: str = "") -
         raise CustomResponseException(
             status_code=status.HTTP_401_UNAUTHORIZED, message=ErrorMessages.LOGIN_PLEASE
         )
-    query = text("""
-        select user_id, role_type, (select apply_type from tb_user_profile_apply where user_id = u.user_id order by created_date desc limit 1) as apply_type from tb_user u where kc_user_id = :kc_user_id
-    """)
-    results = await db.execute(query, {"kc_user_id": kc_user_id})
-    row = results.mappings().one_or_none()
-    if row is None:
+    identity = await resolve_user_identity(kc_user_id, db, active_only=False)
+    if identity is None:
         # 사용자 데이터가 없는 경우
         raise CustomResponseException(
             status_code=status.HTTP_401_UNAUTHORIZED, message=ErrorMessages.LOGIN_PLEASE
         )
-    user = dict(row)
     if role == "admin":
         # 관리자 계정인지 체크
-        if user["role_type"] != "admin":
+        if identity.role_type != "admin":
             # 관리자 계정이 아니면 에러
             raise CustomResponseException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 message=ErrorMessages.ADMIN_LOGIN_REQUIRED,
             )
-    if user["role_type"] == "admin":
-        return {"user_id": int(user["user_id"]), "role": "admin"}
-    elif user["apply_type"] == "cp":
-        return {"user_id": int(user["user_id"]), "role": "CP"}
-    elif user["apply_type"] == "editor":
-        return {"user_id": int(user["user_id"]), "role": "author"}
-    return {"user_id": int(user["user_id"]), "role": "author"}
+    if identity.role_type == "admin":
+        return {"user_id": identity.user_id, "role": "admin"}
+    elif identity.latest_apply_type == "cp":
+        return {"user_id": identity.user_id, "role": "CP"}
+    elif identity.latest_apply_type == "editor":
+        return {"user_id": identity.user_id, "role": "author"}
+    return {"user_id": identity.user_id, "role": "author"}
@@ -0,0 +1,266 @@
+import base64
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from fastapi import status
+
+from app.const import ErrorMessages, settings
+from app.exceptions import CustomResponseException
+
+"""
+커서(keyset) 페이징 유틸
+- LIMIT/OFFSET 은 뒤 페이지로 갈수록 앞의 행을 모두 읽고 버리므로 느려지고,
+  조회 중 행이 추가/삭제되면 페이지 경계에서 중복/누락이 생깁니다.
+- 정렬 컬럼 값(마지막 행 기준) 이후만 조회하도록 WHERE 절을 만들고, 다음 페이지 커서를 돌려줍니다.
+- 정렬 컬럼 마지막은 반드시 유일한 컬럼(PK 등)이어야 동순위 행이 안정적으로 나뉩니다.
+  NULL 이 올 수 있는 컬럼은 COALESCE 식으로 지정합니다.
+- 커서는 정렬 값 + 목록 이름/조회 조건(scope) 지문을 담은 불투명 문자열이며 HMAC 으로 서명합니다.
+  다른 목록/조건에 재사용하거나 변조하면 400(INVALID_PAGE_CURSOR) 을 반환합니다.
+- 서명 키는 PAGINATION_CURSOR_SECRET, 없으면 KC_CLIENT_SECRET 에서 HMAC(고정 label) 로 유도한 하위 키입니다.
+  둘 다 없으면 기동 시 check_cursor_secret() 에서 실패합니다.
+- 전체 개수(COUNT)는 include_total 일 때만 조회하도록 호출부에서 분기합니다.
+
+사용 예시:
+    spec = KeysetSpec("admin_users", (KeysetOrder("u.created_date"), KeysetOrder("u.user_id")))
+    keyset = parse_keyset_page(spec, cursor, limit, scope={"status": status})
+    query = text(f'''
+        SELECT u.user_id, ..., {keyset.select_sql}
+          FROM tb_user u
+         WHERE u.use_yn = 'Y' {keyset.where_sql}
+         ORDER BY {keyset.order_by_sql}
+         {keyset.limit_sql}
+    ''')
+    result = await db.execute(query, {**params, **keyset.params})
+    rows, next_cursor = keyset.split(result.mappings().all())
+"""
+
+# 커서 계산용 select 컬럼 alias 접두어(응답에서는 제거)
+_CURSOR_COLUMN_PREFIX = "keyset_sort_"
+# 커서 서명 길이(bytes)
+_SIGNATURE_BYTES = 16
+# KC_CLIENT_SECRET 에서 커서 서명용 하위 키를 유도할 때 쓰는 label
+_DERIVED_KEY_LABEL = b"likenovel/pagination-cursor/v1"
+
+
+@dataclass(frozen=True)
+class KeysetOrder:
+    """정렬 컬럼(SQL 식)과 방향"""
+
+    expr: str
+    desc: bool = True
+
+
+@dataclass(frozen=True)
+class KeysetSpec:
+    """
+    목록별 keyset 정렬 정의
+
+    Args:
+        name: 커서 범위 구분용 목록 이름
+        orders: 정렬 컬럼 목록(마지막은 유일 컬럼)
+    """
+
+    name: str
+    orders: tuple[KeysetOrder, ...]
+
+    @property
+    def select_sql(self) -> str:
+        return ", ".join(
+            f"{order.expr} AS {_CURSOR_COLUMN_PREFIX}{idx}"
+            for idx, order in enumerate(self.orders)
+        )
+
+    @property
+    def order_by_sql(self) -> str:
+        return ", ".join(
+            f"{order.expr} {'DESC' if order.desc else 'ASC'}" for order in self.orders
+        )
+
+
+def _invalid_cursor() -> CustomResponseException:
+    return CustomResponseException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        message=ErrorMessages.INVALID_PAGE_CURSOR,
+    )
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+@lru_cache(maxsize=4)
+def _derive_signing_key(cursor_secret: str, fallback_secret: str) -> bytes:
+    if cursor_secret:
+        return cursor_secret.encode()
+    if fallback_secret:
+        return hmac.new(fallback_secret.encode(), _DERIVED_KEY_LABEL, hashlib.sha256).digest()
+    raise RuntimeError("PAGINATION_CURSOR_SECRET or KC_CLIENT_SECRET must be configured")
+
+
+def _signing_key() -> bytes:
+    return _derive_signing_key(settings.PAGINATION_CURSOR_SECRET, settings.KC_CLIENT_SECRET)
+
+
+def check_cursor_secret() -> None:
+    """
+    기동 시 1회 호출: 커서 서명 키가 없으면 예외로 기동을 중단합니다.
+    """
+    _signing_key()
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(_signing_key(), payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+
+def _scope_fingerprint(spec: KeysetSpec, scope: dict | None) -> str:
+    raw = json.dumps([spec.name, scope or {}], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _dump_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _load_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def encode_cursor(spec: KeysetSpec, values: list, scope: dict | None = None) -> str:
+    payload = json.dumps(
+        {"f": _scope_fingerprint(spec, scope), "v": [_dump_value(v) for v in values]},
+        separators=(",", ":"),
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(spec: KeysetSpec, cursor: str, scope: dict | None = None) -> list:
+    """
+    Raises:
+        CustomResponseException: 형식 오류/서명 불일치/다른 목록·조건의 커서
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, TypeError):
+        raise _invalid_cursor()
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise _invalid_cursor()
+
+    try:
+        data = json.loads(payload)
+        values = [_load_value(v) for v in data["v"]]
+    except (ValueError, KeyError, TypeError):
+        raise _invalid_cursor()
+    if data.get("f") != _scope_fingerprint(spec, scope) or len(values) != len(spec.orders):
+        raise _invalid_cursor()
+    return values
+
+
+@dataclass
+class KeysetPage:
+    """한 페이지 조회에 필요한 SQL 조각/파라미터"""
+
+    spec: KeysetSpec
+    limit: int
+    after: list | None = None
+    scope: dict | None = None
+    include_total: bool = False
+
+    @property
+    def select_sql(self) -> str:
+        return self.spec.select_sql
+
+    @property
+    def order_by_sql(self) -> str:
+        return self.spec.order_by_sql
+
+    @property
+    def where_sql(self) -> str:
+        """
+        (a < :a) OR (a = :a AND b < :b) ... 형태의 다음 페이지 조건(첫 페이지는 빈 문자열)
+        """
+        if self.after is None:
+            return ""
+        terms = []
+        for idx, order in enumerate(self.spec.orders):
+            conditions = [
+                f"{self.spec.orders[prev].expr} = :keyset_{prev}" for prev in range(idx)
+            ]
+            conditions.append(f"{order.expr} {'<' if order.desc else '>'} :keyset_{idx}")
+            terms.append(f"({' AND '.join(conditions)})")
+        return f"AND ({' OR '.join(terms)})"
+
+    @property
+    def limit_sql(self) -> str:
+        # 다음 페이지 존재 여부 확인용으로 1건 더 조회
+        return "LIMIT :keyset_limit"
+
+    @property
+    def params(self) -> dict:
+        params = {"keyset_limit": self.limit + 1}
+        if self.after is not None:
+            params.update({f"keyset_{idx}": value for idx, value in enumerate(self.after)})
+        return params
+
+    def split(self, rows) -> tuple[list[dict], str | None]:
+        """
+        조회 결과를 (현재 페이지 행, 다음 페이지 커서)로 분리하고 커서 계산용 컬럼을 제거합니다.
+        """
+        rows = [dict(row) for row in rows]
+        has_next = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        last_values = None
+        for row in rows:
+            last_values = [
+                row.pop(f"{_CURSOR_COLUMN_PREFIX}{idx}", None)
+                for idx in range(len(self.spec.orders))
+            ]
+        if not has_next or last_values is None:
+            return rows, None
+        return rows, encode_cursor(self.spec, last_values, self.scope)
+
+
+def parse_keyset_page(
+    spec: KeysetSpec,
+    cursor: str | None,
+    limit: int | None,
+    scope: dict | None = None,
+    include_total: bool = False,
+) -> KeysetPage:
+    """
+    요청의 cursor/limit 으로 KeysetPage 생성(빈 cursor 는 첫 페이지)
+
+    Args:
+        scope: 커서를 묶을 조회 조건(필터/정렬 옵션 등). 조건이 바뀌면 기존 커서는 거부됩니다.
+    """
+    limit = limit if limit and limit > 0 else settings.PAGINATION_DEFAULT_LIMIT
+    limit = min(limit, settings.PAGINATION_CURSOR_MAX_LIMIT)
+    after = decode_cursor(spec, cursor, scope) if cursor else None
+    return KeysetPage(
+        spec=spec, limit=limit, after=after, scope=scope, include_total=include_total
+    )
@@ -0,0 +1,232 @@
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import asyncio
+import importlib.util
+import logging
+import time
+
+import httpx
+
+from app.const import settings
+
+"""
+외부 provider 별 공유 HTTP 클라이언트(커넥션 풀) 레지스트리
+- 호출마다 AsyncClient 를 새로 만들면 매번 TCP/TLS handshake 비용이 발생하므로,
+  provider 별로 keep-alive 커넥션 풀을 가진 AsyncClient 를 앱 수명(lifespan) 동안 재사용합니다.
+- 요청별 timeout 은 기존과 동일하게 호출부에서 client.post(..., timeout=...) 로 지정합니다.
+- 앱 종료 시 app.main lifespan 에서 close_http_clients() 로 정리합니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# provider 이름
+HTTP_PROVIDER_KEYCLOAK = "keycloak"
+HTTP_PROVIDER_GEMINI = "gemini"
+HTTP_PROVIDER_ANTHROPIC = "anthropic"
+HTTP_PROVIDER_OPENROUTER = "openrouter"
+HTTP_PROVIDER_R2 = "r2"
+HTTP_PROVIDER_EXTERNAL = "external"  # SNS OAuth 등 기타 외부 API
+
+# HTTP/2 는 h2 패키지(httpx[http2])가 설치된 경우에만 사용합니다.
+# 없으면 HTTP/1.1 로 동작하며, 기동 시 check_http2_support() 가 한 번 경고합니다.
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    timeout: float = 5.0
+    max_connections: int = settings.HTTP_POOL_MAX_CONNECTIONS
+    max_keepalive_connections: int = settings.HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = settings.HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS
+    http2: bool = False
+
+
+_DEFAULT_POOL_CONFIGS: dict[str, HttpPoolConfig] = {
+    # 내부망 Keycloak: 인증 요청마다 호출되므로 keep-alive 를 넉넉하게 유지
+    HTTP_PROVIDER_KEYCLOAK: HttpPoolConfig(timeout=5.0, max_keepalive_connections=50),
+    HTTP_PROVIDER_GEMINI: HttpPoolConfig(timeout=60.0, http2=True),
+    HTTP_PROVIDER_ANTHROPIC: HttpPoolConfig(timeout=60.0, http2=True),
+    HTTP_PROVIDER_OPENROUTER: HttpPoolConfig(timeout=30.0, http2=True),
+    HTTP_PROVIDER_R2: HttpPoolConfig(timeout=60.0),
+    HTTP_PROVIDER_EXTERNAL: HttpPoolConfig(timeout=5.0),
+}
+
+
+class _PoolMetrics:
+    __slots__ = (
+        "requests_total",
+        "errors_total",
+        "in_flight",
+        "max_in_flight",
+        "latency_seconds_total",
+        "clients_created",
+    )
+
+    def __init__(self):
+        self.requests_total = 0
+        self.errors_total = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.latency_seconds_total = 0.0
+        self.clients_created = 0
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """
+    커넥션 풀 transport 를 감싸서 요청 수/에러/동시 요청/응답 헤더까지의 지연시간을 집계합니다.
+    """
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport, metrics: _PoolMetrics):
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self._metrics
+        metrics.requests_total += 1
+        metrics.in_flight += 1
+        metrics.max_in_flight = max(metrics.max_in_flight, metrics.in_flight)
+        started_at = time.perf_counter()
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception:
+            metrics.errors_total += 1
+            raise
+        finally:
+            metrics.in_flight -= 1
+            metrics.latency_seconds_total += time.perf_counter() - started_at
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def pool_connections(self) -> list:
+        pool = getattr(self._transport, "_pool", None)
+        return list(getattr(pool, "connections", []) or [])
+
+
+class HttpClientRegistry:
+    """
+    provider 이름 -> 공유 AsyncClient
+    - 클라이언트는 처음 사용할 때 생성합니다(lazy).
+    - 커넥션은 이벤트 루프에 묶이므로, 다른 이벤트 루프에서 요청하면 해당 루프용으로 새로 만듭니다.
+    """
+
+    def __init__(self, configs: dict[str, HttpPoolConfig] | None = None):
+        self._configs = dict(configs or _DEFAULT_POOL_CONFIGS)
+        self._clients: dict[str, tuple[httpx.AsyncClient, object, _MeteredTransport]] = (
+            dict()
+        )
+        self._metrics: dict[str, _PoolMetrics] = dict()
+
+    def configure(self, name: str, config: HttpPoolConfig) -> None:
+        self._configs[name] = config
+
+    def http2_downgraded_pools(self) -> list[str]:
+        """HTTP/2 를 요청했지만 h2 가 없어 HTTP/1.1 로 동작할 풀 이름"""
+        if not settings.HTTP_POOL_HTTP2_ENABLED or _H2_AVAILABLE:
+            return []
+        return sorted(name for name, config in self._configs.items() if config.http2)
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        cached = self._clients.get(name)
+        if cached is not None:
+            client, client_loop, _ = cached
+            if client_loop is loop and not client.is_closed:
+                return client
+
+        client, transport = self._build_client(name)
+        self._clients[name] = (client, loop, transport)
+        return client
+
+    def _build_client(self, name: str) -> tuple[httpx.AsyncClient, _MeteredTransport]:
+        config = self._configs.get(name) or _DEFAULT_POOL_CONFIGS[HTTP_PROVIDER_EXTERNAL]
+        metrics = self._metrics.setdefault(name, _PoolMetrics())
+        metrics.clients_created += 1
+
+        http2 = config.http2 and settings.HTTP_POOL_HTTP2_ENABLED and _H2_AVAILABLE
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        transport = _MeteredTransport(
+            httpx.AsyncHTTPTransport(limits=limits, http2=http2), metrics
+        )
+        # 공유 클라이언트이므로 응답 쿠키(Keycloak 세션 등)가 다른 요청에 섞이지 않도록 저장하지 않습니다.
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=config.timeout,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
+        return client, transport
+
+    def metrics(self) -> dict[str, dict]:
+        """
+        provider 별 풀 지표
+        """
+        result = dict()
+        for name, metrics in self._metrics.items():
+            connections = []
+            cached = self._clients.get(name)
+            if cached is not None:
+                connections = cached[2].pool_connections()
+            idle = sum(1 for conn in connections if conn.is_idle())
+            result[name] = {
+                "requests_total": metrics.requests_total,
+                "errors_total": metrics.errors_total,
+                "in_flight": metrics.in_flight,
+                "max_in_flight": metrics.max_in_flight,
+                "avg_latency_ms": (
+                    round(metrics.latency_seconds_total * 1000 / metrics.requests_total, 3)
+                    if metrics.requests_total
+                    else 0.0
+                ),
+                "clients_created": metrics.clients_created,
+                "connections_open": len(connections),
+                "connections_idle": idle,
+                "connections_active": len(connections) - idle,
+            }
+        return result
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client, client_loop, _ in clients:
+            if client.is_closed:
+                continue
+            try:
+                if client_loop is asyncio.get_running_loop():
+                    await client.aclose()
+            except Exception as e:
+                logger.warning(f"[http_client] Failed to close client: {e}")
+
+
+http_client_registry = HttpClientRegistry()
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """
+    provider 공유 AsyncClient 반환. `async with` 로 감싸지 말고 그대로 사용합니다.
+    """
+    return http_client_registry.get(name)
+
+
+def check_http2_support() -> None:
+    """
+    기동 시 1회 호출: HTTP/2 풀이 h2 없이 HTTP/1.1 로 동작하게 되면 경고
+    """
+    pools = http_client_registry.http2_downgraded_pools()
+    if pools:
+        logger.warning(
+            f"[http_client] HTTP/2 requested for {pools} but h2 is not installed "
+            "(install httpx[http2]); falling back to HTTP/1.1"
+        )
+
+
+def get_http_pool_metrics() -> dict[str, dict]:
+    return http_client_registry.metrics()
+
+
+async def close_http_clients() -> None:
+    await http_client_registry.aclose()
@@ -0,0 +1,266 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.time import get_full_age
+
+"""
+kc_user_id -> user_id/권한/성인 여부 식별 정보 resolver
+- 인증된 API 대부분이 요청마다 `tb_user where kc_user_id = :kc_user_id` 를 한 번 이상 조회하므로
+  한 곳(resolve_user_identity)에서 조회하고 결과를 재사용합니다.
+- 요청 단위 memo: UserIdentityScopeMiddleware 가 요청마다 memo 를 열어, 같은 요청 안에서는 최대 1회만 조회합니다.
+- 프로세스 단위 캐시: 요청 간에는 TTL LRU 캐시를 공유합니다.
+  요청 범위 밖(배치/스크립트)에서는 캐시를 사용하지 않고 항상 DB 를 조회합니다.
+- 회원탈퇴/권한 승인/프로필(생년월일 등) 변경 시 invalidate_user_identity() 로 즉시 무효화합니다.
+  캐시는 프로세스(워커) 단위이므로 다른 워커에는 TTL 내에 반영됩니다.
+- 존재하지 않는 사용자(None)는 캐시하지 않습니다(회원가입 직후 조회 대비).
+- user_id 만 얻으려고 tb_user 를 kc_user_id 로 조회/조인하던 곳은 모두 이 resolver 를 씁니다.
+  tb_user 를 kc_user_id 로 직접 조회하는 곳은 아래 경우만 남아 있습니다.
+  - 식별 정보에 없는 컬럼(email, gender, 연동 정보 등)을 함께 읽는 조회
+  - tb_user 자체를 갱신하는 UPDATE (로그인 정보, 본인인증, kc_user_id 재연결)
+  - 로그인 시 탈퇴 계정 확인처럼 캐시가 아닌 DB 값으로 판단해야 하는 확인
+"""
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 단위 식별 정보 캐시 TTL
+_IDENTITY_CACHE_TTL_SECONDS = 60
+# 캐시 최대 엔트리 수(LRU)
+_IDENTITY_CACHE_MAX_ENTRIES = 20000
+# 성인 기준 나이(user_service.get_user 와 동일)
+_ADULT_AGE = 19
+
+_IDENTITY_QUERY = text("""
+    select u.user_id
+         , u.role_type
+         , u.use_yn
+         , DATE_FORMAT(u.birthdate, '%Y-%m-%d') as birthdate
+         , (select apply_type from tb_user_profile_apply
+             where user_id = u.user_id
+             order by created_date desc limit 1) as latest_apply_type
+         , (select apply_type from tb_user_profile_apply
+             where user_id = u.user_id
+               and approval_code = 'accepted'
+             order by created_date desc limit 1) as accepted_apply_type
+         , exists(select 1 from tb_user_profile_apply
+                   where user_id = u.user_id
+                     and apply_type = 'cp'
+                     and approval_code = 'accepted'
+                     and approval_date is not null) as is_cp
+      from tb_user u
+     where u.kc_user_id = :kc_user_id
+     limit 1
+""")
+
+
+@dataclass(frozen=True)
+class UserIdentity:
+    user_id: int
+    kc_user_id: str
+    role_type: str | None
+    use_yn: str
+    birthdate: str | None
+    # 가장 최근 신청(승인 여부 무관) - check_user 기준
+    latest_apply_type: str | None
+    # 가장 최근 승인된 신청
+    accepted_apply_type: str | None
+    # 승인 완료(approval_date 존재)된 CP 여부
+    is_cp: bool
+
+    @property
+    def is_active(self) -> bool:
+        return self.use_yn == "Y"
+
+    @property
+    def is_admin(self) -> bool:
+        return self.role_type == "admin"
+
+    @property
+    def adult_yn(self) -> str:
+        if self.birthdate and get_full_age(date=self.birthdate) >= _ADULT_AGE:
+            return "Y"
+        return "N"
+
+
+class UserIdentityCache:
+    """
+    kc_user_id -> UserIdentity TTL LRU 캐시
+    """
+
+    def __init__(
+        self,
+        ttl: float = _IDENTITY_CACHE_TTL_SECONDS,
+        max_entries: int = _IDENTITY_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # kc_user_id -> (identity, expires_at)
+        self._entries: OrderedDict[str, tuple[UserIdentity, float]] = OrderedDict()
+        # user_id -> kc_user_id (user_id 기준 무효화용)
+        self._kc_by_user_id: dict[int, str] = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kc_user_id: str) -> UserIdentity | None:
+        entry = self._entries.get(kc_user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        identity, expires_at = entry
+        if expires_at <= time.time():
+            self._pop(kc_user_id)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(kc_user_id)
+        self.hits += 1
+        return identity
+
+    def put(self, identity: UserIdentity) -> None:
+        self._entries[identity.kc_user_id] = (identity, time.time() + self.ttl)
+        self._entries.move_to_end(identity.kc_user_id)
+        self._kc_by_user_id[identity.user_id] = identity.kc_user_id
+        while len(self._entries) > self.max_entries:
+            kc_user_id, _ = next(iter(self._entries.items()))
+            self._pop(kc_user_id)
+
+    def invalidate(
+        self, kc_user_id: str | None = None, user_id: int | None = None
+    ) -> str | None:
+        """
+        Returns:
+            무효화된 kc_user_id (user_id 로만 요청했을 때 memo 정리에 사용)
+        """
+        if kc_user_id is None and user_id is not None:
+            kc_user_id = self._kc_by_user_id.get(int(user_id))
+        if kc_user_id is not None:
+            self._pop(kc_user_id)
+        return kc_user_id
+
+    def _pop(self, kc_user_id: str) -> None:
+        entry = self._entries.pop(kc_user_id, None)
+        if entry is not None:
+            self._kc_by_user_id.pop(entry[0].user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._kc_by_user_id.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+user_identity_cache = UserIdentityCache()
+
+# 요청 단위 memo(kc_user_id -> UserIdentity). 요청 범위 밖에서는 None
+_request_identity_memo: ContextVar[dict | None] = ContextVar(
+    "request_identity_memo", default=None
+)
+
+
+class UserIdentityScopeMiddleware:
+    """
+    요청마다 식별 정보 memo 를 여는 pure ASGI 미들웨어
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_identity_memo.set(dict())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_identity_memo.reset(token)
+
+
+async def _load_user_identity(kc_user_id: str, db: AsyncSession) -> UserIdentity | None:
+    result = await db.execute(_IDENTITY_QUERY, {"kc_user_id": kc_user_id})
+    row = result.mappings().one_or_none()
+    if row is None:
+        return None
+    return UserIdentity(
+        user_id=int(row["user_id"]),
+        kc_user_id=kc_user_id,
+        role_type=row.get("role_type"),
+        use_yn=row.get("use_yn") or "N",
+        birthdate=row.get("birthdate"),
+        latest_apply_type=row.get("latest_apply_type"),
+        accepted_apply_type=row.get("accepted_apply_type"),
+        is_cp=bool(row.get("is_cp")),
+    )
+
+
+async def resolve_user_identity(
+    kc_user_id: str | None, db: AsyncSession, active_only: bool = True
+) -> UserIdentity | None:
+    """
+    kc_user_id 로 사용자 식별 정보 조회(요청 memo -> 프로세스 캐시 -> DB)
+
+    Args:
+        kc_user_id: Keycloak user ID
+        db: AsyncSession
+        active_only: True 면 탈퇴(use_yn = 'N') 사용자는 None 반환
+
+    Returns:
+        UserIdentity, 없으면 None
+    """
+    if not kc_user_id:
+        return None
+
+    memo = _request_identity_memo.get()
+    identity = None
+    if memo is not None:
+        identity = memo.get(kc_user_id)
+        if identity is None:
+            identity = user_identity_cache.get(kc_user_id)
+
+    if identity is None:
+        identity = await _load_user_identity(kc_user_id, db)
+        if identity is not None and memo is not None:
+            user_identity_cache.put(identity)
+
+    if identity is not None and memo is not None:
+        memo[kc_user_id] = identity
+
+    if identity is None or (active_only and not identity.is_active):
+        return None
+    return identity
+
+
+async def resolve_user_id(
+    kc_user_id: str | None, db: AsyncSession, active_only: bool = True
+) -> int | None:
+    """
+    kc_user_id 로 user_id 조회. 없으면 None
+    """
+    identity = await resolve_user_identity(kc_user_id, db, active_only=active_only)
+    return identity.user_id if identity else None
+
+
+def invalidate_user_identity(
+    kc_user_id: str | None = None, user_id: int | None = None
+) -> None:
+    """
+    회원탈퇴/권한 승인/프로필 변경 시 식별 정보 캐시 무효화
+    """
+    if kc_user_id is None and user_id is None:
+        return
+    kc_user_id = user_identity_cache.invalidate(kc_user_id=kc_user_id, user_id=user_id)
+
+    memo = _request_identity_memo.get()
+    if memo:
+        if kc_user_id is None:
+            kc_user_id = next(
+                (k for k, v in memo.items() if v.user_id == int(user_id)), None
+            )
+        if kc_user_id is not None:
+            memo.pop(kc_user_id, None)
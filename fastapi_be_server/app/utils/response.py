@@ -73,6 +73,36 @@ def build_paginated_response(
     }
 
 
+def build_cursor_paginated_response(
+    rows,
+    next_cursor: str | None,
+    count_per_page: int,
+    total_count: int | None = None,
+) -> dict:
+    """
+    커서 페이징된 리스트 조회 결과를 응답 형식으로 변환하는 함수 (admin/partner용)
+
+    Args:
+        rows: KeysetPage.split() 결과 행 목록
+        next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+        count_per_page: 페이지당 아이템 수
+        total_count: 전체 아이템 수 (include_total 미요청 시 None)
+
+    Returns:
+        dict: {"total_count": N|None, "count_per_page": N, "next_cursor": "...", "results": [...]} 형식의 응답
+
+    사용 예시:
+        rows, next_cursor = keyset.split(result.mappings().all())
+        return build_cursor_paginated_response(rows, next_cursor, keyset.limit)
+    """
+    return {
+        "total_count": total_count,
+        "count_per_page": count_per_page,
+        "next_cursor": next_cursor,
+        "results": [dict(row) for row in rows],
+    }
+
+
 def get_row_or_404(result, error_message: str):
     """
     쿼리 결과에서 첫 번째 row를 반환하거나 없으면 404 예외를 발생시키는 함수
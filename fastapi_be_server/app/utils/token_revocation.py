@@ -0,0 +1,241 @@
+from collections import OrderedDict
+
+import asyncio
+import hashlib
+import jwt
+import logging
+import time
+
+from app.const import settings
+
+"""
+access token 폐기(revocation) 로컬 캐시
+- 서명/만료 검증은 JWKS 캐시로 로컬에서 수행하고(app.utils.auth.chk_jwt_token),
+  Keycloak introspection 결과(active 여부)는 토큰별로 짧게 캐싱합니다.
+- 로그아웃/회원탈퇴 시 앱이 직접 폐기 이벤트(세션/사용자/토큰 단위)를 등록하여
+  캐시 TTL을 기다리지 않고 즉시 401 처리합니다.
+- 캐시/이벤트는 프로세스(워커) 단위입니다. 다른 워커에는 introspection 캐시 TTL 내에 반영됩니다.
+"""
+
+logger = logging.getLogger(__name__)
+
+# active 판정 캐시: 이 시간 내에는 Keycloak 재확인 없이 사용
+_VERDICT_FRESH_TTL_SECONDS = 30
+# active 판정 캐시: fresh 이후 이 시간까지는 캐시로 응답하고 백그라운드에서 재확인
+_VERDICT_STALE_TTL_SECONDS = 120
+# inactive(폐기/만료) 판정 캐시(negative cache): 토큰 exp 가 없을 때 사용하는 기본 보관 시간
+_NEGATIVE_DEFAULT_TTL_SECONDS = 60 * 10
+# 캐시 최대 엔트리 수(LRU)
+_VERDICT_CACHE_MAX_ENTRIES = 50000
+# 폐기 이벤트 최대 보관 시간(access token 최대 수명보다 길게)
+_REVOCATION_EVENT_TTL_SECONDS = 60 * 60 * 24
+
+
+def token_cache_key(token: str, decoded_token: dict) -> str:
+    """
+    introspection 캐시 키: jti 우선, 없으면 토큰 sha256
+    """
+    jti = decoded_token.get("jti")
+    if jti:
+        return f"jti:{jti}"
+    return "sha256:" + hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenRevocationCache:
+    """
+    introspection 판정 캐시 + 폐기 이벤트 저장소
+    """
+
+    def __init__(
+        self,
+        fresh_ttl: float = _VERDICT_FRESH_TTL_SECONDS,
+        stale_ttl: float = _VERDICT_STALE_TTL_SECONDS,
+        negative_ttl: float = _NEGATIVE_DEFAULT_TTL_SECONDS,
+        max_entries: int = _VERDICT_CACHE_MAX_ENTRIES,
+    ):
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # key -> (active, checked_at, expires_at, introspect_result)
+        self._verdicts: OrderedDict[str, tuple] = OrderedDict()
+        # sid -> 만료 시각
+        self._revoked_sessions: dict[str, float] = dict()
+        # sub -> 폐기 시각(이 시각 이전 iat 토큰은 모두 무효)
+        self._revoked_users: dict[str, float] = dict()
+        # 백그라운드 재확인 중인 키
+        self._refreshing: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    # ---- 폐기 이벤트 ----
+    def revoke_session(self, sid: str | None, expires_at: float | None = None) -> None:
+        if not sid:
+            return
+        self._revoked_sessions[sid] = expires_at or (
+            time.time() + _REVOCATION_EVENT_TTL_SECONDS
+        )
+        self._purge_events()
+
+    def revoke_user(self, sub: str | None, revoked_at: float | None = None) -> None:
+        if not sub:
+            return
+        self._revoked_users[sub] = revoked_at or time.time()
+        self._purge_events()
+
+    def revoke_token(self, token: str, decoded_token: dict) -> None:
+        exp = decoded_token.get("exp")
+        self._store(
+            token_cache_key(token, decoded_token),
+            active=False,
+            result=None,
+            token_exp=exp,
+        )
+
+    def is_revoked(self, decoded_token: dict) -> bool:
+        now = time.time()
+        sid = decoded_token.get("sid")
+        if sid:
+            expires_at = self._revoked_sessions.get(sid)
+            if expires_at is not None and expires_at > now:
+                return True
+
+        sub = decoded_token.get("sub")
+        if sub:
+            revoked_at = self._revoked_users.get(sub)
+            if revoked_at is not None:
+                iat = decoded_token.get("iat") or 0
+                if iat <= revoked_at:
+                    return True
+        return False
+
+    def _purge_events(self) -> None:
+        now = time.time()
+        for sid in [k for k, v in self._revoked_sessions.items() if v <= now]:
+            self._revoked_sessions.pop(sid, None)
+        threshold = now - _REVOCATION_EVENT_TTL_SECONDS
+        for sub in [k for k, v in self._revoked_users.items() if v <= threshold]:
+            self._revoked_users.pop(sub, None)
+
+    # ---- introspection 판정 캐시 ----
+    def lookup(self, key: str) -> tuple[str, tuple | None]:
+        """
+        Returns:
+            ("fresh" | "stale" | "negative" | "miss", entry)
+        """
+        entry = self._verdicts.get(key)
+        now = time.time()
+        if entry is None:
+            self.misses += 1
+            return "miss", None
+
+        active, checked_at, expires_at, _ = entry
+        if expires_at <= now:
+            self._verdicts.pop(key, None)
+            self.misses += 1
+            return "miss", None
+
+        self._verdicts.move_to_end(key)
+        if not active:
+            self.hits += 1
+            return "negative", entry
+        age = now - checked_at
+        if age < self.fresh_ttl:
+            self.hits += 1
+            return "fresh", entry
+        if age < self.stale_ttl:
+            self.hits += 1
+            return "stale", entry
+
+        self._verdicts.pop(key, None)
+        self.misses += 1
+        return "miss", None
+
+    def store_verdict(
+        self, key: str, active: bool, result: dict | None, token_exp: float | None
+    ) -> None:
+        self._store(key, active=active, result=result, token_exp=token_exp)
+
+    def _store(
+        self, key: str, active: bool, result: dict | None, token_exp: float | None
+    ) -> None:
+        now = time.time()
+        if active:
+            expires_at = now + self.stale_ttl
+        else:
+            expires_at = now + self.negative_ttl
+        if token_exp:
+            # active 판정은 토큰 만료 이후 사용하지 않고, 폐기 판정은 토큰 만료까지 유지합니다.
+            if active:
+                expires_at = min(expires_at, float(token_exp))
+            else:
+                expires_at = max(expires_at, float(token_exp))
+        self._verdicts[key] = (active, now, expires_at, result)
+        self._verdicts.move_to_end(key)
+        while len(self._verdicts) > self.max_entries:
+            self._verdicts.popitem(last=False)
+
+    def begin_refresh(self, key: str) -> bool:
+        if key in self._refreshing:
+            return False
+        self._refreshing.add(key)
+        return True
+
+    def end_refresh(self, key: str) -> None:
+        self._refreshing.discard(key)
+
+    def clear(self) -> None:
+        self._verdicts.clear()
+        self._revoked_sessions.clear()
+        self._revoked_users.clear()
+        self._refreshing.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+token_revocation_cache = TokenRevocationCache()
+
+# 백그라운드 재확인 task 참조 유지(GC 방지)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def spawn_background(coro) -> None:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def revoke_by_refresh_token(refresh_token: str | None) -> None:
+    """
+    로그아웃 시 refresh token 의 sid(세션)를 폐기 등록합니다.
+    동일 세션에서 발급된 access token 은 만료 전이라도 즉시 무효 처리됩니다.
+
+    서명을 검증하지 않고 payload 를 읽으므로, Keycloak 로그아웃이 성공해
+    토큰이 진짜임이 확인된 뒤에만 호출해야 합니다.
+    보관 시간은 refresh token 최대 수명으로 제한합니다.
+    """
+    if not refresh_token:
+        return
+    try:
+        decoded = jwt.decode(jwt=refresh_token, options={"verify_signature": False})
+    except Exception as e:
+        logger.warning(f"[token_revocation] Failed to decode refresh token: {e}")
+        return
+
+    sid = decoded.get("sid")
+    if not isinstance(sid, str):
+        return
+    max_expires_at = time.time() + settings.KC_REFRESH_TOKEN_MAX_LIFETIME_SECONDS
+    exp = decoded.get("exp")
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        expires_at = min(float(exp), max_expires_at)
+    else:
+        expires_at = max_expires_at
+    token_revocation_cache.revoke_session(sid, expires_at)
+
+
+def revoke_user(kc_user_id: str | None) -> None:
+    """
+    회원탈퇴 등으로 사용자의 기존 토큰을 모두 무효화합니다.
+    """
+    token_revocation_cache.revoke_user(kc_user_id)
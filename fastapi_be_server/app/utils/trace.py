@@ -0,0 +1,169 @@
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+import json
+import logging
+import time
+import uuid
+
+"""
+요청 추적(trace_id/span_id) 및 요청/응답 샘플 로깅용 ASGI 미들웨어
+"""
+
+logger = logging.getLogger(__name__)
+
+# 요청/응답 본문 샘플 최대 크기(bytes). 이 크기를 넘는 본문은 앞부분만 보관합니다.
+TRACE_SAMPLE_MAX_BYTES = 4096
+
+# 본문을 샘플링하지 않고 그대로 흘려보내는 스트리밍 응답 content-type
+_STREAMING_MEDIA_TYPES = ("text/event-stream", "text/csv", "application/octet-stream")
+
+_BODY_METHODS = ("POST", "PUT", "PATCH")
+
+
+class BoundedSample:
+    """
+    스트림으로 들어오는 bytes 중 앞부분 max_bytes 만 보관하는 샘플 버퍼
+    - 전체 본문을 복사하지 않고 총 길이(total_bytes)만 누적합니다.
+    """
+
+    __slots__ = ("max_bytes", "total_bytes", "truncated", "_buf")
+
+    def __init__(self, max_bytes: int = TRACE_SAMPLE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.truncated = False
+        self._buf = bytearray()
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.total_bytes += len(chunk)
+        remain = self.max_bytes - len(self._buf)
+        if remain <= 0:
+            self.truncated = True
+            return
+        if len(chunk) > remain:
+            self._buf += chunk[:remain]
+            self.truncated = True
+        else:
+            self._buf += chunk
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self._buf)
+
+    def as_json(self):
+        """
+        샘플이 본문 전체(잘리지 않음)일 때만 JSON 파싱 결과를 반환합니다. 그 외 None
+        """
+        if self.truncated or not self._buf:
+            return None
+        try:
+            return json.loads(self._buf)
+        except Exception:
+            return None
+
+    def as_text(self) -> str:
+        return self._buf.decode("utf-8", errors="replace")
+
+
+def _is_streaming_media_type(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type in _STREAMING_MEDIA_TYPES
+
+
+class TraceIdMiddleware:
+    """
+    trace_id, span_id 발급 미들웨어(pure ASGI)
+    - 요청 상태(request.state)에 params/body/analysis_params/trace_id/span_id/odata 저장
+    - 응답 헤더에 trace_id 추가
+    - 요청/응답 본문은 receive/send 를 지나가는 그대로 앞부분만 샘플링합니다(본문 재구성 없음).
+    - text/event-stream 등 스트리밍 응답은 샘플링 없이 청크 단위로 즉시 통과시킵니다.
+    """
+
+    def __init__(self, app: ASGIApp, sample_max_bytes: int = TRACE_SAMPLE_MAX_BYTES):
+        self.app = app
+        self.sample_max_bytes = sample_max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        headers = Headers(scope=scope)
+
+        trace_id = headers.get("trace_id") or str(uuid.uuid4().hex)
+        span_id = uuid.uuid4().int >> 64
+
+        # 요청 파라미터
+        params = dict(QueryParams(scope.get("query_string", b"")))
+
+        # 요청 상태 저장 (request.state 는 scope["state"] 를 참조)
+        state = scope.setdefault("state", {})
+        state["params"] = params
+        state["body"] = None
+        state["analysis_params"] = params
+        state["trace_id"] = trace_id
+        state["span_id"] = str(f"{span_id:016x}")
+        state["odata"] = headers.get("odata")
+
+        method = scope.get("method", "")
+        request_sample = (
+            BoundedSample(self.sample_max_bytes) if method in _BODY_METHODS else None
+        )
+        response_sample = BoundedSample(self.sample_max_bytes)
+        response_info = {"status_code": None, "streaming": False}
+
+        async def receive_with_sample() -> Message:
+            message = await receive()
+            if request_sample is not None and message["type"] == "http.request":
+                request_sample.feed(message.get("body", b""))
+                if not message.get("more_body", False):
+                    # 요청 바디는 샘플 한도 내에서 온전히 들어온 경우에만 파싱해 둡니다.
+                    state["body"] = request_sample.as_json()
+            return message
+
+        async def send_with_trace(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_info["status_code"] = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers["trace_id"] = trace_id
+                response_info["streaming"] = _is_streaming_media_type(
+                    response_headers.get("content-type")
+                )
+            elif message["type"] == "http.response.body":
+                if response_info["streaming"]:
+                    response_sample.total_bytes += len(message.get("body", b""))
+                else:
+                    response_sample.feed(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_sample, send_with_trace)
+        finally:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    {
+                        "trace_id": trace_id,
+                        "span_id": state["span_id"],
+                        "method": method,
+                        "path": scope.get("path"),
+                        "status_code": response_info["status_code"],
+                        "streaming": response_info["streaming"],
+                        "elapsed_ms": round(
+                            (time.perf_counter() - started_at) * 1000, 3
+                        ),
+                        "request_bytes": (
+                            request_sample.total_bytes if request_sample else 0
+                        ),
+                        "request_sample": (
+                            request_sample.as_text() if request_sample else None
+                        ),
+                        "response_bytes": response_sample.total_bytes,
+                        "response_sample": response_sample.as_text(),
+                    }
+                )
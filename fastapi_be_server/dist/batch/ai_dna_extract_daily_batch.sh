@@ -52,7 +52,7 @@ echo "$$" > "$LOCK_PID_FILE"
 if [ -r /proc/1/environ ]; then
   while IFS='=' read -r key value; do
     case "$key" in
-      ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS)
+      ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS|AI_DNA_CONCURRENCY|AI_DNA_PROVIDER_RPM|AI_DNA_RATE_BURST|AI_DNA_WRITE_BATCH_SIZE|AI_DNA_CHECKPOINT_PATH)
         export "$key=$value"
         ;;
     esac
@@ -148,6 +148,29 @@ on duplicate key update
     updated_date = now()
 ;
 
+-- 축 점수가 바뀐 유저의 취향 추천 캐시 무효화 (app/services/ai/taste_recommendation_cache.py)
+insert into tb_user_taste_profile_version (
+    user_id,
+    profile_version
+)
+select x.user_id
+     , 1 as profile_version
+  from (
+        select f.user_id
+          from tb_user_ai_signal_event_factor f
+         where f.created_date >= @watermark
+           and f.created_date < @batch_end
+        union
+        select e.user_id
+          from tb_user_ai_signal_event e
+         where e.created_date >= @watermark
+           and e.created_date < @batch_end
+           and json_extract(e.event_payload, '$.factor_type') is not null
+  ) x
+on duplicate key update
+    profile_version = profile_version + 1
+;
+
 -- 이번 실행에서 실제 반영된 이벤트의 최대 created_date를 계산한다.
 set @processed_max_created_date = (
     select max(x.created_date)
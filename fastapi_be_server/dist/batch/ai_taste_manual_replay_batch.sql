@@ -138,6 +138,29 @@ on duplicate key update
 
 set @upsert_affected_rows = row_count();
 
+-- 재반영 대상 유저의 취향 추천 캐시 무효화 (app/services/ai/taste_recommendation_cache.py)
+insert into tb_user_taste_profile_version (
+    user_id,
+    profile_version
+)
+select x.user_id
+     , 1 as profile_version
+  from (
+        select f.user_id
+          from tb_user_ai_signal_event_factor f
+         where f.event_id >= @replay_from_id
+           and f.event_id <= @replay_to_id
+        union
+        select e.user_id
+          from tb_user_ai_signal_event e
+         where e.id >= @replay_from_id
+           and e.id <= @replay_to_id
+           and json_extract(e.event_payload, '$.factor_type') is not null
+  ) x
+on duplicate key update
+    profile_version = profile_version + 1
+;
+
 update tb_ai_taste_manual_replay_log
    set status = 'SUCCESS'
      , error_message = null
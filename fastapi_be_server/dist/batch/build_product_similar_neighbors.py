@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+유사 작품 이웃 테이블(tb_product_similar_neighbor)을 계산한다.
+
+- --product-ids: DNA 가 바뀐 작품 기준 증분 갱신 (extract_product_dna.py 가 저장 후 호출)
+- --all: 전체 재계산 (테이블이 비어 있으면 --product-ids 로 호출해도 전체 재계산)
+
+사용법 (컨테이너 내부):
+  python3 /app/dist/batch/build_product_similar_neighbors.py --all
+  python3 /app/dist/batch/build_product_similar_neighbors.py --product-ids 673,674
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+if str(APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(APP_ROOT))
+
+from app.rdb import likenovel_db_engine, likenovel_db_session  # noqa: E402
+from app.services.ai import product_similar_neighbor  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build similar product neighbor table")
+    parser.add_argument("--all", action="store_true", help="전체 재계산")
+    parser.add_argument("--product-ids", help="DNA 가 바뀐 작품 ID (쉼표 구분)")
+    args = parser.parse_args()
+    if not args.all and not args.product_ids:
+        parser.error("--all 또는 --product-ids 중 하나를 지정하세요.")
+    return args
+
+
+def parse_product_ids(value: str | None) -> list[int]:
+    product_ids: list[int] = []
+    for token in str(value or "").split(","):
+        token = token.strip()
+        if token:
+            product_ids.append(int(token))
+    return product_ids
+
+
+async def run(args: argparse.Namespace) -> int:
+    product_ids = parse_product_ids(args.product_ids)
+    started = time.perf_counter()
+    try:
+        async with likenovel_db_session() as db:
+            rebuild_all = args.all
+            if not rebuild_all:
+                result = await db.execute(text("SELECT 1 FROM tb_product_similar_neighbor LIMIT 1"))
+                if result.scalar_one_or_none() is None:
+                    print("[INFO] 이웃 테이블이 비어 있어 전체 재계산합니다.")
+                    rebuild_all = True
+
+            if rebuild_all:
+                summary = await product_similar_neighbor.rebuild_all_similar_neighbors(db)
+            else:
+                summary = await product_similar_neighbor.refresh_similar_neighbors(db, product_ids)
+
+            print(
+                f"[DONE] mode={'all' if rebuild_all else 'incremental'} products={summary['products']} "
+                f"updated_products={summary['updated_products']} rows={summary['rows']} "
+                f"elapsed={time.perf_counter() - started:.1f}s"
+            )
+            return 0
+    finally:
+        await likenovel_db_engine.dispose()
+
+
+def main() -> int:
+    args = parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,7 +21,7 @@ for _try in 1 2 3; do
   if [ -r "$ENV_FILE" ] && [ -s "$ENV_FILE" ]; then
     while IFS="=" read -r key value || [ -n "$key" ]; do
       case "$key" in
-      DB_HOST|DB_IP|DB_PORT|DB_USER|DB_PW|DB_USER_ID|DB_USER_PW|DB_NAME|ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|STORY_AGENT_SUMMARY_MODEL|STORY_AGENT_SUMMARY_TEMPERATURE|STORY_AGENT_RP_REASONING_MODEL|STORY_AGENT_RP_REASONING_EFFORT|STORY_AGENT_RP_REASONING_THINKING_DISPLAY|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|STORY_AGENT_RP_DEEPSEEK_FALLBACK_MODEL|STORYCTX_MAX_PARALLEL|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS)
+      DB_HOST|DB_IP|DB_PORT|DB_USER|DB_PW|DB_USER_ID|DB_USER_PW|DB_NAME|ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|STORY_AGENT_SUMMARY_MODEL|STORY_AGENT_SUMMARY_TEMPERATURE|STORY_AGENT_RP_REASONING_MODEL|STORY_AGENT_RP_REASONING_EFFORT|STORY_AGENT_RP_REASONING_THINKING_DISPLAY|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|STORY_AGENT_RP_DEEPSEEK_FALLBACK_MODEL|STORYCTX_MAX_PARALLEL|STORY_AGENT_CONTEXT_WORKERS|STORY_AGENT_SUMMARY_CONCURRENCY|STORY_AGENT_SUMMARY_RPM|STORY_AGENT_CONTEXT_DOC_BATCH_SIZE|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS|AI_DNA_CONCURRENCY|AI_DNA_PROVIDER_RPM|AI_DNA_RATE_BURST|AI_DNA_WRITE_BATCH_SIZE|AI_DNA_CHECKPOINT_PATH)
           export "$key=$value"
           ;;
       esac
@@ -36,7 +36,7 @@ done
 if [ "$_loaded" = false ] && [ -r /proc/1/environ ]; then
   while IFS='=' read -r key value; do
     case "$key" in
-      DB_HOST|DB_IP|DB_PORT|DB_USER|DB_PW|DB_USER_ID|DB_USER_PW|DB_NAME|ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|STORY_AGENT_SUMMARY_MODEL|STORY_AGENT_SUMMARY_TEMPERATURE|STORY_AGENT_RP_REASONING_MODEL|STORY_AGENT_RP_REASONING_EFFORT|STORY_AGENT_RP_REASONING_THINKING_DISPLAY|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|STORY_AGENT_RP_DEEPSEEK_FALLBACK_MODEL|STORYCTX_MAX_PARALLEL|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS)
+      DB_HOST|DB_IP|DB_PORT|DB_USER|DB_PW|DB_USER_ID|DB_USER_PW|DB_NAME|ANTHROPIC_API_KEY|ANTHROPIC_MODEL|OPENROUTER_API_KEY|OPENROUTER_BASE_URL|STORY_AGENT_SUMMARY_MODEL|STORY_AGENT_SUMMARY_TEMPERATURE|STORY_AGENT_RP_REASONING_MODEL|STORY_AGENT_RP_REASONING_EFFORT|STORY_AGENT_RP_REASONING_THINKING_DISPLAY|DEEPSEEK_API_KEY|DEEPSEEK_BASE_URL|AI_DNA_DEEPSEEK_FALLBACK_MODEL|STORY_AGENT_RP_DEEPSEEK_FALLBACK_MODEL|STORYCTX_MAX_PARALLEL|STORY_AGENT_CONTEXT_WORKERS|STORY_AGENT_SUMMARY_CONCURRENCY|STORY_AGENT_SUMMARY_RPM|STORY_AGENT_CONTEXT_DOC_BATCH_SIZE|AI_DNA_PROVIDER|AI_DNA_OPENROUTER_MODEL|AI_DNA_OPENROUTER_PROVIDER_ONLY|AI_DNA_RESPONSE_FORMAT|AI_DNA_TIMEOUT_SECONDS|AI_METADATA_MAX_TOKENS|AI_METADATA_PIPELINE_VERSION|AI_METADATA_FAILED_RETRY_COOLDOWN_DAYS|AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS|AI_DNA_CONCURRENCY|AI_DNA_PROVIDER_RPM|AI_DNA_RATE_BURST|AI_DNA_WRITE_BATCH_SIZE|AI_DNA_CHECKPOINT_PATH)
         export "$key=$value"
         ;;
     esac
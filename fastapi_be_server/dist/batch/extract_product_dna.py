@@ -11,9 +11,14 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
+import random
 import re
+import subprocess
+import sys
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -57,6 +62,16 @@ FAILED_RETRY_COOLDOWN_DAYS = int(os.getenv("AI_METADATA_FAILED_RETRY_COOLDOWN_DA
 INCOMPLETE_RETRY_COOLDOWN_DAYS = int(os.getenv("AI_METADATA_INCOMPLETE_RETRY_COOLDOWN_DAYS", "3"))
 ANALYSIS_PIPELINE_VERSION = os.getenv("AI_METADATA_PIPELINE_VERSION", "dna-v20260320-r1")
 UNSUPPORTED_LABEL_ERROR_PREFIX = "unsupported_label:"
+SIMILAR_NEIGHBOR_REFRESH_TIMEOUT_SECONDS = int(os.getenv("AI_SIMILAR_NEIGHBOR_REFRESH_TIMEOUT_SECONDS", "1800"))
+
+# 병렬 파이프라인 (기본은 기존 순차 처리, env 또는 --concurrency 2 이상으로 켬)
+AI_DNA_CONCURRENCY = int(os.getenv("AI_DNA_CONCURRENCY", "1"))
+AI_DNA_PROVIDER_RPM = os.getenv("AI_DNA_PROVIDER_RPM", "anthropic=50,openrouter=60,deepseek=60")  # provider 별 분당 요청 수
+AI_DNA_RATE_BURST = int(os.getenv("AI_DNA_RATE_BURST", "4"))
+AI_DNA_WRITE_BATCH_SIZE = int(os.getenv("AI_DNA_WRITE_BATCH_SIZE", "20"))
+AI_DNA_CHECKPOINT_PATH = os.getenv("AI_DNA_CHECKPOINT_PATH", "/tmp/ai-dna-extract-checkpoint.jsonl")
+RETRY_BACKOFF_BASE_SECONDS = 1.0
+RETRY_BACKOFF_MAX_SECONDS = 30.0
 
 AXIS_ORDER = ("세", "직", "능", "연", "작", "타", "목")
 AXIS_LIMITS: dict[str, tuple[int, int]] = {
@@ -194,6 +209,55 @@ DNA_REPAIR_TEMPLATE = """아래는 1차 분석 결과 JSON이다.
 """
 
 
+class TokenBucket:
+    """provider 요청 속도 제한 (스레드 안전, 토큰이 없으면 채워질 때까지 대기)."""
+
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 1개 사용, 대기한 초 반환."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(wait)
+            waited += wait
+
+
+# 파이프라인 실행 중에만 설정 (순차 처리는 작품 사이 sleep 으로 제한)
+_RATE_LIMITERS: dict[str, TokenBucket] = {}
+
+
+def configure_rate_limiters(spec: str, burst: int) -> dict[str, TokenBucket]:
+    """'anthropic=50,openrouter=60' 형식(분당 요청 수)으로 provider 별 버킷 설정."""
+    _RATE_LIMITERS.clear()
+    for item in _split_csv(spec):
+        provider, _, rpm = item.partition("=")
+        if not rpm.strip():
+            continue
+        per_minute = float(rpm)
+        if per_minute > 0:
+            _RATE_LIMITERS[provider.strip().lower()] = TokenBucket(per_minute / 60.0, burst)
+    return _RATE_LIMITERS
+
+
+def _acquire_rate_limit(provider: str) -> None:
+    bucket = _RATE_LIMITERS.get(provider)
+    if bucket is not None:
+        bucket.acquire()
+
+
 class UnsupportedLabelError(ValueError):
     def __init__(self, axis: str, label: str):
         self.axis = axis
@@ -900,6 +964,7 @@ def _call_llm(
 ) -> tuple[str, dict[str, Any]]:
     if AI_DNA_PROVIDER == "anthropic":
         try:
+            _acquire_rate_limit("anthropic")
             return call_claude(system_prompt, user_prompt), {
                 "provider": "anthropic",
                 "model": ANTHROPIC_MODEL,
@@ -908,6 +973,7 @@ def _call_llm(
         except Exception as exc:
             if not DEEPSEEK_API_KEY:
                 raise
+            _acquire_rate_limit("deepseek")
             raw, usage = call_deepseek(system_prompt, user_prompt)
             return raw, {
                 "provider": "deepseek",
@@ -918,6 +984,7 @@ def _call_llm(
                 "usage": _usage_summary(usage),
             }
     if AI_DNA_PROVIDER == "openrouter":
+        _acquire_rate_limit("openrouter")
         raw, usage = call_openrouter(system_prompt, user_prompt, allowed_labels)
         return raw, {
             "provider": "openrouter",
@@ -1025,112 +1092,189 @@ def analyze_product(
     return normalized, parsed
 
 
+SAVE_DNA_INSERT_SQL = """
+    INSERT INTO tb_product_ai_metadata (
+        product_id,
+        protagonist_type, protagonist_desc, heroine_type, heroine_weight, romance_chemistry_weight,
+        mood, pacing, premise, hook,
+        protagonist_goal_primary, goal_confidence, overall_confidence,
+        protagonist_material_tags, worldview_tags, protagonist_type_tags, protagonist_job_tags, axis_style_tags, axis_romance_tags,
+        themes, similar_famous, taste_tags,
+        raw_analysis, analyzed_at, model_version,
+        analysis_status, analysis_attempt_count, analysis_error_message
+    ) VALUES
+"""
+SAVE_DNA_ROW_SQL = """(
+        %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s,
+        %s, %s, %s,
+        %s, %s, %s, %s, %s, %s,
+        %s, %s, %s,
+        %s, NOW(), %s,
+        'success', %s, NULL
+    )"""
+SAVE_DNA_UPDATE_SQL = """
+    ON DUPLICATE KEY UPDATE
+        protagonist_type = VALUES(protagonist_type),
+        protagonist_desc = VALUES(protagonist_desc),
+        heroine_type = VALUES(heroine_type),
+        heroine_weight = VALUES(heroine_weight),
+        romance_chemistry_weight = VALUES(romance_chemistry_weight),
+        mood = VALUES(mood),
+        pacing = VALUES(pacing),
+        premise = VALUES(premise),
+        hook = VALUES(hook),
+        protagonist_goal_primary = VALUES(protagonist_goal_primary),
+        goal_confidence = VALUES(goal_confidence),
+        overall_confidence = VALUES(overall_confidence),
+        protagonist_material_tags = VALUES(protagonist_material_tags),
+        worldview_tags = VALUES(worldview_tags),
+        protagonist_type_tags = VALUES(protagonist_type_tags),
+        protagonist_job_tags = VALUES(protagonist_job_tags),
+        axis_style_tags = VALUES(axis_style_tags),
+        axis_romance_tags = VALUES(axis_romance_tags),
+        themes = VALUES(themes),
+        similar_famous = VALUES(similar_famous),
+        taste_tags = VALUES(taste_tags),
+        raw_analysis = VALUES(raw_analysis),
+        analyzed_at = NOW(),
+        model_version = VALUES(model_version),
+        analysis_status = 'success',
+        analysis_attempt_count = VALUES(analysis_attempt_count),
+        analysis_error_message = NULL
+"""
+
+SAVE_FAILED_INSERT_SQL = """
+    INSERT INTO tb_product_ai_metadata (
+        product_id, analysis_status, analysis_attempt_count, analysis_error_message, model_version
+    ) VALUES
+"""
+SAVE_FAILED_ROW_SQL = """(
+        %s, 'failed', %s, %s, %s
+    )"""
+SAVE_FAILED_UPDATE_SQL = """
+    ON DUPLICATE KEY UPDATE
+        analysis_status = 'failed',
+        analysis_attempt_count = VALUES(analysis_attempt_count),
+        analysis_error_message = VALUES(analysis_error_message),
+        model_version = VALUES(model_version)
+"""
+
+
+def _dna_row_params(product_id: int, dna: dict, parsed: dict, attempt_count: int) -> tuple:
+    return (
+        product_id,
+        dna.get("protagonist_type"),
+        dna.get("protagonist_desc"),
+        dna.get("heroine_type"),
+        dna.get("heroine_weight"),
+        dna.get("romance_chemistry_weight"),
+        dna.get("mood"),
+        dna.get("pacing"),
+        dna.get("premise"),
+        dna.get("hook"),
+        dna.get("protagonist_goal_primary"),
+        dna.get("goal_confidence"),
+        dna.get("overall_confidence"),
+        json.dumps(dna.get("protagonist_material_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("worldview_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("protagonist_type_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("protagonist_job_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("axis_style_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("axis_romance_tags", []), ensure_ascii=False),
+        json.dumps(dna.get("themes", []), ensure_ascii=False),
+        json.dumps(dna.get("similar_famous", []), ensure_ascii=False),
+        json.dumps(dna.get("taste_tags", []), ensure_ascii=False),
+        json.dumps(parsed, ensure_ascii=False),
+        CURRENT_ANALYSIS_VERSION,
+        attempt_count,
+    )
+
+
+def _failed_row_params(product_id: int, attempt_count: int, error_message: str) -> tuple:
+    return (
+        product_id,
+        attempt_count,
+        (error_message or "unknown error")[:1000],
+        CURRENT_ANALYSIS_VERSION,
+    )
+
+
+def _multi_row_sql(insert_sql: str, row_sql: str, update_sql: str, row_count: int) -> str:
+    return insert_sql + ",\n    ".join([row_sql] * row_count) + update_sql
+
+
 def save_dna(conn, product_id: int, dna: dict, parsed: dict, attempt_count: int):
     """분석 결과 저장 (UPSERT)."""
     with conn.cursor() as cur:
         cur.execute(
-            """
-            INSERT INTO tb_product_ai_metadata (
-                product_id,
-                protagonist_type, protagonist_desc, heroine_type, heroine_weight, romance_chemistry_weight,
-                mood, pacing, premise, hook,
-                protagonist_goal_primary, goal_confidence, overall_confidence,
-                protagonist_material_tags, worldview_tags, protagonist_type_tags, protagonist_job_tags, axis_style_tags, axis_romance_tags,
-                themes, similar_famous, taste_tags,
-                raw_analysis, analyzed_at, model_version,
-                analysis_status, analysis_attempt_count, analysis_error_message
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, NOW(), %s,
-                'success', %s, NULL
-            )
-            ON DUPLICATE KEY UPDATE
-                protagonist_type = VALUES(protagonist_type),
-                protagonist_desc = VALUES(protagonist_desc),
-                heroine_type = VALUES(heroine_type),
-                heroine_weight = VALUES(heroine_weight),
-                romance_chemistry_weight = VALUES(romance_chemistry_weight),
-                mood = VALUES(mood),
-                pacing = VALUES(pacing),
-                premise = VALUES(premise),
-                hook = VALUES(hook),
-                protagonist_goal_primary = VALUES(protagonist_goal_primary),
-                goal_confidence = VALUES(goal_confidence),
-                overall_confidence = VALUES(overall_confidence),
-                protagonist_material_tags = VALUES(protagonist_material_tags),
-                worldview_tags = VALUES(worldview_tags),
-                protagonist_type_tags = VALUES(protagonist_type_tags),
-                protagonist_job_tags = VALUES(protagonist_job_tags),
-                axis_style_tags = VALUES(axis_style_tags),
-                axis_romance_tags = VALUES(axis_romance_tags),
-                themes = VALUES(themes),
-                similar_famous = VALUES(similar_famous),
-                taste_tags = VALUES(taste_tags),
-                raw_analysis = VALUES(raw_analysis),
-                analyzed_at = NOW(),
-                model_version = VALUES(model_version),
-                analysis_status = 'success',
-                analysis_attempt_count = VALUES(analysis_attempt_count),
-                analysis_error_message = NULL
-        """,
-            (
-                product_id,
-                dna.get("protagonist_type"),
-                dna.get("protagonist_desc"),
-                dna.get("heroine_type"),
-                dna.get("heroine_weight"),
-                dna.get("romance_chemistry_weight"),
-                dna.get("mood"),
-                dna.get("pacing"),
-                dna.get("premise"),
-                dna.get("hook"),
-                dna.get("protagonist_goal_primary"),
-                dna.get("goal_confidence"),
-                dna.get("overall_confidence"),
-                json.dumps(dna.get("protagonist_material_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("worldview_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("protagonist_type_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("protagonist_job_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("axis_style_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("axis_romance_tags", []), ensure_ascii=False),
-                json.dumps(dna.get("themes", []), ensure_ascii=False),
-                json.dumps(dna.get("similar_famous", []), ensure_ascii=False),
-                json.dumps(dna.get("taste_tags", []), ensure_ascii=False),
-                json.dumps(parsed, ensure_ascii=False),
-                CURRENT_ANALYSIS_VERSION,
-                attempt_count,
-            ),
+            _multi_row_sql(SAVE_DNA_INSERT_SQL, SAVE_DNA_ROW_SQL, SAVE_DNA_UPDATE_SQL, 1),
+            _dna_row_params(product_id, dna, parsed, attempt_count),
         )
 
 
 def save_failed(conn, product_id: int, attempt_count: int, error_message: str):
     with conn.cursor() as cur:
         cur.execute(
-            """
-            INSERT INTO tb_product_ai_metadata (
-                product_id, analysis_status, analysis_attempt_count, analysis_error_message, model_version
-            ) VALUES (
-                %s, 'failed', %s, %s, %s
-            )
-            ON DUPLICATE KEY UPDATE
-                analysis_status = 'failed',
-                analysis_attempt_count = VALUES(analysis_attempt_count),
-                analysis_error_message = VALUES(analysis_error_message),
-                model_version = VALUES(model_version)
-            """,
-            (
-                product_id,
-                attempt_count,
-                (error_message or "unknown error")[:1000],
-                CURRENT_ANALYSIS_VERSION,
-            ),
+            _multi_row_sql(SAVE_FAILED_INSERT_SQL, SAVE_FAILED_ROW_SQL, SAVE_FAILED_UPDATE_SQL, 1),
+            _failed_row_params(product_id, attempt_count, error_message),
         )
 
 
+def save_results_batch(conn, results: list[dict[str, Any]]) -> None:
+    """파이프라인 결과를 성공/실패별 multi-row UPSERT 로 저장 (save_dna/save_failed 와 같은 값)."""
+    success_params: list[Any] = []
+    failed_params: list[Any] = []
+    success_count = 0
+    failed_count = 0
+    for result in results:
+        if result["status"] == "success":
+            success_params.extend(
+                _dna_row_params(result["product_id"], result["dna"], result["parsed"], result["attempt_count"])
+            )
+            success_count += 1
+        else:
+            failed_params.extend(
+                _failed_row_params(result["product_id"], result["attempt_count"], result["error_message"])
+            )
+            failed_count += 1
+    with conn.cursor() as cur:
+        if success_count:
+            cur.execute(
+                _multi_row_sql(SAVE_DNA_INSERT_SQL, SAVE_DNA_ROW_SQL, SAVE_DNA_UPDATE_SQL, success_count),
+                success_params,
+            )
+        if failed_count:
+            cur.execute(
+                _multi_row_sql(SAVE_FAILED_INSERT_SQL, SAVE_FAILED_ROW_SQL, SAVE_FAILED_UPDATE_SQL, failed_count),
+                failed_params,
+            )
+
+
+def refresh_similar_neighbors(product_ids: list[int]) -> bool:
+    """
+    DNA 가 바뀐(성공/실패 저장) 작품 기준 유사 작품 이웃 증분 갱신.
+    앱 모듈(product_similar_neighbor)을 쓰는 별도 스크립트로 실행하고, 실패해도 추출 결과는 유지한다.
+    """
+    if not product_ids:
+        return True
+    command = [
+        sys.executable,
+        str(SCRIPT_DIR / "build_product_similar_neighbors.py"),
+        "--product-ids",
+        ",".join(str(product_id) for product_id in sorted(set(product_ids))),
+    ]
+    try:
+        completed = subprocess.run(command, check=False, timeout=SIMILAR_NEIGHBOR_REFRESH_TIMEOUT_SECONDS)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        print(f"[WARN] similar neighbor refresh failed: {e}")
+        return False
+    if completed.returncode != 0:
+        print(f"[WARN] similar neighbor refresh failed (exit={completed.returncode})")
+        return False
+    return True
+
+
 def _format_failure_message(error: Exception) -> str:
     if isinstance(error, UnsupportedLabelError):
         return f"{UNSUPPORTED_LABEL_ERROR_PREFIX}{error.axis}:{error.label}"
@@ -1144,28 +1288,11 @@ def _format_cost_from_parsed(parsed: dict[str, Any]) -> str:
     return f", cost=${float(meta['total_cost']):.6f}"
 
 
-def main():
-    parser = argparse.ArgumentParser(description="작품 AI 메타 추출")
-    parser.add_argument("--product-id", type=int, help="특정 작품 ID만 분석")
-    parser.add_argument("--all", action="store_true", help="전체 작품 분석")
-    parser.add_argument("--force", action="store_true", help="기존 분석 덮어쓰기")
-    args = parser.parse_args()
-
-    if not args.product_id and not args.all:
-        parser.error("--product-id 또는 --all 중 하나를 지정하세요.")
-
-    allowed_labels = load_allowed_labels()
-    _validate_runtime_config(allowed_labels)
-    conn = db_connect()
-    print(f"[OK] DB 연결 성공 ({DB_HOST}:{DB_PORT})")
-    print(f"[OK] 라벨 SSOT 로드 완료: {next(path for path in LABELS_JSON_CANDIDATES if path.exists())}")
-    print(f"[INFO] provider={AI_DNA_PROVIDER}, version={CURRENT_ANALYSIS_VERSION}")
-
-    products = get_products(conn, args.product_id, args.force)
-    print(f"[INFO] 분석 대상: {len(products)}개 작품")
-
+def run_sequential(conn, products: list[dict], allowed_labels: dict[str, set[str]]) -> tuple[int, int, list[int]]:
+    """작품을 하나씩 분석/저장 (기존 방식, --concurrency 1)."""
     success = 0
     fail = 0
+    changed_product_ids: list[int] = []
     for i, product in enumerate(products, 1):
         pid = product["product_id"]
         title = product["title"]
@@ -1176,6 +1303,7 @@ def main():
         if used_count < MIN_REQUIRED_EPISODES:
             fail += 1
             save_failed(conn, pid, 1, f"insufficient_episodes(<{MIN_REQUIRED_EPISODES})")
+            changed_product_ids.append(pid)
             print(f"SKIP: insufficient episodes ({used_count})")
             continue
 
@@ -1202,11 +1330,236 @@ def main():
             fail += 1
             save_failed(conn, pid, MAX_RETRY_COUNT + 1, last_error)
             print(f"FAIL: {last_error}")
+        changed_product_ids.append(pid)
 
         time.sleep(1)  # rate limit 방지
+    return success, fail, changed_product_ids
+
+
+def _retry_delay(retry_idx: int) -> float:
+    """지수 백오프 + jitter (동시에 실패한 작업이 같은 시점에 재시도하지 않도록)."""
+    ceiling = min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_BASE_SECONDS * (2 ** retry_idx))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class ExtractCheckpoint:
+    """
+    저장까지 끝난 작품 ID 와 결과 상태 기록 (JSON lines).
+    같은 실행 조건(분석 버전/force/대상)으로 다시 실행하면 성공한 작품만 건너뛰고(실패는 재시도), 정상 종료 시 파일을 지운다.
+    """
+
+    def __init__(self, path: str | None, run_key: str):
+        self.path = Path(path) if path else None
+        self.run_key = run_key
+
+    def load(self) -> set[int]:
+        if self.path is None or not self.path.exists():
+            return set()
+        done: set[int] = set()
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시점의 잘린 줄
+                if entry.get("run_key") == self.run_key and entry.get("status") == "success":
+                    done.add(int(entry["product_id"]))
+        return done
+
+    def record(self, results: list[dict[str, Any]]) -> None:
+        if self.path is None or not results:
+            return
+        with self.path.open("a", encoding="utf-8") as f:
+            for result in results:
+                f.write(
+                    json.dumps(
+                        {"run_key": self.run_key, "product_id": result["product_id"], "status": result["status"]},
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                )
+
+    def clear(self) -> None:
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+
+class DnaResultWriter:
+    """분석 결과를 모아 batch_size 개씩 저장하고, 저장된 작품만 체크포인트에 기록."""
+
+    def __init__(self, conn, db_lock: asyncio.Lock, batch_size: int, checkpoint: ExtractCheckpoint):
+        self.conn = conn
+        self.db_lock = db_lock
+        self.batch_size = max(1, batch_size)
+        self.checkpoint = checkpoint
+        self.pending: list[dict[str, Any]] = []
+        self.flush_count = 0
+
+    async def add(self, result: dict[str, Any]) -> None:
+        self.pending.append(result)
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.pending:
+            return
+        results, self.pending = self.pending, []
+        async with self.db_lock:
+            await asyncio.to_thread(save_results_batch, self.conn, results)
+        self.flush_count += 1
+        self.checkpoint.record(results)
+
+
+async def _analyze_product_async(
+    product: dict,
+    allowed_labels: dict[str, set[str]],
+    conn,
+    db_lock: asyncio.Lock,
+) -> dict[str, Any]:
+    """작품 1개 분석 (run_sequential 과 같은 판정/재시도 횟수, 저장은 writer)."""
+    pid = product["product_id"]
+    async with db_lock:
+        episodes = await asyncio.to_thread(get_episodes, conn, pid)
+    episode_context, used_count = _build_episode_context(episodes)
+    if used_count < MIN_REQUIRED_EPISODES:
+        return {
+            "product_id": pid,
+            "status": "failed",
+            "attempt_count": 1,
+            "error_message": f"insufficient_episodes(<{MIN_REQUIRED_EPISODES})",
+            "log": f"SKIP: insufficient episodes ({used_count})",
+        }
+
+    last_error = "unknown error"
+    for retry_idx in range(MAX_RETRY_COUNT + 1):
+        attempt = retry_idx + 1
+        try:
+            # LLM 호출은 동기 httpx 라 스레드에서 실행 (provider 버킷은 _call_llm 에서 대기)
+            dna, parsed = await asyncio.to_thread(analyze_product, product, allowed_labels, episode_context, used_count)
+            return {
+                "product_id": pid,
+                "status": "success",
+                "attempt_count": attempt,
+                "dna": dna,
+                "parsed": parsed,
+                "log": f"OK (attempt={attempt}{_format_cost_from_parsed(parsed)})",
+            }
+        except UnsupportedLabelError as e:
+            last_error = _format_failure_message(e)
+            break
+        except Exception as e:
+            last_error = _format_failure_message(e)
+            if attempt <= MAX_RETRY_COUNT:
+                await asyncio.sleep(_retry_delay(retry_idx))
+    return {
+        "product_id": pid,
+        "status": "failed",
+        "attempt_count": MAX_RETRY_COUNT + 1,
+        "error_message": last_error,
+        "log": f"FAIL: {last_error}",
+    }
+
+
+async def run_pipeline(
+    conn,
+    products: list[dict],
+    allowed_labels: dict[str, set[str]],
+    *,
+    concurrency: int,
+    write_batch_size: int,
+    checkpoint: ExtractCheckpoint,
+) -> tuple[int, int, list[int]]:
+    """
+    작품을 concurrency 개씩 동시에 분석하는 파이프라인.
+    - DB 연결은 하나를 락으로 나눠 쓰고(회차 조회/저장), 저장은 write_batch_size 개씩 multi-row UPSERT
+    - 체크포인트에 성공으로 기록된 작품은 건너뜀(중단 후 재실행, 실패한 작품은 다시 분석)
+    """
+    done = checkpoint.load()
+    pending = [product for product in products if int(product["product_id"]) not in done]
+    if done:
+        print(f"[INFO] 체크포인트 이어서 처리: {len(products) - len(pending)}개 건너뜀 ({checkpoint.path})")
+
+    db_lock = asyncio.Lock()
+    writer = DnaResultWriter(conn, db_lock, write_batch_size, checkpoint)
+    queue: asyncio.Queue = asyncio.Queue()
+    for product in pending:
+        queue.put_nowait(product)
+
+    counts = {"success": 0, "fail": 0, "finished": 0}
+    changed_product_ids: list[int] = []
+
+    async def worker() -> None:
+        while True:
+            try:
+                product = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await _analyze_product_async(product, allowed_labels, conn, db_lock)
+            counts["finished"] += 1
+            counts["success" if result["status"] == "success" else "fail"] += 1
+            changed_product_ids.append(result["product_id"])
+            print(f"[{counts['finished']}/{len(pending)}] {product['product_id']}: {product['title']} ... {result['log']}")
+            await writer.add(result)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    finally:
+        # 중단되더라도 분석이 끝난 결과는 저장/체크포인트 기록
+        await writer.flush()
+    checkpoint.clear()
+    return counts["success"], counts["fail"], changed_product_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작품 AI 메타 추출")
+    parser.add_argument("--product-id", type=int, help="특정 작품 ID만 분석")
+    parser.add_argument("--all", action="store_true", help="전체 작품 분석")
+    parser.add_argument("--force", action="store_true", help="기존 분석 덮어쓰기")
+    parser.add_argument(
+        "--concurrency", type=int, default=AI_DNA_CONCURRENCY, help="동시 분석 작품 수 (1이면 순차 처리)"
+    )
+    parser.add_argument(
+        "--write-batch-size", type=int, default=AI_DNA_WRITE_BATCH_SIZE, help="한 번에 저장할 분석 결과 수"
+    )
+    parser.add_argument(
+        "--checkpoint", default=AI_DNA_CHECKPOINT_PATH, help="체크포인트 파일 경로 (빈 값이면 사용 안 함)"
+    )
+    args = parser.parse_args()
+
+    if not args.product_id and not args.all:
+        parser.error("--product-id 또는 --all 중 하나를 지정하세요.")
+
+    allowed_labels = load_allowed_labels()
+    _validate_runtime_config(allowed_labels)
+    conn = db_connect()
+    print(f"[OK] DB 연결 성공 ({DB_HOST}:{DB_PORT})")
+    print(f"[OK] 라벨 SSOT 로드 완료: {next(path for path in LABELS_JSON_CANDIDATES if path.exists())}")
+    print(f"[INFO] provider={AI_DNA_PROVIDER}, version={CURRENT_ANALYSIS_VERSION}")
+
+    products = get_products(conn, args.product_id, args.force)
+    print(f"[INFO] 분석 대상: {len(products)}개 작품")
+
+    if args.concurrency <= 1:
+        success, fail, changed_product_ids = run_sequential(conn, products, allowed_labels)
+    else:
+        configure_rate_limiters(AI_DNA_PROVIDER_RPM, AI_DNA_RATE_BURST)
+        print(f"[INFO] concurrency={args.concurrency}, rpm={AI_DNA_PROVIDER_RPM}, write_batch={args.write_batch_size}")
+        run_key = f"{CURRENT_ANALYSIS_VERSION}:force={args.force}:target={args.product_id or 'all'}"
+        success, fail, changed_product_ids = asyncio.run(
+            run_pipeline(
+                conn,
+                products,
+                allowed_labels,
+                concurrency=args.concurrency,
+                write_batch_size=args.write_batch_size,
+                checkpoint=ExtractCheckpoint(args.checkpoint, run_key),
+            )
+        )
 
     conn.close()
     print(f"\n[DONE] 성공: {success}, 실패: {fail}")
+    if changed_product_ids and refresh_similar_neighbors(changed_product_ids):
+        print(f"[OK] 유사 작품 이웃 갱신: {len(changed_product_ids)}개 작품 기준")
     if fail > 0 and success == 0:
         raise SystemExit(1)
 
@@ -19,6 +19,16 @@ SET @recent_24h_basis_at = STR_TO_DATE(
     '%Y-%m-%d %H:%i:%s'
 );
 
+-- 랭킹은 shadow 테이블(*_next)에 재계산한 뒤 RENAME TABLE 로 한 번에 교체한다.
+-- 라이브 테이블을 비우고 다시 채우지 않으므로 조회 쪽에서 빈/일부 랭킹이 보이거나 삭제 락을 기다리지 않는다.
+-- (DDL 은 암묵적 commit 이므로 트랜잭션 시작 전에 준비)
+DROP TABLE IF EXISTS tb_product_rank_next;
+DROP TABLE IF EXISTS tb_product_rank_area_next;
+DROP TABLE IF EXISTS tb_product_rank_old;
+DROP TABLE IF EXISTS tb_product_rank_area_old;
+CREATE TABLE tb_product_rank_next LIKE tb_product_rank;
+CREATE TABLE tb_product_rank_area_next LIKE tb_product_rank_area;
+
 start transaction;
 
 -- 기존 랭킹을 임시 테이블에 저장 (privious_rank 계산용)
@@ -67,13 +77,10 @@ SELECT p.product_id
  WHERE ep.open_episode_count >= 3
 ;
 
--- 기존 랭킹 데이터 전체 삭제 (중복 방지)
-DELETE FROM tb_product_rank;
-
 -- 무료 Top 랭킹 재계산
 -- 공개 3회차 이상 작품만
 -- 총점 = 90 * log(1 + 최근 24시간 조회수 정규화) + 10 * log(1 + 누적 조회수 정규화)
-insert into tb_product_rank (product_id, current_rank, privious_rank, created_id, updated_id)
+insert into tb_product_rank_next (product_id, current_rank, privious_rank, created_id, updated_id)
 select t.product_id
      , t.current_rank
      , t.privious_rank
@@ -105,7 +112,7 @@ select t.product_id
 -- 유료 Top 랭킹 재계산
 -- 공개 3회차 이상 작품만
 -- 총점 = 90 * log(1 + 최근 24시간 조회수 정규화) + 10 * log(1 + 누적 조회수 정규화)
-insert into tb_product_rank (product_id, current_rank, privious_rank, created_id, updated_id)
+insert into tb_product_rank_next (product_id, current_rank, privious_rank, created_id, updated_id)
 select t.product_id
      , t.current_rank
      , t.privious_rank
@@ -149,10 +156,8 @@ SELECT r1.area_code, r1.product_id, r1.current_rank
    AND r1.created_date = r2.max_created_date
 ;
 
-DELETE FROM tb_product_rank_area;
-
 -- 무료연재 Top 랭킹 재계산
-insert into tb_product_rank_area (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
+insert into tb_product_rank_area_next (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
 select 'freeSerialTop'
      , t.product_id
      , t.current_rank
@@ -194,7 +199,7 @@ select 'freeSerialTop'
 ;
 
 -- 유료연재 Top 랭킹 재계산
-insert into tb_product_rank_area (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
+insert into tb_product_rank_area_next (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
 select 'paidSerialTop'
      , t.product_id
      , t.current_rank
@@ -237,7 +242,7 @@ select 'paidSerialTop'
 ;
 
 -- 연재완결 Top 랭킹 재계산
-insert into tb_product_rank_area (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
+insert into tb_product_rank_area_next (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
 select 'paidEndTop'
      , t.product_id
      , t.current_rank
@@ -272,7 +277,7 @@ select 'paidEndTop'
 ;
 
 -- 단행본 Top 랭킹 재계산
-insert into tb_product_rank_area (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
+insert into tb_product_rank_area_next (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
 select 'paidStandaloneTop'
      , t.product_id
      , t.current_rank
@@ -306,7 +311,7 @@ select 'paidStandaloneTop'
 ;
 
 -- 메인 유료 Top 랭킹 재계산 (유료연재 + 연재완결)
-insert into tb_product_rank_area (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
+insert into tb_product_rank_area_next (area_code, product_id, current_rank, previous_rank, created_id, updated_id)
 select 'paidMainTop'
      , t.product_id
      , t.current_rank
@@ -379,7 +384,7 @@ SELECT @recent_24h_basis_at
      , r.previous_rank
      , 0
      , 0
-  FROM tb_product_rank_area r
+  FROM tb_product_rank_area_next r
  INNER JOIN tb_product p
     ON p.product_id = r.product_id
   LEFT JOIN tmp_product_rank_basis b
@@ -403,6 +408,23 @@ DROP TEMPORARY TABLE IF EXISTS tmp_product_rank_basis;
 
 commit;
 
+-- 재계산한 랭킹으로 원자적 교체(두 테이블을 한 문장으로 교체해 조회 쪽은 교체 전/후 중 하나만 본다)
+RENAME TABLE tb_product_rank TO tb_product_rank_old,
+             tb_product_rank_next TO tb_product_rank,
+             tb_product_rank_area TO tb_product_rank_area_old,
+             tb_product_rank_area_next TO tb_product_rank_area;
+
+DROP TABLE IF EXISTS tb_product_rank_old;
+DROP TABLE IF EXISTS tb_product_rank_area_old;
+
+-- 랭킹 세대 번호 증가(앱의 랭킹 포함 목록 캐시는 세대가 바뀔 때 한 번 무효화)
+INSERT INTO tb_batch_generation (generation_key, generation, created_id, updated_id)
+VALUES ('product_rank', 1, 0, 0)
+ON DUPLICATE KEY UPDATE
+    generation = generation + 1,
+    updated_id = 0,
+    updated_date = CURRENT_TIMESTAMP;
+
 INSERT INTO tb_product_hit_snapshot_hourly (
     basis_at, product_id, count_hit, created_id, updated_id
 )
@@ -0,0 +1,149 @@
+-- 작품 카드 read model (app/services/product/product_card_service.py)
+-- 목록 API 의 작품 단위 집계(회차 수, 키워드, 관심 수, 매출, 계약 제안, 유료 전환 신청, 최신/첫 회차)를 미리 계산해 둔다.
+
+CREATE TABLE IF NOT EXISTS tb_product_card_summary (
+    product_id INT NOT NULL COMMENT '작품 ID',
+    keywords TEXT NULL COMMENT '키워드(|구분)',
+    episode_count INT NOT NULL DEFAULT 0 COMMENT '사용 회차 수',
+    open_episode_count INT NOT NULL DEFAULT 0 COMMENT '공개 회차 수',
+    open_episode_text_count BIGINT NOT NULL DEFAULT 0 COMMENT '공개 회차 글자 수 합',
+    latest_episode_id INT NULL COMMENT '최신 공개 회차 ID',
+    latest_episode_no INT NULL COMMENT '최신 공개 회차 번호',
+    first_episode_id INT NULL COMMENT '첫 공개 회차 ID',
+    total_interest INT NOT NULL DEFAULT 0 COMMENT '관심 유저 수',
+    total_sales BIGINT NOT NULL DEFAULT 0 COMMENT '누적 매출',
+    offer_count INT NOT NULL DEFAULT 0 COMMENT '계약 제안 수',
+    offer_id INT NULL COMMENT '최신 계약 제안 ID',
+    offer_date TIMESTAMP NULL COMMENT '최신 계약 제안 일시',
+    offer_price DOUBLE NULL COMMENT '최신 계약 제안 금액',
+    offer_profit DOUBLE NULL COMMENT '최신 계약 제안 제시자 수익',
+    author_profit DOUBLE NULL COMMENT '최신 계약 제안 작가 수익',
+    offer_decision_state VARCHAR(20) NULL COMMENT '최신 계약 제안 상태',
+    paid_state VARCHAR(20) NULL COMMENT '유료 전환 신청 상태',
+    paid_apply_count INT NOT NULL DEFAULT 0 COMMENT '유료 전환 신청 수',
+    paid_status_code_raw VARCHAR(20) NULL COMMENT '유료 전환 신청 상태코드',
+    interest_sustain_count INT NULL COMMENT '최근 관심 유지 수',
+    interest_loss_count INT NULL COMMENT '최근 관심 이탈 수',
+    refreshed_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '재계산 일시',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (product_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='작품 카드 read model';
+
+-- 초기 적재(이후에는 앱의 ProductCardRefresher 가 증분 갱신)
+INSERT INTO tb_product_card_summary (product_id, keywords, episode_count, open_episode_count, open_episode_text_count, latest_episode_id, latest_episode_no, first_episode_id, total_interest, total_sales, offer_count, offer_id, offer_date, offer_price, offer_profit, author_profit, offer_decision_state, paid_state, paid_apply_count, paid_status_code_raw, interest_sustain_count, interest_loss_count)
+SELECT product_id, keywords, episode_count, open_episode_count, open_episode_text_count, latest_episode_id, latest_episode_no, first_episode_id, total_interest, total_sales, offer_count, offer_id, offer_date, offer_price, offer_profit, author_profit, offer_decision_state, paid_state, paid_apply_count, paid_status_code_raw, interest_sustain_count, interest_loss_count
+  FROM (
+    SELECT p.product_id
+         , (SELECT GROUP_CONCAT(DISTINCT sk.keyword_name SEPARATOR '|')
+              FROM tb_mapped_product_keyword mpk
+              LEFT JOIN tb_standard_keyword sk ON sk.keyword_id = mpk.keyword_id
+             WHERE mpk.product_id = p.product_id) AS keywords
+         , COALESCE(ep_count.episode_count, 0) AS episode_count
+         , COALESCE(ep_count.open_episode_count, 0) AS open_episode_count
+         , COALESCE(ep_count.open_episode_text_count, 0) AS open_episode_text_count
+         , latest_episode.episode_id AS latest_episode_id
+         , latest_episode.episode_no AS latest_episode_no
+         , first_episode.episode_id AS first_episode_id
+         , COALESCE(interest_count.total_interest, 0) AS total_interest
+         , COALESCE(total_sales.total, 0) AS total_sales
+         , COALESCE(offer_stats.offer_count, 0) AS offer_count
+         , pco_latest.offer_id
+         , pco_latest.offer_date
+         , pco_latest.offer_price
+         , pco_latest.offer_profit
+         , pco_latest.author_profit
+         , pco_latest.decision_state AS offer_decision_state
+         , ppa_latest.paid_state
+         , COALESCE(ppa_latest.apply_count, 0) AS paid_apply_count
+         , ppa_latest.status_code_raw AS paid_status_code_raw
+         , pdcs.current_count_interest_sustain AS interest_sustain_count
+         , pdcs.current_count_interest_loss AS interest_loss_count
+      FROM tb_product p
+      LEFT JOIN (
+          SELECT product_id, COUNT(*) as episode_count, SUM(CASE WHEN open_yn = 'Y' THEN 1 ELSE 0 END) as open_episode_count, SUM(CASE WHEN open_yn = 'Y' THEN episode_text_count ELSE 0 END) as open_episode_text_count
+            FROM tb_product_episode
+           WHERE use_yn = 'Y'
+           GROUP BY product_id
+      ) ep_count ON ep_count.product_id = p.product_id
+      LEFT JOIN (
+          SELECT DISTINCT
+              product_id,
+              FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_id,
+              FIRST_VALUE(episode_no) OVER (PARTITION BY product_id ORDER BY created_date DESC, episode_id DESC) as episode_no
+            FROM tb_product_episode
+           WHERE open_yn = 'Y' AND use_yn = 'Y'
+      ) latest_episode ON latest_episode.product_id = p.product_id
+      LEFT JOIN (
+          SELECT DISTINCT
+              product_id,
+              FIRST_VALUE(episode_id) OVER (PARTITION BY product_id ORDER BY created_date ASC, episode_id ASC) as episode_id
+            FROM tb_product_episode
+           WHERE open_yn = 'Y' AND use_yn = 'Y'
+      ) first_episode ON first_episode.product_id = p.product_id
+      LEFT JOIN (
+          SELECT product_id, COUNT(DISTINCT user_id) as total_interest
+            FROM tb_user_product_usage
+           WHERE use_yn = 'Y'
+           GROUP BY product_id
+      ) interest_count ON interest_count.product_id = p.product_id
+      LEFT JOIN (
+          SELECT poii.product_id, SUM(po.total_price) as total
+            FROM tb_product_order po
+            JOIN tb_product_order_item poi ON po.order_id = poi.order_id
+            JOIN tb_product_order_item_info poii ON poi.item_id = poii.item_info_id
+           WHERE po.cancel_yn = 'N'
+           GROUP BY poii.product_id
+      ) total_sales ON total_sales.product_id = p.product_id
+      LEFT JOIN (
+          SELECT product_id, COUNT(*) as offer_count
+            FROM tb_product_contract_offer
+           WHERE use_yn = 'Y'
+           GROUP BY product_id
+      ) offer_stats ON offer_stats.product_id = p.product_id
+      LEFT JOIN (
+          SELECT DISTINCT
+              product_id,
+              FIRST_VALUE(offer_id) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_id,
+              FIRST_VALUE(offer_date) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_date,
+              FIRST_VALUE(offer_price) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_price,
+              FIRST_VALUE(offer_profit) OVER (PARTITION BY product_id ORDER BY created_date DESC) as offer_profit,
+              FIRST_VALUE(author_profit) OVER (PARTITION BY product_id ORDER BY created_date DESC) as author_profit,
+              FIRST_VALUE(CASE WHEN author_accept_yn = 'Y' THEN 'accepted' WHEN author_accept_yn = 'N' THEN 'review' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC) as decision_state
+            FROM tb_product_contract_offer
+           WHERE use_yn = 'Y'
+      ) pco_latest ON pco_latest.product_id = p.product_id
+      LEFT JOIN (
+          SELECT DISTINCT
+              product_id,
+              CASE
+                  WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                      FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                  WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                      FIRST_VALUE(CASE WHEN status_code = 'review' THEN 'review' WHEN status_code = 'denied' THEN 'rejected' WHEN status_code = 'accepted' THEN 'approval' ELSE 'review' END) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                  ELSE 'review'
+              END as paid_state,
+              COUNT(*) OVER (PARTITION BY product_id) as apply_count,
+              CASE
+                  WHEN COUNT(*) OVER (PARTITION BY product_id) = 1 THEN
+                      FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date ASC)
+                  WHEN COUNT(*) OVER (PARTITION BY product_id) = 2 THEN
+                      FIRST_VALUE(status_code) OVER (PARTITION BY product_id ORDER BY created_date DESC)
+                  ELSE NULL
+              END as status_code_raw
+            FROM tb_product_paid_apply
+           WHERE use_yn = 'Y'
+      ) ppa_latest ON ppa_latest.product_id = p.product_id
+      LEFT JOIN (
+          SELECT product_id, current_count_interest_sustain, current_count_interest_loss
+            FROM (
+                SELECT product_id
+                     , current_count_interest_sustain
+                     , current_count_interest_loss
+                     , ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY created_date DESC, id DESC) AS rn
+                  FROM tb_batch_daily_product_count_summary
+            ) latest_pdcs
+           WHERE rn = 1
+      ) pdcs ON pdcs.product_id = p.product_id
+  ) src
+ON DUPLICATE KEY UPDATE refreshed_date = NOW();
@@ -0,0 +1,16 @@
+-- 배치 산출물 세대 번호 (app/services/product/rank_generation.py)
+-- service_reset_hourly_batch.sql 이 랭킹 테이블을 RENAME TABLE 로 교체한 직후 product_rank 세대를 1 증가시킨다.
+-- 앱은 세대 변화를 감지했을 때 랭킹을 포함한 목록 캐시를 한 번만 무효화한다.
+
+CREATE TABLE IF NOT EXISTS tb_batch_generation (
+    generation_key VARCHAR(50) NOT NULL COMMENT '세대 구분 키',
+    generation BIGINT NOT NULL DEFAULT 0 COMMENT '세대 번호',
+    created_id INT COMMENT 'row를 생성한 id',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_id INT COMMENT 'row를 갱신한 id',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (generation_key)
+);
+
+INSERT IGNORE INTO tb_batch_generation (generation_key, generation, created_id, updated_id)
+VALUES ('product_rank', 0, 0, 0);
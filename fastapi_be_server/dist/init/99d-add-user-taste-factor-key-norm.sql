@@ -0,0 +1,51 @@
+-- 유저 취향 축 점수 정규화 키 + 축 키 역색인 (app/services/ai/recommendation_service.py _get_cohort_similar_user_weights)
+-- 코호트 유사 유저 조회가 LOWER(TRIM(factor_key)) IN (...) 로 테이블 전체를 훑던 것을
+-- 쓰기 시점에 계산되는 factor_key_norm 과 (factor_key_norm, score, user_id) 커버링 인덱스 range scan 으로 바꾼다.
+-- STORED 생성 컬럼이라 배치 INSERT/UPSERT(ai_taste_*_batch.sql)는 그대로 두어도 값이 채워진다.
+
+SET @user_taste_factor_table_exists := (
+    SELECT COUNT(*)
+      FROM information_schema.tables
+     WHERE table_schema = DATABASE()
+       AND table_name = 'tb_user_taste_factor_score'
+);
+
+SET @has_factor_key_norm_col := (
+    SELECT COUNT(*)
+      FROM information_schema.columns
+     WHERE table_schema = DATABASE()
+       AND table_name = 'tb_user_taste_factor_score'
+       AND column_name = 'factor_key_norm'
+);
+
+SET @sql := IF(
+    @user_taste_factor_table_exists = 1
+    AND @has_factor_key_norm_col = 0,
+    'ALTER TABLE tb_user_taste_factor_score
+       ADD COLUMN factor_key_norm VARCHAR(120)
+       GENERATED ALWAYS AS (LOWER(TRIM(factor_key))) STORED
+       COMMENT ''정규화 축 키(LOWER(TRIM(factor_key)))''
+       AFTER factor_key',
+    'SELECT ''factor_key_norm already exists'''
+);
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @has_factor_key_norm_index := (
+    SELECT COUNT(*)
+      FROM information_schema.statistics
+     WHERE table_schema = DATABASE()
+       AND table_name = 'tb_user_taste_factor_score'
+       AND index_name = 'idx_user_taste_factor_key_norm'
+);
+
+SET @sql := IF(
+    @user_taste_factor_table_exists = 1
+    AND @has_factor_key_norm_index = 0,
+    'ALTER TABLE tb_user_taste_factor_score ADD KEY idx_user_taste_factor_key_norm (factor_key_norm, score, user_id)',
+    'SELECT ''idx_user_taste_factor_key_norm already exists'''
+);
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
@@ -0,0 +1,12 @@
+-- 유저 취향 추천 입력 버전 (app/services/ai/taste_recommendation_cache.py)
+-- AI 신호 이벤트/온보딩/구매 시점과 시간 배치(축 점수 반영)에서 profile_version 을 1 증가시킨다.
+-- 취향 추천 결과 캐시는 (user_id, adult_yn, profile_version) 이 같을 때만 재사용하므로, 워커가 여러 개여도 변경 즉시 다시 계산된다.
+-- 행이 없으면 버전 0 으로 본다.
+
+CREATE TABLE IF NOT EXISTS tb_user_taste_profile_version (
+    user_id INT NOT NULL COMMENT '유저 아이디',
+    profile_version BIGINT NOT NULL DEFAULT 0 COMMENT '취향 추천 입력 버전',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (user_id)
+);
@@ -0,0 +1,18 @@
+-- 유사 작품 이웃 테이블 (app/services/ai/product_similar_neighbor.py)
+-- 작품마다 DNA 내용 유사도(축 태그/목표/분위기/전개속도/설정·훅 토큰) 상위 N개를 저장한다.
+-- extract_product_dna 가 DNA 를 저장한 작품 기준으로 증분 갱신하고(dist/batch/build_product_similar_neighbors.py),
+-- get_similar_products 는 이 이웃만 인기/독자반응/취향을 더해 다시 채점한다. 이웃이 부족하면 기존 후보 채점으로 대체한다.
+
+CREATE TABLE IF NOT EXISTS tb_product_similar_neighbor (
+    product_id INT NOT NULL COMMENT '기준 작품 아이디',
+    neighbor_product_id INT NOT NULL COMMENT '유사 작품 아이디',
+    rank_no INT NOT NULL COMMENT '내용 유사도 순위(1부터)',
+    content_score DOUBLE NOT NULL COMMENT '내용 유사도 점수',
+    matched_signals JSON NULL COMMENT '일치한 신호 라벨 배열',
+    computed_date DATETIME NOT NULL COMMENT '계산 일시',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (product_id, neighbor_product_id),
+    KEY idx_product_similar_neighbor_rank (product_id, rank_no),
+    KEY idx_product_similar_neighbor_neighbor (neighbor_product_id)
+);
@@ -0,0 +1,23 @@
+-- 웹소챗 회차 본문 청크 n-gram 색인 (app/services/websochat/websochat_chunk_index.py)
+-- 스토리 컨텍스트 적재 배치(scripts/build_story_agent_context.py)가 작품 잠금 안에서 청크 본문의 글자 2-gram posting 을 갱신한다.
+-- 새 청크만 세그먼트로 덧붙이고, 비활성 청크는 chunk_meta(live 청크 목록)에서 빠지는 것으로 조회 때 걸러진다.
+-- _search_websochat_episode_contents 는 이 색인으로 BM25 순위를 매기고, 색인이 없는 작품은 기존 LIKE 조회로 대체한다.
+
+CREATE TABLE IF NOT EXISTS tb_story_agent_chunk_index (
+    product_id BIGINT PRIMARY KEY COMMENT '작품 ID',
+    index_version INT NOT NULL DEFAULT 1 COMMENT '색인 버전(갱신마다 증가, 조회 캐시 키)',
+    segment_count INT NOT NULL DEFAULT 0 COMMENT 'posting 세그먼트 수',
+    chunk_count INT NOT NULL DEFAULT 0 COMMENT 'live 청크 수',
+    indexed_chunk_count INT NOT NULL DEFAULT 0 COMMENT '세그먼트에 색인된 청크 수(비활성 포함)',
+    chunk_meta LONGBLOB NOT NULL COMMENT 'live 청크 chunk_id/episode_id/episode_no/chunk_no/n-gram 수 배열',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일'
+);
+
+CREATE TABLE IF NOT EXISTS tb_story_agent_chunk_ngram (
+    product_id BIGINT NOT NULL COMMENT '작품 ID',
+    ngram VARCHAR(8) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL COMMENT '소문자 글자 2-gram',
+    segment_no INT NOT NULL COMMENT '세그먼트 번호',
+    postings MEDIUMBLOB NOT NULL COMMENT 'chunk_id(int64) 배열 + tf(uint16) 배열',
+    PRIMARY KEY (product_id, ngram, segment_no)
+);
@@ -0,0 +1,13 @@
+-- 웹소챗 턴 잠금 lease (app/services/websochat/websochat_turn_lock.py)
+-- post_message 가 세션/사용자(게스트) 단위 잠금을 짧은 트랜잭션으로 잡고, 커넥션은 바로 풀에 돌려준다.
+-- 답변 생성 중에는 주기적으로 expires_at 을 연장하고, 워커가 죽으면 만료된 행을 다음 턴이 지우고 가져간다.
+
+CREATE TABLE IF NOT EXISTS tb_story_agent_turn_lease (
+    lock_name VARCHAR(191) NOT NULL COMMENT '잠금 이름 (websochat-session:{id}, websochat-actor:...)',
+    holder_token CHAR(32) NOT NULL COMMENT '잠금을 가진 턴 토큰',
+    expires_at DATETIME(6) NOT NULL COMMENT 'lease 만료 시각(UTC)',
+    created_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    updated_date TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
+    PRIMARY KEY (lock_name),
+    KEY idx_story_agent_turn_lease_holder (holder_token)
+);
@@ -0,0 +1,6 @@
+-- 웹소챗 세션 대화 문맥 버전 (app/services/websochat/websochat_session_context.py)
+-- 세션 메모리나 메시지를 쓰는 턴마다 1 씩 올린다. 워커의 세션 문맥 캐시는 이 값이 같을 때만 쓰고,
+-- 세션 메모리 delta 저장(JSON_SET)은 읽은 버전이 그대로일 때만 반영한다.
+
+ALTER TABLE tb_story_agent_session
+  ADD COLUMN context_version BIGINT NOT NULL DEFAULT 0 COMMENT '세션 대화 문맥 버전' AFTER session_memory_json;
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""코호트 유사 유저 조회(축 키 역색인) 벤치마크.
+
+목적
+- _get_condition_first_cohort_scores 의 유사 유저 조회가 LOWER(TRIM(factor_key)) IN (...) 로
+  tb_user_taste_factor_score 전체를 훑던 방식(legacy)과
+  factor_key_norm 생성 컬럼 + idx_user_taste_factor_key_norm (factor_key_norm, score, user_id) 로
+  축 키 posting 만 읽는 방식(index, _get_cohort_similar_user_weights)의 요청당 지연을 비교한다.
+- 합성 데이터는 --rows 개(기본 200만) 취향 축 점수 행이며 축 키는 --keys 개 중 Zipf 형태로 치우쳐 있다.
+- DB 는 임시 SQLite 파일(aiosqlite)이다. 운영(MySQL)과 절대 시간은 다르지만 전체 스캔 대 range scan 차이를 본다.
+
+출력
+- 방식별 요청당 평균/p95 시간(ms), 반환 행 수(legacy 는 매번 전체 행을 훑음), 결과 일치 여부, 각 조회의 EXPLAIN QUERY PLAN
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import math
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.ai import recommendation_service  # noqa: E402
+
+_FACTOR_TYPES = ["protagonist", "material", "worldview", "romance", "style", "job"]
+
+_LEGACY_QUERY = text(
+    """
+    SELECT user_id, LOWER(TRIM(factor_key)) AS factor_key, score
+    FROM tb_user_taste_factor_score
+    WHERE user_id <> :user_id
+      AND score > 0
+      AND LOWER(TRIM(factor_key)) IN :factor_keys
+    """
+).bindparams(bindparam("factor_keys", expanding=True))
+
+
+def _build_db(path: str, rows: int, keys: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    key_names = [f"Key{idx:05d}" for idx in range(keys)]
+    # 인기 축 키에 행이 몰리도록 1/rank 가중치
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(keys)))
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        create table tb_user_taste_factor_score (
+            id integer primary key,
+            user_id integer not null,
+            factor_type varchar(50) not null,
+            factor_key varchar(120) not null,
+            factor_key_norm varchar(120) generated always as (lower(trim(factor_key))) stored,
+            score double not null default 0
+        )
+        """
+    )
+
+    def generate():
+        per_user = 12
+        for row_no in range(rows):
+            key = rnd.choices(key_names, cum_weights=cum_weights)[0]
+            if rnd.random() < 0.2:
+                key = f" {key.upper()} "
+            yield (
+                row_no // per_user + 1,
+                rnd.choice(_FACTOR_TYPES),
+                key,
+                rnd.choice([-1.0, 0.0, 0.5, 1.5, 3.0, 8.0]),
+            )
+
+    conn.executemany(
+        "insert into tb_user_taste_factor_score (user_id, factor_type, factor_key, score) values (?, ?, ?, ?)",
+        generate(),
+    )
+    conn.execute(
+        "create index idx_user_taste_factor_key_norm on tb_user_taste_factor_score (factor_key_norm, score, user_id)"
+    )
+    conn.commit()
+    conn.close()
+    return [name.lower() for name in key_names]
+
+
+def _aggregate(rows, seed_labels: dict[str, float]) -> dict[int, float]:
+    # legacy 경로의 Python 합산(_get_cohort_similar_user_weights 와 같은 식)
+    weights: dict[int, float] = {}
+    for row in rows:
+        factor_key = recommendation_service._normalize_factor_key(row.get("factor_key"))
+        base_weight = seed_labels.get(factor_key, 0.0)
+        if base_weight <= 0:
+            continue
+        signal_weight = recommendation_service._clamp(
+            recommendation_service._normalize_factor_score(float(row.get("score") or 0.0)) / 6.0, 0.0, 1.0
+        )
+        if signal_weight <= 0:
+            continue
+        user_id = int(row.get("user_id") or 0)
+        weights[user_id] = weights.get(user_id, 0.0) + base_weight * signal_weight
+    return weights
+
+
+def _fmt(name: str, latencies: list[float], rows_read: int) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+    return f"{name:>6}: avg {statistics.fmean(ordered):.2f} ms  p95 {p95:.2f} ms  rows returned {rows_read}"
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        started = time.perf_counter()
+        key_names = _build_db(path, args.rows, args.keys, args.seed)
+        print(f"rows {args.rows}  keys {args.keys}  build {time.perf_counter() - started:.1f} s")
+
+        rnd = random.Random(args.seed + 1)
+        requests = [
+            (
+                rnd.randint(1, args.rows // 12),
+                {key: rnd.choice([0.5, 1.0, 2.0, 4.0]) for key in rnd.sample(key_names[: args.keys // 4], 8)},
+            )
+            for _ in range(args.requests)
+        ]
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.connect() as conn:
+            for label, sql in [
+                ("legacy", "select user_id from tb_user_taste_factor_score where score > 0 and lower(trim(factor_key)) in ('key00001')"),
+                ("index", "select user_id from tb_user_taste_factor_score where factor_key_norm in ('key00001') and score > 0"),
+            ]:
+                plan = (await conn.execute(text(f"explain query plan {sql}"))).all()
+                print(f"  plan {label}: {' / '.join(str(row[-1]) for row in plan)}")
+
+            legacy_latencies, index_latencies = [], []
+            legacy_rows = index_rows = 0
+            identical = True
+            for user_id, seed_labels in requests:
+                started = time.perf_counter()
+                result = await conn.execute(
+                    _LEGACY_QUERY, {"user_id": user_id, "factor_keys": list(seed_labels.keys())}
+                )
+                rows = result.mappings().all()
+                legacy = _aggregate(rows, seed_labels)
+                legacy_latencies.append((time.perf_counter() - started) * 1000)
+                legacy_rows += len(rows)
+
+                started = time.perf_counter()
+                indexed = await recommendation_service._get_cohort_similar_user_weights(
+                    user_id=user_id, seed_labels=seed_labels, db=conn
+                )
+                index_latencies.append((time.perf_counter() - started) * 1000)
+                index_rows += len(rows)
+
+                identical = identical and legacy.keys() == indexed.keys() and all(
+                    math.isclose(legacy[key], indexed[key], rel_tol=1e-9) for key in legacy
+                )
+        await engine.dispose()
+
+        print(_fmt("legacy", legacy_latencies, legacy_rows))
+        print(_fmt("index", index_latencies, index_rows))
+        print(f"  identical results: {identical}")
+    finally:
+        os.remove(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--keys", type=int, default=400)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
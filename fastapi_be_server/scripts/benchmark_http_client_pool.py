@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""외부 HTTP 호출 커넥션 풀 재사용 벤치마크.
+
+목적
+- 호출마다 `async with AsyncClient()` 를 만드는 기존 방식과
+  app.utils.http_client 의 provider 공유 클라이언트(keep-alive 풀) 방식을 비교한다.
+- 로컬 asyncio HTTP 서버에 인위적인 연결 지연(--connect-delay, TLS handshake 대용)을 주고 측정한다.
+
+출력
+- 방식별 평균/p95 요청 시간(ms), 서버가 수락한 TCP 연결 수
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import httpx  # noqa: E402
+
+from app.utils.http_client import HttpClientRegistry, HttpPoolConfig  # noqa: E402
+
+
+class StubServer:
+    """keep-alive 를 지원하는 최소 HTTP/1.1 서버"""
+
+    def __init__(self, connect_delay: float):
+        self.connect_delay = connect_delay
+        self.connections = 0
+        self.server = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        await asyncio.sleep(self.connect_delay)
+        body = b'{"active":true}'
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    + f"content-length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/token/introspect"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def call_per_request_client(url: str) -> None:
+    async with httpx.AsyncClient(timeout=5.0) as ac:
+        res = await ac.post(url, data={"token": "x"})
+        res.raise_for_status()
+
+
+async def run_case(name, call, server, url, requests, concurrency) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    durations = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call(url)
+            durations.append((time.perf_counter() - started) * 1000)
+
+    server.connections = 0
+    started = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(requests)])
+    elapsed = time.perf_counter() - started
+    durations.sort()
+    return {
+        "name": name,
+        "avg_ms": statistics.mean(durations),
+        "p95_ms": durations[int(len(durations) * 0.95) - 1],
+        "rps": requests / elapsed,
+        "connections": server.connections,
+    }
+
+
+async def main_async(args) -> None:
+    server = StubServer(args.connect_delay)
+    url = await server.start()
+    registry = HttpClientRegistry(
+        {"keycloak": HttpPoolConfig(timeout=5.0, max_keepalive_connections=args.concurrency)}
+    )
+
+    async def call_pooled(target: str) -> None:
+        res = await registry.get("keycloak").post(target, data={"token": "x"})
+        res.raise_for_status()
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"connect_delay={args.connect_delay * 1000:.1f}ms"
+    )
+    print(f"{'client':<26}{'avg_ms':>10}{'p95_ms':>10}{'rps':>10}{'tcp_conns':>11}")
+    try:
+        for name, call in [
+            ("per-call AsyncClient", call_per_request_client),
+            ("shared pool(registry)", call_pooled),
+        ]:
+            result = await run_case(
+                name, call, server, url, args.requests, args.concurrency
+            )
+            print(
+                f"{result['name']:<26}{result['avg_ms']:>10.3f}{result['p95_ms']:>10.3f}"
+                f"{result['rps']:>10.1f}{result['connections']:>11}"
+            )
+        print(f"pool metrics: {registry.metrics()['keycloak']}")
+    finally:
+        await registry.aclose()
+        await server.stop()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--connect-delay", type=float, default=0.01)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async(parse_args()))
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""추천용 작품 AI 메타데이터 색인 벤치마크.
+
+목적
+- get_all_product_ai_metadata 가 매 요청 전체 작품의 AI 메타데이터를 조회하고 JSON 컬럼을 파싱하던 방식(query)과
+  프로세스 색인(product_ai_metadata_index)을 공유하고 주기적으로 증분 반영하는 방식(index)의 요청당 비용을 비교한다.
+- 카탈로그는 --products 개(기본 5만)의 합성 행이며 JSON 컬럼은 실제 DNA 와 비슷한 크기의 문자열이다.
+- DB 는 조회 행 수에 비례한 지연(--row-us, 행당 마이크로초)을 갖는 가짜 세션이다(네트워크/전송 비용 근사).
+  파싱(_metadata_row_to_dict)과 목록 생성은 실제 코드를 그대로 실행한다.
+- index 는 매 요청 증분 조회를 거치며(실제는 refresh 주기마다), --refresh-every 요청마다 --changed 개 작품이 바뀐다.
+
+출력
+- 방식별 요청당 평균/p95 시간(ms), DB 조회 행 수, 색인 version
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.ai import recommendation_service  # noqa: E402
+from app.services.ai.product_ai_metadata_index import ProductAiMetadataIndex  # noqa: E402
+
+_TAGS = ["회귀", "복수", "성장", "먼치킨", "두뇌전", "암울", "힐링", "로맨스", "헌터", "아카데미"]
+
+
+def _catalog(count: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+
+    def tags(size: int) -> str:
+        return json.dumps(rnd.sample(_TAGS, size), ensure_ascii=False)
+
+    rows = []
+    for product_id in range(1, count + 1):
+        rows.append({
+            "product_id": product_id,
+            "title": f"작품{product_id}",
+            "status_code": "ongoing",
+            "count_hit": rnd.randint(0, 100000),
+            "ratings_code": "adult" if rnd.random() < 0.1 else "all",
+            "protagonist_type": rnd.choice(["전략가", "먼치킨", "노력형"]),
+            "mood": rnd.choice(["어두운", "밝은", "긴장감"]),
+            "premise": "회귀한 주인공이 " * 4,
+            "themes": tags(3),
+            "similar_famous": tags(2),
+            "taste_tags": tags(4),
+            "raw_analysis": json.dumps({"analysis": "x" * 800}),
+            "protagonist_material_tags": tags(2),
+            "worldview_tags": tags(2),
+            "protagonist_type_tags": tags(2),
+            "protagonist_job_tags": tags(1),
+            "axis_style_tags": tags(2),
+            "axis_romance_tags": tags(1),
+            "binge_rate": 0.3,
+            "total_readers": rnd.randint(0, 5000),
+            "index_eligible_yn": "Y",
+        })
+    return rows
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class LatencyDb:
+    """조회 행 수에 비례한 지연을 주는 가짜 세션(기존 전체 조회 경로용)"""
+
+    def __init__(self, rows: list[dict], row_us: float):
+        self.rows = rows
+        self.row_us = row_us
+        self.rows_read = 0
+
+    async def execute(self, query, params=None):
+        self.rows_read += len(self.rows)
+        await asyncio.sleep(len(self.rows) * self.row_us / 1_000_000)
+        return _Result(self.rows)
+
+
+class LatencyLoader:
+    """색인 loader 대역: 전체 조회는 카탈로그 전체, 증분 조회는 바뀐 행만"""
+
+    def __init__(self, rows: list[dict], row_us: float):
+        self.rows = rows
+        self.row_us = row_us
+        self.rows_read = 0
+        self.changed: list[dict] = []
+        self.now = datetime(2026, 1, 1)
+
+    async def load(self, db, since):
+        rows = self.rows if since is None else self.changed
+        self.changed = []
+        self.now += timedelta(seconds=30)
+        self.rows_read += len(rows)
+        await asyncio.sleep(len(rows) * self.row_us / 1_000_000)
+        return rows, self.now
+
+
+def _summary(name: str, latencies: list[float], rows_read: int, extra: str = "") -> str:
+    ordered = sorted(latencies)
+    return (
+        f"{name:>6}: avg {statistics.fmean(ordered):.2f} ms"
+        f"  p95 {ordered[int(len(ordered) * 0.95) - 1]:.2f} ms"
+        f"  max {ordered[-1]:.2f} ms"
+        f"  rows read {rows_read}{extra}"
+    )
+
+
+async def run_query_mode(rows: list[dict], args: argparse.Namespace) -> str:
+    # 기존 방식 재현: 매 요청 전체 조회 + 행마다 JSON 파싱
+    db = LatencyDb([row for row in rows if row["ratings_code"] == "all"], args.row_us)
+    latencies = []
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        result = await db.execute(None)
+        [recommendation_service._metadata_row_to_dict(r) for r in result.mappings().all()]
+        latencies.append((time.perf_counter() - started) * 1000)
+    return _summary("query", latencies, db.rows_read)
+
+
+async def run_index_mode(rows: list[dict], args: argparse.Namespace) -> str:
+    rnd = random.Random(args.seed)
+    loader = LatencyLoader(rows, args.row_us)
+    index = ProductAiMetadataIndex(
+        loader=loader.load,
+        parse_row=recommendation_service._metadata_row_to_dict,
+        # 매 요청 증분 조회(변경 없으면 빈 결과)까지 포함해 보수적으로 측정
+        refresh_interval=0,
+        full_reload_interval=86400,
+    )
+    latencies = []
+    first_load_ms = None
+    with patch.object(recommendation_service, "product_ai_metadata_index", index):
+        for request_no in range(args.requests):
+            if request_no and request_no % args.refresh_every == 0:
+                # 다음 요청에서 증분 반영되도록 변경 행 준비
+                loader.changed = [
+                    {**rows[rnd.randrange(len(rows))], "count_hit": rnd.randint(0, 100000)}
+                    for _ in range(args.changed)
+                ]
+            started = time.perf_counter()
+            await recommendation_service.get_all_product_ai_metadata(None, adult_yn="N")
+            elapsed = (time.perf_counter() - started) * 1000
+            if first_load_ms is None:
+                first_load_ms = elapsed
+            else:
+                latencies.append(elapsed)
+    return _summary(
+        "index",
+        latencies,
+        loader.rows_read,
+        f"  first load {first_load_ms:.2f} ms  version {index.version}",
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    rows = _catalog(args.products, args.seed)
+    print(f"products {args.products}  requests {args.requests}")
+    print(await run_query_mode(rows, args))
+    print(await run_index_mode(rows, args))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--row-us", type=float, default=2.0)
+    parser.add_argument("--refresh-every", type=int, default=10)
+    parser.add_argument("--changed", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
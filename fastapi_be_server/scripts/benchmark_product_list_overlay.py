@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""작품 목록 전역 캐시 + 사용자 overlay 벤치마크.
+
+목적
+- products_all / products_of_managed 에서 사용자별 값을 목록 쿼리에 섞어 매 요청 조회하던 방식(mixed)과
+  전역 목록은 product_list_cache 로 사용자 간 공유하고 사용자별 값만 keyed 쿼리로 조회하는 방식(split)을 비교한다.
+- DB 는 쿼리 종류별 고정 지연(--list-ms: 목록 집계 쿼리, --overlay-ms: 사용자별 join/keyed 쿼리)을 갖는 가짜 세션이다.
+  mixed 는 로그인 사용자 요청의 목록 쿼리에 사용자별 join 비용이 더해진 것으로 본다(별도 쿼리 없음).
+- 요청은 --users 명의 사용자(일부 비로그인)가 두 경로의 필터/페이지를 치우친 분포로 호출한다.
+
+출력
+- 방식별 초당 처리 요청 수, 평균/p95 응답 시간(ms), 목록 쿼리 수, overlay 쿼리 수, 캐시 적중률
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.product import product_service  # noqa: E402
+from app.services.product.product_list_cache import ProductListCache  # noqa: E402
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+
+class LatencyDb:
+    """쿼리 종류별 고정 지연을 주는 가짜 세션"""
+
+    def __init__(self, list_ms: float, overlay_ms: float):
+        self.list_ms = list_ms
+        self.overlay_ms = overlay_ms
+        self.list_queries = 0
+        self.overlay_queries = 0
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        if "tb_batch_generation" in sql:
+            return _Result([1])
+        if "tb_user_ticketbook" in sql and "p.product_id IN" in sql:
+            self.overlay_queries += 1
+            await asyncio.sleep(self.overlay_ms / 1000)
+            return _Result([])
+        self.list_queries += 1
+        await asyncio.sleep(self.list_ms / 1000)
+        seed = hash(sql) % 10000
+        return _Result([{"productId": seed * 100 + idx} for idx in range(25)])
+
+
+def _requests(count: int, users: int, seed: int) -> list[tuple]:
+    rnd = random.Random(seed)
+    price_types = ["free", "paid", None]
+    areas = ["main", "freeTop", "paidTop"]
+    plan = []
+    for _ in range(count):
+        # 약 30% 비로그인
+        user_id = -1 if rnd.random() < 0.3 else rnd.randint(1, users)
+        # 앞쪽 페이지에 치우친 분포
+        page = min(int(rnd.paretovariate(1.5)), 10)
+        if rnd.random() < 0.6:
+            plan.append(("products_all", user_id, rnd.choice(price_types), page))
+        else:
+            plan.append(("products_of_managed", user_id, rnd.choice(areas), None))
+    return plan
+
+
+async def _get_user_id(kc_user_id: str, db) -> int:
+    # 벤치마크에서는 kc_user_id 에 user_id 를 그대로 담아 호출
+    return int(kc_user_id)
+
+
+async def _call(kind: str, user_id: int, option, page, db) -> None:
+    if kind == "products_all":
+        await product_service.products_all(
+            price_type=option,
+            product_type=None,
+            product_state=None,
+            page=page,
+            limit=25,
+            kc_user_id=str(user_id),
+            db=db,
+        )
+    else:
+        await product_service.products_of_managed(
+            division=None,
+            area=option,
+            limit=50,
+            adult_yn="N",
+            kc_user_id=str(user_id),
+            db=db,
+        )
+
+
+def _mixed_overlay(overlay_ms: float):
+    # 기존 방식: 사용자별 join 이 목록 쿼리 안에서 함께 실행됨
+    async def _overlay(user_id, product_ids, db):
+        if user_id and user_id > 0:
+            await asyncio.sleep(overlay_ms / 1000)
+        return dict()
+
+    return _overlay
+
+
+async def run_mode(name: str, plan: list[tuple], args: argparse.Namespace) -> dict:
+    mixed = name == "mixed"
+    db = LatencyDb(args.list_ms, args.overlay_ms)
+    cache = ProductListCache(ttl=args.ttl, max_entries=1000, enabled=not mixed)
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def _one(item):
+        async with semaphore:
+            started = time.perf_counter()
+            await _call(*item, db)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    with (
+        patch.object(product_service, "product_list_cache", cache),
+        patch.object(product_service, "get_user_id", _get_user_id),
+        patch.object(
+            product_service.statistics_service, "insert_site_statistics_logs", AsyncMock()
+        ),
+        patch.object(product_service, "convert_product_data", lambda row: row),
+        patch.object(product_service, "convert_home_card_product_data", lambda row: row),
+        patch.object(
+            product_service,
+            "fetch_user_product_overlay",
+            _mixed_overlay(args.overlay_ms) if mixed else product_service.fetch_user_product_overlay,
+        ),
+    ):
+        started = time.perf_counter()
+        await asyncio.gather(*(_one(item) for item in plan))
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "mode": name,
+        "req_per_sec": round(len(plan) / elapsed, 1),
+        "avg_ms": round(statistics.fmean(ordered), 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+        "list_queries": db.list_queries,
+        "overlay_queries": db.overlay_queries,
+        "hit_rate": cache.metrics()["hit_rate"],
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    plan = _requests(args.requests, args.users, args.seed)
+    for name in ("mixed", "split"):
+        result = await run_mode(name, plan, args)
+        print(
+            f"{result['mode']:>6}: {result['req_per_sec']:>8} req/s"
+            f"  avg {result['avg_ms']} ms  p95 {result['p95_ms']} ms"
+            f"  list queries {result['list_queries']}"
+            f"  overlay queries {result['overlay_queries']}"
+            f"  hit rate {result['hit_rate']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--list-ms", type=float, default=40.0)
+    parser.add_argument("--overlay-ms", type=float, default=3.0)
+    parser.add_argument("--ttl", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""유사 작품 이웃 테이블 벤치마크.
+
+목적
+- product_similar_neighbor 의 전체 계산(역색인)과 DNA 변경 작품 기준 증분 갱신 시간을 잰다.
+- get_similar_products 채점 단계를 비교한다.
+  · legacy: 요청마다 인기 상위 120개 후보를 채점(_rank_similar_candidates)
+  · neighbor: 미리 계산한 내용 유사도 상위 --top-n 개 이웃만 채점
+- 카탈로그는 --products 개(기본 1만) 합성 작품 DNA 이며, 인기(reading_rate/count_hit)는 DNA 와 무관하게 준다.
+  DB 조회는 포함하지 않는다(후보 행을 메모리에서 바로 넘김).
+
+출력
+- 전체 계산/증분 갱신 시간, 저장 행 수
+- 방식별 요청당 평균/p95 채점 시간(ms), 카탈로그 전체 기준 내용 유사도 상위 --limit 개를 결과에 담은 비율(recall)
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.ai import ai_chat_service, product_similar_neighbor  # noqa: E402
+
+_AXIS_LABELS = {
+    "worldview_tags": [f"세계관{idx}" for idx in range(20)],
+    "protagonist_type_tags": [f"타입{idx}" for idx in range(15)],
+    "protagonist_job_tags": [f"직업{idx}" for idx in range(25)],
+    "protagonist_material_tags": [f"소재{idx}" for idx in range(40)],
+    "axis_romance_tags": [f"관계{idx}" for idx in range(10)],
+    "axis_style_tags": [f"작풍{idx}" for idx in range(12)],
+}
+_WORDS = [f"단어{idx}" for idx in range(3000)]
+
+
+def _product(rnd: random.Random, product_id: int) -> dict:
+    product = {
+        "product_id": product_id,
+        "protagonist_goal_primary": rnd.choice(["복수", "성장", "생존", "정복", "사랑"]),
+        "mood": rnd.choice(["어두운", "밝은", "긴장감", "잔잔한", "코믹"]),
+        "pacing": rnd.choice(["fast", "medium", "slow"]),
+        "premise": " ".join(rnd.choices(_WORDS, k=12)),
+        "hook": " ".join(rnd.choices(_WORDS, k=6)),
+        "reading_rate": rnd.random(),
+        "count_hit": rnd.randint(0, 200000),
+    }
+    for key, labels in _AXIS_LABELS.items():
+        product[key] = rnd.sample(labels, rnd.randint(1, 3))
+    return product
+
+
+def _fmt(name: str, latencies: list[float], recall: float) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+    return f"{name:>8}: avg {statistics.fmean(ordered):.2f} ms  p95 {p95:.2f} ms  content top-{{limit}} recall {recall:.3f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--top-n", type=int, default=50)
+    parser.add_argument("--changed", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    products = {product_id: _product(rnd, product_id) for product_id in range(1, args.products + 1)}
+
+    started = time.perf_counter()
+    neighbors = product_similar_neighbor.build_similar_neighbors(products, top_n=args.top_n)
+    build_seconds = time.perf_counter() - started
+    rows = sum(len(items) for items in neighbors.values())
+    print(f"products {args.products}  top-n {args.top_n}  full build {build_seconds:.1f} s  rows {rows}")
+
+    changed = rnd.sample(sorted(products), args.changed)
+    for product_id in changed:
+        products[product_id] = _product(rnd, product_id)
+    started = time.perf_counter()
+    updated = product_similar_neighbor.refresh_similar_neighbor_lists(products, neighbors, changed, top_n=args.top_n)
+    print(
+        f"incremental refresh ({args.changed} changed) {time.perf_counter() - started:.1f} s"
+        f"  rewritten products {len(updated)}"
+    )
+    neighbors.update(updated)
+
+    popular = sorted(products.values(), key=lambda p: (p["reading_rate"], p["count_hit"]), reverse=True)
+    index = product_similar_neighbor.SimilarNeighborIndex(products)
+    latencies = {"legacy": [], "neighbor": []}
+    found = {"legacy": 0, "neighbor": 0}
+    total = 0
+    for base_id in rnd.sample(sorted(products), args.requests):
+        base = products[base_id]
+        truth = {neighbor_id for neighbor_id, _, _ in index.top_neighbors(base_id, args.limit)}
+        total += len(truth)
+        pools = {
+            "legacy": [p for p in popular if p["product_id"] != base_id][:120],
+            "neighbor": [products[neighbor_id] for neighbor_id, _, _ in neighbors.get(base_id, [])],
+        }
+        for name, pool in pools.items():
+            started = time.perf_counter()
+            items = ai_chat_service._rank_similar_candidates(base, pool, None)[: args.limit]
+            latencies[name].append((time.perf_counter() - started) * 1000)
+            found[name] += len(truth & {item["product_id"] for item in items})
+
+    for name in ("legacy", "neighbor"):
+        print(_fmt(name, latencies[name], found[name] / total if total else 0.0).replace("{limit}", str(args.limit)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""추천 축/차원 매칭 점수 계산 벤치마크.
+
+목적
+- _match_products_by_axes / _match_products_by_dimension 의 기존 Python 루프(loop)와
+  NumPy 경로(numpy)의 추천 호출 1회당 지연을 합성 카탈로그(--sizes, 기본 1만/10만 작품)에서 비교한다.
+- 추천 호출 1회는 get_taste_recommendations 의 섹션 구성과 비슷하게
+  축 매칭 3회(구좌별 축) + 차원 매칭 2회(fallback)로 본다.
+- numpy 의 첫 호출은 카탈로그 인코딩 비용을 포함하므로 따로 출력한다(이후 색인 version 이 바뀌면 바뀐 작품만 재추출).
+
+출력
+- 카탈로그 크기별/방식별 호출당 평균/p95 시간(ms), numpy 첫 호출(인코딩 포함) 시간, 결과 일치 여부
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.ai import recommendation_service  # noqa: E402
+from app.services.ai.recommendation_scoring import ScoringEngine  # noqa: E402
+
+_LABELS = {
+    "type": ["계략", "고인물", "npc", "b급"],
+    "job": ["가수", "감독", "개발자", "검사"],
+    "material": ["각성자", "마나", "나노머신", "ai"],
+    "worldview": ["게이트", "게임", "가상현실", "sf"],
+    "romance": ["순애", "소꿉친구", "백합"],
+    "style": ["감성", "느와르", "공포", "느린전개"],
+}
+_GOALS = ["복수", "레이드", "농사", "생존"]
+_CALL_AXES = [["type", "job"], ["material", "worldview"], ["romance", "style", "goal"]]
+_CALL_DIMENSIONS = ["protagonist", "theme"]
+
+
+def _catalog(size: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+
+    def tags(axis: str, max_size: int) -> list[str]:
+        return rnd.sample(_LABELS[axis], rnd.randint(0, min(max_size, len(_LABELS[axis]))))
+
+    all_dna = []
+    for product_id in range(1, size + 1):
+        all_dna.append({
+            "product_id": product_id,
+            "protagonist_type": rnd.choice(_LABELS["type"]),
+            "premise": f"설정{product_id}",
+            "protagonist_goal_primary": rnd.choice(_GOALS),
+            "goal_confidence": rnd.choice([0.5, 0.7, 0.9]),
+            "overall_confidence": rnd.choice([0.6, 0.8, 1.0]),
+            "mood": rnd.choice(["어두운", "밝은", "긴장감"]),
+            "romance_chemistry_weight": rnd.choice(["high", "mid", "low"]),
+            "themes": tags("worldview", 2),
+            "taste_tags": tags("material", 3) + tags("style", 2),
+            "protagonist_type_tags": tags("type", 2),
+            "protagonist_job_tags": tags("job", 1),
+            "protagonist_material_tags": tags("material", 3),
+            "worldview_tags": tags("worldview", 2),
+            "axis_romance_tags": tags("romance", 1),
+            "axis_style_tags": tags("style", 2),
+            "count_hit": rnd.randint(0, 100000),
+            "binge_rate": rnd.random(),
+            "total_readers": rnd.randint(0, 50),
+            "dropoff_7d": rnd.randint(0, 5),
+            "reengage_rate": rnd.random() / 4,
+            "avg_speed_cpm": rnd.choice([None, 700, 900, 1200]),
+        })
+    return all_dna
+
+
+def _profile() -> tuple[dict, dict, set, set]:
+    factor_scores = {
+        "protagonist": {"계략": 4.0, "복수": 3.0},
+        "job": {"개발자": 2.0},
+        "material": {"각성자": 5.0, "마나": 1.5},
+        "worldview": {"게이트": 4.0},
+        "romance": {"순애": 2.0},
+        "style": {"느와르": 3.0},
+    }
+    profile = {
+        "preferred_protagonist": {"계략": 3},
+        "preferred_themes": {"게이트": 2, "sf": 1},
+        "taste_tags": ["각성자", "느와르"],
+    }
+    read_ids = set(range(1, 200))
+    return profile, factor_scores, read_ids, {"각성자", "느와르"}
+
+
+def _recommendation_call(all_dna, profile, factor_scores, read_ids, taste_tags, loop: bool) -> list:
+    match_axes = (
+        recommendation_service._match_products_by_axes_loop
+        if loop
+        else recommendation_service._match_products_by_axes
+    )
+    match_dimension = (
+        recommendation_service._match_products_by_dimension_loop
+        if loop
+        else recommendation_service._match_products_by_dimension
+    )
+    results = []
+    for axes in _CALL_AXES:
+        results.append(match_axes(all_dna, axes, profile, read_ids, factor_scores, limit=6))
+    for dimension in _CALL_DIMENSIONS:
+        results.append(
+            match_dimension(all_dna, dimension, profile, read_ids, taste_tags, factor_scores, limit=6)
+        )
+    return results
+
+
+def _measure(fn, repeat: int) -> list[float]:
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def _fmt(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+    return f"avg {statistics.fmean(ordered):.2f} ms  p95 {p95:.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    profile, factor_scores, read_ids, taste_tags = _profile()
+    for size in args.sizes:
+        all_dna = _catalog(size, args.seed)
+        engine = ScoringEngine(extract=recommendation_service._extract_scoring_features)
+        with patch.object(recommendation_service, "recommendation_scoring_engine", engine):
+            # 요청마다 색인에서 새 목록 객체를 받는 것과 같게 list 복사본으로 호출
+            started = time.perf_counter()
+            vectorized = _recommendation_call(
+                list(all_dna), profile, factor_scores, read_ids, taste_tags, loop=False
+            )
+            first_ms = (time.perf_counter() - started) * 1000
+            numpy_latencies = _measure(
+                lambda: _recommendation_call(
+                    list(all_dna), profile, factor_scores, read_ids, taste_tags, loop=False
+                ),
+                args.repeat,
+            )
+        looped = _recommendation_call(all_dna, profile, factor_scores, read_ids, taste_tags, loop=True)
+        loop_latencies = _measure(
+            lambda: _recommendation_call(all_dna, profile, factor_scores, read_ids, taste_tags, loop=True),
+            max(1, args.repeat // 2),
+        )
+        print(f"products {size}")
+        print(f"   loop: {_fmt(loop_latencies)}")
+        print(f"  numpy: {_fmt(numpy_latencies)}  first call (encoding) {first_ms:.2f} ms")
+        print(f"  identical results: {vectorized == looped}")
+
+
+if __name__ == "__main__":
+    main()
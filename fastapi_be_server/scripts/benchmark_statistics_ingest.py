@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""사이트 통계 로그 적재 방식 처리량 벤치마크.
+
+목적
+- 조회 API 마다 `insert_site_statistics_logs(["visit", "page_view"])` 를 직접 INSERT + commit 하는 기존 방식과
+  app.services.common.statistics_ingest 버퍼(multi-row INSERT 주기 flush) 방식을 비교한다.
+- 로컬 SQLite 파일 DB(synchronous=FULL, commit 마다 fsync)를 MySQL stand-in 으로 사용한다.
+
+출력
+- 방식별 초당 처리 요청 수, 요청당 평균/p95 통계 적재 시간(ms), 쓰기 트랜잭션 수, 적재 row 수
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import event, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.services.common import statistics_service  # noqa: E402
+from app.services.common.statistics_ingest import StatisticsIngestBuffer  # noqa: E402
+
+
+def _on_connect(dbapi_connection, connection_record):
+    # MySQL NOW() 대용
+    dbapi_connection.create_function(
+        "NOW", 0, lambda: datetime.now().isoformat(sep=" ")
+    )
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = DELETE")
+    cursor.execute("PRAGMA synchronous = FULL")
+    cursor.close()
+
+
+async def _prepare(db_path: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    event.listen(engine.sync_engine, "connect", _on_connect)
+    async with engine.begin() as conn:
+        await conn.execute(text("drop table if exists tb_site_statistics_log"))
+        await conn.execute(
+            text(
+                "create table tb_site_statistics_log ("
+                " id integer primary key autoincrement,"
+                " date text, type text, user_id integer, created_date text)"
+            )
+        )
+    commits = {"count": 0}
+
+    def _count_commit(conn):
+        commits["count"] += 1
+
+    event.listen(engine.sync_engine, "commit", _count_commit)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession)
+    return engine, session_factory, commits
+
+
+async def _row_count(engine) -> int:
+    async with engine.connect() as conn:
+        result = await conn.execute(text("select count(*) from tb_site_statistics_log"))
+        return result.scalar()
+
+
+async def _drive(requests: int, concurrency: int, handler) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(idx: int):
+        async with semaphore:
+            started = time.perf_counter()
+            await handler(idx)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(_one(idx) for idx in range(requests)))
+    return latencies
+
+
+async def run_direct(db_path: str, requests: int, concurrency: int) -> dict:
+    engine, session_factory, commits = await _prepare(db_path)
+
+    async def handler(idx: int):
+        async with session_factory() as db:
+            await statistics_service.insert_site_statistics_logs(
+                db=db, types=["visit", "page_view"], user_id=idx + 1
+            )
+
+    started = time.perf_counter()
+    latencies = await _drive(requests, concurrency, handler)
+    elapsed = time.perf_counter() - started
+    rows = await _row_count(engine)
+    await engine.dispose()
+    return _summary("direct", requests, elapsed, latencies, commits["count"], rows)
+
+
+async def run_buffered(
+    db_path: str, requests: int, concurrency: int, flush_size: int, flush_interval: float
+) -> dict:
+    engine, session_factory, commits = await _prepare(db_path)
+    buffer = StatisticsIngestBuffer(
+        session_factory=session_factory,
+        flush_size=flush_size,
+        flush_interval=flush_interval,
+        spill_path="",
+        enabled=True,
+    )
+
+    async def handler(idx: int):
+        async with session_factory() as db:
+            await statistics_service.insert_site_statistics_logs(
+                db=db, types=["visit", "page_view"], user_id=idx + 1
+            )
+
+    with patch.object(statistics_service, "statistics_ingest_buffer", buffer):
+        await buffer.start()
+        started = time.perf_counter()
+        latencies = await _drive(requests, concurrency, handler)
+        # drain 까지 포함해 처리량 계산
+        await buffer.stop()
+        elapsed = time.perf_counter() - started
+
+    rows = await _row_count(engine)
+    await engine.dispose()
+    return _summary("buffered", requests, elapsed, latencies, commits["count"], rows)
+
+
+def _summary(
+    name: str, requests: int, elapsed: float, latencies: list[float], commits: int, rows: int
+) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "mode": name,
+        "req_per_sec": round(requests / elapsed, 1),
+        "avg_ms": round(statistics.fmean(ordered), 3),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 3),
+        "write_commits": commits,
+        "rows": rows,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = [
+            await run_direct(
+                os.path.join(tmpdir, "direct.db"), args.requests, args.concurrency
+            ),
+            await run_buffered(
+                os.path.join(tmpdir, "buffered.db"),
+                args.requests,
+                args.concurrency,
+                args.flush_size,
+                args.flush_interval,
+            ),
+        ]
+
+    for result in results:
+        print(
+            f"{result['mode']:>9}: {result['req_per_sec']:>9} req/s"
+            f"  avg {result['avg_ms']} ms  p95 {result['p95_ms']} ms"
+            f"  commits {result['write_commits']}  rows {result['rows']}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--flush-size", type=int, default=500)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""스토리 에이전트 회차 컨텍스트 적재 end-to-end 벤치마크.
+
+목적
+- build_story_agent_context 의 회차 doc/chunk/episode_summary 적재를 합성 작품(기본 500화)으로 잰다.
+  · legacy: 회차마다 정규화/청크 → insert_doc_and_chunks → insert_episode_summary 순차 처리(엔진 도입 전)
+  · engine: EpisodeContextBuildEngine (프로세스 풀 정규화/청크, doc/chunk 묶음 적재, 회차 요약 동시 호출)
+- DB 는 sqlite 메모리 DB 에 문장당 --query-ms 지연을 준 pymysql 대역이고,
+  회차 요약 LLM 은 요청당 --llm-ms 지연 후 형식에 맞는 요약을 돌려주는 로컬 대역(httpx MockTransport)이다.
+
+출력
+- 방식별 전체 시간, 회차당 평균(ms), DB 문장 수, LLM 호출 수
+- legacy 와 engine 의 적재 결과(doc/chunk/summary 행) 일치 여부
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+import build_story_agent_context as story_context  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE tb_story_agent_context_doc (
+    context_doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, episode_id INTEGER, episode_no INTEGER,
+    source_type TEXT, source_locator TEXT, source_hash TEXT, source_text_length INTEGER,
+    version_no INTEGER, is_active TEXT, created_id INTEGER
+);
+CREATE INDEX ix_doc_episode ON tb_story_agent_context_doc (episode_id, source_hash);
+CREATE TABLE tb_story_agent_context_chunk (
+    context_chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    context_doc_id INTEGER, product_id INTEGER, episode_id INTEGER, episode_no INTEGER,
+    chunk_no INTEGER, text_hash TEXT, char_start INTEGER, char_end INTEGER, text TEXT, created_id INTEGER
+);
+CREATE TABLE tb_story_agent_context_summary (
+    summary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, summary_type TEXT, scope_key TEXT, episode_from INTEGER, episode_to INTEGER,
+    source_hash TEXT, source_doc_count INTEGER, version_no INTEGER, is_active TEXT, summary_text TEXT,
+    created_id INTEGER
+);
+CREATE INDEX ix_summary_scope ON tb_story_agent_context_summary (product_id, summary_type, scope_key);
+"""
+_NAMES = ["한서진", "윤하", "백도현", "서리아", "강무진", "이안"]
+_WORDS = ["검", "마나", "게이트", "던전", "길드", "결계", "계약", "시험", "균열", "기사단", "황궁", "서약"]
+
+
+class LatencyCursor:
+    def __init__(self, db: "LatencyDb"):
+        self.db = db
+        self.cursor = db.conn.cursor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    def execute(self, sql, params=()):
+        self.db.tick()
+        self.cursor.execute(sql.replace("%s", "?"), tuple(params or ()))
+
+    def executemany(self, sql, rows):
+        # pymysql 은 INSERT ... VALUES executemany 를 multi-row INSERT 로 보냄
+        self.db.tick()
+        self.cursor.executemany(sql.replace("%s", "?"), list(rows))
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [dict(row) for row in self.cursor.fetchall()]
+
+
+class LatencyDb:
+    """문장당 고정 지연을 주는 pymysql 연결 대역 (sqlite 메모리 DB)"""
+
+    def __init__(self, query_ms: float):
+        self.query_ms = query_ms
+        self.statements = 0
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def tick(self):
+        self.statements += 1
+        time.sleep(self.query_ms / 1000)
+
+    def ping(self, reconnect=True):
+        pass
+
+    def cursor(self):
+        return LatencyCursor(self)
+
+    def commit(self):
+        self.tick()
+        self.conn.commit()
+
+    def snapshot(self) -> list:
+        return [
+            tuple(row)
+            for sql in (
+                "SELECT episode_id, source_hash, version_no, is_active FROM tb_story_agent_context_doc ORDER BY episode_id, version_no",
+                "SELECT episode_id, chunk_no, text_hash, char_start, char_end FROM tb_story_agent_context_chunk ORDER BY episode_id, chunk_no",
+                "SELECT scope_key, source_hash, is_active, summary_text FROM tb_story_agent_context_summary ORDER BY scope_key",
+            )
+            for row in self.conn.execute(sql).fetchall()
+        ]
+
+
+def _episode_rows(count: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+    rows = []
+    for episode_no in range(1, count + 1):
+        paragraphs = []
+        for _ in range(rnd.randint(40, 60)):
+            sentences = [
+                f"{rnd.choice(_NAMES)}은 {rnd.choice(_WORDS)}을 두고 {rnd.choice(_NAMES)}와 부딪혔다."
+                for _ in range(rnd.randint(2, 5))
+            ]
+            paragraphs.append(f"<p>{' '.join(sentences)}</p>")
+            if rnd.random() < 0.3:
+                paragraphs.append("<p>&nbsp;</p><br/>")
+        rows.append(
+            {
+                "product_id": 1,
+                "episode_id": 10000 + episode_no,
+                "episode_no": episode_no,
+                "episode_title": f"{episode_no}화 {rnd.choice(_WORDS)}",
+                "title": "합성 작품",
+                "episode_content": f"<div class='ep'>{''.join(paragraphs)}<script>track()</script></div>",
+            }
+        )
+    return rows
+
+
+def _summary_client(llm_ms: float, calls: list[int]) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        await asyncio.sleep(llm_ms / 1000)
+        prompt = json.loads(request.content)["messages"][1]["content"]
+        lines = prompt.splitlines()
+        header = lines[2]
+        hint = next(line for line in lines if line.startswith("등장 인물"))
+        names = [name.strip() for name in hint.split(":", 1)[1].split(",") if name.strip() and name.strip() != "없음"]
+        anchors = (names + _WORDS)[:6]
+        content = f"{header}\n- {', '.join(names[:3] or ['주인공'])}이 사건을 겪는다.\n핵심: {', '.join(anchors)}"
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def run_legacy(rows: list[dict], db: LatencyDb, client: httpx.AsyncClient) -> None:
+    for row in rows:
+        source = await story_context.resolve_source_payload(row=row, use_epub_fallback=False)
+        normalized_text = story_context.normalize_episode_html(source["html_content"])
+        chunks = story_context.build_chunks(normalized_text)
+        with story_context.work_cursor(db) as cur:
+            story_context.insert_doc_and_chunks(cur, row, source, normalized_text, chunks)
+        db.commit()
+        await story_context.insert_episode_summary(
+            db, row, story_context.sha256_text(normalized_text), normalized_text, summary_client=client
+        )
+
+
+async def run_engine(rows: list[dict], db: LatencyDb, client: httpx.AsyncClient, args: argparse.Namespace) -> None:
+    engine = story_context.EpisodeContextBuildEngine(
+        workers=args.workers,
+        summary_concurrency=args.summary_concurrency,
+        doc_batch_size=args.doc_batch_size,
+        summary_rpm=args.rpm,
+    )
+    try:
+        await engine.build_product_episodes(
+            db,
+            rows,
+            apply=True,
+            use_epub_fallback=False,
+            summary_client=client,
+            results=story_context.build_empty_results(),
+        )
+    finally:
+        engine.close()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    story_context.OPENROUTER_API_KEY = "benchmark"
+    rows = _episode_rows(args.episodes, args.seed)
+    print(
+        f"episodes {args.episodes}  query {args.query_ms} ms  llm {args.llm_ms} ms  workers {args.workers}"
+        f"  summary concurrency {args.summary_concurrency}  rpm {args.rpm:g}  doc batch {args.doc_batch_size}"
+    )
+    snapshots = {}
+    for name in ("legacy", "engine"):
+        db = LatencyDb(args.query_ms)
+        calls: list[int] = []
+        client = _summary_client(args.llm_ms, calls)
+        started = time.perf_counter()
+        try:
+            if name == "legacy":
+                await run_legacy(rows, db, client)
+            else:
+                await run_engine(rows, db, client, args)
+        finally:
+            await client.aclose()
+        elapsed = time.perf_counter() - started
+        snapshots[name] = db.snapshot()
+        print(
+            f"{name:>6}: {elapsed:.1f} s  per episode {elapsed * 1000 / len(rows):.1f} ms"
+            f"  db statements {db.statements}  llm calls {len(calls)}"
+        )
+    print(f"  identical doc/chunk/summary rows: {snapshots['legacy'] == snapshots['engine']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--episodes", type=int, default=500)
+    parser.add_argument("--query-ms", type=float, default=1.0)
+    parser.add_argument("--llm-ms", type=float, default=200.0)
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--summary-concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=float, default=6000.0, help="회차 요약 분당 요청 수 제한")
+    parser.add_argument("--doc-batch-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
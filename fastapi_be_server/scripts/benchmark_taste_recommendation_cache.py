@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""취향 추천 결과 캐시 벤치마크 (온보딩 -> 홈 흐름).
+
+목적
+- get_taste_recommendations 가 매 호출 모든 구좌를 다시 계산하던 방식(off)과
+  (user_id, adult_yn, profile_version) 결과 캐시(on, taste_recommendation_cache)의 홈 요청당 지연과 hit rate 를 비교한다.
+- 유저 --users 명이 각자 온보딩(버전 증가) 후 홈을 --home-visits 번 열고,
+  --signal-every 번째 방문마다 작품을 열람해 AI 신호 이벤트(버전 증가)가 생긴다.
+- DB 조회는 쿼리당 --query-ms 지연을 주는 대역이며, 구좌 매칭/카드 구성은 실제 코드를 실행한다.
+  카탈로그는 --products 개(기본 2만) 합성 작품이다.
+
+출력
+- 방식별 홈 요청당 평균/p95 시간(ms), DB 조회 수, 캐시 metrics(hit rate 등), 첫 요청과 이후 요청의 결과 일치 여부
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.ai import recommendation_service  # noqa: E402
+from app.services.ai import taste_recommendation_cache as cache_module  # noqa: E402
+from app.services.ai.taste_recommendation_cache import TasteRecommendationCache  # noqa: E402
+
+_TAGS = ["회귀", "복수", "각성자", "마나", "게이트", "게임", "순애", "느와르", "감성", "아카데미"]
+_TYPES = ["전략가", "먼치킨", "노력형"]
+
+
+def _catalog(size: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+    return [
+        {
+            "product_id": product_id,
+            "protagonist_type": rnd.choice(_TYPES),
+            "premise": f"설정{product_id}",
+            "mood": rnd.choice(["어두운", "밝은", "긴장감"]),
+            "themes": rnd.sample(_TAGS, 2),
+            "taste_tags": rnd.sample(_TAGS, 3),
+            "protagonist_type_tags": rnd.sample(_TYPES, 1),
+            "protagonist_material_tags": rnd.sample(_TAGS, 2),
+            "worldview_tags": rnd.sample(_TAGS, 2),
+            "overall_confidence": 0.8,
+            "count_hit": rnd.randint(0, 100000),
+            "binge_rate": rnd.random(),
+            "total_readers": rnd.randint(0, 50),
+        }
+        for product_id in range(1, size + 1)
+    ]
+
+
+def _profile(user_id: int) -> dict:
+    rnd = random.Random(user_id)
+    return {
+        "onboarding_picks": [rnd.randint(1, 100)],
+        "preferred_protagonist": {rnd.choice(_TYPES): 3},
+        "preferred_mood": {"긴장감": 2},
+        "preferred_themes": {rnd.choice(_TAGS): 2},
+        "taste_tags": rnd.sample(_TAGS, 3),
+        "recommendation_sections": [
+            {"dimension": "protagonist", "title": "주인공", "reason": ""},
+            {"dimension": "mood", "title": "분위기", "reason": ""},
+            {"dimension": "theme", "title": "테마", "reason": ""},
+        ],
+        "read_product_ids": [],
+    }
+
+
+class _Result:
+    def __init__(self, scalar=None):
+        self._scalar = scalar
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+
+class _Nested:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class LatencyDb:
+    """쿼리당 고정 지연 세션 대역(버전 조회/증가만 실제 처리)"""
+
+    def __init__(self, query_ms: float):
+        self.query_ms = query_ms
+        self.queries = 0
+        self.versions: dict[int, int] = {}
+
+    async def tick(self):
+        self.queries += 1
+        await asyncio.sleep(self.query_ms / 1000)
+
+    async def execute(self, query, params=None):
+        await self.tick()
+        sql = str(query)
+        user_id = params["user_id"]
+        if "ON DUPLICATE KEY UPDATE" in sql:
+            self.versions[user_id] = self.versions.get(user_id, 0) + 1
+            return _Result()
+        return _Result(self.versions.get(user_id))
+
+    def begin_nested(self):
+        return _Nested()
+
+
+def _patches(db: LatencyDb, all_dna: list[dict], cache: TasteRecommendationCache) -> list:
+    by_id = {dna["product_id"]: dna for dna in all_dna}
+
+    def query(value):
+        async def fake(*args, **kwargs):
+            await db.tick()
+            return value(*args, **kwargs) if callable(value) else value
+        return fake
+
+    def briefs(product_ids, _db):
+        return {
+            pid: {"product_id": pid, "title": f"작품{pid}", "cover_url": None, "author_nickname": "작가", "episode_count": 10}
+            for pid in product_ids
+            if pid in by_id
+        }
+
+    return [
+        patch.object(cache_module, "taste_recommendation_cache", cache),
+        patch.object(recommendation_service, "taste_recommendation_cache", cache),
+        patch.object(recommendation_service, "_get_user_id_by_kc", query(lambda kc, _db: int(kc))),
+        patch.object(recommendation_service, "_is_ai_onboarding_dismissed", query(True)),
+        patch.object(recommendation_service, "get_user_taste_profile", query(lambda user_id, _db: _profile(user_id))),
+        patch.object(recommendation_service, "_get_recent_read_product_ids", query(set())),
+        patch.object(recommendation_service, "get_all_product_ai_metadata", query(lambda *a, **k: list(all_dna))),
+        patch.object(recommendation_service, "_get_user_factor_scores", query({})),
+        patch.object(recommendation_service, "_get_user_total_signal_count", query(0)),
+        patch.object(recommendation_service, "_get_product_briefs", query(briefs)),
+        patch.object(recommendation_service, "_save_ai_slot_serving_logs", query(None)),
+        patch.object(recommendation_service, "_is_servable_recommendation_product", lambda pid: pid in by_id),
+    ]
+
+
+async def run_flow(args: argparse.Namespace, all_dna: list[dict], enabled: bool) -> tuple[list[float], LatencyDb, TasteRecommendationCache, bool]:
+    db = LatencyDb(args.query_ms)
+    cache = TasteRecommendationCache(ttl=600, max_entries=args.users * 2, enabled=enabled)
+    patchers = _patches(db, all_dna, cache)
+    for patcher in patchers:
+        patcher.start()
+    latencies = []
+    consistent = True
+    try:
+        for user_id in range(1, args.users + 1):
+            # 온보딩 완료(process_onboarding 의 버전 증가)
+            await cache_module.bump_taste_profile_version(user_id, db)
+            baseline = None
+            for visit in range(args.home_visits):
+                if visit and visit % args.signal_every == 0:
+                    # 작품 열람 신호(post_signal_event 의 버전 증가)
+                    await cache_module.bump_taste_profile_version(user_id, db)
+                    baseline = None
+                started = time.perf_counter()
+                result = await recommendation_service.get_taste_recommendations(str(user_id), "N", db)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if baseline is None:
+                    baseline = result
+                consistent = consistent and result == baseline
+    finally:
+        for patcher in reversed(patchers):
+            patcher.stop()
+    return latencies, db, cache, consistent
+
+
+def _fmt(name: str, latencies: list[float], queries: int) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+    return (
+        f"{name:>4}: avg {statistics.fmean(ordered):.2f} ms  p95 {p95:.2f} ms"
+        f"  db queries/home {queries / len(ordered):.2f}"
+    )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    all_dna = _catalog(args.products, args.seed)
+    with patch.object(recommendation_service, "recommendation_scoring_engine", recommendation_service.ScoringEngine(
+        extract=recommendation_service._extract_scoring_features
+    )):
+        off, off_db, _, _ = await run_flow(args, all_dna, enabled=False)
+        on, on_db, cache, consistent = await run_flow(args, all_dna, enabled=True)
+    print(
+        f"products {args.products}  users {args.users}  home visits/user {args.home_visits}"
+        f"  signal every {args.signal_every}  query {args.query_ms} ms"
+    )
+    print(_fmt("off", off, off_db.queries))
+    print(_fmt("on", on, on_db.queries))
+    print(f"  cache metrics: {cache.metrics()}")
+    print(f"  identical results within a profile version: {consistent}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=30)
+    parser.add_argument("--home-visits", type=int, default=8)
+    parser.add_argument("--signal-every", type=int, default=3)
+    parser.add_argument("--query-ms", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""TraceIdMiddleware 요청당 오버헤드 벤치마크.
+
+목적
+- 기존 BaseHTTPMiddleware(응답 전체 버퍼링) 방식과 pure ASGI 방식의 요청당 비용을 비교한다.
+- 대용량 JSON 응답(목록 API)과 SSE 응답(websochat/story_agent)을 각각 측정한다.
+- 네트워크/서버 없이 ASGI 앱을 직접 호출하므로 미들웨어 비용만 측정된다.
+
+출력
+- 시나리오/미들웨어별 평균 요청 시간(ms), SSE 첫 이벤트 도착 시간(ms), 최대 단일 청크 크기
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from starlette.datastructures import MutableHeaders  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.utils.trace import TraceIdMiddleware  # noqa: E402
+
+
+class LegacyTraceIdMiddleware(BaseHTTPMiddleware):
+    """비교용: 기존 app/main.py 의 BaseHTTPMiddleware 구현"""
+
+    async def dispatch(self, request: Request, call_next):
+        params = dict(request.query_params) if request.query_params else dict()
+        body = None
+        if request.method in ["POST", "PUT", "PATCH"]:
+            try:
+                body = await request.json()
+            except Exception:
+                pass
+        request.state.params = params
+        request.state.body = body
+        request.state.analysis_params = params if params is not None else body
+        trace_id = request.headers.get("trace_id") or str(uuid.uuid4().hex)
+        request.state.trace_id = trace_id
+        request.state.span_id = str(f"{uuid.uuid4().int >> 64:016x}")
+        request.state.odata = request.headers.get("odata")
+
+        response = await call_next(request)
+        response.headers["trace_id"] = trace_id
+
+        res_body = b""
+        async for chunk in response.body_iterator:
+            res_body += chunk
+
+        return Response(
+            content=res_body,
+            status_code=response.status_code,
+            headers=MutableHeaders(response.headers),
+            media_type=response.media_type,
+        )
+
+
+def build_app(middleware_cls, payload_bytes: int, sse_events: int, sse_interval: float):
+    app = FastAPI()
+    row = b'{"productId":1,"title":"' + b"x" * 200 + b'"},'
+    rows = max(1, payload_bytes // len(row))
+    large_body = b'{"data":[' + row * (rows - 1) + row[:-1] + b"]}"
+
+    @app.get("/large")
+    async def large():
+        return Response(content=large_body, media_type="application/json")
+
+    @app.get("/sse")
+    async def sse():
+        async def gen():
+            for idx in range(sse_events):
+                if sse_interval:
+                    await asyncio.sleep(sse_interval)
+                yield f'data: {{"seq":{idx},"delta":"안녕하세요"}}\n\n'.encode()
+
+        return StreamingResponse(gen(), media_type="text/event-stream")
+
+    if middleware_cls is not None:
+        app.add_middleware(middleware_cls)
+    return app
+
+
+async def call_once(app, path: str) -> dict:
+    started = time.perf_counter()
+    first_body_at = None
+    max_chunk = 0
+    total = 0
+
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 실제 서버처럼 응답이 끝날 때까지 연결을 유지합니다.
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_body_at, max_chunk, total
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if body and first_body_at is None:
+                first_body_at = time.perf_counter()
+            max_chunk = max(max_chunk, len(body))
+            total += len(body)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    await app(scope, receive, send)
+    ended = time.perf_counter()
+    disconnected.set()
+    return {
+        "total_ms": (ended - started) * 1000,
+        "first_byte_ms": ((first_body_at or ended) - started) * 1000,
+        "max_chunk": max_chunk,
+        "bytes": total,
+    }
+
+
+async def run_case(app, path: str, iterations: int) -> dict:
+    for _ in range(min(5, iterations)):
+        await call_once(app, path)
+    results = [await call_once(app, path) for _ in range(iterations)]
+    return {
+        "total_ms": statistics.mean(r["total_ms"] for r in results),
+        "p95_ms": sorted(r["total_ms"] for r in results)[int(len(results) * 0.95) - 1],
+        "first_byte_ms": statistics.mean(r["first_byte_ms"] for r in results),
+        "max_chunk": max(r["max_chunk"] for r in results),
+        "bytes": results[-1]["bytes"],
+    }
+
+
+async def main_async(args) -> None:
+    variants = [
+        ("none", None),
+        ("legacy(BaseHTTPMiddleware)", LegacyTraceIdMiddleware),
+        ("asgi(TraceIdMiddleware)", TraceIdMiddleware),
+    ]
+    scenarios = [
+        ("large-json", "/large", args.iterations),
+        ("sse", "/sse", max(1, args.iterations // 10)),
+    ]
+    baseline = {}
+    print(
+        f"payload={args.payload_bytes}B sse_events={args.sse_events} "
+        f"sse_interval={args.sse_interval}s"
+    )
+    print(
+        f"{'scenario':<12}{'middleware':<30}{'avg_ms':>10}{'p95_ms':>10}"
+        f"{'overhead_ms':>13}{'first_byte_ms':>15}{'max_chunk':>12}"
+    )
+    for scenario, path, iterations in scenarios:
+        for name, middleware_cls in variants:
+            app = build_app(
+                middleware_cls, args.payload_bytes, args.sse_events, args.sse_interval
+            )
+            result = await run_case(app, path, iterations)
+            if middleware_cls is None:
+                baseline[scenario] = result["total_ms"]
+            overhead = result["total_ms"] - baseline.get(scenario, result["total_ms"])
+            print(
+                f"{scenario:<12}{name:<30}{result['total_ms']:>10.3f}"
+                f"{result['p95_ms']:>10.3f}{overhead:>13.3f}"
+                f"{result['first_byte_ms']:>15.3f}{result['max_chunk']:>12}"
+            )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--payload-bytes", type=int, default=2 * 1024 * 1024)
+    parser.add_argument("--sse-events", type=int, default=50)
+    parser.add_argument("--sse-interval", type=float, default=0.002)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async(parse_args()))
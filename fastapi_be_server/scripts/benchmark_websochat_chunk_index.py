@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""웹소챗 회차 본문 청크 검색 벤치마크 (LIKE 조회 vs n-gram 색인).
+
+목적
+- 청크 수만 개짜리 합성 작품(기본 30000청크, 청크당 약 1600자)에서 _search_websochat_episode_contents 를 잰다.
+  · like: 색인 없이 기존 LIKE OR 조회 (청크 본문 전체 스캔)
+  · index: tb_story_agent_chunk_index/ngram 색인 + BM25 (chunk_meta 캐시 적중/미적중 각각)
+- DB 는 sqlite 파일 DB 이고, 색인은 build_story_agent_context.sync_story_chunk_index 로 만든다.
+
+출력
+- 색인 전체 생성 시간, 새 회차 1화 증분 반영 시간, 색인 크기
+- 방식별 질의 지연 p50/p95 (ms)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+import build_story_agent_context as story_context  # noqa: E402
+from app.const import settings  # noqa: E402
+from app.services.websochat import websochat_chunk_index, websochat_service  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE tb_product_episode (
+    episode_id INTEGER PRIMARY KEY, product_id INTEGER, episode_no INTEGER, use_yn TEXT, open_yn TEXT
+);
+CREATE TABLE tb_story_agent_context_doc (
+    context_doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, episode_id INTEGER, episode_no INTEGER, is_active TEXT
+);
+CREATE TABLE tb_story_agent_context_chunk (
+    chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    context_doc_id INTEGER, product_id INTEGER, episode_id INTEGER, episode_no INTEGER, chunk_no INTEGER, text TEXT
+);
+CREATE INDEX ix_chunk_product_episode ON tb_story_agent_context_chunk (product_id, episode_no);
+CREATE TABLE tb_story_agent_chunk_index (
+    product_id INTEGER PRIMARY KEY, index_version INTEGER, segment_count INTEGER,
+    chunk_count INTEGER, indexed_chunk_count INTEGER, chunk_meta BLOB
+);
+CREATE TABLE tb_story_agent_chunk_ngram (
+    product_id INTEGER, ngram TEXT, segment_no INTEGER, postings BLOB,
+    PRIMARY KEY (product_id, ngram, segment_no)
+);
+"""
+PRODUCT_ID = 1
+CHUNKS_PER_EPISODE = 6
+_NAMES = ["한서진", "윤하", "백도현", "서리아", "강무진", "이안", "카엘", "루시엔"]
+_WORDS = ["검", "마나", "게이트", "던전", "길드", "결계", "계약", "시험", "균열", "기사단", "황궁", "서약", "마탑", "성녀"]
+_VERBS = ["부딪혔다", "바라보았다", "숨을 골랐다", "웃었다", "고개를 저었다", "검을 뽑았다"]
+QUERIES = ["한서진 게이트", "윤하와 계약은 어떻게 됐어?", "마탑 성녀", "카엘이 검을 뽑은 장면", "황궁 기사단 서약"]
+
+
+class SqliteCursor:
+    def __init__(self, conn: sqlite3.Connection):
+        self.cursor = conn.cursor()
+
+    def execute(self, sql, params=()):
+        self.cursor.execute(sql.replace("%s", "?"), tuple(params or ()))
+
+    def executemany(self, sql, rows):
+        self.cursor.executemany(sql.replace("%s", "?"), list(rows))
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [dict(row) for row in self.cursor.fetchall()]
+
+
+def _chunk_text(rnd: random.Random, target_chars: int) -> str:
+    sentences = []
+    length = 0
+    while length < target_chars:
+        sentence = f"{rnd.choice(_NAMES)}은 {rnd.choice(_WORDS)} 앞에서 {rnd.choice(_NAMES)}를 보며 {rnd.choice(_VERBS)}."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def add_episodes(conn: sqlite3.Connection, episode_nos: range, rnd: random.Random, chunk_chars: int) -> None:
+    for episode_no in episode_nos:
+        episode_id = 10000 + episode_no
+        conn.execute("INSERT INTO tb_product_episode VALUES (?, ?, ?, 'Y', 'Y')", (episode_id, PRODUCT_ID, episode_no))
+        doc_id = conn.execute(
+            "INSERT INTO tb_story_agent_context_doc (product_id, episode_id, episode_no, is_active) VALUES (?, ?, ?, 'Y')",
+            (PRODUCT_ID, episode_id, episode_no),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO tb_story_agent_context_chunk"
+            " (context_doc_id, product_id, episode_id, episode_no, chunk_no, text) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (doc_id, PRODUCT_ID, episode_id, episode_no, chunk_no, _chunk_text(rnd, chunk_chars))
+                for chunk_no in range(1, CHUNKS_PER_EPISODE + 1)
+            ],
+        )
+    conn.commit()
+
+
+def sync_index(conn: sqlite3.Connection) -> tuple[float, dict]:
+    started = time.perf_counter()
+    result = story_context.sync_story_chunk_index(SqliteCursor(conn), product_id=PRODUCT_ID)
+    conn.commit()
+    return time.perf_counter() - started, result
+
+
+async def measure(engine, latest_episode_no: int, repeat: int, *, use_index: bool, warm_cache: bool) -> list[float]:
+    settings.WEBSOCHAT_CHUNK_INDEX_ENABLED = use_index
+    timings = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            if not warm_cache:
+                websochat_chunk_index.chunk_meta_cache.clear()
+            async with AsyncSession(engine) as db:
+                started = time.perf_counter()
+                rows = await websochat_service._search_websochat_episode_contents(
+                    PRODUCT_ID, query, latest_episode_no, db
+                )
+                timings.append((time.perf_counter() - started) * 1000)
+            assert rows, query
+    return timings
+
+
+def _percentile(values: list[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    rnd = random.Random(args.seed)
+    episodes = max(1, args.chunks // CHUNKS_PER_EPISODE)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "chunks.db")
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        add_episodes(conn, range(1, episodes + 1), rnd, args.chunk_chars)
+        print(f"chunks {episodes * CHUNKS_PER_EPISODE}  episodes {episodes}  chunk chars ~{args.chunk_chars}")
+
+        elapsed, result = sync_index(conn)
+        print(f"index rebuild: {elapsed:.1f} s  indexed chunks {result['indexed_chunks']}")
+        add_episodes(conn, range(episodes + 1, episodes + 2), rnd, args.chunk_chars)
+        elapsed, result = sync_index(conn)
+        print(f"index append (1 episode): {elapsed * 1000:.0f} ms  mode {result['mode']}")
+        ngram_rows, posting_bytes = conn.execute(
+            "SELECT COUNT(*), SUM(LENGTH(postings)) FROM tb_story_agent_chunk_ngram"
+        ).fetchone()
+        print(f"index size: ngram rows {ngram_rows}  postings {posting_bytes / 1024 / 1024:.1f} MiB")
+        conn.close()
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        latest_episode_no = episodes + 1
+        try:
+            for name, use_index, warm_cache in (
+                ("like", False, False),
+                ("index (cold meta)", True, False),
+                ("index (cached meta)", True, True),
+            ):
+                timings = await measure(engine, latest_episode_no, args.repeat, use_index=use_index, warm_cache=warm_cache)
+                print(
+                    f"{name:>20}: p50 {statistics.median(timings):.1f} ms  p95 {_percentile(timings, 0.95):.1f} ms"
+                    f"  queries {len(timings)}"
+                )
+        finally:
+            await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=30000)
+    parser.add_argument("--chunk-chars", type=int, default=1600)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
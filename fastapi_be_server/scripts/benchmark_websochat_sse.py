@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""웹소챗 SSE 스트리밍 계층 벤치마크.
+
+목적
+- 기존 방식(asyncio.Queue worker + StreamingResponse 제너레이터, 매 이벤트 is_disconnected 폴링,
+  48/64자 재분할, 이벤트당 str 두 조각)과 WebsochatSseResponse(bounded 큐, delta 합치기,
+  이벤트당 bytes 프레임 하나, receive 채널 끊김 감지)를 같은 가짜 LLM delta 흐름으로 비교한다.
+- 네트워크/서버 없이 ASGI 응답을 직접 호출하므로 스트리밍 계층 비용만 측정된다.
+
+출력
+- 방식별 전체 처리량(입력 delta/s, 전송 프레임/s, ASGI send/s), 스트림당 CPU 시간(ms),
+  스트림당 평균 프레임 수/바이트, 모델 응답이 멈춘 채 끊겼을 때 생산자 취소까지 걸린 시간(ms)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from contextlib import suppress
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from fastapi.responses import StreamingResponse  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from app.services.websochat.websochat_sse import WebsochatSseResponse, WebsochatSseStats  # noqa: E402
+
+
+async def fake_llm(emit, deltas: int, delta_chars: int, interval: float, stall: bool = False) -> None:
+    """모델 토큰 흐름 흉내: delta_chars 글자 delta 를 interval 마다 하나씩, stall 이면 끝에 멈춘다"""
+    text = ("가나다라 마바사아 " * (delta_chars // 4 + 1))[:delta_chars]
+    for index in range(deltas):
+        if interval and index % 8 == 0:
+            await asyncio.sleep(interval * 8)
+        await emit(text)
+    if stall:
+        await asyncio.sleep(3600)
+
+
+def build_legacy_response(http_request: Request, deltas: int, delta_chars: int, interval: float, stall: bool):
+    """비교용: 기존 websochat_command.post_websochat_message_stream 구현"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+    done = asyncio.Event()
+    client_gone = asyncio.Event()
+
+    async def _queue_event(event_name, payload) -> None:
+        while True:
+            if client_gone.is_set():
+                raise asyncio.CancelledError("websochat stream disconnected")
+            try:
+                await asyncio.wait_for(queue.put({"event": event_name, "data": payload}), timeout=1.0)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    async def _emit_delta(chunk: str) -> None:
+        text = str(chunk or "")
+        max_chars = 64
+        start = 0
+        while start < len(text):
+            end = min(start + max_chars, len(text))
+            if end < len(text):
+                boundary = max(text.rfind("\n", start, end), text.rfind(".", start, end), text.rfind(" ", start, end))
+                if boundary > start:
+                    end = boundary + 1
+            part = text[start:end]
+            if part:
+                await _queue_event("assistant_delta", {"delta": part})
+            start = end
+
+    async def _emit_stream_delta(text: str) -> None:
+        # 기존 emit_websochat_stream_delta 의 48자 분할
+        for start in range(0, len(text), 48):
+            await _emit_delta(text[start : start + 48])
+
+    async def _worker() -> None:
+        try:
+            await _queue_event("assistant_started", {"sessionId": 1})
+            await fake_llm(_emit_stream_delta, deltas, delta_chars, interval, stall)
+            await _queue_event("assistant_completed", {"sessionId": 1})
+        finally:
+            done.set()
+
+    worker_task = asyncio.create_task(_worker())
+
+    async def _event_gen():
+        try:
+            while True:
+                if done.is_set() and queue.empty():
+                    break
+                if await http_request.is_disconnected():
+                    client_gone.set()
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=10.0)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {item['event']}\n"
+                yield f"data: {json.dumps(item['data'], ensure_ascii=False)}\n\n"
+        finally:
+            client_gone.set()
+            if not worker_task.done():
+                worker_task.cancel()
+                with suppress(BaseException):
+                    await worker_task
+            if not await http_request.is_disconnected():
+                yield "event: done\n"
+                yield "data: {}\n\n"
+
+    return StreamingResponse(_event_gen(), media_type="text/event-stream; charset=utf-8"), worker_task
+
+
+def build_new_response(deltas: int, delta_chars: int, interval: float, stall: bool, stats: WebsochatSseStats):
+    async def _produce(channel) -> None:
+        await channel.send_event("assistant_started", {"sessionId": 1})
+        await fake_llm(channel.send_delta, deltas, delta_chars, interval, stall)
+        await channel.send_event("assistant_completed", {"sessionId": 1})
+
+    return WebsochatSseResponse(_produce, stats=stats)
+
+
+async def run_stream(variant: str, args, stats: WebsochatSseStats, disconnect_after: float | None = None) -> dict:
+    sends = 0
+    body_bytes = 0
+    finished = asyncio.Event()
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [], "query_string": b""}
+
+    async def receive():
+        if disconnect_after is None:
+            await finished.wait()
+        else:
+            await asyncio.sleep(disconnect_after)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal sends, body_bytes
+        if message["type"] == "http.response.body":
+            sends += 1
+            body_bytes += len(message.get("body", b""))
+            if args.send_delay:
+                await asyncio.sleep(args.send_delay)
+
+    worker_task = None
+    if variant == "legacy":
+        response, worker_task = build_legacy_response(
+            Request(scope, receive), args.deltas, args.delta_chars, args.interval, disconnect_after is not None
+        )
+    else:
+        response = build_new_response(
+            args.deltas, args.delta_chars, args.interval, disconnect_after is not None, stats
+        )
+    started = time.perf_counter()
+    await response(scope, receive, send)
+    finished.set()
+    returned = time.perf_counter()
+    if worker_task is not None and not worker_task.done():
+        # 기존 방식은 StreamingResponse 가 제너레이터를 닫을 때까지 worker 가 남아 있을 수 있다
+        with suppress(BaseException):
+            await worker_task
+    cancelled = time.perf_counter()
+    return {
+        "sends": sends,
+        "bytes": body_bytes,
+        "cancel_ms": (cancelled - started - (disconnect_after or 0)) * 1000,
+    }
+
+
+async def run_variant(variant: str, args) -> dict:
+    stats = WebsochatSseStats()
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    results = await asyncio.gather(*(run_stream(variant, args, stats) for _ in range(args.streams)))
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+    sends = sum(r["sends"] for r in results)
+    cancel = await run_stream(variant, args, stats, disconnect_after=args.disconnect_after)
+    frames = sends - args.streams if variant == "new" else sends // 2
+    return {
+        "deltas_per_s": args.streams * args.deltas / wall,
+        "frames_per_s": frames / wall,
+        "sends_per_s": sends / wall,
+        "cpu_ms_per_stream": cpu * 1000 / args.streams,
+        "frames_per_stream": frames / args.streams,
+        "bytes_per_stream": sum(r["bytes"] for r in results) / args.streams,
+        "cancel_ms": cancel["cancel_ms"],
+    }
+
+
+async def main_async(args) -> None:
+    print(
+        f"streams={args.streams} deltas={args.deltas} delta_chars={args.delta_chars} "
+        f"interval={args.interval}s send_delay={args.send_delay}s"
+    )
+    print(
+        f"{'variant':<8}{'deltas/s':>12}{'frames/s':>12}{'sends/s':>12}{'cpu_ms/stream':>15}"
+        f"{'frames/stream':>15}{'bytes/stream':>14}{'cancel_ms':>11}"
+    )
+    for variant in ("legacy", "new"):
+        result = await run_variant(variant, args)
+        print(
+            f"{variant:<8}{result['deltas_per_s']:>12.0f}{result['frames_per_s']:>12.0f}"
+            f"{result['sends_per_s']:>12.0f}{result['cpu_ms_per_stream']:>15.2f}"
+            f"{result['frames_per_stream']:>15.1f}{result['bytes_per_stream']:>14.0f}"
+            f"{result['cancel_ms']:>11.1f}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streams", type=int, default=100)
+    parser.add_argument("--deltas", type=int, default=400)
+    parser.add_argument("--delta-chars", type=int, default=6)
+    parser.add_argument("--interval", type=float, default=0.001, help="delta 사이 간격(초)")
+    parser.add_argument("--send-delay", type=float, default=0.0, help="느린 클라이언트 흉내(send 당 초)")
+    parser.add_argument("--disconnect-after", type=float, default=0.05, help="취소 측정 스트림이 끊기는 시점(초)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main_async(parse_args()))
@@ -19,7 +19,9 @@ import logging
 import os
 import re
 import sys
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
@@ -38,6 +40,7 @@ if str(ROOT_DIR) not in sys.path:
 from app.const import settings  # noqa: E402
 from app.services.common import comm_service  # noqa: E402
 from app.services.product.episode_service import _extract_epub_payload_from_epub  # noqa: E402
+from app.services.websochat import websochat_chunk_index  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +66,11 @@ EPISODE_SUMMARY_TIMEOUT_SECONDS = 120.0
 EPISODE_SUMMARY_TEMPERATURE = float(os.getenv("STORY_AGENT_SUMMARY_TEMPERATURE", "0.0"))
 EPISODE_SUMMARY_MAX_OUTPUT_TOKENS = 1400
 EPISODE_SUMMARY_MAX_INPUT_CHARS = 10000
+# 회차 정규화/청크 프로세스 수, 회차 요약 동시 호출 수/분당 요청 수, doc/chunk 일괄 적재 단위
+CONTEXT_BUILD_WORKERS = int(os.getenv("STORY_AGENT_CONTEXT_WORKERS", str(min(4, os.cpu_count() or 1))))
+EPISODE_SUMMARY_CONCURRENCY = int(os.getenv("STORY_AGENT_SUMMARY_CONCURRENCY", "4"))
+EPISODE_SUMMARY_RPM = float(os.getenv("STORY_AGENT_SUMMARY_RPM", "60"))
+CONTEXT_DOC_BATCH_SIZE = int(os.getenv("STORY_AGENT_CONTEXT_DOC_BATCH_SIZE", "50"))
 
 TARGET_CHUNK_LEN = 1600
 MAX_CHUNK_LEN = 2500
@@ -380,6 +388,24 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="delta 모드에서 캐릭터 RP 프로필/예시를 갱신. 기본 delta/cron에서는 비용 방지를 위해 생략.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=CONTEXT_BUILD_WORKERS,
+        help="회차 원문 정규화/청크 분할 프로세스 수. 1이면 현재 프로세스에서 처리.",
+    )
+    parser.add_argument(
+        "--summary-concurrency",
+        type=int,
+        default=EPISODE_SUMMARY_CONCURRENCY,
+        help="회차 요약 LLM 동시 호출 수 (STORY_AGENT_SUMMARY_RPM 으로 분당 요청 수 제한).",
+    )
+    parser.add_argument(
+        "--doc-batch-size",
+        type=int,
+        default=CONTEXT_DOC_BATCH_SIZE,
+        help="한 번에 정규화/적재하는 회차 수.",
+    )
     parser.add_argument(
         "--verification-json-path",
         type=str,
@@ -591,6 +617,14 @@ def build_chunks(normalized_text: str) -> list[dict[str, object]]:
     return chunks
 
 
+def prepare_episode_text(html_content: str) -> tuple[str, list[dict[str, object]], str]:
+    """정규화 본문, 청크, source_hash 를 한 번에 계산 (프로세스 풀 작업 단위)."""
+    normalized_text = normalize_episode_html(html_content)
+    if not normalized_text:
+        return "", [], ""
+    return normalized_text, build_chunks(normalized_text), sha256_text(normalized_text)
+
+
 def extract_summary_sentences(normalized_text: str, limit: int = 3) -> list[str]:
     sentences: list[str] = []
     for paragraph in normalized_text.split("\n\n"):
@@ -1010,12 +1044,48 @@ def validate_episode_summary_semantics(
     return issues, bool(issues)
 
 
+class EpisodeSummaryRateLimiter:
+    """회차 요약 LLM 요청 속도 제한 (토큰 버킷, 분당 요청 수 기준)."""
+
+    def __init__(self, requests_per_minute: float, burst: int = 1):
+        self.rate_per_second = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate_per_second)
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate_per_second)
+
+
+# 회차 요약을 동시에 호출할 때만 설정 (EpisodeContextBuildEngine)
+_episode_summary_rate_limiter: EpisodeSummaryRateLimiter | None = None
+
+
+def configure_episode_summary_rate_limit(requests_per_minute: float, burst: int) -> EpisodeSummaryRateLimiter | None:
+    global _episode_summary_rate_limiter
+    _episode_summary_rate_limiter = (
+        EpisodeSummaryRateLimiter(requests_per_minute, burst) if requests_per_minute > 0 else None
+    )
+    return _episode_summary_rate_limiter
+
+
 async def request_episode_summary_text(
     client: AsyncClient,
     *,
     row: dict,
     normalized_text: str,
 ) -> str:
+    if _episode_summary_rate_limiter is not None:
+        await _episode_summary_rate_limiter.acquire()
     response = await client.post(
         f"{OPENROUTER_BASE_URL}/chat/completions",
         headers={
@@ -5270,6 +5340,66 @@ def activate_existing_doc(cur, episode_id: int, context_doc_id: int) -> None:
     )
 
 
+CONTEXT_DOC_INSERT_SQL = """
+    INSERT INTO tb_story_agent_context_doc (
+        product_id,
+        episode_id,
+        episode_no,
+        source_type,
+        source_locator,
+        source_hash,
+        source_text_length,
+        version_no,
+        is_active,
+        created_id
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y', %s)
+"""
+# executemany 가 multi-row INSERT 로 묶을 수 있도록 VALUES 한 줄 형태 유지
+CONTEXT_CHUNK_INSERT_SQL = """
+    INSERT INTO tb_story_agent_context_chunk (
+        context_doc_id,
+        product_id,
+        episode_id,
+        episode_no,
+        chunk_no,
+        text_hash,
+        char_start,
+        char_end,
+        text,
+        created_id
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+def build_context_doc_params(row: dict, source: dict[str, str], source_hash: str, text_length: int, version_no: int) -> tuple:
+    return (
+        int(row["product_id"]),
+        int(row["episode_id"]),
+        int(row["episode_no"]),
+        str(source["source_type"]),
+        str(source["source_locator"]),
+        source_hash,
+        text_length,
+        version_no,
+        settings.DB_DML_DEFAULT_ID,
+    )
+
+
+def build_context_chunk_params(context_doc_id: int, row: dict, chunk: dict[str, object]) -> tuple:
+    return (
+        context_doc_id,
+        int(row["product_id"]),
+        int(row["episode_id"]),
+        int(row["episode_no"]),
+        int(chunk["chunk_no"]),
+        str(chunk["text_hash"]),
+        int(chunk["char_start"]),
+        int(chunk["char_end"]),
+        str(chunk["text"]),
+        settings.DB_DML_DEFAULT_ID,
+    )
+
+
 def insert_doc_and_chunks(cur, row: dict, source: dict[str, str], normalized_text: str, chunks: list[dict[str, object]]) -> int:
     source_hash = sha256_text(normalized_text)
     existing = fetch_existing_doc(
@@ -5293,64 +5423,14 @@ def insert_doc_and_chunks(cur, row: dict, source: dict[str, str], normalized_tex
         (int(row["episode_id"]),),
     )
     cur.execute(
-        """
-        INSERT INTO tb_story_agent_context_doc (
-            product_id,
-            episode_id,
-            episode_no,
-            source_type,
-            source_locator,
-            source_hash,
-            source_text_length,
-            version_no,
-            is_active,
-            created_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Y', %s)
-        """,
-        (
-            int(row["product_id"]),
-            int(row["episode_id"]),
-            int(row["episode_no"]),
-            str(source["source_type"]),
-            str(source["source_locator"]),
-            source_hash,
-            len(normalized_text),
-            version_no,
-            settings.DB_DML_DEFAULT_ID,
-        ),
+        CONTEXT_DOC_INSERT_SQL,
+        build_context_doc_params(row, source, source_hash, len(normalized_text), version_no),
     )
     context_doc_id = int(cur.lastrowid)
 
     cur.executemany(
-        """
-        INSERT INTO tb_story_agent_context_chunk (
-            context_doc_id,
-            product_id,
-            episode_id,
-            episode_no,
-            chunk_no,
-            text_hash,
-            char_start,
-            char_end,
-            text,
-            created_id
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """,
-        [
-            (
-                context_doc_id,
-                int(row["product_id"]),
-                int(row["episode_id"]),
-                int(row["episode_no"]),
-                int(chunk["chunk_no"]),
-                str(chunk["text_hash"]),
-                int(chunk["char_start"]),
-                int(chunk["char_end"]),
-                str(chunk["text"]),
-                settings.DB_DML_DEFAULT_ID,
-            )
-            for chunk in chunks
-        ],
+        CONTEXT_CHUNK_INSERT_SQL,
+        [build_context_chunk_params(context_doc_id, row, chunk) for chunk in chunks],
     )
     return context_doc_id
 
@@ -5412,6 +5492,320 @@ async def insert_episode_summary(
     return int(summary_id), inserted, summary_meta
 
 
+@dataclass(frozen=True)
+class PreparedEpisode:
+    row: dict
+    source: dict[str, str]
+    normalized_text: str
+    chunks: list[dict[str, object]]
+    source_hash: str
+
+    @property
+    def episode_id(self) -> int:
+        return int(self.row["episode_id"])
+
+    @property
+    def doc_key(self) -> tuple[int, str, str]:
+        return self.episode_id, self.source_hash, str(self.source["source_type"])
+
+
+def build_in_placeholders(values: list[object]) -> str:
+    return ", ".join(["%s"] * len(values))
+
+
+def fetch_existing_docs(cur, episodes: list[PreparedEpisode]) -> dict[tuple[int, str, str], dict]:
+    """fetch_existing_doc 의 회차 묶음 조회. (episode_id, source_hash, source_type) -> doc"""
+    if not episodes:
+        return {}
+    episode_ids = sorted({episode.episode_id for episode in episodes})
+    source_hashes = sorted({episode.source_hash for episode in episodes})
+    cur.execute(
+        f"""
+        SELECT context_doc_id, episode_id, source_hash, source_type, version_no, is_active
+          FROM tb_story_agent_context_doc
+         WHERE episode_id IN ({build_in_placeholders(episode_ids)})
+           AND source_hash IN ({build_in_placeholders(source_hashes)})
+        """,
+        (*episode_ids, *source_hashes),
+    )
+    existing: dict[tuple[int, str, str], dict] = {}
+    for doc in list(cur.fetchall() or []):
+        existing.setdefault((int(doc["episode_id"]), str(doc["source_hash"]), str(doc["source_type"])), doc)
+    return existing
+
+
+def write_episode_docs(
+    cur,
+    episodes: list[PreparedEpisode],
+    existing_docs: dict[tuple[int, str, str], dict],
+) -> dict[int, int]:
+    """
+    insert_doc_and_chunks 의 회차 묶음 버전. episode_id -> context_doc_id
+    - 같은 원문 doc 가 있으면 그 doc 만 활성화 (묶음 전체 UPDATE 1회)
+    - 새 doc 는 이전 활성 doc 비활성화 후 INSERT, chunk 는 묶음 전체를 executemany 로 적재
+    """
+    doc_ids: dict[int, int] = {}
+    new_episodes: list[PreparedEpisode] = []
+    for episode in episodes:
+        existing = existing_docs.get(episode.doc_key)
+        if existing:
+            doc_ids[episode.episode_id] = int(existing["context_doc_id"])
+        else:
+            new_episodes.append(episode)
+
+    if doc_ids:
+        reused_episode_ids = sorted(doc_ids)
+        reused_doc_ids = [doc_ids[episode_id] for episode_id in reused_episode_ids]
+        cur.execute(
+            f"""
+            UPDATE tb_story_agent_context_doc
+               SET is_active = CASE WHEN context_doc_id IN ({build_in_placeholders(reused_doc_ids)}) THEN 'Y' ELSE 'N' END
+             WHERE episode_id IN ({build_in_placeholders(reused_episode_ids)})
+               AND (is_active = 'Y' OR context_doc_id IN ({build_in_placeholders(reused_doc_ids)}))
+            """,
+            (*reused_doc_ids, *reused_episode_ids, *reused_doc_ids),
+        )
+
+    if not new_episodes:
+        return doc_ids
+
+    new_episode_ids = sorted({episode.episode_id for episode in new_episodes})
+    cur.execute(
+        f"""
+        SELECT episode_id, COALESCE(MAX(version_no), 0) AS max_version_no
+          FROM tb_story_agent_context_doc
+         WHERE episode_id IN ({build_in_placeholders(new_episode_ids)})
+         GROUP BY episode_id
+        """,
+        tuple(new_episode_ids),
+    )
+    max_version_nos = {int(row["episode_id"]): int(row.get("max_version_no") or 0) for row in list(cur.fetchall() or [])}
+    cur.execute(
+        f"""
+        UPDATE tb_story_agent_context_doc
+           SET is_active = 'N'
+         WHERE episode_id IN ({build_in_placeholders(new_episode_ids)})
+           AND is_active = 'Y'
+        """,
+        tuple(new_episode_ids),
+    )
+
+    chunk_params: list[tuple] = []
+    for episode in new_episodes:
+        cur.execute(
+            CONTEXT_DOC_INSERT_SQL,
+            build_context_doc_params(
+                episode.row,
+                episode.source,
+                episode.source_hash,
+                len(episode.normalized_text),
+                max_version_nos.get(episode.episode_id, 0) + 1,
+            ),
+        )
+        context_doc_id = int(cur.lastrowid)
+        doc_ids[episode.episode_id] = context_doc_id
+        chunk_params.extend(build_context_chunk_params(context_doc_id, episode.row, chunk) for chunk in episode.chunks)
+    cur.executemany(CONTEXT_CHUNK_INSERT_SQL, chunk_params)
+    return doc_ids
+
+
+def record_episode_summary_result(results: dict[str, object], inserted_summary: bool, summary_meta: dict[str, object]) -> None:
+    if inserted_summary:
+        results["inserted_summaries"] += 1
+        if summary_meta.get("used_llm"):
+            results["llm_generated_summaries"] += 1
+            if int(summary_meta.get("retry_count") or 0) > 0:
+                results["summary_retry_successes"] += 1
+        elif summary_meta.get("fallback_used"):
+            results["summary_fallbacks"] += 1
+    else:
+        results["reused_summaries"] += 1
+
+
+class EpisodeContextBuildEngine:
+    """
+    작품 1개의 회차 doc/chunk/episode_summary 적재 (full/delta 공통).
+    - 원문 정규화/청크 분할은 프로세스 풀(workers > 1)에서 doc_batch_size 회차씩 처리
+    - doc/chunk 는 묶음 단위로 적재(write_episode_docs)
+    - 회차 요약은 summary_concurrency 개까지 동시에 생성하고, LLM 요청은 분당 요청 수로 제한
+    작품 잠금(GET_LOCK)은 호출하는 쪽이 잡고 있어야 하며, DB 연결 하나를 이벤트 루프 안에서 나눠 쓴다.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        summary_concurrency: int = 1,
+        doc_batch_size: int = CONTEXT_DOC_BATCH_SIZE,
+        summary_rpm: float = EPISODE_SUMMARY_RPM,
+    ):
+        self.workers = max(1, workers)
+        self.summary_concurrency = max(1, summary_concurrency)
+        self.doc_batch_size = max(1, doc_batch_size)
+        self._pool: ProcessPoolExecutor | None = None
+        if self.summary_concurrency > 1:
+            configure_episode_summary_rate_limit(summary_rpm, self.summary_concurrency)
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "EpisodeContextBuildEngine":
+        return cls(
+            workers=args.workers,
+            summary_concurrency=args.summary_concurrency,
+            doc_batch_size=args.doc_batch_size,
+        )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        configure_episode_summary_rate_limit(0, 1)
+
+    async def _prepare_texts(self, html_contents: list[str]) -> list[tuple[str, list[dict[str, object]], str]]:
+        if self.workers <= 1 or len(html_contents) <= 1:
+            return [prepare_episode_text(html_content) for html_content in html_contents]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(self._pool, prepare_episode_text, html_content) for html_content in html_contents)
+            )
+        )
+
+    async def prepare_episodes(
+        self,
+        rows: list[dict],
+        *,
+        use_epub_fallback: bool,
+        results: dict[str, object],
+        verbose: bool = False,
+    ) -> list[PreparedEpisode]:
+        sourced: list[tuple[dict, dict[str, str]]] = []
+        for row in rows:
+            source = await resolve_source_payload(row=row, use_epub_fallback=use_epub_fallback)
+            if source is None:
+                results["skipped_rows"] += 1
+                if verbose:
+                    print(f"[skip] product_id={row['product_id']} episode_id={row['episode_id']} source unavailable")
+                continue
+            sourced.append((row, source))
+
+        prepared: list[PreparedEpisode] = []
+        texts = await self._prepare_texts([source["html_content"] for _, source in sourced])
+        for (row, source), (normalized_text, chunks, source_hash) in zip(sourced, texts):
+            if not normalized_text or not chunks:
+                results["skipped_rows"] += 1
+                if verbose:
+                    reason = "normalized text empty" if not normalized_text else "chunks empty"
+                    print(f"[skip] product_id={row['product_id']} episode_id={row['episode_id']} {reason}")
+                continue
+            prepared.append(PreparedEpisode(row, source, normalized_text, chunks, source_hash))
+        return prepared
+
+    async def _summarize_episodes(
+        self,
+        conn,
+        episodes: list[PreparedEpisode],
+        *,
+        summary_client: AsyncClient | None,
+        verbose: bool,
+    ) -> list[tuple[int, bool, dict[str, object]]]:
+        semaphore = asyncio.Semaphore(self.summary_concurrency)
+
+        async def summarize(episode: PreparedEpisode) -> tuple[int, bool, dict[str, object]]:
+            async with semaphore:
+                return await insert_episode_summary(
+                    conn=conn,
+                    row=episode.row,
+                    source_hash=episode.source_hash,
+                    normalized_text=episode.normalized_text,
+                    summary_client=summary_client,
+                    verbose=verbose,
+                )
+
+        tasks = [asyncio.create_task(summarize(episode)) for episode in episodes]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # 한 회차가 실패하면 나머지 요약 호출도 취소 (기존 순차 처리의 break 와 같은 판정)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def build_product_episodes(
+        self,
+        conn,
+        rows: list[dict],
+        *,
+        apply: bool,
+        use_epub_fallback: bool,
+        summary_client: AsyncClient | None,
+        results: dict[str, object],
+        verbose: bool = False,
+    ) -> dict[int, str]:
+        """회차 doc/chunk/episode_summary 적재 후 episode_no -> 정규화 본문 반환."""
+        episode_texts_by_no: dict[int, str] = {}
+        for start in range(0, len(rows), self.doc_batch_size):
+            episodes = await self.prepare_episodes(
+                rows[start : start + self.doc_batch_size],
+                use_epub_fallback=use_epub_fallback,
+                results=results,
+                verbose=verbose,
+            )
+            if not episodes:
+                continue
+            for episode in episodes:
+                episode_texts_by_no[int(episode.row["episode_no"])] = episode.normalized_text
+
+            with work_cursor(conn) as cur:
+                existing_docs = fetch_existing_docs(cur, episodes)
+            for episode in episodes:
+                results["reused_docs" if episode.doc_key in existing_docs else "inserted_docs"] += 1
+
+            if not apply:
+                for episode in episodes:
+                    with work_cursor(conn) as cur:
+                        existing_summary = fetch_existing_summary(
+                            cur=cur,
+                            product_id=int(episode.row["product_id"]),
+                            summary_type="episode_summary",
+                            scope_key=f"episode:{episode.episode_id}",
+                            source_hash=build_summary_source_hash(
+                                episode.source_hash, str(episode.row.get("episode_title") or "")
+                            ),
+                        )
+                    results["reused_summaries" if existing_summary else "inserted_summaries"] += 1
+                    if verbose:
+                        print(
+                            f"[dry-run] product_id={episode.row['product_id']} episode_no={episode.row['episode_no']} "
+                            f"source={episode.source['source_type']} hash={episode.source_hash[:10]} "
+                            f"chunks={len(episode.chunks)}"
+                        )
+                continue
+
+            with work_cursor(conn) as cur:
+                doc_ids = write_episode_docs(cur, episodes, existing_docs)
+            conn.commit()
+
+            summaries = await self._summarize_episodes(
+                conn,
+                episodes,
+                summary_client=summary_client,
+                verbose=verbose,
+            )
+            for episode, (_, inserted_summary, summary_meta) in zip(episodes, summaries):
+                record_episode_summary_result(results, inserted_summary, summary_meta)
+                if verbose:
+                    print(
+                        f"[ok] product_id={episode.row['product_id']} episode_no={episode.row['episode_no']} "
+                        f"context_doc_id={doc_ids[episode.episode_id]} source={episode.source['source_type']} "
+                        f"chunks={len(episode.chunks)} summary_llm={summary_meta.get('used_llm')} "
+                        f"summary_fallback={summary_meta.get('fallback_used')}"
+                    )
+        return episode_texts_by_no
+
+
 def refresh_product_context_status(cur, product_id: int, total_episode_count: int) -> dict[str, object]:
     cur.execute(
         """
@@ -5470,6 +5864,125 @@ def refresh_product_context_status(cur, product_id: int, total_episode_count: in
     }
 
 
+CHUNK_INDEX_TEXT_FETCH_SIZE = 500
+CHUNK_INDEX_INSERT_BATCH_SIZE = 500
+
+
+def fetch_live_chunk_rows(cur, *, product_id: int) -> list[dict]:
+    cur.execute(
+        """
+        SELECT c.chunk_id, c.episode_id, c.episode_no, c.chunk_no
+          FROM tb_story_agent_context_chunk c
+          JOIN tb_story_agent_context_doc d
+            ON d.context_doc_id = c.context_doc_id
+           AND d.is_active = 'Y'
+         WHERE c.product_id = %s
+         ORDER BY c.chunk_id
+        """,
+        (product_id,),
+    )
+    return list(cur.fetchall() or [])
+
+
+def fetch_chunk_texts(cur, chunk_ids: list[int]) -> Iterable[list[tuple[int, str]]]:
+    for start in range(0, len(chunk_ids), CHUNK_INDEX_TEXT_FETCH_SIZE):
+        page = chunk_ids[start:start + CHUNK_INDEX_TEXT_FETCH_SIZE]
+        cur.execute(
+            f"SELECT chunk_id, text FROM tb_story_agent_context_chunk WHERE chunk_id IN ({build_in_placeholders(page)})",
+            tuple(page),
+        )
+        yield [(int(row["chunk_id"]), str(row["text"] or "")) for row in list(cur.fetchall() or [])]
+
+
+def sync_story_chunk_index(cur, *, product_id: int) -> dict[str, object]:
+    """
+    웹소챗 청크 n-gram 색인 갱신 (작품 잠금 안에서 호출).
+    새 live 청크만 세그먼트로 덧붙이고, 세그먼트/죽은 posting 한도를 넘으면 작품 전체를 다시 만든다.
+    """
+    live_rows = fetch_live_chunk_rows(cur, product_id=product_id)
+    cur.execute(
+        """
+        SELECT index_version, segment_count, indexed_chunk_count, chunk_meta
+          FROM tb_story_agent_chunk_index
+         WHERE product_id = %s
+        """,
+        (product_id,),
+    )
+    state = cur.fetchone()
+    meta = websochat_chunk_index.unpack_chunk_meta(bytes(state["chunk_meta"])) if state else None
+    plan = websochat_chunk_index.plan_chunk_index_update(
+        meta,
+        [row["chunk_id"] for row in live_rows],
+        segment_count=int(state["segment_count"]) if state else 0,
+        indexed_chunk_count=int(state["indexed_chunk_count"]) if state else 0,
+    )
+    if plan.mode == "noop":
+        return {"product_id": product_id, "mode": plan.mode, "indexed_chunks": 0}
+
+    lengths: dict[int, int] = {}
+    if plan.mode == "append" and meta is not None:
+        lengths.update(zip(meta.chunk_ids.tolist(), meta.lengths.tolist()))
+        segment_no = int(state["segment_count"])
+        indexed_chunk_count = int(state["indexed_chunk_count"])
+    else:
+        cur.execute("DELETE FROM tb_story_agent_chunk_ngram WHERE product_id = %s", (product_id,))
+        segment_no = 0
+        indexed_chunk_count = 0
+
+    # 세그먼트 하나에 CHUNK_INDEX_SEGMENT_CHUNKS 개까지 담아 전체 재색인도 메모리를 일정하게 유지
+    segment_size = websochat_chunk_index.CHUNK_INDEX_SEGMENT_CHUNKS
+    for start in range(0, len(plan.add_chunk_ids), segment_size):
+        chunks = [
+            item
+            for page in fetch_chunk_texts(cur, plan.add_chunk_ids[start:start + segment_size])
+            for item in page
+        ]
+        postings, segment_lengths = websochat_chunk_index.build_segment_postings(chunks)
+        lengths.update(segment_lengths)
+        segment_no += 1
+        indexed_chunk_count += len(chunks)
+        rows = [(product_id, gram, segment_no, blob) for gram, blob in postings.items()]
+        for row_start in range(0, len(rows), CHUNK_INDEX_INSERT_BATCH_SIZE):
+            cur.executemany(
+                """
+                INSERT INTO tb_story_agent_chunk_ngram (product_id, ngram, segment_no, postings)
+                VALUES (%s, %s, %s, %s)
+                """,
+                rows[row_start:row_start + CHUNK_INDEX_INSERT_BATCH_SIZE],
+            )
+
+    new_meta = websochat_chunk_index.build_chunk_meta(live_rows, lengths)
+    cur.execute("DELETE FROM tb_story_agent_chunk_index WHERE product_id = %s", (product_id,))
+    cur.execute(
+        """
+        INSERT INTO tb_story_agent_chunk_index (
+            product_id,
+            index_version,
+            segment_count,
+            chunk_count,
+            indexed_chunk_count,
+            chunk_meta
+        ) VALUES (%s, %s, %s, %s, %s, %s)
+        """,
+        (
+            product_id,
+            (int(state["index_version"]) if state else 0) + 1,
+            segment_no,
+            len(new_meta),
+            indexed_chunk_count,
+            websochat_chunk_index.pack_chunk_meta(new_meta),
+        ),
+    )
+    return {"product_id": product_id, "mode": plan.mode, "indexed_chunks": len(plan.add_chunk_ids)}
+
+
+def record_chunk_index_result(results: dict[str, object], sync_result: dict[str, object]) -> None:
+    mode = str(sync_result.get("mode") or "")
+    if mode in {"append", "rebuild"}:
+        results[f"chunk_index_{mode}s"] += 1
+        results["chunk_index_indexed_chunks"] += int(sync_result.get("indexed_chunks") or 0)
+
+
 def assert_story_agent_foundation_invariants(cur, *, product_id: int) -> None:
     cur.execute(
         """
@@ -5591,6 +6104,9 @@ def build_empty_results() -> dict[str, object]:
         "reused_character_rp_profiles": 0,
         "inserted_character_rp_examples": 0,
         "reused_character_rp_examples": 0,
+        "chunk_index_appends": 0,
+        "chunk_index_rebuilds": 0,
+        "chunk_index_indexed_chunks": 0,
         "skipped_rows": 0,
         "products": [],
         "delta_verifications": [],
@@ -5608,6 +6124,7 @@ async def build_context_rows(rows: Iterable[dict], args: argparse.Namespace) ->
     if (OPENROUTER_API_KEY and EPISODE_SUMMARY_MODEL) or (settings.ANTHROPIC_API_KEY and RP_REASONING_MODEL):
         summary_client = AsyncClient(timeout=EPISODE_SUMMARY_TIMEOUT_SECONDS)
 
+    engine = EpisodeContextBuildEngine.from_args(args)
     work_conn = db_connect()
     try:
         for product_id, product_rows in rows_by_product.items():
@@ -5632,119 +6149,27 @@ async def build_context_rows(rows: Iterable[dict], args: argparse.Namespace) ->
                     continue
 
                 try:
-                    for row in product_rows:
-                        source = await resolve_source_payload(row=row, use_epub_fallback=args.use_epub_fallback)
-                        if source is None:
-                            results["skipped_rows"] += 1
-                            if args.verbose:
-                                print(
-                                    f"[skip] product_id={row['product_id']} episode_id={row['episode_id']} source unavailable"
-                                )
-                            continue
-
-                        normalized_text = normalize_episode_html(source["html_content"])
-                        if not normalized_text:
-                            results["skipped_rows"] += 1
-                            if args.verbose:
-                                print(
-                                    f"[skip] product_id={row['product_id']} episode_id={row['episode_id']} normalized text empty"
-                                )
-                            continue
-                        episode_texts_by_no[int(row["episode_no"])] = normalized_text
-
-                        chunks = build_chunks(normalized_text)
-                        if not chunks:
-                            results["skipped_rows"] += 1
-                            if args.verbose:
-                                print(
-                                    f"[skip] product_id={row['product_id']} episode_id={row['episode_id']} chunks empty"
-                                )
-                            continue
-
-                        source_hash = sha256_text(normalized_text)
-                        with work_cursor(work_conn) as cur:
-                            existing = fetch_existing_doc(
-                                cur=cur,
-                                episode_id=int(row["episode_id"]),
-                                source_hash=source_hash,
-                                source_type=str(source["source_type"]),
-                            )
-
-                        if args.apply:
-                            try:
-                                with work_cursor(work_conn) as cur:
-                                    context_doc_id = insert_doc_and_chunks(
-                                        cur=cur,
-                                        row=row,
-                                        source=source,
-                                        normalized_text=normalized_text,
-                                        chunks=chunks,
-                                    )
-                                work_conn.commit()
-                                if existing:
-                                    results["reused_docs"] += 1
-                                else:
-                                    results["inserted_docs"] += 1
-
-                                _, inserted_summary, summary_meta = await insert_episode_summary(
-                                    conn=work_conn,
-                                    row=row,
-                                    source_hash=source_hash,
-                                    normalized_text=normalized_text,
-                                    summary_client=summary_client,
-                                    verbose=args.verbose,
-                                )
-                                if inserted_summary:
-                                    results["inserted_summaries"] += 1
-                                    if summary_meta.get("used_llm"):
-                                        results["llm_generated_summaries"] += 1
-                                        if int(summary_meta.get("retry_count") or 0) > 0:
-                                            results["summary_retry_successes"] += 1
-                                    elif summary_meta.get("fallback_used"):
-                                        results["summary_fallbacks"] += 1
-                                else:
-                                    results["reused_summaries"] += 1
-                                if args.verbose:
-                                    print(
-                                        f"[ok] product_id={row['product_id']} episode_no={row['episode_no']} "
-                                        f"context_doc_id={context_doc_id} source={source['source_type']} chunks={len(chunks)} "
-                                        f"summary_llm={summary_meta.get('used_llm')} "
-                                        f"summary_fallback={summary_meta.get('fallback_used')}"
-                                    )
-                            except Exception as exc:
-                                product_failed = True
-                                failed_ready_episode_count = mark_product_context_failed(
-                                    product_id=product_id,
-                                    total_episode_count=total_episode_count,
-                                    error_message=str(exc),
-                                )
-                                if args.verbose:
-                                    print(
-                                        f"[failed] product_id={product_id} episode_id={row['episode_id']} error={str(exc)[:200]}"
-                                    )
-                                break
-                        else:
-                            if existing:
-                                results["reused_docs"] += 1
-                            else:
-                                results["inserted_docs"] += 1
-                            with work_cursor(work_conn) as cur:
-                                existing_summary = fetch_existing_summary(
-                                    cur=cur,
-                                    product_id=int(row["product_id"]),
-                                    summary_type="episode_summary",
-                                    scope_key=f"episode:{int(row['episode_id'])}",
-                                    source_hash=build_summary_source_hash(source_hash, str(row.get("episode_title") or "")),
-                                )
-                            if existing_summary:
-                                results["reused_summaries"] += 1
-                            else:
-                                results["inserted_summaries"] += 1
-                            if args.verbose:
-                                print(
-                                    f"[dry-run] product_id={row['product_id']} episode_no={row['episode_no']} "
-                                    f"source={source['source_type']} hash={source_hash[:10]} chunks={len(chunks)}"
-                                )
+                    try:
+                        episode_texts_by_no = await engine.build_product_episodes(
+                            work_conn,
+                            product_rows,
+                            apply=args.apply,
+                            use_epub_fallback=args.use_epub_fallback,
+                            summary_client=summary_client,
+                            results=results,
+                            verbose=args.verbose,
+                        )
+                    except Exception as exc:
+                        if not args.apply:
+                            raise
+                        product_failed = True
+                        failed_ready_episode_count = mark_product_context_failed(
+                            product_id=product_id,
+                            total_episode_count=total_episode_count,
+                            error_message=str(exc),
+                        )
+                        if args.verbose:
+                            print(f"[failed] product_id={product_id} error={str(exc)[:200]}")
 
                     if args.apply and not product_failed:
                         with work_cursor(work_conn) as cur:
@@ -5816,12 +6241,14 @@ async def build_context_rows(rows: Iterable[dict], args: argparse.Namespace) ->
                         results["reused_character_rp_examples"] += rp_counts["examples"][1]
 
                         with work_cursor(work_conn) as cur:
+                            chunk_index_result = sync_story_chunk_index(cur, product_id=product_id)
                             status_row = refresh_product_context_status(
                                 cur=cur,
                                 product_id=product_id,
                                 total_episode_count=total_episode_count,
                             )
                         work_conn.commit()
+                        record_chunk_index_result(results, chunk_index_result)
                         results["products"].append(status_row)
                     elif args.apply and product_failed:
                         results["products"].append(
@@ -5864,6 +6291,7 @@ async def build_context_rows(rows: Iterable[dict], args: argparse.Namespace) ->
     finally:
         if summary_client is not None:
             await summary_client.aclose()
+        engine.close()
         work_conn.close()
     return results
 
@@ -5879,6 +6307,7 @@ async def build_context_rows_delta(rows: Iterable[dict], args: argparse.Namespac
     if (OPENROUTER_API_KEY and EPISODE_SUMMARY_MODEL) or (settings.ANTHROPIC_API_KEY and RP_REASONING_MODEL):
         summary_client = AsyncClient(timeout=EPISODE_SUMMARY_TIMEOUT_SECONDS)
 
+    engine = EpisodeContextBuildEngine.from_args(args)
     work_conn = db_connect()
     try:
         for product_id, product_rows in rows_by_product.items():
@@ -5924,69 +6353,15 @@ async def build_context_rows_delta(rows: Iterable[dict], args: argparse.Namespac
                             episode_nos=touched_episode_nos,
                         )
 
-                    for row in product_rows:
-                        source = await resolve_source_payload(row=row, use_epub_fallback=args.use_epub_fallback)
-                        if source is None:
-                            results["skipped_rows"] += 1
-                            continue
-
-                        normalized_text = normalize_episode_html(source["html_content"])
-                        if not normalized_text:
-                            results["skipped_rows"] += 1
-                            continue
-
-                        chunks = build_chunks(normalized_text)
-                        if not chunks:
-                            results["skipped_rows"] += 1
-                            continue
-
-                        source_hash = sha256_text(normalized_text)
-                        with work_cursor(work_conn) as cur:
-                            existing = fetch_existing_doc(
-                                cur=cur,
-                                episode_id=int(row["episode_id"]),
-                                source_hash=source_hash,
-                                source_type=str(source["source_type"]),
-                            )
-
-                        if args.apply:
-                            with work_cursor(work_conn) as cur:
-                                insert_doc_and_chunks(
-                                    cur=cur,
-                                    row=row,
-                                    source=source,
-                                    normalized_text=normalized_text,
-                                    chunks=chunks,
-                                )
-                            work_conn.commit()
-                            if existing:
-                                results["reused_docs"] += 1
-                            else:
-                                results["inserted_docs"] += 1
-
-                            _, inserted_summary, summary_meta = await insert_episode_summary(
-                                conn=work_conn,
-                                row=row,
-                                source_hash=source_hash,
-                                normalized_text=normalized_text,
-                                summary_client=summary_client,
-                                verbose=args.verbose,
-                            )
-                            if inserted_summary:
-                                results["inserted_summaries"] += 1
-                                if summary_meta.get("used_llm"):
-                                    results["llm_generated_summaries"] += 1
-                                    if int(summary_meta.get("retry_count") or 0) > 0:
-                                        results["summary_retry_successes"] += 1
-                                elif summary_meta.get("fallback_used"):
-                                    results["summary_fallbacks"] += 1
-                            else:
-                                results["reused_summaries"] += 1
-                        else:
-                            if existing:
-                                results["reused_docs"] += 1
-                            else:
-                                results["inserted_docs"] += 1
+                    await engine.build_product_episodes(
+                        work_conn,
+                        product_rows,
+                        apply=args.apply,
+                        use_epub_fallback=args.use_epub_fallback,
+                        summary_client=summary_client,
+                        results=results,
+                        verbose=False,
+                    )
 
                     if args.apply and not product_failed:
                         with work_cursor(work_conn) as cur:
@@ -6122,12 +6497,14 @@ async def build_context_rows_delta(rows: Iterable[dict], args: argparse.Namespac
                                 cur=cur,
                                 product_id=product_id,
                             )
+                            chunk_index_result = sync_story_chunk_index(cur, product_id=product_id)
                             status_row = refresh_product_context_status(
                                 cur=cur,
                                 product_id=product_id,
                                 total_episode_count=total_episode_count,
                             )
                         work_conn.commit()
+                        record_chunk_index_result(results, chunk_index_result)
                         results["inserted_range_summaries"] += compound_counts["range"][0]
                         results["reused_range_summaries"] += compound_counts["range"][1]
                         results["inserted_product_summaries"] += compound_counts["product"][0]
@@ -6182,6 +6559,7 @@ async def build_context_rows_delta(rows: Iterable[dict], args: argparse.Namespac
     finally:
         if summary_client is not None:
             await summary_client.aclose()
+        engine.close()
         work_conn.close()
     return results
 
@@ -6202,6 +6580,8 @@ def print_summary(results: dict[str, object], apply: bool) -> None:
         f"inserted_relation_inventories={results['inserted_relation_inventories']} reused_relation_inventories={results['reused_relation_inventories']} "
         f"inserted_character_rp_profiles={results['inserted_character_rp_profiles']} reused_character_rp_profiles={results['reused_character_rp_profiles']} "
         f"inserted_character_rp_examples={results['inserted_character_rp_examples']} reused_character_rp_examples={results['reused_character_rp_examples']} "
+        f"chunk_index_appends={results['chunk_index_appends']} chunk_index_rebuilds={results['chunk_index_rebuilds']} "
+        f"chunk_index_indexed_chunks={results['chunk_index_indexed_chunks']} "
         f"skipped_rows={results['skipped_rows']}"
     )
     for product in list(results.get("products") or [])[:20]:
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""작품 카드 read model(tb_product_card_summary) 정합성 점검.
+
+목적
+- tb_product_card_summary 값과 라이브 집계(join) 결과를 작품 단위로 비교한다.
+- 대상은 `--product-ids` 로 지정하거나, 생략 시 product_id 오름차순으로 `--limit` 건.
+- 기본은 점검만 수행하고, `--repair` 일 때만 불일치 작품을 재계산(upsert)한다.
+
+출력
+- 불일치 컬럼별 기대값/실제값, 점검/불일치/재계산 작품 수
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import text  # noqa: E402
+
+from app.rdb import likenovel_db_engine, likenovel_db_session  # noqa: E402
+from app.services.product.product_card_service import (  # noqa: E402
+    check_product_card_consistency,
+    refresh_product_cards,
+)
+
+
+async def _target_product_ids(db, args: argparse.Namespace) -> list[int]:
+    if args.product_ids:
+        return [int(product_id) for product_id in args.product_ids.split(",") if product_id]
+    result = await db.execute(
+        text("""
+            SELECT product_id
+              FROM tb_product
+             WHERE product_id > :cursor
+             ORDER BY product_id
+             LIMIT :limit
+        """),
+        {"cursor": args.cursor, "limit": args.limit},
+    )
+    return [row["product_id"] for row in result.mappings().all()]
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    try:
+        async with likenovel_db_session() as db:
+            product_ids = await _target_product_ids(db, args)
+            mismatches = await check_product_card_consistency(product_ids, db)
+
+            for mismatch in mismatches:
+                if mismatch["column"] is None:
+                    print(f"product {mismatch['product_id']}: card row missing")
+                else:
+                    print(
+                        f"product {mismatch['product_id']}: {mismatch['column']}"
+                        f" expected={mismatch['expected']!r} actual={mismatch['actual']!r}"
+                    )
+
+            mismatch_ids = sorted({mismatch["product_id"] for mismatch in mismatches})
+            repaired = 0
+            if args.repair and mismatch_ids:
+                repaired = await refresh_product_cards(mismatch_ids, db)
+                await db.commit()
+    finally:
+        await likenovel_db_engine.dispose()
+
+    print(
+        f"checked {len(product_ids)}  mismatched {len(mismatch_ids)}"
+        f"  repaired {repaired}"
+    )
+    return 1 if mismatch_ids and not args.repair else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--product-ids", default="", help="쉼표 구분 product_id 목록")
+    parser.add_argument("--cursor", type=int, default=0, help="이 product_id 초과부터 점검")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repair", action="store_true", help="불일치 작품 재계산")
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""웹소챗 질문 분류 빠른 경로 오프라인 평가.
+
+목적
+- 라벨을 단 질문 모음(tests/fixtures/websochat_intent_labels.jsonl)을 가중치만큼 섞어 여러 작품에 흘려 보내고,
+  _resolve_websochat_intent / _resolve_websochat_rp_recall_need / _resolve_websochat_qa_corrections 의
+  규칙 -> 작품별 캐시 -> LLM 경로를 그대로 탄다.
+- LLM 분류는 라벨을 돌려주는 대역(정답 LLM)이라, 정확도는 규칙 판단이 라벨과 얼마나 맞는지를 잰다.
+
+출력
+- 분류 종류별 메시지 수, LLM 호출 수(기존: 메시지마다 1회), LLM 호출 회피율, 규칙/캐시 처리 비율
+- 규칙 판단 정확도, 전체 정확도(LLM 은 라벨대로 답한다고 가정), 틀린 규칙 판단 목록
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.services.websochat import websochat_service  # noqa: E402
+from app.services.websochat.websochat_intent_router import websochat_intent_cache  # noqa: E402
+
+DEFAULT_FIXTURE_PATH = ROOT_DIR / "tests" / "fixtures" / "websochat_intent_labels.jsonl"
+KINDS = ("intent", "rp_recall", "qa_corrections")
+
+
+def load_labeled_prompts(path: Path) -> list[dict[str, Any]]:
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _expected(item: dict[str, Any]) -> Any:
+    label = item["label"]
+    if item["kind"] == "intent":
+        return label["intent"], bool(label["needs_creative"]), label["mode"]
+    if item["kind"] == "rp_recall":
+        return bool(label["needs_exact_recall"])
+    return bool(label["has_corrections"])
+
+
+async def _classify(item: dict[str, Any], product_id: int) -> Any:
+    prompt = item["prompt"]
+    if item["kind"] == "intent":
+        return await websochat_service._resolve_websochat_intent(
+            user_prompt=prompt, recent_messages=[], product_id=product_id
+        )
+    if item["kind"] == "rp_recall":
+        needs_exact_recall, _ = await websochat_service._resolve_websochat_rp_recall_need(
+            user_prompt=prompt,
+            recent_messages=[],
+            rp_context={"active_character": "주인공", "anchor_episode_no": 3},
+            product_id=product_id,
+        )
+        return needs_exact_recall
+    corrections = await websochat_service._resolve_websochat_qa_corrections(
+        user_prompt=prompt, recent_messages=[], qa_recent_notes=[], qa_corrections=[]
+    )
+    return bool(corrections)
+
+
+async def evaluate_intent_router(
+    items: list[dict[str, Any]],
+    *,
+    products: int = 3,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """가중치만큼 반복한 질문 흐름을 작품 products 개에 흘려 분류 경로별 건수/정확도를 센다"""
+    labels = {(item["kind"], item["prompt"]): item for item in items}
+
+    async def oracle_intent(*, user_prompt, recent_messages):
+        return _expected(labels[("intent", user_prompt)])
+
+    async def oracle_rp_recall(*, user_prompt, recent_messages, rp_context):
+        return _expected(labels[("rp_recall", user_prompt)]), user_prompt
+
+    async def oracle_corrections(*, system_prompt, user_prompt, max_tokens):
+        prompt = user_prompt.removeprefix("현재 사용자 발화: ").removesuffix("\n\nJSON만 반환해.")
+        has_corrections = _expected(labels[("qa_corrections", prompt)])
+        return {
+            "has_corrections": has_corrections,
+            "corrections": [{"subject": "정정", "correct_value": prompt}] if has_corrections else [],
+        }
+
+    stream = [
+        (product_id, item)
+        for product_id in range(1, products + 1)
+        for item in items
+        for _ in range(int(item.get("weight") or 1))
+    ]
+    random.Random(seed).shuffle(stream)
+
+    websochat_intent_cache.clear()
+    sources: dict[str, Counter[str]] = {kind: Counter() for kind in KINDS}
+    correct: dict[str, Counter[str]] = {kind: Counter() for kind in KINDS}
+    rule_misses: list[dict[str, Any]] = []
+    with (
+        patch.object(websochat_service, "_classify_websochat_intent_with_llm", oracle_intent),
+        patch.object(websochat_service, "_classify_websochat_rp_recall_need_with_llm", oracle_rp_recall),
+        patch.object(websochat_service, "_call_websochat_gemini_json", oracle_corrections),
+        patch.object(websochat_service.logger, "info"),
+    ):
+        for product_id, item in stream:
+            kind = item["kind"]
+            before = Counter(websochat_intent_cache.sources)
+            actual = await _classify(item, product_id)
+            (source,) = [source for (item_kind, source), _ in (Counter(websochat_intent_cache.sources) - before).items() if item_kind == kind]
+            sources[kind][source] += 1
+            matched = actual == _expected(item)
+            correct[kind]["all"] += int(matched)
+            if source == "rule":
+                correct[kind]["rule"] += int(matched)
+                if not matched:
+                    rule_misses.append({"kind": kind, "prompt": item["prompt"], "expected": _expected(item), "actual": actual})
+
+    report: dict[str, Any] = {}
+    for kind in KINDS:
+        messages = sum(sources[kind].values())
+        if not messages:
+            continue
+        rule_count = sources[kind]["rule"]
+        report[kind] = {
+            "messages": messages,
+            "llm_calls": sources[kind]["llm"],
+            "llm_avoided_rate": round(1 - sources[kind]["llm"] / messages, 4),
+            "rule_rate": round(rule_count / messages, 4),
+            "cache_rate": round(sources[kind]["cache"] / messages, 4),
+            "rule_accuracy": round(correct[kind]["rule"] / rule_count, 4) if rule_count else None,
+            "accuracy": round(correct[kind]["all"] / messages, 4),
+        }
+    report["rule_misses"] = rule_misses
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", default=str(DEFAULT_FIXTURE_PATH))
+    parser.add_argument("--products", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    items = load_labeled_prompts(Path(args.fixture))
+    report = asyncio.run(evaluate_intent_router(items, products=args.products, seed=args.seed))
+    print(f"labeled prompts {len(items)}  products {args.products}")
+    for kind in KINDS:
+        if kind not in report:
+            continue
+        row = report[kind]
+        rule_accuracy = "-" if row["rule_accuracy"] is None else f"{row['rule_accuracy']:.3f}"
+        print(
+            f"{kind:>15}: messages {row['messages']}  llm calls {row['llm_calls']} (before {row['messages']})"
+            f"  avoided {row['llm_avoided_rate']:.1%}  rule {row['rule_rate']:.1%}  cache {row['cache_rate']:.1%}"
+            f"  rule accuracy {rule_accuracy}  accuracy {row['accuracy']:.3f}"
+        )
+    for miss in report["rule_misses"]:
+        print(f"  [rule-miss] {miss['kind']} {miss['prompt']!r} expected={miss['expected']} actual={miss['actual']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,3 +20,6 @@ class _PytestTimedRotatingFileHandler(_OriginalTimedRotatingFileHandler):
 
 
 logging.handlers.TimedRotatingFileHandler = _PytestTimedRotatingFileHandler
+
+# 커서 페이징 서명 키 (설정이 없으면 check_cursor_secret 에서 기동 실패)
+os.environ.setdefault("PAGINATION_CURSOR_SECRET", "pytest-cursor-secret")
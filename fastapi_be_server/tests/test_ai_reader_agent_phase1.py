@@ -259,16 +259,8 @@ class AiReaderAgentPhase1Test(unittest.TestCase):
                 }
 
         class FakeAsyncClient:
-            def __init__(self, *, timeout):
+            async def post(self, url, *, headers, json, timeout):
                 captured["timeout"] = timeout
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, exc_type, exc, tb):
-                return False
-
-            async def post(self, url, *, headers, json):
                 captured["url"] = url
                 captured["headers"] = headers
                 captured["payload"] = json
@@ -280,7 +272,7 @@ class AiReaderAgentPhase1Test(unittest.TestCase):
                     with patch.object(service.settings, "AI_READER_OPENROUTER_PROVIDER_ONLY", ""):
                         with patch.object(service.settings, "AI_READER_OPENROUTER_TEMPERATURE", 0.4):
                             with patch.object(service.settings, "AI_READER_OPENROUTER_TIMEOUT_SECONDS", 12.0):
-                                with patch.object(service.httpx, "AsyncClient", FakeAsyncClient):
+                                with patch.object(service, "get_http_client", return_value=FakeAsyncClient()):
                                     raw = asyncio.run(
                                         service._default_llm_call(
                                             "system prompt",
@@ -334,16 +326,7 @@ class AiReaderAgentPhase1Test(unittest.TestCase):
                 return self._payload
 
         class FakeAsyncClient:
-            def __init__(self, *, timeout):
-                self.timeout = timeout
-
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, exc_type, exc, tb):
-                return False
-
-            async def post(self, url, *, headers, json):
+            async def post(self, url, *, headers, json, timeout):
                 calls["count"] += 1
                 if calls["count"] == 1:
                     return FakeResponse({"choices": []})
@@ -362,7 +345,7 @@ class AiReaderAgentPhase1Test(unittest.TestCase):
             with patch.object(service.settings, "OPENROUTER_BASE_URL", "https://openrouter.test/api/v1"):
                 with patch.object(service.settings, "AI_READER_OPENROUTER_MODEL", "deepseek/deepseek-v3.2"):
                     with patch.object(service.settings, "AI_READER_OPENROUTER_PROVIDER_ONLY", ""):
-                        with patch.object(service.httpx, "AsyncClient", FakeAsyncClient):
+                        with patch.object(service, "get_http_client", return_value=FakeAsyncClient()):
                             raw = asyncio.run(
                                 service._default_llm_call(
                                     "system prompt",
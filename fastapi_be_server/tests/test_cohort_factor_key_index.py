@@ -0,0 +1,151 @@
+import importlib.util
+import os
+import random
+import tempfile
+import unittest
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.services.ai import recommendation_service
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+
+# 대소문자/앞뒤 공백이 섞인 축 키(SQLite lower/trim 은 ASCII 공백/문자만 다루므로 ASCII 로 구성)
+_KEYS = ["Regression", " regression", "REVENGE ", "revenge", "hunter", " Hunter ", "academy", "Gate", "romance"]
+_FACTOR_TYPES = ["protagonist", "material", "worldview"]
+
+# dist/init/45 + 99d 의 tb_user_taste_factor_score 중 조회에 필요한 컬럼
+_CREATE_TABLE = """
+create table tb_user_taste_factor_score (
+    id integer primary key,
+    user_id integer not null,
+    factor_type varchar(50) not null,
+    factor_key varchar(120) not null,
+    factor_key_norm varchar(120) generated always as (lower(trim(factor_key))) stored,
+    score double not null default 0,
+    unique (user_id, factor_type, factor_key)
+)
+"""
+_CREATE_INDEX = (
+    "create index idx_user_taste_factor_key_norm "
+    "on tb_user_taste_factor_score (factor_key_norm, score, user_id)"
+)
+
+
+def _expected_user_weights(rows, user_id, seed_labels):
+    """기존 LOWER(TRIM(factor_key)) IN (...) 조회 + 가중치 합산을 그대로 옮긴 기준값"""
+    weights = {}
+    for row_user_id, factor_key, score in rows:
+        factor_key = factor_key.strip().lower()
+        if row_user_id == user_id or score <= 0 or seed_labels.get(factor_key, 0.0) <= 0:
+            continue
+        signal_weight = recommendation_service._clamp(
+            recommendation_service._normalize_factor_score(score) / 6.0, 0.0, 1.0
+        )
+        if signal_weight <= 0:
+            continue
+        weights[row_user_id] = weights.get(row_user_id, 0.0) + seed_labels[factor_key] * signal_weight
+    return weights
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite 미설치")
+class CohortFactorKeyIndexTest(unittest.IsolatedAsyncioTestCase):
+    """factor_key_norm 역색인 조회가 기존 정규화 조회와 같은 유사 유저 가중치를 내는지 SQLite 로 확인"""
+
+    async def asyncSetUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{self.db_path}")
+        rnd = random.Random(3)
+        self.rows = []
+        for user_id in range(1, 121):
+            for factor_type in _FACTOR_TYPES:
+                for factor_key in rnd.sample(_KEYS, 3):
+                    self.rows.append(
+                        (user_id, factor_type, factor_key, rnd.choice([-2.0, 0.0, 0.4, 1.5, 3.0, 9.0]))
+                    )
+        async with self.engine.begin() as conn:
+            await conn.execute(text(_CREATE_TABLE))
+            await conn.execute(text(_CREATE_INDEX))
+            await conn.execute(
+                text(
+                    "insert into tb_user_taste_factor_score (user_id, factor_type, factor_key, score) "
+                    "values (:user_id, :factor_type, :factor_key, :score)"
+                ),
+                [
+                    {"user_id": u, "factor_type": t, "factor_key": k, "score": s}
+                    for u, t, k, s in self.rows
+                ],
+            )
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        os.remove(self.db_path)
+
+    async def test_weights_match_normalized_scan(self):
+        seed_sets = [
+            {"regression": 4.0},
+            {"revenge": 2.5, "hunter": 1.0, "gate": 0.5},
+            {"academy": 3.0, "romance": 0.0, "unknown": 5.0},
+        ]
+        rows = [(u, k, s) for u, _, k, s in self.rows]
+        async with self.engine.connect() as conn:
+            for user_id in (1, 7, 999):
+                for seed_labels in seed_sets:
+                    with self.subTest(user_id=user_id, seed_labels=seed_labels):
+                        actual = await recommendation_service._get_cohort_similar_user_weights(
+                            user_id=user_id,
+                            seed_labels=seed_labels,
+                            db=conn,
+                        )
+                        expected = _expected_user_weights(rows, user_id, seed_labels)
+                        self.assertEqual(actual.keys(), expected.keys())
+                        for similar_user_id, weight in expected.items():
+                            self.assertAlmostEqual(actual[similar_user_id], weight, places=9)
+                        self.assertNotIn(user_id, actual)
+
+    async def test_normalized_key_is_written_on_insert_and_update(self):
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "update tb_user_taste_factor_score set factor_key = '  Dungeon ' "
+                    "where user_id = 2 and id = (select min(id) from tb_user_taste_factor_score where user_id = 2)"
+                )
+            )
+            weights = await recommendation_service._get_cohort_similar_user_weights(
+                user_id=1,
+                seed_labels={"dungeon": 1.0},
+                db=conn,
+            )
+            norm_keys = (
+                await conn.execute(
+                    text("select distinct factor_key_norm from tb_user_taste_factor_score")
+                )
+            ).scalars().all()
+
+        self.assertEqual(set(norm_keys), {key.strip().lower() for key in _KEYS} | {"dungeon"})
+        # 점수 > 0 인 행이면 유사 유저로 잡힘
+        updated_score = next(s for u, _, _, s in self.rows if u == 2)
+        self.assertEqual(2 in weights, updated_score > 0)
+
+    async def test_query_searches_factor_key_index(self):
+        async with self.engine.connect() as conn:
+            plan = (
+                await conn.execute(
+                    text(
+                        "explain query plan "
+                        "select user_id, factor_key_norm as factor_key, score "
+                        "from tb_user_taste_factor_score "
+                        "where factor_key_norm in ('revenge', 'hunter') and score > 0 and user_id <> 1"
+                    )
+                )
+            ).all()
+        detail = " ".join(str(row[-1]) for row in plan)
+        # 전체 스캔이 아니라 축 키 range search(MySQL 에서는 커버링 인덱스만 읽음)
+        self.assertIn("SEARCH tb_user_taste_factor_score USING", detail)
+        self.assertIn("INDEX idx_user_taste_factor_key_norm (factor_key_norm=?", detail)
+
+
+if __name__ == "__main__":
+    unittest.main()
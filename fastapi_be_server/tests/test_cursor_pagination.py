@@ -0,0 +1,243 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.const import ErrorMessages
+from app.exceptions import CustomResponseException
+from app.services.admin import admin_user_service
+from app.utils import cursor_pagination
+from app.utils.cursor_pagination import (
+    KeysetOrder,
+    KeysetSpec,
+    check_cursor_secret,
+    decode_cursor,
+    encode_cursor,
+    parse_keyset_page,
+)
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+
+# 같은 시각 행이 여러 개 있어 id 로 동순위를 구분해야 하는 정렬
+_RECENT_SPEC = KeysetSpec("test_items", (KeysetOrder("created_date"), KeysetOrder("id")))
+
+
+class CursorTokenTest(unittest.TestCase):
+    def test_round_trip_keeps_value_types(self):
+        values = [datetime(2025, 1, 2, 3, 4, 5), Decimal("1.50"), 7, None]
+        spec = KeysetSpec("typed", tuple(KeysetOrder(f"c{idx}") for idx in range(4)))
+
+        cursor = encode_cursor(spec, values, scope={"product_id": 1})
+
+        self.assertEqual(decode_cursor(spec, cursor, scope={"product_id": 1}), values)
+
+    def test_tampered_or_reused_cursor_is_rejected(self):
+        cursor = encode_cursor(_RECENT_SPEC, ["2025-01-01", 3], scope={"product_id": 1})
+        payload, signature = cursor.split(".")
+        other_spec = KeysetSpec("other", _RECENT_SPEC.orders)
+
+        for bad_cursor, spec, scope in [
+            (payload + "x." + signature, _RECENT_SPEC, {"product_id": 1}),
+            ("not-a-cursor", _RECENT_SPEC, {"product_id": 1}),
+            (cursor, _RECENT_SPEC, {"product_id": 2}),
+            (cursor, other_spec, {"product_id": 1}),
+        ]:
+            with self.assertRaises(CustomResponseException) as ctx:
+                decode_cursor(spec, bad_cursor, scope)
+            self.assertEqual(ctx.exception.status_code, 400)
+            self.assertEqual(ctx.exception.message, ErrorMessages.INVALID_PAGE_CURSOR)
+
+    def test_signing_key_requires_secret(self):
+        with patch.object(cursor_pagination.settings, "PAGINATION_CURSOR_SECRET", ""):
+            with patch.object(cursor_pagination.settings, "KC_CLIENT_SECRET", "kc-secret"):
+                check_cursor_secret()
+                derived = cursor_pagination._signing_key()
+            with patch.object(cursor_pagination.settings, "KC_CLIENT_SECRET", ""):
+                with self.assertRaises(RuntimeError):
+                    check_cursor_secret()
+
+        # KC_CLIENT_SECRET 을 그대로 쓰지 않고 하위 키를 유도
+        self.assertNotEqual(derived, b"kc-secret")
+        self.assertEqual(len(derived), 32)
+
+    def test_limit_is_capped(self):
+        with patch("app.utils.cursor_pagination.settings.PAGINATION_CURSOR_MAX_LIMIT", 50):
+            self.assertEqual(parse_keyset_page(_RECENT_SPEC, "", 1000).limit, 50)
+            self.assertEqual(parse_keyset_page(_RECENT_SPEC, None, 20).after, None)
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite 미설치")
+class KeysetIterationTest(unittest.IsolatedAsyncioTestCase):
+    """조회 중 행 추가/삭제가 있어도 중복/누락 없이 순회하는지 SQLite 로 확인"""
+
+    async def asyncSetUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{self.db_path}")
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text("create table items (id integer primary key, created_date text, score integer)")
+            )
+            # 시각 10개 x 3행(동시각), score 는 0~2 반복
+            for idx in range(1, 31):
+                await conn.execute(
+                    text("insert into items values (:id, :created_date, :score)"),
+                    {
+                        "id": idx,
+                        "created_date": f"2025-01-01 00:00:{(idx - 1) // 3:02d}",
+                        "score": idx % 3,
+                    },
+                )
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        os.remove(self.db_path)
+
+    async def _page(self, spec, cursor, limit=4):
+        keyset = parse_keyset_page(spec, cursor, limit, scope={"table": "items"})
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(f"""
+                    select id, created_date, score, {keyset.select_sql}
+                      from items
+                     where 1=1 {keyset.where_sql}
+                     order by {keyset.order_by_sql}
+                     {keyset.limit_sql}
+                """),
+                keyset.params,
+            )
+            return keyset.split(result.mappings().all())
+
+    async def _execute(self, sql, params=None):
+        async with self.engine.begin() as conn:
+            await conn.execute(text(sql), params or {})
+
+    async def test_iteration_with_inserts_and_deletes(self):
+        seen = []
+        deleted_ahead = set()
+        cursor = ""
+        page_no = 0
+        while cursor is not None:
+            rows, cursor = await self._page(_RECENT_SPEC, cursor)
+            self.assertTrue(all(not key.startswith("keyset_") for key in rows[0]))
+            seen.extend(row["id"] for row in rows)
+            page_no += 1
+
+            if page_no == 1:
+                # 이미 지나간 위치보다 최신 행 추가, 이미 본 행 삭제
+                await self._execute(
+                    "insert into items values (100, '2025-01-01 00:01:00', 0)"
+                )
+                await self._execute("delete from items where id = :id", {"id": seen[0]})
+            if page_no == 2:
+                # 커서 행과 같은 시각인 바로 다음 행(경계 행)과 아직 안 본 행 삭제
+                unseen = [idx for idx in range(30, 0, -1) if idx not in seen]
+                deleted_ahead = {unseen[0], unseen[5]}
+                for idx in deleted_ahead:
+                    await self._execute("delete from items where id = :id", {"id": idx})
+                # 아직 안 본 구간에 새 행 추가(순회 범위 안이므로 포함되어야 함)
+                await self._execute(
+                    "insert into items values (200, '2025-01-01 00:00:01', 1)"
+                )
+
+        self.assertEqual(len(seen), len(set(seen)))
+        expected = [idx for idx in range(30, 0, -1) if idx not in deleted_ahead]
+        # 200 은 00:00:01 구간(4~6) 의 맨 앞(id 내림차순)
+        expected.insert(expected.index(6), 200)
+        self.assertEqual(seen, expected)
+
+    async def test_mixed_directions(self):
+        spec = KeysetSpec(
+            "test_items_score",
+            (KeysetOrder("score"), KeysetOrder("created_date", desc=False), KeysetOrder("id")),
+        )
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            rows, cursor = await self._page(spec, cursor, limit=7)
+            seen.extend((row["score"], row["created_date"], -row["id"]) for row in rows)
+
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(seen, sorted(seen, key=lambda row: (-row[0], row[1], row[2])))
+
+    async def test_last_page_has_no_cursor(self):
+        rows, cursor = await self._page(_RECENT_SPEC, "", limit=30)
+
+        self.assertEqual(len(rows), 30)
+        self.assertIsNone(cursor)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def first(self):
+        return self._rows[0]
+
+
+class _RecordingDb:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        self.queries.append((sql, params))
+        if "COUNT(*)" in sql:
+            return _FakeResult([{"total_count": len(self.rows)}])
+        return _FakeResult(self.rows[: params["keyset_limit"]])
+
+
+class AdminUserListCursorTest(unittest.IsolatedAsyncioTestCase):
+    async def test_cursor_mode_skips_count_and_filters_after_cursor(self):
+        rows = [
+            {"user_id": idx, "keyset_sort_0": f"2025-01-0{idx}", "keyset_sort_1": idx}
+            for idx in (3, 2, 1)
+        ]
+        db = _RecordingDb(rows)
+
+        first = await admin_user_service.user_list("all", "", "", 1, 2, db, cursor="")
+
+        self.assertEqual(len(db.queries), 1)
+        self.assertIsNone(first["total_count"])
+        self.assertEqual([row["user_id"] for row in first["results"]], [3, 2])
+        self.assertNotIn("keyset_sort_0", first["results"][0])
+
+        db.rows = rows[2:]
+        second = await admin_user_service.user_list(
+            "all", "", "", 1, 2, db, cursor=first["next_cursor"], include_total=True
+        )
+
+        sql, params = db.queries[-1]
+        self.assertIn("u.created_date < :keyset_0", sql)
+        self.assertEqual((params["keyset_0"], params["keyset_1"]), ("2025-01-02", 2))
+        self.assertEqual(second["total_count"], 1)
+        self.assertIsNone(second["next_cursor"])
+
+    async def test_cursor_from_other_filter_is_rejected(self):
+        db = _RecordingDb([])
+        cursor = encode_cursor(
+            admin_user_service.ADMIN_USER_KEYSET_SPEC,
+            ["2025-01-01", 1],
+            scope={"status": "all", "search_target": "", "search_word": ""},
+        )
+
+        with self.assertRaises(CustomResponseException):
+            await admin_user_service.user_list("signout", "", "", 1, 2, db, cursor=cursor)
+        self.assertEqual(db.queries, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
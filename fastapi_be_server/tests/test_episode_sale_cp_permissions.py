@@ -16,12 +16,15 @@ def _function_block(source: str, name: str) -> str:
 def test_episode_sale_actor_uses_accepted_cp_profile():
     source = _read(ROOT / "app/services/product/episode_service.py")
     helper = _function_block(source, "_resolve_episode_sale_actor")
-
-    assert "from tb_user_profile_apply upa" in helper
-    assert "upa.apply_type = 'cp'" in helper
-    assert "upa.approval_code = 'accepted'" in helper
-    assert "upa.approval_date IS NOT NULL" in helper
-    assert "u.use_yn = 'Y'" in helper
+    identity_source = _read(ROOT / "app/utils/identity.py")
+    is_cp_query = identity_source.split("exists(select 1 from tb_user_profile_apply", 1)[1]
+    is_cp_query = is_cp_query.split(") as is_cp", 1)[0]
+
+    assert "resolve_user_identity(kc_user_id, db)" in helper
+    assert "identity.is_cp" in helper
+    assert "apply_type = 'cp'" in is_cp_query
+    assert "approval_code = 'accepted'" in is_cp_query
+    assert "approval_date is not null" in is_cp_query
 
 
 def test_sale_state_mutations_allow_approved_cp_linked_products():
@@ -0,0 +1,176 @@
+import asyncio
+import unittest
+from collections import defaultdict
+from datetime import date, datetime
+
+from app.services.product.view_counter import (
+    EpisodeViewCounter,
+    build_episode_hit_query,
+    build_product_hit_log_query,
+)
+
+
+class _FakeCounterDb:
+    """bulk 쿼리의 바인딩 파라미터를 해석해 카운터 테이블을 흉내내는 DB"""
+
+    def __init__(self):
+        self.episode_hits = defaultdict(int)
+        self.product_hits = defaultdict(int)
+        self.product_cp_hits = defaultdict(int)
+        self.hit_logs = defaultdict(int)
+        self.statements = []
+        self.commits = 0
+        self.fail = False
+
+    def session(self):
+        return _FakeCounterSession(self)
+
+
+class _FakeCounterSession:
+    def __init__(self, db: _FakeCounterDb):
+        self.db = db
+        self.pending = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, query, params=None):
+        if self.db.fail:
+            raise OSError("db unavailable")
+        sql = str(query)
+        self.db.statements.append(sql)
+        self.pending.append((sql, params))
+
+    async def commit(self):
+        for sql, params in self.pending:
+            size = len([k for k in params if k.startswith("hit_") and k[4:].isdigit()])
+            if "update tb_product_episode" in sql:
+                for idx in range(size):
+                    self.db.episode_hits[params[f"episode_id_{idx}"]] += params[f"hit_{idx}"]
+            elif "update tb_product p" in sql:
+                for idx in range(size):
+                    product_id = params[f"product_id_{idx}"]
+                    self.db.product_hits[product_id] += params[f"hit_{idx}"]
+                    self.db.product_cp_hits[product_id] += params[f"cp_hit_{idx}"]
+            elif "tb_product_hit_log" in sql:
+                idx = 0
+                while f"product_id_{idx}" in params:
+                    key = (params[f"product_id_{idx}"], params[f"hit_date_{idx}"])
+                    self.db.hit_logs[key] += params[f"hit_count_{idx}"]
+                    idx += 1
+        self.pending = []
+        self.db.commits += 1
+
+
+class EpisodeViewCounterTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.db = _FakeCounterDb()
+
+    def _counter(self, **kwargs):
+        options = {
+            "session_factory": self.db.session,
+            "flush_interval": 60,
+            "max_keys": 1000,
+            "enabled": True,
+        }
+        options.update(kwargs)
+        return EpisodeViewCounter(**options)
+
+    def test_bulk_queries(self):
+        query, params = build_episode_hit_query([(10, 3), (11, 1)])
+        sql = str(query)
+
+        self.assertIn("join (select :episode_id_0 as episode_id, :hit_0 as hit", sql)
+        self.assertIn("union all select :episode_id_1, :hit_1", sql)
+        self.assertEqual(params["hit_0"], 3)
+
+        query, params = build_product_hit_log_query([(1, date(2026, 1, 1), 5)])
+        self.assertIn("hit_count = hit_count + values(hit_count)", str(query))
+        self.assertEqual(params["hit_count_0"], 5)
+
+    async def test_views_are_coalesced_into_one_flush(self):
+        counter = self._counter()
+        now = datetime(2026, 1, 1, 10, 15)
+        for _ in range(100):
+            counter.record(product_id=1, episode_id=10, cp_yn="N", now=now)
+        counter.record(product_id=1, episode_id=11, cp_yn="Y", now=now)
+        # 비로그인 조회는 에피소드 조회수만 증가
+        counter.record(product_id=1, episode_id=11, count_product=False, now=now)
+
+        flushed = await counter.flush()
+
+        self.assertEqual(flushed, 102)
+        # 테이블별 bulk 쿼리 1회 + commit 1회
+        self.assertEqual(len(self.db.statements), 3)
+        self.assertEqual(self.db.commits, 1)
+        self.assertEqual(self.db.episode_hits, {10: 100, 11: 2})
+        self.assertEqual(self.db.product_hits[1], 101)
+        self.assertEqual(self.db.product_cp_hits[1], 1)
+        self.assertEqual(self.db.hit_logs[(1, date(2026, 1, 1))], 101)
+        self.assertEqual(counter.pending_keys, 0)
+
+    async def test_hit_log_is_attributed_to_view_date(self):
+        counter = self._counter()
+        counter.record(product_id=1, episode_id=10, now=datetime(2026, 1, 1, 23, 59))
+        counter.record(product_id=1, episode_id=10, now=datetime(2026, 1, 2, 0, 1))
+
+        await counter.flush()
+
+        self.assertEqual(self.db.hit_logs[(1, date(2026, 1, 1))], 1)
+        self.assertEqual(self.db.hit_logs[(1, date(2026, 1, 2))], 1)
+        self.assertEqual(self.db.episode_hits[10], 2)
+
+    async def test_counts_stay_exact_across_workers(self):
+        # 워커 2개가 각자 증가분만 더하므로 합계가 보존됨
+        workers = [self._counter(), self._counter()]
+        for idx in range(1000):
+            workers[idx % 2].record(product_id=1, episode_id=10, cp_yn="Y" if idx % 10 == 0 else "N")
+            if idx % 250 == 0:
+                await asyncio.gather(*(worker.flush() for worker in workers))
+        await asyncio.gather(*(worker.flush() for worker in workers))
+
+        self.assertEqual(self.db.episode_hits[10], 1000)
+        self.assertEqual(self.db.product_hits[1], 1000)
+        self.assertEqual(self.db.product_cp_hits[1], 100)
+        self.assertEqual(sum(self.db.hit_logs.values()), 1000)
+
+    async def test_failed_flush_keeps_increments_for_retry(self):
+        counter = self._counter()
+        counter.record(product_id=1, episode_id=10)
+        self.db.fail = True
+
+        self.assertEqual(await counter.flush(), 0)
+        counter.record(product_id=1, episode_id=10)
+        self.assertEqual(counter.failed_flush_count, 1)
+
+        self.db.fail = False
+        await counter.flush()
+
+        self.assertEqual(self.db.episode_hits[10], 2)
+        self.assertEqual(self.db.product_hits[1], 2)
+
+    async def test_max_keys_wakes_flush_loop_and_stop_drains(self):
+        counter = self._counter(max_keys=2)
+        await counter.start()
+        try:
+            counter.record(product_id=1, episode_id=10)
+            counter.record(product_id=2, episode_id=20)
+            for _ in range(10):
+                await asyncio.sleep(0)
+                if counter.flushed_views:
+                    break
+            self.assertEqual(counter.flushed_views, 2)
+
+            counter.record(product_id=3, episode_id=30)
+        finally:
+            await counter.stop()
+
+        self.assertFalse(counter.is_running)
+        self.assertEqual(self.db.episode_hits[30], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+import asyncio
+import importlib.util
+import json
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "dist" / "batch" / "extract_product_dna.py"
+
+ALLOWED_LABELS = {
+    "세": {"현대", "무협"},
+    "직": {"헌터"},
+    "능": {"천재"},
+    "연": set(),
+    "작": {"일상"},
+    "타": {"먼치킨"},
+    "목": {"복수"},
+}
+
+
+def load_module():
+    spec = importlib.util.spec_from_file_location("extract_product_dna_pipeline", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def dna_payload(product_id: int) -> dict:
+    return {
+        "summary": {
+            "protagonist_type": "먼치킨",
+            "protagonist_desc": f"주인공{product_id}",
+            "heroine_type": "없음",
+            "heroine_weight": "none",
+            "mood": "긴장감",
+            "pacing": "fast",
+            "premise": f"설정{product_id}",
+            "hook": f"훅{product_id}",
+            "themes": ["복수"],
+        },
+        "axis_labels": {
+            "세": ["현대" if product_id % 2 else "무협"],
+            "직": ["헌터"],
+            "능": ["천재"],
+            "연": [],
+            "작": ["일상"],
+            "타": ["먼치킨"],
+            "목": ["복수"],
+        },
+        "overall_confidence": 0.9,
+    }
+
+
+class FakeOpenRouter:
+    """/chat/completions 만 흉내 내는 로컬 서버 (응답 지연, 지정 작품 첫 호출 500)"""
+
+    def __init__(self, delay: float, fail_once: set[int]):
+        self.delay = delay
+        self.fail_once = set(fail_once)
+        self.calls = 0
+        self.lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                product_id = int(re.search(r"PID-(\d+)", body["messages"][1]["content"]).group(1))
+                with fake.lock:
+                    fake.calls += 1
+                    fail = product_id in fake.fail_once
+                    fake.fail_once.discard(product_id)
+                time.sleep(fake.delay)
+                if fail:
+                    self._send(500, {"error": {"message": "upstream overloaded"}})
+                    return
+                self._send(
+                    200,
+                    {
+                        "choices": [
+                            {
+                                "message": {"content": json.dumps(dna_payload(product_id), ensure_ascii=False)},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15, "cost": 0.001},
+                    },
+                )
+
+            def _send(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __exit__(self, exc_type, exc, tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def execute(self, sql, params=None):
+        if "FROM tb_product_episode" in sql:
+            product_id = params[0]
+            count = 1 if product_id == self.conn.short_product_id else 3
+            self.rows = [
+                {"episode_no": no, "episode_title": f"{no}화", "episode_content": f"<p>본문 {product_id}-{no}</p>"}
+                for no in range(1, count + 1)
+            ]
+            return
+        self.conn.statements += 1
+        width = 25 if "'success'" in sql else 4
+        params = list(params)
+        for start in range(0, len(params), width):
+            row = params[start : start + width]
+            self.conn.saved[row[0]] = row
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, short_product_id=None):
+        self.short_product_id = short_product_id
+        self.saved = {}
+        self.statements = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+def products(count: int) -> list[dict]:
+    return [{"product_id": product_id, "title": f"PID-{product_id}"} for product_id in range(1, count + 1)]
+
+
+class ExtractProductDnaPipelineTest(TestCase):
+    def setUp(self):
+        self.module = load_module()
+        self.module.AI_DNA_PROVIDER = "openrouter"
+        self.module.OPENROUTER_API_KEY = "test-key"
+        self.module.RETRY_BACKOFF_BASE_SECONDS = 0.01
+        self.module._RATE_LIMITERS.clear()
+
+    def run_pipeline(self, conn, items, concurrency, checkpoint=None):
+        checkpoint = checkpoint or self.module.ExtractCheckpoint(None, "test")
+        return asyncio.run(
+            self.module.run_pipeline(
+                conn, items, ALLOWED_LABELS, concurrency=concurrency, write_batch_size=4, checkpoint=checkpoint
+            )
+        )
+
+    def test_pipeline_saves_same_rows_as_sequential(self):
+        items = products(10)
+        with FakeOpenRouter(delay=0.0, fail_once={3}) as base_url:
+            self.module.OPENROUTER_BASE_URL = base_url
+            sequential_conn = FakeConnection(short_product_id=7)
+            fake_time = SimpleNamespace(sleep=lambda seconds: None, monotonic=time.monotonic)
+            with patch.object(self.module, "time", fake_time), patch("builtins.print"):
+                sequential = self.module.run_sequential(sequential_conn, items, ALLOWED_LABELS)
+
+        with FakeOpenRouter(delay=0.0, fail_once={3}) as base_url:
+            self.module.OPENROUTER_BASE_URL = base_url
+            pipeline_conn = FakeConnection(short_product_id=7)
+            with patch("builtins.print"):
+                pipeline = self.run_pipeline(pipeline_conn, items, concurrency=4)
+
+        self.assertEqual(sequential[:2], (9, 1))
+        self.assertEqual(pipeline[:2], sequential[:2])
+        self.assertEqual(sorted(pipeline[2]), sorted(sequential[2]))
+        self.assertEqual(pipeline_conn.saved, sequential_conn.saved)
+        self.assertEqual(pipeline_conn.saved[3][-1], 2)  # 500 한 번 뒤 재시도 성공
+        self.assertEqual(pipeline_conn.saved[7][2], "insufficient_episodes(<3)")
+        # 10건을 4건씩 모아 저장 (성공/실패 구분)
+        self.assertLess(pipeline_conn.statements, sequential_conn.statements)
+
+    def test_throughput_scales_with_concurrency(self):
+        items = products(12)
+        elapsed = {}
+        with FakeOpenRouter(delay=0.1, fail_once=set()) as base_url:
+            self.module.OPENROUTER_BASE_URL = base_url
+            for concurrency in (1, 4):
+                started = time.perf_counter()
+                with patch("builtins.print"):
+                    result = self.run_pipeline(FakeConnection(), items, concurrency=concurrency)
+                elapsed[concurrency] = time.perf_counter() - started
+                self.assertEqual(result[:2], (12, 0))
+
+        self.assertLess(elapsed[4], elapsed[1] / 2)
+
+    def test_rate_limiter_caps_provider_requests(self):
+        self.module.configure_rate_limiters("openrouter=600,anthropic=0", burst=2)
+        self.assertEqual(set(self.module._RATE_LIMITERS), {"openrouter"})
+
+        bucket = self.module._RATE_LIMITERS["openrouter"]
+        started = time.monotonic()
+        waits = [bucket.acquire() for _ in range(4)]
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(waits[:2], [0.0, 0.0])  # burst 만큼은 바로 통과
+        self.assertGreaterEqual(elapsed, 0.15)  # 초당 10건 -> 나머지 2건은 0.1초씩 대기
+
+    def test_checkpoint_resume_skips_saved_products(self):
+        items = products(6)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "checkpoint.jsonl"
+            checkpoint = self.module.ExtractCheckpoint(str(path), "v1:all")
+            checkpoint.record([{"product_id": 1, "status": "success"}, {"product_id": 2, "status": "failed"}])
+            self.module.ExtractCheckpoint(str(path), "v0:all").record([{"product_id": 3, "status": "success"}])
+            with path.open("a", encoding="utf-8") as f:
+                f.write('{"run_key": "v1:all", "product_')  # 중단 시점의 잘린 줄
+
+            self.assertEqual(checkpoint.load(), {1})  # 실패한 작품은 재시도 대상
+            with FakeOpenRouter(delay=0.0, fail_once=set()) as base_url:
+                self.module.OPENROUTER_BASE_URL = base_url
+                conn = FakeConnection()
+                with patch("builtins.print"):
+                    success, fail, changed = self.run_pipeline(conn, items, concurrency=3, checkpoint=checkpoint)
+
+            self.assertEqual((success, fail), (5, 0))
+            self.assertEqual(sorted(changed), [2, 3, 4, 5, 6])
+            self.assertEqual(sorted(conn.saved), [2, 3, 4, 5, 6])
+            self.assertFalse(path.exists())  # 정상 종료 시 삭제
+
+    def test_failed_flush_keeps_checkpoint_for_unsaved_results(self):
+        items = products(3)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "checkpoint.jsonl"
+            checkpoint = self.module.ExtractCheckpoint(str(path), "v1:all")
+            with FakeOpenRouter(delay=0.0, fail_once=set()) as base_url:
+                self.module.OPENROUTER_BASE_URL = base_url
+                with patch.object(self.module, "save_results_batch", side_effect=RuntimeError("db down")), \
+                     patch("builtins.print"):
+                    with self.assertRaisesRegex(RuntimeError, "db down"):
+                        self.run_pipeline(FakeConnection(), items, concurrency=2, checkpoint=checkpoint)
+
+            self.assertEqual(checkpoint.load(), set())
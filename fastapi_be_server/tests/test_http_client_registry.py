@@ -0,0 +1,99 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from app.utils import http_client
+from app.utils.http_client import HttpClientRegistry, HttpPoolConfig
+
+
+def _stub_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"path": request.url.path},
+        headers={"set-cookie": "KEYCLOAK_SESSION=abc; Path=/"},
+    )
+
+
+class _StubRegistry(HttpClientRegistry):
+    """실제 네트워크 대신 MockTransport 로 요청을 처리하는 레지스트리"""
+
+    def _build_client(self, name):
+        client, transport = super()._build_client(name)
+        transport._transport = httpx.MockTransport(_stub_handler)
+        return client, transport
+
+
+class HttpClientRegistryTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.registry = _StubRegistry({"keycloak": HttpPoolConfig(timeout=3.0)})
+
+    async def asyncTearDown(self):
+        await self.registry.aclose()
+
+    async def test_same_client_is_reused_per_provider(self):
+        first = self.registry.get("keycloak")
+        second = self.registry.get("keycloak")
+        other = self.registry.get("gemini")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.timeout.read, 3.0)
+
+    async def test_metrics_count_requests(self):
+        client = self.registry.get("keycloak")
+        await asyncio.gather(*[client.get("https://kc.test/userinfo") for _ in range(5)])
+
+        metrics = self.registry.metrics()["keycloak"]
+        self.assertEqual(metrics["requests_total"], 5)
+        self.assertEqual(metrics["errors_total"], 0)
+        self.assertEqual(metrics["in_flight"], 0)
+        self.assertEqual(metrics["clients_created"], 1)
+
+    async def test_response_cookies_are_not_shared(self):
+        client = self.registry.get("keycloak")
+        await client.get("https://kc.test/token")
+
+        self.assertEqual(len(client.cookies.jar), 0)
+
+    async def test_closed_client_is_rebuilt(self):
+        client = self.registry.get("keycloak")
+        await self.registry.aclose()
+
+        self.assertTrue(client.is_closed)
+        rebuilt = self.registry.get("keycloak")
+        self.assertIsNot(client, rebuilt)
+        self.assertEqual(self.registry.metrics()["keycloak"]["clients_created"], 2)
+
+
+class Http2SupportTest(unittest.TestCase):
+    def test_http2_pools_without_h2_are_reported(self):
+        registry = HttpClientRegistry(
+            {"gemini": HttpPoolConfig(http2=True), "keycloak": HttpPoolConfig()}
+        )
+        with patch.object(http_client.settings, "HTTP_POOL_HTTP2_ENABLED", True):
+            with patch.object(http_client, "_H2_AVAILABLE", False):
+                self.assertEqual(registry.http2_downgraded_pools(), ["gemini"])
+                with patch.object(http_client, "http_client_registry", registry), \
+                        self.assertLogs(http_client.logger, "WARNING"):
+                    http_client.check_http2_support()
+            with patch.object(http_client, "_H2_AVAILABLE", True):
+                self.assertEqual(registry.http2_downgraded_pools(), [])
+
+
+class HttpClientRegistryLoopTest(unittest.TestCase):
+    def test_new_event_loop_gets_new_client(self):
+        registry = _StubRegistry()
+
+        async def get_client():
+            return registry.get("r2")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        self.assertIsNot(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import unittest
+from datetime import datetime, timedelta
+
+from app.services.ai import recommendation_service
+from app.services.ai.product_ai_metadata_index import ProductAiMetadataIndex
+
+
+def _row(product_id, eligible="Y", ratings_code="all", tags=("회귀",), count_hit=0):
+    return {
+        "product_id": product_id,
+        "title": f"작품{product_id}",
+        "ratings_code": ratings_code,
+        "count_hit": count_hit,
+        "taste_tags": json.dumps(list(tags), ensure_ascii=False),
+        "themes": "[]",
+        "raw_analysis": json.dumps({"large": "x" * 100}),
+        "index_eligible_yn": eligible,
+    }
+
+
+class _FakeCatalog:
+    """loader 대역: 전체/증분 조회 구분과 호출 횟수 기록"""
+
+    def __init__(self, rows):
+        self.rows = {row["product_id"]: row for row in rows}
+        self.changed: list[dict] = []
+        self.now = datetime(2026, 1, 1, 0, 0, 0)
+        self.calls: list = []
+        self.fail = False
+
+    async def load(self, db, since):
+        self.calls.append(since)
+        await asyncio.sleep(0)
+        if self.fail:
+            raise OSError("db unavailable")
+        checked_at = self.now
+        if since is None:
+            rows = [row for row in self.rows.values() if row["index_eligible_yn"] == "Y"]
+        else:
+            rows, self.changed = self.changed, []
+        return rows, checked_at
+
+
+def _index(catalog, **kwargs):
+    kwargs.setdefault("refresh_interval", 0)
+    kwargs.setdefault("full_reload_interval", 3600)
+    kwargs.setdefault("overlap_seconds", 5)
+    return ProductAiMetadataIndex(
+        loader=catalog.load,
+        parse_row=recommendation_service._metadata_row_to_dict,
+        **kwargs,
+    )
+
+
+class ProductAiMetadataIndexTest(unittest.IsolatedAsyncioTestCase):
+    async def test_first_load_parses_once_and_filters_ratings(self):
+        catalog = _FakeCatalog([_row(1), _row(2, ratings_code="adult"), _row(3, eligible="N")])
+        index = _index(catalog, refresh_interval=60)
+
+        all_age = await index.get_all(None, adult_yn="N")
+        everything = await index.get_all(None, adult_yn="Y")
+
+        self.assertEqual(len(catalog.calls), 1)
+        self.assertEqual([row["product_id"] for row in all_age], [1])
+        self.assertEqual([row["product_id"] for row in everything], [1, 2])
+        self.assertEqual(all_age[0]["taste_tags"], ["회귀"])
+        self.assertNotIn("raw_analysis", all_age[0])
+        self.assertNotIn("index_eligible_yn", all_age[0])
+        # 같은 version 이면 파싱된 dict 를 재사용
+        self.assertIs((await index.get_all(None))[0], all_age[0])
+
+    async def test_incremental_refresh_updates_adds_and_removes(self):
+        catalog = _FakeCatalog([_row(1), _row(2), _row(3)])
+        index = _index(catalog)
+        await index.get_all(None)
+        version = index.version
+
+        catalog.now += timedelta(minutes=1)
+        catalog.changed = [
+            _row(1, tags=("복수",)),
+            _row(2, eligible="N"),
+            _row(4, ratings_code="adult"),
+        ]
+        rows = await index.get_all(None, adult_yn="Y")
+
+        self.assertEqual(catalog.calls[-1], datetime(2026, 1, 1) - timedelta(seconds=5))
+        self.assertEqual([row["product_id"] for row in rows], [1, 3, 4])
+        self.assertEqual(rows[0]["taste_tags"], ["복수"])
+        self.assertEqual(index.version, version + 1)
+        self.assertEqual(index.metrics()["incremental_loads"], 1)
+
+        # 겹침 구간에서 같은 내용이 다시 와도 version 은 그대로
+        catalog.changed = [_row(1, tags=("복수",))]
+        await index.get_all(None)
+        self.assertEqual(index.version, version + 1)
+
+    async def test_concurrent_requests_share_one_load_and_failures_keep_index(self):
+        catalog = _FakeCatalog([_row(1), _row(2)])
+        index = _index(catalog, refresh_interval=60)
+
+        results = await asyncio.gather(*(index.get_all(None) for _ in range(10)))
+        self.assertEqual(len(catalog.calls), 1)
+        self.assertTrue(all(len(rows) == 2 for rows in results))
+
+        catalog.fail = True
+        self.assertEqual(len(await index.get_all(None)), 2)
+        await index.refresh(None, force=True)
+        self.assertEqual(index.metrics()["failed_loads"], 1)
+        self.assertEqual(len(index.snapshot()), 2)
+
+    async def test_first_load_failure_is_raised(self):
+        catalog = _FakeCatalog([_row(1)])
+        catalog.fail = True
+        index = _index(catalog)
+
+        with self.assertRaises(OSError):
+            await index.get_all(None)
+
+    async def test_full_reload_drops_rows_missed_by_increments(self):
+        catalog = _FakeCatalog([_row(1), _row(2)])
+        index = _index(catalog, full_reload_interval=0)
+        await index.get_all(None)
+
+        # 행 삭제는 증분 조회로 알 수 없으므로 전체 재적재로 반영
+        del catalog.rows[2]
+        rows = await index.get_all(None)
+
+        self.assertEqual([row["product_id"] for row in rows], [1])
+        self.assertEqual(catalog.calls, [None, None])
+        self.assertEqual(index.metrics()["full_loads"], 2)
+
+
+class _Result:
+    def __init__(self, rows=None, scalar=None):
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+
+class _RecordingDb:
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        self.queries.append((sql, params))
+        if "SELECT NOW()" in sql:
+            return _Result(scalar=datetime(2026, 1, 1))
+        return _Result([_row(1)])
+
+
+class MetadataIndexLoaderQueryTest(unittest.IsolatedAsyncioTestCase):
+    async def test_full_and_incremental_queries(self):
+        db = _RecordingDb()
+
+        rows, checked_at = await recommendation_service._load_product_ai_metadata_index_rows(db, None)
+        full_sql, full_params = db.queries[-1]
+        self.assertEqual(checked_at, datetime(2026, 1, 1))
+        self.assertEqual(len(rows), 1)
+        self.assertIn("COALESCE(m.exclude_from_recommend_yn, 'N') = 'N'", full_sql.split("WHERE (")[-1])
+        self.assertNotIn(":since", full_sql)
+        self.assertNotIn("ratings_code = 'all'", full_sql)
+
+        await recommendation_service._load_product_ai_metadata_index_rows(db, datetime(2025, 12, 31))
+        delta_sql, delta_params = db.queries[-1]
+        self.assertIn("m.updated_date > :since", delta_sql)
+        self.assertIn("p.updated_date > :since", delta_sql)
+        self.assertRegex(delta_sql, r"tb_product_engagement_metrics\s+WHERE updated_date > :since")
+        self.assertIn("AS index_eligible_yn", delta_sql)
+        self.assertEqual(delta_params, {"since": datetime(2025, 12, 31)})
+
+
+if __name__ == "__main__":
+    unittest.main()
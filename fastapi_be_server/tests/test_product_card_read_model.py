@@ -0,0 +1,223 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from app.services.admin import admin_user_service
+from app.services.product import product_service
+from app.services.product.product_card_service import (
+    PRODUCT_CARD_COLUMNS,
+    ProductCardRefresher,
+    check_product_card_consistency,
+)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeCardDb:
+    """재계산 요청 product_id 와 sweep 커서를 기록하는 DB"""
+
+    def __init__(self, product_ids=(), episode_products=None):
+        self.product_ids = sorted(product_ids)
+        self.episode_products = episode_products or {}
+        self.refreshed: list[list[int]] = []
+        self.commits = 0
+        self.fail = False
+
+    def session(self):
+        return _FakeCardSession(self)
+
+
+class _FakeCardSession:
+    def __init__(self, db: _FakeCardDb):
+        self.db = db
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, query, params=None):
+        if self.db.fail:
+            raise OSError("db unavailable")
+        sql = str(query)
+        if "INSERT INTO tb_product_card_summary" in sql:
+            self.db.refreshed.append(list(params["product_ids"]))
+            return _FakeResult([])
+        if "FROM tb_product_episode" in sql and "episode_ids" in params:
+            return _FakeResult(
+                [
+                    {"product_id": self.db.episode_products[eid]}
+                    for eid in params["episode_ids"]
+                    if eid in self.db.episode_products
+                ]
+            )
+        rows = [pid for pid in self.db.product_ids if pid > params["cursor"]]
+        return _FakeResult([{"product_id": pid} for pid in rows[: params["limit"]]])
+
+    async def commit(self):
+        self.db.commits += 1
+
+
+class _FakeConsistencyDb:
+    def __init__(self, live_rows, card_rows):
+        self.live_rows = live_rows
+        self.card_rows = card_rows
+
+    async def execute(self, query, params=None):
+        rows = self.card_rows if "FROM tb_product_card_summary" in str(query) else self.live_rows
+        return _FakeResult([row for row in rows if row["product_id"] in params["product_ids"]])
+
+
+def _card_row(product_id, **values):
+    row = {column: 0 for column in PRODUCT_CARD_COLUMNS}
+    row.update(product_id=product_id, **values)
+    return row
+
+
+class ProductCardSelectTest(unittest.TestCase):
+    def test_read_model_replaces_live_aggregate_joins(self):
+        with patch.object(product_service.settings, "PRODUCT_CARD_READ_MODEL_ENABLED", True):
+            bundle = product_service.get_select_fields_and_joins_for_product(user_id=1)
+
+        self.assertIn("tb_product_card_summary pcs", bundle["joins"])
+        self.assertIn("pcs.episode_count", bundle["select_fields"])
+        self.assertNotIn("tb_product_order po", bundle["joins"])
+        self.assertNotIn("tb_batch_daily_product_count_summary", bundle["joins"])
+
+    def test_live_joins_when_read_model_disabled(self):
+        with patch.object(product_service.settings, "PRODUCT_CARD_READ_MODEL_ENABLED", False):
+            bundle = product_service.get_select_fields_and_joins_for_product(user_id=1)
+
+        self.assertNotIn("pcs.", bundle["select_fields"])
+        self.assertIn("ep_count.episode_count", bundle["select_fields"])
+        self.assertIn("tb_product_order po", bundle["joins"])
+
+    def test_interest_fields_reuse_usage_join(self):
+        bundle = product_service.get_select_fields_and_joins_for_product(user_id=1)
+
+        self.assertIn("DATE_ADD(readed_count.updated_date, INTERVAL 3 DAY)", bundle["select_fields"])
+        self.assertNotIn("upu2", bundle["select_fields"])
+
+
+class ProductCardRefresherTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.db = _FakeCardDb(product_ids=range(1, 6), episode_products={100: 3})
+
+    def _refresher(self, **kwargs):
+        options = {
+            "session_factory": self.db.session,
+            "flush_interval": 60,
+            "sweep_batch_size": 2,
+            "enabled": True,
+        }
+        options.update(kwargs)
+        refresher = ProductCardRefresher(**options)
+        # 루프 없이 dirty 표시만 받도록 실행 중 상태로 둠
+        refresher._task = asyncio.get_running_loop().create_future()
+        return refresher
+
+    async def test_dirty_products_are_rechecked_once(self):
+        refresher = self._refresher(sweep_batch_size=0)
+        refresher.mark_products([1, 2])
+        refresher.mark_episodes([100])
+
+        self.assertEqual(await refresher.flush(), 3)
+        self.assertEqual(self.db.refreshed, [[1, 2, 3]])
+
+        # 직전 주기 dirty 작품은 한 번 더, 그 다음 주기에는 재계산하지 않음
+        self.assertEqual(await refresher.flush(), 3)
+        self.assertEqual(await refresher.flush(), 0)
+        self.assertEqual(len(self.db.refreshed), 2)
+
+    async def test_sweep_walks_products_and_wraps_around(self):
+        refresher = self._refresher()
+
+        for _ in range(4):
+            await refresher.flush()
+
+        self.assertEqual(self.db.refreshed, [[1, 2], [3, 4], [5], [1, 2]])
+
+    async def test_failed_flush_restores_dirty_products(self):
+        refresher = self._refresher(sweep_batch_size=0)
+        refresher.mark_products([4])
+        self.db.fail = True
+
+        self.assertEqual(await refresher.flush(), 0)
+        self.assertEqual(refresher.failed_flush_count, 1)
+
+        self.db.fail = False
+        await refresher.flush()
+        self.assertEqual(self.db.refreshed, [[4]])
+
+    async def test_marks_are_ignored_without_refresh_loop(self):
+        refresher = ProductCardRefresher(session_factory=self.db.session, enabled=True)
+        refresher.mark_products([1])
+
+        self.assertEqual(refresher.metrics()["dirty_products"], 0)
+
+    async def test_start_stop_drains_pending(self):
+        refresher = ProductCardRefresher(
+            session_factory=self.db.session, flush_interval=60, sweep_batch_size=2, enabled=True
+        )
+        await refresher.start()
+        refresher.mark_products([5])
+        await refresher.stop()
+
+        self.assertFalse(refresher.is_running)
+        # 종료 시에는 sweep 없이 dirty 작품만 반영
+        self.assertEqual(self.db.refreshed, [[5]])
+
+
+class ProductCardConsistencyTest(unittest.IsolatedAsyncioTestCase):
+    async def test_detects_stale_and_missing_cards(self):
+        db = _FakeConsistencyDb(
+            live_rows=[_card_row(1, episode_count=3), _card_row(2), _card_row(3)],
+            card_rows=[_card_row(1, episode_count=2), _card_row(2)],
+        )
+
+        mismatches = await check_product_card_consistency([1, 2, 3], db)
+
+        self.assertEqual(
+            mismatches,
+            [
+                {"product_id": 1, "column": "episode_count", "expected": 3, "actual": 2},
+                {"product_id": 3, "column": None, "expected": None, "actual": None},
+            ],
+        )
+
+
+class _FakePaidApplyDb:
+    """유료 전환 신청 1건을 돌려주고 실행한 쿼리를 기록하는 DB"""
+
+    def __init__(self, apply_row):
+        self.apply_row = apply_row
+        self.statements: list[str] = []
+
+    async def execute(self, query, params=None):
+        self.statements.append(str(query))
+        return _FakeResult([self.apply_row])
+
+
+class PaidApplyCardHookTest(unittest.IsolatedAsyncioTestCase):
+    async def test_deny_marks_product_card_dirty(self):
+        db = _FakePaidApplyDb({"id": 9, "product_id": 42, "status_code": "review"})
+
+        with patch.object(admin_user_service, "mark_product_cards_dirty") as mark:
+            await admin_user_service.deny_apply_rank_up(9, db)
+
+        self.assertIn("status_code = 'denied'", db.statements[-1])
+        mark.assert_called_once_with(42)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.services.product import product_service
+from app.services.product.product_list_cache import (
+    ProductListCache,
+    apply_user_overlay,
+    fetch_user_product_overlay,
+)
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeListDb:
+    """전역 목록 쿼리와 사용자 overlay 쿼리를 구분해 응답하는 DB"""
+
+    def __init__(self, product_ids=(1, 2, 3), overlay=None):
+        self.product_ids = product_ids
+        # user_id -> {product_id: overlay 값}
+        self.overlay = overlay or {}
+        self.global_queries = []
+        self.overlay_queries = []
+        self.rank_generation = 1
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        if "tb_batch_generation" in sql:
+            return _FakeResult([self.rank_generation])
+        if "tb_user_ticketbook" in sql:
+            self.overlay_queries.append(params)
+            user_overlay = self.overlay.get(params["user_id"], {})
+            return _FakeResult(
+                [
+                    {"product_id": pid, **user_overlay[pid]}
+                    for pid in params["product_ids"]
+                    if pid in user_overlay
+                ]
+            )
+        self.global_queries.append(sql)
+        return _FakeResult(
+            [
+                {"productId": pid, "title": f"작품{pid}", "bookmarkYn": "N", "readedEpisodeCount": 0}
+                for pid in self.product_ids
+            ]
+        )
+
+
+class UserOverlayTest(unittest.IsolatedAsyncioTestCase):
+    async def test_overlay_is_one_keyed_query_for_visible_products(self):
+        db = _FakeListDb(overlay={7: {2: {"bookmarkYn": "Y", "readedEpisodeCount": 4}}})
+
+        overlay = await fetch_user_product_overlay(7, [3, 2, 2, 1], db)
+
+        self.assertEqual(db.overlay_queries, [{"user_id": 7, "product_ids": [1, 2, 3]}])
+        self.assertEqual(overlay, {2: {"bookmarkYn": "Y", "readedEpisodeCount": 4}})
+
+    async def test_guest_skips_overlay_query(self):
+        db = _FakeListDb()
+
+        self.assertEqual(await fetch_user_product_overlay(-1, [1], db), {})
+        self.assertEqual(await fetch_user_product_overlay(None, [1], db), {})
+        self.assertEqual(db.overlay_queries, [])
+
+    def test_apply_overlay_defaults_missing_products(self):
+        rows = [{"productId": 1, "bookmarkYn": "Y"}, {"productId": 2}]
+
+        merged = apply_user_overlay(rows, {2: {"bookmarkYn": "Y", "readedEpisodeCount": 3}})
+
+        self.assertEqual(merged[0]["bookmarkYn"], "N")
+        self.assertEqual(merged[0]["interestStatus"], "no_interest")
+        self.assertEqual(merged[1]["readedEpisodeCount"], 3)
+        # 원본(캐시) 행은 수정하지 않음
+        self.assertEqual(rows[0]["bookmarkYn"], "Y")
+
+
+class ProductListCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_misses_share_one_load(self):
+        cache = ProductListCache(ttl=60, max_entries=10, enabled=True)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"productId": 1}]
+
+        results = await asyncio.gather(*(cache.get_or_load("q", loader) for _ in range(5)))
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(all(rows == [{"productId": 1}] for rows in results))
+        results[0][0]["productId"] = 99
+        self.assertEqual(await cache.get_or_load("q", loader), [{"productId": 1}])
+
+    async def test_expired_and_evicted_entries_reload(self):
+        cache = ProductListCache(ttl=60, max_entries=1, enabled=True)
+        loader = AsyncMock(return_value=[{"productId": 1}])
+
+        await cache.get_or_load("a", loader)
+        await cache.get_or_load("b", loader)
+        await cache.get_or_load("a", loader)
+        self.assertEqual(loader.await_count, 3)
+
+        cache.ttl = 0
+        await cache.get_or_load("c", loader)
+        await cache.get_or_load("c", loader)
+        self.assertEqual(loader.await_count, 5)
+
+    async def test_failed_load_is_not_cached(self):
+        cache = ProductListCache(ttl=60, max_entries=10, enabled=True)
+        loader = AsyncMock(side_effect=[OSError("db unavailable"), [{"productId": 1}]])
+
+        with self.assertRaises(OSError):
+            await cache.get_or_load("q", loader)
+        self.assertEqual(await cache.get_or_load("q", loader), [{"productId": 1}])
+
+
+class ProductsAllOverlayTest(unittest.IsolatedAsyncioTestCase):
+    async def _products_all(self, db, user_id):
+        with (
+            patch.object(product_service, "get_user_id", AsyncMock(return_value=user_id)),
+            patch.object(
+                product_service.statistics_service,
+                "insert_site_statistics_logs",
+                AsyncMock(),
+            ),
+            patch.object(product_service, "convert_product_data", lambda row: row),
+        ):
+            return await product_service.products_all(
+                price_type="free",
+                product_type=None,
+                product_state=None,
+                page=1,
+                limit=25,
+                kc_user_id="kc",
+                db=db,
+            )
+
+    async def test_global_rows_are_shared_between_users(self):
+        cache = ProductListCache(ttl=60, max_entries=10, enabled=True)
+        db = _FakeListDb(overlay={7: {2: {"bookmarkYn": "Y"}}, 8: {3: {"readedEpisodeCount": 5}}})
+
+        with patch.object(product_service, "product_list_cache", cache):
+            user7 = await self._products_all(db, 7)
+            user8 = await self._products_all(db, 8)
+            guest = await self._products_all(db, -1)
+
+        self.assertEqual(len(db.global_queries), 1)
+        self.assertNotIn("tb_user_ticketbook", db.global_queries[0])
+        self.assertNotIn("tb_user_bookmark", db.global_queries[0])
+        self.assertEqual(len(db.overlay_queries), 2)
+        self.assertEqual(cache.metrics()["hits"], 2)
+
+        self.assertEqual([row["bookmarkYn"] for row in user7["data"]], ["N", "Y", "N"])
+        self.assertEqual([row["readedEpisodeCount"] for row in user8["data"]], [0, 0, 5])
+        self.assertEqual([row["bookmarkYn"] for row in guest["data"]], ["N", "N", "N"])
+
+
+if __name__ == "__main__":
+    unittest.main()
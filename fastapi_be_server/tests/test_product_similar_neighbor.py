@@ -0,0 +1,331 @@
+import importlib.util
+import json
+import random
+import unittest
+from datetime import datetime
+
+from sqlalchemy.exc import OperationalError
+
+from app.services.ai import ai_chat_service, product_similar_neighbor
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+
+_TAGS = ["회귀", "복수", "각성자", "마나", "게이트", "게임", "순애", "느와르", "감성", "아카데미", " "]
+_WORDS = ["회귀한", "검사", "복수", "황녀", "게이트", "탑을", "오르는", "마왕", "학원", "천재"]
+
+
+def _random_product(rnd: random.Random, product_id: int) -> dict:
+    return {
+        "product_id": product_id,
+        "worldview_tags": rnd.sample(_TAGS, rnd.randint(0, 3)),
+        "protagonist_type_tags": rnd.sample(_TAGS, rnd.randint(0, 2)),
+        "protagonist_job_tags": rnd.sample(_TAGS, rnd.randint(0, 2)),
+        "protagonist_material_tags": rnd.sample(_TAGS, rnd.randint(0, 3)),
+        "axis_romance_tags": rnd.sample(_TAGS, rnd.randint(0, 1)),
+        "axis_style_tags": rnd.sample(_TAGS, rnd.randint(0, 2)),
+        "protagonist_goal_primary": rnd.choice(["복수", "성장", "생존", "", None]),
+        "mood": rnd.choice(["어두운", "밝은", " 긴장감 ", ""]),
+        "pacing": rnd.choice(["fast", "medium", "slow", None]),
+        "premise": " ".join(rnd.choices(_WORDS, k=rnd.randint(0, 8))),
+        "hook": " ".join(rnd.choices(_WORDS, k=rnd.randint(0, 4))),
+    }
+
+
+def _catalog(seed: int, size: int = 80) -> dict[int, dict]:
+    rnd = random.Random(seed)
+    return {product_id: _random_product(rnd, product_id) for product_id in range(1, size + 1)}
+
+
+def _brute_force(products: dict[int, dict], top_n: int) -> dict[int, list]:
+    expected = {}
+    for product_id, base in products.items():
+        scored = []
+        for candidate_id, candidate in products.items():
+            if candidate_id == product_id:
+                continue
+            score, signals = product_similar_neighbor.compute_content_similarity(base, candidate)
+            if score > 0:
+                scored.append((candidate_id, score, signals))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        expected[product_id] = scored[:top_n]
+    return expected
+
+
+class ContentSimilarityTest(unittest.TestCase):
+    def test_similarity_score_is_content_plus_popularity_and_engagement(self):
+        base = {
+            "worldview_tags": ["게이트", "현대"],
+            "protagonist_type_tags": ["먼치킨"],
+            "mood": "어두운",
+            "premise": "게이트가 열린 현대",
+            "hook": "회귀한 헌터",
+        }
+        candidate = {
+            "worldview_tags": ["게이트"],
+            "protagonist_type_tags": ["먼치킨"],
+            "mood": "어두운",
+            "premise": "현대 게이트",
+            "hook": "",
+            "reading_rate": 0.5,
+            "count_hit": 30000,
+        }
+
+        content, content_signals = product_similar_neighbor.compute_content_similarity(base, candidate)
+        total, signals = ai_chat_service._compute_similarity_score(base, candidate)
+
+        self.assertEqual(content_signals, ["세계관", "주인공 타입", "분위기", "설정/훅"])
+        self.assertEqual(signals[: len(content_signals)], content_signals)
+        self.assertAlmostEqual(content, 0.12 * 0.5 + 0.12 + 0.07 + 0.10 * (1 / 5))
+        self.assertAlmostEqual(total, content + 0.06 * (0.5 * 0.6 + 0.3 * 0.4))
+
+
+class SimilarNeighborBuildTest(unittest.TestCase):
+    def test_index_matches_brute_force_scores_exactly(self):
+        for seed in range(5):
+            products = _catalog(seed)
+            for top_n in (1, 5, 200):
+                self.assertEqual(
+                    product_similar_neighbor.build_similar_neighbors(products, top_n=top_n),
+                    _brute_force(products, top_n),
+                )
+
+    def test_incremental_refresh_matches_full_rebuild(self):
+        for seed in range(8):
+            rnd = random.Random(seed + 100)
+            products = _catalog(seed)
+            top_n = rnd.choice([3, 8])
+            current = product_similar_neighbor.build_similar_neighbors(products, top_n=top_n)
+
+            changed = set(rnd.sample(sorted(products), 4))
+            for product_id in changed:
+                if rnd.random() < 0.25:
+                    # 분석 실패/추천 제외로 대상에서 빠짐
+                    products.pop(product_id)
+                else:
+                    products[product_id] = _random_product(rnd, product_id)
+            # 새 작품 분석
+            new_id = max(changed | set(products)) + 1
+            products[new_id] = _random_product(rnd, new_id)
+            changed.add(new_id)
+
+            updated = product_similar_neighbor.refresh_similar_neighbor_lists(
+                products, current, changed, top_n=top_n
+            )
+            merged = {**current, **updated}
+            merged = {product_id: neighbors for product_id, neighbors in merged.items() if neighbors}
+            expected = {
+                product_id: neighbors
+                for product_id, neighbors in _brute_force(products, top_n).items()
+                if neighbors
+            }
+            self.assertEqual(merged, expected)
+            # 다시 써야 하는 작품만 반환
+            self.assertLess(len(updated), len(products))
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite is not installed")
+class SimilarNeighborTableTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        from sqlalchemy import text
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+        self.text = text
+        self.engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        self.db = AsyncSession(self.engine)
+        await self.db.execute(
+            text(
+                """
+                create table tb_product_ai_metadata (
+                    product_id integer primary key,
+                    analysis_status varchar(20),
+                    exclude_from_recommend_yn varchar(1),
+                    protagonist_goal_primary varchar(50),
+                    mood varchar(50),
+                    pacing varchar(20),
+                    premise text,
+                    hook text,
+                    worldview_tags text,
+                    protagonist_type_tags text,
+                    protagonist_job_tags text,
+                    protagonist_material_tags text,
+                    axis_romance_tags text,
+                    axis_style_tags text
+                )
+                """
+            )
+        )
+        await self.db.execute(
+            text(
+                """
+                create table tb_product_similar_neighbor (
+                    product_id integer not null,
+                    neighbor_product_id integer not null,
+                    rank_no integer not null,
+                    content_score double not null,
+                    matched_signals text,
+                    computed_date datetime not null,
+                    primary key (product_id, neighbor_product_id)
+                )
+                """
+            )
+        )
+        self.products = _catalog(3, size=30)
+        for product in self.products.values():
+            await self._upsert(product)
+        await self.db.commit()
+
+    async def asyncTearDown(self):
+        await self.db.close()
+        await self.engine.dispose()
+
+    async def _upsert(self, product: dict, status: str = "success"):
+        await self.db.execute(
+            self.text("delete from tb_product_ai_metadata where product_id = :product_id"),
+            {"product_id": product["product_id"]},
+        )
+        params = {key: product.get(key) for key in ("product_id", "protagonist_goal_primary", "mood", "pacing", "premise", "hook")}
+        for _, key, _ in product_similar_neighbor.SIMILARITY_AXIS_RULES:
+            params[key] = json.dumps(product.get(key) or [], ensure_ascii=False)
+        params["analysis_status"] = status
+        await self.db.execute(
+            self.text(
+                """
+                insert into tb_product_ai_metadata values (
+                    :product_id, :analysis_status, 'N', :protagonist_goal_primary, :mood, :pacing, :premise, :hook,
+                    :worldview_tags, :protagonist_type_tags, :protagonist_job_tags, :protagonist_material_tags,
+                    :axis_romance_tags, :axis_style_tags
+                )
+                """
+            ),
+            params,
+        )
+
+    async def _stored(self) -> dict[int, list]:
+        return await product_similar_neighbor.load_similar_neighbors(self.db)
+
+    async def _expected(self, top_n: int) -> dict[int, list]:
+        # 저장된 JSON 을 다시 읽은 DNA(빈 라벨 제거) 기준
+        products = await product_similar_neighbor.load_similar_neighbor_products(self.db)
+        return {pid: neighbors for pid, neighbors in _brute_force(products, top_n).items() if neighbors}
+
+    async def test_rebuild_and_refresh_round_trip(self):
+        summary = await product_similar_neighbor.rebuild_all_similar_neighbors(self.db, top_n=5)
+        expected = await self._expected(5)
+        self.assertEqual(await self._stored(), expected)
+        self.assertEqual(summary["products"], 30)
+
+        rows = (
+            await self.db.execute(
+                self.text("select rank_no from tb_product_similar_neighbor where product_id = 1 order by rank_no")
+            )
+        ).scalars().all()
+        self.assertEqual(rows, list(range(1, len(expected[1]) + 1)))
+
+        rnd = random.Random(11)
+        self.products[2] = _random_product(rnd, 2)
+        await self._upsert(self.products[2])
+        failed = self.products.pop(3)
+        await self._upsert(failed, status="failed")
+        await self.db.commit()
+
+        await product_similar_neighbor.refresh_similar_neighbors(self.db, [2, 3], top_n=5)
+        expected = await self._expected(5)
+        self.assertEqual(await self._stored(), expected)
+
+    async def test_full_rebuild_removes_products_out_of_scope(self):
+        await product_similar_neighbor.save_similar_neighbors(
+            self.db, {999: [(1, 0.5, ["분위기"])]}, computed_date=datetime(2020, 1, 1)
+        )
+        await self.db.commit()
+
+        await product_similar_neighbor.rebuild_all_similar_neighbors(self.db, top_n=3)
+
+        self.assertNotIn(999, await self._stored())
+
+
+class _Mappings:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+    def one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return _Mappings(self._rows)
+
+
+class _SimilarDb:
+    def __init__(self, *, neighbor_rows=None, popular_rows=None, neighbor_error=False):
+        self.neighbor_rows = neighbor_rows or []
+        self.popular_rows = popular_rows or []
+        self.neighbor_error = neighbor_error
+        self.queries: list[str] = []
+
+    async def execute(self, query, params=None):
+        sql = str(query)
+        if "tb_product_similar_neighbor" in sql:
+            self.queries.append("neighbor")
+            if self.neighbor_error:
+                raise OperationalError(sql, params, Exception("no such table"))
+            return _Result(self.neighbor_rows)
+        if "LIMIT 120" in sql:
+            self.queries.append("popular")
+            return _Result(self.popular_rows)
+        self.queries.append("base")
+        return _Result([{"product_id": 1, "title": "기준", "mood": "어두운", "worldview_tags": '["게이트"]'}])
+
+
+def _candidate(product_id: int, **overrides) -> dict:
+    row = {
+        "product_id": product_id,
+        "title": f"작품{product_id}",
+        "mood": "어두운",
+        "worldview_tags": '["게이트"]',
+        "reading_rate": 0.1,
+        "count_hit": 10,
+    }
+    row.update(overrides)
+    return row
+
+
+class GetSimilarProductsNeighborTest(unittest.IsolatedAsyncioTestCase):
+    async def test_serves_from_neighbor_rows_when_enough(self):
+        db = _SimilarDb(
+            neighbor_rows=[_candidate(pid) for pid in (5, 6, 7)],
+            popular_rows=[_candidate(pid) for pid in (8, 9, 10)],
+        )
+
+        base, items = await ai_chat_service.get_similar_products(db, base_product_id=1, limit=3)
+
+        self.assertEqual(base["product_id"], 1)
+        self.assertEqual(db.queries, ["base", "neighbor"])
+        self.assertEqual(sorted(item["product_id"] for item in items), [5, 6, 7])
+
+    async def test_tops_up_surviving_neighbors_with_popular_candidates(self):
+        few = _SimilarDb(
+            neighbor_rows=[_candidate(5)],
+            popular_rows=[_candidate(pid) for pid in (5, 8, 9, 10)],
+        )
+        _, items = await ai_chat_service.get_similar_products(few, base_product_id=1, limit=3)
+        self.assertEqual(few.queries, ["base", "neighbor", "popular"])
+        # 남은 이웃을 앞에 두고, 인기 후보는 중복을 빼고 남은 자리만 채운다
+        self.assertEqual(items[0]["product_id"], 5)
+        self.assertEqual(len({item["product_id"] for item in items}), 3)
+        self.assertTrue({item["product_id"] for item in items[1:]} <= {8, 9, 10})
+
+        missing_table = _SimilarDb(neighbor_error=True, popular_rows=[_candidate(8)])
+        _, items = await ai_chat_service.get_similar_products(missing_table, base_product_id=1, limit=1)
+        self.assertEqual(missing_table.queries, ["base", "neighbor", "popular"])
+        self.assertEqual([item["product_id"] for item in items], [8])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import asyncio
+import importlib.util
+import os
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services.product.rank_generation import RankGenerationTracker
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _batch_sql() -> str:
+    return (ROOT / "dist" / "batch" / "service_reset_hourly_batch.sql").read_text(
+        encoding="utf-8"
+    )
+
+
+class RankSwapBatchSqlTest(unittest.TestCase):
+    def test_live_rank_tables_are_never_emptied(self):
+        sql = _batch_sql()
+
+        self.assertIsNone(re.search(r"DELETE FROM tb_product_rank(_area)?\s*;", sql))
+        self.assertNotIn("insert into tb_product_rank (", sql)
+        self.assertNotIn("insert into tb_product_rank_area (", sql)
+        self.assertEqual(sql.count("insert into tb_product_rank_next ("), 2)
+        self.assertEqual(sql.count("insert into tb_product_rank_area_next ("), 5)
+        self.assertIn("CREATE TABLE tb_product_rank_next LIKE tb_product_rank;", sql)
+        self.assertIn("CREATE TABLE tb_product_rank_area_next LIKE tb_product_rank_area;", sql)
+        # 시간별 스냅샷은 이번에 계산한 랭킹 기준
+        self.assertIn("FROM tb_product_rank_area_next r", sql)
+
+    def test_swap_is_single_rename_after_commit_then_generation_bump(self):
+        sql = _batch_sql()
+        renames = re.findall(r"^RENAME TABLE [^;]+;", sql, re.MULTILINE)
+        self.assertEqual(len(renames), 1)
+        rename = renames[0]
+
+        for pair in (
+            "tb_product_rank TO tb_product_rank_old",
+            "tb_product_rank_next TO tb_product_rank",
+            "tb_product_rank_area TO tb_product_rank_area_old",
+            "tb_product_rank_area_next TO tb_product_rank_area",
+        ):
+            self.assertIn(pair, rename)
+
+        commit_at = sql.index("\ncommit;")
+        rename_at = sql.index(rename)
+        generation_at = sql.index("INSERT INTO tb_batch_generation")
+        self.assertLess(commit_at, rename_at)
+        self.assertLess(rename_at, generation_at)
+        self.assertIn("generation = generation + 1", sql[generation_at:])
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite 미설치")
+class RankSwapConcurrencyTest(unittest.IsolatedAsyncioTestCase):
+    """
+    배치와 같은 순서(shadow 테이블 재계산 -> 한 트랜잭션으로 이름 교체 -> 세대 증가)를
+    SQLite(WAL) 에서 재현하고, 동시에 랭킹을 읽는 조회가 빈/섞인 랭킹을 보지 않는지 확인
+    """
+
+    RANK_SIZE = 50
+
+    async def asyncSetUp(self):
+        import aiosqlite
+
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.aiosqlite = aiosqlite
+        async with aiosqlite.connect(self.db_path, isolation_level=None) as conn:
+            await conn.execute("PRAGMA journal_mode=WAL")
+            await conn.execute(
+                "create table tb_product_rank (product_id integer, current_rank integer, generation integer)"
+            )
+            await conn.execute(
+                "create table tb_batch_generation (generation_key text primary key, generation integer)"
+            )
+            await conn.execute("insert into tb_batch_generation values ('product_rank', 0)")
+            await conn.executemany(
+                "insert into tb_product_rank values (?, ?, 0)",
+                [(idx, idx) for idx in range(1, self.RANK_SIZE + 1)],
+            )
+
+    async def asyncTearDown(self):
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.db_path + suffix):
+                os.remove(self.db_path + suffix)
+
+    async def _rebuild(self, generation: int) -> None:
+        async with self.aiosqlite.connect(self.db_path, isolation_level=None) as conn:
+            await conn.execute("drop table if exists tb_product_rank_next")
+            await conn.execute(
+                "create table tb_product_rank_next (product_id integer, current_rank integer, generation integer)"
+            )
+            # 재계산은 여러 번에 나눠 적재(라이브 테이블은 그대로)
+            for start in range(0, self.RANK_SIZE, 10):
+                await conn.executemany(
+                    "insert into tb_product_rank_next values (?, ?, ?)",
+                    [
+                        (generation * 1000 + idx, idx, generation)
+                        for idx in range(start + 1, start + 11)
+                    ],
+                )
+                await asyncio.sleep(0)
+
+            await conn.execute("begin immediate")
+            await conn.execute("alter table tb_product_rank rename to tb_product_rank_old")
+            await conn.execute("alter table tb_product_rank_next rename to tb_product_rank")
+            await conn.execute("commit")
+            await conn.execute("drop table tb_product_rank_old")
+            await conn.execute(
+                "update tb_batch_generation set generation = generation + 1 where generation_key = 'product_rank'"
+            )
+
+    async def _reader(self, stop: asyncio.Event, observations: list) -> None:
+        async with self.aiosqlite.connect(self.db_path, isolation_level=None) as conn:
+            while not stop.is_set():
+                async with conn.execute(
+                    "select count(*), count(distinct generation), min(generation) from tb_product_rank"
+                ) as cursor:
+                    observations.append(await cursor.fetchone())
+                await asyncio.sleep(0)
+
+    async def test_concurrent_readers_never_see_empty_or_mixed_ranking(self):
+        stop = asyncio.Event()
+        observations = []
+        readers = [
+            asyncio.create_task(self._reader(stop, observations)) for _ in range(4)
+        ]
+        try:
+            for generation in range(1, 6):
+                await self._rebuild(generation)
+        finally:
+            stop.set()
+            await asyncio.gather(*readers)
+
+        self.assertGreater(len(observations), 20)
+        for count, distinct_generations, _ in observations:
+            self.assertEqual(count, self.RANK_SIZE)
+            self.assertEqual(distinct_generations, 1)
+        self.assertEqual(observations[-1][2], 5)
+
+
+class _FakeScalarResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class _GenerationDb:
+    def __init__(self, generation):
+        self.generation = generation
+        self.reads = 0
+        self.fail = False
+
+    async def execute(self, query, params=None):
+        self.reads += 1
+        if self.fail:
+            raise OSError("db unavailable")
+        await asyncio.sleep(0)
+        return _FakeScalarResult(self.generation)
+
+
+class RankGenerationTrackerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_invalidates_once_per_generation(self):
+        tracker = RankGenerationTracker(check_interval=0)
+        invalidations = []
+        tracker.subscribe(lambda: invalidations.append(tracker.generation))
+        db = _GenerationDb(3)
+
+        # 처음 읽은 세대는 기준값으로만 기록
+        await tracker.refresh(db)
+        self.assertEqual(invalidations, [])
+
+        db.generation = 4
+        await asyncio.gather(*(tracker.refresh(db, force=True) for _ in range(5)))
+        await tracker.refresh(db)
+
+        self.assertEqual(invalidations, [4])
+        self.assertEqual(tracker.metrics()["invalidations"], 1)
+
+    async def test_check_interval_limits_reads_and_failures_keep_generation(self):
+        tracker = RankGenerationTracker(check_interval=60)
+        db = _GenerationDb(7)
+
+        await asyncio.gather(*(tracker.refresh(db) for _ in range(10)))
+        self.assertEqual(db.reads, 1)
+
+        db.fail = True
+        self.assertEqual(await tracker.refresh(db, force=True), 7)
+        self.assertEqual(tracker.metrics()["failed_checks"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import rdb
+from app.routers.common import statistics_query
+from app.routers.partner import partner_query
+from app.routers.product import product_query
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+
+
+def _route_dependencies(router, path: str) -> set:
+    for route in router.routes:
+        if route.path == path:
+            return {dep.call for dep in route.dependant.dependencies}
+    raise AssertionError(f"route not found: {path}")
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite 미설치")
+class ReadReplicaEngineTest(unittest.IsolatedAsyncioTestCase):
+    """replica stand-in 으로 SQLite 파일 DB 를 사용"""
+
+    async def asyncSetUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite+aiosqlite:///{self.db_path}"
+
+        primary = create_async_engine(url)
+        async with primary.begin() as conn:
+            await conn.execute(text("create table tb_product (product_id integer, title text)"))
+            await conn.execute(text("insert into tb_product values (1, '작품')"))
+        await primary.dispose()
+
+        self.read_engine = rdb.create_read_db_engine(url)
+
+    async def asyncTearDown(self):
+        await self.read_engine.dispose()
+        os.remove(self.db_path)
+
+    async def test_reads_are_served(self):
+        async with self.read_engine.connect() as conn:
+            result = await conn.execute(text("select title from tb_product"))
+
+            self.assertEqual(result.scalar(), "작품")
+
+    async def test_writes_are_rejected(self):
+        async with self.read_engine.connect() as conn:
+            with self.assertRaises(OperationalError):
+                await conn.execute(text("update tb_product set title = 'x'"))
+
+
+class _FakeSession:
+    def __init__(self):
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def commit(self):
+        self.commits += 1
+
+
+class ReadSessionDependencyTest(unittest.IsolatedAsyncioTestCase):
+    async def _drain(self, dependency):
+        gen = dependency()
+        session = await gen.__anext__()
+        with self.assertRaises(StopAsyncIteration):
+            await gen.__anext__()
+        return session
+
+    async def test_read_session_skips_commit(self):
+        with patch.object(rdb, "likenovel_read_db_session", _FakeSession):
+            session = await self._drain(rdb.get_likenovel_read_db)
+
+        self.assertEqual(session.commits, 0)
+
+    async def test_primary_session_still_commits(self):
+        with patch.object(rdb, "likenovel_db_session", _FakeSession):
+            session = await self._drain(rdb.get_likenovel_db)
+
+        self.assertEqual(session.commits, 1)
+
+    def test_falls_back_to_primary_without_replica(self):
+        if rdb.settings.LIKENOVEL_READ_DB_URL:
+            self.skipTest("replica 설정됨")
+
+        self.assertIs(rdb.likenovel_read_db_engine, rdb.likenovel_db_engine)
+
+
+class ReadRoutingTest(unittest.TestCase):
+    def test_report_routers_use_read_session(self):
+        self.assertIn(
+            rdb.get_likenovel_read_db,
+            _route_dependencies(statistics_query.router, "/statistics/site"),
+        )
+        for route in partner_query.router.routes:
+            calls = {dep.call for dep in route.dependant.dependencies}
+            self.assertNotIn(rdb.get_likenovel_db, calls, route.path)
+
+    def test_product_rank_uses_read_session_and_writes_stay_on_primary(self):
+        self.assertIn(
+            rdb.get_likenovel_read_db,
+            _route_dependencies(product_query.router, "/products/rank"),
+        )
+        # 조회 로그/조회수를 기록하는 상세 API 는 primary 유지
+        self.assertIn(
+            rdb.get_likenovel_db,
+            _route_dependencies(product_query.router, "/products/{product_id}"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from app.services.ai import recommendation_service
+from app.services.ai.recommendation_scoring import ScoringEngine, top_k_indices
+
+# 축별 허용 라벨(docs/ai-codebook) 일부 + 허용 목록 밖 라벨/공백/빈 라벨
+_TAGS = ["게이트", "게임", "각성자", "마나", "순애", "느와르", "감성", "DJ", "회귀", "암울", "", " 게이트 "]
+_TYPES = ["전략가", "먼치킨", "노력형", "Strategist", None]
+_GOALS = ["생존", "복수", "성공", "", None]
+_MOODS = ["어두운", "밝은", "긴장감", None]
+_WEIGHTS = ["high", "mid", "low", None]
+
+
+def _catalog(size: int, seed: int) -> list[dict]:
+    rnd = random.Random(seed)
+
+    def tags(max_size: int) -> list[str]:
+        # 중복/공백/빈 라벨 포함
+        return [rnd.choice(_TAGS) for _ in range(rnd.randint(0, max_size))]
+
+    products = []
+    for idx in range(size):
+        products.append({
+            "product_id": None if idx % 97 == 5 else idx + 1,
+            "protagonist_type": rnd.choice(_TYPES),
+            "protagonist_desc": rnd.choice([None, f"설명{idx}"]),
+            "premise": f"설정{idx}",
+            "protagonist_goal_primary": rnd.choice(_GOALS),
+            "goal_confidence": rnd.choice([None, 0.3, 0.58, 0.7, 1.0]),
+            "overall_confidence": rnd.choice([None, 0.5, 0.6, 0.83, 1.0]),
+            "mood": rnd.choice(_MOODS),
+            "romance_chemistry_weight": rnd.choice(_WEIGHTS),
+            "themes": tags(3),
+            "taste_tags": tags(4),
+            "protagonist_type_tags": tags(2),
+            "protagonist_job_tags": tags(2),
+            "protagonist_material_tags": tags(3),
+            "worldview_tags": tags(3),
+            "axis_romance_tags": tags(1),
+            "axis_style_tags": tags(2),
+            # 동점 정렬 확인용으로 값 범위를 좁게
+            "count_hit": rnd.choice([0, 9, 99, 999, None]),
+            "binge_rate": rnd.choice([0, 0.2, 0.5]),
+            "total_readers": rnd.choice([0, 10, 30]),
+            "dropoff_7d": rnd.choice([0, 3]),
+            "reengage_rate": rnd.choice([0, 0.1]),
+            "avg_speed_cpm": rnd.choice([None, 900, 1300]),
+        })
+    return products
+
+
+def _profile(seed: int) -> tuple[dict, dict]:
+    rnd = random.Random(seed)
+    labels = [tag.strip().lower() for tag in _TAGS if tag.strip()] + ["전략가", "strategist", "high", "복수", "생존"]
+    factor_scores = {
+        factor: {label: rnd.choice([0.0, 0.5, 1.5, 3, 7.2]) for label in rnd.sample(labels, 5)}
+        for factor in ("protagonist", "material", "worldview", "romance", "style", "job", "mood")
+    }
+    profile = {
+        "preferred_protagonist": {"전략가": 3, "먼치킨": "2.5", "노력형": None},
+        "preferred_mood": {"긴장감": 4, "어두운": 1.5},
+        "preferred_themes": {"회귀": 2, "복수": 0.5, "": 1},
+        "preferred_heroine_weight": "high",
+        "taste_tags": ["회귀", "복수", "생존"],
+    }
+    return profile, factor_scores
+
+
+class VectorizedMatchParityTest(unittest.TestCase):
+    """NumPy 경로와 기존 Python 루프 결과(순서/부동소수 값 포함)가 같은지 확인"""
+
+    def setUp(self):
+        patcher = patch.object(recommendation_service, "VECTORIZED_MATCH_MIN_PRODUCTS", 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.engine_patcher = patch.object(
+            recommendation_service,
+            "recommendation_scoring_engine",
+            ScoringEngine(extract=recommendation_service._extract_scoring_features),
+        )
+        self.engine_patcher.start()
+        self.addCleanup(self.engine_patcher.stop)
+
+    def test_axes_parity(self):
+        axis_sets = [
+            ["type"],
+            ["material", "worldview"],
+            ["goal", "job", "goal"],
+            ["romance", "style", "type"],
+            ["unknown"],
+            list(recommendation_service.AXIS_KEYS),
+        ]
+        for seed in range(6):
+            all_dna = _catalog(600, seed)
+            profile, factor_scores = _profile(seed)
+            excluded = {1, 2, 3, 50, "7", 10_000}
+            for axes in axis_sets:
+                for limit in (0, 1, 6, 50, 10_000, -3):
+                    with self.subTest(seed=seed, axes=axes, limit=limit):
+                        expected = recommendation_service._match_products_by_axes_loop(
+                            all_dna, axes, profile, excluded, factor_scores, limit=limit
+                        )
+                        actual = recommendation_service._match_products_by_axes(
+                            all_dna, axes, profile, excluded, factor_scores, limit=limit
+                        )
+                        self.assertEqual(actual, expected)
+
+    def test_axes_parity_without_positive_scores(self):
+        all_dna = _catalog(300, 11)
+        # 사용자 라벨이 없으면 0점 작품을 행동 지표/인기순으로
+        expected = recommendation_service._match_products_by_axes_loop(
+            all_dna, ["worldview"], {}, set(), {}, limit=20
+        )
+        actual = recommendation_service._match_products_by_axes(
+            all_dna, ["worldview"], {}, set(), {}, limit=20
+        )
+        self.assertEqual(len(actual), 20)
+        self.assertEqual(actual, expected)
+
+    def test_dimension_parity(self):
+        dimensions = ["protagonist", " Protagonist", "material", "worldview", "romance", "mood", "theme", "etc"]
+        for seed in range(6):
+            all_dna = _catalog(600, 100 + seed)
+            profile, factor_scores = _profile(seed)
+            read_ids = {4, 5, 6, None}
+            taste_tags = {"회귀", "암울", ""}
+            for dimension in dimensions:
+                for limit in (0, 6, 10_000):
+                    with self.subTest(seed=seed, dimension=dimension, limit=limit):
+                        expected = recommendation_service._match_products_by_dimension_loop(
+                            all_dna, dimension, profile, read_ids, taste_tags, factor_scores, limit=limit
+                        )
+                        actual = recommendation_service._match_products_by_dimension(
+                            all_dna, dimension, profile, read_ids, taste_tags, factor_scores, limit=limit
+                        )
+                        self.assertEqual(actual, expected)
+
+    def test_catalog_encoding_is_reused_and_follows_changed_products(self):
+        engine = recommendation_service.recommendation_scoring_engine
+        all_dna = _catalog(50, 3)
+
+        catalog = engine.catalog(all_dna)
+        self.assertIs(engine.catalog(list(all_dna)), catalog)
+
+        # 색인 갱신처럼 바뀐 작품만 새 dict 로 교체
+        changed = dict(all_dna[0], worldview_tags=["회귀"], overall_confidence=1.0)
+        next_dna = [changed] + all_dna[1:]
+        next_catalog = engine.catalog(next_dna)
+
+        self.assertIsNot(next_catalog, catalog)
+        self.assertIs(next_catalog.features[1], catalog.features[1])
+        self.assertEqual(
+            next_catalog.features[0].weighted_tokens["axis:worldview"], (("회귀", 1.0),)
+        )
+
+
+class TopKIndicesTest(unittest.TestCase):
+    def test_matches_stable_reverse_sort(self):
+        rnd = random.Random(5)
+        primary = np.array([rnd.choice([0.0, 1.0, 2.0]) for _ in range(200)])
+        secondary = np.array([rnd.choice([0.0, 0.5]) for _ in range(200)])
+        mask = np.array([rnd.random() < 0.8 for _ in range(200)])
+
+        expected = sorted(
+            (idx for idx in range(200) if mask[idx]),
+            key=lambda idx: (primary[idx], secondary[idx]),
+            reverse=True,
+        )
+        for limit in (0, 1, 7, 199, 500):
+            self.assertEqual(top_k_indices(mask, [primary, secondary], limit), expected[:limit])
+
+
+if __name__ == "__main__":
+    unittest.main()
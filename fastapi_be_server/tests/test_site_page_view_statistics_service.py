@@ -37,7 +37,7 @@ class FakeDb:
     async def execute(self, query, params=None):
         sql = str(query)
         self.calls.append((sql, params))
-        if "FROM tb_user" in sql:
+        if "from tb_user" in sql.lower():
             return FakeResult(self.user_row)
         return FakeResult(None)
 
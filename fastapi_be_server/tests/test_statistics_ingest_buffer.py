@@ -0,0 +1,305 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from app.services.common import statistics_ingest, statistics_service
+from app.services.common.statistics_ingest import (
+    INGEST_TABLES,
+    StatisticsIngestBuffer,
+    build_multi_row_insert,
+)
+
+
+class _FakeSession:
+    def __init__(self, store):
+        self.store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, query, params=None):
+        if self.store.fail:
+            raise OSError("db unavailable")
+        if any(
+            key.startswith("user_id_") and value in self.store.poison
+            for key, value in (params or {}).items()
+        ):
+            raise ValueError("invalid row")
+        self.store.executes.append((str(query), params))
+
+    async def commit(self):
+        self.store.commits += 1
+
+
+class _FakeStore:
+    def __init__(self):
+        self.executes = []
+        self.commits = 0
+        self.fail = False
+        self.poison = set()
+
+    def session(self):
+        return _FakeSession(self)
+
+    @property
+    def row_count(self):
+        # 바인딩 키 `<column>_<idx>` 중 첫 컬럼 기준으로 row 수 계산
+        return sum(
+            len([k for k in params or {} if k.startswith("date_")])
+            for _, params in self.executes
+        )
+
+
+def _log_row(idx=0, type="visit"):
+    return {"date": datetime(2026, 1, 1, 10, 0, idx), "type": type, "user_id": idx + 1}
+
+
+class StatisticsIngestBufferTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spill_path = os.path.join(self.tmpdir.name, "spill.jsonl")
+        self.store = _FakeStore()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _buffer(self, **kwargs):
+        options = {
+            "session_factory": self.store.session,
+            "flush_size": 100,
+            "flush_interval": 60,
+            "max_pending": 1000,
+            "spill_path": self.spill_path,
+            "enabled": True,
+        }
+        options.update(kwargs)
+        return StatisticsIngestBuffer(**options)
+
+    def test_multi_row_insert_query(self):
+        query, params = build_multi_row_insert(
+            INGEST_TABLES["site_page_dwell_event"],
+            [{"event_id": "a", "active_ms": 10}, {"event_id": "b", "active_ms": 20}],
+        )
+        sql = str(query)
+
+        self.assertIn("INSERT INTO tb_site_page_dwell_event", sql)
+        self.assertEqual(sql.count("NOW()"), 2)
+        self.assertIn("ON DUPLICATE KEY UPDATE event_id = event_id", sql)
+        self.assertEqual(params["event_id_1"], "b")
+        self.assertIsNone(params["route_group_0"])
+
+    async def test_flush_coalesces_events_into_one_transaction(self):
+        buffer = self._buffer(flush_size=3)
+        for idx in range(5):
+            buffer.add("site_statistics_log", [_log_row(idx)])
+
+        written = await buffer.flush()
+
+        self.assertEqual(written, 5)
+        # flush_size 단위로 multi-row INSERT, commit 은 1회
+        self.assertEqual(len(self.store.executes), 2)
+        self.assertEqual(self.store.commits, 1)
+        self.assertEqual(self.store.row_count, 5)
+        self.assertEqual(buffer.pending, 0)
+
+    async def test_size_threshold_wakes_flush_loop(self):
+        buffer = self._buffer(flush_size=2)
+        await buffer.start()
+        try:
+            buffer.add("site_statistics_log", [_log_row(0), _log_row(1)])
+            for _ in range(10):
+                await asyncio.sleep(0)
+                if buffer.flushed_rows:
+                    break
+
+            self.assertEqual(buffer.flushed_rows, 2)
+        finally:
+            await buffer.stop()
+
+    async def test_stop_drains_pending_events(self):
+        buffer = self._buffer()
+        await buffer.start()
+        buffer.add("site_statistics_log", [_log_row(0)])
+
+        await buffer.stop()
+
+        self.assertFalse(buffer.is_running)
+        self.assertEqual(self.store.row_count, 1)
+
+    async def test_db_failure_spills_to_disk_and_replays(self):
+        buffer = self._buffer()
+        await buffer.start()
+        try:
+            self.store.fail = True
+            buffer.add("site_statistics_log", [_log_row(0), _log_row(1)])
+            await buffer.flush()
+
+            with open(self.spill_path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(lines[0]["row"]["date"], "2026-01-01T10:00:00")
+
+            # DB 복구 후 flush 성공 시 spill 분을 큐로 되돌리고 다음 flush 에서 적재
+            self.store.fail = False
+            await buffer.flush()
+            self.assertFalse(os.path.exists(self.spill_path))
+            await buffer.flush()
+        finally:
+            await buffer.stop()
+
+        self.assertEqual(self.store.row_count, 2)
+        self.assertEqual(buffer.replayed_rows, 2)
+        _, params = self.store.executes[-1]
+        self.assertEqual(params["date_0"], datetime(2026, 1, 1, 10, 0, 0))
+
+    async def test_poison_row_is_isolated_and_dead_lettered(self):
+        buffer = self._buffer(max_attempts=2)
+        await buffer.start()
+        try:
+            # user_id 3 인 row 만 적재 불가 (DB 는 정상)
+            self.store.poison = {3}
+            buffer.add("site_statistics_log", [_log_row(idx) for idx in range(4)])
+            self.assertEqual(await buffer.flush(), 3)
+            self.assertEqual(self.store.row_count, 3)
+
+            # 문제 row 만 시도 횟수와 함께 spill 됐다가 큐로 재적재됨
+            self.assertEqual(buffer.spilled_rows, 1)
+            self.assertEqual(buffer.replayed_rows, 1)
+            self.assertEqual(buffer.pending, 1)
+
+            # 다시 실패하면 max_attempts 에 걸려 dead-letter (더 이상 재적재하지 않음)
+            self.assertEqual(await buffer.flush(), 0)
+            self.assertEqual(buffer.pending, 0)
+        finally:
+            await buffer.stop()
+
+        self.assertFalse(os.path.exists(self.spill_path))
+        with open(f"{self.spill_path}.dead", encoding="utf-8") as f:
+            dead = [json.loads(line) for line in f]
+        self.assertEqual(len(dead), 1)
+        self.assertEqual(dead[0]["row"]["user_id"], 3)
+        self.assertEqual(dead[0]["attempts"], 2)
+        self.assertIn("invalid row", dead[0]["error"])
+        self.assertEqual(buffer.dead_letter_rows, 1)
+        self.assertEqual(self.store.row_count, 3)
+
+    async def test_db_unavailable_spill_does_not_count_attempts(self):
+        buffer = self._buffer(max_attempts=1)
+        self.store.fail = True
+        buffer.add("site_statistics_log", [_log_row(0)])
+        await buffer.flush()
+
+        with open(self.spill_path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 1)
+        self.assertNotIn("attempts", lines[0])
+        self.assertEqual(buffer.dead_letter_rows, 0)
+
+    async def test_overflow_goes_to_spill_file(self):
+        buffer = self._buffer(max_pending=1)
+        buffer.add("site_statistics_log", [_log_row(0)])
+        buffer.add("site_statistics_log", [_log_row(1)])
+
+        self.assertEqual(buffer.pending, 1)
+        self.assertEqual(buffer.spilled_rows, 1)
+
+
+class _FakeDb:
+    def __init__(self):
+        self.calls = []
+        self.commits = 0
+
+    async def execute(self, query, params=None):
+        self.calls.append((str(query), params))
+
+    async def commit(self):
+        self.commits += 1
+
+
+class StatisticsServiceBufferedPathTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.store = _FakeStore()
+        self.buffer = StatisticsIngestBuffer(
+            session_factory=self.store.session,
+            flush_interval=60,
+            spill_path="",
+            enabled=True,
+        )
+        await self.buffer.start()
+        self.patcher = patch.object(
+            statistics_service, "statistics_ingest_buffer", self.buffer
+        )
+        self.patcher.start()
+
+    async def asyncTearDown(self):
+        self.patcher.stop()
+        await self.buffer.stop()
+
+    async def test_read_api_logs_skip_db_round_trips(self):
+        db = _FakeDb()
+
+        await statistics_service.insert_site_statistics_logs(
+            db=db, types=["visit", "page_view"], user_id=7
+        )
+
+        self.assertEqual(db.calls, [])
+        self.assertEqual(db.commits, 0)
+        self.assertEqual(self.buffer.pending, 2)
+
+    async def test_single_log_keeps_caller_commit(self):
+        db = _FakeDb()
+
+        await statistics_service.insert_site_statistics_log(db=db, type="login", user_id=7)
+
+        self.assertEqual(db.calls, [])
+        self.assertEqual(db.commits, 1)
+        self.assertEqual(self.buffer.pending, 1)
+
+    async def test_page_view_event_is_buffered(self):
+        db = _FakeDb()
+
+        await statistics_service.insert_site_page_view_event(
+            db=db,
+            kc_user_id=None,
+            event_id="evt-1",
+            occurred_at=datetime(2026, 1, 1, 10, 0, 0),
+            visitor_id="visitor",
+            session_id="session",
+            route_group="home",
+            route_name="home",
+            path_template="/",
+            path="/",
+            query_hash=None,
+            referrer_path=None,
+            source="web",
+            taxonomy_version=1,
+        )
+        await self.buffer.flush()
+
+        self.assertEqual(db.commits, 0)
+        sql, params = self.store.executes[0]
+        self.assertIn("INSERT INTO tb_site_page_view_event", sql)
+        self.assertEqual(params["event_id_0"], "evt-1")
+
+
+class IngestModuleTest(unittest.TestCase):
+    def test_buffer_disabled_does_not_start(self):
+        buffer = StatisticsIngestBuffer(enabled=False)
+
+        asyncio.run(buffer.start())
+
+        self.assertFalse(buffer.is_running)
+        self.assertIsInstance(
+            statistics_ingest.statistics_ingest_buffer, StatisticsIngestBuffer
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
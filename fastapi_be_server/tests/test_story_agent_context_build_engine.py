@@ -0,0 +1,304 @@
+import asyncio
+import importlib.util
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "build_story_agent_context.py"
+
+SCHEMA = """
+CREATE TABLE tb_story_agent_context_doc (
+    context_doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, episode_id INTEGER, episode_no INTEGER,
+    source_type TEXT, source_locator TEXT, source_hash TEXT, source_text_length INTEGER,
+    version_no INTEGER, is_active TEXT, created_id INTEGER
+);
+CREATE TABLE tb_story_agent_context_chunk (
+    context_chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    context_doc_id INTEGER, product_id INTEGER, episode_id INTEGER, episode_no INTEGER,
+    chunk_no INTEGER, text_hash TEXT, char_start INTEGER, char_end INTEGER, text TEXT, created_id INTEGER
+);
+CREATE TABLE tb_story_agent_context_summary (
+    summary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, summary_type TEXT, scope_key TEXT, episode_from INTEGER, episode_to INTEGER,
+    source_hash TEXT, source_doc_count INTEGER, version_no INTEGER, is_active TEXT, summary_text TEXT,
+    created_id INTEGER
+);
+"""
+
+
+def load_module():
+    module_name = "build_story_agent_context_engine_under_test"
+    spec = importlib.util.spec_from_file_location(module_name, MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class SqliteCursor:
+    """pymysql DictCursor 흉내 (%s 바인딩, dict 행)"""
+
+    def __init__(self, db):
+        self.db = db
+        self.cursor = db.conn.cursor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    def execute(self, sql, params=()):
+        self.db.statements += 1
+        self.cursor.execute(sql.replace("%s", "?"), tuple(params or ()))
+
+    def executemany(self, sql, rows):
+        self.db.statements += 1
+        self.cursor.executemany(sql.replace("%s", "?"), list(rows))
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [dict(row) for row in self.cursor.fetchall()]
+
+
+class SqliteStoryDb:
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.statements = 0
+
+    def cursor(self):
+        return SqliteCursor(self)
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        pass
+
+    def rows(self, sql):
+        return [tuple(row) for row in self.conn.execute(sql).fetchall()]
+
+    def snapshot(self):
+        return {
+            "docs": self.rows(
+                "SELECT episode_id, source_hash, source_text_length, version_no, is_active"
+                " FROM tb_story_agent_context_doc ORDER BY episode_id, version_no"
+            ),
+            "chunks": self.rows(
+                "SELECT d.episode_id, d.version_no, c.chunk_no, c.text_hash, c.char_start, c.char_end, c.text"
+                " FROM tb_story_agent_context_chunk c JOIN tb_story_agent_context_doc d USING (context_doc_id)"
+                " ORDER BY d.episode_id, d.version_no, c.chunk_no"
+            ),
+            "summaries": self.rows(
+                "SELECT scope_key, source_hash, version_no, is_active, summary_text"
+                " FROM tb_story_agent_context_summary ORDER BY scope_key, version_no"
+            ),
+        }
+
+
+@contextmanager
+def sqlite_work_cursor(conn):
+    with conn.cursor() as cur:
+        yield cur
+
+
+def episode_rows(count):
+    rows = []
+    for episode_no in range(1, count + 1):
+        paragraphs = "".join(
+            f"<p>{episode_no}화 {idx}번째 문단. 한서진은 검을 들었다. 윤하가 뒤를 따랐다.{' 긴 문장' * 40}</p>"
+            for idx in range(12)
+        )
+        rows.append(
+            {
+                "product_id": 687,
+                "episode_id": 1000 + episode_no,
+                "episode_no": episode_no,
+                "episode_title": f"{episode_no}화 시작",
+                "title": "테스트 작품",
+                "episode_content": f"<div>{paragraphs}<script>x()</script></div>",
+            }
+        )
+    return rows
+
+
+async def legacy_build(module, conn, rows, results):
+    """엔진 도입 전 회차 단위 순차 적재 (insert_doc_and_chunks + insert_episode_summary)"""
+    for row in rows:
+        source = await module.resolve_source_payload(row=row, use_epub_fallback=False)
+        normalized_text = module.normalize_episode_html(source["html_content"])
+        chunks = module.build_chunks(normalized_text)
+        source_hash = module.sha256_text(normalized_text)
+        with module.work_cursor(conn) as cur:
+            existing = module.fetch_existing_doc(cur, int(row["episode_id"]), source_hash, source["source_type"])
+            module.insert_doc_and_chunks(cur, row, source, normalized_text, chunks)
+        conn.commit()
+        results["reused_docs" if existing else "inserted_docs"] += 1
+        _, inserted, meta = await module.insert_episode_summary(
+            conn, row, source_hash, normalized_text, summary_client=None
+        )
+        module.record_episode_summary_result(results, inserted, meta)
+
+
+class StoryAgentContextBuildEngineTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.module = load_module()
+        self.patchers = [patch.object(self.module, "work_cursor", sqlite_work_cursor)]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self.patchers):
+            patcher.stop()
+
+    async def build(self, engine, conn, rows, *, apply=True):
+        results = self.module.build_empty_results()
+        try:
+            texts = await engine.build_product_episodes(
+                conn,
+                rows,
+                apply=apply,
+                use_epub_fallback=False,
+                summary_client=None,
+                results=results,
+            )
+        finally:
+            engine.close()
+        return results, texts
+
+    def test_prepare_episode_text_matches_normalize_and_chunk(self):
+        html = episode_rows(1)[0]["episode_content"]
+        normalized_text, chunks, source_hash = self.module.prepare_episode_text(html)
+
+        self.assertEqual(normalized_text, self.module.normalize_episode_html(html))
+        self.assertEqual(chunks, self.module.build_chunks(normalized_text))
+        self.assertEqual(source_hash, self.module.sha256_text(normalized_text))
+        self.assertEqual(self.module.prepare_episode_text("<p> </p>"), ("", [], ""))
+
+    async def test_engine_writes_same_rows_as_sequential_build(self):
+        rows = episode_rows(12)
+        legacy_db = SqliteStoryDb()
+        legacy_results = self.module.build_empty_results()
+        await legacy_build(self.module, legacy_db, rows, legacy_results)
+
+        engine_db = SqliteStoryDb()
+        engine = self.module.EpisodeContextBuildEngine(workers=2, summary_concurrency=4, doc_batch_size=5)
+        results, texts = await self.build(engine, engine_db, rows)
+
+        self.assertEqual(engine_db.snapshot(), legacy_db.snapshot())
+        self.assertEqual(results, legacy_results)
+        self.assertEqual(results["inserted_docs"], 12)
+        self.assertEqual(sorted(texts), list(range(1, 13)))
+        self.assertLess(engine_db.statements, legacy_db.statements)
+
+        # 같은 원문 재실행: 기존 doc 재사용, 제목이 바뀐 회차만 요약 새 버전
+        rerun_rows = episode_rows(12)
+        rerun_rows[0]["episode_title"] = "1화 새 제목"
+        legacy_results = self.module.build_empty_results()
+        await legacy_build(self.module, legacy_db, rerun_rows, legacy_results)
+        engine = self.module.EpisodeContextBuildEngine(workers=2, summary_concurrency=4, doc_batch_size=5)
+        results, _ = await self.build(engine, engine_db, rerun_rows)
+
+        self.assertEqual(engine_db.snapshot(), legacy_db.snapshot())
+        self.assertEqual((results["reused_docs"], results["inserted_summaries"]), (12, 1))
+
+    async def test_changed_source_adds_new_doc_version_and_deactivates_old(self):
+        db = SqliteStoryDb()
+        engine = self.module.EpisodeContextBuildEngine(workers=1, summary_concurrency=1, doc_batch_size=10)
+        await self.build(engine, db, episode_rows(3))
+
+        changed = episode_rows(3)
+        changed[1]["episode_content"] = "<p>완전히 바뀐 원문. 한서진은 떠났다.</p>"
+        engine = self.module.EpisodeContextBuildEngine(workers=1, summary_concurrency=1, doc_batch_size=10)
+        results, _ = await self.build(engine, db, changed)
+
+        self.assertEqual((results["inserted_docs"], results["reused_docs"]), (1, 2))
+        docs = [row for row in db.snapshot()["docs"] if row[0] == 1002]
+        self.assertEqual([(row[3], row[4]) for row in docs], [(1, "N"), (2, "Y")])
+
+    async def test_summary_calls_fan_out_up_to_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def fake_generate(*, client, row, normalized_text, verbose=False):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return self.module.build_episode_summary_text(row, normalized_text), {"used_llm": True, "retry_count": 0}
+
+        db = SqliteStoryDb()
+        engine = self.module.EpisodeContextBuildEngine(workers=1, summary_concurrency=3, doc_batch_size=20)
+        with patch.object(self.module, "generate_episode_summary_text", fake_generate):
+            results, _ = await self.build(engine, db, episode_rows(10))
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(results["llm_generated_summaries"], 10)
+
+    async def test_failed_summary_cancels_remaining_calls(self):
+        started = []
+
+        async def fake_generate(*, client, row, normalized_text, verbose=False):
+            started.append(row["episode_no"])
+            if row["episode_no"] == 2:
+                raise RuntimeError("summary down")
+            await asyncio.sleep(0.05)
+            return "요약", {"used_llm": True}
+
+        db = SqliteStoryDb()
+        engine = self.module.EpisodeContextBuildEngine(workers=1, summary_concurrency=2, doc_batch_size=3)
+        with patch.object(self.module, "generate_episode_summary_text", fake_generate):
+            with self.assertRaisesRegex(RuntimeError, "summary down"):
+                await self.build(engine, db, episode_rows(6))
+
+        self.assertNotIn(4, started)  # 다음 묶음은 시작하지 않음
+        self.assertEqual(db.snapshot()["summaries"], [])
+
+    async def test_rate_limiter_spaces_requests(self):
+        limiter = self.module.EpisodeSummaryRateLimiter(requests_per_minute=1200, burst=2)  # 초당 20건
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+    async def test_locked_product_is_skipped_without_building_episodes(self):
+        @contextmanager
+        def busy_lock(_product_id):
+            yield None
+
+        args = SimpleNamespace(
+            apply=True,
+            verbose=False,
+            use_epub_fallback=False,
+            workers=1,
+            summary_concurrency=1,
+            doc_batch_size=10,
+        )
+        db = SqliteStoryDb()
+        with patch.object(self.module, "db_connect", return_value=db), \
+             patch.object(self.module, "fetch_total_episode_count", return_value=3), \
+             patch.object(self.module, "product_lock_connection", busy_lock), \
+             patch.object(self.module.EpisodeContextBuildEngine, "build_product_episodes") as build_mock:
+            results = await self.module.build_context_rows(episode_rows(3), args)
+
+        build_mock.assert_not_called()
+        self.assertEqual(results["products"][0]["context_status"], "locked")
+        self.assertEqual(db.statements, 0)
@@ -0,0 +1,219 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from app.services.ai import recommendation_service, taste_recommendation_cache as cache_module
+from app.services.ai.taste_recommendation_cache import TasteRecommendationCache
+
+
+def _result(*sections):
+    return {
+        "sections": [
+            {
+                "title": f"구좌{idx}",
+                "dimension": dimension,
+                "reason": "",
+                "products": [{"productId": pid, "title": f"작품{pid}"} for pid in product_ids],
+            }
+            for idx, (dimension, product_ids) in enumerate(sections)
+        ],
+        "needs_onboarding": False,
+    }
+
+
+class TasteRecommendationCacheTest(unittest.TestCase):
+    def test_hit_requires_same_profile_version(self):
+        cache = TasteRecommendationCache(ttl=60, max_entries=10, enabled=True)
+        cache.put(1, "N", 3, _result(("protagonist", [10, 11])))
+
+        self.assertEqual(cache.get(1, "N", 3)["sections"][0]["products"][1]["productId"], 11)
+        self.assertIsNone(cache.get(1, "Y", 3))
+        self.assertIsNone(cache.get(1, "N", 4))
+        # 버전이 바뀐 항목은 제거되어 이전 버전으로도 다시 쓰지 않음
+        self.assertIsNone(cache.get(1, "N", 3))
+        self.assertEqual(
+            cache.metrics(),
+            {
+                "entries": 0,
+                "hits": 1,
+                "misses": 3,
+                "hit_rate": 0.25,
+                "version_misses": 1,
+                "dropped_products": 0,
+                "dropped_sections": 0,
+            },
+        )
+
+    def test_returned_result_is_a_copy(self):
+        cache = TasteRecommendationCache(ttl=60, max_entries=10, enabled=True)
+        source = _result(("protagonist", [10]))
+        cache.put(1, "N", 0, source)
+        source["sections"][0]["products"].append({"productId": 99})
+
+        served = cache.get(1, "N", 0)
+        served["sections"][0]["products"][0]["title"] = "변경"
+        served["sections"].clear()
+
+        again = cache.get(1, "N", 0)
+        self.assertEqual(again["sections"][0]["products"], [{"productId": 10, "title": "작품10"}])
+
+    def test_unservable_products_and_sections_are_dropped(self):
+        cache = TasteRecommendationCache(ttl=60, max_entries=10, enabled=True)
+        cache.put(1, "N", 0, _result(("protagonist", [10, 11]), ("mood", [20])))
+        servable = {10}
+
+        served = cache.get(1, "N", 0, is_servable=lambda pid: pid in servable)
+
+        self.assertEqual([section["dimension"] for section in served["sections"]], ["protagonist"])
+        self.assertEqual([p["productId"] for p in served["sections"][0]["products"]], [10])
+        self.assertEqual(cache.metrics()["dropped_products"], 2)
+        self.assertEqual(cache.metrics()["dropped_sections"], 1)
+
+        # 남은 구좌가 없으면 다시 계산하도록 miss
+        servable.clear()
+        self.assertIsNone(cache.get(1, "N", 0, is_servable=lambda pid: pid in servable))
+        self.assertEqual(cache.metrics()["entries"], 0)
+
+    def test_ttl_lru_invalidate_and_disabled(self):
+        cache = TasteRecommendationCache(ttl=0, max_entries=10, enabled=True)
+        cache.put(1, "N", 0, _result())
+        self.assertIsNone(cache.get(1, "N", 0))
+
+        cache = TasteRecommendationCache(ttl=60, max_entries=2, enabled=True)
+        for user_id in (1, 2, 3):
+            cache.put(user_id, "N", 0, _result())
+        self.assertIsNone(cache.get(1, "N", 0))
+        self.assertIsNotNone(cache.get(3, "N", 0))
+
+        cache.put(2, "Y", 0, _result())
+        cache.invalidate_user(2)
+        self.assertIsNone(cache.get(2, "N", 0))
+        self.assertIsNone(cache.get(2, "Y", 0))
+
+        cache = TasteRecommendationCache(ttl=60, max_entries=10, enabled=True, empty_ttl=0)
+        cache.put(4, "N", 0, {"sections": [], "needs_onboarding": True})
+        self.assertIsNone(cache.get(4, "N", 0))
+
+        disabled = TasteRecommendationCache(ttl=60, max_entries=10, enabled=False)
+        disabled.put(1, "N", 0, _result())
+        self.assertIsNone(disabled.get(1, "N", 0))
+
+
+class _Result:
+    def __init__(self, scalar=None):
+        self._scalar = scalar
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+
+class _NestedTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class _VersionDb:
+    """tb_user_taste_profile_version 조회/증가만 처리하는 세션 대역"""
+
+    def __init__(self):
+        self.versions: dict[int, int] = {}
+        self.other_queries: list[str] = []
+        self.fail = False
+
+    async def execute(self, query, params=None):
+        if self.fail:
+            raise RuntimeError("Table 'tb_user_taste_profile_version' doesn't exist")
+        sql = str(query)
+        user_id = params["user_id"]
+        if "ON DUPLICATE KEY UPDATE profile_version = profile_version + 1" in sql:
+            self.versions[user_id] = self.versions.get(user_id, 0) + 1
+            return _Result()
+        if "FROM tb_user_taste_profile_version" in sql:
+            return _Result(self.versions.get(user_id))
+        self.other_queries.append(sql)
+        return _Result()
+
+    def begin_nested(self):
+        return _NestedTransaction()
+
+
+class TasteRecommendationsCachePathTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.cache = TasteRecommendationCache(ttl=60, max_entries=10, enabled=True)
+        self.build = AsyncMock(side_effect=lambda user_id, adult_yn, db: _result(("protagonist", [10, 11])))
+        self.save_logs = AsyncMock()
+        self.recent_read_ids: set[int] = set()
+        patchers = [
+            patch.object(cache_module, "taste_recommendation_cache", self.cache),
+            patch.object(recommendation_service, "taste_recommendation_cache", self.cache),
+            patch.object(recommendation_service, "_get_user_id_by_kc", AsyncMock(return_value=7)),
+            patch.object(recommendation_service, "_build_taste_recommendations", self.build),
+            patch.object(recommendation_service, "_save_ai_slot_serving_logs", self.save_logs),
+            patch.object(recommendation_service, "_is_servable_recommendation_product", return_value=True),
+            patch.object(
+                recommendation_service,
+                "_get_recent_read_product_ids",
+                AsyncMock(side_effect=lambda user_id, db, limit=120: self.recent_read_ids),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_profile_version_bump_recomputes_and_logs_every_serving(self):
+        db = _VersionDb()
+
+        first = await recommendation_service.get_taste_recommendations("kc", "N", db)
+        second = await recommendation_service.get_taste_recommendations("kc", "n", db)
+        self.assertEqual(first, second)
+        self.assertEqual(self.build.await_count, 1)
+
+        await cache_module.bump_taste_profile_version(7, db)
+        self.assertEqual(db.versions, {7: 1})
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+
+        self.assertEqual(self.build.await_count, 2)
+        # 캐시에서 내준 구좌도 노출 로그는 매번 기록
+        self.assertEqual(self.save_logs.await_count, 4)
+        self.assertEqual(self.cache.metrics()["hits"], 2)
+
+    async def test_products_read_after_caching_are_filtered_on_hit(self):
+        db = _VersionDb()
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+
+        # 회차 열람은 버전을 올리지 않음
+        self.recent_read_ids = {10}
+        served = await recommendation_service.get_taste_recommendations("kc", "N", db)
+
+        self.assertEqual(self.build.await_count, 1)
+        self.assertEqual([p["productId"] for p in served["sections"][0]["products"]], [11])
+
+    async def test_version_lookup_failure_bypasses_cache(self):
+        db = _VersionDb()
+        db.fail = True
+
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+        # 증가 실패도 호출부로 전파하지 않음
+        await cache_module.bump_taste_profile_version(7, db)
+
+        self.assertEqual(self.build.await_count, 2)
+        self.assertEqual(self.cache.metrics()["entries"], 0)
+
+    async def test_onboarding_dismiss_bumps_version(self):
+        db = _VersionDb()
+        await recommendation_service.get_taste_recommendations("kc", "N", db)
+        self.assertEqual(self.cache.metrics()["entries"], 1)
+
+        await recommendation_service.dismiss_onboarding("kc", db)
+
+        self.assertIn("ai_onboarding_dismissed_yn = 'Y'", db.other_queries[-1])
+        self.assertEqual(db.versions, {7: 1})
+        self.assertEqual(self.cache.metrics()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
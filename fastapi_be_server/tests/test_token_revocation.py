@@ -0,0 +1,232 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+import app.schemas.auth as auth_schema
+from app.const import settings
+from app.exceptions import CustomResponseException
+from app.services.auth import auth_service
+from app.utils import auth, token_revocation
+from app.utils.token_revocation import token_revocation_cache
+
+
+class _FakeKeycloak:
+    """/token/introspect 만 흉내내는 로컬 Keycloak"""
+
+    def __init__(self):
+        self.introspect_calls = 0
+        self.inactive_jtis = set()
+        self.fail_next = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/token/introspect")
+        self.introspect_calls += 1
+        if self.fail_next:
+            self.fail_next -= 1
+            raise httpx.ConnectError("keycloak down", request=request)
+        token = dict(
+            pair.split("=", 1) for pair in request.content.decode().split("&")
+        )["token"]
+        claims = jwt.decode(token, options={"verify_signature": False})
+        active = claims.get("jti") not in self.inactive_jtis
+        return httpx.Response(200, json={"active": active, "sub": claims["sub"]})
+
+    def get_http_client(self, name):
+        assert name == "keycloak"
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+_PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _issue_token(jti="jti-1", sub="kc-user-1", sid="sid-1", iat=None, ttl=300):
+    now = int(time.time()) if iat is None else iat
+    return jwt.encode(
+        {
+            "jti": jti,
+            "sub": sub,
+            "sid": sid,
+            "azp": settings.KC_CLIENT_ID,
+            "iss": settings.KC_ISSUER_BASE_URL,
+            "aud": settings.KC_AUDIENCE,
+            "iat": now,
+            "exp": now + ttl,
+        },
+        _PRIVATE_KEY,
+        algorithm="RS256",
+    )
+
+
+class TokenRevocationTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        token_revocation_cache.clear()
+        self.keycloak = _FakeKeycloak()
+        self.patches = [
+            patch.object(auth, "get_http_client", self.keycloak.get_http_client),
+            patch.object(
+                auth,
+                "get_kc_signing_key",
+                return_value=_PRIVATE_KEY.public_key(),
+            ),
+            patch.object(auth.asyncio, "sleep", return_value=None),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        token_revocation_cache.clear()
+
+    async def test_repeated_requests_introspect_once(self):
+        token = _issue_token()
+
+        for _ in range(20):
+            decoded = await auth.chk_jwt_token(token)
+
+        self.assertEqual(decoded["sub"], "kc-user-1")
+        self.assertEqual(self.keycloak.introspect_calls, 1)
+        self.assertEqual(token_revocation_cache.hits, 19)
+
+    async def test_inactive_verdict_is_negatively_cached(self):
+        token = _issue_token(jti="revoked-jti")
+        self.keycloak.inactive_jtis.add("revoked-jti")
+
+        for _ in range(3):
+            with self.assertRaises(CustomResponseException) as ctx:
+                await auth.chk_jwt_token(token)
+            self.assertEqual(ctx.exception.status_code, 401)
+
+        self.assertEqual(self.keycloak.introspect_calls, 1)
+
+    async def test_stale_verdict_served_and_refreshed_in_background(self):
+        token = _issue_token(jti="stale-jti")
+        await auth.chk_jwt_token(token)
+
+        key = "jti:stale-jti"
+        active, _, expires_at, result = token_revocation_cache._verdicts[key]
+        token_revocation_cache._verdicts[key] = (
+            active,
+            time.time() - token_revocation_cache.fresh_ttl - 1,
+            expires_at,
+            result,
+        )
+        self.keycloak.inactive_jtis.add("stale-jti")
+
+        # stale 판정은 즉시 응답하고, 백그라운드에서 재확인
+        await auth.chk_jwt_token(token)
+        await asyncio.sleep(0)
+        await asyncio.gather(*token_revocation._background_tasks)
+
+        self.assertEqual(self.keycloak.introspect_calls, 2)
+        with self.assertRaises(CustomResponseException):
+            await auth.chk_jwt_token(token)
+        self.assertEqual(self.keycloak.introspect_calls, 2)
+
+    async def test_logout_revokes_session_without_keycloak_roundtrip(self):
+        token = _issue_token(sid="logout-sid")
+        await auth.chk_jwt_token(token)
+        refresh_token = jwt.encode(
+            {"sid": "logout-sid", "exp": int(time.time()) + 3600},
+            "refresh-secret",
+            algorithm="HS256",
+        )
+
+        token_revocation.revoke_by_refresh_token(refresh_token)
+
+        with self.assertRaises(CustomResponseException):
+            await auth.chk_jwt_token(token)
+        self.assertEqual(self.keycloak.introspect_calls, 1)
+
+    async def test_session_revocation_is_clamped_to_refresh_lifetime(self):
+        refresh_token = jwt.encode(
+            {"sid": "long-sid", "exp": int(time.time()) + 10**9},
+            "refresh-secret",
+            algorithm="HS256",
+        )
+
+        token_revocation.revoke_by_refresh_token(refresh_token)
+
+        self.assertLessEqual(
+            token_revocation_cache._revoked_sessions["long-sid"],
+            time.time() + settings.KC_REFRESH_TOKEN_MAX_LIFETIME_SECONDS,
+        )
+
+    async def test_signout_revokes_only_after_keycloak_logout(self):
+        token = _issue_token(sid="signout-sid")
+        await auth.chk_jwt_token(token)
+        refresh_token = jwt.encode(
+            {"sid": "signout-sid", "exp": int(time.time()) + 3600},
+            "refresh-secret",
+            algorithm="HS256",
+        )
+        req_body = auth_schema.SignoutReqBody(refresh_token=refresh_token)
+
+        with patch.object(
+            auth_service.comm_service,
+            "kc_logout_endpoint",
+            side_effect=CustomResponseException(status_code=400, message="invalid"),
+        ):
+            await auth_service.post_auth_signout(
+                req_body, "kc-user-1", settings.KC_CLIENT_ID
+            )
+        self.assertNotIn("signout-sid", token_revocation_cache._revoked_sessions)
+
+        with patch.object(auth_service.comm_service, "kc_logout_endpoint") as logout:
+            await auth_service.post_auth_signout(
+                req_body, "kc-user-1", settings.KC_CLIENT_ID
+            )
+        logout.assert_awaited_once()
+        with self.assertRaises(CustomResponseException):
+            await auth.chk_jwt_token(token)
+
+    async def test_withdrawal_revokes_tokens_issued_before(self):
+        old_token = _issue_token(jti="old", sub="kc-withdrawn", iat=int(time.time()) - 10)
+        await auth.chk_jwt_token(old_token)
+
+        token_revocation.revoke_user("kc-withdrawn")
+
+        with self.assertRaises(CustomResponseException):
+            await auth.chk_jwt_token(old_token)
+
+    async def test_network_failure_is_not_cached(self):
+        token = _issue_token(jti="flaky")
+        self.keycloak.fail_next = 3
+
+        with self.assertRaises(CustomResponseException):
+            await auth.chk_jwt_token(token)
+
+        decoded = await auth.chk_jwt_token(token)
+        self.assertEqual(decoded["jti"], "flaky")
+        self.assertEqual(self.keycloak.introspect_calls, 4)
+
+    async def test_active_verdict_does_not_outlive_token(self):
+        token = _issue_token(jti="short", ttl=2)
+        await auth.chk_jwt_token(token)
+
+        _, _, expires_at, _ = token_revocation_cache._verdicts["jti:short"]
+        self.assertLessEqual(expires_at, time.time() + 2)
+
+
+class TokenRevocationCacheTest(unittest.TestCase):
+    def test_lru_bound(self):
+        cache = token_revocation.TokenRevocationCache(max_entries=2)
+        for idx in range(3):
+            cache.store_verdict(f"k{idx}", active=True, result={}, token_exp=None)
+
+        self.assertEqual(cache.lookup("k0")[0], "miss")
+        self.assertEqual(cache.lookup("k2")[0], "fresh")
+
+    def test_cache_key_falls_back_to_token_hash(self):
+        key = token_revocation.token_cache_key("a.b.c", {})
+
+        self.assertTrue(key.startswith("sha256:"))
+
+
+if __name__ == "__main__":
+    unittest.main()
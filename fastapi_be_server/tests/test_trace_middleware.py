@@ -0,0 +1,205 @@
+import json
+import unittest
+
+from app.utils.trace import BoundedSample, TraceIdMiddleware
+
+
+def _http_scope(method="GET", query_string=b"", headers=None):
+    return {
+        "type": "http",
+        "method": method,
+        "path": "/v1/query/test",
+        "query_string": query_string,
+        "headers": headers or [],
+    }
+
+
+def _receive_from(chunks):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": idx < len(chunks) - 1}
+        for idx, chunk in enumerate(chunks)
+    ] or [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        return messages.pop(0)
+
+    return receive
+
+
+class _Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+
+    @property
+    def headers(self):
+        return dict(self.messages[0]["headers"])
+
+    @property
+    def body_messages(self):
+        return [m for m in self.messages if m["type"] == "http.response.body"]
+
+
+def _chunked_app(content_type: bytes, chunks: list[bytes], seen: dict):
+    async def app(scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                break
+        seen["body"] = body
+        seen["state"] = dict(scope["state"])
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", content_type)],
+            }
+        )
+        for idx, chunk in enumerate(chunks):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": idx < len(chunks) - 1,
+                }
+            )
+
+    return app
+
+
+class BoundedSampleTest(unittest.TestCase):
+    def test_keeps_only_head_and_counts_total(self):
+        sample = BoundedSample(max_bytes=4)
+        sample.feed(b"abc")
+        sample.feed(b"defg")
+
+        self.assertEqual(sample.data, b"abcd")
+        self.assertEqual(sample.total_bytes, 7)
+        self.assertTrue(sample.truncated)
+        self.assertIsNone(sample.as_json())
+
+    def test_as_json_for_complete_body(self):
+        sample = BoundedSample(max_bytes=64)
+        sample.feed(b'{"a": 1}')
+
+        self.assertEqual(sample.as_json(), {"a": 1})
+
+
+class TraceIdMiddlewareTest(unittest.IsolatedAsyncioTestCase):
+    async def test_sets_request_state_and_trace_header(self):
+        seen = {}
+        middleware = TraceIdMiddleware(
+            _chunked_app(b"application/json", [b"{}"], seen)
+        )
+        payload = json.dumps({"title": "hello"}).encode()
+        recorder = _Recorder()
+
+        await middleware(
+            _http_scope(
+                "POST",
+                query_string=b"page=2",
+                headers=[(b"trace_id", b"given-trace")],
+            ),
+            _receive_from([payload[:5], payload[5:]]),
+            recorder,
+        )
+
+        self.assertEqual(seen["body"], payload)
+        self.assertEqual(seen["state"]["params"], {"page": "2"})
+        self.assertEqual(seen["state"]["analysis_params"], {"page": "2"})
+        self.assertEqual(seen["state"]["trace_id"], "given-trace")
+        self.assertEqual(len(seen["state"]["span_id"]), 16)
+        self.assertEqual(recorder.headers[b"trace_id"], b"given-trace")
+
+    async def test_request_body_parsed_after_app_reads_it(self):
+        payload = json.dumps({"title": "hello"}).encode()
+        captured = {}
+
+        async def app(scope, receive, send):
+            captured["before"] = scope["state"]["body"]
+            await receive()
+            captured["after"] = scope["state"]["body"]
+            await send({"type": "http.response.start", "status": 204, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        await TraceIdMiddleware(app)(
+            _http_scope("POST"), _receive_from([payload]), _Recorder()
+        )
+
+        self.assertIsNone(captured["before"])
+        self.assertEqual(captured["after"], {"title": "hello"})
+
+    async def test_oversized_request_body_is_not_parsed(self):
+        payload = json.dumps({"content": "x" * 100}).encode()
+        seen = {}
+        middleware = TraceIdMiddleware(
+            _chunked_app(b"application/json", [b"{}"], seen), sample_max_bytes=16
+        )
+
+        await middleware(_http_scope("PUT"), _receive_from([payload]), _Recorder())
+
+        self.assertEqual(seen["body"], payload)
+        self.assertIsNone(seen["state"]["body"])
+
+    async def test_large_response_passes_through_without_rebuffering(self):
+        chunks = [b"a" * 65536 for _ in range(8)]
+        recorder = _Recorder()
+        middleware = TraceIdMiddleware(
+            _chunked_app(b"application/json", chunks, {})
+        )
+
+        await middleware(_http_scope(), _receive_from([]), recorder)
+
+        body_messages = recorder.body_messages
+        self.assertEqual(len(body_messages), len(chunks))
+        for message, chunk in zip(body_messages, chunks):
+            self.assertIs(message["body"], chunk)
+
+    async def test_event_stream_chunks_are_forwarded_one_by_one(self):
+        events = [f"data: {i}\n\n".encode() for i in range(5)]
+        recorder = _Recorder()
+        forwarded_before_next = []
+
+        async def app(scope, receive, send):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"text/event-stream; charset=utf-8")],
+                }
+            )
+            for idx, event in enumerate(events):
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": event,
+                        "more_body": idx < len(events) - 1,
+                    }
+                )
+                forwarded_before_next.append(len(recorder.body_messages))
+
+        await TraceIdMiddleware(app)(_http_scope(), _receive_from([]), recorder)
+
+        self.assertEqual(forwarded_before_next, [1, 2, 3, 4, 5])
+        self.assertEqual([m["body"] for m in recorder.body_messages], events)
+        self.assertIn(b"trace_id", recorder.headers)
+
+    async def test_non_http_scope_is_passed_through(self):
+        called = {}
+
+        async def app(scope, receive, send):
+            called["scope"] = scope
+
+        scope = {"type": "lifespan"}
+        await TraceIdMiddleware(app)(scope, None, None)
+
+        self.assertIs(called["scope"], scope)
+        self.assertNotIn("state", scope)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import unittest
+from datetime import date
+
+import httpx
+from fastapi import FastAPI
+
+from app.services.ai import recommendation_service
+from app.services.common import comm_service
+from app.services.product import product_service
+from app.utils import identity
+from app.utils.common import check_user
+from app.utils.identity import (
+    UserIdentityScopeMiddleware,
+    invalidate_user_identity,
+    resolve_user_identity,
+    user_identity_cache,
+)
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def mappings(self):
+        return self
+
+    def one_or_none(self):
+        return self._row
+
+
+class _FakeDb:
+    """tb_user 식별 정보 조회 횟수만 기록하는 세션"""
+
+    def __init__(self, users: dict):
+        self.users = users
+        self.identity_queries = 0
+
+    async def execute(self, query, params=None):
+        assert query is identity._IDENTITY_QUERY, str(query)
+        self.identity_queries += 1
+        return _FakeResult(self.users.get(params["kc_user_id"]))
+
+
+def _user_row(user_id=7, role_type="normal", use_yn="Y", birthdate="1990-01-01", **kwargs):
+    row = {
+        "user_id": user_id,
+        "role_type": role_type,
+        "use_yn": use_yn,
+        "birthdate": birthdate,
+        "latest_apply_type": None,
+        "accepted_apply_type": None,
+        "is_cp": 0,
+    }
+    row.update(kwargs)
+    return row
+
+
+def _build_app(db: _FakeDb) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me():
+        # 한 요청에서 여러 서비스 helper 가 같은 사용자를 조회하는 흐름
+        user = await check_user("kc-1", db)
+        user_id = await comm_service.get_user_from_kc("kc-1", db)
+        _, user_info = await comm_service.get_user_from_kc("kc-1", db, ["role_type"])
+        product_user_id = await product_service.get_user_id("kc-1", db)
+        role = await product_service._resolve_current_user_role("kc-1", db)
+        recommendation_user_id = await recommendation_service._get_user_id_by_kc("kc-1", db)
+        return {
+            "user": user,
+            "user_id": user_id,
+            "role_type": user_info["role_type"],
+            "product_user_id": product_user_id,
+            "role": role,
+            "recommendation_user_id": recommendation_user_id,
+        }
+
+    app.add_middleware(UserIdentityScopeMiddleware)
+    return app
+
+
+class UserIdentityResolverTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        user_identity_cache.clear()
+
+    def tearDown(self):
+        user_identity_cache.clear()
+
+    async def _get(self, app, path="/me"):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            return await ac.get(path)
+
+    async def test_each_request_resolves_identity_at_most_once(self):
+        db = _FakeDb({"kc-1": _user_row(accepted_apply_type="cp", latest_apply_type="cp")})
+        app = _build_app(db)
+
+        res = await self._get(app)
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.json(),
+            {
+                "user": {"user_id": 7, "role": "CP"},
+                "user_id": 7,
+                "role_type": "normal",
+                "product_user_id": 7,
+                "role": "CP",
+                "recommendation_user_id": 7,
+            },
+        )
+        self.assertEqual(db.identity_queries, 1)
+
+    async def test_identity_is_shared_across_requests_until_invalidated(self):
+        db = _FakeDb({"kc-1": _user_row()})
+        app = _build_app(db)
+
+        await self._get(app)
+        await self._get(app)
+        self.assertEqual(db.identity_queries, 1)
+
+        # 권한 승인 등 변경 시 user_id 기준 무효화
+        db.users["kc-1"] = _user_row(role_type="admin")
+        invalidate_user_identity(user_id=7)
+        res = await self._get(app)
+
+        self.assertEqual(db.identity_queries, 2)
+        self.assertEqual(res.json()["user"]["role"], "admin")
+
+    async def test_outside_request_scope_always_reads_db(self):
+        db = _FakeDb({"kc-1": _user_row()})
+
+        await resolve_user_identity("kc-1", db)
+        await resolve_user_identity("kc-1", db)
+
+        self.assertEqual(db.identity_queries, 2)
+        self.assertEqual(len(user_identity_cache._entries), 0)
+
+    async def test_withdrawn_user_is_filtered_only_when_active_required(self):
+        db = _FakeDb({"kc-1": _user_row(use_yn="N")})
+
+        self.assertIsNone(await resolve_user_identity("kc-1", db))
+        self.assertEqual(await product_service.get_user_id("kc-1", db), 7)
+        self.assertEqual(await comm_service.get_user_from_kc("kc-1", db), -1)
+
+    async def test_missing_user_is_not_cached(self):
+        db = _FakeDb({})
+        app = FastAPI()
+
+        @app.get("/missing")
+        async def missing():
+            first = await resolve_user_identity("kc-new", db)
+            db.users["kc-new"] = _user_row(user_id=8)
+            second = await resolve_user_identity("kc-new", db)
+            return {"first": first is None, "second": second.user_id}
+
+        app.add_middleware(UserIdentityScopeMiddleware)
+        res = await self._get(app, "/missing")
+
+        self.assertEqual(res.json(), {"first": True, "second": 8})
+
+    async def test_adult_flag_from_birthdate(self):
+        today = date.today()
+        minor_birthdate = f"{today.year - 10}-01-01"
+        db = _FakeDb(
+            {
+                "kc-adult": _user_row(birthdate="1990-01-01"),
+                "kc-minor": _user_row(user_id=8, birthdate=minor_birthdate),
+                "kc-none": _user_row(user_id=9, birthdate=None),
+            }
+        )
+
+        self.assertEqual((await resolve_user_identity("kc-adult", db)).adult_yn, "Y")
+        self.assertEqual((await resolve_user_identity("kc-minor", db)).adult_yn, "N")
+        self.assertEqual((await resolve_user_identity("kc-none", db)).adult_yn, "N")
+
+
+class UserIdentityCacheTest(unittest.TestCase):
+    def _identity(self, kc_user_id, user_id):
+        return identity.UserIdentity(
+            user_id=user_id,
+            kc_user_id=kc_user_id,
+            role_type="normal",
+            use_yn="Y",
+            birthdate=None,
+            latest_apply_type=None,
+            accepted_apply_type=None,
+            is_cp=False,
+        )
+
+    def test_lru_bound(self):
+        cache = identity.UserIdentityCache(max_entries=2)
+        for idx in range(3):
+            cache.put(self._identity(f"kc-{idx}", idx))
+
+        self.assertIsNone(cache.get("kc-0"))
+        self.assertEqual(cache.get("kc-2").user_id, 2)
+        self.assertNotIn(0, cache._kc_by_user_id)
+
+    def test_expired_entry_is_dropped(self):
+        cache = identity.UserIdentityCache(ttl=-1)
+        cache.put(self._identity("kc-1", 1))
+
+        self.assertIsNone(cache.get("kc-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
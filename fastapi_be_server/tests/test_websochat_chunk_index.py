@@ -0,0 +1,283 @@
+import importlib.util
+import math
+import os
+import random
+import re
+import sqlite3
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.websochat import websochat_chunk_index, websochat_service
+
+_AIOSQLITE_AVAILABLE = importlib.util.find_spec("aiosqlite") is not None
+MODULE_PATH = Path(__file__).resolve().parents[1] / "scripts" / "build_story_agent_context.py"
+
+# dist/init/80 + 99g 중 검색/색인에 필요한 컬럼
+SCHEMA = """
+CREATE TABLE tb_product_episode (
+    episode_id INTEGER PRIMARY KEY, product_id INTEGER, episode_no INTEGER, use_yn TEXT, open_yn TEXT
+);
+CREATE TABLE tb_story_agent_context_doc (
+    context_doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER, episode_id INTEGER, episode_no INTEGER, is_active TEXT
+);
+CREATE TABLE tb_story_agent_context_chunk (
+    chunk_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    context_doc_id INTEGER, product_id INTEGER, episode_id INTEGER, episode_no INTEGER, chunk_no INTEGER, text TEXT
+);
+CREATE TABLE tb_story_agent_chunk_index (
+    product_id INTEGER PRIMARY KEY, index_version INTEGER, segment_count INTEGER,
+    chunk_count INTEGER, indexed_chunk_count INTEGER, chunk_meta BLOB
+);
+CREATE TABLE tb_story_agent_chunk_ngram (
+    product_id INTEGER, ngram TEXT, segment_no INTEGER, postings BLOB,
+    PRIMARY KEY (product_id, ngram, segment_no)
+);
+"""
+PRODUCT_ID = 687
+_NAMES = ["한서진", "윤하", "백도현", "서리아", "Kael", "이안"]
+_WORDS = ["검", "마나", "게이트", "던전", "길드", "결계", "계약", "균열", "기사단", "황궁", "S급", "서약"]
+_BIGRAM_RUN_RE = re.compile(r"[가-힣a-z0-9]+")
+
+
+def load_build_module():
+    module_name = "build_story_agent_context_chunk_index_under_test"
+    spec = importlib.util.spec_from_file_location(module_name, MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class SqliteCursor:
+    """pymysql DictCursor 흉내 (%s 바인딩, dict 행)"""
+
+    def __init__(self, conn):
+        self.cursor = conn.cursor()
+
+    def execute(self, sql, params=()):
+        self.cursor.execute(sql.replace("%s", "?"), tuple(params or ()))
+
+    def executemany(self, sql, rows):
+        self.cursor.executemany(sql.replace("%s", "?"), list(rows))
+
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetchall(self):
+        return [dict(row) for row in self.cursor.fetchall()]
+
+
+def bigrams(text_value):
+    grams = {}
+    for run in _BIGRAM_RUN_RE.findall(text_value.lower()):
+        for idx in range(len(run) - 1):
+            grams[run[idx:idx + 2]] = grams.get(run[idx:idx + 2], 0) + 1
+    return grams
+
+
+def reference_search(conn, keywords, latest_episode_no, limit=6):
+    """색인 없이 청크 본문 전체를 훑는 BM25 기준값 (LIKE 후보 + 키워드 2-gram 질의)"""
+    rows = conn.execute(
+        """
+        SELECT c.episode_no, c.chunk_no, c.text
+        FROM tb_story_agent_context_chunk c
+        JOIN tb_story_agent_context_doc d ON d.context_doc_id = c.context_doc_id AND d.is_active = 'Y'
+        JOIN tb_product_episode pe ON pe.episode_id = c.episode_id AND pe.use_yn = 'Y' AND pe.open_yn = 'Y'
+        WHERE c.product_id = ? AND c.episode_no <= ?
+        """,
+        (PRODUCT_ID, latest_episode_no),
+    ).fetchall()
+    docs = [(row["episode_no"], row["chunk_no"], row["text"], bigrams(row["text"])) for row in rows]
+    avgdl = sum(sum(grams.values()) for *_, grams in docs) / len(docs)
+    query = sorted({gram for keyword in keywords for gram in bigrams(keyword)})
+    df = {gram: sum(1 for *_, grams in docs if gram in grams) for gram in query}
+    scored = []
+    for episode_no, chunk_no, text_value, grams in docs:
+        if not any(keyword.lower() in text_value.lower() for keyword in keywords):
+            continue
+        length = sum(grams.values())
+        score = 0.0
+        for gram in query:
+            tf = grams.get(gram, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (len(docs) - df[gram] + 0.5) / (df[gram] + 0.5))
+            score += idf * tf * 2.2 / (tf + 1.2 * (1 - 0.75 + 0.75 * length / avgdl))
+        scored.append((-score, -episode_no, chunk_no, score, text_value))
+    scored.sort(key=lambda item: item[:3])
+    return [(-item[1], item[3], item[4]) for item in scored[:limit]]
+
+
+class StoryCorpus:
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.rnd = random.Random(11)
+
+    def add_episode(self, episode_no, *, open_yn="Y", chunk_count=6):
+        episode_id = 1000 + episode_no
+        self.conn.execute(
+            "INSERT OR REPLACE INTO tb_product_episode VALUES (?, ?, ?, 'Y', ?)",
+            (episode_id, PRODUCT_ID, episode_no, open_yn),
+        )
+        self.conn.execute(
+            "UPDATE tb_story_agent_context_doc SET is_active = 'N' WHERE episode_id = ?", (episode_id,)
+        )
+        doc_id = self.conn.execute(
+            "INSERT INTO tb_story_agent_context_doc (product_id, episode_id, episode_no, is_active) VALUES (?, ?, ?, 'Y')",
+            (PRODUCT_ID, episode_id, episode_no),
+        ).lastrowid
+        for chunk_no in range(1, chunk_count + 1):
+            sentences = [
+                f"{self.rnd.choice(_NAMES)}은 {self.rnd.choice(_WORDS)}을 두고 {self.rnd.choice(_NAMES)}와 부딪혔다."
+                for _ in range(self.rnd.randint(3, 12))
+            ]
+            self.conn.execute(
+                "INSERT INTO tb_story_agent_context_chunk"
+                " (context_doc_id, product_id, episode_id, episode_no, chunk_no, text) VALUES (?, ?, ?, ?, ?, ?)",
+                (doc_id, PRODUCT_ID, episode_id, episode_no, chunk_no, " ".join(sentences)),
+            )
+        self.conn.commit()
+
+    def sync(self, module):
+        result = module.sync_story_chunk_index(SqliteCursor(self.conn), product_id=PRODUCT_ID)
+        self.conn.commit()
+        return result
+
+    def drop_index(self):
+        self.conn.execute("DELETE FROM tb_story_agent_chunk_index")
+        self.conn.execute("DELETE FROM tb_story_agent_chunk_ngram")
+        self.conn.commit()
+
+
+@unittest.skipUnless(_AIOSQLITE_AVAILABLE, "aiosqlite 미설치")
+class WebsochatChunkIndexTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        os.remove(self.db_path)
+        self.module = load_build_module()
+        self.corpus = StoryCorpus(self.db_path)
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{self.db_path}")
+        websochat_chunk_index.chunk_meta_cache.clear()
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        self.corpus.conn.close()
+        os.remove(self.db_path)
+
+    async def search(self, keywords, latest_episode_no):
+        async with AsyncSession(self.engine) as db:
+            rows = await websochat_chunk_index.search_chunk_index(PRODUCT_ID, keywords, latest_episode_no, db)
+        if rows is None:
+            return None
+        return [(row["episodeNo"], row["matchScore"], row["rawText"]) for row in rows]
+
+    def assert_same_ranking(self, actual, expected):
+        self.assertEqual([(row[0], row[2]) for row in actual], [(row[0], row[2]) for row in expected])
+        for actual_row, expected_row in zip(actual, expected):
+            self.assertAlmostEqual(actual_row[1], expected_row[1], places=5)
+
+    async def test_index_ranking_matches_bruteforce_bm25(self):
+        for episode_no in range(1, 21):
+            self.corpus.add_episode(episode_no, open_yn="N" if episode_no == 7 else "Y")
+        self.corpus.add_episode(3)  # 재적재: 이전 doc 청크는 비활성
+        self.assertEqual(self.corpus.sync(self.module)["mode"], "rebuild")
+
+        queries = [
+            (["한서진"], 20),
+            (["한서진", "게이트"], 15),
+            (["kael", "계약"], 20),
+            (["s급"], 10),
+            (["서약", "기사단", "윤하"], 20),
+            (["균열"], 2),
+        ]
+        for keywords, latest_episode_no in queries:
+            with self.subTest(keywords=keywords):
+                expected = reference_search(self.corpus.conn, keywords, latest_episode_no)
+                self.assertTrue(expected)
+                self.assert_same_ranking(await self.search(keywords, latest_episode_no), expected)
+
+        self.assertEqual(await self.search(["없는단어"], 20), [])
+        self.assertIsNone(await self.search(["한"], 20))  # 2-gram 보다 짧은 키워드는 LIKE 로 대체
+
+    async def test_incremental_sync_matches_full_rebuild(self):
+        for episode_no in range(1, 9):
+            self.corpus.add_episode(episode_no)
+        self.corpus.sync(self.module)
+        for episode_no in range(9, 13):
+            self.corpus.add_episode(episode_no)
+        self.corpus.add_episode(2, chunk_count=3)
+
+        result = self.corpus.sync(self.module)
+        self.assertEqual((result["mode"], result["indexed_chunks"]), ("append", 4 * 6 + 3))
+        self.assertEqual(self.corpus.sync(self.module)["mode"], "noop")
+        state = self.corpus.conn.execute("SELECT * FROM tb_story_agent_chunk_index").fetchone()
+        self.assertEqual((state["index_version"], state["segment_count"], state["chunk_count"]), (2, 2, 11 * 6 + 3))
+
+        keyword_sets = [["한서진", "던전"], ["윤하"], ["황궁", "kael"]]
+        incremental = [await self.search(keywords, 12) for keywords in keyword_sets]
+        self.corpus.drop_index()
+        self.assertEqual(self.corpus.sync(self.module)["mode"], "rebuild")
+        rebuilt = [await self.search(keywords, 12) for keywords in keyword_sets]
+
+        self.assertEqual(incremental, rebuilt)
+        for keywords, rows in zip(keyword_sets, rebuilt):
+            self.assert_same_ranking(rows, reference_search(self.corpus.conn, keywords, 12))
+
+    async def test_service_search_uses_index_and_falls_back_to_like(self):
+        for episode_no in range(1, 6):
+            self.corpus.add_episode(episode_no)
+        async with AsyncSession(self.engine) as db:
+            like_rows = await websochat_service._search_websochat_episode_contents(PRODUCT_ID, "한서진 게이트", 5, db)
+        self.corpus.sync(self.module)
+        async with AsyncSession(self.engine) as db:
+            index_rows = await websochat_service._search_websochat_episode_contents(PRODUCT_ID, "한서진 게이트", 5, db)
+
+        self.assertEqual(len(like_rows), 6)
+        self.assertEqual(len(index_rows), 6)
+        self.assertEqual(set(like_rows[0]), {"episodeNo", "matchScore", "chunkText"})
+        self.assertEqual(set(index_rows[0]), {"episodeNo", "matchScore", "chunkText"})
+        self.assertTrue(all(isinstance(row["matchScore"], float) for row in index_rows))
+        self.assertTrue(all("한서진" in row["chunkText"] or "게이트" in row["chunkText"] for row in index_rows))
+
+
+class ChunkIndexPlanTest(unittest.TestCase):
+    def meta(self, chunk_ids):
+        rows = [{"chunk_id": chunk_id, "episode_id": 1, "episode_no": 1, "chunk_no": chunk_id} for chunk_id in chunk_ids]
+        return websochat_chunk_index.build_chunk_meta(rows, {})
+
+    def test_plan_appends_new_chunks_and_rebuilds_on_dead_postings(self):
+        plan = websochat_chunk_index.plan_chunk_index_update
+        meta = self.meta(range(1, 11))
+
+        self.assertEqual(plan(None, [3, 1, 2], segment_count=0, indexed_chunk_count=0).mode, "rebuild")
+        self.assertEqual(plan(meta, range(1, 11), segment_count=1, indexed_chunk_count=10).mode, "noop")
+        self.assertEqual(
+            plan(meta, [*range(2, 11), 11, 12], segment_count=1, indexed_chunk_count=10),
+            websochat_chunk_index.ChunkIndexPlan("append", [11, 12]),
+        )
+        self.assertEqual(plan(meta, [*range(6, 11), 11], segment_count=1, indexed_chunk_count=10).mode, "rebuild")
+        self.assertEqual(
+            plan(meta, [*range(1, 11), 11], segment_count=websochat_chunk_index.CHUNK_INDEX_MAX_SEGMENTS, indexed_chunk_count=10).mode,
+            "rebuild",
+        )
+
+    def test_meta_and_postings_round_trip(self):
+        meta = self.meta([5, 9, 40])
+        restored = websochat_chunk_index.unpack_chunk_meta(websochat_chunk_index.pack_chunk_meta(meta))
+        self.assertEqual(restored.chunk_ids.tolist(), [5, 9, 40])
+
+        postings, lengths = websochat_chunk_index.build_segment_postings([(9, "검은 검 Kael"), (5, "검은 숲")])
+        self.assertEqual(lengths, {5: 1, 9: 4})
+        ids, tfs = websochat_chunk_index.unpack_postings(postings["검은"])
+        self.assertEqual((ids.tolist(), tfs.tolist()), ([5, 9], [1, 1]))
+        self.assertIn("ka", postings)
@@ -0,0 +1,193 @@
+import importlib.util
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from app.services.websochat import websochat_intent_router as router
+from app.services.websochat import websochat_service
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "evaluate_websochat_intent_router.py"
+
+
+def load_evaluate_module():
+    module_name = "evaluate_websochat_intent_router_under_test"
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+class WebsochatIntentRulesTest(unittest.TestCase):
+    def test_rules_follow_classifier_prompt_examples(self):
+        cases = {
+            "한스랑 존이 붙으면 누가 이겨?": ("comparative", True, "general"),
+            "주인공 능력이 뭐야?": ("factual", False, "general"),
+            "주인공이랑 악당이 성격이 왜 비슷해?": ("factual", False, "general"),
+            "이 세계관에서 최강자 랭킹 매겨봐": ("comparative", True, "general"),
+            "내가 들어가면 살아남을 수 있어?": ("self_insert", True, "general"),
+            "최신 갈등이 뭐야?": ("factual", False, "latest"),
+            "초반 분위기가 어때?": ("factual", False, "early"),
+            "12화 내용 요약해줘": ("factual", False, "exact"),
+            "IF 루트로 황제가 살아있었다면?": ("simulation", True, "general"),
+            "남주랑 역할극 하자": ("playful", True, "general"),
+        }
+        for prompt, expected in cases.items():
+            with self.subTest(prompt=prompt):
+                self.assertEqual(router.classify_websochat_intent_by_rules(prompt), expected)
+
+    def test_ambiguous_or_context_dependent_prompts_go_to_llm(self):
+        for prompt in [
+            "주인공이 처음 각성한 건 어디야?",  # 처음 = 도입부 / 최초 사건
+            "한스 능력이 존보다 강해?",
+            "남주랑 서브남 붙으면 누가 이기는지 역할극으로 보여줘",
+            "그럼 그 다음은?",
+            "왜?",
+        ]:
+            with self.subTest(prompt=prompt):
+                self.assertIsNone(router.classify_websochat_intent_by_rules(prompt))
+        self.assertIsNone(router.build_websochat_intent_cache_key("아까 말한 거 더 자세히"))
+        self.assertEqual(
+            router.build_websochat_intent_cache_key(" 주인공  능력이 뭐야??ㅋㅋ"),
+            router.build_websochat_intent_cache_key("주인공 능력이뭐야"),
+        )
+
+    def test_rp_recall_and_correction_rules(self):
+        self.assertIs(router.classify_websochat_rp_recall_by_rules("안녕? 오늘 기분 어때?"), False)
+        self.assertIsNone(router.classify_websochat_rp_recall_by_rules("그때 던전에서 나한테 했던 말 다시 해줘"))
+        self.assertIsNone(router.classify_websochat_rp_recall_by_rules("예전에 나 구해줬던 거 기억해?"))
+        self.assertFalse(router.has_websochat_qa_correction_marker("주인공이 맞지?"))
+        self.assertTrue(router.has_websochat_qa_correction_marker("아니 주인공 동생 이름은 하린이야"))
+
+    def test_cache_is_scoped_per_product_and_bounded(self):
+        cache = router.WebsochatIntentCache(ttl=60, max_entries_per_product=2, max_products=2, enabled=True)
+        cache.put(1, "intent", "", "a", ("factual", False, "general"))
+        cache.put(1, "intent", "", "b", ("playful", True, "general"))
+        cache.put(1, "intent", "", "c", ("comparative", True, "general"))
+        cache.put(2, "intent", "", "a", ("simulation", True, "general"))
+
+        self.assertIsNone(cache.get(1, "intent", "", "a"))  # 작품별 상한으로 밀려남
+        self.assertEqual(cache.get(1, "intent", "", "c"), ("comparative", True, "general"))
+        self.assertEqual(cache.get(2, "intent", "", "a"), ("simulation", True, "general"))
+        self.assertIsNone(cache.get(2, "rp_recall", "", "a"))
+        cache.put(3, "intent", "", "a", ("factual", False, "exact"))
+        self.assertIsNone(cache.get(1, "intent", "", "c"))  # 가장 오래 안 쓴 작품부터 제거
+
+        expired = router.WebsochatIntentCache(ttl=0, max_entries_per_product=2, max_products=2, enabled=True)
+        expired.put(1, "intent", "", "a", ("factual", False, "general"))
+        self.assertIsNone(expired.get(1, "intent", "", "a"))
+
+
+class WebsochatLayeredResolverTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        router.websochat_intent_cache.clear()
+
+    def tearDown(self):
+        router.websochat_intent_cache.clear()
+
+    async def test_intent_uses_rules_then_cache_then_llm(self):
+        with patch.object(
+            websochat_service, "_classify_websochat_intent_with_llm", new_callable=AsyncMock
+        ) as llm:
+            llm.return_value = ("factual", False, "general")
+            ruled = await websochat_service._resolve_websochat_intent(
+                user_prompt="주인공 능력이 뭐야?", recent_messages=[], product_id=7
+            )
+            first = await websochat_service._resolve_websochat_intent(
+                user_prompt="한스 능력이 존보다 강해?", recent_messages=[], product_id=7
+            )
+            cached = await websochat_service._resolve_websochat_intent(
+                user_prompt="한스 능력이  존보다 강해??", recent_messages=[], product_id=7
+            )
+            await websochat_service._resolve_websochat_intent(
+                user_prompt="한스 능력이 존보다 강해?", recent_messages=[], product_id=8
+            )
+            await websochat_service._resolve_websochat_intent(
+                user_prompt="그럼 그 다음은?", recent_messages=[], product_id=7
+            )
+            await websochat_service._resolve_websochat_intent(
+                user_prompt="그럼 그 다음은?", recent_messages=[], product_id=7
+            )
+
+        self.assertEqual(ruled, ("factual", False, "general"))
+        self.assertEqual(first, cached)
+        self.assertEqual(llm.await_count, 4)  # 다른 작품 1회 + 문맥 의존 질문 2회
+        self.assertEqual(
+            router.websochat_intent_cache.metrics()["intent"],
+            {"rule": 1, "llm": 4, "cache": 1, "llm_avoided_rate": 0.3333},
+        )
+
+    async def test_unparsed_llm_reply_is_not_cached(self):
+        with patch.object(
+            websochat_service, "_call_websochat_gemini_json", new_callable=AsyncMock
+        ) as gemini_json:
+            gemini_json.return_value = {}
+            fallback = await websochat_service._resolve_websochat_intent(
+                user_prompt="한스 능력이 존보다 강해?", recent_messages=[], product_id=7
+            )
+            recall = await websochat_service._resolve_websochat_rp_recall_need(
+                user_prompt="처음 만났을 때 뭐라고 했는지 기억나?",
+                recent_messages=[],
+                rp_context={"active_character": "윤하", "anchor_episode_no": 3},
+                product_id=7,
+            )
+            gemini_json.return_value = {"intent": "comparative", "needs_creative": True, "mode": "general"}
+            classified = await websochat_service._resolve_websochat_intent(
+                user_prompt="한스 능력이 존보다 강해?", recent_messages=[], product_id=7
+            )
+
+        self.assertEqual(fallback, ("factual", False, "general"))
+        self.assertEqual(recall, (False, "처음 만났을 때 뭐라고 했는지 기억나?"))
+        self.assertEqual(classified, ("comparative", True, "general"))
+        self.assertEqual(gemini_json.await_count, 3)
+
+    async def test_fast_path_can_be_disabled(self):
+        with patch.object(websochat_service.settings, "WEBSOCHAT_INTENT_FAST_PATH_ENABLED", False), \
+             patch.object(websochat_service, "_classify_websochat_intent_with_llm", new_callable=AsyncMock) as llm, \
+             patch.object(websochat_service, "_call_websochat_gemini_json", new_callable=AsyncMock) as gemini_json:
+            llm.return_value = ("comparative", True, "general")
+            gemini_json.return_value = {"has_corrections": False}
+            intent = await websochat_service._resolve_websochat_intent(
+                user_prompt="주인공 능력이 뭐야?", recent_messages=[], product_id=7
+            )
+            corrections = await websochat_service._resolve_websochat_qa_corrections(
+                user_prompt="주인공 능력이 뭐야?", recent_messages=[], qa_recent_notes=[], qa_corrections=[]
+            )
+
+        self.assertEqual(intent, ("comparative", True, "general"))
+        self.assertEqual(corrections, [])
+        gemini_json.assert_awaited_once()
+
+    async def test_rp_recall_small_talk_skips_llm_and_cache_is_scoped_by_anchor(self):
+        rp_context = {"active_character": "윤하", "anchor_episode_no": 3}
+        with patch.object(
+            websochat_service, "_classify_websochat_rp_recall_need_with_llm", new_callable=AsyncMock
+        ) as llm:
+            llm.return_value = (True, "윤하 던전 약속")
+            small_talk = await websochat_service._resolve_websochat_rp_recall_need(
+                user_prompt="나랑 산책 갈래?", recent_messages=[], rp_context=rp_context, product_id=7
+            )
+            for anchor_episode_no in (3, 3, 4):
+                recall = await websochat_service._resolve_websochat_rp_recall_need(
+                    user_prompt="처음 만났을 때 뭐라고 했는지 기억나?",
+                    recent_messages=[],
+                    rp_context={**rp_context, "anchor_episode_no": anchor_episode_no},
+                    product_id=7,
+                )
+
+        self.assertEqual(small_talk, (False, "나랑 산책 갈래?"))
+        self.assertEqual(recall, (True, "윤하 던전 약속"))
+        self.assertEqual(llm.await_count, 2)
+
+    async def test_fixture_evaluation_avoids_most_llm_calls_without_rule_errors(self):
+        module = load_evaluate_module()
+        items = module.load_labeled_prompts(module.DEFAULT_FIXTURE_PATH)
+        report = await module.evaluate_intent_router(items, products=2, seed=3)
+
+        self.assertEqual(report["rule_misses"], [])
+        for kind in module.KINDS:
+            with self.subTest(kind=kind):
+                self.assertEqual(report[kind]["accuracy"], 1.0)
+                self.assertGreaterEqual(report[kind]["llm_avoided_rate"], 0.6)
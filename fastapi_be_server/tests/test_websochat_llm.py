@@ -52,16 +52,8 @@ class _FakeGeminiResponse:
 class _FakeGeminiAsyncClient:
     timeouts: list[float] = []
 
-    def __init__(self, *, timeout: float):
+    async def post(self, *args, timeout: float, **kwargs):
         self.__class__.timeouts.append(timeout)
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-    async def post(self, *args, **kwargs):
         return _FakeGeminiResponse()
 
 
@@ -73,7 +65,9 @@ class WebsochatLlmTimeoutTest(unittest.IsolatedAsyncioTestCase):
             patch.object(websochat_llm.settings, "GEMINI_API_KEY", "test-key"),
             patch.object(websochat_llm.settings, "WEBSOCHAT_GEMINI_MODEL", "test-model"),
             patch.object(websochat_llm, "is_websochat_stream_enabled", return_value=False),
-            patch.object(websochat_llm.httpx, "AsyncClient", _FakeGeminiAsyncClient),
+            patch.object(
+                websochat_llm, "get_http_client", return_value=_FakeGeminiAsyncClient()
+            ),
         ):
             reply = await websochat_llm.call_websochat_gemini(
                 system_prompt="system",
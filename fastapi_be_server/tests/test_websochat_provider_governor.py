@@ -0,0 +1,276 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+from fastapi import status
+
+from app.exceptions import CustomResponseException
+from app.services.websochat import websochat_llm
+from app.services.websochat.websochat_provider_governor import (
+    WEBSOCHAT_CIRCUIT_CLOSED,
+    WEBSOCHAT_CIRCUIT_OPEN,
+    WebsochatProviderGovernor,
+)
+from app.services.websochat.websochat_stream import (
+    reset_websochat_stream_emitter,
+    set_websochat_stream_emitter,
+)
+
+
+def _reply_json(text: str) -> dict:
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+class _FaultyGemini:
+    """
+    장애를 주입하는 로컬 Gemini 대역 (httpx.MockTransport)
+    faults[operation] 의 앞에서부터 하나씩 꺼내 쓰고, 비면 latency 만큼 기다린 뒤 정상 응답한다.
+    fault: {"status": 503} / {"latency": 1.0} / {"error": httpx.ConnectError} / {"break_after_first_delta": True}
+    """
+
+    def __init__(self, *, latency: float = 0.0):
+        self.latency = latency
+        self.faults: dict[str, list[dict]] = {"generateContent": [], "streamGenerateContent": []}
+        self.calls: dict[str, int] = {"generateContent": 0, "streamGenerateContent": 0}
+        self.active = 0
+        self.peak_active = 0
+        self.cancelled = 0
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        operation = "streamGenerateContent" if ":streamGenerateContent" in request.url.path else "generateContent"
+        self.calls[operation] += 1
+        fault = self.faults[operation].pop(0) if self.faults[operation] else {}
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(fault.get("latency", self.latency))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        if "error" in fault:
+            raise fault["error"]("injected", request=request)
+        if "status" in fault:
+            return httpx.Response(fault["status"], json={"error": {"message": "injected"}})
+        if operation == "generateContent":
+            return httpx.Response(200, json=_reply_json(f"응답{self.calls[operation]}"))
+        return httpx.Response(200, content=self._sse(fault.get("break_after_first_delta", False)))
+
+    async def _sse(self, broken: bool):
+        yield f"data: {json.dumps(_reply_json('안녕'))}\n\n".encode()
+        if broken:
+            raise httpx.ReadError("injected")
+        yield f"data: {json.dumps(_reply_json('안녕하세요'))}\n\n".encode()
+
+
+def _governor(**kwargs) -> WebsochatProviderGovernor:
+    options = {
+        "max_in_flight": 8,
+        "queue_timeout": 1.0,
+        "max_attempts": 3,
+        "backoff_base": 0.01,
+        "backoff_max": 0.02,
+        "hedge_enabled": True,
+        "hedge_percentile": 95,
+        "hedge_min_samples": 5,
+        "hedge_min_delay": 0.01,
+        "failure_threshold": 5,
+        "open_seconds": 30,
+    }
+    options.update(kwargs)
+    return WebsochatProviderGovernor("gemini", **options)
+
+
+class WebsochatProviderGovernorTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.stub = _FaultyGemini()
+        self.client = self.stub.client()
+        self.governor = _governor()
+        self.patches = [
+            patch.object(websochat_llm.settings, "GEMINI_API_KEY", "test-key"),
+            patch.object(websochat_llm.settings, "WEBSOCHAT_GEMINI_MODEL", "test-model"),
+            patch.object(websochat_llm, "get_http_client", return_value=self.client),
+        ]
+        for item in self.patches:
+            item.start()
+
+    async def asyncTearDown(self):
+        for item in reversed(self.patches):
+            item.stop()
+        await self.client.aclose()
+
+    async def call(self, *, hedge: bool = False, governor: WebsochatProviderGovernor | None = None) -> str:
+        with patch.object(websochat_llm, "websochat_gemini_governor", governor or self.governor):
+            return await websochat_llm.call_websochat_gemini(
+                system_prompt="system",
+                messages=[{"role": "user", "parts": [{"text": "질문"}]}],
+                hedge=hedge,
+            )
+
+    async def call_streaming(self) -> tuple[str, list[str]]:
+        deltas: list[str] = []
+
+        async def _emit(text: str):
+            deltas.append(text)
+
+        tokens = set_websochat_stream_emitter(_emit)
+        try:
+            return await self.call(), deltas
+        finally:
+            reset_websochat_stream_emitter(tokens)
+
+    async def test_retries_transient_failures_before_the_request_reaches_the_model(self):
+        self.stub.faults["generateContent"] = [{"status": 503}, {"error": httpx.ConnectError}]
+
+        self.assertEqual(await self.call(), "응답3")
+        self.assertEqual(self.stub.calls["generateContent"], 3)
+        self.assertEqual(self.governor.metrics()["retries"], 2)
+        self.assertEqual(self.governor.state, WEBSOCHAT_CIRCUIT_CLOSED)
+
+    async def test_non_retryable_status_and_exhausted_retries_keep_error_codes(self):
+        self.stub.faults["generateContent"] = [{"status": 400}]
+        with self.assertRaises(CustomResponseException) as exc:
+            await self.call()
+        self.assertEqual(exc.exception.code, "AI_PROVIDER_UNAVAILABLE")
+        self.assertEqual(self.stub.calls["generateContent"], 1)
+
+        self.stub.faults["generateContent"] = [{"status": 429}] * 3
+        with self.assertRaises(CustomResponseException) as exc:
+            await self.call()
+        self.assertEqual(exc.exception.status_code, status.HTTP_502_BAD_GATEWAY)
+        self.assertEqual(exc.exception.code, "AI_PROVIDER_LIMITED")
+        self.assertEqual(self.stub.calls["generateContent"], 4)
+        self.assertEqual(self.governor.metrics()["gave_up"], 1)
+
+    async def test_stream_retries_only_before_the_first_delta(self):
+        self.stub.faults["streamGenerateContent"] = [{"status": 503}]
+        reply, deltas = await self.call_streaming()
+        self.assertEqual(reply, "안녕하세요")
+        self.assertEqual(deltas, ["안녕", "하세요"])
+        self.assertEqual(self.stub.calls["streamGenerateContent"], 2)
+
+        # 글자를 내보낸 뒤 끊기면 다시 스트리밍하지 않고 기존처럼 generateContent 로 넘어간다
+        self.stub.faults["streamGenerateContent"] = [{"break_after_first_delta": True}]
+        reply, deltas = await self.call_streaming()
+        self.assertEqual(deltas, ["안녕"])
+        self.assertEqual(reply, "응답1")
+        self.assertEqual(self.stub.calls["streamGenerateContent"], 3)
+        self.assertEqual(self.governor.metrics()["retries"], 1)
+
+    async def test_hedge_calls_never_stream(self):
+        reply, deltas = None, []
+
+        async def _emit(text: str):
+            deltas.append(text)
+
+        tokens = set_websochat_stream_emitter(_emit)
+        try:
+            reply = await self.call(hedge=True)
+        finally:
+            reset_websochat_stream_emitter(tokens)
+        self.assertEqual(reply, "응답1")
+        self.assertEqual(deltas, [])
+        self.assertEqual(self.stub.calls["streamGenerateContent"], 0)
+
+    async def test_in_flight_calls_are_bounded(self):
+        self.stub.latency = 0.05
+        governor = _governor(max_in_flight=2)
+
+        replies = await asyncio.gather(*(self.call(governor=governor) for _ in range(6)))
+
+        self.assertEqual(len(replies), 6)
+        self.assertEqual(self.stub.peak_active, 2)
+        self.assertEqual(governor.metrics()["max_in_flight"], 2)
+
+    async def test_waiting_for_a_slot_too_long_is_rejected_as_limited(self):
+        self.stub.latency = 0.3
+        governor = _governor(max_in_flight=1, queue_timeout=0.05)
+
+        results = await asyncio.gather(
+            self.call(governor=governor), self.call(governor=governor), return_exceptions=True
+        )
+
+        rejected = [item for item in results if isinstance(item, CustomResponseException)]
+        self.assertEqual(len(rejected), 1)
+        self.assertEqual(rejected[0].status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(rejected[0].code, "AI_PROVIDER_LIMITED")
+        self.assertEqual(self.stub.calls["generateContent"], 1)
+
+    async def test_slow_classification_call_is_hedged_after_latency_percentile(self):
+        self.stub.latency = 0.02
+        for _ in range(5):
+            await self.call(hedge=True)
+        self.assertIsNotNone(self.governor.hedge_delay())
+
+        self.stub.faults["generateContent"] = [{"latency": 2.0}]
+        started = time.perf_counter()
+        reply = await self.call(hedge=True)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(reply, "응답7")  # 늦게 보낸 hedge 응답을 쓴다
+        self.assertLess(elapsed, 0.5)
+        metrics = self.governor.metrics()
+        self.assertEqual(metrics["hedged"], 1)
+        self.assertEqual(metrics["hedge_won"], 1)
+        self.assertEqual(self.stub.cancelled, 1)  # 느린 원 요청은 취소된다
+        self.assertEqual(self.stub.active, 0)
+
+    async def test_no_hedge_without_enough_samples_or_for_generation_calls(self):
+        self.stub.faults["generateContent"] = [{"latency": 0.1}]
+        await self.call(hedge=True)
+        for _ in range(5):
+            await self.call()  # 생성 호출 지연은 hedge 기준에 넣지 않는다
+
+        self.assertIsNone(self.governor.hedge_delay())
+        self.assertEqual(self.governor.metrics().get("hedged", 0), 0)
+        self.assertEqual(self.stub.calls["generateContent"], 6)
+
+    async def test_circuit_opens_after_consecutive_failures_and_probes_after_cooldown(self):
+        governor = _governor(max_attempts=1, failure_threshold=2, open_seconds=0.1)
+        self.stub.faults["generateContent"] = [{"status": 503}, {"status": 503}]
+
+        for _ in range(2):
+            with self.assertRaises(CustomResponseException):
+                await self.call(governor=governor)
+        self.assertEqual(governor.state, WEBSOCHAT_CIRCUIT_OPEN)
+
+        with self.assertRaises(CustomResponseException) as exc:
+            await self.call(governor=governor)
+        self.assertEqual(exc.exception.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(exc.exception.code, "AI_PROVIDER_UNAVAILABLE")
+        self.assertEqual(self.stub.calls["generateContent"], 2)  # 열린 동안 provider 를 부르지 않는다
+
+        await asyncio.sleep(0.12)
+        self.stub.latency = 0.05
+        probe, during_probe = await asyncio.gather(
+            self.call(governor=governor), self.call(governor=governor), return_exceptions=True
+        )
+        self.assertEqual(probe, "응답3")
+        self.assertIsInstance(during_probe, CustomResponseException)  # 시험 호출은 하나만 보낸다
+        self.assertEqual(governor.state, WEBSOCHAT_CIRCUIT_CLOSED)
+        self.assertEqual(governor.metrics()["rejected_open"], 2)
+
+    async def test_failed_probe_reopens_the_circuit(self):
+        governor = _governor(max_attempts=3, failure_threshold=1, open_seconds=0.05)
+        self.stub.faults["generateContent"] = [{"status": 500}, {"status": 500}]
+
+        with self.assertRaises(CustomResponseException):
+            await self.call(governor=governor)
+        self.assertEqual(self.stub.calls["generateContent"], 1)  # 회로가 열리면 재시도하지 않는다
+
+        await asyncio.sleep(0.06)
+        with self.assertRaises(CustomResponseException):
+            await self.call(governor=governor)
+        self.assertEqual(governor.state, WEBSOCHAT_CIRCUIT_OPEN)
+        self.assertEqual(governor.metrics()["circuit_opened"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -80,16 +80,19 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
             ) as release_actor_lock,
             patch.object(
                 websochat_service,
-                "_acquire_websochat_actor_lock_on_connection",
+                "_acquire_websochat_actor_lock_on_lease",
                 new_callable=AsyncMock,
-                create=True,
-            ) as acquire_actor_lock_on_connection,
+            ) as acquire_actor_lock_on_lease,
             patch.object(
                 websochat_service,
-                "_release_websochat_actor_lock_on_connection",
+                "_release_websochat_actor_lock_on_lease",
                 new_callable=AsyncMock,
-                create=True,
-            ) as release_actor_lock_on_connection,
+            ) as release_actor_lock_on_lease,
+            patch.object(
+                websochat_service,
+                "_ensure_websochat_turn_lease_held",
+                new_callable=AsyncMock,
+            ) as ensure_lease_held,
             patch.object(
                 websochat_service,
                 "_get_websochat_latest_visible_episode_no",
@@ -128,7 +131,7 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
             }
             resolve_prompt_scope.return_value = None
             acquire_session_lock.return_value = session_lock
-            acquire_actor_lock_on_connection.return_value = True
+            acquire_actor_lock_on_lease.return_value = True
             latest_visible_episode_no.return_value = 3
             get_existing_turn_messages.return_value = None
             resolve_charge_required.return_value = False
@@ -143,17 +146,18 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result["data"]["sessionId"], 123)
         acquire_actor_lock.assert_not_awaited()
         release_actor_lock.assert_not_awaited()
-        acquire_actor_lock_on_connection.assert_awaited_once_with(
+        acquire_actor_lock_on_lease.assert_awaited_once_with(
             user_id=321,
             guest_key=None,
-            conn=session_lock,
+            lease=session_lock,
         )
-        release_actor_lock_on_connection.assert_awaited_once_with(
+        release_actor_lock_on_lease.assert_awaited_once_with(
             user_id=321,
             guest_key=None,
-            conn=session_lock,
+            lease=session_lock,
         )
-        release_session_lock.assert_awaited_once_with(session_id=123, conn=session_lock)
+        release_session_lock.assert_awaited_once_with(session_id=123, lease=session_lock)
+        ensure_lease_held.assert_awaited_once_with(session_lock, db)
         self.assertTrue(db.committed)
         self.assertFalse(db.rolled_back)
 
@@ -207,16 +211,19 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
             ) as release_actor_lock,
             patch.object(
                 websochat_service,
-                "_acquire_websochat_actor_lock_on_connection",
+                "_acquire_websochat_actor_lock_on_lease",
                 new_callable=AsyncMock,
-                create=True,
-            ) as acquire_actor_lock_on_connection,
+            ) as acquire_actor_lock_on_lease,
             patch.object(
                 websochat_service,
-                "_release_websochat_actor_lock_on_connection",
+                "_release_websochat_actor_lock_on_lease",
                 new_callable=AsyncMock,
-                create=True,
-            ) as release_actor_lock_on_connection,
+            ) as release_actor_lock_on_lease,
+            patch.object(
+                websochat_service,
+                "_ensure_websochat_turn_lease_held",
+                new_callable=AsyncMock,
+            ) as ensure_lease_held,
             patch.object(
                 websochat_service,
                 "_get_websochat_latest_visible_episode_no",
@@ -250,7 +257,7 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
             }
             resolve_prompt_scope.return_value = None
             acquire_session_lock.return_value = session_lock
-            acquire_actor_lock_on_connection.return_value = False
+            acquire_actor_lock_on_lease.return_value = False
             latest_visible_episode_no.return_value = 3
             get_existing_turn_messages.return_value = None
 
@@ -267,16 +274,31 @@ class WebsochatActorLockTests(unittest.IsolatedAsyncioTestCase):
         resolve_charge_required.assert_not_awaited()
         acquire_actor_lock.assert_not_awaited()
         release_actor_lock.assert_not_awaited()
-        acquire_actor_lock_on_connection.assert_awaited_once_with(
+        acquire_actor_lock_on_lease.assert_awaited_once_with(
             user_id=321,
             guest_key=None,
-            conn=session_lock,
+            lease=session_lock,
         )
-        release_actor_lock_on_connection.assert_not_awaited()
-        release_session_lock.assert_awaited_once_with(session_id=123, conn=session_lock)
+        release_actor_lock_on_lease.assert_not_awaited()
+        release_session_lock.assert_awaited_once_with(session_id=123, lease=session_lock)
         self.assertFalse(db.committed)
         self.assertTrue(db.rolled_back)
 
 
+    async def test_lost_turn_lease_is_rejected_before_persisting(self):
+        lease = websochat_service.WebsochatTurnLease(token="token", names=["websochat-session:123"])
+        with patch.object(
+            websochat_service.websochat_turn_locks,
+            "ensure_held",
+            new_callable=AsyncMock,
+            side_effect=websochat_service.WebsochatTurnLeaseLostError(lease.names),
+        ):
+            with self.assertRaises(CustomResponseException) as exc:
+                await websochat_service._ensure_websochat_turn_lease_held(lease, _FakeDb())
+
+        self.assertEqual(exc.exception.status_code, status.HTTP_409_CONFLICT)
+        self.assertIn("다른 메시지를 처리 중", exc.exception.message)
+
+
 if __name__ == "__main__":
     unittest.main()
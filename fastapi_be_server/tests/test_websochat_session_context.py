@@ -0,0 +1,342 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.websochat import websochat_service
+from app.services.websochat.websochat_game_memory import (
+    _normalize_websochat_session_memory,
+    _serialize_websochat_session_memory,
+)
+from app.services.websochat.websochat_session_context import (
+    WebsochatSessionContextCache,
+    update_websochat_session_context,
+)
+from app.services.websochat.websochat_turn_prep import WebsochatTurnPrepTrace
+
+SCHEMA = [
+    """
+    CREATE TABLE tb_story_agent_session (
+        session_id INTEGER PRIMARY KEY,
+        title TEXT NOT NULL DEFAULT '새 대화',
+        session_memory_json TEXT NULL,
+        context_version INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE tb_story_agent_message (
+        message_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL
+    )
+    """,
+]
+SESSION_ID = 1
+HISTORY_LIMIT = 6
+
+
+class _Worker:
+    """
+    워커 하나 대역: 자기 엔진(커넥션 풀)과 자기 세션 문맥 캐시를 가진다.
+    post_message 와 같은 순서로 세션 행 조회 -> 메모리/최근 대화 -> 메시지 INSERT + 세션 UPDATE -> commit -> 캐시 반영.
+    """
+
+    def __init__(self, db_url: str):
+        self.engine = create_async_engine(db_url)
+        self.cache = WebsochatSessionContextCache(max_sessions=16, enabled=True)
+
+    async def load(self) -> tuple[int, dict, list[dict]]:
+        async with AsyncSession(self.engine) as db:
+            row = (
+                await db.execute(
+                    text(
+                        "SELECT session_memory_json, context_version FROM tb_story_agent_session WHERE session_id = :session_id"
+                    ),
+                    {"session_id": SESSION_ID},
+                )
+            ).mappings().one()
+            version = int(row["context_version"])
+            memory = self.cache.resolve_memory(SESSION_ID, version, row["session_memory_json"])
+            recent = await self.cache.recent_messages(
+                SESSION_ID,
+                version,
+                lambda: websochat_service._get_websochat_recent_message_rows(session_id=SESSION_ID, db=db),
+                limit=HISTORY_LIMIT,
+            )
+        return version, memory, recent
+
+    async def write(self, version: int, memory: dict, messages: list[tuple[str, str]]):
+        async with AsyncSession(self.engine) as db:
+            for role, content in messages:
+                await db.execute(
+                    text(
+                        "INSERT INTO tb_story_agent_message (session_id, role, content) VALUES (:session_id, :role, :content)"
+                    ),
+                    {"session_id": SESSION_ID, "role": role, "content": content},
+                )
+            write = await update_websochat_session_context(
+                session_id=SESSION_ID,
+                context_version=version,
+                session_memory=memory,
+                set_clause="title = :title",
+                params={"title": messages[0][1][:20] if messages else "새 대화"},
+                db=db,
+                cache=self.cache,
+            )
+            await db.commit()
+        self.cache.apply_write(
+            write,
+            history_rows=[websochat_service._build_websochat_history_row(role, content) for role, content in messages],
+        )
+        return write
+
+    async def turn(self, index: int, mutate, *, noncanonical: bool = False):
+        version, memory, _ = await self.load()
+        mutate(memory)
+        qa_action_key = "next_episode_write" if noncanonical else None
+        messages = [
+            ("user", websochat_service._mark_websochat_noncanonical_message(f"질문 {index}", qa_action_key=qa_action_key)),
+            (
+                "assistant",
+                websochat_service._mark_websochat_noncanonical_message(f"답변 {index}", qa_action_key=qa_action_key),
+            ),
+        ]
+        return await self.write(version, memory, messages)
+
+
+class WebsochatSessionContextTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite+aiosqlite:///{os.path.join(self.tmp.name, 'session.db')}"
+        self.engine = create_async_engine(self.db_url)
+        async with self.engine.begin() as conn:
+            for statement in SCHEMA:
+                await conn.execute(text(statement))
+        self.workers = [_Worker(self.db_url), _Worker(self.db_url)]
+        self.history_limit = patch.object(websochat_service, "WEBSOCHAT_MAX_HISTORY_MESSAGES", HISTORY_LIMIT)
+        self.history_limit.start()
+
+    async def asyncTearDown(self):
+        self.history_limit.stop()
+        for engine in [self.engine, *(worker.engine for worker in self.workers)]:
+            await engine.dispose()
+        self.tmp.cleanup()
+
+    async def create_session(self, session_memory_json: str | None):
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                text("INSERT INTO tb_story_agent_session (session_id, session_memory_json) VALUES (:session_id, :memory)"),
+                {"session_id": SESSION_ID, "memory": session_memory_json},
+            )
+
+    async def fresh_load(self) -> tuple[int, dict, list[dict], str | None]:
+        """캐시 없이 DB 에서 바로 읽은 세션 문맥"""
+        async with AsyncSession(self.engine) as db:
+            row = (
+                await db.execute(
+                    text(
+                        "SELECT session_memory_json, context_version FROM tb_story_agent_session WHERE session_id = :session_id"
+                    ),
+                    {"session_id": SESSION_ID},
+                )
+            ).mappings().one()
+            recent = await websochat_service._get_websochat_recent_messages(session_id=SESSION_ID, db=db)
+        return (
+            int(row["context_version"]),
+            _normalize_websochat_session_memory(row["session_memory_json"]),
+            recent,
+            row["session_memory_json"],
+        )
+
+    async def assert_workers_match_db(self):
+        version, memory, recent, _ = await self.fresh_load()
+        for worker in self.workers:
+            self.assertEqual(await worker.load(), (version, memory, recent))
+
+    async def test_two_workers_stay_coherent_across_turns(self):
+        await self.create_session(_serialize_websochat_session_memory({"read_episode_to": 3}))
+        worker_a, worker_b = self.workers
+
+        def _note(index):
+            def _mutate(memory):
+                memory["qa_recent_notes"] = [f"메모 {index}", *memory["qa_recent_notes"]]
+
+            return _mutate
+
+        def _read_more(memory):
+            memory["read_episode_to"] = int(memory["read_episode_to"] or 0) + 1
+
+        def _start_rp(memory):
+            memory.update(active_character="hero", active_character_label="주인공", rp_mode="free", active_mode="rp")
+
+        plan = [
+            (worker_a, _note(1), False),
+            (worker_a, _read_more, False),
+            (worker_b, _start_rp, False),
+            (worker_b, _note(2), True),
+            (worker_a, _note(3), False),
+            (worker_b, _read_more, False),
+            (worker_a, _note(4), False),
+            (worker_a, _note(5), False),
+        ]
+        for index, (worker, mutate, noncanonical) in enumerate(plan, start=1):
+            write = await worker.turn(index, mutate, noncanonical=noncanonical)
+            self.assertEqual(write.to_version, write.from_version + 1)
+            await self.assert_workers_match_db()
+
+        version, memory, recent, _ = await self.fresh_load()
+        self.assertEqual(version, len(plan))
+        self.assertEqual(memory["read_episode_to"], 5)
+        self.assertEqual(memory["active_character"], "hero")
+        self.assertEqual(memory["qa_recent_notes"][:2], ["메모 5", "메모 4"])
+        # ring 은 최근 HISTORY_LIMIT 개 메시지만 들고, 대화 기록에서 빠지는 메시지는 내보내지 않는다
+        self.assertEqual([row["content"] for row in recent], ["질문 6", "답변 6", "질문 7", "답변 7", "질문 8", "답변 8"])
+
+        metrics_a, metrics_b = worker_a.cache.metrics(), worker_b.cache.metrics()
+        self.assertGreater(metrics_a["memory_hits"], 0)
+        self.assertGreater(metrics_a["history_hits"], 0)
+        self.assertGreater(metrics_b["stale"], 0)  # 다른 워커가 쓴 턴 뒤에는 캐시를 쓰지 않았다
+        self.assertGreater(metrics_a["delta_writes"] + metrics_b["delta_writes"], 0)
+        self.assertEqual(metrics_a.get("conflicts", 0) + metrics_b.get("conflicts", 0), 0)
+
+    async def test_delta_write_stores_the_same_memory_as_a_full_rewrite(self):
+        base = _normalize_websochat_session_memory(
+            {
+                "read_episode_to": 4,
+                "qa_recent_notes": ["처음 메모"],
+                "game_context": {"mode": "vs_game", "gender_scope": "male"},
+            }
+        )
+        await self.create_session(_serialize_websochat_session_memory(base))
+        worker = self.workers[0]
+        version, memory, _ = await worker.load()
+
+        memory["qa_recent_notes"] = ["새 메모", "처음 메모"]
+        memory["pending_qa_action_key"] = "predict"
+        memory["games"] = {
+            "vs_game": {"male": {"__pending__": {"mode": "direct_match", "question_index": 2, "answers": ["A", "B"]}}}
+        }
+        write = await worker.write(version, memory, [("user", "예상해줘"), ("assistant", "좋아요")])
+
+        expected = _normalize_websochat_session_memory(_serialize_websochat_session_memory(memory))
+        self.assertEqual(sorted(write.changed_keys), ["games", "pending_qa_action_key", "qa_recent_notes"])
+        self.assertNotIn("session_memory_json", write.params)
+        _, stored_memory, _, raw = await self.fresh_load()
+        self.assertEqual(stored_memory, expected)
+        self.assertEqual(json.loads(raw), expected)  # delta 뒤에도 문서는 정규화 결과 그대로다
+        self.assertEqual((await worker.load())[1], expected)
+
+        # 바뀐 키가 없으면 메모리는 쓰지 않고 버전만 올린다
+        version, memory, _ = await worker.load()
+        write = await worker.write(version, memory, [("user", "다음")])
+        self.assertEqual(write.changed_keys, [])
+        self.assertEqual(write.to_version, version + 1)
+        self.assertEqual((await self.fresh_load())[3], raw)
+
+    async def test_legacy_or_emptied_documents_are_rewritten_in_full(self):
+        # 정규화 전 값이 남은 문서에는 JSON_SET 을 쓰지 않는다
+        await self.create_session(json.dumps({"read_episode_to": "2", "read_scope_state": "weird"}))
+        worker = self.workers[0]
+        version, memory, _ = await worker.load()
+        memory["qa_recent_notes"] = ["메모"]
+        write = await worker.write(version, memory, [("user", "안녕")])
+        self.assertIsNone(write.changed_keys)
+        _, stored_memory, _, raw = await self.fresh_load()
+        self.assertEqual(raw, _serialize_websochat_session_memory(memory))
+
+        # 저장할 상태가 없어지면 기존처럼 NULL 로 둔다
+        version, memory, _ = await worker.load()
+        self.assertEqual(memory, stored_memory)
+        write = await worker.write(version, _normalize_websochat_session_memory(None), [("user", "초기화")])
+        self.assertIsNone(write.changed_keys)
+        self.assertIsNone((await self.fresh_load())[3])
+        await self.assert_workers_match_db()
+
+    async def test_concurrent_writer_falls_back_to_full_rewrite(self):
+        await self.create_session(_serialize_websochat_session_memory({"read_episode_to": 1}))
+        worker_a, worker_b = self.workers
+        stale_version, stale_memory, _ = await worker_a.load()
+
+        await worker_b.turn(1, lambda memory: memory.update(read_episode_to=7))
+        stale_memory["qa_recent_notes"] = ["늦게 쓴 메모"]
+        write = await worker_a.write(stale_version, stale_memory, [("user", "늦은 질문")])
+
+        self.assertIsNone(write.to_version)
+        self.assertEqual(worker_a.cache.metrics()["conflicts"], 1)
+        version, memory, recent, _ = await self.fresh_load()
+        self.assertEqual(version, stale_version + 2)
+        # 기존처럼 나중에 쓴 요청의 전체 메모리가 남는다
+        self.assertEqual(memory, _normalize_websochat_session_memory(_serialize_websochat_session_memory(stale_memory)))
+        self.assertEqual([row["content"] for row in recent][-1], "늦은 질문")
+        await self.assert_workers_match_db()
+
+    async def test_turn_prep_after_lease_sees_turn_committed_since_session_read(self):
+        await self.create_session(_serialize_websochat_session_memory({"read_episode_to": 2}))
+        worker_a, worker_b = self.workers
+        await worker_b.turn(1, lambda memory: None)
+        # B 가 세션 행을 읽은 뒤, 턴 잠금을 잡기 전에 A 가 턴을 저장한다
+        read_version, memory, _ = await worker_b.load()
+        await worker_a.turn(2, lambda memory: memory.update(read_episode_to=5))
+        stale = await worker_b.cache.recent_messages(
+            SESSION_ID, read_version, lambda: self.fail("ring 을 써야 한다"), limit=HISTORY_LIMIT
+        )
+        self.assertNotIn("질문 2", [row["content"] for row in stale])
+
+        with patch.object(websochat_service, "websochat_session_contexts", worker_b.cache):
+            async with AsyncSession(worker_b.engine) as db:
+                locked_version = await websochat_service._refresh_websochat_session_context_version(
+                    session_id=SESSION_ID,
+                    context_version=read_version,
+                    db=db,
+                )
+                steps = websochat_service._build_websochat_turn_prep_steps(
+                    session_id=SESSION_ID,
+                    normalized_memory=memory,
+                    product_row={"productId": 1},
+                    user_prompt="질문 3",
+                    load_rp_context=False,
+                    turn_trace=WebsochatTurnPrepTrace(label="test"),
+                    context_version=locked_version,
+                )
+                recent_step = next(step for step in steps if step.name == "recent_messages")
+                recent = await recent_step.run({}, db)
+
+        self.assertEqual(locked_version, read_version + 1)
+        self.assertEqual(recent, (await self.fresh_load())[2])
+        self.assertEqual([row["content"] for row in recent][-2:], ["질문 2", "답변 2"])
+
+        # 잠금 시점 버전으로 저장하므로 버전 경합 없이 이어 쓴다
+        memory["qa_recent_notes"] = ["B 메모"]
+        write = await worker_b.write(locked_version, memory, [("user", "질문 3"), ("assistant", "답변 3")])
+        self.assertEqual(write.to_version, locked_version + 1)
+        self.assertEqual(worker_b.cache.metrics().get("conflicts", 0), 0)
+        await self.assert_workers_match_db()
+
+    async def test_rolled_back_turn_leaves_cache_at_committed_version(self):
+        await self.create_session(_serialize_websochat_session_memory({"read_episode_to": 2}))
+        worker = self.workers[0]
+        version, memory, _ = await worker.load()
+        memory["read_episode_to"] = 9
+        async with AsyncSession(worker.engine) as db:
+            await update_websochat_session_context(
+                session_id=SESSION_ID,
+                context_version=version,
+                session_memory=memory,
+                set_clause="title = :title",
+                params={"title": "실패한 턴"},
+                db=db,
+                cache=worker.cache,
+            )
+            await db.rollback()
+
+        self.assertEqual((await worker.load())[1]["read_episode_to"], 2)
+        await self.assert_workers_match_db()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+import asyncio
+import json
+import time
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+from app.routers.websochat import websochat_command
+from app.schemas.websochat import PostWebsochatMessageReqBody
+from app.services.websochat.websochat_sse import (
+    WebsochatSseResponse,
+    WebsochatSseStats,
+    encode_websochat_sse_delta,
+    encode_websochat_sse_event,
+)
+from app.services.websochat.websochat_stream import emit_websochat_stream_delta
+
+
+def _parse_frames(body: bytes) -> list[tuple[str, object]]:
+    """SSE 본문 -> [(event, data)], keep-alive 주석은 (":", None)"""
+    frames = []
+    for block in body.decode().split("\n\n"):
+        if not block:
+            continue
+        if block.startswith(":"):
+            frames.append((":", None))
+            continue
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        frames.append((lines["event"], json.loads(lines["data"])))
+    return frames
+
+
+class _AsgiClient:
+    """ASGI 응답을 직접 호출하는 클라이언트 대역 (send_delay 로 느린 클라이언트, disconnect_after 로 끊김)"""
+
+    def __init__(self, *, send_delay: float = 0.0, disconnect_after: float | None = None):
+        self.send_delay = send_delay
+        self.disconnect_after = disconnect_after
+        self.messages: list[dict] = []
+        self.finished = asyncio.Event()
+
+    async def receive(self):
+        if self.disconnect_after is None:
+            await self.finished.wait()
+        else:
+            await asyncio.sleep(self.disconnect_after)
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.body" and self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.messages.append(message)
+
+    async def run(self, response) -> list[tuple[str, object]]:
+        scope = {"type": "http", "method": "POST", "path": "/", "headers": []}
+        try:
+            await response(scope, self.receive, self.send)
+        finally:
+            self.finished.set()
+        return _parse_frames(self.body)
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(message.get("body", b"") for message in self.messages if message["type"] == "http.response.body")
+
+    @property
+    def body_messages(self) -> list[dict]:
+        return [message for message in self.messages if message["type"] == "http.response.body"]
+
+
+def _response(producer, **kwargs) -> WebsochatSseResponse:
+    options = {
+        "queue_size": 8,
+        "coalesce_seconds": 0.01,
+        "max_frame_chars": 512,
+        "keep_alive_seconds": 10,
+        "stats": WebsochatSseStats(),
+    }
+    options.update(kwargs)
+    return WebsochatSseResponse(producer, **options)
+
+
+class WebsochatSseResponseTest(unittest.IsolatedAsyncioTestCase):
+    def test_frames_are_encoded_once_in_the_existing_wire_format(self):
+        self.assertEqual(encode_websochat_sse_delta('안녕 "세계"'), 'event: assistant_delta\ndata: {"delta": "안녕 \\"세계\\""}\n\n'.encode())
+        self.assertEqual(
+            encode_websochat_sse_event("assistant_started", {"sessionId": 1}),
+            b'event: assistant_started\ndata: {"sessionId": 1}\n\n',
+        )
+
+    async def test_small_deltas_are_coalesced_and_each_frame_is_one_send(self):
+        async def _produce(channel):
+            await channel.send_event("assistant_started", {"sessionId": 1})
+            for index in range(200):
+                await channel.send_delta(f"{index % 10}")
+                if index % 50 == 49:
+                    await asyncio.sleep(0.03)  # 모델 출력 사이 간격
+            await channel.send_event("assistant_completed", {"ok": True})
+
+        response = _response(_produce)
+        client = _AsgiClient()
+        frames = await client.run(response)
+
+        self.assertEqual(frames[0], ("assistant_started", {"sessionId": 1}))
+        self.assertEqual(frames[-2:], [("assistant_completed", {"ok": True}), ("done", {})])
+        deltas = [data["delta"] for event, data in frames if event == "assistant_delta"]
+        self.assertEqual("".join(deltas), "0123456789" * 20)
+        self.assertLessEqual(len(deltas), 8)
+        self.assertEqual(len(client.body_messages), len(frames) + 1)  # 프레임당 send 한 번 + 종료
+        self.assertFalse(client.body_messages[-1]["more_body"])
+        self.assertEqual(response.stats.metrics()["deltas"], 200)
+
+    async def test_long_text_is_split_by_max_frame_chars(self):
+        async def _produce(channel):
+            await channel.send_delta("가" * 1100)
+
+        frames = await _AsgiClient().run(_response(_produce))
+
+        self.assertEqual([len(data["delta"]) for event, data in frames if event == "assistant_delta"], [512, 512, 76])
+
+    async def test_slow_client_applies_backpressure_to_the_producer(self):
+        produced = 0
+        sent_at_produce: list[int] = []
+        client = _AsgiClient(send_delay=0.01)
+
+        async def _produce(channel):
+            nonlocal produced
+            for _ in range(40):
+                await channel.send_event("assistant_progress", {"n": produced})
+                produced += 1
+                sent_at_produce.append(len(client.body_messages))
+
+        response = _response(_produce, queue_size=4)
+        frames = await client.run(response)
+
+        self.assertEqual(len(frames), 41)
+        # 생산자는 클라이언트보다 큐 크기 + writer 가 들고 있는 1개 이상 앞서지 못한다
+        self.assertLessEqual(max(n + 1 - sent for n, sent in enumerate(sent_at_produce)), 4 + 2)
+        self.assertGreater(response.stats.metrics()["backpressure_waits"], 0)
+
+    async def test_disconnect_cancels_the_producer_immediately(self):
+        llm_cancelled = asyncio.Event()
+
+        async def _produce(channel):
+            await channel.send_delta("앞부분")
+            try:
+                await asyncio.sleep(30)  # 진행 중인 LLM 스트림
+            except asyncio.CancelledError:
+                llm_cancelled.set()
+                raise
+
+        response = _response(_produce)
+        started = time.perf_counter()
+        frames = await _AsgiClient(disconnect_after=0.05).run(response)
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertTrue(llm_cancelled.is_set())
+        self.assertEqual(frames, [("assistant_delta", {"delta": "앞부분"})])  # done 을 보내지 않는다
+        self.assertEqual(response.stats.metrics()["disconnected"], 1)
+
+    async def test_keep_alive_while_waiting_for_the_model(self):
+        async def _produce(channel):
+            await asyncio.sleep(0.12)
+            await channel.send_delta("늦은 답변")
+
+        frames = await _AsgiClient().run(_response(_produce, keep_alive_seconds=0.05))
+
+        self.assertEqual(frames[:2], [(":", None), (":", None)])
+        self.assertEqual(frames[-2:], [("assistant_delta", {"delta": "늦은 답변"}), ("done", {})])
+
+
+class WebsochatStreamRouteTest(unittest.IsolatedAsyncioTestCase):
+    async def _stream(self, fake_post_message, **client_kwargs):
+        @asynccontextmanager
+        async def _fake_session():
+            yield object()
+
+        req_body = PostWebsochatMessageReqBody(client_message_id="client-1", content="안녕")
+        with (
+            patch.object(websochat_command, "likenovel_db_session", _fake_session),
+            patch.object(websochat_command.websochat_service, "post_message", fake_post_message),
+        ):
+            response = await websochat_command.post_websochat_message_stream(
+                session_id=7, req_body=req_body, user={"sub": "kc-user"}
+            )
+            client = _AsgiClient(**client_kwargs)
+            return response, await client.run(response)
+
+    async def test_llm_deltas_reach_the_client_without_rechunking(self):
+        async def fake_post_message(**kwargs):
+            await emit_websochat_stream_delta("첫 문장입니다. ")
+            await emit_websochat_stream_delta("두 번째 문장입니다.")
+            return {"data": {"sessionId": 7, "reply": "첫 문장입니다. 두 번째 문장입니다."}}
+
+        response, frames = await self._stream(fake_post_message)
+
+        self.assertEqual(response.headers["content-type"], "text/event-stream; charset=utf-8")
+        self.assertEqual(response.headers["x-accel-buffering"], "no")
+        self.assertEqual(frames[0], ("assistant_started", {"sessionId": 7, "clientMessageId": "client-1"}))
+        self.assertEqual(frames[1], ("assistant_delta", {"delta": "첫 문장입니다. 두 번째 문장입니다."}))
+        self.assertEqual(frames[2][0], "assistant_completed")
+        self.assertEqual(frames[3], ("done", {}))
+
+    async def test_client_disconnect_cancels_post_message(self):
+        cancelled = asyncio.Event()
+
+        async def fake_post_message(**kwargs):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        _, frames = await self._stream(fake_post_message, disconnect_after=0.05)
+
+        self.assertTrue(cancelled.is_set())
+        self.assertEqual([event for event, _ in frames], ["assistant_started"])
+
+
+if __name__ == "__main__":
+    unittest.main()
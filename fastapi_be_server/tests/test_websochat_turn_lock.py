@@ -0,0 +1,216 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.websochat.websochat_turn_lock import WebsochatTurnLeaseLostError, WebsochatTurnLockManager
+
+SCHEMA = """
+CREATE TABLE tb_story_agent_turn_lease (
+    lock_name TEXT PRIMARY KEY,
+    holder_token TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+)
+"""
+GENERATION_SECONDS = 0.2
+
+
+class _PoolUsage:
+    """풀에서 빌려 간 커넥션 수와 최댓값"""
+
+    def __init__(self, engine):
+        self.current = 0
+        self.peak = 0
+        event.listen(engine.sync_engine, "checkout", self._checkout)
+        event.listen(engine.sync_engine, "checkin", self._checkin)
+
+    def _checkout(self, *args):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    def _checkin(self, *args):
+        self.current -= 1
+
+
+class WebsochatTurnLockTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite+aiosqlite:///{os.path.join(self.tmp.name, 'lease.db')}"
+        self.engines = []
+        self.engine = self.create_engine()
+        async with self.engine.begin() as conn:
+            await conn.execute(text(SCHEMA))
+
+    async def asyncTearDown(self):
+        for engine in self.engines:
+            await engine.dispose()
+        self.tmp.cleanup()
+
+    def create_engine(self, **kwargs):
+        engine = create_async_engine(self.db_url, **kwargs)
+        self.engines.append(engine)
+        return engine
+
+    async def lease_rows(self):
+        async with self.engine.connect() as conn:
+            result = await conn.execute(text("SELECT lock_name, holder_token FROM tb_story_agent_turn_lease"))
+            return {row.lock_name: row.holder_token for row in result}
+
+    async def test_same_worker_contention_is_rejected_without_db(self):
+        locks = WebsochatTurnLockManager(engine=self.engine, ttl=30, renew_interval=10)
+        pool = _PoolUsage(self.engine)
+
+        lease = await locks.acquire("websochat-session:1")
+        checkouts_after_first = pool.peak
+        self.assertIsNotNone(lease)
+        self.assertIsNone(await locks.acquire("websochat-session:1"))
+        self.assertTrue(await locks.acquire_on(lease, "websochat-actor:user:7"))
+        self.assertFalse(await locks.acquire_on(lease, "websochat-actor:user:7"))
+
+        self.assertEqual(locks.metrics()["busy_local"], 2)
+        self.assertEqual(locks.metrics()["held"], 2)
+        self.assertEqual(pool.current, 0)  # 잠금을 잡고 있는 동안 커넥션을 쥐고 있지 않다
+        self.assertEqual(pool.peak, checkouts_after_first)
+        self.assertEqual(
+            await self.lease_rows(),
+            {"websochat-session:1": lease.token, "websochat-actor:user:7": lease.token},
+        )
+
+        await locks.release(lease, "websochat-actor:user:7")
+        await locks.release(lease, "websochat-session:1")
+        self.assertEqual(await self.lease_rows(), {})
+        self.assertIsNone(lease.heartbeat)
+        self.assertEqual(locks.metrics()["held"], 0)
+
+    async def test_other_worker_is_excluded_until_release(self):
+        worker_a = WebsochatTurnLockManager(engine=self.engine, ttl=30, renew_interval=10)
+        worker_b = WebsochatTurnLockManager(engine=self.create_engine(), ttl=30, renew_interval=10)
+
+        lease = await worker_a.acquire("websochat-session:1")
+        self.assertIsNone(await worker_b.acquire("websochat-session:1"))
+        self.assertEqual(worker_b.metrics()["busy_db"], 1)
+        other = await worker_b.acquire("websochat-session:2")
+        self.assertIsNotNone(other)
+
+        await worker_a.release(lease, "websochat-session:1")
+        retry = await worker_b.acquire("websochat-session:1")
+        self.assertIsNotNone(retry)
+        await worker_b.release(retry, "websochat-session:1")
+        await worker_b.release(other, "websochat-session:2")
+
+    async def test_heartbeat_keeps_lease_and_crashed_worker_lease_expires(self):
+        worker_a = WebsochatTurnLockManager(engine=self.engine, ttl=0.3, renew_interval=0.1)
+        worker_b = WebsochatTurnLockManager(engine=self.create_engine(), ttl=0.3, renew_interval=0.1)
+
+        lease = await worker_a.acquire("websochat-session:1")
+        await asyncio.sleep(0.6)  # ttl 보다 길게 생성 중이어도 연장된다
+        self.assertIsNone(await worker_b.acquire("websochat-session:1"))
+        self.assertGreaterEqual(worker_a.metrics()["renewed"], 3)
+
+        # 워커가 죽으면 연장이 멈추고 ttl 뒤에 다른 워커가 가져간다
+        lease.heartbeat.cancel()
+        await asyncio.sleep(0.4)
+        taken = await worker_b.acquire("websochat-session:1")
+        self.assertIsNotNone(taken)
+        self.assertEqual(worker_b.metrics()["taken_over"], 1)
+        self.assertEqual(await self.lease_rows(), {"websochat-session:1": taken.token})
+
+        # 늦게 돌아온 워커의 해제는 새 주인의 lease 를 지우지 않는다
+        await worker_a.release(lease, "websochat-session:1")
+        self.assertEqual(await self.lease_rows(), {"websochat-session:1": taken.token})
+        await worker_b.release(taken, "websochat-session:1")
+
+    async def test_heartbeat_reports_lost_lease(self):
+        locks = WebsochatTurnLockManager(engine=self.engine, ttl=30, renew_interval=0.05)
+        lease = await locks.acquire("websochat-session:1")
+        async with self.engine.begin() as conn:
+            await conn.execute(text("DELETE FROM tb_story_agent_turn_lease"))
+        await asyncio.sleep(0.15)
+
+        self.assertTrue(lease.lost)
+        self.assertEqual(locks.metrics()["lost"], 1)
+        await locks.release(lease, "websochat-session:1")
+
+    async def test_ensure_held_fences_persistence_after_takeover(self):
+        worker_a = WebsochatTurnLockManager(engine=self.engine, ttl=30, renew_interval=10)
+        worker_b = WebsochatTurnLockManager(engine=self.create_engine(), ttl=30, renew_interval=10)
+        lease = await worker_a.acquire("websochat-session:1")
+        self.assertTrue(await worker_a.acquire_on(lease, "websochat-actor:user:7"))
+
+        async with AsyncSession(self.engine) as db:
+            await worker_a.ensure_held(lease, db)
+
+        # 연장이 멈춘 사이 만료되어 다른 워커가 세션 잠금을 가져갔다 (heartbeat 는 아직 모른다)
+        async with self.engine.begin() as conn:
+            await conn.execute(text("UPDATE tb_story_agent_turn_lease SET expires_at = '2000-01-01 00:00:00'"))
+        taken = await worker_b.acquire("websochat-session:1")
+        self.assertIsNotNone(taken)
+        self.assertFalse(lease.lost)
+
+        async with AsyncSession(self.engine) as db:
+            with self.assertRaises(WebsochatTurnLeaseLostError):
+                await worker_a.ensure_held(lease, db)
+        self.assertTrue(lease.lost)
+        self.assertEqual(worker_a.metrics()["lost_before_commit"], 1)
+
+        await worker_a.release(lease, "websochat-actor:user:7")
+        await worker_a.release(lease, "websochat-session:1")
+        await worker_b.release(taken, "websochat-session:1")
+        self.assertEqual(await self.lease_rows(), {})
+
+    async def _run_chats(self, concurrency: int, *, pinned: bool) -> tuple[int, int]:
+        """동시 대화 concurrency 개를 돌리고 (풀 사용 최댓값, 동시에 생성 중이던 대화 수 최댓값) 을 돌려준다"""
+        pool_size = concurrency if pinned else 2
+        engine = self.create_engine(pool_size=pool_size, max_overflow=0, pool_timeout=5)
+        locks = WebsochatTurnLockManager(engine=engine, ttl=30, renew_interval=GENERATION_SECONDS / 2)
+        pool = _PoolUsage(engine)
+        generating = 0
+        peak_generating = 0
+        all_started = asyncio.Event()
+
+        async def _generate():
+            nonlocal generating, peak_generating
+            generating += 1
+            peak_generating = max(peak_generating, generating)
+            if peak_generating == concurrency:
+                all_started.set()
+            # 모든 대화가 잠금을 잡은 채 동시에 생성 중인 구간을 만든다
+            await asyncio.wait_for(all_started.wait(), timeout=10)
+            await asyncio.sleep(GENERATION_SECONDS)
+            generating -= 1
+
+        async def _pinned_chat(chat_no: int):
+            # 기존 GET_LOCK 방식처럼 턴 내내 커넥션 하나를 붙잡는다
+            async with engine.connect():
+                await _generate()
+
+        async def _leased_chat(chat_no: int):
+            lease = await locks.acquire(f"websochat-session:{chat_no}")
+            self.assertIsNotNone(lease)
+            self.assertTrue(await locks.acquire_on(lease, f"websochat-actor:user:{chat_no}"))
+            try:
+                await _generate()
+            finally:
+                await locks.release(lease, f"websochat-actor:user:{chat_no}")
+                await locks.release(lease, f"websochat-session:{chat_no}")
+
+        chat = _pinned_chat if pinned else _leased_chat
+        await asyncio.gather(*(chat(chat_no) for chat_no in range(concurrency)))
+        return pool.peak, peak_generating
+
+    async def test_load_pool_usage_stays_flat_as_concurrent_chats_grow(self):
+        for concurrency in (5, 20, 60):
+            with self.subTest(concurrency=concurrency):
+                leased_peak, leased_generating = await self._run_chats(concurrency, pinned=False)
+                pinned_peak, _ = await self._run_chats(concurrency, pinned=True)
+
+                self.assertEqual(leased_generating, concurrency)
+                self.assertLessEqual(leased_peak, 2)  # 풀 크기 2 로 모든 대화가 동시에 생성된다
+                self.assertEqual(pinned_peak, concurrency)
+
+
+if __name__ == "__main__":
+    unittest.main()
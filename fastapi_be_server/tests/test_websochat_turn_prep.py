@@ -0,0 +1,317 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from app.services.websochat import websochat_service, websochat_turn_prep
+from app.services.websochat.websochat_turn_prep import (
+    WebsochatTurnPrepTrace,
+    WebsochatTurnStep,
+    run_websochat_turn_steps,
+)
+
+# 가짜 지연 (초)
+DB_LATENCY = 0.06
+LLM_LATENCY = 0.2
+SCOPE_LATENCY = 0.15
+
+
+class _FakeSession:
+    """세션마다 동시에 쿼리 하나만 허용하는 AsyncSession 대역"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy = False
+        self.closed = False
+
+    async def query(self, latency: float):
+        if self.busy:
+            raise AssertionError(f"{self.name} 세션에서 쿼리가 겹쳤습니다")
+        self.busy = True
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            self.busy = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+class _SessionFactory:
+    def __init__(self):
+        self.sessions: list[_FakeSession] = []
+
+    def __call__(self):
+        session = _FakeSession(f"step-{len(self.sessions)}")
+        self.sessions.append(session)
+        return session
+
+
+def _sleep_step(name: str, latency: float, *, deps=(), uses_db=False, value=None) -> WebsochatTurnStep:
+    async def _run(results, db):
+        if uses_db:
+            await db.query(latency)
+        else:
+            await asyncio.sleep(latency)
+        return value if value is not None else name
+
+    return WebsochatTurnStep(name=name, run=_run, deps=tuple(deps), uses_db=uses_db)
+
+
+class WebsochatTurnStepRunnerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_independent_steps_run_concurrently_on_their_own_sessions(self):
+        factory = _SessionFactory()
+        shared_db = _FakeSession("request")
+        trace = WebsochatTurnPrepTrace(label="test")
+        steps = [
+            _sleep_step("a", DB_LATENCY, uses_db=True),
+            _sleep_step("b", DB_LATENCY, uses_db=True),
+            _sleep_step("c", LLM_LATENCY, deps=("a",)),
+            _sleep_step("d", DB_LATENCY, deps=("a", "b"), uses_db=True),
+        ]
+
+        started = time.perf_counter()
+        results = await run_websochat_turn_steps(
+            steps, db=shared_db, trace=trace, parallel=True, session_factory=factory
+        )
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(results, {"a": "a", "b": "b", "c": "c", "d": "d"})
+        self.assertEqual(len(factory.sessions), 2)  # 첫 DB 단계만 요청 세션을 쓴다
+        self.assertTrue(all(session.closed for session in factory.sessions))
+        self.assertLess(elapsed, DB_LATENCY + LLM_LATENCY + 0.08)
+        self.assertAlmostEqual(trace.critical_path_ms(), (DB_LATENCY + LLM_LATENCY) * 1000, delta=40)
+        self.assertAlmostEqual(trace.sequential_ms(), (DB_LATENCY * 3 + LLM_LATENCY) * 1000, delta=60)
+
+    async def test_extra_sessions_are_capped_per_worker(self):
+        factory = _SessionFactory()
+        shared_db = _FakeSession("request")
+        slots = websochat_turn_prep.WebsochatTurnDbSlots(limit=1)
+        steps = [_sleep_step(name, DB_LATENCY, uses_db=True) for name in ("a", "b", "c", "d")]
+
+        with patch.object(websochat_turn_prep, "websochat_turn_db_slots", slots):
+            results = await run_websochat_turn_steps(
+                steps,
+                db=shared_db,
+                trace=WebsochatTurnPrepTrace(label="test"),
+                parallel=True,
+                session_factory=factory,
+            )
+
+        # 자리가 없는 단계는 요청 세션에서 차례로 실행 (_FakeSession 이 쿼리 겹침을 막는다)
+        self.assertEqual(set(results), {"a", "b", "c", "d"})
+        self.assertEqual(len(factory.sessions), 1)
+        self.assertEqual(slots.metrics()["in_use"], 0)
+        self.assertEqual(slots.metrics()["shared_fallbacks"], 2)
+
+    async def test_sequential_mode_keeps_declared_order_on_request_session(self):
+        factory = _SessionFactory()
+        order = []
+
+        def _step(name, deps=()):
+            async def _run(results, db):
+                order.append(name)
+                return db
+
+            return WebsochatTurnStep(name=name, run=_run, deps=deps, uses_db=True)
+
+        shared_db = _FakeSession("request")
+        results = await run_websochat_turn_steps(
+            [_step("a"), _step("b"), _step("c", ("a",))],
+            db=shared_db,
+            trace=WebsochatTurnPrepTrace(label="test"),
+            parallel=False,
+            session_factory=factory,
+        )
+
+        self.assertEqual(order, ["a", "b", "c"])
+        self.assertEqual(factory.sessions, [])
+        self.assertTrue(all(value is shared_db for value in results.values()))
+
+    async def test_fallback_and_failure(self):
+        async def _fail(results, db):
+            raise RuntimeError("llm down")
+
+        trace = WebsochatTurnPrepTrace(label="test")
+        results = await run_websochat_turn_steps(
+            [
+                WebsochatTurnStep(name="intent", run=_fail, fallback=lambda exc: "factual"),
+                _sleep_step("after", 0, deps=("intent",)),
+            ],
+            db=_FakeSession("request"),
+            trace=trace,
+            parallel=True,
+        )
+        self.assertEqual(results["intent"], "factual")
+        self.assertTrue(trace.steps["intent"]["failed"])
+
+        slow_finished = []
+
+        async def _slow(results, db):
+            await asyncio.sleep(LLM_LATENCY)
+            slow_finished.append(True)
+
+        with self.assertRaises(RuntimeError):
+            await run_websochat_turn_steps(
+                [
+                    WebsochatTurnStep(name="slow", run=_slow),
+                    WebsochatTurnStep(name="broken", run=_fail),
+                ],
+                db=_FakeSession("request"),
+                trace=WebsochatTurnPrepTrace(label="test"),
+                parallel=True,
+            )
+        self.assertEqual(slow_finished, [])  # 남은 단계는 취소된다
+
+    async def test_steps_must_be_declared_after_their_deps(self):
+        for steps in (
+            [_sleep_step("b", 0, deps=("a",)), _sleep_step("a", 0)],
+            [_sleep_step("a", 0), _sleep_step("a", 0)],
+        ):
+            with self.subTest(steps=[step.name for step in steps]), self.assertRaises(ValueError):
+                await run_websochat_turn_steps(
+                    steps, db=_FakeSession("request"), trace=WebsochatTurnPrepTrace(label="test")
+                )
+
+
+class WebsochatTurnPrepLatencyTest(unittest.IsolatedAsyncioTestCase):
+    """가짜 LLM/DB 지연에서 답변 생성 시작(첫 토큰) 시각이 임계 경로로 줄어드는지 본다"""
+
+    async def _measure_qa_turn(self, *, parallel: bool) -> tuple[float, WebsochatTurnPrepTrace]:
+        product_row = {"productId": 1, "title": "테스트", "latestEpisodeNo": 5}
+        evidence_bundle = {
+            "product_row": product_row,
+            "resolved_scope": {"read_episode_to": 3},
+            "context_text": "",
+            "summary_rows": [],
+            "chunk_rows": [],
+            "exact_episode_rows": [],
+            "tool_context_message": None,
+        }
+        factory = _SessionFactory()
+        generation_started: list[float] = []
+
+        async def fake_recent_messages(*, session_id, db):
+            await db.query(DB_LATENCY)
+            return [{"role": "user", "content": "이전 질문"}]
+
+        async def fake_intent(*, user_prompt, recent_messages, product_id):
+            await asyncio.sleep(LLM_LATENCY)
+            return ("factual", False, "general")
+
+        async def fake_corrections(*, user_prompt, recent_messages, qa_recent_notes, qa_corrections):
+            await asyncio.sleep(LLM_LATENCY * 0.75)
+            return []
+
+        async def fake_scope_context(*, product_row, session_memory, user_prompt, db):
+            await db.query(SCOPE_LATENCY)
+            return evidence_bundle
+
+        async def fake_execute_qa(**kwargs):
+            generation_started.append(time.perf_counter())
+            return {
+                "reply": "답변",
+                "model_used": "gemini",
+                "route_mode": "general",
+                "fallback_used": False,
+                "intent": "factual",
+                "referenced_episode_nos": [],
+            }
+
+        trace = WebsochatTurnPrepTrace(label="test")
+        with (
+            patch.object(websochat_service.settings, "WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED", parallel),
+            patch.object(websochat_turn_prep, "_default_session_factory", factory),
+            patch.object(websochat_service, "_get_websochat_recent_messages", fake_recent_messages),
+            patch.object(websochat_service, "_resolve_websochat_intent", fake_intent),
+            patch.object(websochat_service, "_resolve_websochat_qa_corrections", fake_corrections),
+            patch.object(websochat_service, "assemble_websochat_scope_context", fake_scope_context),
+            patch.object(websochat_service, "execute_websochat_qa", fake_execute_qa),
+        ):
+            started = time.perf_counter()
+            reply, *_ = await websochat_service._generate_websochat_reply(
+                session_id=123,
+                session_memory={"read_scope_state": "known", "read_episode_to": 3},
+                product_row=product_row,
+                user_prompt="주인공 능력이 뭐야?",
+                user_id=1,
+                db=_FakeSession("request"),
+                turn_trace=trace,
+            )
+        self.assertEqual(reply, "답변")
+        return generation_started[0] - started, trace
+
+    async def test_qa_turn_time_to_first_token_drops_to_critical_path(self):
+        sequential_ttft, sequential_trace = await self._measure_qa_turn(parallel=False)
+        parallel_ttft, parallel_trace = await self._measure_qa_turn(parallel=True)
+
+        # 기존: 최근 대화 -> (의도 분류 || 교정 추출) -> 범위 컨텍스트
+        # 임계 경로: max(최근 대화 -> 의도 분류, 범위 컨텍스트)
+        critical_path = max(DB_LATENCY + LLM_LATENCY, SCOPE_LATENCY)
+        self.assertGreaterEqual(sequential_ttft, DB_LATENCY + LLM_LATENCY * 1.75 + SCOPE_LATENCY)
+        self.assertLess(parallel_ttft, critical_path + 0.08)
+        self.assertLess(parallel_ttft, sequential_ttft * 0.6)
+        self.assertAlmostEqual(parallel_trace.critical_path_ms(), critical_path * 1000, delta=40)
+        self.assertEqual(
+            set(parallel_trace.steps),
+            {"recent_messages", "rp_context", "rp_exact_recall", "intent", "qa_corrections", "scope_context"},
+        )
+        self.assertTrue(parallel_trace.logged)
+        self.assertEqual(set(sequential_trace.steps), set(parallel_trace.steps))
+
+    async def test_rp_exact_recall_reads_summaries_and_trajectory_episodes_concurrently(self):
+        factory = _SessionFactory()
+        episode_calls: list[int] = []
+
+        async def fake_recall_need(*, user_prompt, recent_messages, rp_context, product_id):
+            return True, "윤하 던전 약속"
+
+        async def fake_summary_candidates(**kwargs):
+            await kwargs["db"].query(DB_LATENCY * 2)
+            return [{"episodeFrom": 7, "episodeTo": 8}]
+
+        async def fake_episode_contents(*, product_id, episode_from, episode_to, latest_episode_no, db):
+            await db.query(DB_LATENCY)
+            episode_calls.append(episode_from)
+            return [{"chunkText": f"{episode_from}화 던전 약속 장면"}]
+
+        rp_context = {
+            "active_character": "윤하",
+            "anchor_episode_no": 3,
+            "trajectory_history": [{"episode_no": 2}],
+            "session_memory": {"read_episode_to": 9},
+        }
+        trace = WebsochatTurnPrepTrace(label="test")
+        with (
+            patch.object(websochat_service.settings, "WEBSOCHAT_TURN_PREP_PARALLEL_ENABLED", True),
+            patch.object(websochat_turn_prep, "_default_session_factory", factory),
+            patch.object(websochat_service, "_resolve_websochat_rp_recall_need", fake_recall_need),
+            patch.object(websochat_service, "_get_websochat_summary_candidates", fake_summary_candidates),
+            patch.object(websochat_service, "_get_websochat_episode_contents", fake_episode_contents),
+        ):
+            started = time.perf_counter()
+            context = await websochat_service._build_websochat_rp_exact_recall_context(
+                product_row={"productId": 1, "latestEpisodeNo": 10},
+                user_prompt="그때 던전에서 한 약속 기억나?",
+                recent_messages=[],
+                rp_context=rp_context,
+                db=_FakeSession("request"),
+                turn_trace=trace,
+            )
+            elapsed = time.perf_counter() - started
+
+        # 요약 후보(2) -> 요약 회차 7, 8 (2) 가 임계 경로이고 앵커/이동 기록 회차 3, 2 는 그 사이에 읽는다
+        self.assertLess(elapsed, DB_LATENCY * 4 + 0.08)
+        self.assertEqual(sorted(episode_calls), [2, 3, 7, 8])
+        recall_text = context["raw_recall_context"]
+        self.assertLess(recall_text.index("[3화"), recall_text.index("[2화"))
+        self.assertLess(recall_text.index("[2화"), recall_text.index("[8화"))
+        self.assertIn("rp_exact_recall/summary_episodes", trace.steps)
+        self.assertEqual(trace.critical_path_ms(), 0.0)  # 하위 단계는 상위 단계 시간에 포함된다
+
+
+if __name__ == "__main__":
+    unittest.main()